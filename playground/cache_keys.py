@@ -0,0 +1,46 @@
+"""
+cache_keys.py
+
+Compares the previous `str(dict)` cache keys with the tuple keys built by `BaseTranslator._cache_key`.
+"""
+
+import sys
+import timeit
+from hashlib import sha256
+
+TEXT_LENGTH_LIMIT = 256
+
+
+def dict_key(text: str, dest_code: str, source_code: str) -> str:
+    return str({"t": text, "d": dest_code, "s": source_code})
+
+
+def tuple_key(text: str, dest_code: str, source_code: str) -> tuple:
+    if len(text) > TEXT_LENGTH_LIMIT:
+        text = sha256(text.encode("utf-8")).digest()
+    return ("GoogleTranslate", text, dest_code, source_code)
+
+
+def key_size(key) -> int:
+    """
+    The memory owned by the key (the text itself is owned by the caller when it is kept in the tuple)
+    """
+    if isinstance(key, str):
+        return sys.getsizeof(key)
+    return sys.getsizeof(key) + sum(sys.getsizeof(element) for element in key if isinstance(element, bytes))
+
+
+if __name__ == "__main__":
+    for length in (20, 200, 2000, 50000):
+        text = ("Hello world, how are you? " * (length // 26 + 1))[:length]
+        dict_time = min(timeit.repeat(lambda: dict_key(text, "fr", "en"), number=10000, repeat=5)) / 10000
+        tuple_time = min(timeit.repeat(lambda: tuple_key(text, "fr", "en"), number=10000, repeat=5)) / 10000
+        dict_size = key_size(dict_key(text, "fr", "en"))
+        tuple_size = key_size(tuple_key(text, "fr", "en"))
+        print("{length:>6} chars | build: {dict_time:8.2f}µs --> {tuple_time:6.2f}µs | key memory: {dict_size:>6}B --> {tuple_size:>4}B".format(
+            length=length,
+            dict_time=dict_time * 1e6,
+            tuple_time=tuple_time * 1e6,
+            dict_size=dict_size,
+            tuple_size=tuple_size
+        ))
@@ -0,0 +1,51 @@
+"""
+fuzzy_search_benchmark.py
+
+Compares the linear scan of `translatepy.utils.similarity.fuzzy_search` with the `SearchIndex`
+and the `MatrixIndex` (which needs NumPy) on the language vectors, with misspelled language names.
+"""
+
+import random
+import time
+
+from translatepy.language import LOADED_VECTORS
+from translatepy.utils.similarity import MatrixIndex, SearchIndex, fuzzy_search
+
+QUERIES = 500
+random.seed(0)
+
+
+def misspell(string: str) -> str:
+    string = list(string)
+    string[random.randrange(len(string))] = random.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(string)
+
+
+def benchmark(search_source, queries) -> list:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        fuzzy_search(search_source, query)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)
+
+
+if __name__ == "__main__":
+    queries = [misspell(random.choice(LOADED_VECTORS).string) for _ in range(QUERIES)]
+    indexes = {"index": SearchIndex(LOADED_VECTORS), "matrix": MatrixIndex(LOADED_VECTORS)}
+
+    for name, index in indexes.items():
+        start = time.perf_counter()
+        index.search("")  # building the index
+        print("{vectors} vectors, {name} built in {time:.1f}ms".format(vectors=len(LOADED_VECTORS), name=name, time=(time.perf_counter() - start) * 1000))
+
+    for name, search_source in [("scan", LOADED_VECTORS)] + list(indexes.items()):
+        timings = benchmark(search_source, queries)
+        print("{name:<6} | mean {mean:6.3f}ms | median {median:6.3f}ms | p95 {p95:6.3f}ms".format(
+            name=name,
+            mean=sum(timings) / len(timings) * 1000,
+            median=timings[len(timings) // 2] * 1000,
+            p95=timings[int(len(timings) * 0.95)] * 1000
+        ))
+    for index in indexes.values():
+        assert all(fuzzy_search(index, query) == fuzzy_search(LOADED_VECTORS, query) for query in queries)
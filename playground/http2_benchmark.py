@@ -0,0 +1,124 @@
+"""
+http2_benchmark.py
+
+Compares the HTTP/1.1 `RequestsTransport` with the `HTTP2Transport` of `translatepy.utils.request.Request`
+on concurrent POST requests, against local servers answering after the same simulated latency.
+
+Needs httpx and h2: pip install "httpx[http2]"
+"""
+
+import json
+import socket
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.pool import ThreadPool
+from threading import Lock, Thread
+
+import h2.config
+import h2.connection
+import h2.events
+
+from translatepy.utils.request import HTTP2Transport, Request, RequestsTransport, RetryPolicy
+
+LATENCY = 0.05
+THREADS = 32
+REQUESTS = 256
+
+ANSWER = json.dumps({"result": "Bonjour"}).encode("utf-8")
+
+
+class HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    connections = 0
+
+    def setup(self):
+        HTTP1Handler.connections += 1
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(ANSWER)))
+        self.end_headers()
+        self.wfile.write(ANSWER)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class H2Server():
+    """
+    A minimal HTTP/2 server (without TLS, with prior knowledge), answering each stream in its own thread
+    """
+
+    def __init__(self) -> None:
+        self.socket = socket.socket()
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.listen(128)
+        self.port = self.socket.getsockname()[1]
+        self.connections = 0
+        Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            connection, _ = self.socket.accept()
+            self.connections += 1
+            Thread(target=self.handle, args=(connection,), daemon=True).start()
+
+    def answer(self, connection, h2_connection, lock, stream_id):
+        time.sleep(LATENCY)
+        with lock:
+            h2_connection.send_headers(stream_id, [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(ANSWER)))])
+            h2_connection.send_data(stream_id, ANSWER, end_stream=True)
+            connection.sendall(h2_connection.data_to_send())
+
+    def handle(self, connection):
+        h2_connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        lock = Lock()
+        with lock:
+            h2_connection.initiate_connection()
+            connection.sendall(h2_connection.data_to_send())
+        while True:
+            data = connection.recv(65535)
+            if not data:
+                return
+            with lock:
+                events = h2_connection.receive_data(data)
+                for event in events:
+                    if isinstance(event, h2.events.DataReceived):
+                        h2_connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        Thread(target=self.answer, args=(connection, h2_connection, lock, event.stream_id), daemon=True).start()
+                connection.sendall(h2_connection.data_to_send())
+
+
+def benchmark(request: Request, url: str) -> float:
+    def translate(index):
+        response = request.post(url, data={"q": "Hello {}".format(index), "target": "fr"})
+        assert response.json() == {"result": "Bonjour"}
+
+    translate(-1)  # warming up the connection
+    start = time.perf_counter()
+    with ThreadPool(THREADS) as pool:
+        pool.map(translate, range(REQUESTS))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    http1_server = ThreadingHTTPServer(("127.0.0.1", 0), HTTP1Handler)
+    Thread(target=http1_server.serve_forever, daemon=True).start()
+    h2_server = H2Server()
+
+    no_retry = RetryPolicy(total=0)
+    http1 = Request(transport=RequestsTransport(), pool_maxsize=THREADS, retry_policy=no_retry)
+    http2 = Request(transport=HTTP2Transport(http1=False), retry_policy=no_retry)
+
+    http1_time = benchmark(http1, "http://127.0.0.1:{port}/translate".format(port=http1_server.server_address[1]))
+    http2_time = benchmark(http2, "http://127.0.0.1:{port}/translate".format(port=h2_server.port))
+
+    print("{requests} requests, {threads} threads, {latency}ms of server latency".format(requests=REQUESTS, threads=THREADS, latency=int(LATENCY * 1000)))
+    print("HTTP/1.1 (requests) | {time:6.3f}s | {rate:6.1f} req/s | {connections:>3} connections".format(time=http1_time, rate=REQUESTS / http1_time, connections=HTTP1Handler.connections))
+    print("HTTP/2   (httpx)    | {time:6.3f}s | {rate:6.1f} req/s | {connections:>3} connections".format(time=http2_time, rate=REQUESTS / http2_time, connections=h2_server.connections))
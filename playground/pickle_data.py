@@ -0,0 +1,50 @@
+"""
+pickle_data.py
+
+Writes the data files loaded by translatepy (translatepy/utils/_data) from the results of
+clean.py (LANGUAGE_DATA, CODES and VECTORS) and builtin_translators_vectors.py (the translators aliases).
+
+The vectors are kept as (norm, character counts), their characters set being rebuilt from the counts.
+
+Usage: python pickle_data.py [results.py] [vectors_results.json]
+"""
+
+import json
+import pickle
+import runpy
+import sys
+from os import path
+
+DATA_DIRECTORY = path.join(path.dirname(path.abspath(__file__)), "..", "translatepy", "utils", "_data")
+
+
+def dump(obj, filename: str):
+    with open(path.join(DATA_DIRECTORY, filename), "wb") as out:
+        pickle.dump(obj, out, protocol=4)
+
+
+if __name__ == "__main__":
+    language_source = sys.argv[1] if len(sys.argv) > 1 else "results.py"
+    importer_source = sys.argv[2] if len(sys.argv) > 2 else "vectors_results.json"
+
+    language = runpy.run_path(language_source)
+    if importer_source.endswith(".json"):
+        with open(importer_source, encoding="utf-8") as importer_file:
+            importer_vectors = json.load(importer_file)
+    else:
+        importer_vectors = runpy.run_path(importer_source)["VECTORS"]
+
+    # the names in foreign languages are the largest part of the data, and are only needed by `Language.in_foreign_languages`
+    foreign_names = {}
+    languages = {}
+    for language_id, data in language["LANGUAGE_DATA"].items():
+        data = dict(data)
+        if "f" in data:
+            foreign_names[language_id] = data.pop("f")
+        languages[language_id] = data
+
+    dump(language["CODES"], "language_codes.pickle")
+    dump(languages, "language_data.pickle")
+    dump(foreign_names, "language_foreign_names.pickle")
+    dump({string: (data["i"], data["l"], data["c"]) for string, data in language["VECTORS"].items()}, "language_vectors.pickle")
+    dump({alias: (data["t"], data["l"], data["c"]) for alias, data in importer_vectors.items()}, "importer_vectors.pickle")
@@ -36,7 +36,7 @@ setup(
         "language",
     ],
     install_requires=read_requirements("requirements.txt"),
-    extras_require={"server": read_requirements("requirements-server.txt"), "dev": read_requirements("requirements-dev.txt")},
+    extras_require={"server": read_requirements("requirements-server.txt"), "async": read_requirements("requirements-async.txt"), "http2": read_requirements("requirements-http2.txt"), "numpy": read_requirements("requirements-numpy.txt"), "dev": read_requirements("requirements-dev.txt")},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
@@ -56,6 +56,6 @@ setup(
     python_requires=">=3.2, <4",
     entry_points={"console_scripts": ["translatepy = translatepy.__main__:main"]},
     package_data={
-        "translatepy": ["LICENSE"],
+        "translatepy": ["LICENSE", "utils/_data/*.pickle"],
     },
 )
@@ -0,0 +1,212 @@
+import asyncio
+
+from translatepy import Language
+from translatepy.exceptions import DeadlineExceeded
+from translatepy.translators.base import BaseTranslator
+from translatepy.utils.deadline import remaining_time
+from translatepy.utils.singleflight import SingleFlight
+
+
+class DummyTranslate(BaseTranslator):
+    """
+    An offline translator which "translates" by upper-casing the text
+    """
+
+    _max_batch_size = 2
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def _translate(self, text: str, destination_language: str, source_language: str):
+        self.calls.append(("translate", text))
+        return "en", text.upper()
+
+    def _language_normalize(self, language: Language) -> str:
+        return language.alpha2
+
+    def _language_denormalize(self, language_code: str) -> Language:
+        return Language(language_code)
+
+    def __str__(self) -> str:
+        return "Dummy"
+
+
+class DummyBatchTranslate(DummyTranslate):
+    def _translate_batch(self, texts, destination_language, source_language):
+        self.calls.append(("batch", tuple(texts)))
+        return [("en", text.upper()) for text in texts]
+
+
+def test_translate_batch():
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator.translate_batch")
+    translator = DummyTranslate()
+    translator.clean_cache()
+    results = translator.translate_batch(["hello", "world", "hello"], "fr")
+    assert [result.result for result in results] == ["HELLO", "WORLD", "HELLO"]
+    assert translator.calls == [("translate", "hello"), ("translate", "world")]  # falls back to `_translate`, once per unique text
+
+    translator = DummyBatchTranslate()
+    translator.clean_cache()
+    translator.translate("cached", "fr")
+    results = translator.translate_batch(["a", "cached", "b", "c"], "fr")
+    assert [result.result for result in results] == ["A", "CACHED", "B", "C"]
+    assert translator.calls == [("translate", "cached"), ("batch", ("a", "b")), ("batch", ("c",))]  # only the misses, packed by `_max_batch_size`
+
+
+class DummyAsyncTranslate(DummyTranslate):
+    async def _atranslate(self, text: str, destination_language: str, source_language: str):
+        self.calls.append(("atranslate", text))
+        return "en", text.lower()
+
+
+def test_async_methods():
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator asynchronous methods")
+    translator = DummyTranslate()
+    native_translator = DummyAsyncTranslate()
+    translator.clean_cache()
+
+    async def run():
+        result = await translator.atranslate("Hello", "fr")
+        assert result.result == "HELLO"
+        assert translator.calls == [("translate", "Hello")]  # ran in the executor
+
+        result = await native_translator.atranslate("World", "fr")
+        assert result.result == "world"
+        assert native_translator.calls == [("atranslate", "World")]
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+    class RemainingTimeTranslate(DummyTranslate):
+        def _translate(self, text: str, destination_language: str, source_language: str):
+            self.calls.append(("remaining", remaining_time()))
+            return "en", text.upper()
+
+    print("[test] --> Testing the deadline of the blocking calls of the asynchronous methods")
+    translator = RemainingTimeTranslate()
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(translator.atranslate("Deadline", "fr", timeout=5))
+        assert 0 < translator.calls[0][1] <= 5  # the executor thread got the deadline
+        loop.run_until_complete(translator.atranslate("No deadline", "fr"))
+        assert translator.calls[1][1] is None
+    finally:
+        loop.close()
+
+
+def test_cache_key():
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator._cache_key")
+    translator = DummyTranslate()
+    assert translator._cache_key("Hello", "fr", "en") == ("DummyTranslate", "Hello", "fr", "en")
+    assert translator._cache_key("Hello", "fr", "en") != DummyBatchTranslate()._cache_key("Hello", "fr", "en")  # not shared between services
+
+    long_key = translator._cache_key("a" * 10000, "fr", "en")
+    assert len(long_key[1]) == 32  # digest
+    assert long_key != translator._cache_key("a" * 10001, "fr", "en")
+
+
+def test_single_flight():
+    import time
+    from multiprocessing.pool import ThreadPool
+
+    class SlowTranslate(DummyTranslate):
+        def _translate(self, text: str, destination_language: str, source_language: str):
+            time.sleep(0.2)
+            return super()._translate(text, destination_language, source_language)
+
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator single-flight calls")
+    translator = SlowTranslate()
+    translator.clean_cache()
+    with ThreadPool(8) as pool:
+        results = pool.map(lambda _: translator.translate("Add to cart", "fr").result, range(8))
+    assert results == ["ADD TO CART"] * 8
+    assert translator.calls == [("translate", "Add to cart")]  # a single upstream call
+
+    async def run():
+        native_translator = DummyAsyncTranslate()
+        results = await asyncio.gather(*[native_translator.atranslate("Add to wishlist", "fr") for _ in range(8)])
+        assert [result.result for result in results] == ["add to wishlist"] * 8
+        assert native_translator.calls == [("atranslate", "Add to wishlist")]
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+    print("[test] --> Testing translatepy.utils.singleflight.SingleFlight when the deadline of the first caller passes")
+    flights, calls = SingleFlight(), []
+
+    def expiring():
+        calls.append("expiring")
+        time.sleep(0.2)
+        raise DeadlineExceeded("The deadline of the first caller passed")
+
+    def succeeding():
+        calls.append("succeeding")
+        return "ok"
+
+    def second_caller():
+        time.sleep(0.05)
+        return flights.do("key", succeeding)
+
+    with ThreadPool(2) as pool:
+        first = pool.apply_async(flights.do, ("key", expiring))
+        assert pool.apply(second_caller) == "ok"  # retried instead of sharing the DeadlineExceeded
+        try:
+            first.get()
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("DeadlineExceeded should be raised")
+    assert calls == ["expiring", "succeeding"] and flights.shared == 0
+
+    async def aexpiring():
+        calls.append("aexpiring")
+        await asyncio.sleep(0.2)
+        raise DeadlineExceeded("The deadline of the first caller passed")
+
+    async def asucceeding():
+        calls.append("asucceeding")
+        return "ok"
+
+    async def arun():
+        first = asyncio.ensure_future(flights.ado("key", aexpiring))
+        await asyncio.sleep(0.05)
+        assert await flights.ado("key", asucceeding) == "ok"
+        try:
+            await first
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("DeadlineExceeded should be raised")
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(arun())
+    finally:
+        loop.close()
+    assert calls[2:] == ["aexpiring", "asucceeding"] and flights.shared == 0
+
+
+def test_long_text_chunking():
+    from translatepy.utils.chunker import split_text
+
+    print("[test] --> Testing translatepy.utils.chunker.split_text")
+    text = "First sentence. Second sentence!\n\nA new paragraph with a veryveryveryverylongword in it.\n"
+    chunks = split_text(text, 20)
+    assert "".join(chunks) == text
+    assert all(len(chunk.strip()) <= 20 for chunk in chunks)
+    assert chunks[:2] == ["First sentence. ", "Second sentence!\n\n"]
+
+    class ShortTranslate(DummyTranslate):
+        _max_text_length = 20
+
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator long texts translation")
+    translator = ShortTranslate()
+    translator.clean_cache()
+    assert translator.translate(text, "fr").result == text.upper()
+    assert sorted(translator.calls) == sorted(("translate", chunk.strip()) for chunk in chunks)
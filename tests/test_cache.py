@@ -0,0 +1,208 @@
+import os
+import socketserver
+import tempfile
+from threading import Thread
+
+from translatepy.utils.cache import (MemoryCacheBackend, RedisCacheBackend,
+                                     RedisError, SQLiteCacheBackend,
+                                     cache_backend_from_url)
+from tests.test_base import DummyTranslate
+
+
+def test_sqlite_cache_backend():
+    print("[test] --> Testing translatepy.utils.cache.SQLiteCacheBackend")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.sqlite")
+        backend = SQLiteCacheBackend(path, maxsize=3, batch_size=2)
+        translations = backend.namespace("translations")
+        translations["hello"] = ("en", "bonjour")
+        assert "hello" in translations  # readable before being committed
+        assert translations["hello"] == ("en", "bonjour")
+        assert backend.namespace("languages").get("hello") is None
+
+        other_process = SQLiteCacheBackend(path)
+        translations["world"] = ("en", "monde")  # triggers a batch commit
+        assert other_process.get("translations", "world") == ("en", "monde")
+
+        for text in ("a", "b", "c"):
+            translations[text] = ("en", text)
+        backend.flush()
+        assert "hello" not in translations  # evicted, the least recently used
+        assert translations["c"] == ("en", "c")
+
+        del translations["c"]
+        assert "c" not in translations
+        backend.close()
+        other_process.close()
+
+        restarted = SQLiteCacheBackend(path)
+        assert restarted.get("translations", "b") == ("en", "b")
+        value = ("en", ["a", ("b", b"\x00\xff")], {"t": None, "n": 1.5})
+        restarted.namespace("dictionaries")["value"] = value
+        restarted.flush()
+        assert SQLiteCacheBackend(path).get("dictionaries", "value") == value
+        restarted.clear("translations")
+        assert restarted.get("translations", "b") is None
+        restarted.close()
+
+
+def test_use_cache_backend():
+    class CachedTranslate(DummyTranslate):
+        pass
+
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator.use_cache_backend")
+    backend = MemoryCacheBackend()
+    CachedTranslate.use_cache_backend(backend)
+    translator = CachedTranslate()
+    translator.translate("Backend", "fr")
+    translator.translate("Backend", "fr")
+    assert translator.calls == [("translate", "Backend")]
+    assert len(backend.namespace("translations")) == 1
+    assert DummyTranslate._translations_cache is not CachedTranslate._translations_cache
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """
+    A minimal stand-in for a Redis server, supporting the commands used by RedisCacheBackend
+    """
+
+    store = {}
+    commands = []
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        arguments = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            arguments.append(self.rfile.read(length + 2)[:-2])
+        return arguments
+
+    def bulk(self, value):
+        return b"$-1\r\n" if value is None else b"$" + str(len(value)).encode() + b"\r\n" + value + b"\r\n"
+
+    def handle(self):
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            name, arguments = command[0].decode().upper(), command[1:]
+            self.commands.append(name)
+            if name == "MGET":
+                reply = b"*" + str(len(arguments)).encode() + b"\r\n" + b"".join(self.bulk(self.store.get(key)) for key in arguments)
+            elif name == "SET":
+                self.store[arguments[0]] = arguments[1]
+                reply = b"+OK\r\n"
+            elif name == "MSET":
+                self.store.update(zip(arguments[::2], arguments[1::2]))
+                reply = b"+OK\r\n"
+            elif name == "DEL":
+                reply = ":{}\r\n".format(sum(1 for key in arguments if self.store.pop(key, None) is not None)).encode()
+            elif name == "SCAN":
+                prefix = arguments[2][:-1]
+                keys = [key for key in self.store if key.startswith(prefix)]
+                reply = b"*2\r\n" + self.bulk(b"0") + b"*" + str(len(keys)).encode() + b"\r\n" + b"".join(self.bulk(key) for key in keys)
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+def test_redis_cache_backend():
+    print("[test] --> Testing translatepy.utils.cache.RedisCacheBackend")
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        backend = cache_backend_from_url("redis://127.0.0.1:{port}/0?prefix=test".format(port=server.server_address[1]))
+        translations = backend.namespace("translations")
+        translations.set_many({"hello": ("en", "bonjour"), "world": ("en", "monde")})
+        assert FakeRedisHandler.commands == ["MSET"]
+        assert b"test:translations:hello" in FakeRedisHandler.store
+        assert translations.get_many(["hello", "world", "missing"]) == [("en", "bonjour"), ("en", "monde"), None]
+        assert FakeRedisHandler.commands == ["MSET", "MGET"]
+
+        backend.ttl = 60
+        translations["ttl"] = ("en", "ttl")
+        assert FakeRedisHandler.commands[-1] == "SET"
+
+        # the values written by someone else are never unpickled
+        import pickle
+        FakeRedisHandler.store[b"test:translations:pickled"] = pickle.dumps(("en", "pickled"))
+        assert "pickled" not in translations
+
+        # another worker
+        other_worker = RedisCacheBackend(port=server.server_address[1], prefix="test")
+        assert other_worker.get("translations", "ttl") == ("en", "ttl")
+
+        # an error in the middle of a pipeline does not leave its other replies to the next command
+        try:
+            backend._pipeline([("UNKNOWN",), ("MGET", "test:translations:world")])
+        except RedisError:
+            pass
+        else:
+            raise AssertionError("RedisError should be raised")
+        assert translations["hello"] == ("en", "bonjour")
+
+        # a failed authentication acts as a cache miss
+        unauthorized = RedisCacheBackend(port=server.server_address[1], prefix="test", password="secret")
+        assert unauthorized.get("translations", "hello") is None
+        assert unauthorized._socket is None
+        unauthorized.clear()
+
+        translations.clear()
+        assert "hello" not in translations
+        backend.close()
+        other_worker.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "hello" not in translations  # the server is unreachable: acts as a cache miss
+
+
+def test_lru_dict_cache():
+    import time
+    from multiprocessing.pool import ThreadPool
+    from translatepy.utils.lru_cacher import LRUDictCache
+
+    print("[test] --> Testing translatepy.utils.lru_cacher.LRUDictCache")
+    cache = LRUDictCache(maxbytes=2000)
+    cache["short"] = "a"
+    cache["long"] = "b" * 1500
+    cache["other"] = "c" * 500  # over the budget: evicts the least recently used
+    assert "short" not in cache and "long" not in cache and cache["other"] == "c" * 500
+    assert cache.currentbytes <= 2000
+    cache["huge"] = "d" * 5000  # bigger than the whole budget: not cached
+    assert "huge" not in cache and "other" in cache
+
+    cache.set("expiring", "e", ttl=0.05)
+    assert cache.get("expiring") == "e"
+    time.sleep(0.06)
+    assert cache.get("expiring") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 4
+    assert stats["evictions"] == 2 and stats["expirations"] == 1
+
+    cache = LRUDictCache(maxbytes=2000)
+    cache["kept"] = "a"
+    cache.set("expiring", "b", ttl=0.05)
+    time.sleep(0.06)
+    assert len(cache) == 1 and list(cache) == ["kept"]  # the expired entries are skipped
+    assert cache.items() == [("kept", "a")] and cache.values() == ["a"]
+    assert cache.hits == 0  # reading the items is not an access
+    assert cache.setdefault("default", "c" * 100) == "c" * 100 and cache.setdefault("default", "d") == "c" * 100
+    assert cache.popitem() == ("default", "c" * 100) and cache.popitem(last=False) == ("kept", "a")
+    assert len(cache) == 0 and cache.currentbytes == 0  # the memory usage follows popitem
+
+    cache = LRUDictCache(100)
+
+    def fill(index):
+        for element in range(200):
+            cache[(index, element)] = element
+            cache.get((index, element - 1))
+
+    with ThreadPool(16) as pool:
+        pool.map(fill, range(16))
+    assert len(cache) == 100
@@ -1,4 +1,7 @@
+import pytest
+
 from translatepy import Language
+from translatepy.utils.similarity import SearchIndex, StringVector
 
 
 def test_language():
@@ -8,3 +11,77 @@ def test_language():
     assert Language("en").name.lower() == "english"
     assert Language("japanese").alpha2 == "ja"
     assert Language("自动").name.lower() == "automatic"
+
+
+def test_search_index():
+    from translatepy.language import LOADED_VECTORS, VECTORS_INDEX
+    from translatepy.utils.similarity import fuzzy_search
+
+    def scan(query, limit):
+        vector = StringVector(query)
+        results = [(element.string, SearchIndex._score(element, vector)) for element in LOADED_VECTORS]
+        return sorted(results, key=lambda element: element[1], reverse=True)[:limit]
+
+    for query in ["franch", "japanes", "englsh", "deutch", "bahaxaindonesia", "aerbianu", "a", "zz", "自动", "", "😀"]:
+        assert fuzzy_search(VECTORS_INDEX, query) == fuzzy_search(LOADED_VECTORS, query)
+        for limit in (1, 5, 25):
+            assert VECTORS_INDEX.search(query, limit=limit) == scan(query, limit)
+    assert VECTORS_INDEX.search("french", limit=0) == []
+
+
+def test_matrix_index(monkeypatch):
+    pytest.importorskip("numpy")
+    from translatepy.language import LOADED_VECTORS
+    from translatepy.utils import similarity
+
+    index = similarity.MatrixIndex(LOADED_VECTORS)
+    python_index = similarity.SearchIndex(LOADED_VECTORS)
+    for query in ["franch", "englsh", "bahaxaindonesia", "a", "自动", "", "😀"]:
+        for limit in (1, 5, 25):
+            assert index.search(query, limit=limit) == python_index.search(query, limit=limit)
+
+    assert isinstance(similarity.create_index(LOADED_VECTORS), similarity.MatrixIndex)
+    monkeypatch.setattr(similarity, "NUMPY_AVAILABLE", False)
+    assert type(similarity.create_index(LOADED_VECTORS)) is similarity.SearchIndex
+
+
+def test_lazy_data():
+    import subprocess
+    import sys
+
+    # a new interpreter, as the data is already loaded in this one
+    script = "\n".join([
+        "import translatepy",
+        "from translatepy.language import LOADED_VECTORS",
+        "from translatepy.utils import _importer_data, _language_data",
+        "assert not any(data.loaded for data in (_language_data.CODES, _language_data.LANGUAGE_DATA, _language_data.FOREIGN_NAMES, _language_data.VECTORS, _importer_data.VECTORS))",
+        "language = translatepy.Language('fr')",
+        "assert _language_data.LANGUAGE_DATA.loaded and not _language_data.FOREIGN_NAMES.loaded and not LOADED_VECTORS.loaded",
+        "assert language.in_foreign_languages['ja'] == 'フランス語' and _language_data.FOREIGN_NAMES.loaded",
+        "assert translatepy.Language('Englesh').id == 'eng' and LOADED_VECTORS.loaded"
+    ])
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_interned_language():
+    import copy
+    import pickle
+
+    french = Language("fr")
+    assert Language("fra") is french and Language(french) is french
+    assert Language("French") is Language("french")
+    assert pickle.loads(pickle.dumps(french)) is french and copy.deepcopy(french) is french
+    assert Language("French").in_foreign_languages is french.in_foreign_languages
+    assert Language("Japanese").extra is Language("English").extra
+    with pytest.raises(AttributeError):
+        french.name = "Français"
+    with pytest.raises(TypeError):
+        french.in_foreign_languages["en"] = "Français"
+    assert french.as_dict()["in_foreign_languages"]["en"] == "French"
+
+    # the fuzzy matches, with any similarity, are not all kept
+    from translatepy.language import _fuzzy_interned, get_language
+    for similarity in range(600):
+        assert get_language("fra", 93 + similarity / 1000).id == "fra"
+    assert len(_fuzzy_interned) <= 512
+    assert get_language("fra", 100) is french
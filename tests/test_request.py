@@ -0,0 +1,526 @@
+import asyncio
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+from translatepy.utils.request import AsyncRequest, Request
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    A local HTTP server handler answering with the request details as JSON
+    """
+    hits = 0
+
+    def _answer(self, body: bytes = b""):
+        StubHandler.hits += 1
+        data = json.dumps({
+            "method": self.command,
+            "path": self.path,
+            "body": body.decode("utf-8"),
+            "user_agent": self.headers.get("User-Agent"),
+            "custom": self.headers.get("X-Custom"),
+            "cookie": self.headers.get("Cookie")
+        }).encode("utf-8")
+        self.send_response(200)
+        if self.path.startswith("/set-cookie"):
+            self.send_header("Set-Cookie", "async=1; Path=/")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._answer()
+
+    def do_POST(self):
+        self._answer(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = HTTPServer(("127.0.0.1", 0), StubHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:{port}".format(port=server.server_address[1])
+
+
+def test_async_request():
+    print("[test] --> Testing translatepy.utils.request.AsyncRequest")
+    server, url = start_server()
+    request = AsyncRequest(request=Request())
+    request.headers = {"X-Custom": "translatepy"}
+
+    async def run():
+        async with request:
+            response = await request.post(url + "/translate", data={"q": "Hello", "flag": True}, params={"dt": ["t", "bd"]})
+            assert response.status_code == 200
+            result = response.json()
+            assert result["method"] == "POST"
+            assert result["path"] == "/translate?dt=t&dt=bd"
+            assert result["body"] == "q=Hello&flag=True"
+            assert result["user_agent"] == request.headers["User-Agent"]
+            assert result["custom"] == "translatepy"
+
+            hits = StubHandler.hits
+            first = await request.get(url + "/cached", params={"q": "Hello"})
+            second = await request.get(url + "/cached", params={"q": "Hello"})
+            assert first.json() == second.json()
+            assert StubHandler.hits == hits + 1  # the second GET request comes from the cache
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+    print("[test] --> Testing translatepy.utils.request.AsyncRequest cookies and event loops")
+    request.request.session.cookies.set("sync", "1")
+
+    async def cookies():
+        await request.post(url + "/set-cookie")
+        return (await request.post(url + "/cookies", cookies={"request": "1"})).json()["cookie"]
+
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        assert sorted(first_loop.run_until_complete(cookies()).split("; ")) == ["async=1", "request=1", "sync=1"]
+        assert request.request.session.cookies.get("async") == "1" and "request" not in request.request.session.cookies  # shared with Request
+        first_session = request._session
+        second_loop.run_until_complete(cookies())
+        assert first_session.closed and request._session is not first_session  # the session of the previous loop got closed
+        second_loop.run_until_complete(request.close())
+    finally:
+        first_loop.close()
+        second_loop.close()
+        server.shutdown()
+
+
+def test_rate_limit():
+    import time
+    from multiprocessing.pool import ThreadPool
+    from translatepy.utils.request import TokenBucket
+
+    print("[test] --> Testing translatepy.utils.request.TokenBucket")
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    with ThreadPool(8) as pool:
+        pool.map(lambda _: bucket.acquire(), range(8))
+    assert 0.25 <= time.monotonic() - start < 0.6  # 2 tokens at once, then 6 at 20 requests per second
+
+    # the waits are reserved in the order of the calls
+    bucket = TokenBucket(rate=10)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[0] == 0 and delays == sorted(delays)
+    assert abs(delays[-1] - 0.3) < 0.05
+    assert bucket.reserve(timeout=0.1) is None  # would wait about 0.4s: nothing is reserved
+    assert abs(bucket.reserve() - 0.4) < 0.05
+
+    print("[test] --> Testing translatepy.utils.request.Request.set_rate_limit")
+    server, url = start_server()
+    try:
+        host = url.split("//")[1]
+        request = Request(rate_limits={host: 10})
+        request.set_rate_limit(host, 1000, override=False)  # a translator default does not override the user limit
+        assert request.rate_limits[host].rate == 10
+        start = time.monotonic()
+        for _ in range(3):
+            request.post(url + "/limited")
+        assert time.monotonic() - start >= 0.2
+
+        async_request = AsyncRequest(request=request)
+
+        async def run():
+            async with async_request:
+                begin = time.monotonic()
+                await asyncio.gather(*[async_request.post(url + "/limited") for _ in range(3)])
+                return time.monotonic() - begin
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(run()) >= 0.2
+        finally:
+            loop.close()
+
+        from translatepy.exceptions import DeadlineExceeded
+        from translatepy.utils.deadline import deadline
+        limiter = request.set_rate_limit(host, 1)
+        request.post(url + "/limited")
+        start = time.monotonic()
+        try:
+            with deadline(0.2):
+                request.post(url + "/limited")
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("DeadlineExceeded should be raised")
+        assert time.monotonic() - start < 0.1  # raised without waiting for the token
+        assert limiter.bucket(None).reserve(timeout=0.2) is None and 0.5 < limiter.bucket(None).reserve() <= 1  # the token was not taken
+    finally:
+        server.shutdown()
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """
+    A local HTTP server handler answering with the queued status codes, then with 200
+    """
+    statuses = []
+    hits = 0
+    body = b"{}"
+
+    def do_POST(self):
+        FlakyHandler.hits += 1
+        status = FlakyHandler.statuses.pop(0) if FlakyHandler.statuses else 200
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", str(len(FlakyHandler.body)))
+        self.end_headers()
+        self.wfile.write(FlakyHandler.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_retry_policy():
+    import time
+    from email.utils import formatdate
+    import requests
+    from translatepy.utils.request import BaseTransport, Retry, RetryPolicy
+
+    print("[test] --> Testing translatepy.utils.request.RetryPolicy")
+
+    class Headers():
+        def __init__(self, value):
+            self.headers = {"Retry-After": value}
+
+    assert RetryPolicy.retry_after(Headers("120")) == 120
+    assert 50 < RetryPolicy.retry_after(Headers(formatdate(time.time() + 60, usegmt=True))) <= 60
+    assert RetryPolicy.retry_after(Headers("soon")) is None
+
+    policy = RetryPolicy(total=3, backoff_factor=0.1, jitter=0)
+    assert [policy.backoff(attempt) for attempt in range(3)] == [0.1, 0.2, 0.4]
+
+    attempts = []
+
+    def attempt():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise Retry(ValueError("failed"), backoff=len(attempts) != 1)
+        return "ok"
+
+    assert policy.run(attempt) == "ok"
+    assert attempts[1] - attempts[0] < 0.05 and attempts[2] - attempts[1] >= 0.2  # no backoff after the first attempt
+
+    attempts.clear()
+
+    def failing():
+        attempts.append(time.monotonic())
+        raise Retry(KeyError("always"))
+
+    try:
+        RetryPolicy(total=5, backoff_factor=0.1, jitter=0, deadline=0.25).run(failing)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("the last exception should be raised")
+    assert len(attempts) == 2  # 0.1 + 0.2 goes over the deadline
+
+    print("[test] --> Testing translatepy.utils.request.Request retries")
+    server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{port}".format(port=server.server_address[1])
+    try:
+        request = Request(retry_policy=RetryPolicy(total=2, backoff_factor=0.01))
+        FlakyHandler.statuses, FlakyHandler.hits = [503, 502], 0
+        assert request.post(url).status_code == 200
+        assert FlakyHandler.hits == 3
+
+        FlakyHandler.statuses, FlakyHandler.hits = [429], 0
+        assert request.post(url).status_code == 429  # the rate limited requests are not retried by default
+        assert FlakyHandler.hits == 1
+
+        FlakyHandler.statuses, FlakyHandler.hits = [503, 503, 503], 0
+        assert request.post(url).status_code == 503  # the last response is returned
+        assert FlakyHandler.hits == 3
+
+        FlakyHandler.statuses, FlakyHandler.hits = [503], 0
+        assert request.post(url, retry=RetryPolicy(total=0)).status_code == 503
+        assert FlakyHandler.hits == 1
+
+        async_request = AsyncRequest(request=request)
+
+        async def run():
+            async with async_request:
+                return await async_request.post(url)
+
+        FlakyHandler.statuses, FlakyHandler.hits = [502], 0
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(run()).status_code == 200
+        finally:
+            loop.close()
+        assert FlakyHandler.hits == 2
+
+        async def single_attempt():
+            async with async_request:
+                return await async_request.single_attempt("POST", url)
+
+        FlakyHandler.statuses, FlakyHandler.hits = [502], 0
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(single_attempt()).status_code == 502  # returned for the translator to decide
+        finally:
+            loop.close()
+        assert FlakyHandler.hits == 1
+    finally:
+        server.shutdown()
+
+    print("[test] --> Testing translatepy.utils.request.Request retries of streamed responses")
+
+    class TrackedResponse(requests.Response):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    class StatusTransport(BaseTransport):
+        """Answers with the queued status codes, then with 200"""
+
+        def __init__(self, statuses: list) -> None:
+            self.statuses = statuses
+            self.responses = []
+
+        def send(self, proxy, method, url, **kwargs):
+            response = TrackedResponse()
+            response.status_code = self.statuses.pop(0) if self.statuses else 200
+            response._content, response._content_consumed = b"{}", True
+            self.responses.append(response)
+            return response
+
+    transport = StatusTransport([503])
+    response = Request(retry_policy=RetryPolicy(total=2, backoff_factor=0.01), transport=transport).get("http://translatepy.test/stream", stream=True)
+    assert response.status_code == 200
+    assert [response.closed for response in transport.responses] == [True, False]  # only the retried one is released
+
+
+def test_translator_retries():
+    from translatepy.translators.deepl import DeeplTranslateException, JSONRPCRequest
+    from translatepy.utils.request import BaseTransport, RetryPolicy
+
+    class LocalTransport(BaseTransport):
+        """Sends every request to the local server"""
+
+        def __init__(self, url: str) -> None:
+            self.url = url
+
+        def send(self, proxy, method, url, **kwargs):
+            return proxy.session.request(method, self.url, **kwargs)
+
+    print("[test] --> Testing the retries of the translators (only at one layer)")
+    server = HTTPServer(("127.0.0.1", 0), FlakyHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{port}".format(port=server.server_address[1])
+    try:
+        request = Request(retry_policy=RetryPolicy(total=2, backoff_factor=0.01), transport=LocalTransport(url))
+        FlakyHandler.body = b'{"result": "ok"}'
+        jsonrpc = JSONRPCRequest(request, rate_limit=1000)
+
+        FlakyHandler.statuses, FlakyHandler.hits = [503], 0
+        assert jsonrpc.send_jsonrpc("LMT_handle_jobs", {}) == "ok"
+        assert FlakyHandler.hits == 2
+
+        FlakyHandler.statuses, FlakyHandler.hits = [503] * 10, 0
+        try:
+            jsonrpc.send_jsonrpc("LMT_handle_jobs", {})
+        except DeeplTranslateException as exception:
+            assert exception.status_code == 503
+        else:
+            raise AssertionError("DeeplTranslateException should be raised")
+        assert FlakyHandler.hits == 3  # one request and the 2 retries of the policy, not retried again by Request
+
+        FlakyHandler.statuses, FlakyHandler.hits = [429] * 10, 0
+        try:
+            jsonrpc.send_jsonrpc("LMT_handle_jobs", {})
+        except DeeplTranslateException as exception:
+            assert exception.rate_limited
+        else:
+            raise AssertionError("DeeplTranslateException should be raised")
+        assert FlakyHandler.hits == 1  # reported to the circuit breaker right away
+    finally:
+        FlakyHandler.statuses, FlakyHandler.body = [], b"{}"
+        server.shutdown()
+
+class HangingHandler(BaseHTTPRequestHandler):
+    """
+    A local HTTP server handler taking a second to answer
+    """
+
+    def do_GET(self):
+        import time
+        time.sleep(1)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_request_deadline():
+    import time
+    from translatepy.exceptions import DeadlineExceeded
+    from translatepy.utils.deadline import deadline
+
+    print("[test] --> Testing translatepy.utils.request.Request with a deadline")
+    server = HTTPServer(("127.0.0.1", 0), HangingHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        request = Request()
+        start = time.monotonic()
+        try:
+            with deadline(0.2):
+                request.get("http://127.0.0.1:{port}/hanging".format(port=server.server_address[1]))
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("DeadlineExceeded should be raised")
+        assert time.monotonic() - start < 0.8  # not retried once the deadline passed
+
+        print("[test] --> Testing translatepy.utils.request.AsyncRequest with a deadline")
+        async_request = AsyncRequest(request=request)
+        loop = asyncio.new_event_loop()
+        start = time.monotonic()
+        try:
+            with deadline(0.2):
+                loop.run_until_complete(async_request.get("http://127.0.0.1:{port}/async-hanging".format(port=server.server_address[1])))
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("DeadlineExceeded should be raised")
+        finally:
+            loop.run_until_complete(async_request.close())
+            loop.close()
+        assert time.monotonic() - start < 0.8
+    finally:
+        server.shutdown()
+
+
+def test_proxy_pool():
+    from multiprocessing.pool import ThreadPool
+    from translatepy.utils.request import ProxyPool, RetryPolicy
+
+    print("[test] --> Testing translatepy.utils.request.ProxyPool")
+    pool = ProxyPool(["http://a", "http://b", "http://c"], failure_threshold=2, ejection_time=0.1)
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second  # the least loaded proxy is picked
+    pool.release(first, 0.1)
+    pool.release(second, 0.5)
+    third = pool.acquire()
+    assert third.url == "http://c"
+    pool.release(third, 0.2)
+    assert pool.acquire() is first  # the fastest one
+    pool.release(first, 0.1, success=False)
+    pool.release(first, 0.1, success=False)
+    assert first.ejected
+    assert all(pool.acquire() is not first for _ in range(6))
+
+    import time
+    time.sleep(0.11)
+    assert not first.ejected  # rotated back in
+
+    in_flight = [proxy.in_flight for proxy in pool.proxies]
+    with ThreadPool(8) as threads:
+        threads.map(lambda _: pool.release(pool.acquire(), 0.1), range(200))
+    assert [proxy.in_flight for proxy in pool.proxies] == in_flight
+    assert sum(proxy.requests for proxy in pool.proxies) == 205
+
+    print("[test] --> Testing translatepy.utils.request.Request with a proxy pool")
+    server, url = start_server()  # the stub server also answers the requests sent through it as a proxy
+    try:
+        request = Request(
+            proxy_pool=ProxyPool(["http://127.0.0.1:1", url], failure_threshold=1, ejection_time=60),
+            retry_policy=RetryPolicy(total=2, backoff_factor=0)
+        )
+        for _ in range(3):
+            response = request.post("http://translatepy.test/translate", data={"q": "Hello"})
+            assert response.status_code == 200
+            assert response.json()["path"] == "http://translatepy.test/translate"
+        dead, alive = request.proxy_pool.stats()
+        assert dead["ejected"] and dead["requests"] == 1
+        assert not alive["ejected"] and alive["requests"] == 3 and alive["in_flight"] == 0
+    finally:
+        server.shutdown()
+
+
+def test_connection_pool():
+    import requests
+    from translatepy import Translate
+    from translatepy.translators.reverso import ReversoTranslate
+    from translatepy.utils.request import default_request
+
+    print("[test] --> Testing translatepy.utils.request connection pools")
+    assert ReversoTranslate().session is default_request()
+    assert Translate().request is default_request()
+
+    request = Request(pool_maxsize=4)
+    adapter = request.session.get_adapter("https://translate.google.com")
+    assert adapter._pool_maxsize == 4
+    pool = adapter.get_connection_with_tls_context(requests.Request("GET", "https://translate.google.com").prepare(), verify=True)
+    connection = pool._get_conn()
+    pool._put_conn(connection)  # a connection kept alive
+    Translate(request=request, fast=True, max_workers=16)
+    assert request.session.get_adapter("https://translate.google.com") is adapter  # not remounted
+    assert adapter._pool_maxsize == 16 and pool.pool.maxsize == 16
+    assert adapter.get_connection_with_tls_context(requests.Request("GET", "https://translate.google.com").prepare(), verify=True) is pool
+    assert pool._get_conn() is connection  # the connections kept alive are not dropped
+    request.resize_pool(8)  # never shrunk
+    assert request.pool_maxsize == 16
+
+    detections = []
+    apparent_encoding = requests.Response.apparent_encoding
+    requests.Response.apparent_encoding = property(lambda self: detections.append(self) or "utf-8")
+    server, url = start_server()
+    try:
+        response = request.post(url + "/lazy")
+        assert response.json()["path"] == "/lazy" and response.ok
+        assert detections == []  # the charset detection is not run in the hot path
+        assert response.apparent_encoding == "utf-8" and len(detections) == 1
+
+        streamed = request.post(url + "/streamed", stream=True)  # not closed before being read
+        assert json.loads(b"".join(streamed.iter_content(chunk_size=8)))["path"] == "/streamed"
+        streamed.close()
+    finally:
+        requests.Response.apparent_encoding = apparent_encoding
+        server.shutdown()
+
+
+def test_http2_transport():
+    import pytest
+    pytest.importorskip("httpx")
+    from translatepy.utils.request import HTTP2Transport
+
+    print("[test] --> Testing translatepy.utils.request.HTTP2Transport")
+    server, url = start_server()
+    request = Request(transport=HTTP2Transport())
+    request.headers = {"X-Custom": "translatepy"}
+    try:
+        response = request.post(url + "/translate", data={"q": "Hello", "flag": True}, params={"dt": ["t", "bd"]})
+        assert response.status_code == 200 and response.ok
+        result = response.json()
+        assert result["method"] == "POST"
+        assert result["path"] == "/translate?dt=t&dt=bd"
+        assert result["body"] == "q=Hello&flag=True"
+        assert result["user_agent"] == request.headers["User-Agent"]
+        assert result["custom"] == "translatepy"
+        assert request.get(url + "/cached", headers={"X-Custom": None}).json()["custom"] is None
+        assert request.post(url + "/unverified", verify=False).json()["path"] == "/unverified"
+        assert len(request.transport._clients) == 2  # the TLS options are set on the clients
+        upload = request.post(url + "/upload", files={"file": ("hello.txt", b"Hello")}).json()
+        assert "filename=\"hello.txt\"" in upload["body"]
+        with pytest.raises(TypeError):
+            request.post(url + "/hooks", hooks={"response": []})  # not silently dropped
+    finally:
+        request.transport.close()
+        server.shutdown()
@@ -1,4 +1,14 @@
+import asyncio
+import io
+import time
+from multiprocessing.pool import ThreadPool
+
 from translatepy import Translate
+from translatepy.exceptions import DeadlineExceeded, TranslationError
+from translatepy.language import Language
+from translatepy.translators.base import BaseTranslateException
+from translatepy.utils._language_data import LANGUAGE_DATA
+from tests.test_base import DummyAsyncTranslate, DummyBatchTranslate, DummyTranslate
 
 
 def alternate(func):
@@ -13,6 +23,24 @@ def alternate(func):
     return wrapper
 
 
+def clean_cache() -> None:
+    """
+    Empties the caches shared by the translators, so that the services of the test get called
+    """
+    DummyTranslate().clean_cache()
+
+
+def run_async(coroutine):
+    """
+    Runs the given coroutine in a new event loop and returns its result
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
 class TestAllTranslators:
     def setup(self):
         self.translator = Translate()
@@ -81,3 +109,251 @@ class TestAllTranslators:
 
         for args in translation_args_list:
             assert self.translator.translate_html(*args)
+
+
+def test_async_translate():
+    class FailingTranslate(DummyAsyncTranslate):
+        async def _atranslate(self, text, destination_language, source_language):
+            raise TranslationError("failing on purpose")
+
+    print("[test] --> Testing translatepy.Translate asynchronous methods")
+    for fast in (False, True):
+        translator = Translate([FailingTranslate, DummyAsyncTranslate], fast=fast)
+        clean_cache()
+        result = run_async(translator.atranslate("Async Hello", "fr"))
+        assert result.result == "async hello"
+        assert str(result.service) == "Dummy"
+
+
+def test_fast_mode_executor():
+    class SlowTranslate(DummyTranslate):
+        def _translate(self, text, destination_language, source_language):
+            time.sleep(0.5)
+            return "en", "slow"
+
+    print("[test] --> Testing translatepy.Translate fast mode executor")
+    clean_cache()
+    with Translate([SlowTranslate, DummyTranslate], fast=True, max_workers=2, service_concurrency=1) as translator:
+        start = time.time()
+        assert translator.translate("Fast Hello", "fr").result == "FAST HELLO"
+        assert time.time() - start < 0.5  # the first valid result is returned without waiting for the slow service
+        executor = translator.executor
+        assert translator.translate("Fast World", "fr").result == "FAST WORLD"
+        assert translator.executor is executor  # the same thread pool is reused between calls
+
+
+def test_hedged_mode():
+    class SlowTranslate(DummyTranslate):
+        def _translate(self, text, destination_language, source_language):
+            self.calls.append(("translate", text))
+            time.sleep(0.5)
+            return "en", "slow"
+
+    print("[test] --> Testing translatepy.Translate hedged mode")
+    clean_cache()
+    slow, dummy = SlowTranslate(), DummyTranslate()
+    with Translate([dummy, slow], hedged=True, hedge_delay=0.1) as translator:
+        assert translator.translate("Hedged Hello", "fr").result == "HEDGED HELLO"
+        assert slow.calls == []  # the first service answered within its budget
+
+    with Translate([slow, dummy], hedged=True, hedge_delay=0.1) as translator:
+        start = time.time()
+        assert translator.translate("Hedged World", "fr").result == "HEDGED WORLD"
+        assert time.time() - start < 0.5  # the second service got started after the budget of the first one ran out
+
+
+def test_adaptive_ranking():
+    class FailingTranslate(DummyTranslate):
+        def _translate(self, text, destination_language, source_language):
+            self.calls.append(("translate", text))
+            raise TranslationError("failing on purpose")
+
+        def __str__(self) -> str:
+            return "Failing"
+
+    print("[test] --> Testing translatepy.Translate adaptive ranking")
+    clean_cache()
+    failing = FailingTranslate()
+    translator = Translate([failing, DummyTranslate()])
+    assert translator.translate("Ranked Hello", "fr").result == "RANKED HELLO"
+    assert translator.translate("Ranked World", "fr").result == "RANKED WORLD"
+    assert len(failing.calls) == 1  # the failing service got tried only once
+
+    stats = translator.stats()
+    assert [element["service"] for element in stats] == ["Dummy", "Failing"]
+    assert stats[0]["success_rate"] == 1 and stats[0]["calls"] == 2
+    assert stats[1]["recent_failures"] == 1
+
+
+def test_circuit_breaker():
+    class RateLimitedTranslate(DummyTranslate):
+        def _translate(self, text, destination_language, source_language):
+            self.calls.append(("translate", text))
+            raise BaseTranslateException(429)
+
+        def __str__(self) -> str:
+            return "RateLimited"
+
+    print("[test] --> Testing translatepy.Translate circuit breakers")
+    clean_cache()
+    limited = RateLimitedTranslate()
+    translator = Translate([limited, DummyTranslate()], adaptive=False, breaker_cooldown=0.2)
+    assert translator.translate("Breaker Hello", "fr").result == "BREAKER HELLO"
+    assert translator.translate("Breaker World", "fr").result == "BREAKER WORLD"
+    assert len(limited.calls) == 1  # opened right away because of the rate limit
+
+    breakers = translator.circuit_breakers()
+    assert breakers[0]["service"] == "RateLimited" and breakers[0]["state"] == "open"
+    assert breakers[1]["state"] == "closed"
+
+    time.sleep(0.25)
+    assert translator.circuit_breakers()[0]["state"] == "half-open"
+    assert translator.translate("Breaker Probe", "fr").result == "BREAKER PROBE"
+    assert len(limited.calls) == 2  # a single probe went through, and failed
+    assert translator.circuit_breakers()[0]["state"] == "open"
+
+
+def test_single_flight():
+    print("[test] --> Testing translatepy.Translate single-flight calls")
+    clean_cache()
+    translator = Translate([DummyTranslate()])
+    calls = []
+    run_services = translator._run_services
+
+    def counting_run_services(method, **kwargs):
+        calls.append(method)
+        time.sleep(0.2)
+        return run_services(method, **kwargs)
+
+    translator._run_services = counting_run_services
+    with ThreadPool(8) as pool:
+        results = pool.map(lambda _: translator.translate("Flight Hello", "fr").result, range(8))
+    assert results == ["FLIGHT HELLO"] * 8
+    assert calls == ["translate"]
+    assert translator._flights.shared == 7
+
+
+def test_translate_html_batches():
+    print("[test] --> Testing translatepy.Translate.translate_html batching")
+    clean_cache()
+    service = DummyBatchTranslate()
+    html = "<ul>{items}</ul><p> Checkout </p>".format(items="<li>Add to cart</li>" * 40)
+    result = Translate([service]).translate_html(html, "fr")
+    assert result == "<ul>{items}</ul><p> CHECKOUT </p>".format(items="<li>ADD TO CART</li>" * 40)
+    assert service.calls == [("batch", ("Add to cart", "Checkout"))]  # deduplicated, in a single batch (`_max_batch_size` = 2)
+
+    # BaseTranslator.translate_html
+    clean_cache()
+    service = DummyBatchTranslate()
+    assert service.translate_html("<p>a</p><p>b</p><p>c</p><p>a</p>", "fr") == "<p>A</p><p>B</p><p>C</p><p>A</p>"
+    assert sorted(service.calls) == [("batch", ("a", "b")), ("batch", ("c",))]
+
+
+def test_translate_html_stream():
+    print("[test] --> Testing translatepy.Translate.translate_html_stream")
+    clean_cache()
+    service = DummyBatchTranslate()
+    html = '<!DOCTYPE html><html><head><style>p {color: red}</style></head><body><!-- comment --><p class="a">Hello &amp; <b>world</b></p>\n<pre>keep</pre>' + "<p>Add to cart</p>" * 10 + "<br/>end</body></html>"
+    chunks = list(Translate([service]).translate_html_stream(io.StringIO(html), "fr", window_size=4))
+    assert len(chunks) > 1  # yielded as it goes
+    assert "".join(chunks) == '<!DOCTYPE html><html><head><style>p {color: red}</style></head><body><!-- comment --><p class="a">HELLO &amp; <b>WORLD</b></p>\n<pre>keep</pre>' + "<p>ADD TO CART</p>" * 10 + "<br/>END</body></html>"
+
+    # the end tags are passed through as is, like the start tags
+    assert "".join(Translate([service]).translate_html_stream('<DIV Class="a">Hello</DIV >', "fr")) == '<DIV Class="a">HELLO</DIV >'
+
+
+def test_deadline():
+    class SlowTranslate(DummyTranslate):
+        def _translate(self, text, destination_language, source_language):
+            self.calls.append(("translate", text))
+            time.sleep(0.3)
+            raise ValueError("too slow")
+
+    print("[test] --> Testing translatepy.Translate deadlines")
+    clean_cache()
+    slow, dummy = SlowTranslate(), DummyTranslate()
+    translator = Translate([slow, dummy], adaptive=False)
+    try:
+        translator.translate("Deadline Hello", "fr", timeout=0.2)
+    except DeadlineExceeded:
+        pass
+    else:
+        raise AssertionError("DeadlineExceeded should be raised")
+    assert dummy.calls == []  # no other service is tried once the deadline passed
+    assert translator.circuit_breakers()[1]["state"] == "closed"
+    assert translator.translate("Deadline Hello", "fr", timeout=1).result == "DEADLINE HELLO"
+
+    class HangingTranslate(DummyTranslate):
+        def _translate(self, text, destination_language, source_language):
+            time.sleep(1)
+            return "en", "hanging"
+
+    with Translate([HangingTranslate], fast=True) as translator:
+        start = time.time()
+        try:
+            translator.translate("Deadline World", "fr", timeout=0.2)
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("DeadlineExceeded should be raised")
+        assert time.time() - start < 0.5
+
+    class HangingAsyncTranslate(DummyAsyncTranslate):
+        async def _atranslate(self, text, destination_language, source_language):
+            await asyncio.sleep(1)
+            return "en", "hanging"
+
+    translator = Translate([HangingAsyncTranslate])
+    start = time.time()
+    try:
+        run_async(translator.atranslate("Async Deadline", "fr", timeout=0.1))
+    except DeadlineExceeded:
+        assert time.time() - start < 0.5
+    else:
+        raise AssertionError("DeadlineExceeded should be raised")
+
+    class BlockingAsyncTranslate(DummyAsyncTranslate):
+        async def _atranslate(self, text, destination_language, source_language):
+            time.sleep(0.3)  # the coroutine cannot be cancelled while blocking the event loop
+            raise ValueError("too slow")
+
+    dummy = DummyAsyncTranslate()
+    translator = Translate([BlockingAsyncTranslate(), dummy], adaptive=False)
+    try:
+        run_async(translator.atranslate("Async Deadline Hello", "fr", timeout=0.2))
+    except DeadlineExceeded:
+        pass
+    else:
+        raise AssertionError("DeadlineExceeded should be raised")
+    assert dummy.calls == []  # no other service is tried once the deadline passed
+
+
+def test_supported_languages():
+    class FrenchOnlyTranslate(DummyTranslate):
+        _supported_languages = {"auto", "en", "fr"}
+
+        def __str__(self) -> str:
+            return "FrenchOnly"
+
+    print("[test] --> Testing translatepy.translators.base.BaseTranslator.supports_pair")
+    assert FrenchOnlyTranslate.supports_pair("French", "English")
+    assert FrenchOnlyTranslate().supports_language("fra")
+    assert not FrenchOnlyTranslate.supports_pair("auto", "Japanese")
+    assert FrenchOnlyTranslate._normalize_language(Language("French")) == "fr"
+    assert FrenchOnlyTranslate._denormalize_language("fr") is Language("fr")
+    for language_id in list(LANGUAGE_DATA)[:600]:
+        FrenchOnlyTranslate._denormalize_language(language_id)
+    assert len(FrenchOnlyTranslate._languages_table()["denormalized"]) <= 512  # bounded, the codes can come from the users
+
+    print("[test] --> Testing translatepy.Translate skipping the services not supporting a language")
+    clean_cache()
+    french_only, dummy = FrenchOnlyTranslate(), DummyTranslate()
+    translator = Translate([french_only, dummy], adaptive=False)
+    assert translator.supporting_services("Japanese") == [dummy]
+    assert translator.supporting_services("French", "English") == [french_only, dummy]
+    assert translator.translate("Supported Hello", "ja").result == "SUPPORTED HELLO"
+    assert french_only.calls == [] and dummy.calls == [("translate", "Supported Hello")]
+
+    translator = Translate([french_only, dummy])
+    translator.translate("Ranked Hello", "ja")  # only the second service gets statistics, and is ranked first
+    assert translator.supporting_services("French", "English") == [dummy, french_only]
@@ -2,12 +2,12 @@ from translatepy.exceptions import UnsupportedMethod
 from translatepy.translators.base import BaseTranslator
 from translatepy.translators.bing import (BingTranslate, BingTranslateException)
 from translatepy.translators.deepl import (DeeplTranslate, DeeplTranslateException)
-from translatepy.translators.google import GoogleTranslateV1, GoogleTranslateV2
+from translatepy.translators.google import GoogleTranslateException, GoogleTranslateV1, GoogleTranslateV2
 from translatepy.translators.mymemory import (MyMemoryTranslate, MyMemoryException)
 from translatepy.translators.reverso import ReversoTranslate
 from translatepy.translators.translatecom import TranslateComTranslate
 from translatepy.translators.yandex import (YandexTranslate, YandexTranslateException)
-from translatepy.translators.microsoft import MicrosoftTranslate
+from translatepy.translators.microsoft import MicrosoftException, MicrosoftTranslate
 
 IGNORED_EXCEPTIONS = (UnsupportedMethod, DeeplTranslateException, BingTranslateException, MyMemoryException, YandexTranslateException)  # DeepL's and Bing's rate limit is way too sensitive
 
@@ -136,3 +136,91 @@ class TestAllTranslators:
                 except IGNORED_EXCEPTIONS as ex:
                     self.report_exception("translate_html", service, ex)
                     continue
+
+
+def test_deepl_missing_result():
+    class JSONRPCStub():
+        def send_jsonrpc(self, method, params):
+            if method == "LMT_split_into_sentences":
+                return {"splitted_texts": [[text] for text in params["texts"]], "lang": "EN"}
+            return None  # no "result" in the JSON-RPC response
+
+    print("[test] --> Testing translatepy.translators.deepl.DeeplTranslate without any result")
+    translator = DeeplTranslate.__new__(DeeplTranslate)  # without the client state request
+    translator.jsonrpc = JSONRPCStub()
+    translator.user_preferred_langs = ["EN"]
+    for call in (lambda: translator._translate("Hello", "FR", "auto"), lambda: translator._translate_batch(["Hello", "World"], "FR", "auto")):
+        try:
+            call()
+        except DeeplTranslateException:
+            pass
+        else:
+            raise AssertionError("DeeplTranslateException should be raised")
+
+
+def test_rate_limit_codes():
+    print("[test] --> Testing the rate limit codes of the translators exceptions")
+    assert all(MicrosoftException(code).rate_limited for code in (429, 429000, 429001, 429002))
+    assert not MicrosoftException(401000).rate_limited
+    assert DeeplTranslateException(1042911).rate_limited and YandexTranslateException(404).rate_limited
+
+
+def test_google_missing_batch_result():
+    print("[test] --> Testing translatepy.translators.google.GoogleTranslateV1 with a missing envelope")
+    translator = GoogleTranslateV1.__new__(GoogleTranslateV1)
+    translator._batch_request = lambda texts, destination, source: ")]}'\n"  # no envelope
+    try:
+        translator._translate_batch(["Hello", "World"], "fr", "auto")
+    except GoogleTranslateException:
+        pass
+    else:
+        raise AssertionError("GoogleTranslateException should be raised")
+
+
+def test_native_async():
+    import asyncio
+    from translatepy.translators.deepl import JSONRPCRequest
+    from translatepy.utils.request import Request
+
+    class Response():
+        def __init__(self, data, status_code: int = 200):
+            self.data = data
+            self.status_code = status_code
+
+        def json(self):
+            return self.data
+
+    class AsyncSessionStub():
+        async def single_attempt(self, method, url, json=None, **kwargs):
+            if json["method"] == "LMT_split_into_sentences":
+                return Response({"result": {"splitted_texts": [[text] for text in json["params"]["texts"]], "lang": "EN"}})
+            return Response({"result": {"source_lang": "EN", "translations": [{"beams": [{"postprocessed_sentence": job["raw_en_sentence"].upper()}]} for job in json["params"]["jobs"]]}})
+
+        async def get(self, url, params=None, **kwargs):
+            return Response([[["Bonjour", params["q"]]], None, "en"])
+
+    async def blocking(*args):
+        raise AssertionError("the native coroutine should be used instead of the executor")
+
+    print("[test] --> Testing the native coroutines of the translators")
+    deepl = DeeplTranslate.__new__(DeeplTranslate)  # without the client state request
+    deepl.jsonrpc = JSONRPCRequest.__new__(JSONRPCRequest)
+    deepl.jsonrpc.session, deepl.jsonrpc.async_session, deepl.jsonrpc.id_number = Request(), AsyncSessionStub(), 1
+    deepl.user_preferred_langs = ["EN"]
+    deepl._run_in_executor = blocking
+
+    google = GoogleTranslateV2.__new__(GoogleTranslateV2)
+    google.async_session = AsyncSessionStub()
+    google._run_in_executor = blocking
+
+    async def run():
+        assert await deepl._atranslate("Hello", "FR", "auto") == ("EN", "HELLO")
+        assert await deepl._alanguage("Hello") == "EN"
+        assert await google._atranslate("Hello", "fr", "auto") == ("en", "Bonjour")
+        assert await google._alanguage("Hello") == "en"
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
@@ -57,6 +57,7 @@ def main():
     parser_server = subparser.add_parser("server", help="Starts the translatepy HTTP server")
     parser_server.add_argument('--port', '-p', action='store', default=5000, type=int, help='port to run the server on')
     parser_server.add_argument('--host', action='store', default="127.0.0.1", type=str, help='host to run the server on')
+    parser_server.add_argument('--cache', action='store', default=None, type=str, help='cache backend URL shared by the workers (i.e redis://localhost:6379/0?ttl=86400, sqlite:///path/to/cache.sqlite). Defaults to the TRANSLATEPY_CACHE environment variable or an in-memory cache')
 
     args = parser.parse_args()
 
@@ -149,6 +150,9 @@ def main():
     # SERVER
     if args.action == "server":
         try:
+            if args.cache:
+                from os import environ
+                environ["TRANSLATEPY_CACHE"] = args.cache
             from translatepy.server import translation
             from translatepy.server import language
             from translatepy.server.server import app
@@ -63,3 +63,8 @@ class RequestStatusError(TranslatepyException):
 class ServiceURLError(TranslatepyException):
     def __init__(self, *args: object) -> None:
         super().__init__(*args)
+
+
+class DeadlineExceeded(TranslatepyException, TimeoutError):
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
@@ -1,14 +1,18 @@
 from re import compile
+from threading import Lock
+from types import MappingProxyType
 from translatepy.utils.sanitize import remove_spaces
 from typing import Union
 
 from translatepy.exceptions import UnknownLanguage
-from translatepy.utils._language_data import CODES, LANGUAGE_DATA, VECTORS
+from translatepy.utils._language_data import CODES, FOREIGN_NAMES, LANGUAGE_DATA, VECTORS
+from translatepy.utils.lazy import LazySequence
 from translatepy.utils.lru_cacher import LRUDictCache
-from translatepy.utils.similarity import StringVector, fuzzy_search
+from translatepy.utils.similarity import StringVector, create_index, fuzzy_search
 
-# preparing the vectors
-LOADED_VECTORS = [StringVector(language, data=data) for language, data in VECTORS.items()]
+# the vectors are only prepared when a fuzzy search first happens
+LOADED_VECTORS = LazySequence(lambda: [StringVector(language, data={"s": set(counter), "l": length, "c": counter}) for language, (_, length, counter) in VECTORS.items()])
+VECTORS_INDEX = create_index(LOADED_VECTORS)
 
 LANGUAGE_CLEANUP_REGEX = compile(r"\(.+\)")
 
@@ -76,13 +80,29 @@ class Types():
 
 _languages_cache = LRUDictCache(512)
 
+# The Language instances, one for each (language id, similarity)
+# The exact matches (a similarity of 100) are all kept, as there is a finite number of them,
+# while the fuzzy matches, which can have any similarity, are bounded like `_languages_cache`
+_interned = {}
+_fuzzy_interned = LRUDictCache(512)
+_interned_lock = Lock()
+# The data shared by the instances of a same language
+_extras = {}
+_foreign_names = {}
+
 
 class Language():
     """
     A class holding language data
+
+    The instances are interned and immutable: Language("fr") is Language("fra")
     """
 
+    __slots__ = ("id", "similarity", "alpha2", "alpha3b", "alpha3t", "alpha3", "name", "extra")
+
     class LanguageExtra():
+        __slots__ = ("type", "scope")
+
         def __init__(self, data: dict) -> None:
             self.type = Types().get(data.get("t", None))
             self.scope = Scopes().get(data.get("s", None))
@@ -96,44 +116,62 @@ class Language():
                 "scope": self.scope.name if self.scope is not None else None
             }
 
-    def __init__(self, language: str, threshold: Union[int, float] = 93) -> None:
+    def __new__(cls, language: str, threshold: Union[int, float] = 93) -> "Language":
+        if isinstance(language, Language):
+            return language
         if language is None or remove_spaces(language) == "":
             raise UnknownLanguage("N/A", 0, "You need to pass in a language")
-        if isinstance(language, Language):
-            self.id = language.id
-            self.similarity = language.similarity
+        language = str(language)
+        normalized_language = remove_spaces(LANGUAGE_CLEANUP_REGEX.sub("", language.lower()))
+
+        # Check the incoming language, whether it is in the cache, then return the instance from the cache
+        if normalized_language in _languages_cache:
+            return _languages_cache[normalized_language]
+
+        if normalized_language in CODES:
+            language_id = CODES[normalized_language]
+            similarity = 100
         else:
-            language = str(language)
-            normalized_language = remove_spaces(LANGUAGE_CLEANUP_REGEX.sub("", language.lower()))
-
-            # Check the incoming language, whether it is in the cache, then return the values from the cache
-            if normalized_language in _languages_cache:
-                self.id, self.similarity = _languages_cache[normalized_language]
-            else:
-                if normalized_language in CODES:
-                    self.id = CODES[normalized_language]
-                    self.similarity = 100
-                else:
-                    _search_result, _similarity = fuzzy_search(LOADED_VECTORS, normalized_language)
-                    self.similarity = _similarity * 100
-                    if self.similarity < threshold:
-                        raising_message = "Couldn't recognize the given language ({0})\nDid you mean: {1} (Similarity: {2}%)?".format(language, _search_result, round(self.similarity, 2))
-                        raise UnknownLanguage(_search_result, self.similarity, raising_message)
-                    self.id = VECTORS[_search_result]["i"]
-
-            # Сache the language values to speed up the language recognition process in the future
-            _languages_cache[normalized_language] = (self.id, self.similarity)
-
-        data = LANGUAGE_DATA[self.id]
-
-        self.alpha2 = data.get("2", None)
-        self.alpha3b = data.get("b", None)
-        self.alpha3t = data.get("t", None)
-        self.alpha3 = str(data["3"])
-        self.name = str(data["e"])
-        self.extra = self.LanguageExtra(data.get("x", {}))
-        self.in_foreign_languages = dict(data.get("f", {}))
-        self.in_foreign_languages["en"] = self.name
+            _search_result, _similarity = fuzzy_search(VECTORS_INDEX, normalized_language)
+            similarity = _similarity * 100
+            if similarity < threshold:
+                raising_message = "Couldn't recognize the given language ({0})\nDid you mean: {1} (Similarity: {2}%)?".format(language, _search_result, round(similarity, 2))
+                raise UnknownLanguage(_search_result, similarity, raising_message)
+            language_id = VECTORS[_search_result][0]
+
+        result = get_language(language_id, similarity)
+        # Сache the language to speed up the language recognition process in the future
+        _languages_cache[normalized_language] = result
+        return result
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Language objects are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Language objects are immutable")
+
+    def __reduce__(self):
+        return (get_language, (self.id, self.similarity))
+
+    def __copy__(self) -> "Language":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Language":
+        return self
+
+    @property
+    def in_foreign_languages(self) -> dict:
+        """
+        The name of the language in other languages, loaded on first access and shared by the instances as a read-only mapping
+
+        i.e {"ja": "フランス語", "en": "French", ...}
+        """
+        try:
+            return _foreign_names[self.id]
+        except KeyError:
+            in_foreign_languages = dict(FOREIGN_NAMES.get(self.id, {}))
+            in_foreign_languages["en"] = self.name
+            return _foreign_names.setdefault(self.id, MappingProxyType(in_foreign_languages))
 
     def clean_cache(self) -> None:
         _languages_cache.clear()
@@ -153,5 +191,42 @@ class Language():
             "alpha3": self.alpha3,
             "name": self.name,
             "extra": self.extra.as_dict(),
-            "in_foreign_languages": self.in_foreign_languages if foreign else None
-        }
\ No newline at end of file
+            "in_foreign_languages": dict(self.in_foreign_languages) if foreign else None
+        }
+
+
+def get_language(language_id: str, similarity: Union[int, float] = 100) -> Language:
+    """
+    Returns the interned Language instance for the given language id (a key of LANGUAGE_DATA) and similarity
+
+    i.e get_language("fra") is Language("French")
+    """
+    key = (language_id, similarity)
+    interned = _interned if similarity == 100 else _fuzzy_interned
+    try:
+        return interned[key]
+    except KeyError:
+        pass
+    data = LANGUAGE_DATA[language_id]  # raises a KeyError for an unknown id
+    with _interned_lock:
+        if key in interned:
+            return interned[key]
+        extra_data = data.get("x", {})
+        extra_key = (extra_data.get("t", None), extra_data.get("s", None))
+        if extra_key not in _extras:
+            _extras[extra_key] = Language.LanguageExtra(extra_data)
+
+        result = object.__new__(Language)
+        for name, value in (
+            ("id", language_id),
+            ("similarity", similarity),
+            ("alpha2", data.get("2", None)),
+            ("alpha3b", data.get("b", None)),
+            ("alpha3t", data.get("t", None)),
+            ("alpha3", str(data["3"])),
+            ("name", str(data["e"])),
+            ("extra", _extras[extra_key])
+        ):
+            object.__setattr__(result, name, value)
+        interned[key] = result
+        return result
\ No newline at end of file
@@ -2,10 +2,9 @@ from nasse import Response
 from nasse.models import Endpoint, Error, Login, Param, Return, Dynamic
 from nasse.utils.boolean import to_bool
 from translatepy.exceptions import UnknownLanguage
-from translatepy.language import LANGUAGE_CLEANUP_REGEX, LOADED_VECTORS, Language, VECTORS
+from translatepy.language import LANGUAGE_CLEANUP_REGEX, VECTORS_INDEX, Language, VECTORS
 from translatepy.server.server import app
 from translatepy.utils.sanitize import remove_spaces
-from translatepy.utils.similarity import StringVector
 
 base = Endpoint(
     section="Language",
@@ -79,7 +78,7 @@ def language_details(lang: str, threshold: float = 93, foreign: bool = True):
         "alpha3t": result.alpha3t,
         "alpha3": result.alpha3,
         "name": result.name,
-        "foreign": (result.in_foreign_languages if foreign else None),
+        "foreign": (dict(result.in_foreign_languages) if foreign else None),
         "extra": {
             "type": result.extra.type.name if result.extra.type is not None else None,
             "scope": result.extra.scope.name if result.extra.scope is not None else None
@@ -134,25 +133,17 @@ def language_details(lang: str, threshold: float = 93, foreign: bool = True):
 def language_search(lang: str, foreign: bool = True, limit: int = 10):
     limit = max(min(limit, 100), 0)
 
-    normalized_language = StringVector(remove_spaces(LANGUAGE_CLEANUP_REGEX.sub("", lang.lower())))
-
-    results_dict = {}
-    for vector in LOADED_VECTORS:
-        summation = sum(vector.counter[character] * normalized_language.counter[character] for character in vector.set.intersection(normalized_language.set))
-        length = vector.length * normalized_language.length
-        similarity = (0 if length == 0 else summation / length)
-        results_dict[vector] = similarity
-
-    results = sorted(results_dict.items(), key=lambda x: x[1], reverse=True)[:limit]
+    normalized_language = remove_spaces(LANGUAGE_CLEANUP_REGEX.sub("", lang.lower()))
+    results = VECTORS_INDEX.search(normalized_language, limit=limit)
 
     return 200, {
         "languages": [
             {
-                "string": str(vector.string),
+                "string": string,
                 "similarity": similarity,
-                "language": Language(VECTORS[vector.string]["i"]).as_dict(foreign)
+                "language": Language(VECTORS[string][0]).as_dict(foreign)
             }
-            for vector, similarity in results
+            for string, similarity in results
         ]
     }
 
@@ -183,7 +174,7 @@ def language_details_dynamic(language: str, threshold: float = 93, foreign: bool
         "alpha3t": result.alpha3t,
         "alpha3": result.alpha3,
         "name": result.name,
-        "foreign": (result.in_foreign_languages if foreign else None),
+        "foreign": (dict(result.in_foreign_languages) if foreign else None),
         "extra": {
             "type": result.extra.type.name if result.extra.type is not None else None,
             "scope": result.extra.scope.name if result.extra.scope is not None else None
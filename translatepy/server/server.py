@@ -1,6 +1,15 @@
+import os
+
 from nasse import Nasse
 from nasse.config import General
 
+from translatepy.translators.base import BaseTranslator
+from translatepy.utils.cache import cache_backend_from_url
+
 General.SANITIZE_USER_SENT = False  # this is needed for /html
 
 app = Nasse("translatepy")
+
+# i.e TRANSLATEPY_CACHE=redis://localhost:6379/0?ttl=86400 to share the cache between the workers
+if os.environ.get("TRANSLATEPY_CACHE"):
+    BaseTranslator.use_cache_backend(cache_backend_from_url(os.environ["TRANSLATEPY_CACHE"]))
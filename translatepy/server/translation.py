@@ -1,7 +1,6 @@
 import json
 from threading import Thread
 from typing import List
-from bs4 import NavigableString
 from nasse import Response
 from flask import Response as FlaskResponse
 from nasse.models import Endpoint, Error, Login, Param, Return
@@ -247,16 +246,12 @@ def translate(code: str, dest: str, source: str = "auto", parser: str = "html.pa
     services = []
     languages = []
 
-    def _translate(node: NavigableString):
-        try:
-            result = current_translator.translate(str(node), destination_language=dest, source_language=source)
+    def _collect(results):
+        for result in results:
             services.append(str(result.service))
             languages.append(str(result.source_language))
-            node.replace_with(result.result)
-        except Exception:  # ignore if it couldn't find any result or an error occured
-            pass
 
-    result = current_translator.translate_html(html=code, destination_language=dest, source_language=source, parser=parser, __internal_replacement_function__=_translate)
+    result = current_translator.translate_html(html=code, destination_language=dest, source_language=source, parser=parser, __internal_batch_callback__=_collect)
 
     return 200, {
         "services": [element for element, _ in Counter(services).most_common()],
@@ -267,6 +262,50 @@ def translate(code: str, dest: str, source: str = "auto", parser: str = "html.pa
     }
 
 
+@app.route("/html/stream", Endpoint(
+    endpoint=base,
+    name="Translate HTML Stream",
+    description=t.translate_html_stream.__doc__ + " This endpoint streams the translated HTML document as it gets translated.",
+    params=[
+        Param("code", "The HTML document to translate"),
+        Param("dest", "The destination language"),
+        Param("source", "The source language", required=False),
+        Param("translators", "The translator(s) to use. When providing multiple translators, the names should be comma-separated.", required=False, type=TranslatorList),
+    ]
+))
+def translate(code: str, dest: str, source: str = "auto", translators: List[str] = None):
+    current_translator = t
+    if translators is not None:
+        try:
+            current_translator = Translator(translators)
+        except UnknownTranslator as err:
+            return Response(
+                data={
+                    "guessed": str(err.guessed_translator),
+                    "similarity": err.similarity,
+                },
+                message="translatepy could not find the given translator",
+                error="UNKNOWN_TRANSLATOR",
+                code=400
+            )
+
+    try:
+        dest = Language(dest)
+        source = Language(source)
+    except UnknownLanguage as err:
+        return Response(
+            data={
+                "guessed": str(err.guessed_language),
+                "similarity": err.similarity,
+            },
+            message=str(err),
+            error="UNKNOWN_LANGUAGE",
+            code=400
+        )
+
+    return FlaskResponse(current_translator.translate_html_stream(html=code, destination_language=dest, source_language=source), mimetype="text/html")
+
+
 @app.route("/transliterate", Endpoint(
     endpoint=base,
     name="Transliterate",
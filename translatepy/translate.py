@@ -3,15 +3,23 @@ translatepy v2.4
 
 © Anime no Sekai — 2021
 """
+import asyncio
 import inspect
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from multiprocessing.pool import ThreadPool
-from threading import Thread
-from typing import Iterable, Union
+from threading import BoundedSemaphore, Event, Lock
+from functools import partial
+from time import time
+from typing import Iterable, Iterator, Union
 
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString, PageElement, PreformattedString, Tag
 
-from translatepy.exceptions import NoResult, ParameterTypeError, ParameterValueError
+from translatepy.exceptions import (DeadlineExceeded, NoResult, ParameterError,
+                                    ParameterTypeError, ParameterValueError,
+                                    UnsupportedLanguage, UnsupportedMethod)
 from translatepy.language import Language
 from translatepy.models import (DictionaryResult, ExampleResult,
                                 LanguageResult, SpellcheckResult,
@@ -22,10 +30,15 @@ from translatepy.translators import (BaseTranslator, BingTranslate,
                                      LibreTranslate, MyMemoryTranslate,
                                      ReversoTranslate, TranslateComTranslate,
                                      YandexTranslate, MicrosoftTranslate)
-from translatepy.utils.annotations import List
-from translatepy.utils.queue import Queue
-from translatepy.utils.request import Request
+from translatepy.utils.annotations import List, Tuple
+from translatepy.utils.breaker import CircuitBreaker, is_rate_limit
+from translatepy.utils.deadline import Deadline, bind_deadline, current_deadline, with_timeout
+from translatepy.utils.markup import stream_translate_html, translate_text_nodes
+from translatepy.utils.request import Request, default_request
 from translatepy.utils.sanitize import remove_spaces
+from translatepy.utils.singleflight import SingleFlight
+from translatepy.utils.stats import ServiceStatistics
+from translatepy.utils.utils import pack_batches
 from translatepy.utils.importer import get_translator
 
 
@@ -47,8 +60,16 @@ class Translate():
             TranslateComTranslate,
             MyMemoryTranslate
         ],
-        request: Request = Request(),
-        fast: bool = False
+        request: Request = None,
+        fast: bool = False,
+        max_workers: int = None,
+        service_concurrency: int = None,
+        hedged: bool = False,
+        hedge_percentile: float = 95,
+        hedge_delay: float = 1,
+        adaptive: bool = True,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 60
     ) -> None:
         """
         A special Translator class grouping multiple translators to have better results.
@@ -58,9 +79,32 @@ class Translate():
             services_list : list
                 A list of instanciated or not BaseTranslator subclasses to use as translators
             request : Request
-                The Request class used to make requests
+                The Request class used to make requests (the one shared by the translators by default)
             fast : bool
                 Enabling fast mode (concurrent processing) or not
+            max_workers : int, default = None
+                The maximum number of threads used by the fast mode, shared by all of the calls.
+                Defaults to 4 threads per service.
+            service_concurrency : int, default = None
+                The maximum number of in-flight requests per service. Defaults to no limit.
+            hedged : bool, default = False
+                Enabling hedged mode (staggered concurrent processing) or not.
+                The services are started one after the other, each one only when the previous one
+                failed or did not answer within its latency budget. The first valid result is returned.
+                This takes precedence over the fast mode.
+            hedge_percentile : float, default = 95
+                The percentile of the measured latencies of a service used as its latency budget in hedged mode
+            hedge_delay : float, default = 1
+                The latency budget (in seconds) used in hedged mode for the services with not enough measured latencies
+            adaptive : bool, default = True
+                Reordering the services from their measured latency and recent success rate or not.
+                When disabled, the services are always tried in the `services_list` order.
+            breaker_threshold : int, default = 5
+                The number of consecutive failures after which a service is skipped (its circuit is opened).
+                A service refusing a request because of its rate limits is skipped right away.
+            breaker_cooldown : float, default = 60
+                The time (in seconds) during which a service with an open circuit is skipped.
+                A single probe call is then let through, closing the circuit if it succeeds.
         """
         if not isinstance(services_list, Iterable):
             raise ParameterTypeError("Parameter 'services_list' must be iterable, {} was given".format(type(services_list).__name__))
@@ -69,8 +113,14 @@ class Translate():
             raise ParameterValueError("Parameter 'services_list' must not be empty")
 
         self.FAST_MODE = fast
-
-        if isinstance(request, type):  # is not instantiated
+        self.HEDGED_MODE = hedged
+        self.hedge_percentile = float(hedge_percentile)
+        self.hedge_delay = float(hedge_delay)
+        self.ADAPTIVE_MODE = adaptive
+
+        if request is None:
+            self.request = default_request()
+        elif isinstance(request, type):  # is not instantiated
             self.request = request()
         else:
             self.request = request
@@ -84,6 +134,21 @@ class Translate():
                     raise ParameterTypeError("{service} must be a child class of the BaseTranslator class".format(service=service))
             self.services.append(service)
 
+        self.max_workers = int(max_workers) if max_workers is not None else 4 * len(self.services)
+        if (self.FAST_MODE or self.HEDGED_MODE) and hasattr(self.request, "resize_pool"):
+            self.request.resize_pool(self.max_workers)  # every worker might be talking to the same host
+        self._executor = None
+        self._executor_lock = Lock()
+
+        if service_concurrency is not None:
+            self._services_semaphores = [BoundedSemaphore(int(service_concurrency)) for _ in self.services]
+        else:
+            self._services_semaphores = None
+
+        self._statistics = [ServiceStatistics() for _ in self.services]
+        self._flights = SingleFlight()
+        self._breakers = [CircuitBreaker(failure_threshold=breaker_threshold, cooldown=breaker_cooldown) for _ in self.services]
+
     def _instantiate_translator(self, service: BaseTranslator, services_list: list, index: int):
         if not isinstance(service, BaseTranslator):  # not instantiated
             if "request" in inspect.getfullargspec(service.__init__).args:  # check if __init__ wants a request parameter
@@ -93,53 +158,281 @@ class Translate():
             services_list[index] = service
         return service
 
-    def translate(self, text: str, destination_language: str, source_language: str = "auto") -> TranslationResult:
+    @property
+    def executor(self) -> ThreadPoolExecutor:
         """
-        Translates the given text to the given language
+        The thread pool used by the fast mode, created on first use
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
 
-        i.e Good morning (en) --> おはようございます (ja)
+    @contextmanager
+    def _service_slot(self, index: int, stop: Event = None):
         """
-        dest_lang = Language(destination_language)
-        source_lang = Language(source_language)
+        Waits for the service at the given index to have less in-flight requests than `service_concurrency`
+
+        Gives up if `stop` gets set in the meantime (when another service already returned a result)
+        """
+        if self._services_semaphores is None:
+            yield
+            return
+        semaphore = self._services_semaphores[index]
+        while not semaphore.acquire(timeout=0.1):
+            if stop is not None and stop.is_set():
+                raise NoResult("Cancelled because another service already returned a result")
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def _ranked_services(self, languages: dict = None) -> List[Tuple[int, BaseTranslator]]:
+        """
+        Returns the (index, service) pairs, with the services expected to give a valid result the fastest first
+
+        The services not supporting one of the given languages ({parameter name: Language}) are left out
+        """
+        services = list(enumerate(self.services))
+        if languages:
+            services = [(index, service) for index, service in services if all(service.supports_language(language) for language in languages.values())]
+        if not self.ADAPTIVE_MODE:
+            return services
+        # `sorted` is stable: the services without any statistics keep their order
+        return sorted(services, key=lambda element: self._statistics[element[0]].cost(default_latency=self.hedge_delay))
+
+    def stats(self) -> List[dict]:
+        """
+        Returns the statistics of each service, in their current ranking order
+
+        i.e [{"service": "Google", "rank": 0, "calls": 12, "failures": 0, "latency": 0.31, "p95": 0.52, "success_rate": 1.0, "recent_failures": 0}, ...]
+        """
+        results = []
+        for rank, (index, service) in enumerate(self._ranked_services()):
+            result = {
+                "service": str(service) if isinstance(service, BaseTranslator) else service.__name__,
+                "rank": rank
+            }
+            result.update(self._statistics[index].as_dict())
+            results.append(result)
+        return results
+
+    def circuit_breakers(self) -> List[dict]:
+        """
+        Returns the circuit breaker state of each service, in the `services_list` order
+
+        i.e [{"service": "Google", "state": "closed", "failures": 0, "retry_in": None}, {"service": "DeepL", "state": "open", "failures": 1, "retry_in": 42.3}, ...]
+        """
+        results = []
+        for service, breaker in zip(self.services, self._breakers):
+            result = {"service": str(service) if isinstance(service, BaseTranslator) else service.__name__}
+            result.update(breaker.as_dict())
+            results.append(result)
+        return results
+
+    def _check_circuit(self, index: int) -> None:
+        """
+        Raises NoResult if the service at the given index should be skipped because its circuit is open
+        """
+        if not self._breakers[index].allow():
+            raise NoResult("Skipped because the circuit of the service is open")
+
+    def _record_call(self, index: int, latency: float, exception: Exception = None) -> None:
+        """
+        Records the outcome of a call to the service at the given index in its statistics and circuit breaker
+        """
+        if exception is None:
+            self._statistics[index].record(latency)
+            self._breakers[index].record_success()
+        elif isinstance(exception, (UnsupportedMethod, UnsupportedLanguage, ParameterError, DeadlineExceeded)):
+            # says nothing about the service health
+            self._breakers[index].release()
+        else:
+            self._statistics[index].record(latency, success=False)
+            self._breakers[index].record_failure(rate_limited=is_rate_limit(exception))
+
+    def _hedge_delay(self, index: int) -> float:
+        """
+        Returns the time to wait for the service at the given index before starting the next one in hedged mode
+        """
+        delay = self._statistics[index].percentile(self.hedge_percentile)
+        return self.hedge_delay if delay is None else delay
+
+    def supporting_services(self, destination_language: str, source_language: str = "auto") -> List[BaseTranslator]:
+        """
+        Returns the services supporting the given pair of languages, without making any request
+
+        They are in the order they would be tried in (their current ranking in adaptive mode, refer to `stats`)
+
+        i.e Translate().supporting_services("Korean") --> [GoogleTranslate, YandexTranslate, MicrosoftTranslate, BingTranslate, DeeplTranslate, ...]
+        """
+        languages = {"destination_language": Language(destination_language), "source_language": Language(source_language)}
+        return [service for _, service in self._ranked_services(languages)]
+
+    @staticmethod
+    def _languages(kwargs: dict) -> dict:
+        """
+        Returns the languages given to a method call ({parameter name: Language}), which the services need to support
+        """
+        return {name: kwargs[name] for name in ("source_language", "destination_language") if name in kwargs}
+
+    def _unsupported(self, languages: dict) -> Exception:
+        """
+        Returns the exception given as the cause of NoResult when no service supports the given languages
+        """
+        return UnsupportedLanguage("No service supports {languages}".format(languages=", ".join("{name}={language}".format(name=name, language=language) for name, language in languages.items())))
+
+    @staticmethod
+    def _flight_key(method: str, kwargs: dict) -> tuple:
+        """
+        Returns the key identifying the identical calls to coalesce
+        """
+        def _normalize(value):
+            if isinstance(value, Language):
+                return value.id
+            if isinstance(value, list):
+                return tuple(value)
+            return value
+        return (method,) + tuple((name, _normalize(value)) for name, value in sorted(kwargs.items()))
+
+    @staticmethod
+    def _no_result(deadline: Deadline = None) -> Exception:
+        """
+        Returns the exception raised when no service returned a valid result
+        """
+        if deadline is not None and deadline.expired:
+            return DeadlineExceeded("No service has returned a valid result before the deadline")
+        return NoResult("No service has returned a valid result")
+
+    def _run(self, method: str, **kwargs):
+        """
+        Internal function calling the given method of the services, with the concurrent identical calls sharing a single result
+        """
+        return self._flights.do(self._flight_key(method, kwargs), partial(self._run_services, method, **kwargs))
+
+    def _run_services(self, method: str, **kwargs):
+        """
+        Internal function calling the given method of the services
+
+        When the fast mode is enabled, all of the services are called concurrently in the
+        executor and the first valid result is returned. The calls which did not start yet are
+        cancelled and the ones waiting for a service slot give up.
 
-        def _translate(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.translate(
-                text=text, destination_language=dest_lang, source_language=source_lang
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
+        When the hedged mode is enabled, the next service is only started when the previous one
+        failed or did not answer within its measured latency budget.
 
-        def _fast_translate(queue: Queue, translator: BaseTranslator, index: int):
+        The services with an open circuit are skipped, and no more service is tried once the deadline
+        of the call passed (refer to `translatepy.utils.deadline`).
+        """
+        deadline = current_deadline()
+
+        def _call(translator: BaseTranslator, index: int, stop: Event = None):
+            if stop is not None and stop.is_set():
+                raise NoResult("Cancelled because another service already returned a result")
+            if deadline is not None:
+                deadline.check()
+            self._check_circuit(index)
+            recorded = False
+            try:
+                translator = self._instantiate_translator(translator, self.services, index)
+                with self._service_slot(index, stop):
+                    start = time()
+                    try:
+                        result = getattr(translator, method)(**kwargs)
+                        if result is None:
+                            raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
+                    except Exception as ex:
+                        recorded = True
+                        self._record_call(index, time() - start, ex)
+                        raise
+                    recorded = True
+                    self._record_call(index, time() - start)
+                return result
+            finally:
+                if not recorded:  # cancelled before calling the service
+                    self._breakers[index].release()
+
+        # the services not supporting the languages are skipped before making any request
+        languages = self._languages(kwargs)
+        services = self._ranked_services(languages)
+        exception = None if services else self._unsupported(languages)
+        if self.HEDGED_MODE:
+            stop = Event()
+            candidates = list(services)
+            pending = set()
+            next_start = 0
             try:
-                queue.put(_translate(translator=translator, index=index))
-            except Exception:
-                pass
+                while candidates or pending:
+                    if deadline is not None and deadline.expired:
+                        break
+                    if candidates and (not pending or time() >= next_start):
+                        index, service = candidates.pop(0)
+                        pending.add(self.executor.submit(bind_deadline(_call, deadline), service, index, stop))
+                        next_start = time() + self._hedge_delay(index)
+                    timeout = max(next_start - time(), 0) if candidates else None
+                    if deadline is not None:
+                        timeout = max(deadline.remaining(), 0) if timeout is None else min(timeout, max(deadline.remaining(), 0))
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            return future.result()
+                        except Exception as ex:
+                            exception = ex
+                            next_start = 0  # a failed service does not need to be waited for
+            finally:
+                stop.set()
+                for future in pending:
+                    future.cancel()
+            raise self._no_result(deadline) from exception
 
         if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_translate, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
+            stop = Event()
+            futures = [self.executor.submit(bind_deadline(_call, deadline), service, index, stop) for index, service in services]
             try:
-                return _translate(translator=service, index=index)
+                for future in as_completed(futures, timeout=(None if deadline is None else max(deadline.remaining(), 0))):
+                    try:
+                        return future.result()
+                    except Exception as ex:
+                        exception = ex
+                        continue
+            except FuturesTimeoutError:
+                raise DeadlineExceeded("No service has returned a valid result before the deadline") from exception
+            finally:
+                stop.set()
+                for future in futures:
+                    future.cancel()
+            raise self._no_result(deadline) from exception
+
+        for index, service in services:
+            if deadline is not None and deadline.expired:
+                break
+            try:
+                return _call(translator=service, index=index)
             except Exception as ex:
                 exception = ex
                 continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
+        raise self._no_result(deadline) from exception
 
-    def translate_html(self, html: Union[str, PageElement, Tag, BeautifulSoup], destination_language: str, source_language: str = "auto", parser: str = "html.parser", threads_limit: int = 100, __internal_replacement_function__ = None) -> Union[str, PageElement, Tag, BeautifulSoup]:
+    @with_timeout
+    def translate(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> TranslationResult:
+        """
+        Translates the given text to the given language
+
+        i.e Good morning (en) --> おはようございます (ja)
+        """
+        return self._run("translate", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
+
+    @with_timeout
+    def translate_batch(self, texts: List[str], destination_language: str, source_language: str = "auto", timeout: float = None) -> List[TranslationResult]:
+        """
+        Translates the given texts to the given language, packing them in as few requests as possible
+
+        i.e ["Good morning", "Good night"] (en) --> ["おはようございます", "おやすみなさい"] (ja)
+        """
+        return self._run("translate_batch", texts=texts, destination_language=Language(destination_language), source_language=Language(source_language))
+
+    @with_timeout
+    def translate_html(self, html: Union[str, PageElement, Tag, BeautifulSoup], destination_language: str, source_language: str = "auto", parser: str = "html.parser", threads_limit: int = 100, timeout: float = None, __internal_replacement_function__ = None, __internal_batch_callback__ = None) -> Union[str, PageElement, Tag, BeautifulSoup]:
         """
         Translates the given HTML string or BeautifulSoup object to the given language
 
@@ -150,6 +443,9 @@ class Translate():
         Note: This method is not perfect since it is not tag/context aware. Example: `<span>Hello <strong>everyone</strong></span>` will not be understood as
         "Hello everyone" with "everyone" in bold but rather "Hello" and "everyone" separately.
 
+        Each unique text is only translated once, and the texts are packed in batches which
+        respect the size limits of every service.
+
         Warning: If you give a `bs4.BeautifulSoup`, `bs4.element.PageElement` or `bs4.element.Tag` input (which are mutable), they will be modified.
         If you don't want this behavior, please make sure to pass the string version of the element:
         >>> result = Translate().translate_html(str(page_element), "French")
@@ -165,9 +461,14 @@ class Translate():
             parser : str, default = "html.parser"
                 The parser that BeautifulSoup will use to parse the HTML string.
             threads_limit : int, default = 100
-                The maximum number of threads that will be spawned by translate_html
+                The maximum number of batches translated concurrently by translate_html
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
             __internal_replacement_function__ : function, default = None
                 This is used internally, especially by the translatepy HTTP server to modify the translation step.
+                When given, each text node is translated separately by this function.
+            __internal_batch_callback__ : function, default = None
+                This is used internally, especially by the translatepy HTTP server to get the results of each batch.
 
         Returns:
         --------
@@ -181,258 +482,134 @@ class Translate():
         dest_lang = Language(destination_language)
         source_lang = Language(source_language)
 
-        def _translate(node: NavigableString):
-            try:
-                node.replace_with(self.translate(str(node), destination_language=dest_lang, source_language=source_lang).result)
-            except Exception:  # ignore if it couldn't find any result or an error occured
-                pass
-
-        if __internal_replacement_function__ is not None:
-            _translate = __internal_replacement_function__
+        def _translate_batch(texts: List[str]) -> List[str]:
+            results = self.translate_batch(texts, destination_language=dest_lang, source_language=source_lang)
+            if __internal_batch_callback__ is not None:
+                __internal_batch_callback__(results)
+            return [result.result for result in results]
 
         if not isinstance(html, (PageElement, Tag, BeautifulSoup)):
             page = BeautifulSoup(str(html), str(parser))
         else:
             page = html
-        # nodes = [tag.text for tag in page.find_all(text=True, recursive=True, attrs=lambda class_name: "notranslate" not in str(class_name).split()) if not isinstance(tag, (PreformattedString)) and remove_spaces(tag) != ""]
-        nodes = [tag for tag in page.find_all(text=True, recursive=True) if not isinstance(tag, (PreformattedString)) and remove_spaces(tag) != ""]
-        with ThreadPool(int(threads_limit)) as pool:
-            pool.map(_translate, nodes)
+
+        if __internal_replacement_function__ is not None:
+            # nodes = [tag.text for tag in page.find_all(string=True, recursive=True, attrs=lambda class_name: "notranslate" not in str(class_name).split()) if not isinstance(tag, (PreformattedString)) and remove_spaces(tag) != ""]
+            nodes = [tag for tag in page.find_all(string=True, recursive=True) if not isinstance(tag, (PreformattedString)) and remove_spaces(tag) != ""]
+            with ThreadPool(int(threads_limit)) as pool:
+                pool.map(bind_deadline(__internal_replacement_function__), nodes)
+        else:
+            translate_text_nodes(page, _translate_batch, self._pack_batches, threads_limit=threads_limit)
         return page if isinstance(html, (PageElement, Tag, BeautifulSoup)) else str(page)
 
-    def transliterate(self, text: str, destination_language: str = "en", source_language: str = "auto") -> TransliterationResult:
+    def _pack_batches(self, texts: List[str]) -> List[List[str]]:
         """
-        Transliterates the given text, get its pronunciation
+        Groups the given texts in batches which respect the size limits of every service,
+        so that a batch can be sent in a single request to whichever service translates it
+        """
+        return pack_batches(
+            texts,
+            max_batch_size=min(service._max_batch_size for service in self.services),
+            max_batch_length=min(service._max_batch_length for service in self.services)
+        )
+
+    def translate_html_stream(self, html: Union[str, Iterable[str]], destination_language: str, source_language: str = "auto", window_size: int = 100, threads_limit: int = 100, timeout: float = None) -> Iterator[str]:
+        """
+        Translates the given HTML document incrementally, yielding the translated HTML chunks
+
+        Unlike `translate_html`, the document is never fully loaded in memory, which makes it suitable for very large documents.
+
+        i.e
+        >>> with open("export.html") as source, open("export.fr.html", "w") as output:
+        ...     for chunk in Translate().translate_html_stream(source, "French"):
+        ...         output.write(chunk)
+
+        Parameters:
+        ----------
+            html : str | file-like object | Iterable[str]
+                The HTML document to be translated.
+            destination_language : str
+                The language the HTML document needs to be translated in.
+            source_language : str, default = "auto"
+                The language of the HTML document.
+            window_size : int, default = 100
+                The number of text runs translated together before yielding the corresponding HTML chunk
+            threads_limit : int, default = 100
+                The maximum number of batches translated concurrently for each window
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
+
+        Returns:
+        --------
+            Iterator[str]:
+                The translated HTML chunks. The markup is kept as is.
 
-        i.e おはよう --> Ohayou
         """
         dest_lang = Language(destination_language)
         source_lang = Language(source_language)
 
-        def _transliterate(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.transliterate(
-                text=text, destination_language=dest_lang, source_language=source_lang
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
+        def _translate_batch(texts: List[str]) -> List[str]:
+            return [result.result for result in self.translate_batch(texts, destination_language=dest_lang, source_language=source_lang)]
 
-        def _fast_transliterate(queue: Queue, translator: BaseTranslator, index: int):
-            try:
-                queue.put(_transliterate(translator=translator, index=index))
-            except Exception:
-                pass
+        if timeout is not None:  # the deadline starts now, and is kept while the chunks are being consumed
+            _translate_batch = bind_deadline(_translate_batch, Deadline(timeout))
 
-        if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_transliterate, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
-            try:
-                return _transliterate(translator=service, index=index)
-            except Exception as ex:
-                exception = ex
-                continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
+        return stream_translate_html(html, _translate_batch, self._pack_batches, window_size=window_size, threads_limit=threads_limit)
 
-    def spellcheck(self, text: str, source_language: str = "auto") -> SpellcheckResult:
+    @with_timeout
+    def transliterate(self, text: str, destination_language: str = "en", source_language: str = "auto", timeout: float = None) -> TransliterationResult:
         """
-        Checks the spelling of a given text
+        Transliterates the given text, get its pronunciation
 
-        i.e God morning --> Good morning
+        i.e おはよう --> Ohayou
         """
-        source_lang = Language(source_language)
+        return self._run("transliterate", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
 
-        def _spellcheck(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.spellcheck(
-                text=text, source_language=source_lang
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
-
-        def _fast_spellcheck(queue: Queue, translator: BaseTranslator, index: int):
-            try:
-                queue.put(_spellcheck(translator=translator, index=index))
-            except Exception:
-                pass
+    @with_timeout
+    def spellcheck(self, text: str, source_language: str = "auto", timeout: float = None) -> SpellcheckResult:
+        """
+        Checks the spelling of a given text
 
-        if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_spellcheck, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
-            try:
-                return _spellcheck(translator=service, index=index)
-            except Exception as ex:
-                exception = ex
-                continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
+        i.e God morning --> Good morning
+        """
+        return self._run("spellcheck", text=text, source_language=Language(source_language))
 
-    def language(self, text: str) -> LanguageResult:
+    @with_timeout
+    def language(self, text: str, timeout: float = None) -> LanguageResult:
         """
         Returns the language of the given text
 
         i.e 皆さんおはようございます！ --> Japanese
         """
-        def _language(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.language(
-                text=text
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
-
-        def _fast_language(queue: Queue, translator: BaseTranslator, index: int):
-            try:
-                queue.put(_language(translator=translator, index=index))
-            except Exception:
-                pass
-
-        if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_language, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
-            try:
-                return _language(translator=service, index=index)
-            except Exception as ex:
-                exception = ex
-                continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
+        return self._run("language", text=text)
 
-    def example(self, text: str, destination_language: str, source_language: str = "auto") -> ExampleResult:
+    @with_timeout
+    def example(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> ExampleResult:
         """
         Returns a set of examples / use cases for the given word
 
         i.e Hello --> ['Hello friends how are you?', 'Hello im back again.']
         """
-        dest_lang = Language(destination_language)
-        source_lang = Language(source_language)
+        return self._run("example", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
 
-        def _example(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.example(
-                text=text, destination_language=dest_lang, source_language=source_lang
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
-
-        def _fast_example(queue: Queue, translator: BaseTranslator, index: int):
-            try:
-                queue.put(_example(translator=translator, index=index))
-            except Exception:
-                pass
-
-        if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_example, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
-            try:
-                return _example(translator=service, index=index)
-            except Exception as ex:
-                exception = ex
-                continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
-
-    def dictionary(self, text: str, destination_language: str, source_language="auto") -> DictionaryResult:
+    @with_timeout
+    def dictionary(self, text: str, destination_language: str, source_language="auto", timeout: float = None) -> DictionaryResult:
         """
         Returns a list of translations that are classified between two categories: featured and less common
 
         i.e Hello --> {'featured': ['ハロー', 'こんにちは'], 'less_common': ['hello', '今日は', 'どうも', 'こんにちわ', 'こにちは', 'ほいほい', 'おーい', 'アンニョンハセヨ', 'アニョハセヨ'}
         """
-        dest_lang = Language(destination_language)
-        source_lang = Language(source_language)
-
-        def _dictionary(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.dictionary(
-                text=text, destination_language=dest_lang, source_language=source_lang
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
+        return self._run("dictionary", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
 
-        def _fast_dictionary(queue: Queue, translator: BaseTranslator, index: int):
-            try:
-                queue.put(_dictionary(translator=translator, index=index))
-            except Exception:
-                pass
-
-        if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_dictionary, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
-            try:
-                return _dictionary(translator=service, index=index)
-            except Exception as ex:
-                exception = ex
-                continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
-
-    def text_to_speech(self, text: str, speed: int = 100, gender: str = "female", source_language: str = "auto") -> TextToSpechResult:
+    @with_timeout
+    def text_to_speech(self, text: str, speed: int = 100, gender: str = "female", source_language: str = "auto", timeout: float = None) -> TextToSpechResult:
         """
         Gives back the text to speech result for the given text
 
         Args:
           text: the given text
           source_language: the source language
+            timeout: The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
             the mp3 file as bytes
@@ -451,44 +628,151 @@ class Translate():
 
             # the result is an MP3 file with the text to speech output
         """
-        source_lang = Language(source_language)
+        return self._run("text_to_speech", text=text, speed=speed, gender=gender, source_language=Language(source_language))
+
+    async def _arun(self, method: str, **kwargs):
+        """
+        Internal coroutine calling the given asynchronous method of the services, with the concurrent identical calls sharing a single result
+        """
+        return await self._flights.ado(self._flight_key(method, kwargs), partial(self._arun_services, method, **kwargs))
 
-        def _text_to_speech(translator: BaseTranslator, index: int):
-            translator = self._instantiate_translator(translator, self.services, index)
-            result = translator.text_to_speech(
-                text=text, speed=speed, gender=gender, source_language=source_lang
-            )
-            if result is None:
-                raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
-            return result
+    async def _arun_services(self, method: str, **kwargs):
+        """
+        Internal coroutine calling the given asynchronous method of the services
 
-        def _fast_text_to_speech(queue: Queue, translator: BaseTranslator, index: int):
-            try:
-                queue.put(_text_to_speech(translator=translator, index=index))
-            except Exception:
-                pass
+        It follows the same fast and hedged modes as `_run_services`, with the services being called
+        in the event loop. The calls which are not needed anymore are cancelled, and no more service
+        is tried once the deadline of the task passed.
+        """
+        deadline = current_deadline()
 
-        if self.FAST_MODE:
-            _queue = Queue()
-            threads = []
-            for index, service in enumerate(self.services):
-                thread = Thread(target=_fast_text_to_speech, args=(_queue, service, index))
-                thread.start()
-                threads.append(thread)
-            result = _queue.get(threads=threads)  # wait for a value and return it
-            if result is None:
-                raise NoResult("No service has returned a valid result")
-            return result
-
-        exception = None
-        for index, service in enumerate(self.services):
+        async def _call(translator: BaseTranslator, index: int):
+            if deadline is not None:
+                deadline.check()
+            self._check_circuit(index)
+            recorded = False
+            try:
+                if not isinstance(translator, BaseTranslator):  # instantiating a translator might make blocking requests
+                    translator = await asyncio.get_running_loop().run_in_executor(None, bind_deadline(partial(self._instantiate_translator, translator, self.services, index)))
+                start = time()
+                try:
+                    result = await getattr(translator, method)(**kwargs)
+                    if result is None:
+                        raise NoResult("{service} did not return any value".format(service=translator.__repr__()))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as ex:
+                    recorded = True
+                    self._record_call(index, time() - start, ex)
+                    raise
+                recorded = True
+                self._record_call(index, time() - start)
+                return result
+            finally:
+                if not recorded:  # cancelled before getting a result
+                    self._breakers[index].release()
+
+        languages = self._languages(kwargs)
+        services = self._ranked_services(languages)
+        exception = None if services else self._unsupported(languages)
+        if self.HEDGED_MODE or self.FAST_MODE:
+            candidates = list(services)
+            pending = set()
+            next_start = 0
+            try:
+                while candidates or pending:
+                    if deadline is not None and deadline.expired:
+                        break
+                    while candidates and (not self.HEDGED_MODE or not pending or time() >= next_start):
+                        index, service = candidates.pop(0)
+                        pending.add(asyncio.ensure_future(_call(translator=service, index=index)))
+                        next_start = time() + self._hedge_delay(index)
+                    timeout = max(next_start - time(), 0) if candidates else None
+                    if deadline is not None:
+                        timeout = max(deadline.remaining(), 0) if timeout is None else min(timeout, max(deadline.remaining(), 0))
+                    done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            return task.result()
+                        exception = task.exception()
+                        next_start = 0  # a failed service does not need to be waited for
+            finally:
+                for task in pending:
+                    task.cancel()
+            raise self._no_result(deadline) from exception
+
+        for index, service in services:
+            if deadline is not None and deadline.expired:
+                break
             try:
-                return _text_to_speech(translator=service, index=index)
+                return await _call(translator=service, index=index)
             except Exception as ex:
                 exception = ex
                 continue
-        else:
-            raise NoResult("No service has returned a valid result") from exception
+        raise self._no_result(deadline) from exception
+
+    @with_timeout
+    async def atranslate(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> TranslationResult:
+        """
+        Asynchronously translates the given text to the given language
+
+        i.e Good morning (en) --> おはようございます (ja)
+        """
+        return await self._arun("atranslate", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
+
+    @with_timeout
+    async def atransliterate(self, text: str, destination_language: str = "en", source_language: str = "auto", timeout: float = None) -> TransliterationResult:
+        """
+        Asynchronously transliterates the given text, get its pronunciation
+
+        i.e おはよう --> Ohayou
+        """
+        return await self._arun("atransliterate", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
+
+    @with_timeout
+    async def aspellcheck(self, text: str, source_language: str = "auto", timeout: float = None) -> SpellcheckResult:
+        """
+        Asynchronously checks the spelling of a given text
+
+        i.e God morning --> Good morning
+        """
+        return await self._arun("aspellcheck", text=text, source_language=Language(source_language))
+
+    @with_timeout
+    async def alanguage(self, text: str, timeout: float = None) -> LanguageResult:
+        """
+        Asynchronously returns the language of the given text
+
+        i.e 皆さんおはようございます！ --> Japanese
+        """
+        return await self._arun("alanguage", text=text)
+
+    @with_timeout
+    async def aexample(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> ExampleResult:
+        """
+        Asynchronously returns a set of examples / use cases for the given word
+
+        i.e Hello --> ['Hello friends how are you?', 'Hello im back again.']
+        """
+        return await self._arun("aexample", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
+
+    @with_timeout
+    async def adictionary(self, text: str, destination_language: str, source_language="auto", timeout: float = None) -> DictionaryResult:
+        """
+        Asynchronously returns a list of translations that are classified between two categories: featured and less common
+
+        i.e Hello --> {'featured': ['ハロー', 'こんにちは'], 'less_common': ['hello', '今日は', 'どうも', 'こんにちわ', 'こにちは', 'ほいほい', 'おーい', 'アンニョンハセヨ', 'アニョハセヨ'}
+        """
+        return await self._arun("adictionary", text=text, destination_language=Language(destination_language), source_language=Language(source_language))
+
+    @with_timeout
+    async def atext_to_speech(self, text: str, speed: int = 100, gender: str = "female", source_language: str = "auto", timeout: float = None) -> TextToSpechResult:
+        """
+        Asynchronously gives back the text to speech result for the given text
+
+        Refer to `text_to_speech` for more information.
+        """
+        return await self._arun("atext_to_speech", text=text, speed=speed, gender=gender, source_language=Language(source_language))
 
     def clean_cache(self) -> None:
         """
@@ -499,3 +783,21 @@ class Translate():
         """
         for service in self.services:
             service.clean_cache()
+
+    def close(self) -> None:
+        """
+        Shuts down the fast mode executor, without waiting for the running calls
+
+        Returns:
+            None
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,18 +1,29 @@
+import asyncio
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from hashlib import sha256
 from multiprocessing.pool import ThreadPool
-from typing import Union
+from typing import Iterable, Iterator, Union
 
 from bs4 import BeautifulSoup
-from bs4.element import NavigableString, PageElement, PreformattedString, Tag
+from bs4.element import PageElement, Tag
 from translatepy.exceptions import ParameterTypeError, ParameterValueError, TranslatepyException, UnsupportedMethod, UnsupportedLanguage
 from translatepy.language import Language
 from translatepy.models import (DictionaryResult, ExampleResult,
                                 LanguageResult, SpellcheckResult,
                                 TextToSpechResult, TranslationResult,
                                 TransliterationResult)
-from translatepy.utils.annotations import List
+from translatepy.utils.annotations import List, Tuple
+from translatepy.utils.cache import BaseCacheBackend
 from translatepy.utils.lru_cacher import LRUDictCache
+from translatepy.utils.chunker import split_text
+from translatepy.utils.deadline import Deadline, bind_deadline, with_timeout
+from translatepy.utils.markup import (stream_translate_html, translate_text_nodes,
+                                      with_whitespaces)
+from translatepy.utils.utils import pack_batches
 from translatepy.utils.sanitize import remove_spaces
+from translatepy.utils.singleflight import SingleFlight
 
 
 # copied from abc.ABC (Python 3.9.5)
@@ -27,6 +38,7 @@ class ABC(metaclass=ABCMeta):
 
 class BaseTranslateException(TranslatepyException):
     error_codes = {}
+    rate_limit_codes = {429}  # the status codes meaning that the service is limiting the number of requests
 
     def __init__(self, status_code: int = -1, message=None):
         unknown_status_code_msg = "Unknown error. Error code: {}".format(status_code)
@@ -39,11 +51,17 @@ class BaseTranslateException(TranslatepyException):
 
         super().__init__(self.message)
 
+    @property
+    def rate_limited(self) -> bool:
+        """
+        If the service refused the request because of its rate limits
+        """
+        return self.status_code in self.rate_limit_codes
+
     def __str__(self):
         return "{} | {}".format(self.status_code, self.message)
 
 
-# TODO: Feat: support translating > 5000 characters (or just exception raising)
 # TODO: Feat: Some translation services give out a lot of useful information that can come in handy for programmers. I think we need implement separate models class for each Translator service
 # --> If these informations come from already using endpoints like the translation or transliteration endpoint we could make an "extra data" field with those informations
 # --> but if it is completely different endpoints, we could just add them to the Translator class or as an extra function in the classes which the user would be able to use by initiating their own translator.
@@ -53,17 +71,49 @@ class BaseTranslator(ABC):
     Base abstract class for a translate service
     """
 
-    _translations_cache = LRUDictCache()
-    _transliterations_cache = LRUDictCache()
-    _languages_cache = LRUDictCache()
-    _spellchecks_cache = LRUDictCache()
-    _examples_cache = LRUDictCache()
-    _dictionaries_cache = LRUDictCache()
-    _text_to_speeches_cache = LRUDictCache(8)
+    _translations_cache = LRUDictCache(maxbytes=32 * 2 ** 20)
+    _transliterations_cache = LRUDictCache(maxbytes=32 * 2 ** 20)
+    _languages_cache = LRUDictCache(maxbytes=32 * 2 ** 20)
+    _spellchecks_cache = LRUDictCache(maxbytes=32 * 2 ** 20)
+    _examples_cache = LRUDictCache(maxbytes=32 * 2 ** 20)
+    _dictionaries_cache = LRUDictCache(maxbytes=32 * 2 ** 20)
+    _text_to_speeches_cache = LRUDictCache(maxbytes=16 * 2 ** 20)  # raw MP3 files
+
+    # The cache attributes, with their namespace and maximum size when using `use_cache_backend`
+    _caches = {
+        "_translations_cache": ("translations", 1024),
+        "_transliterations_cache": ("transliterations", 1024),
+        "_languages_cache": ("languages", 1024),
+        "_spellchecks_cache": ("spellchecks", 1024),
+        "_examples_cache": ("examples", 1024),
+        "_dictionaries_cache": ("dictionaries", 1024),
+        "_text_to_speeches_cache": ("text_to_speeches", 8)
+    }
 
     _supported_languages = {}
 
-    def translate(self, text: str, destination_language: str, source_language: str = "auto") -> TranslationResult:
+    # {translator class: {"normalized": {language id: service code}, "denormalized": LRUDictCache({service code: Language}), "instance": translator}}
+    # The language normalization of each translator class, filled as the languages are used
+    # (the codes given to denormalize can come from the users, so only the most recent ones are kept)
+    _languages_tables = {}
+
+    # The concurrent identical calls (sharing the same cache key) wait for a single call to the service
+    _flights = SingleFlight()
+
+    # The texts longer than this are replaced by their digest in the cache keys
+    _cache_key_text_length = 256
+
+    # The maximum number of texts and characters the service accepts in a single batch request
+    _max_batch_size = 50
+    _max_batch_length = 5000
+
+    # The maximum number of characters the service accepts in a single text (None for no limit)
+    # Longer texts are split in chunks, translated concurrently by at most `_chunks_concurrency` threads
+    _max_text_length = 5000
+    _chunks_concurrency = 4
+
+    @with_timeout
+    def translate(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> TranslationResult:
         """
         Translates text from a given language to another specific language.
 
@@ -78,6 +128,8 @@ class BaseTranslator(ABC):
             source_language : str
                 If str it expects the code of the language that the `text` is written in. When using the default value (`auto`),
                 the `Translator` will try to find the language automatically.
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
         --------
@@ -100,14 +152,15 @@ class BaseTranslator(ABC):
         self._validate_language_pair(source_code, dest_code)
 
         # Build cache key
-        _cache_key = str({"t": text, "d": dest_code, "s": source_code})
+        _cache_key = self._cache_key(text, dest_code, source_code)
 
-        if _cache_key in self._translations_cache:
+        _cached = self._translations_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            source_language, translation = self._translations_cache[_cache_key]
+            source_language, translation = _cached
         else:
             # Call the private concrete implementation of the Translator to get the translation
-            source_language, translation = self._translate(text, dest_code, source_code)
+            source_language, translation = self._flights.do(("translate", _cache_key), partial(self._translate_text, text, dest_code, source_code))
 
             # Cache the translation values to speed up the translation process in the future
             self._translations_cache[_cache_key] = (source_language, translation)
@@ -116,8 +169,8 @@ class BaseTranslator(ABC):
         return TranslationResult(
             service=self,
             source=text,
-            source_language=self._language_denormalize(source_language),
-            destination_language=self._language_denormalize(destination_language),
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
             result=translation,
         )
 
@@ -129,7 +182,140 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
-    def translate_html(self, html: Union[str, PageElement, Tag, BeautifulSoup], destination_language: str, source_language: str = "auto", parser: str = "html.parser", threads_limit: int = 100) -> Union[str, PageElement, Tag, BeautifulSoup]:
+    @with_timeout
+    def translate_batch(self, texts: List[str], destination_language: str, source_language: str = "auto", timeout: float = None) -> List[TranslationResult]:
+        """
+        Translates multiple texts from a given language to another specific language.
+
+        The cache is checked for every text and only the missing ones are sent to the service,
+        packed in as few requests as the service allows.
+
+        Parameters:
+        ----------
+            texts : list[str]
+                The texts to be translated.
+            destination_language : str
+                If str it expects the language code that the `texts` should be translated to.
+            source_language : str
+                If str it expects the code of the language that the `texts` are written in. When using the default value (`auto`),
+                the `Translator` will try to find the language automatically.
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
+
+        Returns:
+        --------
+            list[TranslationResult]:
+                The translation results, in the same order as `texts`.
+
+        """
+        if isinstance(texts, str) or not isinstance(texts, Iterable):
+            raise ParameterTypeError("Parameter 'texts' must be an iterable of strings, {} was given".format(type(texts).__name__))
+
+        texts = list(texts)
+
+        # Validate the texts
+        for text in texts:
+            self._validate_text(text)
+
+        # Validate the languages
+        dest_code = self._detect_and_validate_lang(destination_language)
+        source_code = self._detect_and_validate_lang(source_language)
+
+        self._validate_language_pair(source_code, dest_code)
+
+        # Taking the values from the cache (in a single lookup) and collecting the (unique) missing texts
+        unique_texts = list(OrderedDict.fromkeys(texts))
+        cached = self._translations_cache.get_many([self._cache_key(text, dest_code, source_code) for text in unique_texts])
+        results = dict(zip(unique_texts, cached))
+        missing = [text for text in unique_texts if results[text] is None]
+
+        # The texts too long for the service are chunked separately
+        for text in [text for text in missing if self._is_too_long(text)]:
+            missing.remove(text)
+            results[text] = self._translate_text(text, dest_code, source_code)
+            self._translations_cache[self._cache_key(text, dest_code, source_code)] = results[text]
+
+        for batch in self._pack_batches(missing):
+            # Call the private concrete implementation of the Translator to get the translations
+            translations = self._translate_batch(batch, dest_code, source_code)
+            if translations is None or len(translations) != len(batch):
+                raise TranslatepyException("{service} did not return a result for every text of the batch".format(service=str(self)))
+
+            for text, (_source_language, translation) in zip(batch, translations):
+                results[text] = (_source_language, translation)
+
+            # Cache the translation values to speed up the translation process in the future
+            self._translations_cache.set_many({self._cache_key(text, dest_code, source_code): results[text] for text in batch})
+
+        # Return a `TranslationResult` object for each text
+        return [
+            TranslationResult(
+                service=self,
+                source=text,
+                source_language=self._denormalize_language(results[text][0]),
+                destination_language=self._denormalize_language(destination_language),
+                result=results[text][1],
+            ) for text in texts
+        ]
+
+    def _translate_batch(self, texts: List[str], destination_language: str, source_language: str) -> List[Tuple[str, str]]:
+        """
+        Private method that concrete Translators can implement when their service accepts
+        multiple texts per request. Receives the validated and normalized parameters and must
+        return a list of (source_language, translation) tuples, in the same order as `texts`.
+
+        The default implementation falls back to calling `_translate` for each text.
+        """
+        return [self._translate(text, destination_language, source_language) for text in texts]
+
+    def _is_too_long(self, text: str) -> bool:
+        return self._max_text_length is not None and len(text) > self._max_text_length
+
+    def _translate_text(self, text: str, destination_language: str, source_language: str) -> Tuple[str, str]:
+        """
+        Calls `_translate`, or splits the text at its paragraphs, lines, sentences or words boundaries
+        if it is longer than `_max_text_length` and translates the chunks concurrently.
+
+        The whitespaces around each chunk are kept when reassembling the translation.
+        """
+        if not self._is_too_long(text):
+            return self._translate(text, destination_language, source_language)
+
+        chunks = split_text(text, self._max_text_length)
+        contents = [chunk.strip() for chunk in chunks]
+        unique_contents = [content for content in OrderedDict.fromkeys(contents) if remove_spaces(content) != ""]
+
+        if type(self)._translate_batch is not BaseTranslator._translate_batch:  # the service accepts batches
+            batches = self._pack_batches(unique_contents)
+        else:
+            batches = [[content] for content in unique_contents]
+
+        with ThreadPool(max(min(self._chunks_concurrency, len(batches)), 1)) as pool:
+            batches_results = pool.map(bind_deadline(lambda batch: self._translate_batch(batch, destination_language, source_language)), batches)
+
+        translations = {}
+        for batch, batch_results in zip(batches, batches_results):
+            if batch_results is None or len(batch_results) != len(batch):
+                raise TranslatepyException("{service} did not return a result for every chunk of the text".format(service=str(self)))
+            translations.update(zip(batch, batch_results))
+
+        detected_language = translations[unique_contents[0]][0] if unique_contents else source_language
+        return detected_language, "".join(
+            with_whitespaces(chunk, translations[content][1]) if content in translations else chunk
+            for chunk, content in zip(chunks, contents)
+        )
+
+    def _pack_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Groups the given texts in batches which respect the `_max_batch_size` (number of texts)
+        and `_max_batch_length` (number of characters) limits of the service.
+
+        A text longer than `_max_batch_length` is put alone in its own batch.
+        """
+        return pack_batches(texts, max_batch_size=self._max_batch_size, max_batch_length=self._max_batch_length)
+
+    @with_timeout
+    def translate_html(self, html: Union[str, PageElement, Tag, BeautifulSoup], destination_language: str, source_language: str = "auto", parser: str = "html.parser", threads_limit: int = 100, timeout: float = None) -> Union[str, PageElement, Tag, BeautifulSoup]:
         """
         Translates the given HTML string or BeautifulSoup object to the given language
 
@@ -140,6 +326,8 @@ class BaseTranslator(ABC):
         Note: This method is not perfect since it is not tag/context aware. Example: `<span>Hello <strong>everyone</strong></span>` will not be understood as
         "Hello everyone" with "everyone" in bold but rather "Hello" and "everyone" separately.
 
+        Each unique text is only translated once, and the texts are packed in as few requests as the service allows.
+
         Warning: If you give a `bs4.BeautifulSoup`, `bs4.element.PageElement` or `bs4.element.Tag` input (which are mutable), they will be modified.
         If you don't want this behavior, please make sure to pass the string version of the element:
         >>> result = BaseTranslator().translate_html(str(page_element), "French")
@@ -155,7 +343,9 @@ class BaseTranslator(ABC):
             parser : str, default = "html.parser"
                 The parser that BeautifulSoup will use to parse the HTML string.
             threads_limit : int, default = 100
-                The maximum number of threads that will be spawned by translate_html
+                The maximum number of batches translated concurrently by translate_html
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
         --------
@@ -169,23 +359,61 @@ class BaseTranslator(ABC):
         dest_lang = Language(destination_language)
         source_lang = Language(source_language)
 
-        def _translate(node: NavigableString):
-            try:
-                node.replace_with(self.translate(str(node), destination_language=dest_lang, source_language=source_lang).result)
-            except Exception:  # ignore if it couldn't find any result or an error occured
-                pass
+        def _translate_batch(texts: List[str]) -> List[str]:
+            return [result.result for result in self.translate_batch(texts, destination_language=dest_lang, source_language=source_lang)]
 
         if not isinstance(html, (PageElement, Tag, BeautifulSoup)):
             page = BeautifulSoup(str(html), str(parser))
         else:
             page = html
-        # nodes = [tag.text for tag in page.find_all(text=True, recursive=True, attrs=lambda class_name: "notranslate" not in str(class_name).split()) if not isinstance(tag, (PreformattedString)) and remove_spaces(tag) != ""]
-        nodes = [tag for tag in page.find_all(text=True, recursive=True) if not isinstance(tag, (PreformattedString)) and remove_spaces(tag) != ""]
-        with ThreadPool(threads_limit) as pool:
-            pool.map(_translate, nodes)
+        translate_text_nodes(page, _translate_batch, self._pack_batches, threads_limit=threads_limit)
         return page if isinstance(html, (PageElement, Tag, BeautifulSoup)) else str(page)
 
-    def transliterate(self, text: str, destination_language: str, source_language: str = "auto") -> TransliterationResult:
+    def translate_html_stream(self, html: Union[str, Iterable[str]], destination_language: str, source_language: str = "auto", window_size: int = 100, threads_limit: int = 100, timeout: float = None) -> Iterator[str]:
+        """
+        Translates the given HTML document incrementally, yielding the translated HTML chunks
+
+        Unlike `translate_html`, the document is never fully loaded in memory, which makes it suitable for very large documents.
+
+        i.e
+        >>> with open("export.html") as source, open("export.fr.html", "w") as output:
+        ...     for chunk in BaseTranslator().translate_html_stream(source, "French"):
+        ...         output.write(chunk)
+
+        Parameters:
+        ----------
+            html : str | file-like object | Iterable[str]
+                The HTML document to be translated.
+            destination_language : str
+                The language the HTML document needs to be translated in.
+            source_language : str, default = "auto"
+                The language of the HTML document.
+            window_size : int, default = 100
+                The number of text runs translated together before yielding the corresponding HTML chunk
+            threads_limit : int, default = 100
+                The maximum number of batches translated concurrently for each window
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
+
+        Returns:
+        --------
+            Iterator[str]:
+                The translated HTML chunks. The markup is kept as is.
+
+        """
+        dest_lang = Language(destination_language)
+        source_lang = Language(source_language)
+
+        def _translate_batch(texts: List[str]) -> List[str]:
+            return [result.result for result in self.translate_batch(texts, destination_language=dest_lang, source_language=source_lang)]
+
+        if timeout is not None:  # the deadline starts now, and is kept while the chunks are being consumed
+            _translate_batch = bind_deadline(_translate_batch, Deadline(timeout))
+
+        return stream_translate_html(html, _translate_batch, self._pack_batches, window_size=window_size, threads_limit=threads_limit)
+
+    @with_timeout
+    def transliterate(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> TransliterationResult:
         """
         Transliterates text from a given language to another specific language.
 
@@ -196,6 +424,7 @@ class BaseTranslator(ABC):
                 search for a language of the `Translator`, and find it's code. Default value = English
             source_language: If str it expects the code of the language that the `text` is written in. When using the default value (`auto`),
                 the `Translator` will try to find the language automatically.
+            timeout: The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
             A `TransliterationResult` object with the results of the translation.
@@ -215,14 +444,15 @@ class BaseTranslator(ABC):
         self._validate_language_pair(source_code, dest_code)
 
         # Build cache key
-        _cache_key = str({"t": text, "d": dest_code, "s": source_code})
+        _cache_key = self._cache_key(text, dest_code, source_code)
 
-        if _cache_key in self._transliterations_cache:
+        _cached = self._transliterations_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            source_language, transliteration = self._transliterations_cache[_cache_key]
+            source_language, transliteration = _cached
         else:
             # Call the private concrete implementation of the Translator to get the transliteration
-            source_language, transliteration = self._transliterate(text, dest_code, source_code)
+            source_language, transliteration = self._flights.do(("transliterate", _cache_key), partial(self._transliterate, text, dest_code, source_code))
 
             # Cache the transliteration values to speed up the translation process in the future
             self._transliterations_cache[_cache_key] = (source_language, transliteration)
@@ -231,8 +461,8 @@ class BaseTranslator(ABC):
         return TransliterationResult(
             service=self,
             source=text,
-            source_language=self._language_denormalize(source_language),
-            destination_language=self._language_denormalize(destination_language),
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
             result=transliteration,
         )
 
@@ -244,7 +474,8 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
-    def spellcheck(self, text: str, source_language: str = "auto") -> SpellcheckResult:
+    @with_timeout
+    def spellcheck(self, text: str, source_language: str = "auto", timeout: float = None) -> SpellcheckResult:
         """
         Checks text spelling in a given language.
 
@@ -252,6 +483,7 @@ class BaseTranslator(ABC):
             text: The text to be checks.
             source_language: If str it expects the code of the language that the `text` is written in. When using the default value (`auto`),
                 the `Translator` will try to find the language automatically.
+            timeout: The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
             A `SpellcheckResult` object with the results of the corrected text.
@@ -269,14 +501,15 @@ class BaseTranslator(ABC):
         source_code = self._detect_and_validate_lang(source_language)
 
         # Build cache key
-        _cache_key = str({"t": text, "s": source_code})
+        _cache_key = self._cache_key(text, source_code)
 
-        if _cache_key in self._spellchecks_cache:
+        _cached = self._spellchecks_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            source_language, spellcheck = self._spellchecks_cache[_cache_key]
+            source_language, spellcheck = _cached
         else:
             # Call the private concrete implementation of the Translator to get the spellchecked text
-            source_language, spellcheck = self._spellcheck(text, source_code)
+            source_language, spellcheck = self._flights.do(("spellcheck", _cache_key), partial(self._spellcheck, text, source_code))
 
             # Cache the spellcheck values to speed up the translation process in the future
             self._spellchecks_cache[_cache_key] = (source_language, spellcheck)
@@ -285,7 +518,7 @@ class BaseTranslator(ABC):
         return SpellcheckResult(
             service=self,
             source=text,
-            source_language=self._language_denormalize(source_language),
+            source_language=self._denormalize_language(source_language),
             result=spellcheck,
         )
 
@@ -297,12 +530,14 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
-    def language(self, text: str) -> LanguageResult:
+    @with_timeout
+    def language(self, text: str, timeout: float = None) -> LanguageResult:
         """
         Detect the language of the text
 
         Args:
             text: The text to be detect the language
+            timeout: The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
             A `LanguageResult` object with the results of the detected language.
@@ -313,19 +548,20 @@ class BaseTranslator(ABC):
         self._validate_text(text)
 
         # Build cache key
-        _cache_key = str({"t": text})
+        _cache_key = self._cache_key(text)
 
-        if _cache_key in self._languages_cache:
+        _cached = self._languages_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            language = self._languages_cache[_cache_key]
+            language = _cached
         else:
             # Call the private concrete implementation of the Translator to get the language
-            language = self._language(text)
+            language = self._flights.do(("language", _cache_key), partial(self._language, text))
 
             # Cache the languages values to speed up the translation process in the future
             self._languages_cache[_cache_key] = language
 
-        denormalized_lang = self._language_denormalize(language)
+        denormalized_lang = self._denormalize_language(language)
 
         # Return a `LanguageResult` object
         return LanguageResult(
@@ -342,7 +578,8 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
-    def example(self, text: str, destination_language: str, source_language: str = "auto") -> ExampleResult:
+    @with_timeout
+    def example(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> ExampleResult:
         """
         Returns a set of examples
 
@@ -357,6 +594,8 @@ class BaseTranslator(ABC):
             source_language : str
                 If str it expects the code of the language that the `text` is written in. When using the default value (`auto`),
                 the `Translator` will try to find the language automatically.
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
         --------
@@ -379,14 +618,15 @@ class BaseTranslator(ABC):
         self._validate_language_pair(source_code, dest_code)
 
         # Build cache key
-        _cache_key = str({"t": text, "d": dest_code, "s": source_code})
+        _cache_key = self._cache_key(text, dest_code, source_code)
 
-        if _cache_key in self._examples_cache:
+        _cached = self._examples_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            source_language, example = self._examples_cache[_cache_key]
+            source_language, example = _cached
         else:
             # Call the private concrete implementation of the Translator to get the examples
-            source_language, example = self._example(text, dest_code, source_code)
+            source_language, example = self._flights.do(("example", _cache_key), partial(self._example, text, dest_code, source_code))
 
             # Cache the translation values to speed up the translation process in the future
             self._examples_cache[_cache_key] = (source_language, example)
@@ -395,8 +635,8 @@ class BaseTranslator(ABC):
         return ExampleResult(
             service=self,
             source=text,
-            source_language=self._language_denormalize(source_language),
-            destination_language=self._language_denormalize(destination_language),
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
             result=example,
         )
 
@@ -408,7 +648,8 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
-    def dictionary(self, text: str, destination_language: str, source_language: str = "auto") -> DictionaryResult:
+    @with_timeout
+    def dictionary(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> DictionaryResult:
         """
         Returns a list of dictionary results.
 
@@ -423,6 +664,8 @@ class BaseTranslator(ABC):
             source_language : str
                 If str it expects the code of the language that the `text` is written in. When using the default value (`auto`),
                 the `Translator` will try to find the language automatically.
+            timeout : float, default = None
+                The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
         --------
@@ -445,14 +688,15 @@ class BaseTranslator(ABC):
         self._validate_language_pair(source_code, dest_code)
 
         # Build cache key
-        _cache_key = str({"t": text, "d": dest_code, "s": source_code})
+        _cache_key = self._cache_key(text, dest_code, source_code)
 
-        if _cache_key in self._dictionaries_cache:
+        _cached = self._dictionaries_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            source_language, dictionary = self._dictionaries_cache[_cache_key]
+            source_language, dictionary = _cached
         else:
             # Call the private concrete implementation of the Translator to get the dictionary result
-            source_language, dictionary = self._dictionary(text, dest_code, source_code)
+            source_language, dictionary = self._flights.do(("dictionary", _cache_key), partial(self._dictionary, text, dest_code, source_code))
 
             # Cache the translation values to speed up the translation process in the future
             self._dictionaries_cache[_cache_key] = (source_language, dictionary)
@@ -461,8 +705,8 @@ class BaseTranslator(ABC):
         return DictionaryResult(
             service=self,
             source=text,
-            source_language=self._language_denormalize(source_language),
-            destination_language=self._language_denormalize(destination_language),
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
             result=dictionary,
         )
 
@@ -474,13 +718,15 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
-    def text_to_speech(self, text: str, speed: int = 100, gender: str = "female", source_language: str = "auto") -> TextToSpechResult:
+    @with_timeout
+    def text_to_speech(self, text: str, speed: int = 100, gender: str = "female", source_language: str = "auto", timeout: float = None) -> TextToSpechResult:
         """
         Gives back the text to speech result for the given text
 
         Args:
             text: text for voice-over
             speed: text speed
+            timeout: The maximum number of seconds spent on the call (its requests included). DeadlineExceeded is raised once it passed.
 
         Returns:
             A `TextToSpechResult` object
@@ -506,14 +752,15 @@ class BaseTranslator(ABC):
             raise ParameterTypeError("Parameter 'speed' must be an integer, {} was given".format(type(speed).__name__))
 
         # Build cache key
-        _cache_key = str({"t": text, "sp": speed, "s": source_code, "g": gender})
+        _cache_key = self._cache_key(text, speed, source_code, gender)
 
-        if _cache_key in self._text_to_speeches_cache:
+        _cached = self._text_to_speeches_cache.get(_cache_key)
+        if _cached is not None:
             # Taking the values from the cache
-            source_language, text_to_speech = self._text_to_speeches_cache[_cache_key]
+            source_language, text_to_speech = _cached
         else:
             # Call the private concrete implementation of the Translator to get text to spech result
-            source_language, text_to_speech = self._text_to_speech(text, speed, gender, source_code)
+            source_language, text_to_speech = self._flights.do(("text_to_speech", _cache_key), partial(self._text_to_speech, text, speed, gender, source_code))
 
             # Cache the text to spech result to speed up the translation process in the future
             self._text_to_speeches_cache[_cache_key] = (source_language, text_to_speech)
@@ -522,7 +769,7 @@ class BaseTranslator(ABC):
         return TextToSpechResult(
             service=self,
             source=text,
-            source_language=self._language_denormalize(source_language),
+            source_language=self._denormalize_language(source_language),
             speed=speed,
             gender=gender,
             result=text_to_speech,
@@ -535,6 +782,278 @@ class BaseTranslator(ABC):
         """
         raise UnsupportedMethod()
 
+    # Asynchronous versions of the methods
+    # The private `_a*` coroutines run the synchronous implementation in the event loop
+    # default executor by default. Concrete Translators can override them with native coroutines.
+
+    async def _run_in_executor(self, func, *args):
+        """
+        Runs the given blocking function in the event loop default executor, with the deadline of the current task
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, bind_deadline(partial(func, *args)))
+
+    @with_timeout
+    async def atranslate(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> TranslationResult:
+        """
+        Asynchronously translates text from a given language to another specific language.
+
+        Refer to `translate` for the parameters.
+        """
+        self._validate_text(text)
+
+        dest_code = self._detect_and_validate_lang(destination_language)
+        source_code = self._detect_and_validate_lang(source_language)
+
+        self._validate_language_pair(source_code, dest_code)
+
+        _cache_key = self._cache_key(text, dest_code, source_code)
+
+        _cached = self._translations_cache.get(_cache_key)
+        if _cached is not None:
+            source_language, translation = _cached
+        else:
+            source_language, translation = await self._flights.ado(("translate", _cache_key), partial(self._atranslate_text, text, dest_code, source_code))
+            self._translations_cache[_cache_key] = (source_language, translation)
+
+        return TranslationResult(
+            service=self,
+            source=text,
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
+            result=translation,
+        )
+
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> str:
+        """
+        Private coroutine holding the asynchronous logic for the translations.
+        """
+        return await self._run_in_executor(self._translate, text, destination_language, source_language)
+
+    async def _atranslate_text(self, text: str, destination_language: str, source_language: str) -> Tuple[str, str]:
+        """
+        Asynchronous version of `_translate_text`, calling `_atranslate` for the texts which don't need to be chunked
+        """
+        if not self._is_too_long(text):
+            return await self._atranslate(text, destination_language, source_language)
+        return await self._run_in_executor(self._translate_text, text, destination_language, source_language)
+
+    @with_timeout
+    async def atransliterate(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> TransliterationResult:
+        """
+        Asynchronously transliterates text from a given language to another specific language.
+
+        Refer to `transliterate` for the parameters.
+        """
+        self._validate_text(text)
+
+        dest_code = self._detect_and_validate_lang(destination_language)
+        source_code = self._detect_and_validate_lang(source_language)
+
+        self._validate_language_pair(source_code, dest_code)
+
+        _cache_key = self._cache_key(text, dest_code, source_code)
+
+        _cached = self._transliterations_cache.get(_cache_key)
+        if _cached is not None:
+            source_language, transliteration = _cached
+        else:
+            source_language, transliteration = await self._flights.ado(("transliterate", _cache_key), partial(self._atransliterate, text, dest_code, source_code))
+            self._transliterations_cache[_cache_key] = (source_language, transliteration)
+
+        return TransliterationResult(
+            service=self,
+            source=text,
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
+            result=transliteration,
+        )
+
+    async def _atransliterate(self, text: str, destination_language: str, source_language: str) -> str:
+        """
+        Private coroutine holding the asynchronous logic for the transliteration.
+        """
+        return await self._run_in_executor(self._transliterate, text, destination_language, source_language)
+
+    @with_timeout
+    async def aspellcheck(self, text: str, source_language: str = "auto", timeout: float = None) -> SpellcheckResult:
+        """
+        Asynchronously checks text spelling in a given language.
+
+        Refer to `spellcheck` for the parameters.
+        """
+        self._validate_text(text)
+
+        source_code = self._detect_and_validate_lang(source_language)
+
+        _cache_key = self._cache_key(text, source_code)
+
+        _cached = self._spellchecks_cache.get(_cache_key)
+        if _cached is not None:
+            source_language, spellcheck = _cached
+        else:
+            source_language, spellcheck = await self._flights.ado(("spellcheck", _cache_key), partial(self._aspellcheck, text, source_code))
+            self._spellchecks_cache[_cache_key] = (source_language, spellcheck)
+
+        return SpellcheckResult(
+            service=self,
+            source=text,
+            source_language=self._denormalize_language(source_language),
+            result=spellcheck,
+        )
+
+    async def _aspellcheck(self, text: str, source_language: str) -> str:
+        """
+        Private coroutine holding the asynchronous logic for the spellcheck.
+        """
+        return await self._run_in_executor(self._spellcheck, text, source_language)
+
+    @with_timeout
+    async def alanguage(self, text: str, timeout: float = None) -> LanguageResult:
+        """
+        Asynchronously detects the language of the text
+
+        Refer to `language` for the parameters.
+        """
+        self._validate_text(text)
+
+        _cache_key = self._cache_key(text)
+
+        _cached = self._languages_cache.get(_cache_key)
+        if _cached is not None:
+            language = _cached
+        else:
+            language = await self._flights.ado(("language", _cache_key), partial(self._alanguage, text))
+            self._languages_cache[_cache_key] = language
+
+        return LanguageResult(
+            service=self,
+            source=text,
+            result=self._denormalize_language(language),
+        )
+
+    async def _alanguage(self, text: str) -> str:
+        """
+        Private coroutine holding the asynchronous logic for the language detection.
+        """
+        return await self._run_in_executor(self._language, text)
+
+    @with_timeout
+    async def aexample(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> ExampleResult:
+        """
+        Asynchronously returns a set of examples
+
+        Refer to `example` for the parameters.
+        """
+        self._validate_text(text)
+
+        dest_code = self._detect_and_validate_lang(destination_language)
+        source_code = self._detect_and_validate_lang(source_language)
+
+        self._validate_language_pair(source_code, dest_code)
+
+        _cache_key = self._cache_key(text, dest_code, source_code)
+
+        _cached = self._examples_cache.get(_cache_key)
+        if _cached is not None:
+            source_language, example = _cached
+        else:
+            source_language, example = await self._flights.ado(("example", _cache_key), partial(self._aexample, text, dest_code, source_code))
+            self._examples_cache[_cache_key] = (source_language, example)
+
+        return ExampleResult(
+            service=self,
+            source=text,
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
+            result=example,
+        )
+
+    async def _aexample(self, text: str, destination_language: str, source_language: str) -> List:
+        """
+        Private coroutine holding the asynchronous logic for the examples.
+        """
+        return await self._run_in_executor(self._example, text, destination_language, source_language)
+
+    @with_timeout
+    async def adictionary(self, text: str, destination_language: str, source_language: str = "auto", timeout: float = None) -> DictionaryResult:
+        """
+        Asynchronously returns a list of dictionary results.
+
+        Refer to `dictionary` for the parameters.
+        """
+        self._validate_text(text)
+
+        dest_code = self._detect_and_validate_lang(destination_language)
+        source_code = self._detect_and_validate_lang(source_language)
+
+        self._validate_language_pair(source_code, dest_code)
+
+        _cache_key = self._cache_key(text, dest_code, source_code)
+
+        _cached = self._dictionaries_cache.get(_cache_key)
+        if _cached is not None:
+            source_language, dictionary = _cached
+        else:
+            source_language, dictionary = await self._flights.ado(("dictionary", _cache_key), partial(self._adictionary, text, dest_code, source_code))
+            self._dictionaries_cache[_cache_key] = (source_language, dictionary)
+
+        return DictionaryResult(
+            service=self,
+            source=text,
+            source_language=self._denormalize_language(source_language),
+            destination_language=self._denormalize_language(destination_language),
+            result=dictionary,
+        )
+
+    async def _adictionary(self, text: str, destination_language: str, source_language: str) -> List:
+        """
+        Private coroutine holding the asynchronous logic for the dictionary results.
+        """
+        return await self._run_in_executor(self._dictionary, text, destination_language, source_language)
+
+    @with_timeout
+    async def atext_to_speech(self, text: str, speed: int = 100, gender: str = "female", source_language: str = "auto", timeout: float = None) -> TextToSpechResult:
+        """
+        Asynchronously gives back the text to speech result for the given text
+
+        Refer to `text_to_speech` for the parameters.
+        """
+        self._validate_text(text)
+
+        source_code = self._detect_and_validate_lang(source_language)
+
+        gender = remove_spaces(gender).lower()
+
+        if gender not in {"male", "female"}:
+            raise ParameterValueError("Gender {gender} not supported. Supported genders: male, female".format(gender=gender))
+
+        if not isinstance(speed, int):
+            raise ParameterTypeError("Parameter 'speed' must be an integer, {} was given".format(type(speed).__name__))
+
+        _cache_key = self._cache_key(text, speed, source_code, gender)
+
+        _cached = self._text_to_speeches_cache.get(_cache_key)
+        if _cached is not None:
+            source_language, text_to_speech = _cached
+        else:
+            source_language, text_to_speech = await self._flights.ado(("text_to_speech", _cache_key), partial(self._atext_to_speech, text, speed, gender, source_code))
+            self._text_to_speeches_cache[_cache_key] = (source_language, text_to_speech)
+
+        return TextToSpechResult(
+            service=self,
+            source=text,
+            source_language=self._denormalize_language(source_language),
+            speed=speed,
+            gender=gender,
+            result=text_to_speech,
+        )
+
+    async def _atext_to_speech(self, text: str, speed: int, gender: str, source_language: str) -> bytes:
+        """
+        Private coroutine holding the asynchronous logic for the text to speech.
+        """
+        return await self._run_in_executor(self._text_to_speech, text, speed, gender, source_language)
+
     @abstractmethod
     def _language_normalize(self, language) -> str:
         """
@@ -551,6 +1070,50 @@ class BaseTranslator(ABC):
         return a Language instance.
         """
 
+    @classmethod
+    def _languages_table(cls) -> dict:
+        """
+        Returns the language normalization table of the translator class
+
+        The normalization (`_language_normalize` and `_language_denormalize`) must only depend on the language,
+        as it is computed once for all of the instances, with an instance created without calling `__init__`
+        (so that no request is made to check if a service supports a language).
+        """
+        try:
+            return cls._languages_tables[cls]
+        except KeyError:
+            return cls._languages_tables.setdefault(cls, {"normalized": {}, "denormalized": LRUDictCache(512), "instance": cls.__new__(cls)})
+
+    @classmethod
+    def _normalize_language(cls, language: Language) -> str:
+        """
+        Returns the code of the given language for the service (refer to `_language_normalize`), computed once for each language
+        """
+        table = cls._languages_table()
+        try:
+            return table["normalized"][language.id]
+        except KeyError:
+            pass
+        result = cls._language_normalize(table["instance"], language)
+        table["normalized"][language.id] = result
+        return result
+
+    @classmethod
+    def _denormalize_language(cls, language_code) -> Language:
+        """
+        Returns the Language of the given service language code (refer to `_language_denormalize`), computed once for each code
+        """
+        table = cls._languages_table()
+        try:
+            return table["denormalized"][language_code]
+        except KeyError:
+            pass
+        except TypeError:  # not hashable
+            return cls._language_denormalize(table["instance"], language_code)
+        result = cls._language_denormalize(table["instance"], language_code)
+        table["denormalized"][language_code] = result
+        return result
+
     def _detect_and_validate_lang(self, language: str) -> str:
         """
         Validates the language code, and converts the language code into a single format.
@@ -562,7 +1125,7 @@ class BaseTranslator(ABC):
         else:
             result = Language(language)
 
-        normalized_result = self._language_normalize(result)
+        normalized_result = self._normalize_language(result)
 
         if self._supported_languages:  # Check if the attribute is not empty
             if normalized_result not in self._supported_languages:
@@ -570,6 +1133,31 @@ class BaseTranslator(ABC):
 
         return normalized_result
 
+    @classmethod
+    def supports_language(cls, language: Union[str, Language]) -> bool:
+        """
+        Returns whether the service supports the given language, without making any request
+
+        Can be called on the class or on an instance
+
+        i.e DeeplTranslate.supports_language("Japanese") --> True
+        """
+        language = Language(language)
+        try:
+            normalized_language = cls._normalize_language(language)
+        except Exception:  # the service has no code for this language
+            return False
+        return not cls._supported_languages or normalized_language in cls._supported_languages
+
+    @classmethod
+    def supports_pair(cls, source_language: Union[str, Language], destination_language: Union[str, Language]) -> bool:
+        """
+        Returns whether the service supports translating from `source_language` to `destination_language`, without making any request
+
+        i.e ReversoTranslate.supports_pair("auto", "Korean") --> False
+        """
+        return cls.supports_language(source_language) and cls.supports_language(destination_language)
+
     def _validate_text(self, text: str) -> None:
         """
         Performs text validation. Checks the text for the correct type,
@@ -602,6 +1190,46 @@ class BaseTranslator(ABC):
         self._examples_cache.clear()
         self._dictionaries_cache.clear()
 
+    def _cache_key(self, text: str, *parameters) -> tuple:
+        """
+        Returns the key used to cache a result for the given text and parameters (i.e the languages)
+
+        The key starts with the service, so that the results of different services don't get mixed up,
+        and the texts longer than `_cache_key_text_length` characters are replaced by their SHA-256 digest
+        """
+        if len(text) > self._cache_key_text_length:
+            text = sha256(text.encode("utf-8")).digest()
+        return (self.__class__.__name__, text) + parameters
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        """
+        Returns the usage statistics of the in-memory caches
+
+        i.e {"translations": {"entries": 12, "bytes": 3104, "hits": 40, "misses": 12, "evictions": 0, "expirations": 0}, ...}
+        """
+        results = {}
+        for attribute, (namespace, _) in cls._caches.items():
+            cache = getattr(cls, attribute)
+            if isinstance(cache, LRUDictCache):
+                results[namespace] = cache.stats()
+        return results
+
+    @classmethod
+    def use_cache_backend(cls, backend: BaseCacheBackend) -> None:
+        """
+        Stores the cached results of this translator class (and of its subclasses) in the given backend
+
+        i.e BaseTranslator.use_cache_backend(SQLiteCacheBackend("translatepy.sqlite"))
+
+        Returns:
+            None
+        """
+        if not isinstance(backend, BaseCacheBackend):
+            raise ParameterTypeError("Parameter 'backend' must be a BaseCacheBackend instance, {} was given".format(type(backend).__name__))
+        for attribute, (namespace, maxsize) in cls._caches.items():
+            setattr(cls, attribute, backend.namespace(namespace, maxsize=maxsize))
+
     def __str__(self) -> str:
         """
         String representation of a translator.
@@ -11,7 +11,7 @@ from safeIO import JSONFile
 from translatepy.exceptions import UnsupportedMethod
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslateException, BaseTranslator
-from translatepy.utils.request import Request
+from translatepy.utils.request import Request, Retry, default_request
 from translatepy.utils.annotations import Callable, Dict
 
 HOME_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -72,19 +72,17 @@ class BingSessionManager():
             self._parse_authorization_data()
 
     def _parse_authorization_data(self):
-        for _ in range(3):
-            _request = self.session.get("https://www.bing.com/translator")
+        def attempt():
+            _request = self.session.single_attempt("GET", "https://www.bing.com/translator")
             _page = _request.text
-            _parsed_IG = re.findall('IG:"(.*?)"', _page)
-            _parsed_IID = re.findall('data-iid="(.*?)"', _page)
             _parsed_helper_info = re.findall("params_AbusePreventionHelper = (.*?);", _page)
-
             if not _parsed_helper_info:
-                continue
+                raise Retry(BingTranslateException(message="Can't parse the authorization data, try again later or use MicrosoftTranslate"), response=_request)
+            return _request, _page, _parsed_helper_info
 
-            break
-        else:
-            raise BingTranslateException(message="Can't parse the authorization data, try again later or use MicrosoftTranslate")
+        _request, _page, _parsed_helper_info = self.session.retry_policy.run(attempt)
+        _parsed_IG = re.findall('IG:"(.*?)"', _page)
+        _parsed_IID = re.findall('data-iid="(.*?)"', _page)
 
         _normalized_key = json.loads(_parsed_helper_info[0])[0]
         _normalized_token = json.loads(_parsed_helper_info[0])[1]
@@ -96,13 +94,12 @@ class BingSessionManager():
         self.cookies = _request.cookies
 
     def send(self, url, data):
-        # Try 2 times to make a request
-        for _ in range(2):
+        def attempt():
             _params = {'IG': self.ig, 'IID': self.iid, "isVertical": 1}
             _data = {'token': self.token, 'key': self.key, "isAuthv2": True}
             _data.update(data)
 
-            request = self.session.post(url, params=_params, data=_data, cookies=self.cookies)
+            request = self.session.single_attempt("POST", url, params=_params, data=_data, cookies=self.cookies)
             response = request.json()
 
             # Sometimes the Bing Translate API returns the response status code 200 along with the request, even if there is some kind of error.
@@ -125,9 +122,8 @@ class BingSessionManager():
                     self._parse_authorization_data()
                 except Exception:
                     raise BingTranslateException(status_code)
-                else:
-                    continue
-            elif status_code == 429:
+                raise Retry(BingTranslateException(status_code), backoff=False)
+            elif status_code == 429 and not self.session.retry_policy.is_retryable(status_code):
                 # TODO
                 # if response.get("ShowCaptcha", False):
                 #     if self.captcha_callback:
@@ -135,10 +131,13 @@ class BingSessionManager():
                 #             captcha, region, captcha_type, challenge_id = self._fetch_captcha()
                 #             captcha_solution = self.captcha_callback(captcha)
                 #             self._verify_captcha(captcha_solution, region, captcha_type, challenge_id)
-                raise BingTranslateException(status_code)
+                raise BingTranslateException(status_code)  # reported to the circuit breaker of `Translate` right away
+            elif self.session.retry_policy.is_retryable(status_code):
+                raise Retry(BingTranslateException(status_code), response=request)
             else:
                 raise BingTranslateException(status_code)
-        raise BingTranslateException(400)
+
+        return self.session.retry_policy.run(attempt)
 
     # def _fetch_captcha():
     #     pass
@@ -152,8 +151,10 @@ class BingTranslate(BaseTranslator):
     """
 
     _supported_languages = {'auto-detect', 'af', 'sq', 'am', 'ar', 'hy', 'as', 'az', 'bn', 'bs', 'bg', 'my', 'ca', 'ca', 'zh-Hans', 'cs', 'da', 'nl', 'nl', 'en', 'et', 'fj', 'fil', 'fil', 'fi', 'fr', 'fr-ca', 'de', 'ga', 'el', 'gu', 'ht', 'ht', 'he', 'hi', 'hr', 'hu', 'is', 'iu', 'id', 'it', 'ja', 'kn', 'kk', 'km', 'ko', 'ku', 'lo', 'lv', 'lt', 'ml', 'mi', 'mr', 'ms', 'mg', 'mt', 'ne', 'nb', 'nb', 'or', 'pa', 'pa', 'fa', 'pl', 'pt', 'ps', 'ps', 'ro', 'ro', 'ro', 'ru', 'sk', 'sl', 'sm', 'es', 'es', 'sr-Cyrl', 'sw', 'sv', 'ty', 'ta', 'te', 'th', 'ti', 'tlh-Latn', 'tlh-Latn', 'to', 'tr', 'uk', 'ur', 'vi', 'cy', 'zh-Hans', 'zh-Hant', 'yue', 'prs', 'mww', 'tlh-Piqd', 'kmr', 'pt-pt', 'otq', 'sr-Cyrl', 'sr-Latn', 'yua'}
+    _max_text_length = 1000
 
-    def __init__(self, request: Request = Request()):
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session_manager = BingSessionManager(request)
         self.session = request
 
@@ -9,7 +9,7 @@ About the translation and the language endpoints:
 © Anime no Sekai — 2021
 """
 
-from time import time, sleep
+from time import time
 from re import compile
 from random import randint
 from bs4 import BeautifulSoup
@@ -17,7 +17,7 @@ from bs4 import BeautifulSoup
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslator, BaseTranslateException
 from translatepy.utils.annotations import Tuple, List
-from translatepy.utils.request import Request
+from translatepy.utils.request import AsyncRequest, Request, Retry, default_request
 
 SENTENCES_SPLITTING_REGEX = compile('(?<=[.!:?])\s+')
 
@@ -28,8 +28,10 @@ class DeeplTranslateException(BaseTranslateException):
     """
 
     error_codes = {
+        429: "Too many requests.",
         1042911: "Too many requests."
     }
+    rate_limit_codes = {429, 1042911}
 
 
 class GetClientState():
@@ -66,14 +68,16 @@ class JSONRPCRequest():
     """
     JSON RPC Request Sender for DeepL
     """
-    def __init__(self, request: Request) -> None:
+    def __init__(self, request: Request, rate_limit: float = 1 / 3) -> None:
+        # one request every 3 seconds for each IP address, so as not to get blocked (unless the user set another limit)
+        request.set_rate_limit("www2.deepl.com", rate_limit, override=False)
         self.client_state = GetClientState(request)
         try:
             self.id_number = self.client_state.get()
         except Exception:
             self.id_number = (randint(1000, 9999) * 10000) + 1  # ? I didn't verify the range, but it's better having only DeepL not working than having Translator() crash for only one service
         self.session = request
-        self.last_access = 0
+        self.async_session = AsyncRequest(request=request)
 
     def dump(self, method, params):
         self.id_number += 1
@@ -85,28 +89,46 @@ class JSONRPCRequest():
         }
         return data
 
-    def send_jsonrpc(self, method, params):
-        # Take a break 3 sec between requests, so as not to get a block by the IP address
-        if time() - self.last_access < 3:
-            distance = 3 - (time() - self.last_access)
-            sleep((distance if distance >= 0 else 0))
-
-        request = self.session.post("https://www2.deepl.com/jsonrpc", json=self.dump(method, params))
-        self.last_access = time()
+    def _check_response(self, request):
+        """
+        Returns the result of a successful JSON RPC request, or raises the exception (wrapped in `Retry` if it should be retried) of a failed one
+        """
         response = request.json()
         if request.status_code == 200:
             return response["result"]
-        else:
-            raise DeeplTranslateException(response["error"]["code"])
+        exception = DeeplTranslateException(response.get("error", {}).get("code", request.status_code))
+        if self.session.retry_policy.is_retryable(request.status_code):
+            raise Retry(exception, response=request)
+        raise exception
+
+    def send_jsonrpc(self, method, params):
+        def attempt():
+            request = self.session.single_attempt("POST", "https://www2.deepl.com/jsonrpc", json=self.dump(method, params))
+            return self._check_response(request)
+
+        return self.session.retry_policy.run(attempt)
+
+    async def asend_jsonrpc(self, method, params):
+        """
+        Asynchronous version of `send_jsonrpc`
+        """
+        async def attempt():
+            request = await self.async_session.single_attempt("POST", "https://www2.deepl.com/jsonrpc", json=self.dump(method, params))
+            return self._check_response(request)
+
+        return await self.session.retry_policy.arun(attempt)
 
 
 class DeeplTranslate(BaseTranslator):
 
+    _rate_limit = 1 / 3  # the allowed number of JSONRPC requests per second, for each IP address
+
     _supported_languages = {'AUTO', 'BG', 'ZH', 'CS', 'DA', 'NL', 'EN', 'ET', 'FI', 'FR', 'DE', 'EL', 'HU', 'IT', 'JA', 'LV', 'LT', 'PL', 'PT', 'RO', 'RU', 'SK', 'SL', 'ES', 'SV', 'TR', 'ID', 'NB', 'KO', 'UK'}
 
-    def __init__(self, request: Request = Request(), preferred_langs: List = ["EN", "RU"]) -> None:
+    def __init__(self, request: Request = None, preferred_langs: List = ["EN", "RU"]) -> None:
+        request = default_request() if request is None else request
         self.session = request
-        self.jsonrpc = JSONRPCRequest(request)
+        self.jsonrpc = JSONRPCRequest(request, rate_limit=self._rate_limit)
         self.user_preferred_langs = preferred_langs
 
     def _split_into_sentences(self, text: str, destination_language: str, source_language: str) -> Tuple[List[str], str]:
@@ -133,19 +155,33 @@ class DeeplTranslate(BaseTranslator):
         return resp["splitted_texts"][0], resp["lang"]
 
     def _translate(self, text: str, destination_language: str, source_language: str) -> str:
+        return self._translate_batch([text], destination_language, source_language)[0]
+
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> str:
+        return (await self._atranslate_batch([text], destination_language, source_language))[0]
+
+    def _handle_jobs_params(self, splitted_texts: List[List[str]], destination_language: str) -> Tuple[dict, List[Tuple[int, int]]]:
+        """
+        Builds the `LMT_handle_jobs` parameters (without the source language), with a job per sentence
+
+        Returned tuple: (Parameters, Range of the jobs belonging to each text)
+        """
         priority = 1
         quality = ""
 
-        # splitting the text into sentences
-        sentences, computed_lang = self._split_into_sentences(text, destination_language, source_language)
-
-        # building the a job per sentence
-        jobs = self._build_jobs(sentences, quality)
+        # building the a job per sentence, while keeping track of the jobs belonging to each text
+        jobs = []
+        jobs_ranges = []
+        for sentences in splitted_texts:
+            text_jobs = self._build_jobs(sentences, quality)
+            jobs_ranges.append((len(jobs), len(jobs) + len(text_jobs)))
+            jobs.extend(text_jobs)
 
         # timestamp generation
         i_count = 1
-        for sentence in sentences:
-            i_count += sentence.count("i")
+        for sentences in splitted_texts:
+            for sentence in sentences:
+                i_count += sentence.count("i")
         ts = int(time() * 10) * 100 + 1000
 
         # params building
@@ -158,6 +194,13 @@ class DeeplTranslate(BaseTranslator):
             "priority": priority,
             "timestamp": ts + (i_count - ts % i_count)
         }
+        return params, jobs_ranges
+
+    def _translate_batch_params(self, splitted_texts: List[List[str]], computed_lang: str, destination_language: str, source_language: str) -> Tuple[dict, List[Tuple[int, int]]]:
+        """
+        Builds the `LMT_handle_jobs` parameters to translate the given sentences, packing the jobs of every text in the same jobs list
+        """
+        params, jobs_ranges = self._handle_jobs_params(splitted_texts, destination_language)
 
         if source_language == "auto":
             params["lang"]["source_lang_computed"] = computed_lang
@@ -165,51 +208,101 @@ class DeeplTranslate(BaseTranslator):
         else:
             params["lang"]["source_lang_user_selected"] = source_language
 
-        results = self.jsonrpc.send_jsonrpc("LMT_handle_jobs", params)
+        return params, jobs_ranges
 
+    def _parse_translations(self, results: dict, jobs_ranges: List[Tuple[int, int]], source_language: str) -> List[Tuple[str, str]]:
+        """
+        Returns the detected language and the translation of each text from the `LMT_handle_jobs` results
+        """
         try:
             _detected_language = results["source_lang"]
         except:
             _detected_language = source_language
 
-        if results is not None:
-            translations = results["translations"]
-            return _detected_language, " ".join(obj["beams"][0]["postprocessed_sentence"] for obj in translations if obj["beams"])
+        if results is None:
+            raise DeeplTranslateException(message="DeepL did not return any translation")
+        translations = results["translations"]
+        return [(_detected_language, " ".join(obj["beams"][0]["postprocessed_sentence"] for obj in translations[start:end] if obj["beams"])) for start, end in jobs_ranges]
 
-    def _language(self, text: str) -> str:
-        priority = 1
-        quality = ""
+    def _translate_batch(self, texts: List[str], destination_language: str, source_language: str) -> List[Tuple[str, str]]:
+        """
+        Translates all of the given texts with a single `LMT_handle_jobs` call,
+        by packing the jobs of every text in the same jobs list
+        """
+        # splitting the texts into sentences
+        splitted_texts, computed_lang = self._split_texts_into_sentences(texts, destination_language, source_language)
 
-        # splitting the text into sentences
-        sentences, computed_lang = self._split_into_sentences(text, "EN", "AUTO")
+        params, jobs_ranges = self._translate_batch_params(splitted_texts, computed_lang, destination_language, source_language)
+        results = self.jsonrpc.send_jsonrpc("LMT_handle_jobs", params)
+        return self._parse_translations(results, jobs_ranges, source_language)
 
-        # building the a job per sentence
-        jobs = self._build_jobs(sentences, quality)
+    async def _atranslate_batch(self, texts: List[str], destination_language: str, source_language: str) -> List[Tuple[str, str]]:
+        """
+        Asynchronous version of `_translate_batch`
+        """
+        splitted_texts, computed_lang = await self._asplit_texts_into_sentences(texts, destination_language, source_language)
 
-        # timestamp generation
-        i_count = 1
-        for sentence in sentences:
-            i_count += sentence.count("i")
-        ts = int(time() * 10) * 100 + 1000
+        params, jobs_ranges = self._translate_batch_params(splitted_texts, computed_lang, destination_language, source_language)
+        results = await self.jsonrpc.asend_jsonrpc("LMT_handle_jobs", params)
+        return self._parse_translations(results, jobs_ranges, source_language)
 
-        # params building
-        params = {
-            "jobs": jobs,
+    def _split_params(self, texts: List[str], destination_language: str, source_language: str) -> dict:
+        """
+        Builds the `LMT_split_into_sentences` parameters for the given texts
+        """
+        return {
+            "texts": [text.strip() for text in texts],
             "lang": {
-                "target_lang": "EN",
-                "user_preferred_langs": ["EN"]
-            },
-            "priority": priority,
-            "timestamp": ts + (i_count - ts % i_count)
+                "lang_user_selected": source_language,
+                "user_preferred_langs": list(set(self.user_preferred_langs + [destination_language]))
+            }
         }
 
+    def _split_texts_into_sentences(self, texts: List[str], destination_language: str, source_language: str) -> Tuple[List[List[str]], str]:
+        """
+        Split multiple strings into sentences with a single call to the DeepL API.
+
+        Returned tuple: (Sentences for each text, Computed Language)
+        """
+        resp = self.jsonrpc.send_jsonrpc("LMT_split_into_sentences", self._split_params(texts, destination_language, source_language))
+
+        return resp["splitted_texts"], resp["lang"]
+
+    async def _asplit_texts_into_sentences(self, texts: List[str], destination_language: str, source_language: str) -> Tuple[List[List[str]], str]:
+        """
+        Asynchronous version of `_split_texts_into_sentences`
+        """
+        resp = await self.jsonrpc.asend_jsonrpc("LMT_split_into_sentences", self._split_params(texts, destination_language, source_language))
+
+        return resp["splitted_texts"], resp["lang"]
+
+    def _language_params(self, sentences: List[str], computed_lang: str) -> dict:
+        """
+        Builds the `LMT_handle_jobs` parameters to detect the language of the given sentences
+        """
+        params, _ = self._handle_jobs_params([sentences], "EN")
+
         if computed_lang is not None:
             params["lang"]["source_lang_computed"] = computed_lang
             params["lang"]["user_preferred_langs"].append(computed_lang)
         else:
             params["lang"]["source_lang_user_selected"] = "AUTO"
 
-        results = self.jsonrpc.send_jsonrpc("LMT_handle_jobs", params)
+        return params
+
+    def _language(self, text: str) -> str:
+        # splitting the text into sentences
+        sentences, computed_lang = self._split_into_sentences(text, "EN", "AUTO")
+
+        results = self.jsonrpc.send_jsonrpc("LMT_handle_jobs", self._language_params(sentences, computed_lang))
+
+        if results is not None:
+            return results["source_lang"]
+
+    async def _alanguage(self, text: str) -> str:
+        splitted_texts, computed_lang = await self._asplit_texts_into_sentences([text], "EN", "AUTO")
+
+        results = await self.jsonrpc.asend_jsonrpc("LMT_handle_jobs", self._language_params(splitted_texts[0], computed_lang))
 
         if results is not None:
             return results["source_lang"]
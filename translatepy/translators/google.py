@@ -12,9 +12,10 @@ from json import dumps, loads
 
 from translatepy.exceptions import ServiceURLError, UnsupportedMethod
 from translatepy.language import Language
-from translatepy.translators.base import BaseTranslator
+from translatepy.translators.base import BaseTranslateException, BaseTranslator
+from translatepy.utils.annotations import List, Tuple
 from translatepy.utils.gtoken import TokenAcquirer
-from translatepy.utils.request import Request
+from translatepy.utils.request import AsyncRequest, Request, default_request
 from translatepy.utils.utils import convert_to_float
 
 # a set is used to avoid having a O(n) lookup time complexity (a set should have a O(1) lookup time complexity)
@@ -59,12 +60,19 @@ DOMAINS = {
 _google_supported_languages = {'auto', 'af', 'sq', 'am', 'ar', 'hy', 'az', 'eu', 'be', 'bn', 'bs', 'bg', 'my', 'ca', 'ca', 'ceb', 'zh-cn', 'co', 'cs', 'da', 'nl', 'nl', 'en', 'eo', 'et', 'fi', 'fr', 'fy', 'ka', 'de', 'gd', 'gd', 'ga', 'gl', 'el', 'gu', 'ht', 'ht', 'ha', 'haw', 'he', 'hi', 'hr', 'hu', 'ig', 'is', 'id', 'it', 'jw', 'ja', 'kn', 'kk', 'km', 'ky', 'ky', 'ko', 'ku', 'lo', 'la', 'lv', 'lt', 'lb', 'lb', 'mk', 'ml', 'mi', 'mr', 'ms', 'mg', 'mt', 'mn', 'ne', 'no', 'ny', 'ny', 'ny', 'or', 'pa', 'pa', 'fa', 'pl', 'pt', 'ps', 'ps', 'ro', 'ro', 'ro', 'ru', 'si', 'si', 'sk', 'sl', 'sm', 'sn', 'sd', 'so', 'st', 'es', 'es', 'sr', 'su', 'sw', 'sv', 'ta', 'te', 'tg', 'tl', 'th', 'tr', 'ug', 'ug', 'uk', 'ur', 'uz', 'vi', 'cy', 'xh', 'yi', 'yo', 'zu', 'zh-CN', 'zh-TW'}
 
 
+class GoogleTranslateException(BaseTranslateException):
+    """
+    Default Google Translate exception
+    """
+
+
 # For backward compatibility
 class GoogleTranslate(BaseTranslator):
 
     _supported_languages = _google_supported_languages
 
-    def __init__(self, request: Request = Request(), service_url: str = "translate.google.com"):
+    def __init__(self, request: Request = None, service_url: str = "translate.google.com"):
+        request = default_request() if request is None else request
 
         if service_url not in DOMAINS:
             raise ServiceURLError("{url} is not a valid service URL".format(url=str(service_url)))
@@ -85,6 +93,28 @@ class GoogleTranslate(BaseTranslator):
         else:
             raise exception
 
+    async def _atranslate(self, text, destination_language, source_language):
+        exception = None
+        for service in self.services:
+            try:
+                return await service._atranslate(text, destination_language, source_language)
+            except Exception as ex:
+                exception = ex
+                continue
+        else:
+            raise exception
+
+    def _translate_batch(self, texts, destination_language, source_language):
+        exception = None
+        for service in self.services:
+            try:
+                return service._translate_batch(texts, destination_language, source_language)
+            except Exception as ex:
+                exception = ex
+                continue
+        else:
+            raise exception
+
     def _transliterate(self, text, destination_language, source_language):
         exception = None
         for service in self.services:
@@ -107,6 +137,17 @@ class GoogleTranslate(BaseTranslator):
         else:
             raise exception
 
+    async def _alanguage(self, text):
+        exception = None
+        for service in self.services:
+            try:
+                return await service._alanguage(text)
+            except Exception as ex:
+                exception = ex
+                continue
+        else:
+            raise exception
+
     def _language_normalize(self, language: Language):
         if language.id == "zho":
             return "zh-cn"
@@ -147,8 +188,10 @@ class GoogleTranslateV1(BaseTranslator):
 
     _supported_languages = _google_supported_languages
 
-    def __init__(self, request: Request = Request(), service_url: str = "translate.google.com"):
+    def __init__(self, request: Request = None, service_url: str = "translate.google.com"):
+        request = default_request() if request is None else request
         self.session = request
+        self.async_session = AsyncRequest(request=request)
         self.service_url = service_url
 
     def _request(self, text, destination, source):
@@ -157,13 +200,27 @@ class GoogleTranslateV1(BaseTranslator):
 
         Most of the code comes from https://github.com/ssut/py-googletrans/pull/255
         """
+        return self._batch_request([text], destination, source)
+
+    async def _arequest(self, text, destination, source):
+        """
+        Asynchronous version of `_request`
+        """
+        return await self._abatch_request([text], destination, source)
+
+    def _batch_request_params(self, texts, destination, source):
+        """
+        Returns the URL, the parameters and the data of a translation request for multiple texts to Google Translate RPC API
+
+        Each text gets its own envelope in the batchexecute request, identified by its position (starting at 1)
+        """
         rpc_request = dumps([[
             [
                 'MkEWBc',
                 dumps([[text, source, destination, True], [None]], separators=(',', ':')),
                 None,
-                'generic',
-            ],
+                'generic' if len(texts) == 1 else str(index + 1),
+            ] for index, text in enumerate(texts)
         ]], separators=(',', ':'))
         data = {
             "f.req": rpc_request
@@ -176,7 +233,23 @@ class GoogleTranslateV1(BaseTranslator):
             'soc-device': 1,
             'rt': 'c',
         }
-        request = self.session.post('https://{}/_/TranslateWebserverUi/data/batchexecute'.format(self.service_url), params=params, data=data)
+        return 'https://{}/_/TranslateWebserverUi/data/batchexecute'.format(self.service_url), params, data
+
+    def _batch_request(self, texts, destination, source):
+        """
+        Makes a translation request for multiple texts to Google Translate RPC API
+        """
+        url, params, data = self._batch_request_params(texts, destination, source)
+        request = self.session.post(url, params=params, data=data)
+        if request.status_code < 400:
+            return request.text
+
+    async def _abatch_request(self, texts, destination, source):
+        """
+        Asynchronous version of `_batch_request`
+        """
+        url, params, data = self._batch_request_params(texts, destination, source)
+        request = await self.async_session.post(url, params=params, data=data)
         if request.status_code < 400:
             return request.text
 
@@ -212,14 +285,30 @@ class GoogleTranslateV1(BaseTranslator):
 
         return loads(loads(resp)[0][2])
 
-    def _translate(self, text: str, destination_language: str, source_language: str) -> str:
+    def _parse_batch_response(self, data):
         """
-        Translates the given text to the destination language with the new batchexecute API
+        Parses the response given by the batchexecute endpoint when multiple envelopes are sent
 
-        Heavily inspired by ssut/googletrans and https://kovatch.medium.com/deciphering-google-batchexecute-74991e4e446c
+        Returns a dictionary mapping each envelope identifier to its parsed payload
+        """
+        results = {}
+        for line in data.split('\n'):
+            line = line.strip()
+            if not line.startswith('['):
+                continue
+            try:
+                chunk = loads(line)
+            except ValueError:
+                continue
+            for element in chunk:
+                if len(element) > 6 and element[0] == "wrb.fr" and element[1] == "MkEWBc" and element[2] is not None:
+                    results[element[6]] = loads(element[2])
+        return results
+
+    def _parse_translation(self, parsed, source_language: str):
+        """
+        Extracts the detected language and the translation from a parsed batchexecute payload
         """
-        request = self._request(text, destination_language, source_language)
-        parsed = self._parse_response(request)
         translated = (' ' if parsed[1][0][0][3] else '').join([part[0] for part in parsed[1][0][0][5]])
 
         if source_language == 'auto' or source_language is None:
@@ -242,6 +331,37 @@ class GoogleTranslateV1(BaseTranslator):
 
         return source_language, translated
 
+    def _translate(self, text: str, destination_language: str, source_language: str) -> str:
+        """
+        Translates the given text to the destination language with the new batchexecute API
+
+        Heavily inspired by ssut/googletrans and https://kovatch.medium.com/deciphering-google-batchexecute-74991e4e446c
+        """
+        request = self._request(text, destination_language, source_language)
+        parsed = self._parse_response(request)
+        return self._parse_translation(parsed, source_language)
+
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> str:
+        request = await self._arequest(text, destination_language, source_language)
+        parsed = self._parse_response(request)
+        return self._parse_translation(parsed, source_language)
+
+    def _translate_batch(self, texts: List[str], destination_language: str, source_language: str) -> List[Tuple[str, str]]:
+        """
+        Translates all of the given texts with a single batchexecute request, one envelope per text
+        """
+        if len(texts) == 1:
+            return [self._translate(texts[0], destination_language, source_language)]
+        request = self._batch_request(texts, destination_language, source_language)
+        parsed = {} if request is None else self._parse_batch_response(request)
+        results = []
+        for index in range(len(texts)):
+            envelope = parsed.get(str(index + 1))
+            if envelope is None:
+                raise GoogleTranslateException(message="Google Translate did not return the translation of the text at index {index}".format(index=index))
+            results.append(self._parse_translation(envelope, source_language))
+        return results
+
     def _transliterate(self, text: str, destination_language: str, source_language: str) -> str:
         request = self._request(text, destination_language, source_language)
         parsed = self._parse_response(request)
@@ -280,8 +400,16 @@ class GoogleTranslateV1(BaseTranslator):
         Heavily inspired by ssut/googletrans and https://kovatch.medium.com/deciphering-google-batchexecute-74991e4e446c
         """
         request = self._request(text, "en", "auto")
-        parsed = self._parse_response(request)
+        return self._parse_language(self._parse_response(request))
 
+    async def _alanguage(self, text):
+        request = await self._arequest(text, "en", "auto")
+        return self._parse_language(self._parse_response(request))
+
+    def _parse_language(self, parsed):
+        """
+        Extracts the detected language from a parsed batchexecute payload
+        """
         try:
             source_language = parsed[2]
         except Exception:
@@ -326,65 +454,87 @@ class GoogleTranslateV2(BaseTranslator):
 
     _supported_languages = _google_supported_languages
 
-    def __init__(self, request: Request = Request(), service_url: str = "translate.google.com"):
+    def __init__(self, request: Request = None, service_url: str = "translate.google.com"):
+        request = default_request() if request is None else request
         self.session = request
+        self.async_session = AsyncRequest(request=request)
         self.service_url = service_url
         self.token_acquirer = TokenAcquirer(service_url)
 
-    def _translate(self, text: str, destination_language: str, source_language: str) -> str:
-        params = {"client": "gtx", "dt": "t", "sl": source_language, "tl": destination_language, "q": text}
-        request = self.session.get("https://translate.googleapis.com/translate_a/single", params=params)
-        response = request.json()
-        if request.status_code < 400:
-            try:
-                _detected_language = response[2]
-            except Exception:
-                _detected_language = source_language
-            return _detected_language, "".join([sentence[0] for sentence in response[0]])
+    def _translate_endpoints(self, text: str, destination_language: str, source_language: str):
+        """
+        Returns the endpoints tried in order for a translation, as (URL, parameters, parser) tuples
 
-        params = {"client": "dict-chrome-ex", "sl": source_language, "tl": destination_language, "q": text}
-        request = self.session.get("https://clients5.google.com/translate_a/t", params=params)
-        response = request.json()
-        if request.status_code < 400:
-            try:
+        The parser receives the response and returns the (detected_language, result) tuple, or None to try the next endpoint
+        """
+        def parse_single(request):
+            response = request.json()
+            if request.status_code < 400:
                 try:
-                    _detected_language = response['ld_result']["srclangs"][0]
+                    _detected_language = response[2]
                 except Exception:
                     _detected_language = source_language
-                return "".join((sentence["trans"] if "trans" in sentence else "") for sentence in response["sentences"])
-            except Exception:
+                return _detected_language, "".join([sentence[0] for sentence in response[0]])
+
+        def parse_dict_chrome_ex(request):
+            response = request.json()
+            if request.status_code < 400:
                 try:
                     try:
-                        _detected_language = response[0][0][2]
+                        _detected_language = response['ld_result']["srclangs"][0]
                     except Exception:
                         _detected_language = source_language
-                    return "".join(sentence for sentence in response[0][0][0][0])
-                except Exception:  # if it fails, continue with the other endpoints
-                    pass
-
-        params = {"dt": ["t", "bd", "ex", "ld", "md", "qca", "rw", "rm", "ss", "t", "at"], "client": "gtx", "q": text, "hl": destination_language, "sl": source_language, "tl": destination_language, "dj": "1", "source": "bubble"}
-        request = self.session.get("https://translate.googleapis.com/translate_a/single", params=params)
-        response = request.json()
-        if request.status_code < 400:
-            try:
-                _detected_language = response.get("src", None)
-                if _detected_language is None:
-                    _detected_language = response.get("ld_result", {}).get("srclangs", [None])[0]
+                    return _detected_language, "".join((sentence["trans"] if "trans" in sentence else "") for sentence in response["sentences"])
+                except Exception:
+                    try:
+                        try:
+                            _detected_language = response[0][0][2]
+                        except Exception:
+                            _detected_language = source_language
+                        return _detected_language, "".join(sentence for sentence in response[0][0][0][0])
+                    except Exception:  # if it fails, continue with the other endpoints
+                        pass
+
+        def parse_bubble(request):
+            response = request.json()
+            if request.status_code < 400:
+                try:
+                    _detected_language = response.get("src", None)
                     if _detected_language is None:
-                        _detected_language = response.get("ld_result", {}).get("extended_srclangs", [None])[0]
-            except Exception:
-                _detected_language = source_language
-            return _detected_language, " ".join([sentence["trans"] for sentence in response["sentences"] if "trans" in sentence])
+                        _detected_language = response.get("ld_result", {}).get("srclangs", [None])[0]
+                        if _detected_language is None:
+                            _detected_language = response.get("ld_result", {}).get("extended_srclangs", [None])[0]
+                except Exception:
+                    _detected_language = source_language
+                return _detected_language, " ".join([sentence["trans"] for sentence in response["sentences"] if "trans" in sentence])
 
-        params = {"client": "gtx", "dt": ["t", "bd"], "dj": "1", "source": "input", "q": text, "sl": source_language, "tl": destination_language}
-        request = self.session.get("https://translate.googleapis.com/translate_a/single", params=params)
-        response = request.json()
-        if request.status_code < 400:
-            try:
-                _detected_language = response["src"]
-            except Exception:
-                _detected_language = source_language
-            return _detected_language, "".join([sentence["trans"] for sentence in response["sentences"] if "trans" in sentence])
+        def parse_input(request):
+            response = request.json()
+            if request.status_code < 400:
+                try:
+                    _detected_language = response["src"]
+                except Exception:
+                    _detected_language = source_language
+                return _detected_language, "".join([sentence["trans"] for sentence in response["sentences"] if "trans" in sentence])
+
+        return [
+            ("https://translate.googleapis.com/translate_a/single", {"client": "gtx", "dt": "t", "sl": source_language, "tl": destination_language, "q": text}, parse_single),
+            ("https://clients5.google.com/translate_a/t", {"client": "dict-chrome-ex", "sl": source_language, "tl": destination_language, "q": text}, parse_dict_chrome_ex),
+            ("https://translate.googleapis.com/translate_a/single", {"dt": ["t", "bd", "ex", "ld", "md", "qca", "rw", "rm", "ss", "t", "at"], "client": "gtx", "q": text, "hl": destination_language, "sl": source_language, "tl": destination_language, "dj": "1", "source": "bubble"}, parse_bubble),
+            ("https://translate.googleapis.com/translate_a/single", {"client": "gtx", "dt": ["t", "bd"], "dj": "1", "source": "input", "q": text, "sl": source_language, "tl": destination_language}, parse_input)
+        ]
+
+    def _translate(self, text: str, destination_language: str, source_language: str) -> str:
+        for url, params, parse in self._translate_endpoints(text, destination_language, source_language):
+            result = parse(self.session.get(url, params=params))
+            if result is not None:
+                return result
+
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> str:
+        for url, params, parse in self._translate_endpoints(text, destination_language, source_language):
+            result = parse(await self.async_session.get(url, params=params))
+            if result is not None:
+                return result
 
     def _transliterate(self, text: str, destination_language: str, source_language: str) -> str:
         params = {"dt": ["t", "bd", "ex", "ld", "md", "qca", "rw", "rm", "ss", "t", "at"], "client": "gtx", "q": text, "hl": destination_language, "sl": source_language, "tl": destination_language, "dj": "1", "source": "bubble"}
@@ -427,18 +577,38 @@ class GoogleTranslateV2(BaseTranslator):
         if request.status_code < 400:
             return source_language, request.content
 
-    def _language(self, text: str) -> str:
-        params = {"client": "gtx", "dt": "t", "sl": "auto", "tl": "ja", "q": text}
-        request = self.session.get("https://translate.googleapis.com/translate_a/single", params=params)
-        response = request.json()
-        if request.status_code < 400:
-            return response[2]
+    def _language_endpoints(self, text: str):
+        """
+        Returns the endpoints tried in order for a language detection, as (URL, parameters, parser) tuples
 
-        params = {"client": "dict-chrome-ex", "sl": "auto", "tl": "ja", "q": text}
-        request = self.session.get("https://clients5.google.com/translate_a/t", params=params)
-        response = request.json()
-        if request.status_code < 400:
-            return response['ld_result']["srclangs"][0]
+        The parser receives the response and returns the language code, or None to try the next endpoint
+        """
+        def parse_single(request):
+            response = request.json()
+            if request.status_code < 400:
+                return response[2]
+
+        def parse_dict_chrome_ex(request):
+            response = request.json()
+            if request.status_code < 400:
+                return response['ld_result']["srclangs"][0]
+
+        return [
+            ("https://translate.googleapis.com/translate_a/single", {"client": "gtx", "dt": "t", "sl": "auto", "tl": "ja", "q": text}, parse_single),
+            ("https://clients5.google.com/translate_a/t", {"client": "dict-chrome-ex", "sl": "auto", "tl": "ja", "q": text}, parse_dict_chrome_ex)
+        ]
+
+    def _language(self, text: str) -> str:
+        for url, params, parse in self._language_endpoints(text):
+            result = parse(self.session.get(url, params=params))
+            if result is not None:
+                return result
+
+    async def _alanguage(self, text: str) -> str:
+        for url, params, parse in self._language_endpoints(text):
+            result = parse(await self.async_session.get(url, params=params))
+            if result is not None:
+                return result
 
     def _language_normalize(self, language: Language):
         if language.id == "zho":
@@ -1,7 +1,7 @@
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslator
 from translatepy.utils.annotations import Tuple
-from translatepy.utils.request import Request
+from translatepy.utils.request import AsyncRequest, Request, default_request
 
 
 class LibreTranslate(BaseTranslator):
@@ -9,8 +9,10 @@ class LibreTranslate(BaseTranslator):
     translatepy's implementation of LibreTranslate
     """
 
-    def __init__(self, request: Request = Request()):
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session = request
+        self.async_session = AsyncRequest(request=request)
 
     def _translate(self, text: str, destination_language: str, source_language: str) -> Tuple[str, str]:
         """
@@ -23,6 +25,17 @@ class LibreTranslate(BaseTranslator):
         response = self.session.post("https://libretranslate.com/translate", data={"q": str(text), "source": str(source_language), "target": str(destination_language)}, headers={"Origin": "https://libretranslate.com", "Host": "libretranslate.com", "Referer": "https://libretranslate.com/"})
         return source_language, response.json()["translatedText"]
 
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> Tuple[str, str]:
+        """
+        This is the asynchronous translating endpoint (optional)
+
+        Must return a tuple with (detected_language, result)
+        """
+        if source_language == "auto":
+            source_language = await self._alanguage(text)
+        response = await self.async_session.post("https://libretranslate.com/translate", data={"q": str(text), "source": str(source_language), "target": str(destination_language)}, headers={"Origin": "https://libretranslate.com", "Host": "libretranslate.com", "Referer": "https://libretranslate.com/"})
+        return source_language, response.json()["translatedText"]
+
     def _language(self, text: str) -> str:
         """
         This is the language detection endpoint
@@ -32,6 +45,15 @@ class LibreTranslate(BaseTranslator):
         response = self.session.post("https://libretranslate.com/detect", data={"q": str(text)}, headers={"Origin": "https://libretranslate.com", "Host": "libretranslate.com", "Referer": "https://libretranslate.com/"})
         return response.json()[0]["language"]
 
+    async def _alanguage(self, text: str) -> str:
+        """
+        This is the asynchronous language detection endpoint (optional)
+
+        Must return a string with the language code
+        """
+        response = await self.async_session.post("https://libretranslate.com/detect", data={"q": str(text)}, headers={"Origin": "https://libretranslate.com", "Host": "libretranslate.com", "Referer": "https://libretranslate.com/"})
+        return response.json()[0]["language"]
+
     def _language_normalize(self, language: Language) -> str:
         """
         This is the language validation function
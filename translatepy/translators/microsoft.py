@@ -2,18 +2,21 @@
 This implementation was made specifically for translatepy by 'Zhymabek Roman'.
 """
 
+import asyncio
 import json
 import re
 import os
 import uuid
 import time
+from functools import partial
 from safeIO import JSONFile
 
 from translatepy.exceptions import UnsupportedMethod
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslateException, BaseTranslator
-from translatepy.utils.request import Request
-from translatepy.utils.annotations import Callable, Dict
+from translatepy.utils.deadline import bind_deadline
+from translatepy.utils.request import AsyncRequest, Request, Retry, default_request
+from translatepy.utils.annotations import Callable, Dict, List, Tuple
 from translatepy.translators.bing import BingSessionManager, BingExampleResult
 
 HOME_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -21,13 +24,18 @@ HOME_DIR = os.path.abspath(os.path.dirname(__file__))
 
 class MicrosoftException(BaseTranslateException):
     error_codes = {
-        429: "Too many requests"
+        429: "Too many requests",
+        429000: "Too many requests",
+        429001: "Too many requests",
+        429002: "Too many requests"
     }
+    rate_limit_codes = {429, 429000, 429001, 429002}  # https://learn.microsoft.com/en-us/azure/ai-services/translator/reference/v3-0-reference#errors
 
 
 class MicrosoftSessionManager():
     def __init__(self, request: Request):
         self.session = request
+        self.async_session = AsyncRequest(request=request)
         self.bing_session = BingSessionManager(request)
 
         self._auth_session_file = JSONFile(os.path.join(HOME_DIR, ".microsoft_translatepy"), blocking=False)
@@ -50,39 +58,87 @@ class MicrosoftSessionManager():
 
             self._auth_session_file.write({"token": self._token, "region": self._region, "token_expiries": self._token_expiries})
 
+    def _request_params(self, params: Dict):
+        """
+        Returns the headers and the parameters of a request to the API
+        """
+        headers = {
+            'Authorization': 'Bearer {token}'.format(token=self._token),
+            'Content-type': 'application/json',
+            'X-ClientTraceId': str(uuid.uuid4())
+        }
+        _params = {'api-version': '3.0'}
+        _params.update(params)
+        return headers, _params
+
+    def _check_response(self, request):
+        """
+        Returns the JSON response of a successful request, or raises the exception (wrapped in `Retry` if it should be retried) of a failed one
+
+        The authorization token is refreshed by the caller when the exception status code is 401000.
+        """
+        response = request.json()
+
+        if request.status_code != 200:
+            error = response.get("error", {})
+            exception = MicrosoftException(status_code=error.get("code", request.status_code), message=error.get("message", "Unknown"))
+            if exception.status_code == 401000:
+                raise Retry(exception, backoff=False)
+            if self.session.retry_policy.is_retryable(request.status_code):
+                raise Retry(exception, response=request)
+            raise exception
+
+        return response
+
     def send(self, url, data, params: Dict = {}):
-        # Try 2 times to make a request
-        for _ in range(2):
-            headers = {
-                'Authorization': 'Bearer {token}'.format(token=self._token),
-                'Content-type': 'application/json',
-                'X-ClientTraceId': str(uuid.uuid4())
-            }
-            _params = {'api-version': '3.0'}
-            _params.update(params)
-
-            request = self.session.post(url, params=_params, json=data, headers=headers)
-            response = request.json()
-
-            if request.status_code != 200:
-                error = response.get("error", {})
-                if error.get("code", request.status_code) == 401000:
+        def attempt():
+            headers, _params = self._request_params(params)
+            request = self.session.single_attempt("POST", url, params=_params, json=data, headers=headers)
+            try:
+                return self._check_response(request)
+            except Retry as retry:
+                if retry.exception.status_code == 401000:
                     self._parse_authorization_data(force=True)
-                    continue
-                raise MicrosoftException(status_code=error.get("code"), message=error.get("message", "Unknown"))
+                raise
+
+        return self.session.retry_policy.run(attempt)
+
+    async def asend(self, url, data, params: Dict = {}):
+        """
+        Asynchronous version of `send`
+
+        The authorization token is refreshed in the event loop default executor (it is only needed every 10 minutes).
+        """
+        async def attempt():
+            headers, _params = self._request_params(params)
+            request = await self.async_session.single_attempt("POST", url, params=_params, json=data, headers=headers)
+            try:
+                return self._check_response(request)
+            except Retry as retry:
+                if retry.exception.status_code == 401000:
+                    await asyncio.get_running_loop().run_in_executor(None, bind_deadline(partial(self._parse_authorization_data, force=True)))
+                raise
+
+        return await self.session.retry_policy.arun(attempt)
 
-            return response
 
 class MicrosoftTranslate(BaseTranslator):
     """
     A Python implementation of Microsoft Translation's APIs
     """
 
+    # https://docs.microsoft.com/en-us/azure/cognitive-services/translator/reference/v3-0-translate#request-body
+    _max_batch_size = 1000
+    _max_batch_length = 50000
+    _max_text_length = 50000
+
     _supported_languages = {'auto', 'af', 'sq', 'am', 'ar', 'hy', 'as', 'az', 'bn', 'bs', 'bg', 'my', 'ca', 'ca', 'zh-Hans', 'cs', 'da', 'nl', 'nl', 'en', 'et', 'fj', 'fil', 'fil', 'fi', 'fr', 'fr-ca', 'de', 'ga', 'el', 'gu', 'ht', 'ht', 'he', 'hi', 'hr', 'hu', 'is', 'iu', 'id', 'it', 'ja', 'kn', 'kk', 'km', 'ko', 'ku', 'lo', 'lv', 'lt', 'ml', 'mi', 'mr', 'ms', 'mg', 'mt', 'ne', 'nb', 'nb', 'or', 'pa', 'pa', 'fa', 'pl', 'pt', 'ps', 'ps', 'ro', 'ro', 'ro', 'ru', 'sk', 'sl', 'sm', 'es', 'es', 'sr-Cyrl', 'sw', 'sv', 'ty', 'ta', 'te', 'th', 'ti', 'tlh-Latn', 'tlh-Latn', 'to', 'tr', 'uk', 'ur', 'vi', 'cy', 'zh-Hans', 'zh-Hant', 'yue', 'prs', 'mww', 'tlh-Piqd', 'kmr', 'pt-pt', 'otq', 'sr-Cyrl', 'sr-Latn', 'yua'}
 
-    def __init__(self, request: Request = Request()):
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session_manager = MicrosoftSessionManager(request)
         self.session = request
+        self.async_session = self.session_manager.async_session
 
     def _translate(self, text: str, destination_language: str, source_language: str) -> str:
         if source_language == "auto":
@@ -91,6 +147,31 @@ class MicrosoftTranslate(BaseTranslator):
         response = self.session_manager.send("https://api.cognitive.microsofttranslator.com/translate", params={'from': source_language, 'to': destination_language}, data=[{"text": text}])
         return source_language, response[0]["translations"][0]["text"]
 
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> str:
+        if source_language == "auto":
+            source_language = await self._alanguage(text)
+
+        response = await self.session_manager.asend("https://api.cognitive.microsofttranslator.com/translate", params={'from': source_language, 'to': destination_language}, data=[{"text": text}])
+        return source_language, response[0]["translations"][0]["text"]
+
+    def _translate_batch(self, texts: List[str], destination_language: str, source_language: str) -> List[Tuple[str, str]]:
+        """
+        Translates all of the given texts with a single request, using the array body of the translate endpoint
+        """
+        params = {'to': destination_language}
+        if source_language != "auto":
+            params["from"] = source_language
+
+        response = self.session_manager.send("https://api.cognitive.microsofttranslator.com/translate", params=params, data=[{"text": text} for text in texts])
+        results = []
+        for element in response:
+            try:
+                _detected_language = element["detectedLanguage"]["language"]
+            except Exception:
+                _detected_language = source_language
+            results.append((_detected_language, element["translations"][0]["text"]))
+        return results
+
     def _example(self, text, destination_language, source_language) -> str:
         source_language, translation = self._translate(text, destination_language, source_language)
 
@@ -101,6 +182,10 @@ class MicrosoftTranslate(BaseTranslator):
         response = self.session_manager.send("https://api.cognitive.microsofttranslator.com/detect", data=[{"text": text}])
         return response[0]["language"]
 
+    async def _alanguage(self, text: str) -> str:
+        response = await self.session_manager.asend("https://api.cognitive.microsofttranslator.com/detect", data=[{"text": text}])
+        return response[0]["language"]
+
     # def _transliterate(self, text: str, destination_language: str, source_language: str):
         # TODO: Implement
 
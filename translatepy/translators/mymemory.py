@@ -2,7 +2,7 @@ from translatepy.exceptions import UnsupportedMethod
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslateException, BaseTranslator
 from translatepy.utils.annotations import Tuple
-from translatepy.utils.request import Request
+from translatepy.utils.request import Request, default_request
 
 
 class MyMemoryException(BaseTranslateException):
@@ -16,7 +16,10 @@ class MyMemoryTranslate(BaseTranslator):
     translatepy's implementation of MyMemory
     """
 
-    def __init__(self, request: Request = Request()):
+    _max_text_length = 500  # the "q" parameter limit
+
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session = request
         self.base_url = "https://api.mymemory.translated.net/get"
 
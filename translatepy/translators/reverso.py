@@ -3,7 +3,7 @@ import base64
 from translatepy.exceptions import UnsupportedMethod
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslator
-from translatepy.utils.request import Request
+from translatepy.utils.request import Request, default_request
 
 
 class ReversoTranslate(BaseTranslator):
@@ -12,8 +12,10 @@ class ReversoTranslate(BaseTranslator):
     """
 
     _supported_languages = {'auto', 'ara', 'chi', 'dut', 'dut', 'eng', 'fra', 'ger', 'heb', 'ita', 'jpn', 'pol', 'por', 'rum', 'rum', 'rum', 'rus', 'spa', 'spa', 'tur'}
+    _max_text_length = 2000
 
-    def __init__(self, request: Request = Request()):
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session = request
 
     def _translate(self, text: str, destination_language: str, source_language: str) -> str:
@@ -2,7 +2,7 @@ from translatepy.exceptions import UnsupportedMethod
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslator
 from translatepy.utils.annotations import Tuple
-from translatepy.utils.request import Request
+from translatepy.utils.request import Request, default_request
 
 
 class TranslateComTranslate(BaseTranslator):
@@ -10,7 +10,8 @@ class TranslateComTranslate(BaseTranslator):
     translatepy's implementation of translate.com
     """
 
-    def __init__(self, request: Request = Request()):
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session = request
         self.translate_url = "https://www.translate.com/translator/ajax_translate"
         self.langdetect_url = "https://www.translate.com/translator/ajax_lang_auto_detect"
@@ -9,7 +9,7 @@ import uuid
 from translatepy.exceptions import UnsupportedMethod
 from translatepy.language import Language
 from translatepy.translators.base import BaseTranslateException, BaseTranslator
-from translatepy.utils.request import Request
+from translatepy.utils.request import AsyncRequest, Request, default_request
 
 
 class YandexTranslateException(BaseTranslateException):
@@ -28,6 +28,7 @@ class YandexTranslateException(BaseTranslateException):
         501: "ERR_LANG_NOT_SUPPORTED",
         503: "ERR_SERVICE_NOT_AVAIBLE",
     }
+    rate_limit_codes = {403, 404, 408}
 
 
 class YandexTranslate(BaseTranslator):
@@ -36,10 +37,13 @@ class YandexTranslate(BaseTranslator):
     """
 
     _api_url = "http://translate.yandex.net/api/v1/tr.json/{endpoint}"
+    _max_text_length = 10000  # ERR_TEXT_TOO_LONG
     _supported_languages = {'auto', 'af', 'sq', 'am', 'ar', 'hy', 'az', 'ba', 'eu', 'be', 'bn', 'bs', 'bg', 'my', 'ca', 'ca', 'ceb', 'zh', 'cv', 'cs', 'da', 'nl', 'nl', 'en', 'eo', 'et', 'fi', 'fr', 'ka', 'de', 'gd', 'gd', 'ga', 'gl', 'el', 'gu', 'ht', 'ht', 'he', 'hi', 'hr', 'hu', 'is', 'id', 'it', 'jv', 'ja', 'kn', 'kk', 'km', 'ky', 'ky', 'ko', 'lo', 'la', 'lv', 'lt', 'lb', 'lb', 'mk', 'ml', 'mi', 'mr', 'ms', 'mg', 'mt', 'mn', 'mrj', 'mhr', 'ne', 'no', 'pa', 'pa', 'pap', 'fa', 'pl', 'pt', 'ro', 'ro', 'ro', 'ru', 'sah', 'si', 'si', 'sk', 'sl', 'es', 'es', 'sr', 'sjn', 'su', 'sw', 'sv', 'ta', 'tt', 'te', 'tg', 'tl', 'th', 'tr', 'udm', 'uk', 'ur', 'uz', 'vi', 'cy', 'xh', 'yi', 'zu', 'kazlat', 'uzbcyr', 'emj'}
 
-    def __init__(self, request: Request = Request()):
+    def __init__(self, request: Request = None):
+        request = default_request() if request is None else request
         self.session = request
+        self.async_session = AsyncRequest(request=request)
         self.session.header = {"User-Agent": "ru.yandex.translate/22.11.8.22364114 (samsung SM-A505GM; Android 12)"}  # TODO: generate random telephone model
 
         uuid_v4 = str(uuid.uuid4())
@@ -63,14 +67,19 @@ class YandexTranslate(BaseTranslator):
 
         return self.session_ucid
 
-    def _translate(self, text: str, destination_language: str, source_language: str) -> str:
-        if source_language == "auto":
-            source_language = self._language(text)
-
+    def _translate_params(self, text: str, destination_language: str, source_language: str):
+        """
+        Returns the URL, the parameters and the data of a translation request
+        """
         url = self._api_url.format(endpoint="translate")
         params = {"sid": self._ucid(session_state=True), "srv": "android", "format": "text"}
         data = {"text": text, "lang": source_language + "-" + destination_language}
-        request = self.session.post(url, params=params, data=data)
+        return url, params, data
+
+    def _parse_translation(self, request, data: dict, source_language: str):
+        """
+        Returns the detected language and the translation from the response of a translation request
+        """
         response = request.json()
 
         if request.status_code != 200 and response["code"] != 200:
@@ -83,6 +92,22 @@ class YandexTranslate(BaseTranslator):
 
         return _detected_language, response["text"][0]
 
+    def _translate(self, text: str, destination_language: str, source_language: str) -> str:
+        if source_language == "auto":
+            source_language = self._language(text)
+
+        url, params, data = self._translate_params(text, destination_language, source_language)
+        request = self.session.post(url, params=params, data=data)
+        return self._parse_translation(request, data, source_language)
+
+    async def _atranslate(self, text: str, destination_language: str, source_language: str) -> str:
+        if source_language == "auto":
+            source_language = await self._alanguage(text)
+
+        url, params, data = self._translate_params(text, destination_language, source_language)
+        request = await self.async_session.post(url, params=params, data=data)
+        return self._parse_translation(request, data, source_language)
+
     def _transliterate(self, text: str, destination_language: str, source_language: str) -> str:
         if source_language == "auto":
             source_language = self._language(text)
@@ -116,11 +141,19 @@ class YandexTranslate(BaseTranslator):
                 text = text.replace(word, suggestion)
             return source_language, text
 
-    def _language(self, text: str):
+    def _language_params(self, text: str):
+        """
+        Returns the URL, the parameters and the data of a language detection request
+        """
         url = self._api_url.format(endpoint="detect")
         params = {"sid": self._ucid(), "srv": "android"}
         data = {'text': text, 'hint': "en"}
-        request = self.session.get(url, params=params, data=data)
+        return url, params, data
+
+    def _parse_language(self, request) -> str:
+        """
+        Returns the detected language from the response of a language detection request
+        """
         response = request.json()
 
         if request.status_code != 200 and response["code"] != 200:
@@ -128,6 +161,16 @@ class YandexTranslate(BaseTranslator):
 
         return response["lang"]
 
+    def _language(self, text: str):
+        url, params, data = self._language_params(text)
+        request = self.session.get(url, params=params, data=data)
+        return self._parse_language(request)
+
+    async def _alanguage(self, text: str):
+        url, params, data = self._language_params(text)
+        request = await self.async_session.get(url, params=params, data=data)
+        return self._parse_language(request)
+
     def _example(self, text: str, destination_language: str, source_language: str):
         if source_language == "auto":
             source_language = self._language(text)
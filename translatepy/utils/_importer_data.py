@@ -1 +1,10 @@
-VECTORS = {"Onye ntụgharị google":{"s":{"g","n","h","t","l","r","y","ụ","ị","a","o","e"},"l":5.830951894845301,"c":{"o":3,"n":2,"y":1,"e":2,"t":1,"ụ":1,"g":3,"h":1,"a":1,"r":1,"ị":1,"l":1},"t":"GoogleTranslate"},"கூகிள்":{"s":{"க","ூ","்","ி","ள"},"l":2.8284271247461903,"c":{"க":2,"ூ":1,"ி":1,"ள":1,"்":1},"t":"GoogleTranslate"},"ಗೂಗಲ್ ಅನುವಾದ API":{"s":{"ಲ","ವ","a","ಗ","್","ಅ","ೂ","ನ","ಾ","ದ","p","ು","i"},"l":4.0,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google Oversæt":{"s":{"g","l","t","v","r","æ","s","o","e"},"l":4.795831523312719,"c":{"g":2,"o":3,"l":1,"e":2,"v":1,"r":1,"s":1,"æ":1,"t":1},"t":"GoogleTranslate"},"گوگل مترجم":{"s":{"و","ل","م","ر","ت","ج","گ"},"l":3.605551275463989,"c":{"گ":2,"و":1,"ل":1,"م":2,"ت":1,"ر":1,"ج":1},"t":"GoogleTranslate"},"ਗੂਗਲ ਅਨੁਵਾਦ ਏਪੀਆਈ":{"s":{"ਏ","ੀ","ਈ","ਗ","ਲ","ਾ","ਵ","ੂ","ੁ","ਪ","ਅ","ਆ","ਨ","ਦ"},"l":4.123105625617661,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਏ":1,"ਪ":1,"ੀ":1,"ਆ":1,"ਈ":1},"t":"GoogleTranslate"},"ګوګل ژباړه API":{"s":{"ب","و","ل","ړ","ا","ژ","ه","a","p","ګ","i"},"l":3.7416573867739413,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google翻译API":{"s":{"g","l","译","p","翻","a","o","e","i"},"l":3.872983346207417,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"译":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google Dịch API":{"s":{"a","g","h","d","l","p","ị","c","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"API de traducción de Google":{"s":{"ó","g","n","o","d","t","l","u","c","r","a","p","e","i"},"l":6.708203932499369,"c":{"a":2,"p":1,"i":2,"d":3,"e":3,"t":1,"r":1,"u":1,"c":2,"ó":1,"n":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Google翻訳者":{"s":{"g","l","者","翻","訳","o","e"},"l":3.605551275463989,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"者":1},"t":"GoogleTranslate"},"Umhumushi weGoogle":{"s":{"g","h","w","l","u","s","m","o","e","i"},"l":5.744562646538029,"c":{"u":3,"m":2,"h":2,"s":1,"i":1,"w":1,"e":2,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"ហ្គូហ្គលបកប្រែ API":{"s":{"ប","រ","a","i","្","ូ","ែ","ក","ល","គ","p","ហ"},"l":5.385164807134504,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google traduce":{"s":{"g","d","l","t","u","c","r","a","o","e"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"r":1,"a":1,"d":1,"u":1,"c":1},"t":"GoogleTranslate"},"구글 번역":{"s":{"역","글","번","구"},"l":2.0,"c":{"구":1,"글":1,"번":1,"역":1},"t":"GoogleTranslate"},"Google 번역 API":{"s":{"g","번","l","p","역","a","o","e","i"},"l":3.872983346207417,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"谷歌翻译":{"s":{"谷","歌","译","翻"},"l":2.0,"c":{"谷":1,"歌":1,"翻":1,"译":1},"t":"GoogleTranslate"},"Uphando":{"s":{"n","h","o","d","u","a","p"},"l":2.6457513110645907,"c":{"u":1,"p":1,"h":1,"a":1,"n":1,"d":1,"o":1},"t":"GoogleTranslate"},"गुगल अनुवाद API":{"s":{"a","ग","ु","न","अ","द","ा","ल","व","p","i"},"l":4.123105625617661,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Preložiť Google":{"s":{"g","o","ť","l","r","ž","p","e","i"},"l":5.0990195135927845,"c":{"p":1,"r":1,"e":2,"l":2,"o":3,"ž":1,"i":1,"ť":1,"g":2},"t":"GoogleTranslate"},"Google വിവർത്തനം API":{"s":{"g","ി","ത","വ","l","ർ","്","p","ം","a","o","e","i","ന"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"I-Google Humusha API":{"s":{"g","h","l","p","u","-","s","m","a","o","e","i"},"l":5.477225575051661,"c":{"i":2,"-":1,"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":2,"p":1},"t":"GoogleTranslate"},"Aistritheoir Google":{"s":{"g","h","t","l","r","s","a","o","e","i"},"l":6.164414002968976,"c":{"a":1,"i":3,"s":1,"t":2,"r":2,"h":1,"e":2,"o":3,"g":2,"l":1},"t":"GoogleTranslate"},"Google аудармашысы":{"s":{"g","ш","р","l","ы","с","а","д","м","у","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":1,"e":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1},"t":"GoogleTranslate"},"Cyfieithydd Google":{"s":{"g","h","f","d","t","l","y","c","o","e","i"},"l":5.385164807134504,"c":{"c":1,"y":2,"f":1,"i":2,"e":2,"t":1,"h":1,"d":2,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Google Iwwersetzer":{"s":{"g","w","l","t","r","s","z","o","e","i"},"l":6.082762530298219,"c":{"g":2,"o":2,"l":1,"e":4,"i":1,"w":2,"r":2,"s":1,"t":1,"z":1},"t":"GoogleTranslate"},"Google Übersetzer":{"s":{"g","b","ü","l","t","r","s","z","o","e"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":1,"e":4,"ü":1,"b":1,"r":2,"s":1,"t":1,"z":1},"t":"GoogleTranslate"},"גוגל":{"s":{"ג","ל","ו"},"l":2.449489742783178,"c":{"ג":2,"ו":1,"ל":1},"t":"GoogleTranslate"},"గూగుల్":{"s":{"గ","ూ","ల","్","ు"},"l":2.8284271247461903,"c":{"గ":2,"ూ":1,"ు":1,"ల":1,"్":1},"t":"GoogleTranslate"},"I-Google":{"s":{"g","l","-","o","e","i"},"l":3.4641016151377544,"c":{"i":1,"-":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"ಗೂಗಲ್ ಅನುವಾದ":{"s":{"ಲ","ವ","ಗ","್","ಅ","ೂ","ನ","ಾ","ದ","ು"},"l":3.605551275463989,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1},"t":"GoogleTranslate"},"ګوګل ژباړونکی":{"s":{"ب","و","ک","ی","ل","ړ","ا","ن","ژ","ګ"},"l":4.0,"c":{"ګ":2,"و":2,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ن":1,"ک":1,"ی":1},"t":"GoogleTranslate"},"Гугл":{"s":{"л","у","г"},"l":2.449489742783178,"c":{"г":2,"у":1,"л":1},"t":"GoogleTranslate"},"fassarar Google":{"s":{"g","f","l","r","s","a","o","e"},"l":5.291502622129181,"c":{"f":1,"a":3,"s":2,"r":2,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"ጉግል ትርጉም ኤ.ፒ.አይ.":{"s":{".","ም","ግ","ል","ይ","አ","ር","ኤ","ፒ","ጉ","ት"},"l":4.69041575982343,"c":{"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"ኤ":1,".":3,"ፒ":1,"አ":1,"ይ":1},"t":"GoogleTranslate"},"Google translate API":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1},"t":"GoogleTranslate"},"Translator Google":{"s":{"g","n","t","l","r","s","a","o","e"},"l":5.656854249492381,"c":{"t":2,"r":2,"a":2,"n":1,"s":1,"l":2,"o":3,"g":2,"e":1},"t":"GoogleTranslate"},"Google penerjemah":{"s":{"g","n","h","o","j","l","r","m","a","p","e"},"l":5.656854249492381,"c":{"g":2,"o":2,"l":1,"e":4,"p":1,"n":1,"r":1,"j":1,"m":1,"a":1,"h":1},"t":"GoogleTranslate"},"Tłumacz Google":{"s":{"g","t","l","ł","u","c","z","m","a","o","e"},"l":4.123105625617661,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"גוגל איבערטייטשער":{"s":{"ג","י","ש","ע","ט","ל","א","ב","ר","ו"},"l":5.477225575051661,"c":{"ג":2,"ו":1,"ל":1,"א":1,"י":3,"ב":1,"ע":2,"ר":2,"ט":2,"ש":1},"t":"GoogleTranslate"},"جوجل":{"s":{"ل","ج","و"},"l":2.449489742783178,"c":{"ج":2,"و":1,"ل":1},"t":"GoogleTranslate"},"Гугл перакладчык":{"s":{"к","л","ч","ы","а","г","д","р","у","п","е"},"l":4.795831523312719,"c":{"г":2,"у":1,"л":2,"п":1,"е":1,"р":1,"а":2,"к":2,"д":1,"ч":1,"ы":1},"t":"GoogleTranslate"},"Google Prekladač":{"s":{"g","č","o","d","l","r","k","a","p","e"},"l":5.0,"c":{"g":2,"o":2,"l":2,"e":2,"p":1,"r":1,"k":1,"a":2,"d":1,"č":1},"t":"GoogleTranslate"},"Google μετάφραση":{"s":{"ρ","g","α","l","η","μ","φ","ε","σ","ά","τ","o","e"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"μ":1,"ε":1,"τ":1,"ά":1,"φ":1,"ρ":1,"α":1,"σ":1,"η":1},"t":"GoogleTranslate"},"Google prevoditelj":{"s":{"g","o","d","j","l","t","v","r","p","e","i"},"l":5.744562646538029,"c":{"g":2,"o":3,"l":2,"e":3,"p":1,"r":1,"v":1,"d":1,"i":1,"t":1,"j":1},"t":"GoogleTranslate"},"গুগল অনুবাদ এপিআই":{"s":{"অ","গ","ি","ু","আ","এ","ন","দ","ই","ল","ব","া","প"},"l":4.358898943540674,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1,"এ":1,"প":1,"ি":1,"আ":1,"ই":1},"t":"GoogleTranslate"},"Google تەرجىمىسى":{"s":{"g","l","ى","س","ج","ە","ر","ت","م","o","e"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":3,"م":1,"س":1},"t":"GoogleTranslate"},"Google Faaliliu":{"s":{"g","f","l","u","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":3,"e":1,"f":1,"a":2,"i":2,"u":1},"t":"GoogleTranslate"},"Google vertaal":{"s":{"g","l","t","v","r","a","o","e"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":2,"e":2,"v":1,"r":1,"t":1,"a":2},"t":"GoogleTranslate"},"Google Tradutor":{"s":{"g","d","l","t","u","r","a","o","e"},"l":5.0990195135927845,"c":{"g":2,"o":3,"l":1,"e":1,"t":2,"r":2,"a":1,"d":1,"u":1},"t":"GoogleTranslate"},"Google Tərcümə":{"s":{"g","ü","l","t","ə","r","m","c","o","e"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1},"t":"GoogleTranslate"},"Google turjumi":{"s":{"g","j","l","t","u","r","m","o","e","i"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"u":2,"r":1,"j":1,"m":1,"i":1},"t":"GoogleTranslate"},"Traductor de Google":{"s":{"g","d","t","l","u","c","r","a","o","e"},"l":5.744562646538029,"c":{"t":2,"r":2,"a":1,"d":2,"u":1,"c":1,"o":3,"e":2,"g":2,"l":1},"t":"GoogleTranslate"},"API Translate API":{"s":{"n","t","l","r","s","a","p","e","i"},"l":5.744562646538029,"c":{"a":4,"p":2,"i":2,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1},"t":"GoogleTranslate"},"গুগল":{"s":{"গ","ু","ল"},"l":2.449489742783178,"c":{"গ":2,"ু":1,"ল":1},"t":"GoogleTranslate"},"गुगल अनुवाद्":{"s":{"ग","ु","न","्","अ","द","ा","ल","व"},"l":3.872983346207417,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"्":1},"t":"GoogleTranslate"},"Penerjemah Google":{"s":{"g","n","h","o","j","l","r","m","a","p","e"},"l":5.656854249492381,"c":{"p":1,"e":4,"n":1,"r":1,"j":1,"m":1,"a":1,"h":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Google Traduttur":{"s":{"g","d","l","t","u","r","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":1,"e":1,"t":3,"r":2,"a":1,"d":1,"u":2},"t":"GoogleTranslate"},"Tradutor de Google":{"s":{"g","d","t","l","u","r","a","o","e"},"l":5.656854249492381,"c":{"t":2,"r":2,"a":1,"d":2,"u":1,"o":3,"e":2,"g":2,"l":1},"t":"GoogleTranslate"},"గూగుల్ అనువాదం":{"s":{"గ","ూ","ల","్","ద","ా","ం","న","వ","ు","అ"},"l":4.123105625617661,"c":{"గ":2,"ూ":1,"ు":2,"ల":1,"్":1,"అ":1,"న":1,"వ":1,"ా":1,"ద":1,"ం":1},"t":"GoogleTranslate"},"ഗൂഗിൾ പരിഭാഷകൻ":{"s":{"ഭ","ൻ","ി","ൂ","ൾ","ാ","ക","ഷ","ഗ","പ","ര"},"l":4.123105625617661,"c":{"ഗ":2,"ൂ":1,"ി":2,"ൾ":1,"പ":1,"ര":1,"ഭ":1,"ാ":1,"ഷ":1,"ക":1,"ൻ":1},"t":"GoogleTranslate"},"ගූගල් පරිවර්තන API":{"s":{"ි","න","ව","ර","ප","ත","ල","්","ූ","a","p","i","ග"},"l":4.69041575982343,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"න":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google tradiktè":{"s":{"g","è","d","l","t","r","k","a","o","e","i"},"l":4.47213595499958,"c":{"g":2,"o":2,"l":1,"e":1,"t":2,"r":1,"a":1,"d":1,"i":1,"k":1,"è":1},"t":"GoogleTranslate"},"Google fa'aliliu":{"s":{"g","f","l","'","u","a","o","e","i"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":3,"e":1,"f":1,"a":2,"'":1,"i":2,"u":1},"t":"GoogleTranslate"},"Google Tradukisto":{"s":{"g","d","l","t","u","r","s","k","a","o","e","i"},"l":5.0990195135927845,"c":{"g":2,"o":3,"l":1,"e":1,"t":2,"r":1,"a":1,"d":1,"u":1,"k":1,"i":1,"s":1},"t":"GoogleTranslate"},"Google Çeviri API":{"s":{"g","l","v","p","r","ç","a","o","e","i"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":1,"i":3,"r":1,"a":1,"p":1},"t":"GoogleTranslate"},"Гугл преведувач":{"s":{"л","ч","в","а","г","д","р","у","п","е"},"l":4.69041575982343,"c":{"г":2,"у":2,"л":1,"п":1,"р":1,"е":2,"в":2,"д":1,"а":1,"ч":1},"t":"GoogleTranslate"},"Mtafsiri wa Google":{"s":{"g","f","w","t","l","r","s","m","a","o","e","i"},"l":4.898979485566356,"c":{"m":1,"t":1,"a":2,"f":1,"s":1,"i":2,"r":1,"w":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Гугл тарҷумон":{"s":{"л","н","м","о","а","г","р","ҷ","у","т"},"l":4.0,"c":{"г":2,"у":2,"л":1,"т":1,"а":1,"р":1,"ҷ":1,"м":1,"о":1,"н":1},"t":"GoogleTranslate"},"ഗൂഗിണ്":{"s":{"ി","ൂ","്","ഗ","ണ"},"l":2.8284271247461903,"c":{"ഗ":2,"ൂ":1,"ി":1,"ണ":1,"്":1},"t":"GoogleTranslate"},"Google vertaler":{"s":{"g","l","t","v","r","a","o","e"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":2,"e":3,"v":1,"r":2,"t":1,"a":1},"t":"GoogleTranslate"},"Google jittraduċi l-API":{"s":{"g","j","d","l","t","p","u","r","ċ","-","a","o","e","i"},"l":6.082762530298219,"c":{"g":2,"o":2,"l":2,"e":1,"j":1,"i":3,"t":2,"r":1,"a":2,"d":1,"u":1,"ċ":1,"-":1,"p":1},"t":"GoogleTranslate"},"Հաջողություն":{"s":{"հ","ա","թ","յ","ն","ջ","ո","ւ","ղ"},"l":4.47213595499958,"c":{"հ":1,"ա":1,"ջ":1,"ո":3,"ղ":1,"ւ":2,"թ":1,"յ":1,"ն":1},"t":"GoogleTranslate"},"Google которуу":{"s":{"к","g","l","р","о","у","o","e","т"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"к":1,"о":2,"т":1,"р":1,"у":2},"t":"GoogleTranslate"},"ಗೂಗಲ್ ಅನುವಾದಕ":{"s":{"ಲ","ವ","ಗ","ಕ","್","ಅ","ೂ","ನ","ಾ","ದ","ು"},"l":3.7416573867739413,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಕ":1},"t":"GoogleTranslate"},"Dados":{"s":{"a","o","s","d"},"l":2.6457513110645907,"c":{"d":2,"a":1,"o":1,"s":1},"t":"GoogleTranslate"},"API -ul Google Translate":{"s":{"g","n","o","l","t","u","r","-","s","a","p","e","i"},"l":6.4031242374328485,"c":{"a":3,"p":1,"i":1,"-":1,"u":1,"l":3,"g":2,"o":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslate"},"Womasulira Google":{"s":{"g","w","l","u","r","s","m","a","o","e","i"},"l":5.291502622129181,"c":{"w":1,"o":3,"m":1,"a":2,"s":1,"u":1,"l":2,"i":1,"r":1,"g":2,"e":1},"t":"GoogleTranslate"},"ກາເຟ":{"s":{"ເ","າ","ຟ","ກ"},"l":2.0,"c":{"ກ":1,"າ":1,"ເ":1,"ຟ":1},"t":"GoogleTranslate"},"ဂူးဂဲလ်":{"s":{"ူ","်","လ","ဂ","း","ဲ"},"l":3.0,"c":{"ဂ":2,"ူ":1,"း":1,"ဲ":1,"လ":1,"်":1},"t":"GoogleTranslate"},"גוגל זעץ אַפּי":{"s":{"ג","י","ע","ז","פ","ּ","ל","ץ","ַ","א","ו"},"l":3.7416573867739413,"c":{"ג":2,"ו":1,"ל":1,"ז":1,"ע":1,"ץ":1,"א":1,"ַ":1,"פ":1,"ּ":1,"י":1},"t":"GoogleTranslate"},"Shandurudzo google":{"s":{"g","n","h","d","l","u","r","s","z","a","o","e"},"l":5.385164807134504,"c":{"s":1,"h":1,"a":1,"n":1,"d":2,"u":2,"r":1,"z":1,"o":3,"g":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google Translator":{"s":{"g","n","l","t","r","s","a","o","e"},"l":5.656854249492381,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"r":2,"a":2,"n":1,"s":1},"t":"GoogleTranslate"},"Tafsiri ya Google":{"s":{"g","f","t","l","r","y","s","a","o","e","i"},"l":4.795831523312719,"c":{"t":1,"a":2,"f":1,"s":1,"i":2,"r":1,"y":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google ਅਨੁਵਾਦਕ":{"s":{"g","ਾ","ਕ","ਵ","l","ੁ","ਅ","o","e","ਨ","ਦ"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਕ":1},"t":"GoogleTranslate"},"Isiguquleli sikaGoogle":{"s":{"g","l","q","u","s","k","a","o","e","i"},"l":7.280109889280518,"c":{"i":4,"s":2,"g":3,"u":2,"q":1,"l":3,"e":2,"k":1,"a":1,"o":2},"t":"GoogleTranslate"},"Google تەرجىمە API":{"s":{"g","l","ى","p","ج","ە","ر","ت","م","a","o","e","i"},"l":4.69041575982343,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"கூகிள் மொழிபெயர்ப்பாளர்":{"s":{"ெ","ொ","ம","ர","க","ய","ூ","்","ப","ி","ா","ழ","ள"},"l":6.928203230275509,"c":{"க":2,"ூ":1,"ி":2,"ள":2,"்":4,"ம":1,"ொ":1,"ழ":1,"ப":3,"ெ":1,"ய":1,"ர":2,"ா":1},"t":"GoogleTranslate"},"የጎግል ተርጓሚ":{"s":{"ግ","ል","ሚ","የ","ጎ","ተ","ር","ጓ"},"l":2.8284271247461903,"c":{"የ":1,"ጎ":1,"ግ":1,"ል":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"GoogleTranslate"},"గూగుల్ అనువాదము":{"s":{"మ","గ","ూ","ల","్","ద","ా","న","వ","ు","అ"},"l":4.69041575982343,"c":{"గ":2,"ూ":1,"ు":3,"ల":1,"్":1,"అ":1,"న":1,"వ":1,"ా":1,"ద":1,"మ":1},"t":"GoogleTranslate"},"tłumacz Google":{"s":{"g","t","l","ł","u","c","z","m","a","o","e"},"l":4.123105625617661,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google Traduttore":{"s":{"g","d","l","t","u","r","a","o","e"},"l":5.830951894845301,"c":{"g":2,"o":3,"l":1,"e":2,"t":3,"r":2,"a":1,"d":1,"u":1},"t":"GoogleTranslate"},"Google vertėjas":{"s":{"g","j","l","t","v","r","s","a","o","e","ė"},"l":4.47213595499958,"c":{"g":2,"o":2,"l":1,"e":2,"v":1,"r":1,"t":1,"ė":1,"j":1,"a":1,"s":1},"t":"GoogleTranslate"},"Google Dudziro API":{"s":{"g","d","l","p","u","r","z","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":2,"r":1,"a":1,"p":1},"t":"GoogleTranslate"},"Riadenie":{"s":{"n","d","r","a","e","i"},"l":3.4641016151377544,"c":{"r":1,"i":2,"a":1,"d":1,"e":2,"n":1},"t":"GoogleTranslate"},"ગૂગલ":{"s":{"ગ","લ","ૂ"},"l":2.449489742783178,"c":{"ગ":2,"ૂ":1,"લ":1},"t":"GoogleTranslate"},"谷歌":{"s":{"谷","歌"},"l":1.4142135623730951,"c":{"谷":1,"歌":1},"t":"GoogleTranslate"},"Գուգլ թարգմանիչ":{"s":{"թ","ա","ի","չ","ն","ւ","ո","գ","ր","մ","լ"},"l":4.69041575982343,"c":{"գ":3,"ո":1,"ւ":1,"լ":1,"թ":1,"ա":2,"ր":1,"մ":1,"ն":1,"ի":1,"չ":1},"t":"GoogleTranslate"},"گوگل ٽرانسليٽر":{"s":{"و","ي","ل","س","ا","ٽ","ر","ن","گ"},"l":4.58257569495584,"c":{"گ":2,"و":1,"ل":2,"ٽ":2,"ر":2,"ا":1,"ن":1,"س":1,"ي":1},"t":"GoogleTranslate"},"Mofetoleli oa Google":{"s":{"g","f","t","l","m","a","o","e","i"},"l":7.211102550927978,"c":{"m":1,"o":5,"f":1,"e":3,"t":1,"l":3,"i":1,"a":1,"g":2},"t":"GoogleTranslate"},"গুগল অনুবাদক":{"s":{"অ","গ","ু","ন","দ","ল","ক","ব","া"},"l":3.872983346207417,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1,"ক":1},"t":"GoogleTranslate"},"गूगल ट्रान्सलेटर":{"s":{"े","ग","न","्","ा","ट","र","स","ल","ू"},"l":5.0,"c":{"ग":2,"ू":1,"ल":2,"ट":2,"्":2,"र":2,"ा":1,"न":1,"स":1,"े":1},"t":"GoogleTranslate"},"ଗୁଗୁଲ୍ ଅନୁବାଦ |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","|","ଲ","ଅ","ଗ"},"l":4.58257569495584,"c":{"ଗ":2,"ୁ":3,"ଲ":1,"୍":1,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"|":1},"t":"GoogleTranslate"},"جوجل ترجمة واجهة برمجة التطبيقات":{"s":{"ب","ط","و","ق","ة","ل","ي","ا","م","ر","ت","ه","ج"},"l":8.717797887081348,"c":{"ج":5,"و":2,"ل":2,"ت":3,"ر":2,"م":2,"ة":3,"ا":3,"ه":1,"ب":2,"ط":1,"ي":1,"ق":1},"t":"GoogleTranslate"},"I-Google Guqula API":{"s":{"g","l","p","u","q","-","a","o","e","i"},"l":5.744562646538029,"c":{"i":2,"-":1,"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":2,"p":1},"t":"GoogleTranslate"},"Google vertaal API":{"s":{"g","l","t","v","p","r","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":2,"e":2,"v":1,"r":1,"t":1,"a":3,"p":1,"i":1},"t":"GoogleTranslate"},"Google Vertalen":{"s":{"g","n","l","t","v","r","a","o","e"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":2,"e":3,"v":1,"r":1,"t":1,"a":1,"n":1},"t":"GoogleTranslate"},"Tarjamah Google":{"s":{"g","h","j","t","l","r","m","a","o","e"},"l":4.898979485566356,"c":{"t":1,"a":3,"r":1,"j":1,"m":1,"h":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google Fordító":{"s":{"g","ó","f","d","l","t","í","r","o","e"},"l":4.58257569495584,"c":{"g":2,"o":3,"l":1,"e":1,"f":1,"r":1,"d":1,"í":1,"t":1,"ó":1},"t":"GoogleTranslate"},"Sirimangkrarajan":{"s":{"g","n","j","r","s","m","k","a","i"},"l":6.164414002968976,"c":{"s":1,"i":2,"r":3,"m":1,"a":4,"n":2,"g":1,"k":1,"j":1},"t":"DeeplTranslate"},"Google translate api":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1},"t":"GoogleTranslate"},"गूगल भाषांतर":{"s":{"भ","ग","त","ा","र","ं","ल","ष","ू"},"l":3.872983346207417,"c":{"ग":2,"ू":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1},"t":"GoogleTranslate"},"Google Çeviri":{"s":{"g","l","v","r","ç","o","e","i"},"l":4.47213595499958,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":1,"i":2,"r":1},"t":"GoogleTranslate"},"Lan Translator":{"s":{"n","l","t","r","s","a","o"},"l":5.196152422706632,"c":{"l":2,"a":3,"n":2,"t":2,"r":2,"s":1,"o":1},"t":"TranslateComTranslate"},"Terjemahan Google":{"s":{"g","n","h","j","t","l","r","m","a","o","e"},"l":5.291502622129181,"c":{"t":1,"e":3,"r":1,"j":1,"m":1,"a":2,"h":1,"n":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Traducteur Google":{"s":{"g","d","t","l","u","c","r","a","o","e"},"l":5.291502622129181,"c":{"t":2,"r":2,"a":1,"d":1,"u":2,"c":1,"e":2,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Google mushanduri":{"s":{"g","n","h","d","l","u","r","s","m","a","o","e","i"},"l":4.69041575982343,"c":{"g":2,"o":2,"l":1,"e":1,"m":1,"u":2,"s":1,"h":1,"a":1,"n":1,"d":1,"r":1,"i":1},"t":"GoogleTranslate"},"گوگل":{"s":{"ل","و","گ"},"l":2.449489742783178,"c":{"گ":2,"و":1,"ل":1},"t":"GoogleTranslate"},"Google Translate":{"s":{"g","n","l","t","r","s","a","o","e"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1},"t":"GoogleTranslate"},"Гүүг хамгаал":{"s":{"л","м","а","г","ү","х"},"l":5.0,"c":{"г":3,"ү":2,"х":1,"а":3,"м":1,"л":1},"t":"GoogleTranslate"},"Isinalin ng Google":{"s":{"g","n","l","s","a","o","e","i"},"l":6.164414002968976,"c":{"i":3,"s":1,"n":3,"a":1,"l":2,"g":3,"o":2,"e":1},"t":"GoogleTranslate"},"ဂူဂယ်လ်ဘာသာပြန်":{"s":{"ူ","လ","ဘ","ာ","ဂ","ြ","န","သ","ယ","ပ","်"},"l":5.0,"c":{"ဂ":2,"ူ":1,"ယ":1,"်":3,"လ":1,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1},"t":"GoogleTranslate"},"Google översättare":{"s":{"g","l","t","v","ö","r","s","ä","a","o","e"},"l":5.5677643628300215,"c":{"g":2,"o":2,"l":1,"e":3,"ö":1,"v":1,"r":2,"s":1,"ä":1,"t":2,"a":1},"t":"GoogleTranslate"},"Google çevirici":{"s":{"g","l","v","r","ç","c","o","e","i"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":1,"i":3,"r":1,"c":1},"t":"GoogleTranslate"},"Google Terjemahan API":{"s":{"g","n","h","j","l","t","p","r","m","a","o","e","i"},"l":5.916079783099616,"c":{"g":2,"o":2,"l":1,"e":3,"t":1,"r":1,"j":1,"m":1,"a":3,"h":1,"n":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google Translate APIa":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":4,"n":1,"s":1,"p":1,"i":1},"t":"GoogleTranslate"},"گوگل کا ترجمہ API":{"s":{"و","ک","ل","p","ا","ہ","م","ر","ت","a","ج","i","گ"},"l":4.0,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google Oversetter":{"s":{"g","l","t","v","r","s","o","e"},"l":6.324555320336759,"c":{"g":2,"o":3,"l":1,"e":4,"v":1,"r":2,"s":1,"t":2},"t":"GoogleTranslate"},"Гоогле Транслате АПИ":{"s":{"л","н","и","с","а","г","р","о","п","е","т"},"l":5.830951894845301,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":3,"н":1,"с":1,"п":1,"и":1},"t":"GoogleTranslate"},"Гоогле преводилац":{"s":{"л","и","в","а","г","д","р","о","п","ц","е"},"l":5.291502622129181,"c":{"г":2,"о":3,"л":2,"е":2,"п":1,"р":1,"в":1,"д":1,"и":1,"а":1,"ц":1},"t":"GoogleTranslate"},"Гүүгл орчуулагч":{"s":{"л","ч","о","а","г","р","ү","у"},"l":5.291502622129181,"c":{"г":3,"ү":2,"л":2,"о":1,"р":1,"ч":2,"у":2,"а":1},"t":"GoogleTranslate"},"Google Þýðingarvél":{"s":{"g","þ","ð","n","é","l","ý","v","r","a","o","e","i"},"l":5.196152422706632,"c":{"g":3,"o":2,"l":2,"e":1,"þ":1,"ý":1,"ð":1,"i":1,"n":1,"a":1,"r":1,"v":1,"é":1},"t":"GoogleTranslate"},"Google traduttore":{"s":{"g","d","l","t","u","r","a","o","e"},"l":5.830951894845301,"c":{"g":2,"o":3,"l":1,"e":2,"t":3,"r":2,"a":1,"d":1,"u":1},"t":"GoogleTranslate"},"गूगल ट्रांसलेट":{"s":{"े","ग","्","ा","ट","र","ं","स","ल","ू"},"l":4.358898943540674,"c":{"ग":2,"ू":1,"ल":2,"ट":2,"्":1,"र":1,"ा":1,"ं":1,"स":1,"े":1},"t":"GoogleTranslate"},"Гоогле":{"s":{"о","л","г","е"},"l":3.1622776601683795,"c":{"г":2,"о":2,"л":1,"е":1},"t":"GoogleTranslate"},"Google þýðing":{"s":{"g","þ","ð","n","l","ý","o","e","i"},"l":4.47213595499958,"c":{"g":3,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"i":1,"n":1},"t":"GoogleTranslate"},"مترجم جوجل":{"s":{"و","ل","م","ر","ت","ج"},"l":4.123105625617661,"c":{"م":2,"ت":1,"ر":1,"ج":3,"و":1,"ل":1},"t":"GoogleTranslate"},"Google Орчуул":{"s":{"g","л","ч","l","р","о","у","o","e"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"о":1,"р":1,"ч":1,"у":2,"л":1},"t":"GoogleTranslate"},"API do Google Translate":{"s":{"g","n","d","l","t","p","r","s","a","o","e","i"},"l":6.324555320336759,"c":{"a":3,"p":1,"i":1,"d":1,"o":3,"g":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslate"},"កម្មវិធី​បកប្រែ​ហ្គូហ្គល":{"s":{"ប","រ","្","ូ","ែ","ម","ក","គ","ធ","ល","ិ","វ","ហ","ី"},"l":6.6332495807108,"c":{"ក":2,"ម":2,"្":4,"វ":1,"ិ":1,"ធ":1,"ី":1,"ប":2,"រ":1,"ែ":1,"ហ":2,"គ":2,"ូ":1,"ល":1},"t":"GoogleTranslate"},"Перекладач Google":{"s":{"к","g","л","ч","l","а","e","д","р","п","o","е"},"l":4.898979485566356,"c":{"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Tagasalin ng Google":{"s":{"g","n","t","l","s","a","o","e","i"},"l":6.4031242374328485,"c":{"t":1,"a":3,"g":4,"s":1,"l":2,"i":1,"n":2,"o":2,"e":1},"t":"GoogleTranslate"},"ଗୁଗୁଲ୍":{"s":{"ୁ","ଗ","୍","ଲ"},"l":3.1622776601683795,"c":{"ଗ":2,"ୁ":2,"ଲ":1,"୍":1},"t":"GoogleTranslate"},"mtambasulira wa Google":{"s":{"g","b","w","t","l","u","r","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"m":2,"t":1,"a":4,"b":1,"s":1,"u":1,"l":2,"i":1,"r":1,"w":1,"g":2,"o":2,"e":1},"t":"GoogleTranslate"},"Google dịch":{"s":{"g","h","d","l","ị","c","o","e"},"l":3.7416573867739413,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1},"t":"GoogleTranslate"},"API Google Translate":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"a":3,"p":1,"i":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslate"},"Google itzultzailea":{"s":{"g","l","t","u","z","a","o","e","i"},"l":6.164414002968976,"c":{"g":2,"o":2,"l":3,"e":2,"i":2,"t":2,"z":2,"u":1,"a":2},"t":"GoogleTranslate"},"API de Google Translate":{"s":{"g","n","o","d","l","t","r","s","a","p","e","i"},"l":6.324555320336759,"c":{"a":3,"p":1,"i":1,"d":1,"e":3,"g":2,"o":2,"l":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslate"},"グーグル":{"s":{"ル","ー","グ"},"l":2.449489742783178,"c":{"グ":2,"ー":1,"ル":1},"t":"GoogleTranslate"},"Google oersetter":{"s":{"g","l","t","r","s","o","e"},"l":6.244997998398398,"c":{"g":2,"o":3,"l":1,"e":4,"r":2,"s":1,"t":2},"t":"GoogleTranslate"},"Google Tarjamah API":{"s":{"g","h","j","l","t","p","r","m","a","o","e","i"},"l":5.744562646538029,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":4,"r":1,"j":1,"m":1,"h":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google kääntäjä":{"s":{"g","n","j","l","t","ä","k","o","e"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":1,"k":1,"ä":4,"n":1,"t":1,"j":1},"t":"GoogleTranslate"},"Onitumọ Google":{"s":{"g","n","t","l","u","ọ","m","o","e","i"},"l":4.58257569495584,"c":{"o":3,"n":1,"i":1,"t":1,"u":1,"m":1,"ọ":1,"g":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google Tugharia API":{"s":{"g","h","l","t","p","u","r","a","o","e","i"},"l":5.744562646538029,"c":{"g":3,"o":2,"l":1,"e":1,"t":1,"u":1,"h":1,"a":3,"r":1,"i":2,"p":1},"t":"GoogleTranslate"},"Google tarjimon":{"s":{"g","n","j","l","t","r","m","a","o","e","i"},"l":4.69041575982343,"c":{"g":2,"o":3,"l":1,"e":1,"t":1,"a":1,"r":1,"j":1,"i":1,"m":1,"n":1},"t":"GoogleTranslate"},"グーグル翻訳":{"s":{"ル","ー","グ","翻","訳"},"l":2.8284271247461903,"c":{"グ":2,"ー":1,"ル":1,"翻":1,"訳":1},"t":"GoogleTranslate"},"Google'i tõlge":{"s":{"g","l","t","õ","'","o","e","i"},"l":5.0,"c":{"g":3,"o":2,"l":2,"e":2,"'":1,"i":1,"t":1,"õ":1},"t":"GoogleTranslate"},"ntụgharị google":{"s":{"g","n","h","t","l","r","ụ","ị","a","o","e"},"l":4.69041575982343,"c":{"n":1,"t":1,"ụ":1,"g":3,"h":1,"a":1,"r":1,"ị":1,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"గూగుల్ అనువాదం API":{"s":{"గ","ూ","ల","్","ద","ా","ం","న","వ","ు","a","p","అ","i"},"l":4.47213595499958,"c":{"గ":2,"ూ":1,"ు":2,"ల":1,"్":1,"అ":1,"న":1,"వ":1,"ా":1,"ద":1,"ం":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"fetolela ka google":{"s":{"g","f","t","l","k","a","o","e"},"l":6.164414002968976,"c":{"f":1,"e":3,"t":1,"o":3,"l":3,"a":2,"k":1,"g":2},"t":"GoogleTranslate"},"Google prevodilac":{"s":{"g","o","d","l","v","c","r","a","p","e","i"},"l":5.291502622129181,"c":{"g":2,"o":3,"l":2,"e":2,"p":1,"r":1,"v":1,"d":1,"i":1,"a":1,"c":1},"t":"GoogleTranslate"},"Гугл преводилац":{"s":{"л","и","в","а","г","д","р","о","у","п","ц","е"},"l":4.242640687119285,"c":{"г":2,"у":1,"л":2,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"и":1,"а":1,"ц":1},"t":"GoogleTranslate"},"Google аудармашы":{"s":{"g","ш","р","l","ы","а","д","м","у","o","e"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1},"t":"GoogleTranslate"},"Google орчуулга API":{"s":{"g","л","ч","l","p","а","г","р","о","у","a","o","e","i"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Gûgil":{"s":{"g","l","û","i"},"l":2.6457513110645907,"c":{"g":2,"û":1,"i":1,"l":1},"t":"GoogleTranslate"},"गूगल":{"s":{"ल","ग","ू"},"l":2.449489742783178,"c":{"ग":2,"ू":1,"ल":1},"t":"GoogleTranslate"},"ගූගල් පරිවර්තකය":{"s":{"ි","ව","ර","ප","ත","ක","ල","්","ූ","ය","ග"},"l":4.47213595499958,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"ක":1,"ය":1},"t":"GoogleTranslate"},"ጉግል":{"s":{"ግ","ጉ","ል"},"l":1.7320508075688772,"c":{"ጉ":1,"ግ":1,"ል":1},"t":"GoogleTranslate"},"penerjemah Google":{"s":{"g","n","h","o","j","l","r","m","a","p","e"},"l":5.656854249492381,"c":{"p":1,"e":4,"n":1,"r":1,"j":1,"m":1,"a":1,"h":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"ហ្គូហ្គោ":{"s":{"្","ូ","ោ","គ","ហ"},"l":3.7416573867739413,"c":{"ហ":2,"្":2,"គ":2,"ូ":1,"ោ":1},"t":"GoogleTranslate"},"API-и Google Translate":{"s":{"g","n","o","и","l","t","r","-","s","a","p","e","i"},"l":6.0,"c":{"a":3,"p":1,"i":1,"-":1,"и":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslate"},"Google tulkotājs":{"s":{"g","j","l","t","u","s","k","o","e","ā"},"l":5.196152422706632,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"ā":1,"j":1,"s":1},"t":"GoogleTranslate"},"ଗୁଗୁଲ୍ ଅନୁବାଦକ":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଲ","ଅ","ଗ","କ"},"l":4.58257569495584,"c":{"ଗ":2,"ୁ":3,"ଲ":1,"୍":1,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1},"t":"GoogleTranslate"},"ਗੂਗਲ":{"s":{"ੂ","ਗ","ਲ"},"l":2.449489742783178,"c":{"ਗ":2,"ੂ":1,"ਲ":1},"t":"GoogleTranslate"},"Google Tafsiri API":{"s":{"g","f","l","t","p","r","s","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"p":1},"t":"GoogleTranslate"},"கூகிள் மொழிபெயர்":{"s":{"ெ","ம","ர","க","ய","ூ","்","ா","ி","ப","ழ","ள"},"l":4.898979485566356,"c":{"க":2,"ூ":1,"ி":2,"ள":1,"்":2,"ம":1,"ெ":2,"ா":1,"ழ":1,"ப":1,"ய":1,"ர":1},"t":"GoogleTranslate"},"구글 번역기":{"s":{"번","기","역","글","구"},"l":2.23606797749979,"c":{"구":1,"글":1,"번":1,"역":1,"기":1},"t":"GoogleTranslate"},"Google Transp API":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"r":1,"a":2,"n":1,"s":1,"p":2,"i":1},"t":"GoogleTranslate"},"Google oversætter":{"s":{"g","l","t","v","r","æ","s","o","e"},"l":5.830951894845301,"c":{"g":2,"o":3,"l":1,"e":3,"v":1,"r":2,"s":1,"æ":1,"t":2},"t":"GoogleTranslate"},"გუგლის თარგმანი":{"s":{"ლ","თ","ს","ა","რ","უ","მ","ნ","გ","ი"},"l":4.898979485566356,"c":{"გ":3,"უ":1,"ლ":1,"ი":2,"ს":1,"თ":1,"ა":2,"რ":1,"მ":1,"ნ":1},"t":"GoogleTranslate"},"tumo gugulu":{"s":{"g","t","l","u","m","o"},"l":4.898979485566356,"c":{"t":1,"u":4,"m":1,"o":1,"g":2,"l":1},"t":"GoogleTranslate"},"Google Překladač":{"s":{"g","č","o","d","ř","l","k","a","p","e"},"l":5.0,"c":{"g":2,"o":2,"l":2,"e":2,"p":1,"ř":1,"k":1,"a":2,"d":1,"č":1},"t":"GoogleTranslate"},"Google แปล API":{"s":{"g","ล","แ","l","p","ป","a","o","e","i"},"l":4.0,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google تەرجىمانى":{"s":{"g","l","ى","ج","ا","ە","ر","ت","م","ن","o","e"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1},"t":"GoogleTranslate"},"Google tõlkeprogramm":{"s":{"g","l","t","p","r","m","k","õ","a","o","e"},"l":6.244997998398398,"c":{"g":3,"o":3,"l":2,"e":2,"t":1,"õ":1,"k":1,"p":1,"r":2,"a":1,"m":2},"t":"GoogleTranslate"},"Google wergêr":{"s":{"g","w","l","r","ê","o","e"},"l":4.898979485566356,"c":{"g":3,"o":2,"l":1,"e":2,"w":1,"r":2,"ê":1},"t":"GoogleTranslate"},"Eadar-theangachadh google":{"s":{"g","n","h","d","t","l","c","r","-","a","o","e"},"l":8.12403840463596,"c":{"e":3,"a":5,"d":2,"r":1,"-":1,"t":1,"h":3,"n":1,"g":3,"c":1,"o":2,"l":1},"t":"GoogleTranslate"},"Mpandika google":{"s":{"g","n","o","d","l","m","k","a","p","e","i"},"l":4.47213595499958,"c":{"m":1,"p":1,"a":2,"n":1,"d":1,"i":1,"k":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google Translation":{"s":{"g","n","l","t","r","s","a","o","e","i"},"l":5.744562646538029,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"r":1,"a":2,"n":2,"s":1,"i":1},"t":"GoogleTranslate"},"מתרגם Google":{"s":{"ת","g","ג","o","l","ם","ר","e","מ"},"l":3.872983346207417,"c":{"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google ട്രാൻസലേറ്റ്":{"s":{"ൻ","g","ല","സ","l","്","ാ","േ","ട","റ","o","e","ര"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":1,"ട":1,"്":3,"ര":1,"ാ":1,"ൻ":1,"സ":1,"ല":1,"േ":1,"റ":2},"t":"GoogleTranslate"},"Google oersette":{"s":{"g","l","t","r","s","o","e"},"l":6.0,"c":{"g":2,"o":3,"l":1,"e":4,"r":1,"s":1,"t":2},"t":"GoogleTranslate"},"Google transtelate ap":{"s":{"g","n","l","t","p","r","s","a","o","e"},"l":6.557438524302,"c":{"g":2,"o":2,"l":2,"e":3,"t":3,"r":1,"a":3,"n":1,"s":1,"p":1},"t":"GoogleTranslate"},"Google":{"s":{"g","l","o","e"},"l":3.1622776601683795,"c":{"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google översätt":{"s":{"g","l","t","v","ö","r","s","ä","o","e"},"l":4.69041575982343,"c":{"g":2,"o":2,"l":1,"e":2,"ö":1,"v":1,"r":1,"s":1,"ä":1,"t":2},"t":"GoogleTranslate"},"गूगल अनुवादक":{"s":{"ग","ु","न","अ","द","ा","ल","क","व","ू"},"l":3.605551275463989,"c":{"ग":2,"ू":1,"ल":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"GoogleTranslate"},"Гугъл преводач":{"s":{"л","ч","в","ъ","а","г","д","р","о","у","п","е"},"l":3.872983346207417,"c":{"г":2,"у":1,"ъ":1,"л":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"а":1,"ч":1},"t":"GoogleTranslate"},"गुगल अनुवादक":{"s":{"ग","ु","न","अ","द","ा","ल","क","व"},"l":3.872983346207417,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"क":1},"t":"GoogleTranslate"},"ଗୁଗୁଲ୍ ଅନୁବାଦ API":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଲ","ଅ","ଗ","a","p","i"},"l":4.795831523312719,"c":{"ଗ":2,"ୁ":3,"ଲ":1,"୍":1,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"গুগল অনুবাদ":{"s":{"অ","গ","ু","ন","দ","ল","ব","া"},"l":3.7416573867739413,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1},"t":"GoogleTranslate"},"Գուգլ Թարգմանիչ":{"s":{"թ","ա","ի","չ","ն","ւ","ո","գ","ր","մ","լ"},"l":4.69041575982343,"c":{"գ":3,"ո":1,"ւ":1,"լ":1,"թ":1,"ա":2,"ր":1,"մ":1,"ն":1,"ի":1,"չ":1},"t":"GoogleTranslate"},"גוגל תרגום":{"s":{"ת","ג","ל","ם","ר","ו"},"l":4.123105625617661,"c":{"ג":3,"ו":2,"ל":1,"ת":1,"ר":1,"ם":1},"t":"GoogleTranslate"},"ហ្គូហ្គល​បកប្រែ":{"s":{"ប","រ","្","ូ","ែ","ក","ល","គ","ហ"},"l":5.0990195135927845,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1},"t":"GoogleTranslate"},"Гугл переводчик":{"s":{"к","л","ч","и","в","г","д","р","о","у","п","е"},"l":4.242640687119285,"c":{"г":2,"у":1,"л":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1},"t":"GoogleTranslate"},"ગૂગલ ટ્રાન્સલેટ API":{"s":{"ગ","ા","ન","સ","a","્","ે","ર","ૂ","ટ","p","i","લ"},"l":5.0,"c":{"ગ":2,"ૂ":1,"લ":2,"ટ":2,"્":2,"ર":1,"ા":1,"ન":1,"સ":1,"ે":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google Translate API":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1},"t":"GoogleTranslate"},"ගූගල්":{"s":{"්","ූ","ල","ග"},"l":2.6457513110645907,"c":{"ග":2,"ූ":1,"ල":1,"්":1},"t":"GoogleTranslate"},"Μεταφραστής Google":{"s":{"α","ρ","g","ή","o","ς","l","μ","ε","σ","τ","φ","e"},"l":5.0,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"ಗೂಗಲ್":{"s":{"ಲ","ೂ","್","ಗ"},"l":2.6457513110645907,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1},"t":"GoogleTranslate"},"ਗੂਗਲ ਅਨੁਵਾਦ":{"s":{"ਗ","ਲ","ਾ","ਵ","ੂ","ੁ","ਅ","ਨ","ਦ"},"l":3.4641016151377544,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1},"t":"GoogleTranslate"},"Turjunto Google":{"s":{"g","n","j","t","l","u","r","o","e"},"l":5.0990195135927845,"c":{"t":2,"u":2,"r":1,"j":1,"n":1,"o":3,"g":2,"l":1,"e":1},"t":"GoogleTranslate"},"Google prevajalnik":{"s":{"g","n","o","j","l","v","r","k","a","p","e","i"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":2,"e":2,"p":1,"r":1,"v":1,"a":2,"j":1,"n":1,"i":1,"k":1},"t":"GoogleTranslate"},"Google अनुवाद एपीआई":{"s":{"g","ी","ए","प","l","ु","ई","न","अ","द","ा","व","o","e","आ"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"GoogleTranslate"},"Google þýða API":{"s":{"g","þ","ð","l","ý","p","a","o","e","i"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":2,"p":1,"i":1},"t":"GoogleTranslate"},"ગૂગલ અનુવાદક":{"s":{"ગ","ન","ા","ુ","ક","ૂ","અ","દ","વ","લ"},"l":3.605551275463989,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"ક":1},"t":"GoogleTranslate"},"Dikanteny Google":{"s":{"g","n","d","t","l","y","k","a","o","e","i"},"l":4.795831523312719,"c":{"d":1,"i":1,"k":1,"a":1,"n":2,"t":1,"e":2,"y":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Ko te kaiwhakamaori a Google":{"s":{"g","h","w","t","l","r","m","k","a","o","e","i"},"l":8.246211251235321,"c":{"k":3,"o":4,"t":1,"e":2,"a":5,"i":2,"w":1,"h":1,"m":1,"r":1,"g":2,"l":1},"t":"GoogleTranslate"},"Perkthyesi i Google":{"s":{"g","h","o","t","l","r","y","s","k","p","e","i"},"l":5.385164807134504,"c":{"p":1,"e":3,"r":1,"k":1,"t":1,"h":1,"y":1,"s":1,"i":2,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Google tərcüməçi":{"s":{"g","ü","l","t","ə","r","m","ç","c","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":1},"t":"GoogleTranslate"},"Google Transe":{"s":{"g","n","l","t","r","s","a","o","e"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"r":1,"a":1,"n":1,"s":1},"t":"GoogleTranslate"},"ગૂગલ અનુવાદ":{"s":{"ગ","ન","ા","ુ","ૂ","અ","દ","વ","લ"},"l":3.4641016151377544,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1},"t":"GoogleTranslate"},"-Eolaíocht":{"s":{"h","l","t","í","c","-","a","o","e"},"l":3.4641016151377544,"c":{"-":1,"e":1,"o":2,"l":1,"a":1,"í":1,"c":1,"h":1,"t":1},"t":"GoogleTranslate"},"API tłumaczenia Google":{"s":{"g","n","o","t","l","ł","u","c","z","m","a","p","e","i"},"l":5.830951894845301,"c":{"a":3,"p":1,"i":2,"t":1,"ł":1,"u":1,"m":1,"c":1,"z":1,"e":2,"n":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"Google'i tõlke API":{"s":{"a","g","l","t","p","k","õ","'","o","e","i"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":2,"e":2,"'":1,"i":2,"t":1,"õ":1,"k":1,"a":1,"p":1},"t":"GoogleTranslate"},"Google翻訳API":{"s":{"a","g","l","p","翻","訳","o","e","i"},"l":3.872983346207417,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Tradutor Google":{"s":{"g","d","t","l","u","r","a","o","e"},"l":5.0990195135927845,"c":{"t":2,"r":2,"a":1,"d":1,"u":1,"o":3,"g":2,"l":1,"e":1},"t":"GoogleTranslate"},"Api Google Translate":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"a":3,"p":1,"i":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslate"},"ဂူဂဲလ်ဘာသာပြန်":{"s":{"ူ","လ","ဘ","ာ","ဂ","ြ","န","သ","ဲ","ပ","်"},"l":4.47213595499958,"c":{"ဂ":2,"ူ":1,"ဲ":1,"လ":1,"်":2,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1},"t":"GoogleTranslate"},"Google Translate Api":{"s":{"g","n","l","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1},"t":"GoogleTranslate"},"Goont":{"s":{"g","n","o","t"},"l":2.6457513110645907,"c":{"g":1,"o":2,"n":1,"t":1},"t":"GoogleTranslate"},"جوجل المترجم":{"s":{"و","ل","ا","م","ر","ت","ج"},"l":4.58257569495584,"c":{"ج":3,"و":1,"ل":2,"ا":1,"م":2,"ت":1,"ر":1},"t":"GoogleTranslate"},"Google แปล":{"s":{"g","ล","แ","l","ป","o","e"},"l":3.605551275463989,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1},"t":"GoogleTranslate"},"ukuhumusha nge-Google":{"s":{"g","n","h","l","u","-","s","m","k","a","o","e"},"l":6.6332495807108,"c":{"u":4,"k":1,"h":2,"m":1,"s":1,"a":1,"n":1,"g":3,"e":2,"-":1,"o":2,"l":1},"t":"GoogleTranslate"},"گوگل ترجمو API":{"s":{"و","ل","p","م","ر","ت","a","ج","i","گ"},"l":4.0,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"a":1,"p":1,"i":1},"t":"GoogleTranslate"},"Google Traducere":{"s":{"g","d","l","t","u","c","r","a","o","e"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":1,"e":3,"t":1,"r":2,"a":1,"d":1,"u":1,"c":1},"t":"GoogleTranslate"},"„Google“":{"s":{"g","„","“","l","o","e"},"l":3.4641016151377544,"c":{"„":1,"g":2,"o":2,"l":1,"e":1,"“":1},"t":"GoogleTranslate"},"TRAIMA APLI":{"s":{"t","l","r","m","a","p","i"},"l":4.242640687119285,"c":{"t":1,"r":1,"a":3,"i":2,"m":1,"p":1,"l":1},"t":"GoogleTranslate"},"„Google“ vertimo API":{"s":{"g","„","“","l","t","v","p","r","m","a","o","e","i"},"l":5.477225575051661,"c":{"„":1,"g":2,"o":3,"l":1,"e":2,"“":1,"v":1,"r":1,"t":1,"i":2,"m":1,"a":1,"p":1},"t":"GoogleTranslate"},"Penterjemah Google":{"s":{"g","n","h","o","j","t","l","r","m","a","p","e"},"l":5.744562646538029,"c":{"p":1,"e":4,"n":1,"t":1,"r":1,"j":1,"m":1,"a":1,"h":1,"g":2,"o":2,"l":1},"t":"GoogleTranslate"},"ጉግል ትርጉም":{"s":{"ም","ግ","ል","ር","ጉ","ት"},"l":3.0,"c":{"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1},"t":"GoogleTranslate"},"Გუგლის თარჯიმანი":{"s":{"ლ","თ","ჯ","ს","ა","რ","უ","მ","ნ","გ","ი"},"l":5.0,"c":{"გ":2,"უ":1,"ლ":1,"ი":3,"ს":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"მ":1,"ნ":1},"t":"GoogleTranslate"},"Mai fassarar Google":{"s":{"g","f","l","r","s","m","a","o","e","i"},"l":6.082762530298219,"c":{"m":1,"a":4,"i":1,"f":1,"s":2,"r":2,"g":2,"o":2,"l":1,"e":1},"t":"GoogleTranslate"},"مترجم گوگل":{"s":{"و","ل","م","ر","ت","ج","گ"},"l":3.605551275463989,"c":{"م":2,"ت":1,"ر":1,"ج":1,"گ":2,"و":1,"ل":1},"t":"GoogleTranslate"},"Google tulkotāja API":{"s":{"g","j","l","t","p","u","k","a","o","e","i","ā"},"l":5.656854249492381,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"ā":1,"j":1,"a":2,"p":1,"i":1},"t":"GoogleTranslate"},"গুগল এপিআই ভি 1 অনুবাদ করুন":{"s":{"অ","গ","ি","ু","ভ","আ","এ","ই","1","ন","দ","ল","ক","ব","র","া","প"},"l":5.830951894845301,"c":{"গ":2,"ু":3,"ল":1,"এ":1,"প":1,"ি":2,"আ":1,"ই":1,"ভ":1,"1":1,"অ":1,"ন":2,"ব":1,"া":1,"দ":1,"ক":1,"র":1},"t":"GoogleTranslateV1"},"Google translate v1":{"s":{"g","n","1","l","t","v","r","s","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Çeviri V1":{"s":{"g","1","l","v","r","ç","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":2,"i":2,"r":1,"1":1},"t":"GoogleTranslateV1"},"Google翻译V1 API":{"s":{"g","1","l","译","v","p","翻","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"译":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google vertaal API v1":{"s":{"g","1","l","t","v","p","r","a","o","e","i"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":2,"e":2,"v":2,"r":1,"t":1,"a":3,"p":1,"i":1,"1":1},"t":"GoogleTranslateV1"},"Google Traduttore V1":{"s":{"g","d","1","l","t","v","u","r","a","o","e"},"l":6.0,"c":{"g":2,"o":3,"l":1,"e":2,"t":3,"r":2,"a":1,"d":1,"u":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"I-Google Humusha API v1":{"s":{"g","h","1","l","p","v","u","-","s","m","a","o","e","i"},"l":5.656854249492381,"c":{"i":2,"-":1,"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":2,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ଗୁଗୁଲ୍ ଅନୁବାଦ V1 |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","1","|","v","ଲ","ଅ","ଗ"},"l":4.795831523312719,"c":{"ଗ":2,"ୁ":3,"ଲ":1,"୍":1,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"v":1,"1":1,"|":1},"t":"GoogleTranslateV1"},"গুগল অনুবাদ ভি 1":{"s":{"অ","গ","ভ","ু","ি","1","ন","দ","ল","ব","া"},"l":4.123105625617661,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1,"ভ":1,"ি":1,"1":1},"t":"GoogleTranslateV1"},"Google vertaal v1":{"s":{"g","1","l","t","v","r","a","o","e"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":2,"e":2,"v":2,"r":1,"t":1,"a":2,"1":1},"t":"GoogleTranslateV1"},"API Google Translate V1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"a":3,"p":1,"i":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tugharia V1 API":{"s":{"g","h","1","l","t","v","p","u","r","a","o","e","i"},"l":5.916079783099616,"c":{"g":3,"o":2,"l":1,"e":1,"t":1,"u":1,"h":1,"a":3,"r":1,"i":2,"v":1,"1":1,"p":1},"t":"GoogleTranslateV1"},"Google tõlge V1":{"s":{"g","1","l","t","v","õ","o","e"},"l":5.0,"c":{"g":3,"o":2,"l":2,"e":2,"t":1,"õ":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google v1 API wergerîne":{"s":{"g","n","1","w","l","v","p","r","î","a","o","e","i"},"l":6.48074069840786,"c":{"g":3,"o":2,"l":1,"e":4,"v":1,"1":1,"a":1,"p":1,"i":1,"w":1,"r":2,"î":1,"n":1},"t":"GoogleTranslateV1"},"ගූගල් පරිවර්තනය V1 API":{"s":{"ි","න","ව","ර","ප","1","ත","v","ල","්","ූ","ය","a","p","i","ග"},"l":5.0,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"න":1,"ය":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"የጉግል ትርጉም V1 ኤፒአይ":{"s":{"ም","1","ግ","ል","ይ","የ","v","ር","አ","ኤ","ፒ","ጉ","ት"},"l":4.0,"c":{"የ":1,"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"v":1,"1":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"GoogleTranslateV1"},"Google വിവർത്തനം v1 API":{"s":{"g","ി","ത","1","വ","l","ർ","്","v","p","ം","a","o","e","i","ന"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google Translate V1 APIa":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":6.557438524302,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":4,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"ଗୁଗୁଲ୍ v1 API ଅନୁବାଦ କରେ |":{"s":{"ୁ","ା","୍","ଦ","1","ନ","ବ","େ","|","v","ଲ","ର","ଅ","ଗ","କ","a","p","i"},"l":5.385164807134504,"c":{"ଗ":2,"ୁ":3,"ଲ":1,"୍":1,"v":1,"1":1,"a":1,"p":1,"i":1,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"ର":1,"େ":1,"|":1},"t":"GoogleTranslateV1"},"கூகிள் மொழிபெயர்ப்பு வி 1 ஏபிஐ":{"s":{"வ","ெ","ொ","ு","1","ம","ஐ","ர","க","ய","ூ","ஏ","்","ப","ி","ழ","ள"},"l":7.615773105863909,"c":{"க":2,"ூ":1,"ி":4,"ள":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ப":4,"ெ":1,"ய":1,"ர":1,"ு":1,"வ":1,"1":1,"ஏ":1,"ஐ":1},"t":"GoogleTranslateV1"},"Google แปล v1":{"s":{"g","ล","1","แ","l","v","ป","o","e"},"l":3.872983346207417,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google v1":{"s":{"g","1","l","v","o","e"},"l":3.4641016151377544,"c":{"g":2,"o":2,"l":1,"e":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google übersetzt V1 API":{"s":{"g","b","ü","1","l","t","v","p","r","s","z","a","o","e","i"},"l":5.656854249492381,"c":{"g":2,"o":2,"l":1,"e":3,"ü":1,"b":1,"r":1,"s":1,"t":2,"z":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"గూగుల్ అనువాదం v1":{"s":{"గ","1","ూ","ల","v","్","ద","ా","ం","న","వ","ు","అ"},"l":4.358898943540674,"c":{"గ":2,"ూ":1,"ు":2,"ల":1,"్":1,"అ":1,"న":1,"వ":1,"ా":1,"ద":1,"ం":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google tulkot v1 API":{"s":{"g","1","l","t","v","p","u","k","a","o","e","i"},"l":5.385164807134504,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"ጉግል ትርጉም API v1":{"s":{"ም","1","ግ","ል","p","ር","v","ጉ","a","ት","i"},"l":3.7416573867739413,"c":{"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ګوګل ژباړه API V1":{"s":{"ب","و","1","ل","ړ","v","ا","ژ","ه","a","p","ګ","i"},"l":4.0,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ហ្គូហ្គលបកប្រែ V1 API":{"s":{"ប","រ","a","i","្","ូ","ែ","1","ក","v","ល","គ","p","ហ"},"l":5.5677643628300215,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google വിവർത്തനം v1":{"s":{"g","ി","ത","1","വ","l","ർ","്","v","ം","o","e","ന"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"گوگل کا ترجمہ V1":{"s":{"و","ک","1","ل","v","ا","ہ","م","ر","ت","ج","گ"},"l":3.872983346207417,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ગૂગલ અનુવાદ વી 1 એપીઆઈ":{"s":{"ગ","ન","ા","ુ","પ","ી","1","એ","ઈ","ૂ","અ","આ","દ","વ","લ"},"l":4.898979485566356,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":2,"ા":1,"દ":1,"ી":2,"1":1,"એ":1,"પ":1,"આ":1,"ઈ":1},"t":"GoogleTranslateV1"},"गूगल भाषांतर API v1":{"s":{"भ","1","ग","त","v","ा","र","ं","ल","a","p","ष","i","ू"},"l":4.47213595499958,"c":{"ग":2,"ू":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tarjamahkeun V1 API":{"s":{"g","n","h","j","1","l","t","v","p","u","r","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"a":4,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google Translate v1":{"s":{"g","n","1","l","t","v","r","s","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"গুগল অনুবাদ ভি 1 এপিআই":{"s":{"অ","গ","ভ","ু","ি","1","এ","ন","দ","আ","ই","ল","ব","া","প"},"l":4.898979485566356,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1,"ভ":1,"ি":2,"1":1,"এ":1,"প":1,"আ":1,"ই":1},"t":"GoogleTranslateV1"},"Google Fassara V1 API":{"s":{"g","f","1","l","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":1,"e":1,"f":1,"a":4,"s":2,"r":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"गुगल अनुवाद V1 API":{"s":{"a","1","ग","ु","v","न","अ","द","ा","ल","व","p","i"},"l":4.358898943540674,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google T1":{"s":{"g","1","l","t","o","e"},"l":3.4641016151377544,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"1":1},"t":"GoogleTranslateV1"},"Google Tafsiri V1":{"s":{"g","f","1","l","t","v","r","s","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":1,"f":1,"s":1,"i":2,"r":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google tõlkida V1 API":{"s":{"g","d","1","l","t","v","p","k","õ","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":2,"e":1,"t":1,"õ":1,"k":1,"i":2,"d":1,"a":2,"v":1,"1":1,"p":1},"t":"GoogleTranslateV1"},"Google Iwwersetzer V1":{"s":{"g","1","w","l","t","v","r","s","z","o","e","i"},"l":6.244997998398398,"c":{"g":2,"o":2,"l":1,"e":4,"i":1,"w":2,"r":2,"s":1,"t":1,"z":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google איבערזעצן V1":{"s":{"g","י","ב","צ","ע","ז","ן","1","l","v","א","o","e","ר"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"א":1,"י":1,"ב":1,"ע":2,"ר":1,"ז":1,"צ":1,"ן":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ហ្គូហ្គលបកប្រែ v1":{"s":{"ប","រ","្","ូ","ែ","1","ក","v","ល","គ","ហ"},"l":5.291502622129181,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google transplative API V1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.708203932499369,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":2,"i":2,"v":2,"1":1},"t":"GoogleTranslateV1"},"Google 번역 V1 API":{"s":{"g","번","1","l","v","역","p","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google faaliliu v1 API":{"s":{"g","f","1","l","v","p","u","a","o","e","i"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":3,"e":1,"f":1,"a":3,"i":3,"u":1,"v":1,"1":1,"p":1},"t":"GoogleTranslateV1"},"„Google“ vertimas V1 API":{"s":{"g","„","1","“","l","t","v","p","r","s","m","a","o","e","i"},"l":5.744562646538029,"c":{"„":1,"g":2,"o":2,"l":1,"e":2,"“":1,"v":2,"r":1,"t":1,"i":2,"m":1,"a":2,"s":1,"1":1,"p":1},"t":"GoogleTranslateV1"},"Google翻訳V1":{"s":{"g","1","l","v","翻","訳","o","e"},"l":3.7416573867739413,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google faaliliu v1":{"s":{"g","f","1","l","v","u","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":3,"e":1,"f":1,"a":2,"i":2,"u":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"گوگل ترجمو v1":{"s":{"و","1","ل","v","م","ر","ت","ج","گ"},"l":3.872983346207417,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google tulkot V1":{"s":{"g","1","l","t","v","u","k","o","e"},"l":5.0990195135927845,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google translat V1":{"s":{"g","n","1","l","t","v","r","s","a","o","e"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":2,"e":1,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tafsiri V1 API":{"s":{"g","f","1","l","t","v","p","r","s","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"v":1,"1":1,"p":1},"t":"GoogleTranslateV1"},"Google Dịch V1":{"s":{"g","h","d","1","l","v","ị","c","o","e"},"l":4.0,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google تەرجىمە V1":{"s":{"g","1","l","ى","v","ج","ە","ر","ت","م","o","e"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"جوجل ترجمة API V1":{"s":{"و","1","ة","ل","p","v","م","ر","ت","a","ج","i"},"l":4.47213595499958,"c":{"ج":3,"و":1,"ل":1,"ت":1,"ر":1,"م":1,"ة":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate V1 -sovellusliittymä":{"s":{"g","n","1","l","t","v","u","r","-","s","y","m","ä","a","o","e","i"},"l":9.591663046625438,"c":{"g":2,"o":3,"l":5,"e":3,"t":4,"r":1,"a":2,"n":1,"s":3,"v":2,"1":1,"-":1,"u":1,"i":2,"y":1,"m":1,"ä":1},"t":"GoogleTranslateV1"},"I-Google Humusha v1 API":{"s":{"g","h","1","l","v","p","u","-","s","m","a","o","e","i"},"l":5.656854249492381,"c":{"i":2,"-":1,"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":2,"v":1,"1":1,"p":1},"t":"GoogleTranslateV1"},"Google Translate api v1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tugharia API V1":{"s":{"g","h","1","l","t","p","v","u","r","a","o","e","i"},"l":5.916079783099616,"c":{"g":3,"o":2,"l":1,"e":1,"t":1,"u":1,"h":1,"a":3,"r":1,"i":2,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ગૂગલ અનુવાદ વી 1":{"s":{"ગ","ન","ા","ુ","ી","1","ૂ","અ","દ","વ","લ"},"l":4.123105625617661,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":2,"ા":1,"દ":1,"ી":1,"1":1},"t":"GoogleTranslateV1"},"Google 번역 API V1":{"s":{"g","번","1","l","p","역","v","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"گوگل ترجمو API v1":{"s":{"و","1","ل","p","v","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Guqula v1":{"s":{"g","1","l","v","u","q","a","o","e"},"l":5.0990195135927845,"c":{"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Dudziro V1":{"s":{"g","d","1","l","v","u","r","z","o","e","i"},"l":5.0,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":1,"r":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"கூகிள் மொழிபெயர்ப்பு API V1":{"s":{"ெ","ொ","ு","1","ம","ர","v","க","ய","ூ","்","ப","ி","ழ","a","p","ள","i"},"l":6.324555320336759,"c":{"க":2,"ூ":1,"ி":2,"ள":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ப":3,"ெ":1,"ய":1,"ர":1,"ு":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"گوگل کا ترجمہ API V1":{"s":{"و","ک","1","ل","p","v","ا","ہ","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate Api V1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Гоогле Транслате АПИ В1":{"s":{"л","н","1","и","в","с","а","г","р","о","п","е","т"},"l":6.0,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":3,"н":1,"с":1,"п":1,"и":1,"в":1,"1":1},"t":"GoogleTranslateV1"},"Traductor de Google V1":{"s":{"g","d","1","t","l","v","u","c","r","a","o","e"},"l":5.916079783099616,"c":{"t":2,"r":2,"a":1,"d":2,"u":1,"c":1,"o":3,"e":2,"g":2,"l":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Çeviri API V1":{"s":{"g","1","l","v","p","r","ç","a","o","e","i"},"l":5.5677643628300215,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":2,"i":3,"r":1,"a":1,"p":1,"1":1},"t":"GoogleTranslateV1"},"Google Тарҷумаи V1 API":{"s":{"g","i","м","1","и","l","v","p","а","р","ҷ","у","a","o","e","т"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"и":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google ਅਨੁਵਾਦ V1":{"s":{"g","ਾ","1","ਵ","l","v","ੁ","ਅ","o","e","ਨ","ਦ"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Sms / Mms V1 API":{"s":{"1","v","/","s","m","a","p","i"},"l":4.898979485566356,"c":{"s":3,"m":3,"/":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Гоогле Транслате В1 АПИ":{"s":{"л","н","1","и","в","с","а","г","р","о","п","е","т"},"l":6.0,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":3,"н":1,"с":1,"в":1,"1":1,"п":1,"и":1},"t":"GoogleTranslateV1"},"Google tõlkida API V1":{"s":{"g","d","1","l","t","p","v","k","õ","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":2,"e":1,"t":1,"õ":1,"k":1,"i":2,"d":1,"a":2,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Fassara V1":{"s":{"g","f","1","l","v","r","s","a","o","e"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":1,"e":1,"f":1,"a":3,"s":2,"r":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google translate v1 API":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google traduzzione api v1":{"s":{"g","n","d","1","l","t","p","v","u","r","z","a","o","e","i"},"l":6.164414002968976,"c":{"g":2,"o":3,"l":1,"e":2,"t":1,"r":1,"a":2,"d":1,"u":1,"z":2,"i":2,"n":1,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"„Google“ vertimas V1":{"s":{"g","„","1","“","l","t","v","r","s","m","a","o","e","i"},"l":5.0990195135927845,"c":{"„":1,"g":2,"o":2,"l":1,"e":2,"“":1,"v":2,"r":1,"t":1,"i":1,"m":1,"a":1,"s":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate v1 API":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google translat API v1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":5.744562646538029,"c":{"g":2,"o":2,"l":2,"e":1,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Fassara Api V1":{"s":{"g","f","1","l","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":1,"e":1,"f":1,"a":4,"s":2,"r":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate API V1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tarjamahkeun API V1":{"s":{"g","n","h","j","1","l","t","p","v","u","r","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"a":4,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google翻訳V1 API":{"s":{"a","g","1","l","v","p","翻","訳","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Tłumacz Google API v1":{"s":{"g","1","t","l","p","v","ł","u","c","z","m","a","o","e","i"},"l":4.898979485566356,"c":{"t":1,"ł":1,"u":1,"m":1,"a":2,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google翻译API V1":{"s":{"g","1","l","译","p","v","翻","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"译":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Dịch API V1":{"s":{"a","g","h","d","1","l","p","v","ị","c","o","e","i"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google വിവർത്തനം API v1":{"s":{"g","ി","ത","1","വ","l","ർ","്","p","v","ം","a","o","e","i","ന"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Гоогле Транслате В1":{"s":{"л","н","1","в","с","а","г","р","о","е","т"},"l":5.385164807134504,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":2,"н":1,"с":1,"в":1,"1":1},"t":"GoogleTranslateV1"},"Google ntụgharị v1":{"s":{"g","n","h","1","l","t","v","r","ụ","ị","a","o","e"},"l":4.898979485566356,"c":{"g":3,"o":2,"l":1,"e":1,"n":1,"t":1,"ụ":1,"h":1,"a":1,"r":1,"ị":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google अनुवाद v1":{"s":{"g","1","l","ु","v","न","अ","द","ा","व","o","e"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate v1 api":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google Translate V1 API":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"गुगल अनुवाद v1":{"s":{"1","ग","ु","v","न","अ","द","ा","ल","व"},"l":4.0,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"गुगल अनुवाद API V1":{"s":{"a","1","ग","ु","v","न","अ","द","ा","ल","व","p","i"},"l":4.358898943540674,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ਗੂਗਲ ਅਨੁਵਾਦ ਏਪੀਆਈ ਵੀ 1":{"s":{"ਏ","ੀ","ਈ","ਗ","ਲ","ਾ","1","ਵ","ੂ","ੁ","ਪ","ਅ","ਆ","ਨ","ਦ"},"l":4.898979485566356,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":2,"ਾ":1,"ਦ":1,"ਏ":1,"ਪ":1,"ੀ":2,"ਆ":1,"ਈ":1,"1":1},"t":"GoogleTranslateV1"},"Google अनुवाद एपीआई v1":{"s":{"g","ी","1","ए","प","l","ु","ई","न","v","अ","द","ा","व","o","e","आ"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ګوګل ژباړه V1":{"s":{"ب","و","1","ل","ړ","v","ا","ژ","ه","ګ"},"l":3.605551275463989,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate V1 Api":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"گوگل کا ترجمہ V1 API":{"s":{"و","ک","1","ل","v","p","ا","ہ","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"ګوګل ژباړه V1 API":{"s":{"ب","و","1","ل","ړ","v","ا","ژ","ه","a","p","ګ","i"},"l":4.0,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"ហ្គូហ្គលបកប្រែ API V1":{"s":{"ប","រ","a","i","្","ូ","ែ","1","ក","v","ល","គ","p","ហ"},"l":5.5677643628300215,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tarjamahkeun V1":{"s":{"g","n","h","j","1","l","t","v","u","r","m","k","a","o","e"},"l":5.656854249492381,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"a":3,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"API de Google Translate V1":{"s":{"g","n","o","d","1","l","t","v","r","s","a","p","e","i"},"l":6.48074069840786,"c":{"a":3,"p":1,"i":1,"d":1,"e":3,"g":2,"o":2,"l":2,"t":2,"r":1,"n":1,"s":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Dịch V1 API":{"s":{"a","g","h","d","1","l","v","p","ị","c","o","e","i"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"గూగుల్ API v1 ను అనువదిస్తుంది":{"s":{"గ","1","ూ","స","ల","v","్","ద","ం","ి","వ","త","ు","a","p","న","i","అ"},"l":6.928203230275509,"c":{"గ":2,"ూ":1,"ు":4,"ల":1,"్":2,"a":1,"p":1,"i":1,"v":1,"1":1,"న":2,"అ":1,"వ":1,"ద":2,"ి":2,"స":1,"త":1,"ం":1},"t":"GoogleTranslateV1"},"Google अनुवाद V1 एपीआई":{"s":{"g","ी","1","ए","प","l","ु","v","न","ई","अ","द","ा","व","o","e","आ"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"v":1,"1":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"GoogleTranslateV1"},"Google þýða API v1":{"s":{"g","þ","ð","1","l","ý","p","v","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":2,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google translate api v1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google แปล api v1":{"s":{"g","ล","1","แ","l","p","v","ป","a","o","e","i"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"گوگل ترجمو V1 API":{"s":{"و","1","ل","v","p","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google Dudziro Api v1":{"s":{"g","d","1","l","p","v","u","r","z","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":2,"r":1,"a":1,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google орчуулга V1 API":{"s":{"g","л","ч","1","l","v","p","а","г","р","о","у","a","o","e","i"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"గూగుల్ v1 API ని అనువదిస్తుంది":{"s":{"గ","1","ూ","స","ల","v","్","ద","ం","ి","వ","త","ు","a","p","న","i","అ"},"l":6.782329983125268,"c":{"గ":2,"ూ":1,"ు":3,"ల":1,"్":2,"v":1,"1":1,"a":1,"p":1,"i":1,"న":2,"ి":3,"అ":1,"వ":1,"ద":2,"స":1,"త":1,"ం":1},"t":"GoogleTranslateV1"},"Google Trans V1 API":{"s":{"g","n","1","l","t","v","p","r","s","a","o","e","i"},"l":4.69041575982343,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"r":1,"a":2,"n":1,"s":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google Çeviri V1 API":{"s":{"g","1","l","v","p","r","ç","a","o","e","i"},"l":5.5677643628300215,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":2,"i":3,"r":1,"1":1,"a":1,"p":1},"t":"GoogleTranslateV1"},"Google 번역 v1":{"s":{"g","번","1","l","v","역","o","e"},"l":3.7416573867739413,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Tafsiri API v1":{"s":{"g","f","1","l","t","p","v","r","s","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google איבערזעצן V1 API":{"s":{"a","g","י","ב","צ","ע","ז","ן","1","i","l","v","p","א","o","e","ר"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":1,"e":1,"א":1,"י":1,"ב":1,"ע":2,"ר":1,"ז":1,"צ":1,"ן":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"ಗೂಗಲ್ ಅನುವಾದ ವಿ 1":{"s":{"ಲ","ವ","ಗ","1","್","ಿ","ಅ","ೂ","ನ","ಾ","ದ","ು"},"l":4.242640687119285,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":2,"ಾ":1,"ದ":1,"ಿ":1,"1":1},"t":"GoogleTranslateV1"},"Tłumacz Google V1 API":{"s":{"g","1","t","l","v","p","ł","u","c","z","m","a","o","e","i"},"l":4.898979485566356,"c":{"t":1,"ł":1,"u":1,"m":1,"a":2,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"جوجل ترجمة v1":{"s":{"و","1","ة","ل","v","م","ر","ت","ج"},"l":4.123105625617661,"c":{"ج":3,"و":1,"ل":1,"ت":1,"ر":1,"م":1,"ة":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google भाषांतर v1":{"s":{"g","भ","1","l","त","v","ा","र","ष","ं","o","e"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google翻訳API V1":{"s":{"a","g","1","l","p","v","翻","訳","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google แปล v1 api":{"s":{"g","ล","1","แ","l","v","p","ป","a","o","e","i"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"Google Transp API V1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"r":1,"a":2,"n":1,"s":1,"p":2,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Panasonic API V1":{"s":{"n","o","1","v","c","s","a","p","i"},"l":5.0990195135927845,"c":{"p":2,"a":3,"n":2,"s":1,"o":1,"i":2,"c":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ಗೂಗಲ್ ಅನುವಾದ API V1":{"s":{"ಲ","ವ","a","ಗ","1","್","v","ಅ","ೂ","ನ","ಾ","ದ","p","ು","i"},"l":4.242640687119285,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google tulkot API V1":{"s":{"g","1","l","t","p","v","u","k","a","o","e","i"},"l":5.385164807134504,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ጉግል ትርጉም V1":{"s":{"ም","1","ግ","ል","v","ር","ጉ","ት"},"l":3.3166247903554,"c":{"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Tłumacz Google V1":{"s":{"g","1","t","l","v","ł","u","c","z","m","a","o","e"},"l":4.358898943540674,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Dudziro v1 API":{"s":{"g","d","1","l","v","p","u","r","z","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":2,"r":1,"v":1,"1":1,"a":1,"p":1},"t":"GoogleTranslateV1"},"جوجل ترجمة V1 API":{"s":{"و","1","ة","ل","v","p","م","ر","ت","a","ج","i"},"l":4.47213595499958,"c":{"ج":3,"و":1,"ل":1,"ت":1,"ر":1,"م":1,"ة":1,"v":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"V1 API ကို Google Translate":{"s":{"g","ိ","n","o","1","l","t","v","က","r","s","ု","a","p","e","i"},"l":6.244997998398398,"c":{"v":1,"1":1,"a":3,"p":1,"i":1,"က":1,"ိ":1,"ု":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslateV1"},"கூகிள் மொழிபெயர்ப்பு வி 1":{"s":{"வ","ெ","ொ","ு","1","ம","ர","க","ய","ூ","்","ப","ி","ழ","ள"},"l":6.48074069840786,"c":{"க":2,"ூ":1,"ி":3,"ள":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ப":3,"ெ":1,"ய":1,"ர":1,"ு":1,"வ":1,"1":1},"t":"GoogleTranslateV1"},"Google þýða v1":{"s":{"g","þ","ð","1","l","ý","v","a","o","e"},"l":4.0,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Humusha v1":{"s":{"g","h","1","l","v","u","s","m","a","o","e"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Guqula V1 API":{"s":{"g","1","l","v","p","u","q","a","o","e","i"},"l":5.5677643628300215,"c":{"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":2,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"गूगल भाषांतर व्ही 1 एपीआय":{"s":{"य","भ","ी","1","ए","ह","ग","प","त","्","ा","र","ं","ल","व","ष","आ","ू"},"l":5.196152422706632,"c":{"ग":2,"ू":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1,"व":1,"्":1,"ह":1,"ी":2,"1":1,"ए":1,"प":1,"आ":1,"य":1},"t":"GoogleTranslateV1"},"גוגל זעץ אַפּי וו 1":{"s":{"ג","י","ע","ז","פ","1","ּ","ל","ץ","ַ","א","ו"},"l":4.795831523312719,"c":{"ג":2,"ו":3,"ל":1,"ז":1,"ע":1,"ץ":1,"א":1,"ַ":1,"פ":1,"ּ":1,"י":1,"1":1},"t":"GoogleTranslateV1"},"Google þýða v1 API":{"s":{"g","þ","ð","1","l","ý","v","p","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":2,"v":1,"1":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"ගූගල් පරිවර්තන API V1":{"s":{"ි","න","ව","ර","ප","1","ත","v","ල","්","ූ","a","p","i","ග"},"l":4.898979485566356,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"න":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Sirimix. Pdf":{"s":{".","f","d","r","s","m","p","i","x"},"l":4.123105625617661,"c":{"s":1,"i":3,"r":1,"m":1,"x":1,".":1,"p":1,"d":1,"f":1},"t":"GoogleTranslateV1"},"Google Тарҷумаи V1":{"s":{"g","м","1","и","l","v","а","р","ҷ","у","o","e","т"},"l":4.69041575982343,"c":{"g":2,"o":2,"l":1,"e":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"и":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Terjemahan V1":{"s":{"g","n","h","j","1","l","t","v","r","m","a","o","e"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":3,"t":1,"r":1,"j":1,"m":1,"a":2,"h":1,"n":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google تەرجىمە V1 API نى تەرجىمە قىلىڭ":{"s":{"l","v","م","a","1","ڭ","ج","ن","o","i","g","ى","ر","e","ق","ل","ە","ت","p"},"l":8.717797887081348,"c":{"g":2,"o":2,"l":1,"e":1,"ت":2,"ە":4,"ر":2,"ج":2,"ى":5,"م":2,"v":1,"1":1,"a":1,"p":1,"i":1,"ن":1,"ق":1,"ل":1,"ڭ":1},"t":"GoogleTranslateV1"},"ગૂગલ અનુવાદ API V1":{"s":{"ગ","ન","ા","ુ","1","v","ૂ","અ","દ","a","p","વ","i","લ"},"l":4.123105625617661,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"a":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate API v1":{"s":{"g","n","1","l","t","p","v","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google ಅನುವಾದ ವಿ 1 API":{"s":{"ವ","g","a","1","ು","l","ಿ","p","ಅ","ನ","ಾ","ದ","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"ಅ":1,"ನ":1,"ು":1,"ವ":2,"ಾ":1,"ದ":1,"ಿ":1,"1":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV1"},"„Google“ versti API V1":{"s":{"g","„","1","“","l","t","v","p","r","s","a","o","e","i"},"l":5.385164807134504,"c":{"„":1,"g":2,"o":2,"l":1,"e":2,"“":1,"v":2,"r":1,"s":1,"t":1,"i":2,"a":1,"p":1,"1":1},"t":"GoogleTranslateV1"},"ଗୁଗୁଲ୍ api v1 |":{"s":{"ୁ","୍","|","1","v","ଲ","ଗ","a","p","i"},"l":4.0,"c":{"ଗ":2,"ୁ":2,"ଲ":1,"୍":1,"a":1,"p":1,"i":1,"v":1,"1":1,"|":1},"t":"GoogleTranslateV1"},"I-Google Guqula API V1":{"s":{"g","1","l","p","v","u","q","-","a","o","e","i"},"l":5.916079783099616,"c":{"i":2,"-":1,"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":2,"p":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"Google Translate V1":{"s":{"g","n","1","l","t","v","r","s","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ਗੂਗਲ ਅਨੁਵਾਦ ਵੀ 1 ਏਪੀਆਈ":{"s":{"ੀ","ਏ","ਈ","ਗ","ਲ","ਾ","1","ਵ","ੂ","ੁ","ਪ","ਅ","ਆ","ਨ","ਦ"},"l":4.898979485566356,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":2,"ਾ":1,"ਦ":1,"ੀ":2,"1":1,"ਏ":1,"ਪ":1,"ਆ":1,"ਈ":1},"t":"GoogleTranslateV1"},"Translate V1":{"s":{"n","1","t","l","v","r","s","a","e"},"l":3.872983346207417,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"v":1,"1":1},"t":"GoogleTranslateV1"},"ጉግል ትርጉም API V2":{"s":{"ም","ግ","ል","2","p","ር","v","ጉ","a","ት","i"},"l":3.7416573867739413,"c":{"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Guqula API v2":{"s":{"g","l","2","p","v","u","q","a","o","e","i"},"l":5.5677643628300215,"c":{"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":2,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"గూగుల్ అనువాదం v2":{"s":{"గ","ూ","ల","2","v","్","ద","ా","ం","న","వ","ు","అ"},"l":4.358898943540674,"c":{"గ":2,"ూ":1,"ు":2,"ల":1,"్":1,"అ":1,"న":1,"వ":1,"ా":1,"ద":1,"ం":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Dịch V2":{"s":{"g","h","d","l","2","v","ị","c","o","e"},"l":4.0,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Tłumacz Google API V2":{"s":{"g","t","l","p","v","2","ł","u","c","z","m","a","o","e","i"},"l":4.898979485566356,"c":{"t":1,"ł":1,"u":1,"m":1,"a":2,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Tarjamahkeun V2 API":{"s":{"g","n","h","j","l","t","v","2","p","u","r","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"a":4,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google übersetzen API V2":{"s":{"g","n","b","ü","l","t","p","v","2","r","s","z","a","o","e","i"},"l":6.082762530298219,"c":{"g":2,"o":2,"l":1,"e":4,"ü":1,"b":1,"r":1,"s":1,"t":1,"z":1,"n":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google tõlkida V2 API":{"s":{"g","d","l","t","v","2","p","k","õ","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":2,"e":1,"t":1,"õ":1,"k":1,"i":2,"d":1,"a":2,"v":1,"2":1,"p":1},"t":"GoogleTranslateV2"},"Google Translate v2":{"s":{"g","n","l","t","v","2","r","s","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Dudziro V2 API":{"s":{"g","d","l","2","v","p","u","r","z","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":2,"r":1,"v":1,"2":1,"a":1,"p":1},"t":"GoogleTranslateV2"},"Google איבערזעצן וו 2":{"s":{"g","י","ב","צ","ע","ז","ן","l","2","א","o","e","ר","ו"},"l":5.0990195135927845,"c":{"g":2,"o":2,"l":1,"e":1,"א":1,"י":1,"ב":1,"ע":2,"ר":1,"ז":1,"צ":1,"ן":1,"ו":2,"2":1},"t":"GoogleTranslateV2"},"Google þýða API v2":{"s":{"g","þ","ð","l","ý","p","v","2","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":2,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ਗੂਗਲ ਅਨੁਵਾਦ ਏਪੀਆਈ ਵੀ 2":{"s":{"ਏ","ੀ","ਈ","ਗ","ਲ","ਾ","ਵ","2","ੂ","ੁ","ਪ","ਅ","ਆ","ਨ","ਦ"},"l":4.898979485566356,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":2,"ਾ":1,"ਦ":1,"ਏ":1,"ਪ":1,"ੀ":2,"ਆ":1,"ਈ":1,"2":1},"t":"GoogleTranslateV2"},"Google വിവർത്തനം API v2":{"s":{"g","ി","ത","വ","l","ർ","്","p","v","2","ം","a","o","e","i","ന"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"গুগল এপিআই ভি 2 অনুবাদ করুন":{"s":{"অ","গ","ি","ু","ভ","আ","এ","ই","ন","দ","2","ল","ক","ব","র","া","প"},"l":5.830951894845301,"c":{"গ":2,"ু":3,"ল":1,"এ":1,"প":1,"ি":2,"আ":1,"ই":1,"ভ":1,"2":1,"অ":1,"ন":2,"ব":1,"া":1,"দ":1,"ক":1,"র":1},"t":"GoogleTranslateV2"},"Google tulkot V2 API":{"s":{"g","l","t","v","2","p","u","k","a","o","e","i"},"l":5.385164807134504,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google വിവർത്തനം v2 api":{"s":{"g","ി","ത","വ","l","ർ","്","v","2","p","ം","a","o","e","i","ന"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google translat API v2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":5.744562646538029,"c":{"g":2,"o":2,"l":2,"e":1,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google अनुवाद V2":{"s":{"g","l","ु","v","न","2","अ","द","ा","व","o","e"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"கூகிள் மொழிபெயர்ப்பு வி 2 ஏபிஐ":{"s":{"வ","ெ","ொ","ு","ஐ","ம","2","ர","க","ய","ூ","ஏ","்","ப","ி","ழ","ள"},"l":7.615773105863909,"c":{"க":2,"ூ":1,"ி":4,"ள":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ப":4,"ெ":1,"ய":1,"ர":1,"ு":1,"வ":1,"2":1,"ஏ":1,"ஐ":1},"t":"GoogleTranslateV2"},"API do Google Translate V2":{"s":{"g","n","d","l","t","p","v","2","r","s","a","o","e","i"},"l":6.48074069840786,"c":{"a":3,"p":1,"i":1,"d":1,"o":3,"g":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate API V2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google翻訳V2 API":{"s":{"a","g","l","2","v","p","翻","訳","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google translate v2 api":{"s":{"g","n","l","t","v","2","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Tugharia API V2":{"s":{"g","h","l","t","p","v","2","u","r","a","o","e","i"},"l":5.916079783099616,"c":{"g":3,"o":2,"l":1,"e":1,"t":1,"u":1,"h":1,"a":3,"r":1,"i":2,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ګوګل ژباړه V2":{"s":{"ب","و","ل","ړ","2","v","ا","ژ","ه","ګ"},"l":3.605551275463989,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Гоогле Транслате В2 АПИ":{"s":{"л","н","и","в","2","с","а","г","р","о","п","е","т"},"l":6.0,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":3,"н":1,"с":1,"в":1,"2":1,"п":1,"и":1},"t":"GoogleTranslateV2"},"Google Translate api v2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Panasonic API V2":{"s":{"n","o","2","v","c","s","a","p","i"},"l":5.0990195135927845,"c":{"p":2,"a":3,"n":2,"s":1,"o":1,"i":2,"c":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ហ្គូហ្គលបកប្រែ API V2":{"s":{"ប","រ","a","i","្","ូ","ែ","ក","2","v","ល","គ","p","ហ"},"l":5.5677643628300215,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google v2":{"s":{"g","l","2","v","o","e"},"l":3.4641016151377544,"c":{"g":2,"o":2,"l":1,"e":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Гоогле Транслате в2":{"s":{"л","н","в","2","с","а","г","р","о","е","т"},"l":5.385164807134504,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":2,"н":1,"с":1,"в":1,"2":1},"t":"GoogleTranslateV2"},"Google แปล v2":{"s":{"g","ล","แ","l","v","2","ป","o","e"},"l":3.872983346207417,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Tłumacz Google V2":{"s":{"g","t","l","v","2","ł","u","c","z","m","a","o","e"},"l":4.358898943540674,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google орчуулга V2 API":{"s":{"g","л","ч","l","2","v","p","а","г","р","о","у","a","o","e","i"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google अनुवाद V2 एपीआई":{"s":{"g","ी","ए","प","l","ु","v","न","2","ई","अ","द","ा","व","o","e","आ"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"v":1,"2":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"GoogleTranslateV2"},"ګوګل ژباړه API V2":{"s":{"ب","و","ل","ړ","2","v","ا","ژ","ه","a","p","ګ","i"},"l":4.0,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google تەرجىمە V2 Api":{"s":{"g","l","ى","v","ج","2","p","ە","ر","ت","م","a","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Translate API v2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"گوگل ترجمو v2":{"s":{"و","ل","2","v","م","ر","ت","ج","گ"},"l":3.872983346207417,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"गूगल भाषांतर व्ही 2 एपीआय":{"s":{"य","भ","ी","ए","ह","ग","प","2","त","्","ा","र","ं","ल","व","ष","आ","ू"},"l":5.196152422706632,"c":{"ग":2,"ू":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1,"व":1,"्":1,"ह":1,"ी":2,"2":1,"ए":1,"प":1,"आ":1,"य":1},"t":"GoogleTranslateV2"},"Google വിവർത്തനം v2":{"s":{"g","ി","ത","വ","l","ർ","്","v","2","ം","o","e","ന"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ଗୁଗୁଲ୍ ଅନୁବାଦ V2 |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","|","2","v","ଲ","ଅ","ଗ"},"l":4.795831523312719,"c":{"ଗ":2,"ୁ":3,"ଲ":1,"୍":1,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"v":1,"2":1,"|":1},"t":"GoogleTranslateV2"},"Google Tugharia v2":{"s":{"g","h","l","t","v","2","u","r","a","o","e","i"},"l":5.0990195135927845,"c":{"g":3,"o":2,"l":1,"e":1,"t":1,"u":1,"h":1,"a":2,"r":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate v2 API":{"s":{"g","n","l","t","v","2","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"ගූගල් පරිවර්තන API V2":{"s":{"ි","න","ව","ර","ප","ත","2","v","ල","්","ූ","a","p","i","ග"},"l":4.898979485566356,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"න":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Humusha v2":{"s":{"g","h","l","2","v","u","s","m","a","o","e"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google þýða v2 API":{"s":{"g","þ","ð","l","ý","v","2","p","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":2,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google traduzzione api v2":{"s":{"g","n","d","l","t","p","v","2","u","r","z","a","o","e","i"},"l":6.164414002968976,"c":{"g":2,"o":3,"l":1,"e":2,"t":1,"r":1,"a":2,"d":1,"u":1,"z":2,"i":2,"n":1,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"गूगल भाषांतर व्ही 2":{"s":{"भ","ी","ह","ग","2","त","्","ा","र","ं","ल","व","ष","ू"},"l":4.47213595499958,"c":{"ग":2,"ू":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1,"व":1,"्":1,"ह":1,"ी":1,"2":1},"t":"GoogleTranslateV2"},"गुगल अनुवाद V2 एपीआई":{"s":{"ी","ए","प","ग","ु","2","v","न","ई","अ","द","ा","ल","व","आ"},"l":4.58257569495584,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"v":1,"2":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"GoogleTranslateV2"},"Google T2 Itoju Google":{"s":{"g","j","l","t","2","u","o","e","i"},"l":7.54983443527075,"c":{"g":4,"o":5,"l":2,"e":2,"t":2,"2":1,"i":1,"j":1,"u":1},"t":"GoogleTranslateV2"},"Google Çeviri V2":{"s":{"g","l","2","v","r","ç","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":2,"i":2,"r":1,"2":1},"t":"GoogleTranslateV2"},"ਗੂਗਲ ਅਨੁਵਾਦ ਵੀ 2":{"s":{"ੀ","ਗ","ਲ","ਾ","ਵ","2","ੂ","ੁ","ਅ","ਨ","ਦ"},"l":4.123105625617661,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":2,"ਾ":1,"ਦ":1,"ੀ":1,"2":1},"t":"GoogleTranslateV2"},"Google 번역 API V2":{"s":{"g","번","l","2","p","역","v","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Terjemahan API v2":{"s":{"g","n","h","j","l","t","p","v","2","r","m","a","o","e","i"},"l":6.082762530298219,"c":{"g":2,"o":2,"l":1,"e":3,"t":1,"r":1,"j":1,"m":1,"a":3,"h":1,"n":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ಗೂಗಲ್ ಅನುವಾದ ವಿ 2":{"s":{"ಲ","ವ","ಗ","2","್","ಿ","ಅ","ೂ","ನ","ಾ","ದ","ು"},"l":4.242640687119285,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":2,"ಾ":1,"ದ":1,"ಿ":1,"2":1},"t":"GoogleTranslateV2"},"گوگل ترجمو API v2":{"s":{"و","ل","2","p","v","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"جوجل ترجمة V2 API":{"s":{"و","ة","ل","2","v","p","م","ر","ت","a","ج","i"},"l":4.47213595499958,"c":{"ج":3,"و":1,"ل":1,"ت":1,"ر":1,"م":1,"ة":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"ហ្គូហ្គលបកប្រែ V2 API":{"s":{"ប","រ","a","i","្","ូ","ែ","ក","2","v","ល","គ","p","ហ"},"l":5.5677643628300215,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Tarjamahkeun API V2":{"s":{"g","n","h","j","l","t","p","v","2","u","r","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"a":4,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ଗୁଗୁଲ୍ ରେ ଅନୁବାଦ କରନ୍ତୁ api v2 |":{"s":{"ଦ","v","ଲ","a","ୁ","ା","୍","ବ","ନ","ତ","2","ର","ଅ","i","|","ଗ","େ","କ","p"},"l":6.782329983125268,"c":{"ଗ":2,"ୁ":4,"ଲ":1,"୍":2,"ର":2,"େ":1,"ଅ":1,"ନ":2,"ବ":1,"ା":1,"ଦ":1,"କ":1,"ତ":1,"a":1,"p":1,"i":1,"v":1,"2":1,"|":1},"t":"GoogleTranslateV2"},"Google Fassara V2":{"s":{"g","f","l","2","v","r","s","a","o","e"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":1,"e":1,"f":1,"a":3,"s":2,"r":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google TRITI V2 API":{"s":{"g","l","t","v","2","p","r","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":1,"e":1,"t":2,"r":1,"i":3,"v":1,"2":1,"a":1,"p":1},"t":"GoogleTranslateV2"},"गुगल अनुवाद संक्षिप्त एपीआई v2":{"s":{"ई","v","क","ष","ी","2","ि","न","्","द","स","ं","ल","ए","प","त","अ","ग","ु","ा","व","आ"},"l":5.830951894845301,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"स":1,"ं":1,"क":1,"्":2,"ष":1,"ि":1,"प":2,"त":1,"ए":1,"ी":1,"आ":1,"ई":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google 번역 V2 API":{"s":{"g","번","l","2","v","역","p","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google翻訳V2":{"s":{"g","l","2","v","翻","訳","o","e"},"l":3.7416573867739413,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google þýða v2":{"s":{"g","þ","ð","l","ý","v","2","a","o","e"},"l":4.0,"c":{"g":2,"o":2,"l":1,"e":1,"þ":1,"ý":1,"ð":1,"a":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ගූගල් පරිවර්තනය v2":{"s":{"ි","න","ව","ර","ප","ත","2","v","ල","්","ූ","ය","ග"},"l":4.69041575982343,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"න":1,"ය":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate V2 API":{"s":{"g","n","l","t","v","2","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google tõlkida v2":{"s":{"g","d","l","t","v","2","k","õ","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":2,"e":1,"t":1,"õ":1,"k":1,"i":1,"d":1,"a":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Tafsiri V2 API":{"s":{"g","f","l","t","v","2","p","r","s","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"v":1,"2":1,"p":1},"t":"GoogleTranslateV2"},"የጉግል ትርጉም V2 ኤፒአይ":{"s":{"ም","ግ","ል","ይ","የ","v","ር","2","አ","ኤ","ፒ","ጉ","ት"},"l":4.0,"c":{"የ":1,"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"v":1,"2":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"GoogleTranslateV2"},"API de Google Translate V2":{"s":{"g","n","o","d","l","t","v","2","r","s","a","p","e","i"},"l":6.48074069840786,"c":{"a":3,"p":1,"i":1,"d":1,"e":3,"g":2,"o":2,"l":2,"t":2,"r":1,"n":1,"s":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Panasonic V2 API":{"s":{"n","o","2","v","c","s","a","p","i"},"l":5.0990195135927845,"c":{"p":2,"a":3,"n":2,"s":1,"o":1,"i":2,"c":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"جوجل ترجمة API V2":{"s":{"و","ة","ل","2","p","v","م","ر","ت","a","ج","i"},"l":4.47213595499958,"c":{"ج":3,"و":1,"ل":1,"ت":1,"ر":1,"م":1,"ة":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google แปล V2 API":{"s":{"g","ล","แ","l","v","2","p","ป","a","o","e","i"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Tafsiri API v2":{"s":{"g","f","l","t","p","v","2","r","s","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google faaliliu v2":{"s":{"g","f","l","2","v","u","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":2,"l":3,"e":1,"f":1,"a":2,"i":2,"u":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"கூகிள் மொழிபெயர்ப்பு வி 2":{"s":{"வ","ெ","ொ","ு","ம","2","ர","க","ய","ூ","்","ப","ி","ழ","ள"},"l":6.48074069840786,"c":{"க":2,"ூ":1,"ி":3,"ள":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ப":3,"ெ":1,"ய":1,"ர":1,"ு":1,"வ":1,"2":1},"t":"GoogleTranslateV2"},"Google translate api v2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ګوګل ژباړه V2 API":{"s":{"ب","و","ل","ړ","2","v","ا","ژ","ه","a","p","ګ","i"},"l":4.0,"c":{"ګ":2,"و":1,"ل":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Translate v2 api":{"s":{"g","n","l","t","v","2","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"I-Google Humusha v2 API":{"s":{"g","h","l","2","v","p","u","-","s","m","a","o","e","i"},"l":5.656854249492381,"c":{"i":2,"-":1,"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":2,"v":1,"2":1,"p":1},"t":"GoogleTranslateV2"},"Google Tərcümə API v2":{"s":{"a","g","ü","l","t","p","v","2","ə","r","m","c","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"API Google Translate V2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":6.0,"c":{"a":3,"p":1,"i":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Dịch API V2":{"s":{"a","g","h","d","l","2","p","v","ị","c","o","e","i"},"l":4.358898943540674,"c":{"g":2,"o":2,"l":1,"e":1,"d":1,"ị":1,"c":1,"h":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Tłumacz Google API v2":{"s":{"g","t","l","p","v","2","ł","u","c","z","m","a","o","e","i"},"l":4.898979485566356,"c":{"t":1,"ł":1,"u":1,"m":1,"a":2,"c":1,"z":1,"g":2,"o":2,"l":1,"e":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ગૂગલ અનુવાદ વી 2 એપીઆઈ":{"s":{"ગ","ન","ા","ુ","પ","ી","ઈ","એ","2","ૂ","અ","આ","દ","વ","લ"},"l":4.898979485566356,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":2,"ા":1,"દ":1,"ી":2,"2":1,"એ":1,"પ":1,"આ":1,"ઈ":1},"t":"GoogleTranslateV2"},"جوجل ترجمة v2":{"s":{"و","ة","ل","2","v","م","ر","ت","ج"},"l":4.123105625617661,"c":{"ج":3,"و":1,"ل":1,"ت":1,"ر":1,"م":1,"ة":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Dudziro Api v2":{"s":{"g","d","l","2","p","v","u","r","z","a","o","e","i"},"l":5.477225575051661,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":2,"r":1,"a":1,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"I-Google Humusha API v2":{"s":{"g","h","l","2","p","v","u","-","s","m","a","o","e","i"},"l":5.656854249492381,"c":{"i":2,"-":1,"g":2,"o":2,"l":1,"e":1,"h":2,"u":2,"m":1,"s":1,"a":2,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"గూగుల్ v2 API ని అనువదిస్తుంది":{"s":{"గ","ూ","స","ల","2","v","్","ద","ం","ి","వ","త","ు","a","p","న","i","అ"},"l":6.782329983125268,"c":{"గ":2,"ూ":1,"ు":3,"ల":1,"్":2,"v":1,"2":1,"a":1,"p":1,"i":1,"న":2,"ి":3,"అ":1,"వ":1,"ద":2,"స":1,"త":1,"ం":1},"t":"GoogleTranslateV2"},"গুগল অনুবাদ ভি 2":{"s":{"অ","গ","ভ","ু","ি","ন","দ","2","ল","ব","া"},"l":4.123105625617661,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1,"ভ":1,"ি":1,"2":1},"t":"GoogleTranslateV2"},"Гоогле Транслате АПИ В2":{"s":{"л","н","и","в","2","с","а","г","р","о","п","е","т"},"l":6.0,"c":{"г":2,"о":2,"л":2,"е":2,"т":2,"р":1,"а":3,"н":1,"с":1,"п":1,"и":1,"в":1,"2":1},"t":"GoogleTranslateV2"},"Google Çeviri V2 API":{"s":{"g","l","2","v","p","r","ç","a","o","e","i"},"l":5.5677643628300215,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":2,"i":3,"r":1,"2":1,"a":1,"p":1},"t":"GoogleTranslateV2"},"Amot V2":{"s":{"t","2","v","m","a","o"},"l":2.449489742783178,"c":{"a":1,"m":1,"o":1,"t":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate V2 -sovellusliittymä":{"s":{"g","n","l","t","v","2","u","r","-","s","y","m","ä","a","o","e","i"},"l":9.591663046625438,"c":{"g":2,"o":3,"l":5,"e":3,"t":4,"r":1,"a":2,"n":1,"s":3,"v":2,"2":1,"-":1,"u":1,"i":2,"y":1,"m":1,"ä":1},"t":"GoogleTranslateV2"},"„Google“ vertimas V2":{"s":{"g","„","“","l","t","v","2","r","s","m","a","o","e","i"},"l":5.0990195135927845,"c":{"„":1,"g":2,"o":2,"l":1,"e":2,"“":1,"v":2,"r":1,"t":1,"i":1,"m":1,"a":1,"s":1,"2":1},"t":"GoogleTranslateV2"},"Google Tarjamahkeun V2":{"s":{"g","n","h","j","l","t","v","2","u","r","m","k","a","o","e"},"l":5.656854249492381,"c":{"g":2,"o":2,"l":1,"e":2,"t":1,"a":3,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google翻訳API V2":{"s":{"a","g","l","2","p","v","翻","訳","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"訳":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google translate v2 API":{"s":{"g","n","l","t","v","2","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Tafsiri V2":{"s":{"g","f","l","t","v","2","r","s","a","o","e","i"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"t":1,"a":1,"f":1,"s":1,"i":2,"r":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ಗೂಗಲ್ ಅನುವಾದ API V2":{"s":{"ಲ","ವ","a","ಗ","2","್","v","ಅ","ೂ","ನ","ಾ","ದ","p","ು","i"},"l":4.242640687119285,"c":{"ಗ":2,"ೂ":1,"ಲ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google איבערזעצונג אַפּי וו 2":{"s":{"g","נ","י","ב","צ","ע","ז","ג","פ","l","2","ּ","ַ","א","o","e","ר","ו"},"l":6.4031242374328485,"c":{"g":2,"o":2,"l":1,"e":1,"א":2,"י":2,"ב":1,"ע":2,"ר":1,"ז":1,"צ":1,"ו":3,"נ":1,"ג":1,"ַ":1,"פ":1,"ּ":1,"2":1},"t":"GoogleTranslateV2"},"Google איבערזעצן V2 אַפּי":{"s":{"g","י","ב","צ","ע","ז","ן","פ","l","2","v","ּ","ַ","א","o","e","ר"},"l":5.656854249492381,"c":{"g":2,"o":2,"l":1,"e":1,"א":2,"י":2,"ב":1,"ע":2,"ר":1,"ז":1,"צ":1,"ן":1,"v":1,"2":1,"ַ":1,"פ":1,"ּ":1},"t":"GoogleTranslateV2"},"Google орчуулга API V2":{"s":{"g","л","ч","l","2","p","v","а","г","р","о","у","a","o","e","i"},"l":5.0,"c":{"g":2,"o":2,"l":1,"e":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate V2 APIa":{"s":{"g","n","l","t","v","2","p","r","s","a","o","e","i"},"l":6.557438524302,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":4,"n":1,"s":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Fassara V2 API":{"s":{"g","f","l","2","v","p","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":1,"e":1,"f":1,"a":4,"s":2,"r":1,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Dudziro V2":{"s":{"g","d","l","2","v","u","r","z","o","e","i"},"l":5.0,"c":{"g":2,"o":3,"l":1,"e":1,"d":2,"u":1,"z":1,"i":1,"r":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google翻译V2":{"s":{"g","l","2","译","v","翻","o","e"},"l":3.7416573867739413,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"译":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"گوگل کا ترجمہ V2":{"s":{"و","ک","ل","2","v","ا","ہ","م","ر","ت","ج","گ"},"l":3.872983346207417,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google vertaal API v2":{"s":{"g","l","t","v","p","2","r","a","o","e","i"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":2,"e":2,"v":2,"r":1,"t":1,"a":3,"p":1,"i":1,"2":1},"t":"GoogleTranslateV2"},"Google Çeviri API V2":{"s":{"g","l","2","v","p","r","ç","a","o","e","i"},"l":5.5677643628300215,"c":{"g":2,"o":2,"l":1,"e":2,"ç":1,"v":2,"i":3,"r":1,"a":1,"p":1,"2":1},"t":"GoogleTranslateV2"},"கூகிள் மொழிபெயர்ப்பு API V2":{"s":{"ெ","ொ","ு","ம","2","ர","v","க","ய","ூ","்","ப","ி","ழ","a","p","ள","i"},"l":6.324555320336759,"c":{"க":2,"ூ":1,"ி":2,"ள":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ப":3,"ெ":1,"ய":1,"ர":1,"ு":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate V2":{"s":{"g","n","l","t","v","2","r","s","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ਗੂਗਲ ਅਨੁਵਾਦ ਵੀ 2 ਏਪੀਆਈ":{"s":{"ੀ","ਏ","ਈ","ਗ","ਲ","ਾ","ਵ","2","ੂ","ੁ","ਪ","ਅ","ਆ","ਨ","ਦ"},"l":4.898979485566356,"c":{"ਗ":2,"ੂ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":2,"ਾ":1,"ਦ":1,"ੀ":2,"2":1,"ਏ":1,"ਪ":1,"ਆ":1,"ਈ":1},"t":"GoogleTranslateV2"},"Google翻译V2 API":{"s":{"g","l","2","译","v","p","翻","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"译":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google tulkot API V2":{"s":{"g","l","t","p","v","2","u","k","a","o","e","i"},"l":5.385164807134504,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"गूगल भाषांतर API V2":{"s":{"भ","ग","2","त","v","ा","र","ं","ल","a","p","ष","i","ू"},"l":4.47213595499958,"c":{"ग":2,"ू":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"గూగుల్ API v2 ను అనువదిస్తుంది":{"s":{"గ","ూ","స","ల","2","v","్","ద","ం","ి","వ","త","ు","a","p","న","i","అ"},"l":6.928203230275509,"c":{"గ":2,"ూ":1,"ు":4,"ల":1,"్":2,"a":1,"p":1,"i":1,"v":1,"2":1,"న":2,"అ":1,"వ":1,"ద":2,"ి":2,"స":1,"త":1,"ం":1},"t":"GoogleTranslateV2"},"গুগল অনুবাদ ভি 2 এপিআই":{"s":{"অ","গ","ভ","ু","ি","আ","এ","ন","দ","ই","2","ল","ব","া","প"},"l":4.898979485566356,"c":{"গ":2,"ু":2,"ল":1,"অ":1,"ন":1,"ব":1,"া":1,"দ":1,"ভ":1,"ি":2,"2":1,"এ":1,"প":1,"আ":1,"ই":1},"t":"GoogleTranslateV2"},"گوگل کا ترجمہ V2 API":{"s":{"و","ک","ل","2","v","p","ا","ہ","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google ಅನುವಾದ ವಿ 2 API":{"s":{"ವ","g","a","ು","l","2","ಿ","p","ಅ","ನ","ಾ","ದ","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"ಅ":1,"ನ":1,"ು":1,"ವ":2,"ಾ":1,"ದ":1,"ಿ":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google vertaal v2":{"s":{"g","l","t","v","2","r","a","o","e"},"l":5.196152422706632,"c":{"g":2,"o":2,"l":2,"e":2,"v":2,"r":1,"t":1,"a":2,"2":1},"t":"GoogleTranslateV2"},"ጉግል ትርጉም v2":{"s":{"ም","ግ","ል","2","v","ር","ጉ","ት"},"l":3.3166247903554,"c":{"ጉ":2,"ግ":1,"ል":1,"ት":1,"ር":1,"ም":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google μετάφραση API v2":{"s":{"ρ","g","α","a","l","η","p","μ","v","φ","2","ε","σ","ά","τ","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"μ":1,"ε":1,"τ":1,"ά":1,"φ":1,"ρ":1,"α":1,"σ":1,"η":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ଗୁଗୁଲ୍ v2 API କୁ ଅନୁବାଦ କରେ |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","େ","|","2","v","ଲ","ର","ଅ","ଗ","କ","a","p","i"},"l":6.244997998398398,"c":{"ଗ":2,"ୁ":4,"ଲ":1,"୍":1,"v":1,"2":1,"a":1,"p":1,"i":1,"କ":2,"ଅ":1,"ନ":1,"ବ":1,"ା":1,"ଦ":1,"ର":1,"େ":1,"|":1},"t":"GoogleTranslateV2"},"Google Translate V2 AI":{"s":{"g","n","l","t","v","2","r","s","a","o","e","i"},"l":5.916079783099616,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"v":1,"2":1,"i":1},"t":"GoogleTranslateV2"},"Google Тарҷумаи V2":{"s":{"g","м","и","l","2","v","а","р","ҷ","у","o","e","т"},"l":4.69041575982343,"c":{"g":2,"o":2,"l":1,"e":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"и":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"„Google“ vertimas V2 API":{"s":{"g","„","“","l","t","v","2","p","r","s","m","a","o","e","i"},"l":5.744562646538029,"c":{"„":1,"g":2,"o":2,"l":1,"e":2,"“":1,"v":2,"r":1,"t":1,"i":2,"m":1,"a":2,"s":1,"2":1,"p":1},"t":"GoogleTranslateV2"},"Google Fassara Ap2":{"s":{"g","f","l","2","p","r","s","a","o","e"},"l":5.830951894845301,"c":{"g":2,"o":2,"l":1,"e":1,"f":1,"a":4,"s":2,"r":1,"p":1,"2":1},"t":"GoogleTranslateV2"},"Google translate v2":{"s":{"g","n","l","t","v","2","r","s","a","o","e"},"l":5.385164807134504,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":2,"n":1,"s":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google tulkot V2":{"s":{"g","l","t","v","2","u","k","o","e"},"l":5.0990195135927845,"c":{"g":2,"o":3,"l":2,"e":1,"t":2,"u":1,"k":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google tõlkida API V2":{"s":{"g","d","l","t","p","v","2","k","õ","a","o","e","i"},"l":5.291502622129181,"c":{"g":2,"o":2,"l":2,"e":1,"t":1,"õ":1,"k":1,"i":2,"d":1,"a":2,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Itoju API V2":{"s":{"g","j","l","t","p","v","2","u","a","o","e","i"},"l":5.0990195135927845,"c":{"g":2,"o":3,"l":1,"e":1,"i":2,"t":1,"j":1,"u":1,"a":1,"p":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Translate Api V2":{"s":{"g","n","l","t","p","v","2","r","s","a","o","e","i"},"l":6.0,"c":{"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"a":3,"n":1,"s":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google تەرجىمە API V2":{"s":{"g","l","ى","p","ج","v","2","ە","ر","ت","م","a","o","e","i"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Guqula v2":{"s":{"g","l","2","v","u","q","a","o","e"},"l":5.0990195135927845,"c":{"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"ગૂગલ અનુવાદ વી 2":{"s":{"ગ","ન","ા","ુ","ી","2","ૂ","અ","દ","વ","લ"},"l":4.123105625617661,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":2,"ા":1,"દ":1,"ી":1,"2":1},"t":"GoogleTranslateV2"},"गुगल अनुवाद v2":{"s":{"ग","ु","2","v","न","अ","द","ा","ल","व"},"l":4.0,"c":{"ग":2,"ु":2,"ल":1,"अ":1,"न":1,"व":1,"ा":1,"द":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google翻译API V2":{"s":{"g","l","2","译","p","v","翻","a","o","e","i"},"l":4.123105625617661,"c":{"g":2,"o":2,"l":1,"e":1,"翻":1,"译":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google تەرجىمە V2":{"s":{"g","l","ى","v","ج","2","ە","ر","ت","م","o","e"},"l":4.58257569495584,"c":{"g":2,"o":2,"l":1,"e":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google übersetzt V2 API":{"s":{"g","b","ü","l","t","v","2","p","r","s","z","a","o","e","i"},"l":5.656854249492381,"c":{"g":2,"o":2,"l":1,"e":3,"ü":1,"b":1,"r":1,"s":1,"t":2,"z":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"ගූගල් පරිවර්තනය V2 API":{"s":{"ි","න","ව","ර","ප","ත","2","v","ල","්","ූ","ය","a","p","i","ග"},"l":5.0,"c":{"ග":2,"ූ":1,"ල":1,"්":2,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1,"න":1,"ය":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"ગૂગલ અનુવાદ API V2":{"s":{"ગ","ન","ા","ુ","2","v","ૂ","અ","દ","a","p","વ","i","લ"},"l":4.123105625617661,"c":{"ગ":2,"ૂ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Tugharia v2 API":{"s":{"g","h","l","t","v","2","p","u","r","a","o","e","i"},"l":5.916079783099616,"c":{"g":3,"o":2,"l":1,"e":1,"t":1,"u":1,"h":1,"a":3,"r":1,"i":2,"v":1,"2":1,"p":1},"t":"GoogleTranslateV2"},"گوگل ترجمو v2 API":{"s":{"و","ل","2","v","p","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":2,"ل":1,"ت":1,"ر":1,"ج":1,"م":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"ហ្គូហ្គលបកប្រែ v2":{"s":{"ប","រ","្","ូ","ែ","ក","2","v","ល","គ","ហ"},"l":5.291502622129181,"c":{"ហ":2,"្":3,"គ":2,"ូ":1,"ល":1,"ប":2,"ក":1,"រ":1,"ែ":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google 번역 v2":{"s":{"g","번","l","2","v","역","o","e"},"l":3.7416573867739413,"c":{"g":2,"o":2,"l":1,"e":1,"번":1,"역":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"„Google“ versti API V2":{"s":{"g","„","“","l","t","v","p","2","r","s","a","o","e","i"},"l":5.385164807134504,"c":{"„":1,"g":2,"o":2,"l":1,"e":2,"“":1,"v":2,"r":1,"s":1,"t":1,"i":2,"a":1,"p":1,"2":1},"t":"GoogleTranslateV2"},"V2 API ကို Google Translate":{"s":{"g","ိ","n","o","l","2","v","က","t","r","s","ု","a","p","e","i"},"l":6.244997998398398,"c":{"v":1,"2":1,"a":3,"p":1,"i":1,"က":1,"ိ":1,"ု":1,"g":2,"o":2,"l":2,"e":2,"t":2,"r":1,"n":1,"s":1},"t":"GoogleTranslateV2"},"Google अनुवाद एपीआई V2":{"s":{"g","ी","ए","प","l","ु","ई","न","v","2","अ","द","ा","व","o","e","आ"},"l":4.795831523312719,"c":{"g":2,"o":2,"l":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google แปล api v2":{"s":{"g","ล","แ","l","p","v","2","ป","a","o","e","i"},"l":4.242640687119285,"c":{"g":2,"o":2,"l":1,"e":1,"แ":1,"ป":1,"ล":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"گوگل کا ترجمہ API V2":{"s":{"و","ک","ل","2","p","v","ا","ہ","م","ر","ت","a","ج","i","گ"},"l":4.242640687119285,"c":{"گ":2,"و":1,"ل":1,"ک":1,"ا":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1,"a":1,"p":1,"i":1,"v":1,"2":1},"t":"GoogleTranslateV2"},"Google Guqula v2 API":{"s":{"g","l","2","v","p","u","q","a","o","e","i"},"l":5.5677643628300215,"c":{"g":3,"o":2,"l":2,"e":1,"u":2,"q":1,"a":2,"v":1,"2":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"Google Тарҷума V2 API":{"s":{"g","i","м","l","2","v","p","а","р","ҷ","у","a","o","e","т"},"l":4.898979485566356,"c":{"g":2,"o":2,"l":1,"e":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"v":1,"2":1,"a":1,"p":1,"i":1},"t":"GoogleTranslateV2"},"मास्क्रीेरोज":{"s":{"ी","े","्","ा","स","र","ज","क","ो","म"},"l":4.0,"c":{"म":1,"ा":1,"स":1,"्":2,"क":1,"र":2,"ी":1,"े":1,"ो":1,"ज":1},"t":"MicrosoftTranslate"},"Microsoft Translotor":{"s":{"a","n","f","t","l","r","s","m","c","o","i"},"l":6.708203932499369,"c":{"m":1,"i":1,"c":1,"r":3,"o":4,"s":2,"f":1,"t":3,"a":1,"n":1,"l":1},"t":"MicrosoftTranslate"},"Traductor de Microsoft":{"s":{"f","d","t","u","c","r","s","m","a","o","e","i"},"l":6.48074069840786,"c":{"t":3,"r":3,"a":1,"d":2,"u":1,"c":2,"o":3,"e":1,"m":1,"i":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"مائیکروسافٹ مترجم API":{"s":{"ئ","و","ک","ی","س","ف","ا","p","م","ر","ت","ٹ","a","ج","i"},"l":5.385164807134504,"c":{"م":3,"ا":2,"ئ":1,"ی":1,"ک":1,"ر":2,"و":1,"س":1,"ف":1,"ٹ":1,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"API למתרגם של מיקרוסופט":{"s":{"ת","ג","י","ר","ש","פ","ק","ס","ט","ו","ל","ם","a","p","i","מ"},"l":5.291502622129181,"c":{"a":1,"p":1,"i":1,"ל":2,"מ":2,"ת":1,"ר":2,"ג":1,"ם":1,"ש":1,"י":1,"ק":1,"ו":2,"ס":1,"פ":1,"ט":1},"t":"MicrosoftTranslate"},"Microsofti tõlkija API":{"s":{"a","f","j","t","l","p","r","s","m","k","õ","c","o","i"},"l":6.164414002968976,"c":{"m":1,"i":4,"c":1,"r":1,"o":2,"s":1,"f":1,"t":2,"õ":1,"l":1,"k":1,"j":1,"a":2,"p":1},"t":"MicrosoftTranslate"},"Microsoft орчуулагч API":{"s":{"a","л","ч","f","t","p","а","r","г","s","m","р","о","у","c","o","i"},"l":5.385164807134504,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Turjubaan microsoft":{"s":{"n","b","f","j","t","u","c","r","s","m","a","o","i"},"l":5.291502622129181,"c":{"t":2,"u":2,"r":2,"j":1,"b":1,"a":2,"n":1,"m":1,"i":1,"c":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"Microsoft अनुवाद":{"s":{"f","t","ु","न","अ","द","r","व","s","m","ा","c","o","i"},"l":4.123105625617661,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"MicrosoftTranslate"},"مائڪروسافٽ جيڪو آنس":{"s":{"ئ","و","ي","س","ف","ا","آ","ٽ","م","ر","ن","ج","ڪ"},"l":5.0,"c":{"م":1,"ا":2,"ئ":1,"ڪ":2,"ر":1,"و":2,"س":2,"ف":1,"ٽ":1,"ج":1,"ي":1,"آ":1,"ن":1},"t":"MicrosoftTranslate"},"ମାଇକ୍ରୋସଫ୍ଟ |":{"s":{"ଫ","ା","୍","|","ସ","ଟ","ମ","ର","ଇ","କ","ୋ"},"l":3.7416573867739413,"c":{"ମ":1,"ା":1,"ଇ":1,"କ":1,"୍":2,"ର":1,"ୋ":1,"ସ":1,"ଫ":1,"ଟ":1,"|":1},"t":"MicrosoftTranslate"},"Microsoft Tercüman API":{"s":{"a","n","f","ü","t","p","r","s","m","c","o","e","i"},"l":5.830951894845301,"c":{"m":2,"i":2,"c":2,"r":2,"o":2,"s":1,"f":1,"t":2,"e":1,"ü":1,"a":2,"n":1,"p":1},"t":"MicrosoftTranslate"},"מיקרוסופט תרגם":{"s":{"ת","ג","י","פ","ק","ס","ט","מ","ם","ר","ו"},"l":4.123105625617661,"c":{"מ":1,"י":1,"ק":1,"ר":2,"ו":2,"ס":1,"פ":1,"ט":1,"ת":1,"ג":1,"ם":1},"t":"MicrosoftTranslate"},"Microsoft mushanduri":{"s":{"a","n","h","f","d","t","u","r","s","m","c","o","i"},"l":5.5677643628300215,"c":{"m":2,"i":2,"c":1,"r":2,"o":2,"s":2,"f":1,"t":1,"u":2,"h":1,"a":1,"n":1,"d":1},"t":"MicrosoftTranslate"},"Microsoft translator API":{"s":{"a","n","f","t","l","p","r","s","m","c","o","i"},"l":7.0710678118654755,"c":{"m":1,"i":2,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"a":3,"n":1,"l":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft prevodilac API":{"s":{"a","f","d","t","l","p","v","r","s","m","c","o","e","i"},"l":6.48074069840786,"c":{"m":1,"i":3,"c":2,"r":2,"o":3,"s":1,"f":1,"t":1,"p":2,"e":1,"v":1,"d":1,"l":1,"a":2},"t":"MicrosoftTranslate"},"மைக்ரோசாஃப்ட் மொழிபெயர்ப்பாளர்":{"s":{"ட","ச","ெ","ொ","ம","ர","க","ய","ை","ஃ","்","ோ","ா","ப","ழ","ள","ி"},"l":9.0,"c":{"ம":2,"ை":1,"க":1,"்":6,"ர":3,"ோ":1,"ச":1,"ா":2,"ஃ":1,"ப":4,"ட":1,"ொ":1,"ழ":1,"ி":1,"ெ":1,"ய":1,"ள":1},"t":"MicrosoftTranslate"},"Microsoft tarjimoni API":{"s":{"a","n","f","j","t","p","r","s","m","c","o","i"},"l":6.855654600401044,"c":{"m":2,"i":4,"c":1,"r":2,"o":3,"s":1,"f":1,"t":2,"a":2,"j":1,"n":1,"p":1},"t":"MicrosoftTranslate"},"Traduttur tal-Microsoft":{"s":{"f","d","t","l","u","c","r","-","s","m","a","o","i"},"l":7.3484692283495345,"c":{"t":5,"r":3,"a":2,"d":1,"u":2,"l":1,"-":1,"m":1,"i":1,"c":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"Microsoft tulkotāja API":{"s":{"a","f","j","t","l","p","u","r","s","m","k","c","o","i","ā"},"l":6.082762530298219,"c":{"m":1,"i":2,"c":1,"r":1,"o":3,"s":1,"f":1,"t":3,"u":1,"l":1,"k":1,"ā":1,"j":1,"a":2,"p":1},"t":"MicrosoftTranslate"},"Microsoft Translator":{"s":{"a","n","f","t","l","r","s","m","c","o","i"},"l":6.4031242374328485,"c":{"m":1,"i":1,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"a":2,"n":1,"l":1},"t":"MicrosoftTranslate"},"مايكروسوفت":{"s":{"و","ك","ي","س","ف","ا","م","ر","ت"},"l":3.4641016151377544,"c":{"م":1,"ا":1,"ي":1,"ك":1,"ر":1,"و":2,"س":1,"ف":1,"ت":1},"t":"MicrosoftTranslate"},"Microsoft თარგმნა":{"s":{"თ","f","t","ა","რ","მ","გ","r","ნ","s","m","c","o","i"},"l":4.47213595499958,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"თ":1,"ა":2,"რ":1,"გ":1,"მ":1,"ნ":1},"t":"MicrosoftTranslate"},"Microsoft Dudziro":{"s":{"f","d","t","u","r","s","m","z","c","o","i"},"l":5.291502622129181,"c":{"m":1,"i":2,"c":1,"r":2,"o":3,"s":1,"f":1,"t":1,"d":2,"u":1,"z":1},"t":"MicrosoftTranslate"},"Microsoft prevoditelj":{"s":{"f","d","j","t","l","p","v","r","s","m","c","o","e","i"},"l":5.830951894845301,"c":{"m":1,"i":2,"c":1,"r":2,"o":3,"s":1,"f":1,"t":2,"p":1,"e":2,"v":1,"d":1,"l":1,"j":1},"t":"MicrosoftTranslate"},"Перакладчык Microsoft":{"s":{"к","л","ч","f","t","а","c","r","д","s","m","р","ы","п","o","е","i"},"l":5.0990195135927845,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"ترجمة Microsoft":{"s":{"o","f","ة","t","م","ر","ت","r","m","s","c","ج","i"},"l":4.0,"c":{"ت":1,"ر":1,"ج":1,"م":1,"ة":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"MICROSOFT":{"s":{"f","t","r","s","m","c","o","i"},"l":3.3166247903554,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft Traduki":{"s":{"a","f","d","t","u","r","s","m","k","c","o","i"},"l":4.898979485566356,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"a":1,"d":1,"u":1,"k":1},"t":"MicrosoftTranslate"},"API на Microsoft Translator":{"s":{"н","n","o","f","t","l","а","c","r","s","m","a","p","i"},"l":7.211102550927978,"c":{"a":3,"p":1,"i":2,"н":1,"а":1,"m":1,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"n":1,"l":1},"t":"MicrosoftTranslate"},"Microsoft tłumaczą":{"s":{"a","ą","f","t","ł","u","r","s","m","z","c","o","i"},"l":5.0,"c":{"m":2,"i":1,"c":2,"r":1,"o":2,"s":1,"f":1,"t":2,"ł":1,"u":1,"a":1,"z":1,"ą":1},"t":"MicrosoftTranslate"},"మైక్రోసాఫ్ట్ అనువాదం":{"s":{"మ","ఫ","స","ర","ై","్","క","ు","ా","ద","వ","న","ం","ట","ో","అ"},"l":5.196152422706632,"c":{"మ":1,"ై":1,"క":1,"్":3,"ర":1,"ో":1,"స":1,"ా":2,"ఫ":1,"ట":1,"అ":1,"న":1,"ు":1,"వ":1,"ద":1,"ం":1},"t":"MicrosoftTranslate"},"মাইক্রোসফ্ট অনুবাদ":{"s":{"অ","ু","ই","ম","ন","দ","ক","র","ট","া","ব","ো","স","্","ফ"},"l":4.58257569495584,"c":{"ম":1,"া":2,"ই":1,"ক":1,"্":2,"র":1,"ো":1,"স":1,"ফ":1,"ট":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1},"t":"MicrosoftTranslate"},"ក្រុមហ៊ុន Microsoft":{"s":{"រ","i","្","f","ម","ក","t","c","r","s","៊","m","ុ","ហ","o","ន"},"l":4.69041575982343,"c":{"ក":1,"្":1,"រ":1,"ុ":2,"ម":1,"ហ":1,"៊":1,"ន":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft -kääntäjä":{"s":{"n","f","j","t","r","-","s","m","ä","k","c","o","i"},"l":5.830951894845301,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":2,"-":1,"k":1,"ä":4,"n":1,"j":1},"t":"MicrosoftTranslate"},"Microsoft-oersetter":{"s":{"f","t","r","-","s","m","c","o","e","i"},"l":6.708203932499369,"c":{"m":1,"i":1,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"-":1,"e":3},"t":"MicrosoftTranslate"},"Tradutor de Microsoft":{"s":{"f","d","t","u","c","r","s","m","a","o","e","i"},"l":6.244997998398398,"c":{"t":3,"r":3,"a":1,"d":2,"u":1,"o":3,"e":1,"m":1,"i":1,"c":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"Mtafsiri wa Microsoft":{"s":{"f","w","t","c","r","s","m","a","o","i"},"l":6.244997998398398,"c":{"m":2,"t":2,"a":2,"f":2,"s":2,"i":3,"r":2,"w":1,"c":1,"o":2},"t":"MicrosoftTranslate"},"Мицрософт Транслатор":{"s":{"н","л","и","о","с","а","р","м","ц","т","ф"},"l":6.4031242374328485,"c":{"м":1,"и":1,"ц":1,"р":3,"о":3,"с":2,"ф":1,"т":3,"а":2,"н":1,"л":1},"t":"MicrosoftTranslate"},"Microsoft अनुवादक":{"s":{"f","t","ु","न","अ","द","r","व","s","m","ा","क","c","o","i"},"l":4.242640687119285,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"MicrosoftTranslate"},"Microsoft Tərcüməçi API":{"s":{"a","f","ü","t","p","r","ə","s","m","ç","c","o","i"},"l":6.244997998398398,"c":{"m":2,"i":3,"c":2,"r":2,"o":2,"s":1,"f":1,"t":2,"ə":2,"ü":1,"ç":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft API":{"s":{"a","f","t","p","r","s","m","c","o","i"},"l":4.0,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"API do tradutor da Microsoft":{"s":{"f","d","t","p","u","c","r","s","m","a","o","i"},"l":7.874007874011811,"c":{"a":3,"p":1,"i":2,"d":3,"o":4,"t":3,"r":3,"u":1,"m":1,"c":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"API tat-Traduttur Microsoft":{"s":{"o","d","f","t","u","c","r","-","s","m","a","p","i"},"l":8.54400374531753,"c":{"a":3,"p":1,"i":2,"t":6,"-":1,"r":3,"d":1,"u":2,"m":1,"c":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"මයික්රොසොෆ්ට් ට්රාන්ස්ලේටර් API":{"s":{"ි","න","i","ම","ෆ","ේ","ක","ල","්","ස","ා","ය","ට","a","p","ො","ර"},"l":9.327379053088816,"c":{"ම":1,"ය":1,"ි":1,"ක":1,"්":7,"ර":3,"ො":2,"ස":2,"ෆ":1,"ට":3,"ා":1,"න":1,"ල":1,"ේ":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"Microsoft تەرجىمە":{"s":{"f","t","ى","ج","ە","r","ت","s","m","ر","م","c","o","i"},"l":4.47213595499958,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1},"t":"MicrosoftTranslate"},"Microsoft prevesti":{"s":{"f","t","p","v","r","s","m","c","o","e","i"},"l":5.385164807134504,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":2,"f":1,"t":2,"p":1,"e":2,"v":1},"t":"MicrosoftTranslate"},"Microsoft Tradukisto API":{"s":{"a","f","d","t","p","u","r","s","m","k","c","o","i"},"l":6.782329983125268,"c":{"m":1,"i":3,"c":1,"r":2,"o":3,"s":2,"f":1,"t":3,"a":2,"d":1,"u":1,"k":1,"p":1},"t":"MicrosoftTranslate"},"මයික්රොසොෆ්ට්":{"s":{"ි","ම","ෆ","ක","්","ස","ය","ට","ො","ර"},"l":4.58257569495584,"c":{"ම":1,"ය":1,"ි":1,"ක":1,"්":3,"ර":1,"ො":2,"ස":1,"ෆ":1,"ට":1},"t":"MicrosoftTranslate"},"Penterjemah Microsoft":{"s":{"n","h","o","j","f","t","c","r","s","m","a","p","e","i"},"l":5.830951894845301,"c":{"p":1,"e":3,"n":1,"t":2,"r":2,"j":1,"m":2,"a":1,"h":1,"i":1,"c":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"மைக்ரோசாப்ட்":{"s":{"ட","ச","ம","ர","க","ை","்","ோ","ா","ப"},"l":4.242640687119285,"c":{"ம":1,"ை":1,"க":1,"்":3,"ர":1,"ோ":1,"ச":1,"ா":1,"ப":1,"ட":1},"t":"MicrosoftTranslate"},"Tagasalin ng Microsoft":{"s":{"g","n","f","t","l","c","r","s","m","a","o","i"},"l":6.164414002968976,"c":{"t":2,"a":3,"g":2,"s":2,"l":1,"i":2,"n":2,"m":1,"c":1,"r":1,"o":2,"f":1},"t":"MicrosoftTranslate"},"API Microsoft Translator API":{"s":{"a","n","o","f","t","l","r","s","m","c","p","i"},"l":8.06225774829855,"c":{"a":4,"p":2,"i":3,"m":1,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"n":1,"l":1},"t":"MicrosoftTranslate"},"Microsoft translator Api":{"s":{"a","n","f","t","l","p","r","s","m","c","o","i"},"l":7.0710678118654755,"c":{"m":1,"i":2,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"a":3,"n":1,"l":1,"p":1},"t":"MicrosoftTranslate"},"मायक्रोसॉफ्ट भाषांतर":{"s":{"फ","भ","ॉ","त","्","ा","र","स","ट","ष","ं","क","ो","म","य"},"l":5.385164807134504,"c":{"म":1,"ा":3,"य":1,"क":1,"्":2,"र":2,"ो":1,"स":1,"ॉ":1,"फ":1,"ट":1,"भ":1,"ष":1,"ं":1,"त":1},"t":"MicrosoftTranslate"},"মাইক্রোসফ্ট অনুবাদক":{"s":{"অ","ু","ই","ম","ন","দ","ক","র","ট","া","ব","ো","স","্","ফ"},"l":4.898979485566356,"c":{"ম":1,"া":2,"ই":1,"ক":2,"্":2,"র":1,"ো":1,"স":1,"ফ":1,"ট":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1},"t":"MicrosoftTranslate"},"Microsoft орчуулагч":{"s":{"л","ч","f","t","а","r","г","s","m","р","о","у","c","o","i"},"l":4.898979485566356,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1},"t":"MicrosoftTranslate"},"Microsoft vertaalt":{"s":{"a","f","t","l","v","r","s","m","c","o","e","i"},"l":5.385164807134504,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":3,"v":1,"e":1,"a":2,"l":1},"t":"MicrosoftTranslate"},"Microsoft Translator API":{"s":{"a","n","f","t","l","p","r","s","m","c","o","i"},"l":7.0710678118654755,"c":{"m":1,"i":2,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"a":3,"n":1,"l":1,"p":1},"t":"MicrosoftTranslate"},"Мајкрософт":{"s":{"к","о","с","а","ј","р","м","т","ф"},"l":3.4641016151377544,"c":{"м":1,"а":1,"ј":1,"к":1,"р":1,"о":2,"с":1,"ф":1,"т":1},"t":"MicrosoftTranslate"},"Мицрософт":{"s":{"и","о","с","р","м","ц","т","ф"},"l":3.3166247903554,"c":{"м":1,"и":1,"ц":1,"р":1,"о":2,"с":1,"ф":1,"т":1},"t":"MicrosoftTranslate"},"Microsoft аудармашысы":{"s":{"f","ш","р","t","ы","с","а","r","s","m","д","м","у","c","o","i"},"l":5.477225575051661,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1},"t":"MicrosoftTranslate"},"Microsoft ແປ":{"s":{"ປ","f","t","ແ","r","s","m","c","o","i"},"l":3.605551275463989,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"ແ":1,"ປ":1},"t":"MicrosoftTranslate"},"Microsoft þýða":{"s":{"a","þ","ð","f","t","ý","r","s","m","c","o","i"},"l":3.872983346207417,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"þ":1,"ý":1,"ð":1,"a":1},"t":"MicrosoftTranslate"},"API do tradutor de Microsoft":{"s":{"f","d","t","p","u","c","r","s","m","a","o","e","i"},"l":7.615773105863909,"c":{"a":2,"p":1,"i":2,"d":3,"o":4,"t":3,"r":3,"u":1,"e":1,"m":1,"c":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"ማይክሮሶፍት":{"s":{"ማ","ክ","ሮ","ይ","ሶ","ፍ","ት"},"l":2.6457513110645907,"c":{"ማ":1,"ይ":1,"ክ":1,"ሮ":1,"ሶ":1,"ፍ":1,"ት":1},"t":"MicrosoftTranslate"},"مائیکرو سافٹ":{"s":{"ئ","و","ک","ی","س","ف","ا","م","ر","ٹ"},"l":3.605551275463989,"c":{"م":1,"ا":2,"ئ":1,"ی":1,"ک":1,"ر":1,"و":1,"س":1,"ف":1,"ٹ":1},"t":"MicrosoftTranslate"},"မိုက်ကရိုဆော့":{"s":{"ိ","ရ","့","က","မ","ဆ","ာ","ု","ေ","်"},"l":4.358898943540674,"c":{"မ":1,"ိ":2,"ု":2,"က":2,"်":1,"ရ":1,"ဆ":1,"ေ":1,"ာ":1,"့":1},"t":"MicrosoftTranslate"},"Trình dịch Microsoft":{"s":{"n","ì","h","d","f","t","r","s","m","ị","c","o","i"},"l":5.291502622129181,"c":{"t":2,"r":2,"ì":1,"n":1,"h":2,"d":1,"ị":1,"c":2,"m":1,"i":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"Microsoft Translator Api":{"s":{"a","n","f","t","l","p","r","s","m","c","o","i"},"l":7.0710678118654755,"c":{"m":1,"i":2,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"a":3,"n":1,"l":1,"p":1},"t":"MicrosoftTranslate"},"Kaiwhakara whakahaere Microsoft":{"s":{"h","f","w","t","c","r","s","m","k","a","o","e","i"},"l":9.848857801796104,"c":{"k":3,"a":7,"i":2,"w":2,"h":3,"r":3,"e":2,"m":1,"c":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"മൈക്രോസോഫ്റ്റ് ട്രാൻസ്ലേറ്റർ API":{"s":{"ൻ","ല","i","മ","ൈ","്","സ","ക","ഫ","ാ","ോ","േ","ർ","ട","റ","a","p","ര"},"l":9.486832980505138,"c":{"മ":1,"ൈ":1,"ക":1,"്":7,"ര":2,"ോ":2,"സ":2,"ഫ":1,"റ":4,"ട":1,"ാ":1,"ൻ":1,"ല":1,"േ":1,"ർ":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"Microsoft itzultzailea":{"s":{"a","f","t","l","u","r","s","m","z","c","o","e","i"},"l":6.4031242374328485,"c":{"m":1,"i":3,"c":1,"r":1,"o":2,"s":1,"f":1,"t":3,"z":2,"u":1,"l":2,"a":2,"e":1},"t":"MicrosoftTranslate"},"Microsoft tittraduċi":{"s":{"a","f","d","t","u","r","ċ","s","m","c","o","i"},"l":6.4031242374328485,"c":{"m":1,"i":3,"c":1,"r":2,"o":2,"s":1,"f":1,"t":4,"a":1,"d":1,"u":1,"ċ":1},"t":"MicrosoftTranslate"},"អ្នកបកប្រែ Microsoft API":{"s":{"ប","រ","a","i","្","f","ែ","ក","t","p","r","s","អ","m","c","o","ន"},"l":5.656854249492381,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft Penterjemah API":{"s":{"a","n","h","f","j","t","p","r","s","m","c","o","e","i"},"l":6.557438524302,"c":{"m":2,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"p":2,"e":3,"n":1,"j":1,"a":2,"h":1},"t":"MicrosoftTranslate"},"API Penerjemah Microsoft":{"s":{"n","h","o","j","f","t","c","r","s","m","a","p","e","i"},"l":6.324555320336759,"c":{"a":2,"p":2,"i":2,"e":3,"n":1,"r":2,"j":1,"m":2,"h":1,"c":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft Tradukisto":{"s":{"a","f","d","t","u","r","s","m","k","c","o","i"},"l":6.082762530298219,"c":{"m":1,"i":2,"c":1,"r":2,"o":3,"s":2,"f":1,"t":3,"a":1,"d":1,"u":1,"k":1},"t":"MicrosoftTranslate"},"Microsoft traduce":{"s":{"a","f","d","t","u","r","s","m","c","o","e","i"},"l":4.898979485566356,"c":{"m":1,"i":1,"c":2,"r":2,"o":2,"s":1,"f":1,"t":2,"a":1,"d":1,"u":1,"e":1},"t":"MicrosoftTranslate"},"Microsoft Fassara":{"s":{"a","f","t","r","s","m","c","o","i"},"l":5.830951894845301,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":3,"f":2,"t":1,"a":3},"t":"MicrosoftTranslate"},"microsoft":{"s":{"f","t","r","s","m","c","o","i"},"l":3.3166247903554,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft preložiť":{"s":{"f","ť","t","l","p","r","s","m","ž","c","o","e","i"},"l":5.196152422706632,"c":{"m":1,"i":2,"c":1,"r":2,"o":3,"s":1,"f":1,"t":1,"p":1,"e":1,"l":1,"ž":1,"ť":1},"t":"MicrosoftTranslate"},"مائیکروسافٹ ترجمہ کریں":{"s":{"ئ","و","ک","ی","س","ف","ا","ہ","م","ر","ت","ٹ","ں","ج"},"l":5.830951894845301,"c":{"م":2,"ا":2,"ئ":1,"ی":2,"ک":2,"ر":3,"و":1,"س":1,"ف":1,"ٹ":1,"ت":1,"ج":1,"ہ":1,"ں":1},"t":"MicrosoftTranslate"},"Microsoft แปล":{"s":{"ล","f","t","แ","r","s","m","ป","c","o","i"},"l":3.7416573867739413,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"แ":1,"ป":1,"ล":1},"t":"MicrosoftTranslate"},"I-APICRORTORTORERTORTORECTORTORECTORTOREARTORE":{"s":{"a","o","t","r","-","c","p","e","i"},"l":19.849433241279208,"c":{"i":2,"-":1,"a":2,"p":1,"c":3,"r":13,"o":10,"t":9,"e":5},"t":"MicrosoftTranslate"},"Microsoft Tanthauzirani":{"s":{"a","n","h","f","t","u","r","s","m","z","c","o","i"},"l":6.782329983125268,"c":{"m":1,"i":3,"c":1,"r":2,"o":2,"s":1,"f":1,"t":3,"a":3,"n":2,"h":1,"u":1,"z":1},"t":"MicrosoftTranslate"},"مایکروسافت":{"s":{"و","ک","ی","س","ف","ا","م","ر","ت"},"l":3.4641016151377544,"c":{"م":1,"ا":2,"ی":1,"ک":1,"ر":1,"و":1,"س":1,"ف":1,"ت":1},"t":"MicrosoftTranslate"},"മൈക്രോസോഫ്റ്റ്":{"s":{"മ","ൈ","്","സ","ക","ഫ","ോ","റ","ര"},"l":5.477225575051661,"c":{"മ":1,"ൈ":1,"ക":1,"്":4,"ര":1,"ോ":2,"സ":1,"ഫ":1,"റ":2},"t":"MicrosoftTranslate"},"Microsoft- ის მთარგმნელი":{"s":{"f","მ","ე","ლ","რ","r","m","გ","o","ი","i","თ","t","ა","ნ","s","c","ს","-"},"l":5.291502622129181,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"-":1,"ი":2,"ს":1,"მ":2,"თ":1,"ა":1,"რ":1,"გ":1,"ნ":1,"ე":1,"ლ":1},"t":"MicrosoftTranslate"},"Microsoft þýðandi":{"s":{"a","þ","ð","n","f","d","t","ý","r","s","m","c","o","i"},"l":4.47213595499958,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"þ":1,"ý":1,"ð":1,"a":1,"n":1,"d":1},"t":"MicrosoftTranslate"},"Microsoft -Übersetzer":{"s":{"b","f","ü","t","r","-","s","m","z","c","o","e","i"},"l":6.164414002968976,"c":{"m":1,"i":1,"c":1,"r":3,"o":2,"s":2,"f":1,"t":2,"-":1,"ü":1,"b":1,"e":3,"z":1},"t":"MicrosoftTranslate"},"Microsoft tulkotājs":{"s":{"f","j","t","l","u","r","s","m","k","c","o","i","ā"},"l":5.656854249492381,"c":{"m":1,"i":1,"c":1,"r":1,"o":3,"s":2,"f":1,"t":3,"u":1,"l":1,"k":1,"ā":1,"j":1},"t":"MicrosoftTranslate"},"Microsoft Transler API":{"s":{"a","n","f","t","l","p","r","s","m","c","o","e","i"},"l":6.0,"c":{"m":1,"i":2,"c":1,"r":3,"o":2,"s":2,"f":1,"t":2,"a":2,"n":1,"l":1,"e":1,"p":1},"t":"MicrosoftTranslate"},"ማይክሮሶፍት ተርጓሚ":{"s":{"ማ","ክ","ሮ","ይ","ሶ","ሚ","ር","ፍ","ተ","ት","ጓ"},"l":3.3166247903554,"c":{"ማ":1,"ይ":1,"ክ":1,"ሮ":1,"ሶ":1,"ፍ":1,"ት":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"MicrosoftTranslate"},"የማይክሮሶፍት ተርጓሚ ኤፒአይ":{"s":{"ማ","ክ","ሮ","ይ","ሶ","የ","ሚ","ር","አ","ፍ","ተ","ኤ","ፒ","ት","ጓ"},"l":4.242640687119285,"c":{"የ":1,"ማ":1,"ይ":2,"ክ":1,"ሮ":1,"ሶ":1,"ፍ":1,"ት":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1},"t":"MicrosoftTranslate"},"මයික්රොසොෆ්ට් පරිවර්තනය":{"s":{"ි","න","ව","ම","ෆ","ප","ක","ත","්","ස","ය","ට","ො","ර"},"l":6.782329983125268,"c":{"ම":1,"ය":2,"ි":2,"ක":1,"්":4,"ර":3,"ො":2,"ස":1,"ෆ":1,"ට":1,"ප":1,"ව":1,"ත":1,"න":1},"t":"MicrosoftTranslate"},"Microsoft traducir":{"s":{"a","f","d","t","u","r","s","m","c","o","i"},"l":5.5677643628300215,"c":{"m":1,"i":2,"c":2,"r":3,"o":2,"s":1,"f":1,"t":2,"a":1,"d":1,"u":1},"t":"MicrosoftTranslate"},"မိုက်ကရိုဆော့ဖ်ဘာသာပြန်ဆိုခြင်း":{"s":{"ဘ","က","ဆ","ြ","ပ","ရ","မ","ဖ","ခ","န","့","်","ာ","င","သ","ု","ိ","း","ေ"},"l":8.18535277187245,"c":{"မ":1,"ိ":3,"ု":3,"က":2,"်":4,"ရ":1,"ဆ":2,"ေ":1,"ာ":3,"့":1,"ဖ":1,"ဘ":1,"သ":1,"ပ":1,"ြ":2,"န":1,"ခ":1,"င":1,"း":1},"t":"MicrosoftTranslate"},"Mai fassara Microsoft":{"s":{"f","t","c","r","s","m","a","o","i"},"l":6.855654600401044,"c":{"m":2,"a":4,"i":2,"f":2,"s":3,"r":2,"c":1,"o":2,"t":1},"t":"MicrosoftTranslate"},"Microsoft translate":{"s":{"a","n","f","t","l","r","s","m","c","o","e","i"},"l":5.656854249492381,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":2,"f":1,"t":3,"a":2,"n":1,"l":1,"e":1},"t":"MicrosoftTranslate"},"Microsoft Tranfaitor Api":{"s":{"a","n","f","t","p","r","s","m","c","o","i"},"l":7.3484692283495345,"c":{"m":1,"i":3,"c":1,"r":3,"o":3,"s":1,"f":2,"t":3,"a":3,"n":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft ntụgharị":{"s":{"a","g","n","h","f","t","r","s","m","ụ","ị","c","o","i"},"l":4.795831523312719,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"n":1,"ụ":1,"g":1,"h":1,"a":1,"ị":1},"t":"MicrosoftTranslate"},"Microsoft tõlkige":{"s":{"g","f","t","l","r","s","m","k","õ","c","o","e","i"},"l":4.69041575982343,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":2,"õ":1,"l":1,"k":1,"g":1,"e":1},"t":"MicrosoftTranslate"},"Isalin ang Microsoft":{"s":{"g","n","f","l","t","c","r","s","m","a","o","i"},"l":5.656854249492381,"c":{"i":3,"s":2,"a":2,"l":1,"n":2,"g":1,"m":1,"c":1,"r":1,"o":2,"f":1,"t":1},"t":"MicrosoftTranslate"},"マイクロソフト":{"s":{"イ","マ","ソ","ロ","フ","ト","ク"},"l":2.6457513110645907,"c":{"マ":1,"イ":1,"ク":1,"ロ":1,"ソ":1,"フ":1,"ト":1},"t":"MicrosoftTranslate"},"អ្នកបកប្រែ":{"s":{"ប","រ","្","ែ","ក","អ","ន"},"l":4.0,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1},"t":"MicrosoftTranslate"},"Microsoft prevajalec":{"s":{"a","f","j","t","l","p","v","r","s","m","c","o","e","i"},"l":5.385164807134504,"c":{"m":1,"i":1,"c":2,"r":2,"o":2,"s":1,"f":1,"t":1,"p":1,"e":2,"v":1,"a":2,"j":1,"l":1},"t":"MicrosoftTranslate"},"مترجم Microsoft":{"s":{"o","f","t","م","ر","ت","r","m","s","c","ج","i"},"l":4.242640687119285,"c":{"م":2,"ت":1,"ر":1,"ج":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"API Microsoft prevoditelja":{"s":{"a","o","f","d","j","t","l","v","r","s","m","c","p","e","i"},"l":6.782329983125268,"c":{"a":2,"p":2,"i":3,"m":1,"c":1,"r":2,"o":3,"s":1,"f":1,"t":2,"e":2,"v":1,"d":1,"l":1,"j":1},"t":"MicrosoftTranslate"},"Microsoft përkthen":{"s":{"ë","n","h","f","t","p","r","s","m","k","c","o","e","i"},"l":4.795831523312719,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"p":1,"ë":1,"k":1,"h":1,"e":1,"n":1},"t":"MicrosoftTranslate"},"Мицрософт Транслате":{"s":{"н","л","и","о","с","а","р","м","ц","е","т","ф"},"l":5.656854249492381,"c":{"м":1,"и":1,"ц":1,"р":2,"о":2,"с":2,"ф":1,"т":3,"а":2,"н":1,"л":1,"е":1},"t":"MicrosoftTranslate"},"Tarjamahkeun Microsoft API":{"s":{"n","h","f","j","t","p","u","c","r","s","m","k","a","o","e","i"},"l":6.782329983125268,"c":{"t":2,"a":4,"r":2,"j":1,"m":2,"h":1,"k":1,"e":1,"u":1,"n":1,"i":2,"c":1,"o":2,"s":1,"f":1,"p":1},"t":"MicrosoftTranslate"},"-Yar microsoftrog":{"s":{"g","f","t","c","r","y","-","m","s","a","o","i"},"l":5.291502622129181,"c":{"-":1,"y":1,"a":1,"r":3,"m":1,"i":1,"c":1,"o":3,"s":1,"f":1,"t":1,"g":1},"t":"MicrosoftTranslate"},"માઇક્રોસ .ફ્ટ ભાષાંતર":{"s":{"ા","સ",".","ષ","ત","્","ક","ઇ","ર","ફ","ં","મ","ો","ભ","ટ"},"l":5.385164807134504,"c":{"મ":1,"ા":3,"ઇ":1,"ક":1,"્":2,"ર":2,"ો":1,"સ":1,".":1,"ફ":1,"ટ":1,"ભ":1,"ષ":1,"ં":1,"ત":1},"t":"MicrosoftTranslate"},"ಮೈಕ್ರೋಸಾಫ್ಟ್ ಅನುವಾದ":{"s":{"ವ","ರ","ೋ","ಕ","ಸ","ೈ","್","ಅ","ಟ","ನ","ಫ","ಾ","ದ","ಮ","ು"},"l":5.0990195135927845,"c":{"ಮ":1,"ೈ":1,"ಕ":1,"್":3,"ರ":1,"ೋ":1,"ಸ":1,"ಾ":2,"ಫ":1,"ಟ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ದ":1},"t":"MicrosoftTranslate"},"Microd Microsoft":{"s":{"f","d","t","r","s","m","c","o","i"},"l":5.385164807134504,"c":{"m":2,"i":2,"c":2,"r":2,"o":3,"d":1,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"AKIYESI Microsoft API":{"s":{"f","t","p","c","r","y","s","m","k","a","o","e","i"},"l":6.082762530298219,"c":{"a":2,"k":1,"i":4,"y":1,"e":1,"s":2,"m":1,"c":1,"r":1,"o":2,"f":1,"t":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft Basa":{"s":{"a","b","f","t","r","s","m","c","o","i"},"l":4.358898943540674,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":2,"f":1,"t":1,"b":1,"a":2},"t":"MicrosoftTranslate"},"Microsoft tulkot":{"s":{"f","t","l","u","r","s","m","k","c","o","i"},"l":5.196152422706632,"c":{"m":1,"i":1,"c":1,"r":1,"o":3,"s":1,"f":1,"t":3,"u":1,"l":1,"k":1},"t":"MicrosoftTranslate"},"Microsoft narjamahkeun":{"s":{"a","n","h","f","j","t","u","r","s","m","k","c","o","e","i"},"l":5.916079783099616,"c":{"m":2,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":1,"n":2,"a":3,"j":1,"h":1,"k":1,"e":1,"u":1},"t":"MicrosoftTranslate"},"IMicrosoft Guqulela":{"s":{"a","g","f","t","l","u","q","r","s","m","c","o","e","i"},"l":5.0990195135927845,"c":{"i":2,"m":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"g":1,"u":2,"q":1,"l":2,"e":1,"a":1},"t":"MicrosoftTranslate"},"Microsoft Werger":{"s":{"g","f","w","t","r","s","m","c","o","e","i"},"l":5.0,"c":{"m":1,"i":1,"c":1,"r":3,"o":2,"s":1,"f":1,"t":1,"w":1,"e":2,"g":1},"t":"MicrosoftTranslate"},"Mrooft Transetlate":{"s":{"n","f","t","l","r","s","m","a","o","e"},"l":6.082762530298219,"c":{"m":1,"r":2,"o":2,"f":1,"t":4,"a":2,"n":1,"s":1,"e":2,"l":1},"t":"MicrosoftTranslate"},"Microsoft sụgharị":{"s":{"a","g","h","f","t","r","s","m","ụ","ị","c","o","i"},"l":4.69041575982343,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":2,"f":1,"t":1,"ụ":1,"g":1,"h":1,"a":1,"ị":1},"t":"MicrosoftTranslate"},"Microsoft翻译":{"s":{"f","t","译","r","s","m","翻","c","o","i"},"l":3.605551275463989,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"翻":1,"译":1},"t":"MicrosoftTranslate"},"የማይክሮሶፍት ትርጉም":{"s":{"ማ","ክ","ም","ሮ","ይ","ሶ","የ","ር","ፍ","ጉ","ት"},"l":3.7416573867739413,"c":{"የ":1,"ማ":1,"ይ":1,"ክ":1,"ሮ":1,"ሶ":1,"ፍ":1,"ት":2,"ር":1,"ጉ":1,"ም":1},"t":"MicrosoftTranslate"},"Microsoft prevajalec API":{"s":{"a","f","j","t","l","p","v","r","s","m","c","o","e","i"},"l":6.324555320336759,"c":{"m":1,"i":2,"c":2,"r":2,"o":2,"s":1,"f":1,"t":1,"p":2,"e":2,"v":1,"a":3,"j":1,"l":1},"t":"MicrosoftTranslate"},"مائیکروسافٹ مترجم":{"s":{"ئ","و","ک","ی","س","ف","ا","م","ر","ت","ٹ","ج"},"l":5.0990195135927845,"c":{"م":3,"ا":2,"ئ":1,"ی":1,"ک":1,"ر":2,"و":1,"س":1,"ف":1,"ٹ":1,"ت":1,"ج":1},"t":"MicrosoftTranslate"},"Microsoft Tərcümə":{"s":{"f","ü","t","r","ə","s","m","c","o","i"},"l":5.291502622129181,"c":{"m":2,"i":1,"c":2,"r":2,"o":2,"s":1,"f":1,"t":2,"ə":2,"ü":1},"t":"MicrosoftTranslate"},"මයික්රොසොෆ්ට් පරිවර්තකය":{"s":{"ි","ව","ම","ෆ","ප","ක","ත","්","ස","ය","ට","ො","ර"},"l":6.928203230275509,"c":{"ම":1,"ය":2,"ි":2,"ක":2,"්":4,"ර":3,"ො":2,"ස":1,"ෆ":1,"ට":1,"ප":1,"ව":1,"ත":1},"t":"MicrosoftTranslate"},"मायक्रोसॉफ्ट":{"s":{"फ","ॉ","्","ा","र","स","ट","क","ो","म","य"},"l":3.7416573867739413,"c":{"म":1,"ा":1,"य":1,"क":1,"्":2,"र":1,"ो":1,"स":1,"ॉ":1,"फ":1,"ट":1},"t":"MicrosoftTranslate"},"माइक्रोसॉफ्ट":{"s":{"फ","ॉ","इ","्","ा","र","स","ट","क","ो","म"},"l":3.7416573867739413,"c":{"म":1,"ा":1,"इ":1,"क":1,"्":2,"र":1,"ो":1,"स":1,"ॉ":1,"फ":1,"ट":1},"t":"MicrosoftTranslate"},"Преведувач на Мајкрософт":{"s":{"к","н","ч","в","р","о","с","а","ј","д","м","у","п","е","т","ф"},"l":6.0,"c":{"п":1,"р":2,"е":2,"в":2,"д":1,"у":1,"а":3,"ч":1,"н":1,"м":1,"ј":1,"к":1,"о":2,"с":1,"ф":1,"т":1},"t":"MicrosoftTranslate"},"API مترجم مایکروسافت":{"s":{"و","ک","ی","س","ج","ا","ف","م","ر","ت","a","p","i"},"l":5.477225575051661,"c":{"a":1,"p":1,"i":1,"م":3,"ت":2,"ر":2,"ج":1,"ا":2,"ی":1,"ک":1,"و":1,"س":1,"ف":1},"t":"MicrosoftTranslate"},"Traducător Microsoft":{"s":{"o","d","f","t","u","c","r","s","m","a","ă","i"},"l":6.244997998398398,"c":{"t":3,"r":3,"a":1,"d":1,"u":1,"c":2,"ă":1,"o":3,"m":1,"i":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"Umguquleli weMicrosoft":{"s":{"g","f","w","l","t","u","q","r","s","m","c","o","e","i"},"l":6.082762530298219,"c":{"u":3,"m":2,"g":1,"q":1,"l":2,"e":2,"i":2,"w":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"API de traductor de Microsoft":{"s":{"o","d","f","t","u","c","r","s","m","a","p","e","i"},"l":7.54983443527075,"c":{"a":2,"p":1,"i":2,"d":3,"e":2,"t":3,"r":3,"u":1,"c":2,"o":3,"m":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"Microsoft تەرجىمان":{"s":{"f","t","ى","ج","ا","ە","r","ت","s","m","ر","م","c","o","ن","i"},"l":4.358898943540674,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":1,"م":1,"ا":1,"ن":1},"t":"MicrosoftTranslate"},"מייקראָסאָפֿט":{"s":{"י","ָ","פ","ק","ס","ט","ֿ","א","ר","מ"},"l":4.358898943540674,"c":{"מ":1,"י":2,"ק":1,"ר":1,"א":2,"ָ":2,"ס":1,"פ":1,"ֿ":1,"ט":1},"t":"MicrosoftTranslate"},"மைக்ரோசாஃப்ட் மொழிபெயர்ப்பாளர் ஏபிஐ":{"s":{"ட","ச","ொ","க","ி","ஃ","்","ோ","ள","ம","ஏ","ா","ப","ெ","ஐ","ர","ை","ய","ழ"},"l":9.746794344808963,"c":{"ம":2,"ை":1,"க":1,"்":6,"ர":3,"ோ":1,"ச":1,"ா":2,"ஃ":1,"ப":5,"ட":1,"ொ":1,"ழ":1,"ி":2,"ெ":1,"ய":1,"ள":1,"ஏ":1,"ஐ":1},"t":"MicrosoftTranslate"},"مائڪروسافٽ ترجمو":{"s":{"ئ","و","س","ف","ا","ٽ","م","ر","ت","ج","ڪ"},"l":4.795831523312719,"c":{"م":2,"ا":2,"ئ":1,"ڪ":1,"ر":2,"و":2,"س":1,"ف":1,"ٽ":1,"ت":1,"ج":1},"t":"MicrosoftTranslate"},"Microsoft tarjimasi":{"s":{"a","f","j","t","r","s","m","c","o","i"},"l":6.0,"c":{"m":2,"i":3,"c":1,"r":2,"o":2,"s":2,"f":1,"t":2,"a":2,"j":1},"t":"MicrosoftTranslate"},"Mikrosoft":{"s":{"f","t","r","s","m","k","o","i"},"l":3.3166247903554,"c":{"m":1,"i":1,"k":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Tafsiri ya Microsoft":{"s":{"f","t","c","r","y","s","m","a","o","i"},"l":6.0,"c":{"t":2,"a":2,"f":2,"s":2,"i":3,"r":2,"y":1,"m":1,"c":1,"o":2},"t":"MicrosoftTranslate"},"مىكروسوفت":{"s":{"و","ك","ى","س","ف","م","ر","ت"},"l":3.3166247903554,"c":{"م":1,"ى":1,"ك":1,"ر":1,"و":2,"س":1,"ف":1,"ت":1},"t":"MicrosoftTranslate"},"Microsoft":{"s":{"f","t","r","s","m","c","o","i"},"l":3.3166247903554,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft překladatel":{"s":{"a","f","d","ř","t","l","p","r","s","m","k","c","o","e","i"},"l":5.477225575051661,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":2,"p":1,"ř":1,"e":2,"k":1,"l":2,"a":2,"d":1},"t":"MicrosoftTranslate"},"Penerjemah Microsoft":{"s":{"n","h","o","j","f","t","c","r","s","m","a","p","e","i"},"l":5.5677643628300215,"c":{"p":1,"e":3,"n":1,"r":2,"j":1,"m":2,"a":1,"h":1,"i":1,"c":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft faaliliu":{"s":{"a","f","t","l","u","r","s","m","c","o","i"},"l":5.5677643628300215,"c":{"m":1,"i":3,"c":1,"r":1,"o":2,"s":1,"f":2,"t":1,"a":2,"l":2,"u":1},"t":"MicrosoftTranslate"},"API prekladateľa spoločnosti Microsoft":{"s":{"č","n","o","d","f","ľ","l","t","c","r","s","m","k","a","p","e","i"},"l":9.848857801796104,"c":{"a":4,"p":3,"i":3,"r":2,"e":2,"k":1,"l":2,"d":1,"t":3,"ľ":1,"s":3,"o":5,"č":1,"n":1,"m":1,"c":1,"f":1},"t":"MicrosoftTranslate"},"Microsoft 번역":{"s":{"번","f","t","역","r","s","m","c","o","i"},"l":3.605551275463989,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"번":1,"역":1},"t":"MicrosoftTranslate"},"Përkthyesi i Microsoft":{"s":{"ë","h","o","f","t","r","y","s","m","k","c","p","e","i"},"l":5.830951894845301,"c":{"p":1,"ë":1,"r":2,"k":1,"t":2,"h":1,"y":1,"e":1,"s":2,"i":3,"m":1,"c":1,"o":2,"f":1},"t":"MicrosoftTranslate"},"ಮೈಕ್ರೋಸಾಫ್ಟ್ ಅನುವಾದಕ API":{"s":{"ವ","ರ","a","ೋ","ಕ","ಸ","ೈ","್","p","ಅ","ಟ","ನ","ಫ","ಾ","ದ","ಮ","ು","i"},"l":5.656854249492381,"c":{"ಮ":1,"ೈ":1,"ಕ":2,"್":3,"ರ":1,"ೋ":1,"ಸ":1,"ಾ":2,"ಫ":1,"ಟ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ದ":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"Microsoft орчуулга":{"s":{"л","ч","f","t","а","r","г","s","m","р","о","у","c","o","i"},"l":4.58257569495584,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1},"t":"MicrosoftTranslate"},"د مایکروسافټ ژباړن":{"s":{"ب","و","ک","ی","ړ","س","ف","ا","ټ","م","ر","ژ","ن","د"},"l":4.69041575982343,"c":{"د":1,"م":1,"ا":3,"ی":1,"ک":1,"ر":1,"و":1,"س":1,"ف":1,"ټ":1,"ژ":1,"ب":1,"ړ":1,"ن":1},"t":"MicrosoftTranslate"},"ମାଇକ୍ରୋସଫ୍ଟ ଅନୁବାଦ କରନ୍ତୁ |":{"s":{"ଫ","ା","ୁ","୍","ଦ","ବ","ନ","ତ","|","ସ","ଟ","ମ","ର","ଅ","ଇ","କ","ୋ"},"l":6.324555320336759,"c":{"ମ":1,"ା":2,"ଇ":1,"କ":2,"୍":3,"ର":2,"ୋ":1,"ସ":1,"ଫ":1,"ଟ":1,"ଅ":1,"ନ":2,"ୁ":2,"ବ":1,"ଦ":1,"ତ":1,"|":1},"t":"MicrosoftTranslate"},"Млагын т бэлэг":{"s":{"б","л","н","а","г","э","м","ы","т"},"l":4.242640687119285,"c":{"м":1,"л":2,"а":1,"г":2,"ы":1,"н":1,"т":1,"б":1,"э":2},"t":"MicrosoftTranslate"},"Microsoft Перевод":{"s":{"п","f","в","t","r","д","s","m","р","о","c","o","е","i"},"l":4.47213595499958,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1},"t":"MicrosoftTranslate"},"Panarjamah Microsoft":{"s":{"n","h","o","j","f","t","c","r","s","m","a","p","i"},"l":6.082762530298219,"c":{"p":1,"a":4,"n":1,"r":2,"j":1,"m":2,"h":1,"i":1,"c":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft Dịch":{"s":{"h","f","d","t","r","s","m","ị","c","o","i"},"l":4.123105625617661,"c":{"m":1,"i":1,"c":2,"r":1,"o":2,"s":1,"f":1,"t":1,"d":1,"ị":1,"h":1},"t":"MicrosoftTranslate"},"Microsoft تەرجىمانلۇق API":{"s":{"f","م","a","r","m","ج","o","ن","i","t","ى","ا","ر","s","c","ق","ل","ە","ت","ۇ","p"},"l":5.196152422706632,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":1,"م":1,"ا":1,"ن":1,"ل":1,"ۇ":1,"ق":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft traduz":{"s":{"a","f","d","t","u","r","s","m","z","c","o","i"},"l":4.58257569495584,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"a":1,"d":1,"u":1,"z":1},"t":"MicrosoftTranslate"},"Microsoft Mai Fassara API":{"s":{"a","f","t","p","r","s","m","c","o","i"},"l":7.874007874011811,"c":{"m":2,"i":3,"c":1,"r":2,"o":2,"s":3,"f":2,"t":1,"a":5,"p":1},"t":"MicrosoftTranslate"},"माइक्रोसफ्ट अनुवादक":{"s":{"फ","ु","इ","न","्","अ","द","ा","र","स","ट","व","क","ो","म"},"l":4.898979485566356,"c":{"म":1,"ा":2,"इ":1,"क":2,"्":2,"र":1,"ो":1,"स":1,"फ":1,"ट":1,"अ":1,"न":1,"ु":1,"व":1,"द":1},"t":"MicrosoftTranslate"},"Microsoft tradiktè":{"s":{"a","f","d","t","r","s","m","k","c","o","è","i"},"l":5.385164807134504,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":3,"a":1,"d":1,"k":1,"è":1},"t":"MicrosoftTranslate"},"Umhumushi we-Microsoft":{"s":{"h","f","w","t","u","r","-","s","m","c","o","e","i"},"l":6.4031242374328485,"c":{"u":3,"m":3,"h":2,"s":2,"i":2,"w":1,"e":1,"-":1,"c":1,"r":1,"o":2,"f":1,"t":1},"t":"MicrosoftTranslate"},"„Microsoft“":{"s":{"„","f","“","t","r","s","m","c","o","i"},"l":3.605551275463989,"c":{"„":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"“":1},"t":"MicrosoftTranslate"},"Microsoft tradiktè API":{"s":{"a","f","d","t","p","r","s","m","k","c","o","è","i"},"l":6.164414002968976,"c":{"m":1,"i":3,"c":1,"r":2,"o":2,"s":1,"f":1,"t":3,"a":2,"d":1,"k":1,"è":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft Trans Fresser API":{"s":{"a","n","f","t","p","r","s","m","c","o","e","i"},"l":7.745966692414834,"c":{"m":1,"i":2,"c":1,"r":4,"o":2,"s":4,"f":2,"t":2,"a":2,"n":1,"e":2,"p":1},"t":"MicrosoftTranslate"},"માઇક્રોસ .ફ્ટ અનુવાદક":{"s":{"ા","સ",".","ન","ુ","્","ક","ઇ","ર","ફ","મ","ો","અ","દ","ટ","વ"},"l":5.0,"c":{"મ":1,"ા":2,"ઇ":1,"ક":2,"્":2,"ર":1,"ો":1,"સ":1,".":1,"ફ":1,"ટ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"દ":1},"t":"MicrosoftTranslate"},"മൈക്രോസോഫ്റ്റ് പരിഭാഷകൻ":{"s":{"ഭ","ൻ","ി","മ","ൈ","്","സ","ക","ഫ","ാ","ോ","ഷ","പ","റ","ര"},"l":6.48074069840786,"c":{"മ":1,"ൈ":1,"ക":2,"്":4,"ര":2,"ോ":2,"സ":1,"ഫ":1,"റ":2,"പ":1,"ി":1,"ഭ":1,"ാ":1,"ഷ":1,"ൻ":1},"t":"MicrosoftTranslate"},"Microsoft -vertaler":{"s":{"a","f","t","l","v","r","-","s","m","c","o","e","i"},"l":5.477225575051661,"c":{"m":1,"i":1,"c":1,"r":3,"o":2,"s":1,"f":1,"t":2,"-":1,"v":1,"e":2,"a":1,"l":1},"t":"MicrosoftTranslate"},"માઇક્રોસ .ફ્ટ અનુવાદક API":{"s":{"ન","ફ","ો","a","ુ","્","ક","મ","અ","દ","ટ","i","સ","ઇ","ા",".","ર","p","વ"},"l":5.291502622129181,"c":{"મ":1,"ા":2,"ઇ":1,"ક":2,"્":2,"ર":1,"ો":1,"સ":1,".":1,"ફ":1,"ટ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"દ":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"API del traductor de Microsoft":{"s":{"o","d","f","l","t","u","c","r","s","m","a","p","e","i"},"l":7.615773105863909,"c":{"a":2,"p":1,"i":2,"d":3,"e":2,"l":1,"t":3,"r":3,"u":1,"c":2,"o":3,"m":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"微软":{"s":{"微","软"},"l":1.4142135623730951,"c":{"微":1,"软":1},"t":"MicrosoftTranslate"},"ਮਾਈਕ੍ਰੋਸਾੱਫਟ ਅਨੁਵਾਦਕ":{"s":{"ਮ","ਈ","ਕ","ਾ","ੋ","ੱ","੍","ਫ","ਵ","ਟ","ੁ","ਰ","ਅ","ਸ","ਨ","ਦ"},"l":5.196152422706632,"c":{"ਮ":1,"ਾ":3,"ਈ":1,"ਕ":2,"੍":1,"ਰ":1,"ੋ":1,"ਸ":1,"ੱ":1,"ਫ":1,"ਟ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1},"t":"MicrosoftTranslate"},"Microsoft тарҷумон":{"s":{"н","м","f","t","о","а","r","s","m","р","ҷ","у","c","o","i","т"},"l":4.358898943540674,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1},"t":"MicrosoftTranslate"},"मायक्रोसॉफ्ट ट्रान्सलेटर एपीआय":{"s":{"फ","े","ी","ए","प","ॉ","न","्","ा","र","स","ट","ल","क","ो","म","आ","य"},"l":7.615773105863909,"c":{"म":1,"ा":2,"य":2,"क":1,"्":4,"र":3,"ो":1,"स":2,"ॉ":1,"फ":1,"ट":3,"न":1,"ल":1,"े":1,"ए":1,"प":1,"ी":1,"आ":1},"t":"MicrosoftTranslate"},"Μεταφραστής της Microsoft":{"s":{"α","ρ","ή","o","ς","f","t","μ","c","r","s","ε","m","σ","τ","φ","η","i"},"l":5.916079783099616,"c":{"μ":1,"ε":1,"τ":3,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":2,"η":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft vertaal":{"s":{"a","f","t","l","v","r","s","m","c","o","e","i"},"l":4.898979485566356,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"v":1,"e":1,"a":2,"l":1},"t":"MicrosoftTranslate"},"مایکروسافت ترجمه می کند":{"s":{"و","ک","ی","س","ف","ا","م","ر","ت","ه","ج","ن","د"},"l":6.0,"c":{"م":3,"ا":2,"ی":2,"ک":2,"ر":2,"و":1,"س":1,"ف":1,"ت":2,"ج":1,"ه":1,"ن":1,"د":1},"t":"MicrosoftTranslate"},"Cyfieithydd Microsoft":{"s":{"h","f","d","t","r","y","s","m","c","o","e","i"},"l":6.164414002968976,"c":{"c":2,"y":2,"f":2,"i":3,"e":1,"t":2,"h":1,"d":2,"m":1,"r":1,"o":2,"s":1},"t":"MicrosoftTranslate"},"Microsoft kääntää":{"s":{"n","f","t","r","ä","s","m","k","c","o","i"},"l":5.656854249492381,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":2,"k":1,"ä":4,"n":1},"t":"MicrosoftTranslate"},"Traduttore Microsoft":{"s":{"f","d","t","u","c","r","s","m","a","o","e","i"},"l":6.557438524302,"c":{"t":4,"r":3,"a":1,"d":1,"u":1,"o":3,"e":1,"m":1,"i":1,"c":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"Eadar-theangachadh Microsoft":{"s":{"g","n","h","f","d","t","c","r","-","s","m","a","o","e","i"},"l":8.06225774829855,"c":{"e":2,"a":5,"d":2,"r":2,"-":1,"t":2,"h":3,"n":1,"g":1,"c":2,"m":1,"i":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"Microsofti tõlkija":{"s":{"a","f","j","t","l","r","s","m","k","õ","c","o","i"},"l":5.196152422706632,"c":{"m":1,"i":3,"c":1,"r":1,"o":2,"s":1,"f":1,"t":2,"õ":1,"l":1,"k":1,"j":1,"a":1},"t":"MicrosoftTranslate"},"マイクロソフト翻訳者":{"s":{"イ","マ","ソ","ロ","者","フ","翻","訳","ト","ク"},"l":3.1622776601683795,"c":{"マ":1,"イ":1,"ク":1,"ロ":1,"ソ":1,"フ":1,"ト":1,"翻":1,"訳":1,"者":1},"t":"MicrosoftTranslate"},"Microsoft översätter":{"s":{"f","t","v","r","ö","s","m","ä","c","o","e","i"},"l":6.082762530298219,"c":{"m":1,"i":1,"c":1,"r":3,"o":2,"s":2,"f":1,"t":3,"ö":1,"v":1,"e":2,"ä":1},"t":"MicrosoftTranslate"},"Microsoft тарҷума кунед":{"s":{"к","н","м","f","t","а","r","д","s","m","р","ҷ","у","c","o","е","i","т"},"l":5.196152422706632,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"т":1,"а":2,"р":1,"ҷ":1,"у":2,"м":1,"к":1,"н":1,"е":1,"д":1},"t":"MicrosoftTranslate"},"ਮਾਈਕ੍ਰੋਸਾੱਫਟ":{"s":{"ਮ","ਈ","ਕ","ਾ","ੋ","ੱ","੍","ਫ","ਟ","ਰ","ਸ"},"l":3.7416573867739413,"c":{"ਮ":1,"ਾ":2,"ਈ":1,"ਕ":1,"੍":1,"ਰ":1,"ੋ":1,"ਸ":1,"ੱ":1,"ਫ":1,"ਟ":1},"t":"MicrosoftTranslate"},"Microsoft ترجمو ڪندڙ":{"s":{"و","f","ڙ","t","ج","م","r","ت","s","m","ر","ن","c","o","ڪ","i","د"},"l":4.47213595499958,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"ت":1,"ر":1,"ج":1,"م":1,"و":1,"ڪ":1,"ن":1,"د":1,"ڙ":1},"t":"MicrosoftTranslate"},"Onitumọ Microsoft":{"s":{"n","f","t","u","r","ọ","m","s","c","o","i"},"l":5.291502622129181,"c":{"o":3,"n":1,"i":2,"t":2,"u":1,"m":2,"ọ":1,"c":1,"r":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"மைக்ரோசாப்ட் மொழிபெயர்க்கவும்":{"s":{"ட","வ","ச","ெ","ொ","ு","ம","ர","க","ய","ை","்","ோ","ா","ப","ழ","ி"},"l":8.602325267042627,"c":{"ம":3,"ை":1,"க":3,"்":6,"ர":2,"ோ":1,"ச":1,"ா":1,"ப":2,"ட":1,"ொ":1,"ழ":1,"ி":1,"ெ":1,"ய":1,"வ":1,"ு":1},"t":"MicrosoftTranslate"},"API на Microsoft преведувач":{"s":{"f","д","п","a","а","r","m","o","i","t","s","c","н","ч","в","р","у","p","е"},"l":5.830951894845301,"c":{"a":1,"p":1,"i":2,"н":1,"а":2,"m":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"ч":1},"t":"MicrosoftTranslate"},"Fimọ Microsoft":{"s":{"f","t","r","ọ","m","s","c","o","i"},"l":4.58257569495584,"c":{"f":2,"i":2,"m":2,"ọ":1,"c":1,"r":1,"o":2,"s":1,"t":1},"t":"MicrosoftTranslate"},"마이크로 소프트 번역기":{"s":{"번","기","트","역","마","크","프","이","소","로"},"l":3.1622776601683795,"c":{"마":1,"이":1,"크":1,"로":1,"소":1,"프":1,"트":1,"번":1,"역":1,"기":1},"t":"MicrosoftTranslate"},"„Microsoft“ vertėjas":{"s":{"a","„","f","j","“","t","v","r","s","m","c","o","e","i","ė"},"l":5.196152422706632,"c":{"„":1,"m":1,"i":1,"c":1,"r":2,"o":2,"s":2,"f":1,"t":2,"“":1,"v":1,"e":1,"ė":1,"j":1,"a":1},"t":"MicrosoftTranslate"},"Microsoft tarjimon":{"s":{"a","n","f","j","t","r","s","m","c","o","i"},"l":5.5677643628300215,"c":{"m":2,"i":2,"c":1,"r":2,"o":3,"s":1,"f":1,"t":2,"a":1,"j":1,"n":1},"t":"MicrosoftTranslate"},"Mpandika Microsoft":{"s":{"n","o","d","f","t","c","r","s","m","k","a","p","i"},"l":5.0,"c":{"m":2,"p":1,"a":2,"n":1,"d":1,"i":2,"k":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"Microsoft womasulira":{"s":{"a","f","w","t","l","u","r","s","m","c","o","i"},"l":5.916079783099616,"c":{"m":2,"i":2,"c":1,"r":2,"o":3,"s":2,"f":1,"t":1,"w":1,"a":2,"u":1,"l":1},"t":"MicrosoftTranslate"},"Microsoft- ის თარჯიმანი API":{"s":{"f","მ","a","ჯ","რ","r","m","o","ი","i","თ","t","ა","ნ","s","c","ს","-","p"},"l":6.0,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"-":1,"ი":3,"ს":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"მ":1,"ნ":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"API i përkthyesit të Microsoft":{"s":{"ë","h","o","f","t","c","r","y","s","m","k","a","p","e","i"},"l":7.745966692414834,"c":{"a":1,"p":2,"i":4,"ë":2,"r":2,"k":1,"t":4,"h":1,"y":1,"e":1,"s":2,"m":1,"c":1,"o":2,"f":1},"t":"MicrosoftTranslate"},"Мицрософт Транслатор АПИ":{"s":{"н","л","и","о","с","а","р","м","п","ц","т","ф"},"l":7.0710678118654755,"c":{"м":1,"и":2,"ц":1,"р":3,"о":3,"с":2,"ф":1,"т":3,"а":3,"н":1,"л":1,"п":1},"t":"MicrosoftTranslate"},"מיקראָסאָפט איבערזעצער אַפּי":{"s":{"י","ב","ָ","פ","ע","ז","צ","ק","ס","ט","ּ","ַ","א","ר","מ"},"l":7.745966692414834,"c":{"מ":1,"י":3,"ק":1,"ר":3,"א":4,"ָ":2,"ס":1,"פ":2,"ט":1,"ב":1,"ע":3,"ז":1,"צ":1,"ַ":1,"ּ":1},"t":"MicrosoftTranslate"},"マイクロソフト翻訳":{"s":{"イ","マ","ソ","ロ","フ","翻","訳","ト","ク"},"l":3.0,"c":{"マ":1,"イ":1,"ク":1,"ロ":1,"ソ":1,"フ":1,"ト":1,"翻":1,"訳":1},"t":"MicrosoftTranslate"},"Microsoft Переводчик":{"s":{"к","ч","п","f","и","в","t","r","д","s","m","р","о","c","o","е","i"},"l":4.795831523312719,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1},"t":"MicrosoftTranslate"},"Microsoft Translate":{"s":{"a","n","f","t","l","r","s","m","c","o","e","i"},"l":5.656854249492381,"c":{"m":1,"i":1,"c":1,"r":2,"o":2,"s":2,"f":1,"t":3,"a":2,"n":1,"l":1,"e":1},"t":"MicrosoftTranslate"},"ಮೈಕ್ರೋಸಾಫ್ಟ್":{"s":{"ರ","ೋ","ಕ","ಸ","ೈ","್","ಟ","ಫ","ಾ","ಮ"},"l":4.242640687119285,"c":{"ಮ":1,"ೈ":1,"ಕ":1,"್":3,"ರ":1,"ೋ":1,"ಸ":1,"ಾ":1,"ಫ":1,"ಟ":1},"t":"MicrosoftTranslate"},"מתרגם של מיקרוסופט":{"s":{"ת","ג","י","ש","פ","ק","ס","ט","ו","ל","ם","ר","מ"},"l":4.69041575982343,"c":{"מ":2,"ת":1,"ר":2,"ג":1,"ם":1,"ש":1,"ל":1,"י":1,"ק":1,"ו":2,"ס":1,"פ":1,"ט":1},"t":"MicrosoftTranslate"},"Microsoft аудармашысы API":{"s":{"a","f","ш","р","t","ы","p","с","а","r","s","m","д","м","у","c","o","i"},"l":5.916079783099616,"c":{"m":1,"i":2,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Microsoft аудармасы":{"s":{"f","р","t","ы","с","а","r","s","m","д","м","у","c","o","i"},"l":5.0990195135927845,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"а":3,"у":1,"д":1,"р":1,"м":1,"с":1,"ы":1},"t":"MicrosoftTranslate"},"API Microsoft Traduct":{"s":{"a","o","f","d","t","u","r","s","m","c","p","i"},"l":5.916079783099616,"c":{"a":2,"p":1,"i":2,"m":1,"c":2,"r":2,"o":2,"s":1,"f":1,"t":3,"d":1,"u":1},"t":"MicrosoftTranslate"},"Microsoft Humusha":{"s":{"a","h","f","t","u","r","s","m","c","o","i"},"l":5.0990195135927845,"c":{"m":2,"i":1,"c":1,"r":1,"o":2,"s":2,"f":1,"t":1,"h":2,"u":2,"a":1},"t":"MicrosoftTranslate"},"Trans tradución de Microsoft":{"s":{"ó","n","f","d","t","u","c","r","s","m","a","o","e","i"},"l":7.14142842854285,"c":{"t":3,"r":3,"a":2,"n":2,"s":2,"d":2,"u":1,"c":2,"i":2,"ó":1,"e":1,"m":1,"o":2,"f":1},"t":"MicrosoftTranslate"},"Microsoft itzultzaile APIa":{"s":{"a","f","t","l","p","u","r","s","m","z","c","o","e","i"},"l":7.3484692283495345,"c":{"m":1,"i":4,"c":1,"r":1,"o":2,"s":1,"f":1,"t":3,"z":2,"u":1,"l":2,"a":3,"e":1,"p":1},"t":"MicrosoftTranslate"},"Kātipa anō":{"s":{"n","t","ō","k","a","p","i","ā"},"l":3.3166247903554,"c":{"k":1,"ā":1,"t":1,"i":1,"p":1,"a":2,"n":1,"ō":1},"t":"MicrosoftTranslate"},"Microsoft Çevir":{"s":{"f","t","v","r","s","m","ç","c","o","e","i"},"l":4.47213595499958,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":1,"ç":1,"e":1,"v":1},"t":"MicrosoftTranslate"},"מיקרוסופט":{"s":{"י","פ","ק","ס","ט","מ","ר","ו"},"l":3.3166247903554,"c":{"מ":1,"י":1,"ק":1,"ר":1,"ו":2,"ס":1,"פ":1,"ט":1},"t":"MicrosoftTranslate"},"માઇક્રાસ્ટ":{"s":{"ા","સ","્","ક","ઇ","ર","મ","ટ"},"l":3.7416573867739413,"c":{"મ":1,"ા":2,"ઇ":1,"ક":1,"્":2,"ર":1,"સ":1,"ટ":1},"t":"MicrosoftTranslate"},"మైక్రోసాఫ్ట్":{"s":{"మ","ఫ","స","ర","ై","్","క","ా","ట","ో"},"l":4.242640687119285,"c":{"మ":1,"ై":1,"క":1,"్":3,"ర":1,"ో":1,"స":1,"ా":1,"ఫ":1,"ట":1},"t":"MicrosoftTranslate"},"മൈക്രോസോഫ്റ്റ് വിവർത്തനം":{"s":{"ം","ി","ത","വ","മ","ൈ","്","സ","ക","ഫ","ർ","ോ","റ","ര","ന"},"l":7.14142842854285,"c":{"മ":1,"ൈ":1,"ക":1,"്":5,"ര":1,"ോ":2,"സ":1,"ഫ":1,"റ":2,"വ":2,"ി":1,"ർ":1,"ത":2,"ന":1,"ം":1},"t":"MicrosoftTranslate"},"مایکروسافټ":{"s":{"و","ک","ی","س","ف","ا","ټ","م","ر"},"l":3.4641016151377544,"c":{"م":1,"ا":2,"ی":1,"ک":1,"ر":1,"و":1,"س":1,"ف":1,"ټ":1},"t":"MicrosoftTranslate"},"Pregliompor preglator Microsoft":{"s":{"g","o","f","l","t","c","r","s","m","a","p","e","i"},"l":9.327379053088816,"c":{"p":3,"r":5,"e":2,"g":2,"l":2,"i":2,"o":5,"m":2,"a":1,"t":2,"c":1,"s":1,"f":1},"t":"MicrosoftTranslate"},"Turjumaan microsoft Api":{"s":{"n","f","j","t","p","u","c","r","s","m","a","o","i"},"l":6.244997998398398,"c":{"t":2,"u":2,"r":2,"j":1,"m":2,"a":3,"n":1,"i":2,"c":1,"o":2,"s":1,"f":1,"p":1},"t":"MicrosoftTranslate"},"Μεταφράστε στη Microsoft":{"s":{"α","ρ","o","f","t","μ","c","r","s","ε","m","σ","ά","τ","φ","η","i"},"l":5.830951894845301,"c":{"μ":1,"ε":2,"τ":3,"α":1,"φ":1,"ρ":1,"ά":1,"σ":2,"η":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"ក្រុមហ៊ុន Microsoft បកប្រែ":{"s":{"រ","ប","i","្","f","ែ","ម","ក","t","c","r","s","៊","m","ុ","ហ","o","ន"},"l":6.0,"c":{"ក":2,"្":2,"រ":2,"ុ":2,"ម":1,"ហ":1,"៊":1,"ន":1,"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"ប":2,"ែ":1},"t":"MicrosoftTranslate"},"माइक्रोसफ्ट अनुवाद":{"s":{"फ","ु","इ","न","्","अ","द","ा","र","स","ट","व","क","ो","म"},"l":4.58257569495584,"c":{"म":1,"ा":2,"इ":1,"क":1,"्":2,"र":1,"ो":1,"स":1,"फ":1,"ट":1,"अ":1,"न":1,"ु":1,"व":1,"द":1},"t":"MicrosoftTranslate"},"מייקראָסאָפֿט זעץ":{"s":{"י","ָ","פ","ז","ע","ק","ס","ט","ֿ","ץ","א","ר","מ"},"l":4.69041575982343,"c":{"מ":1,"י":2,"ק":1,"ר":1,"א":2,"ָ":2,"ס":1,"פ":1,"ֿ":1,"ט":1,"ז":1,"ע":1,"ץ":1},"t":"MicrosoftTranslate"},"ਮਾਈਕਰੋਸੌਫਟ ਅਨੁਵਾਦਕ ਏਪੀਆਈ":{"s":{"ਮ","ੋ","ਫ","ਰ","ਈ","ਵ","ਸ","ਦ","ੀ","ਕ","ਨ","ਏ","ੌ","ਾ","ੁ","ਪ","ਟ","ਅ","ਆ"},"l":5.291502622129181,"c":{"ਮ":1,"ਾ":2,"ਈ":2,"ਕ":2,"ਰ":1,"ੋ":1,"ਸ":1,"ੌ":1,"ਫ":1,"ਟ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1,"ਏ":1,"ਪ":1,"ੀ":1,"ਆ":1},"t":"MicrosoftTranslate"},"API Transletor API Microsoft":{"s":{"n","o","f","t","l","c","r","s","m","a","p","e","i"},"l":7.681145747868608,"c":{"a":3,"p":2,"i":3,"t":3,"r":3,"n":1,"s":2,"l":1,"e":1,"o":3,"m":1,"c":1,"f":1},"t":"MicrosoftTranslate"},"Microsoft Terjemahan":{"s":{"a","n","h","f","j","t","r","s","m","c","o","e","i"},"l":5.5677643628300215,"c":{"m":2,"i":1,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"e":2,"j":1,"a":2,"h":1,"n":1},"t":"MicrosoftTranslate"},"Microsoft Tərcüməçi":{"s":{"f","ü","t","r","ə","s","m","ç","c","o","i"},"l":5.656854249492381,"c":{"m":2,"i":2,"c":2,"r":2,"o":2,"s":1,"f":1,"t":2,"ə":2,"ü":1,"ç":1},"t":"MicrosoftTranslate"},"„Microsoft Translate“":{"s":{"a","„","n","f","“","t","l","r","s","m","c","o","e","i"},"l":5.830951894845301,"c":{"„":1,"m":1,"i":1,"c":1,"r":2,"o":2,"s":2,"f":1,"t":3,"a":2,"n":1,"l":1,"e":1,"“":1},"t":"MicrosoftTranslate"},"Translator Ing promt":{"s":{"g","n","t","l","p","r","s","m","a","o","i"},"l":6.0,"c":{"t":3,"r":3,"a":2,"n":2,"s":1,"l":1,"o":2,"i":1,"g":1,"p":1,"m":1},"t":"MicrosoftTranslate"},"IMicrosoft":{"s":{"f","t","r","s","m","c","o","i"},"l":3.7416573867739413,"c":{"i":2,"m":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1},"t":"MicrosoftTranslate"},"माइक्रोसफ्ट अनुवादक एपीआई":{"s":{"ई","र","ट","क","ो","फ","ी","न","्","द","स","ए","प","इ","अ","म","ु","ा","व","आ"},"l":5.385164807134504,"c":{"म":1,"ा":2,"इ":1,"क":2,"्":2,"र":1,"ो":1,"स":1,"फ":1,"ट":1,"अ":1,"न":1,"ु":1,"व":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"MicrosoftTranslate"},"মাইক্রোসফ্ট অনুবাদক এপিআই":{"s":{"অ","ম","া","্","ি","আ","ব","স","ফ","ু","ই","ক","র","ো","এ","ন","দ","ট","প"},"l":5.5677643628300215,"c":{"ম":1,"া":2,"ই":2,"ক":2,"্":2,"র":1,"ো":1,"স":1,"ফ":1,"ট":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1,"এ":1,"প":1,"ি":1,"আ":1},"t":"MicrosoftTranslate"},"Microsoft Oersetter Api":{"s":{"a","f","t","p","r","s","m","c","o","e","i"},"l":7.0,"c":{"m":1,"i":2,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"e":3,"a":1,"p":1},"t":"MicrosoftTranslate"},"Traduzzione Micropoft":{"s":{"n","f","d","t","p","u","c","r","z","m","a","o","e","i"},"l":5.830951894845301,"c":{"t":2,"r":2,"a":1,"d":1,"u":1,"z":2,"i":2,"o":3,"n":1,"e":1,"m":1,"c":1,"p":1,"f":1},"t":"MicrosoftTranslate"},"ಮೈಕ್ರೋಸಾಫ್ಟ್ ಅನುವಾದಕ":{"s":{"ವ","ರ","ೋ","ಕ","ಸ","ೈ","್","ಅ","ಟ","ನ","ಫ","ಾ","ದ","ಮ","ು"},"l":5.385164807134504,"c":{"ಮ":1,"ೈ":1,"ಕ":2,"್":3,"ರ":1,"ೋ":1,"ಸ":1,"ಾ":2,"ಫ":1,"ಟ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ದ":1},"t":"MicrosoftTranslate"},"मायक्रोसॉफ्ट ट्रान्सलेटर":{"s":{"फ","े","ॉ","न","्","ा","र","स","ट","ल","क","ो","म","य"},"l":7.14142842854285,"c":{"म":1,"ा":2,"य":1,"क":1,"्":4,"र":3,"ो":1,"स":2,"ॉ":1,"फ":1,"ट":3,"न":1,"ल":1,"े":1},"t":"MicrosoftTranslate"},"Traducteur de Microsoft":{"s":{"f","d","t","u","c","r","s","m","a","o","e","i"},"l":6.557438524302,"c":{"t":3,"r":3,"a":1,"d":2,"u":2,"c":2,"e":2,"m":1,"i":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"মাইক্রোসফ্ট":{"s":{"ই","ম","ক","র","ট","া","ো","স","্","ফ"},"l":3.605551275463989,"c":{"ম":1,"া":1,"ই":1,"ক":1,"্":2,"র":1,"ো":1,"স":1,"ফ":1,"ট":1},"t":"MicrosoftTranslate"},"API Microsoft Translator":{"s":{"a","n","o","f","t","l","r","s","m","c","p","i"},"l":7.0710678118654755,"c":{"a":3,"p":1,"i":2,"m":1,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"n":1,"l":1},"t":"MicrosoftTranslate"},"Microsoft अनुवादक एपीआई":{"s":{"f","ई","क","ी","न","द","r","m","o","i","ए","प","t","अ","s","c","ु","ा","व","आ"},"l":4.795831523312719,"c":{"m":1,"i":1,"c":1,"r":1,"o":2,"s":1,"f":1,"t":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"MicrosoftTranslate"},"Translator Ing Promt":{"s":{"g","n","t","l","p","r","s","m","a","o","i"},"l":6.0,"c":{"t":3,"r":3,"a":2,"n":2,"s":1,"l":1,"o":2,"i":1,"g":1,"p":1,"m":1},"t":"BingTranslate"},"„Microsoft“ vertėjo API":{"s":{"a","„","f","j","“","t","v","p","r","s","m","c","o","e","i","ė"},"l":5.744562646538029,"c":{"„":1,"m":1,"i":2,"c":1,"r":2,"o":3,"s":1,"f":1,"t":2,"“":1,"v":1,"e":1,"ė":1,"j":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Prekladateľ spoločnosti Microsoft":{"s":{"č","n","o","d","f","ľ","l","t","c","r","s","m","k","a","p","e","i"},"l":8.660254037844387,"c":{"p":2,"r":2,"e":2,"k":1,"l":2,"a":2,"d":1,"t":3,"ľ":1,"s":3,"o":5,"č":1,"n":1,"i":2,"m":1,"c":1,"f":1},"t":"MicrosoftTranslate"},"API di Microsoft Transport":{"s":{"n","o","d","f","t","c","r","s","m","a","p","i"},"l":7.280109889280518,"c":{"a":2,"p":2,"i":3,"d":1,"m":1,"c":1,"r":3,"o":3,"s":2,"f":1,"t":3,"n":1},"t":"MicrosoftTranslate"},"Microsoft mofetoleli":{"s":{"f","t","l","r","s","m","c","o","e","i"},"l":6.557438524302,"c":{"m":2,"i":2,"c":1,"r":1,"o":4,"s":1,"f":2,"t":2,"e":2,"l":2},"t":"MicrosoftTranslate"},"Microsoft ntụgharị API":{"s":{"a","g","n","h","f","t","p","r","s","m","ụ","ị","c","o","i"},"l":5.477225575051661,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"n":1,"ụ":1,"g":1,"h":1,"a":2,"ị":1,"p":1},"t":"MicrosoftTranslate"},"ਮਾਈਕਰੋਸੌਫਟ ਅਨੁਵਾਦ ਕਰੋ":{"s":{"ਮ","ਈ","ੌ","ਕ","ਾ","ੋ","ਫ","ਵ","ਟ","ੁ","ਰ","ਅ","ਸ","ਨ","ਦ"},"l":5.196152422706632,"c":{"ਮ":1,"ਾ":2,"ਈ":1,"ਕ":2,"ਰ":2,"ੋ":2,"ਸ":1,"ੌ":1,"ਫ":1,"ਟ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1},"t":"MicrosoftTranslate"},"Mutrosoft":{"s":{"f","t","u","r","s","m","o"},"l":3.605551275463989,"c":{"m":1,"u":1,"t":2,"r":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"ମାଇକ୍ରୋସଫ୍ଟ ଅନୁବାଦକ API |":{"s":{"ଦ","ମ","a","ୁ","ା","୍","ବ","ନ","ର","ଅ","ଇ","ୋ","i","ଫ","|","ଟ","ସ","କ","p"},"l":5.291502622129181,"c":{"ମ":1,"ା":2,"ଇ":1,"କ":2,"୍":2,"ର":1,"ୋ":1,"ସ":1,"ଫ":1,"ଟ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ଦ":1,"a":1,"p":1,"i":1,"|":1},"t":"MicrosoftTranslate"},"Microsoft traduit":{"s":{"a","f","d","t","u","r","s","m","c","o","i"},"l":5.291502622129181,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":3,"a":1,"d":1,"u":1},"t":"MicrosoftTranslate"},"మైక్రోసాఫ్ట్ అనువాదకుడు":{"s":{"మ","ఫ","స","ర","ై","్","క","ు","ా","ద","వ","న","డ","ట","ో","అ"},"l":6.164414002968976,"c":{"మ":1,"ై":1,"క":2,"్":3,"ర":1,"ో":1,"స":1,"ా":2,"ఫ":1,"ట":1,"అ":1,"న":1,"ు":3,"వ":1,"ద":1,"డ":1},"t":"MicrosoftTranslate"},"مایکروسافټ ژباړه":{"s":{"ب","و","ک","ی","ړ","س","ف","ا","ټ","م","ر","ژ","ه"},"l":4.58257569495584,"c":{"م":1,"ا":3,"ی":1,"ک":1,"ر":1,"و":1,"س":1,"ف":1,"ټ":1,"ژ":1,"ب":1,"ړ":1,"ه":1},"t":"MicrosoftTranslate"},"Microsoft Oversættelse":{"s":{"f","t","l","v","r","æ","s","m","c","o","e","i"},"l":6.855654600401044,"c":{"m":1,"i":1,"c":1,"r":2,"o":3,"s":3,"f":1,"t":3,"v":1,"e":3,"æ":1,"l":1},"t":"MicrosoftTranslate"},"Umhumushi we-Microsoft API":{"s":{"a","h","f","w","t","p","u","r","-","s","m","c","o","e","i"},"l":6.928203230275509,"c":{"u":3,"m":3,"h":2,"s":2,"i":3,"w":1,"e":1,"-":1,"c":1,"r":1,"o":2,"f":1,"t":1,"a":1,"p":1},"t":"MicrosoftTranslate"},"Cyfieithu microsoft":{"s":{"h","f","t","u","r","y","s","m","c","o","e","i"},"l":5.656854249492381,"c":{"c":2,"y":1,"f":2,"i":3,"e":1,"t":2,"h":1,"u":1,"m":1,"r":1,"o":2,"s":1},"t":"MicrosoftTranslate"},"మైక్రోసాఫ్ట్ అనువాదకుడు API":{"s":{"మ","ఫ","ై","ద","ు","a","స","డ","అ","i","ర","ట","ో","న","్","క","ా","వ","p"},"l":6.4031242374328485,"c":{"మ":1,"ై":1,"క":2,"్":3,"ర":1,"ో":1,"స":1,"ా":2,"ఫ":1,"ట":1,"అ":1,"న":1,"ు":3,"వ":1,"ద":1,"డ":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"Microsoft tradwi":{"s":{"a","f","d","w","t","r","s","m","c","o","i"},"l":4.795831523312719,"c":{"m":1,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":2,"a":1,"d":1,"w":1},"t":"MicrosoftTranslate"},"Microsoft çevirmen":{"s":{"n","f","t","v","r","s","m","ç","c","o","e","i"},"l":5.196152422706632,"c":{"m":2,"i":2,"c":1,"r":2,"o":2,"s":1,"f":1,"t":1,"ç":1,"e":2,"v":1,"n":1},"t":"MicrosoftTranslate"},"Eadar-theangaiche Microsoft":{"s":{"g","n","h","f","d","t","c","r","-","s","m","a","o","e","i"},"l":7.483314773547883,"c":{"e":3,"a":4,"d":1,"r":2,"-":1,"t":2,"h":2,"n":1,"g":1,"i":2,"c":2,"m":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"마이크로 소프트":{"s":{"트","마","크","프","이","소","로"},"l":2.6457513110645907,"c":{"마":1,"이":1,"크":1,"로":1,"소":1,"프":1,"트":1},"t":"MicrosoftTranslate"},"ମାଇକ୍ରୋସଫ୍ଟ ଅନୁବାଦକ |":{"s":{"ଫ","ା","ୁ","୍","ଦ","ବ","ନ","|","ସ","ଟ","ମ","ର","ଅ","ଇ","କ","ୋ"},"l":5.0,"c":{"ମ":1,"ା":2,"ଇ":1,"କ":2,"୍":2,"ର":1,"ୋ":1,"ସ":1,"ଫ":1,"ଟ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ଦ":1,"|":1},"t":"MicrosoftTranslate"},"מייקראָסאָפֿט איבערזעצער":{"s":{"י","ב","ָ","פ","ע","ז","צ","ק","ס","ט","ֿ","א","ר","מ"},"l":7.0,"c":{"מ":1,"י":3,"ק":1,"ר":3,"א":3,"ָ":2,"ס":1,"פ":1,"ֿ":1,"ט":1,"ב":1,"ע":3,"ז":1,"צ":1},"t":"MicrosoftTranslate"},"API dịch thuật Microsoft":{"s":{"ậ","h","o","d","f","t","u","c","r","s","m","ị","a","p","i"},"l":5.916079783099616,"c":{"a":1,"p":1,"i":2,"d":1,"ị":1,"c":2,"h":2,"t":3,"u":1,"ậ":1,"m":1,"r":1,"o":2,"s":1,"f":1},"t":"MicrosoftTranslate"},"مائڪروسوفٽ مترجم API":{"s":{"ئ","و","س","ف","ا","p","ٽ","م","ر","ت","a","ج","ڪ","i"},"l":5.291502622129181,"c":{"م":3,"ا":1,"ئ":1,"ڪ":1,"ر":2,"و":2,"س":1,"ف":1,"ٽ":1,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"API Microsoft Traductor":{"s":{"a","o","f","d","t","u","r","s","m","c","p","i"},"l":6.708203932499369,"c":{"a":2,"p":1,"i":2,"m":1,"c":2,"r":3,"o":3,"s":1,"f":1,"t":3,"d":1,"u":1},"t":"MicrosoftTranslate"},"Aistritheoir Microsoft":{"s":{"h","f","t","c","r","s","m","a","o","e","i"},"l":7.280109889280518,"c":{"a":1,"i":4,"s":2,"t":3,"r":3,"h":1,"e":1,"o":3,"m":1,"c":1,"f":1},"t":"MicrosoftTranslate"},"مترجم مایکروسافت":{"s":{"و","ک","ی","س","ف","ا","م","ر","ت","ج"},"l":5.196152422706632,"c":{"م":3,"ت":2,"ر":2,"ج":1,"ا":2,"ی":1,"ک":1,"و":1,"س":1,"ف":1},"t":"MicrosoftTranslate"},"د مایکروسافټ ژباړن API":{"s":{"ب","و","ک","ی","ړ","س","ف","ا","ټ","م","ر","ژ","a","p","ن","i","د"},"l":5.0,"c":{"د":1,"م":1,"ا":3,"ی":1,"ک":1,"ر":1,"و":1,"س":1,"ف":1,"ټ":1,"ژ":1,"ب":1,"ړ":1,"ن":1,"a":1,"p":1,"i":1},"t":"MicrosoftTranslate"},"Tātari Whakawhitiwhiti":{"s":{"h","w","t","r","k","a","i","ā"},"l":8.426149773176359,"c":{"t":4,"ā":1,"a":3,"r":1,"i":5,"w":3,"h":3,"k":1},"t":"MicrosoftTranslate"},"Yandexi tõlkija":{"s":{"n","d","j","t","l","y","k","õ","a","e","i","x"},"l":4.242640687119285,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"i":2,"t":1,"õ":1,"l":1,"k":1,"j":1},"t":"YandexTranslate"},"ইয়ানডেক্স অনুবাদ":{"s":{"য","অ","ু","ই","ন","দ","ক","্","়","া","ব","স","ড","ে"},"l":4.47213595499958,"c":{"ই":1,"য":1,"়":1,"া":2,"ন":2,"ড":1,"ে":1,"ক":1,"্":1,"স":1,"অ":1,"ু":1,"ব":1,"দ":1},"t":"YandexTranslate"},"Yandex prevodilac API":{"s":{"n","o","d","l","v","c","r","y","a","p","e","i","x"},"l":5.744562646538029,"c":{"y":1,"a":3,"n":1,"d":2,"e":2,"x":1,"p":2,"r":1,"v":1,"o":1,"i":2,"l":1,"c":1},"t":"YandexTranslate"},"YandEx":{"s":{"n","d","y","a","e","x"},"l":2.449489742783178,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Яндсия":{"s":{"н","и","я","с","д"},"l":2.8284271247461903,"c":{"я":2,"н":1,"д":1,"с":1,"и":1},"t":"YandexTranslate"},"Перакладчык Yandex":{"s":{"к","a","л","ч","n","d","а","e","д","y","р","ы","п","е","x"},"l":4.58257569495584,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"يونديڪس":{"s":{"و","ي","س","ڪ","ن","د"},"l":3.0,"c":{"ي":2,"و":1,"ن":1,"د":1,"ڪ":1,"س":1},"t":"YandexTranslate"},"Јандекс превод":{"s":{"к","н","р","в","с","а","ј","д","о","п","е"},"l":4.123105625617661,"c":{"ј":1,"а":1,"н":1,"д":2,"е":2,"к":1,"с":1,"п":1,"р":1,"в":1,"о":1},"t":"YandexTranslate"},"Yandex þýðandi API":{"s":{"þ","ð","n","d","ý","y","a","p","e","i","x"},"l":5.291502622129181,"c":{"y":1,"a":3,"n":2,"d":2,"e":1,"x":1,"þ":1,"ý":1,"ð":1,"i":2,"p":1},"t":"YandexTranslate"},"Apziana Yandex":{"s":{"n","d","y","z","a","p","e","i","x"},"l":5.196152422706632,"c":{"a":4,"p":1,"z":1,"i":1,"n":2,"y":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex vertaal":{"s":{"n","d","t","l","v","r","y","a","e","x"},"l":4.58257569495584,"c":{"y":1,"a":3,"n":1,"d":1,"e":2,"x":1,"v":1,"r":1,"t":1,"l":1},"t":"YandexTranslate"},"யாண்டெக்ஸ் மொழிபெயர்ப்பாளர் ஏபிஐ":{"s":{"ட","ள","ெ","ொ","ஐ","ம","ர","ண","க","ஏ","்","ா","ய","ப","ழ","ஸ","ி"},"l":9.055385138137417,"c":{"ய":2,"ா":2,"ண":1,"்":6,"ட":1,"ெ":2,"க":1,"ஸ":1,"ம":1,"ொ":1,"ழ":1,"ி":2,"ப":4,"ர":2,"ள":1,"ஏ":1,"ஐ":1},"t":"YandexTranslate"},"Aistritheoir Yandex":{"s":{"n","h","d","t","r","y","s","a","o","e","i","x"},"l":5.656854249492381,"c":{"a":2,"i":3,"s":1,"t":2,"r":2,"h":1,"e":2,"o":1,"y":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"یاندیکس مترجم API":{"s":{"ک","ی","س","p","ا","م","ر","ت","a","ج","ن","i","د"},"l":4.358898943540674,"c":{"ی":2,"ا":1,"ن":1,"د":1,"ک":1,"س":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"מתרגם ינדקס":{"s":{"ת","נ","ג","י","ק","ס","ם","ד","ר","מ"},"l":3.1622776601683795,"c":{"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"י":1,"נ":1,"ד":1,"ק":1,"ס":1},"t":"YandexTranslate"},"یاندیکس":{"s":{"ک","ی","س","ا","ن","د"},"l":3.0,"c":{"ی":2,"ا":1,"ن":1,"د":1,"ک":1,"س":1},"t":"YandexTranslate"},"Yandex വിവർത്തനം":{"s":{"ി","n","ത","d","വ","ർ","്","y","ം","a","e","ന","x"},"l":4.358898943540674,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1},"t":"YandexTranslate"},"Tarjamah Yandex API":{"s":{"n","h","j","d","t","r","y","m","a","p","e","i","x"},"l":6.082762530298219,"c":{"t":1,"a":5,"r":1,"j":1,"m":1,"h":1,"y":1,"n":1,"d":1,"e":1,"x":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex Пераклад":{"s":{"к","е","л","n","п","d","а","y","д","р","a","e","x"},"l":4.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"п":1,"е":1,"р":1,"а":2,"к":1,"л":1,"д":1},"t":"YandexTranslate"},"Yandex prevajalec API":{"s":{"n","d","j","l","v","c","r","y","a","p","e","i","x"},"l":6.244997998398398,"c":{"y":1,"a":4,"n":1,"d":1,"e":3,"x":1,"p":2,"r":1,"v":1,"j":1,"l":1,"c":1,"i":1},"t":"YandexTranslate"},"Иандек Транслатор АПИ":{"s":{"к","н","л","и","р","с","а","д","о","п","е","т"},"l":6.244997998398398,"c":{"и":2,"а":4,"н":2,"д":1,"е":1,"к":1,"т":2,"р":2,"с":1,"л":1,"о":1,"п":1},"t":"YandexTranslate"},"Yandex Tanthauzirani":{"s":{"n","h","d","t","u","r","y","z","a","e","i","x"},"l":6.4031242374328485,"c":{"y":1,"a":4,"n":3,"d":1,"e":1,"x":1,"t":2,"h":1,"u":1,"z":1,"i":2,"r":1},"t":"YandexTranslate"},"API tat-Traduttur Yandex":{"s":{"n","d","t","u","r","-","y","a","p","e","i","x"},"l":7.745966692414834,"c":{"a":4,"p":1,"i":1,"t":5,"-":1,"r":2,"d":2,"u":2,"y":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"Յանդեքս":{"s":{"ա","յ","ք","ս","ն","ե","դ"},"l":2.6457513110645907,"c":{"յ":1,"ա":1,"ն":1,"դ":1,"ե":1,"ք":1,"ս":1},"t":"YandexTranslate"},"API tłumacza Yandex":{"s":{"n","d","t","ł","u","c","y","z","m","a","p","e","i","x"},"l":5.385164807134504,"c":{"a":4,"p":1,"i":1,"t":1,"ł":1,"u":1,"m":1,"c":1,"z":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"API перекладача Yandex":{"s":{"к","л","ч","п","n","d","а","e","д","y","р","a","p","е","i","x"},"l":5.477225575051661,"c":{"a":2,"p":1,"i":1,"п":1,"е":2,"р":1,"к":1,"л":1,"а":3,"д":1,"ч":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex prevoditelj":{"s":{"n","o","d","j","t","l","v","r","y","a","p","e","i","x"},"l":5.0,"c":{"y":1,"a":1,"n":1,"d":2,"e":3,"x":1,"p":1,"r":1,"v":1,"o":1,"i":1,"t":1,"l":1,"j":1},"t":"YandexTranslate"},"Yandex übersetzen":{"s":{"n","b","ü","d","t","r","y","s","z","a","e","x"},"l":5.477225575051661,"c":{"y":1,"a":1,"n":2,"d":1,"e":4,"x":1,"ü":1,"b":1,"r":1,"s":1,"t":1,"z":1},"t":"YandexTranslate"},"Перекладач Яндекс":{"s":{"к","л","ч","н","я","с","а","д","р","п","е"},"l":5.291502622129181,"c":{"п":1,"е":3,"р":1,"к":2,"л":1,"а":2,"д":2,"ч":1,"я":1,"н":1,"с":1},"t":"YandexTranslate"},"Yandex interpres API":{"s":{"n","d","t","r","y","s","a","p","e","i","x"},"l":5.830951894845301,"c":{"y":1,"a":2,"n":2,"d":1,"e":3,"x":1,"i":2,"t":1,"r":2,"p":2,"s":1},"t":"YandexTranslate"},"API של מתרגם Yandex":{"s":{"ת","ג","ש","ר","n","d","x","y","ל","ם","a","p","e","i","מ"},"l":4.242640687119285,"c":{"a":2,"p":1,"i":1,"ש":1,"ל":1,"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Яндекс аудармашы API":{"s":{"к","н","ш","р","я","ы","с","а","д","м","у","a","p","е","i"},"l":5.0990195135927845,"c":{"я":1,"н":1,"д":2,"е":1,"к":1,"с":1,"а":3,"у":1,"р":1,"м":1,"ш":1,"ы":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex Iwwersetzer":{"s":{"n","d","w","t","r","y","s","z","a","e","i","x"},"l":5.744562646538029,"c":{"y":1,"a":1,"n":1,"d":1,"e":4,"x":1,"i":1,"w":2,"r":2,"s":1,"t":1,"z":1},"t":"YandexTranslate"},"Yandex -kääntäjä":{"s":{"n","d","j","t","y","-","ä","k","a","e","x"},"l":5.385164807134504,"c":{"y":1,"a":1,"n":2,"d":1,"e":1,"x":1,"-":1,"k":1,"ä":4,"t":1,"j":1},"t":"YandexTranslate"},"Yandex prevajalec":{"s":{"n","d","j","l","v","c","r","y","a","p","e","x"},"l":5.291502622129181,"c":{"y":1,"a":3,"n":1,"d":1,"e":3,"x":1,"p":1,"r":1,"v":1,"j":1,"l":1,"c":1},"t":"YandexTranslate"},"Yandex tõlkib":{"s":{"n","b","d","t","l","y","k","õ","a","e","i","x"},"l":3.4641016151377544,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"t":1,"õ":1,"l":1,"k":1,"i":1,"b":1},"t":"YandexTranslate"},"Yandex tradueix":{"s":{"n","d","t","u","r","y","a","e","i","x"},"l":4.69041575982343,"c":{"y":1,"a":2,"n":1,"d":2,"e":2,"x":2,"t":1,"r":1,"u":1,"i":1},"t":"YandexTranslate"},"یاندکس مترجم API":{"s":{"ک","ی","س","p","ا","م","ر","ت","a","ج","ن","i","د"},"l":4.0,"c":{"ی":1,"ا":1,"ن":1,"د":1,"ک":1,"س":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex თარჯიმანი":{"s":{"თ","n","d","ჯ","ი","ა","რ","მ","ნ","y","a","e","x"},"l":4.358898943540674,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"YandexTranslate"},"API Translator Yandex":{"s":{"n","o","d","t","l","r","y","s","a","p","e","i","x"},"l":6.082762530298219,"c":{"a":4,"p":1,"i":1,"t":2,"r":2,"n":2,"s":1,"l":1,"o":1,"y":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"ያንድስቲክ ተርጓሚ ኤፒአይ":{"s":{"ቲ","ክ","ይ","ድ","ሚ","አ","ስ","ተ","ኤ","ፒ","ን","ር","ጓ","ያ"},"l":3.7416573867739413,"c":{"ያ":1,"ን":1,"ድ":1,"ስ":1,"ቲ":1,"ክ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"YandexTranslate"},"API do tradutor do Yandex":{"s":{"n","d","t","p","u","r","y","a","o","e","i","x"},"l":7.0,"c":{"a":3,"p":1,"i":1,"d":4,"o":3,"t":2,"r":2,"u":1,"y":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"ינדקס":{"s":{"נ","י","ק","ס","ד"},"l":2.23606797749979,"c":{"י":1,"נ":1,"ד":1,"ק":1,"ס":1},"t":"YandexTranslate"},"Yandex tulkotājs":{"s":{"n","d","ā","j","t","l","u","y","s","k","a","o","e","x"},"l":4.123105625617661,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"t":2,"u":1,"l":1,"k":1,"o":1,"ā":1,"j":1,"s":1},"t":"YandexTranslate"},"Yandexöversättare":{"s":{"n","d","t","v","ö","y","r","s","ä","a","e","x"},"l":5.385164807134504,"c":{"y":1,"a":2,"n":1,"d":1,"e":3,"x":1,"ö":1,"v":1,"r":2,"s":1,"ä":1,"t":2},"t":"YandexTranslate"},"Yandex tarjimoni":{"s":{"n","d","j","t","r","y","m","a","o","e","i","x"},"l":4.58257569495584,"c":{"y":1,"a":2,"n":2,"d":1,"e":1,"x":1,"t":1,"r":1,"j":1,"i":2,"m":1,"o":1},"t":"YandexTranslate"},"Yandex Mai Fassara API":{"s":{"n","f","d","r","y","s","m","a","p","e","i","x"},"l":7.280109889280518,"c":{"y":1,"a":6,"n":1,"d":1,"e":1,"x":1,"m":1,"i":2,"f":1,"s":2,"r":1,"p":1},"t":"YandexTranslate"},"Yandex Humusha":{"s":{"n","h","d","u","y","s","m","a","e","x"},"l":4.358898943540674,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"h":2,"u":2,"m":1,"s":1},"t":"YandexTranslate"},"Prekladateľ Yandex":{"s":{"n","d","ľ","l","t","r","y","k","a","p","e","x"},"l":5.5677643628300215,"c":{"p":1,"r":1,"e":3,"k":1,"l":1,"a":3,"d":2,"t":1,"ľ":1,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"„Yandex“ vertėjo API":{"s":{"ė","„","n","d","“","j","t","v","p","r","y","a","o","e","i","x"},"l":4.69041575982343,"c":{"„":1,"y":1,"a":2,"n":1,"d":1,"e":2,"x":1,"“":1,"v":1,"r":1,"t":1,"ė":1,"j":1,"o":1,"p":1,"i":1},"t":"YandexTranslate"},"यॅन्डेक्स":{"s":{"े","ड","ॅ","न","्","स","क","य"},"l":3.3166247903554,"c":{"य":1,"ॅ":1,"न":1,"्":2,"ड":1,"े":1,"क":1,"स":1},"t":"YandexTranslate"},"Yandex ژباړه":{"s":{"ب","n","d","ړ","ا","y","ژ","ه","a","e","x"},"l":3.3166247903554,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1},"t":"YandexTranslate"},"API Penerjemah Yandex":{"s":{"n","h","j","d","r","y","m","a","p","e","i","x"},"l":6.4031242374328485,"c":{"a":3,"p":2,"i":1,"e":4,"n":2,"r":1,"j":1,"m":1,"h":1,"y":1,"d":1,"x":1},"t":"YandexTranslate"},"Yandex prevoditelj API":{"s":{"n","o","d","j","t","l","v","r","y","a","p","e","i","x"},"l":5.830951894845301,"c":{"y":1,"a":2,"n":1,"d":2,"e":3,"x":1,"p":2,"r":1,"v":1,"o":1,"i":2,"t":1,"l":1,"j":1},"t":"YandexTranslate"},"Parafe ea YandEx API":{"s":{"n","f","d","r","y","a","p","e","i","x"},"l":6.708203932499369,"c":{"p":2,"a":5,"r":1,"f":1,"e":3,"y":1,"n":1,"d":1,"x":1,"i":1},"t":"YandexTranslate"},"Përkthyesi Yandex":{"s":{"ë","n","h","d","t","r","y","s","k","a","p","e","i","x"},"l":4.47213595499958,"c":{"p":1,"ë":1,"r":1,"k":1,"t":1,"h":1,"y":2,"e":2,"s":1,"i":1,"a":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"Yandex faaliliu API":{"s":{"n","f","d","l","u","y","a","p","e","i","x"},"l":6.082762530298219,"c":{"y":1,"a":4,"n":1,"d":1,"e":1,"x":1,"f":1,"l":2,"i":3,"u":1,"p":1},"t":"YandexTranslate"},"Yandex tulkot":{"s":{"n","d","t","l","u","y","k","a","o","e","x"},"l":3.7416573867739413,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"t":2,"u":1,"l":1,"k":1,"o":1},"t":"YandexTranslate"},"Μεταφραστής Yandex":{"s":{"α","ρ","a","ή","n","ς","d","μ","y","ε","σ","τ","φ","e","x"},"l":4.58257569495584,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex kääntää":{"s":{"n","d","t","y","ä","k","a","e","x"},"l":5.196152422706632,"c":{"y":1,"a":1,"n":2,"d":1,"e":1,"x":1,"k":1,"ä":4,"t":1},"t":"YandexTranslate"},"Yandex Translator Api":{"s":{"n","d","t","l","p","r","y","s","a","o","e","i","x"},"l":6.082762530298219,"c":{"y":1,"a":4,"n":2,"d":1,"e":1,"x":1,"t":2,"r":2,"s":1,"l":1,"o":1,"p":1,"i":1},"t":"YandexTranslate"},"యాండెక్స్ అనువాదం":{"s":{"స","ె","య","డ","క","ా","ం","్","న","ద","వ","ు","అ"},"l":4.69041575982343,"c":{"య":1,"ా":2,"ం":2,"డ":1,"ె":1,"క":1,"్":2,"స":1,"అ":1,"న":1,"ు":1,"వ":1,"ద":1},"t":"YandexTranslate"},"යැන්ඩෙක්ස් පරිවර්තකය":{"s":{"ි","න","ව","ැ","ඩ","ප","ත","ක","ෙ","්","ස","ය","ර"},"l":6.082762530298219,"c":{"ය":2,"ැ":1,"න":1,"්":4,"ඩ":1,"ෙ":1,"ක":2,"ස":1,"ප":1,"ර":2,"ි":1,"ව":1,"ත":1},"t":"YandexTranslate"},"API de traductor de Yandex":{"s":{"n","o","d","t","u","c","r","y","a","p","e","i","x"},"l":7.0710678118654755,"c":{"a":3,"p":1,"i":1,"d":4,"e":3,"t":2,"r":2,"u":1,"c":1,"o":1,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"API на преведувачот Yandex":{"s":{"y","д","п","a","т","d","а","i","n","о","e","x","н","ч","в","р","у","p","е"},"l":5.5677643628300215,"c":{"a":2,"p":1,"i":1,"н":1,"а":2,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"ч":1,"о":1,"т":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex翻译":{"s":{"n","d","译","y","翻","a","e","x"},"l":2.8284271247461903,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"翻":1,"译":1},"t":"YandexTranslate"},"Yandex -tradukisto API":{"s":{"n","d","t","p","u","r","y","-","s","k","a","o","e","i","x"},"l":5.656854249492381,"c":{"y":1,"a":3,"n":1,"d":2,"e":1,"x":1,"-":1,"t":2,"r":1,"u":1,"k":1,"i":2,"s":1,"o":1,"p":1},"t":"YandexTranslate"},"יאַנדעקס טראַנסלאַטאָר אַפּי":{"s":{"נ","י","ָ","ע","פ","ק","ס","ט","ּ","ל","ַ","ד","א","ר"},"l":8.246211251235321,"c":{"י":2,"א":5,"ַ":4,"נ":2,"ד":1,"ע":1,"ק":1,"ס":2,"ט":2,"ר":2,"ל":1,"ָ":1,"פ":1,"ּ":1},"t":"YandexTranslate"},"יאַנדעקס זעץ":{"s":{"נ","י","ע","ז","ק","ס","ַ","ץ","ד","א"},"l":3.605551275463989,"c":{"י":1,"א":1,"ַ":1,"נ":1,"ד":1,"ע":2,"ק":1,"ס":1,"ז":1,"ץ":1},"t":"YandexTranslate"},"ינדקס תרגם":{"s":{"ת","נ","ג","י","ק","ס","ם","ד","ר"},"l":3.0,"c":{"י":1,"נ":1,"ד":1,"ק":1,"ס":1,"ת":1,"ר":1,"ג":1,"ם":1},"t":"YandexTranslate"},"Yandex თარჯიმანი API":{"s":{"თ","n","d","ჯ","ი","ა","რ","მ","ნ","y","a","p","e","i","x"},"l":4.898979485566356,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"p":1,"i":1},"t":"YandexTranslate"},"யாண்டெக்ஸ்":{"s":{"ட","ெ","ண","க","்","ா","ய","ஸ"},"l":4.0,"c":{"ய":1,"ா":1,"ண":1,"்":3,"ட":1,"ெ":1,"க":1,"ஸ":1},"t":"YandexTranslate"},"I-Yandex Translation Api":{"s":{"n","d","t","l","p","r","y","-","s","a","o","e","i","x"},"l":6.928203230275509,"c":{"i":3,"-":1,"y":1,"a":4,"n":3,"d":1,"e":1,"x":1,"t":2,"r":1,"s":1,"l":1,"o":1,"p":1},"t":"YandexTranslate"},"I-Yandex Guqula":{"s":{"g","n","d","l","u","q","y","-","a","e","i","x"},"l":4.242640687119285,"c":{"i":1,"-":1,"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"g":1,"u":2,"q":1,"l":1},"t":"YandexTranslate"},"Onye ntụgharị Yandex":{"s":{"g","n","h","d","t","r","y","ụ","ị","a","o","e","x"},"l":5.477225575051661,"c":{"o":1,"n":3,"y":2,"e":2,"t":1,"ụ":1,"g":1,"h":1,"a":2,"r":1,"ị":1,"d":1,"x":1},"t":"YandexTranslate"},"Yandex ແປພາສາ":{"s":{"n","ປ","ພ","d","ສ","າ","y","a","ແ","e","x"},"l":3.7416573867739413,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1},"t":"YandexTranslate"},"යැන්ඩෙක්ස්":{"s":{"න","ැ","ඩ","ක","ෙ","්","ස","ය"},"l":4.0,"c":{"ය":1,"ැ":1,"න":1,"්":3,"ඩ":1,"ෙ":1,"ක":1,"ස":1},"t":"YandexTranslate"},"Yandex Tafsiri":{"s":{"n","f","d","t","r","y","s","a","e","i","x"},"l":4.123105625617661,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"t":1,"f":1,"s":1,"i":2,"r":1},"t":"YandexTranslate"},"„Yandex“ vertėjas":{"s":{"ė","„","n","d","“","j","t","v","r","y","s","a","e","x"},"l":4.47213595499958,"c":{"„":1,"y":1,"a":2,"n":1,"d":1,"e":2,"x":1,"“":1,"v":1,"r":1,"t":1,"ė":1,"j":1,"s":1},"t":"YandexTranslate"},"Yandex traduzzione":{"s":{"n","d","t","u","r","y","z","a","o","e","i","x"},"l":5.196152422706632,"c":{"y":1,"a":2,"n":2,"d":2,"e":2,"x":1,"t":1,"r":1,"u":1,"z":2,"i":1,"o":1},"t":"YandexTranslate"},"Yandex traduce":{"s":{"n","d","t","u","c","r","y","a","e","x"},"l":4.358898943540674,"c":{"y":1,"a":2,"n":1,"d":2,"e":2,"x":1,"t":1,"r":1,"u":1,"c":1},"t":"YandexTranslate"},"யாண்டெக்ஸ் மொழிபெயர்ப்பாளர்":{"s":{"ட","ள","ெ","ொ","ம","ர","ண","க","்","ா","ய","ப","ழ","ஸ","ி"},"l":8.366600265340756,"c":{"ய":2,"ா":2,"ண":1,"்":6,"ட":1,"ெ":2,"க":1,"ஸ":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ர":2,"ள":1},"t":"YandexTranslate"},"Yandex орчуулагч API":{"s":{"л","ч","n","d","а","г","y","р","о","у","a","p","e","i","x"},"l":4.898979485566356,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"p":1,"i":1},"t":"YandexTranslate"},"યાંદેક્સ":{"s":{"ા","સ","્","ય","ે","ક","ં","દ"},"l":2.8284271247461903,"c":{"ય":1,"ા":1,"ં":1,"દ":1,"ે":1,"ક":1,"્":1,"સ":1},"t":"YandexTranslate"},"Yandex Fassara":{"s":{"n","f","d","r","y","s","a","e","x"},"l":5.196152422706632,"c":{"y":1,"a":4,"n":1,"d":1,"e":1,"x":1,"f":1,"s":2,"r":1},"t":"YandexTranslate"},"యాండెక్స్ అనువాదకుడు":{"s":{"స","ె","య","డ","క","ా","ం","్","న","ద","వ","ు","అ"},"l":5.744562646538029,"c":{"య":1,"ా":2,"ం":1,"డ":2,"ె":1,"క":2,"్":2,"స":1,"అ":1,"న":1,"ు":3,"వ":1,"ద":1},"t":"YandexTranslate"},"Yandex itzultzailea APIa":{"s":{"n","d","t","l","u","y","z","a","p","e","i","x"},"l":7.483314773547883,"c":{"y":1,"a":5,"n":1,"d":1,"e":2,"x":1,"i":3,"t":2,"z":2,"u":1,"l":2,"p":1},"t":"YandexTranslate"},"Onye ntụgharị Yandex API":{"s":{"g","n","h","d","t","p","r","y","ụ","ị","a","o","e","i","x"},"l":6.082762530298219,"c":{"o":1,"n":3,"y":2,"e":2,"t":1,"ụ":1,"g":1,"h":1,"a":3,"r":1,"ị":1,"d":1,"x":1,"p":1,"i":1},"t":"YandexTranslate"},"यॅन्डेक्स भाषांतर":{"s":{"भ","े","ड","ॅ","न","्","त","ा","स","र","ं","क","ष","य"},"l":4.47213595499958,"c":{"य":1,"ॅ":1,"न":1,"्":2,"ड":1,"े":1,"क":1,"स":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1},"t":"YandexTranslate"},"Yandex Translation":{"s":{"n","d","t","l","r","y","s","a","o","e","i","x"},"l":5.5677643628300215,"c":{"y":1,"a":3,"n":3,"d":1,"e":1,"x":1,"t":2,"r":1,"s":1,"l":1,"i":1,"o":1},"t":"YandexTranslate"},"Tunu kan":{"s":{"n","t","u","k","a"},"l":3.3166247903554,"c":{"t":1,"u":2,"n":2,"k":1,"a":1},"t":"YandexTranslate"},"یاندکس":{"s":{"ک","ی","س","ا","ن","د"},"l":2.449489742783178,"c":{"ی":1,"ا":1,"ن":1,"د":1,"ک":1,"س":1},"t":"YandexTranslate"},"Яндекс аудармашы":{"s":{"к","н","ш","р","я","ы","с","а","д","м","у","е"},"l":4.795831523312719,"c":{"я":1,"н":1,"д":2,"е":1,"к":1,"с":1,"а":3,"у":1,"р":1,"м":1,"ш":1,"ы":1},"t":"YandexTranslate"},"Yandex翻訳者API":{"s":{"n","訳","d","者","y","翻","a","p","e","i","x"},"l":3.7416573867739413,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"翻":1,"訳":1,"者":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex fordítása":{"s":{"n","f","d","t","í","á","r","y","s","a","o","e","x"},"l":4.358898943540674,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"f":1,"o":1,"r":1,"í":1,"t":1,"á":1,"s":1},"t":"YandexTranslate"},"यन्डेक्स अनुवादक एपीआई":{"s":{"े","ी","ए","प","ड","ु","ई","न","्","अ","द","ा","स","क","व","आ","य"},"l":5.0990195135927845,"c":{"य":1,"न":2,"्":2,"ड":1,"े":1,"क":2,"स":1,"अ":1,"ु":1,"व":1,"ा":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"YandexTranslate"},"Traductor de yandex":{"s":{"n","d","t","u","c","r","y","a","o","e","x"},"l":5.5677643628300215,"c":{"t":2,"r":2,"a":2,"d":3,"u":1,"c":1,"o":1,"e":2,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"यॅन्डेक्स अनुवादक":{"s":{"े","ड","ु","ॅ","न","्","अ","द","ा","स","क","व","य"},"l":4.69041575982343,"c":{"य":1,"ॅ":1,"न":2,"्":2,"ड":1,"े":1,"क":2,"स":1,"अ":1,"ु":1,"व":1,"ा":1,"द":1},"t":"YandexTranslate"},"Yandox":{"s":{"n","d","y","a","o","x"},"l":2.449489742783178,"c":{"y":1,"a":1,"n":1,"d":1,"o":1,"x":1},"t":"YandexTranslate"},"Yandex translate":{"s":{"n","d","t","l","r","y","s","a","e","x"},"l":5.196152422706632,"c":{"y":1,"a":3,"n":2,"d":1,"e":2,"x":1,"t":2,"r":1,"s":1,"l":1},"t":"YandexTranslate"},"I-Yandex Translation":{"s":{"n","d","t","l","r","y","-","s","a","o","e","i","x"},"l":5.916079783099616,"c":{"i":2,"-":1,"y":1,"a":3,"n":3,"d":1,"e":1,"x":1,"t":2,"r":1,"s":1,"l":1,"o":1},"t":"YandexTranslate"},"Dịch giả Yandex":{"s":{"a","g","n","h","d","y","ả","ị","c","e","i","x"},"l":3.872983346207417,"c":{"d":2,"ị":1,"c":1,"h":1,"g":1,"i":1,"ả":1,"y":1,"a":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"यन्डेक्स अनुवादक":{"s":{"े","ड","ु","न","्","अ","द","ा","स","क","व","य"},"l":4.58257569495584,"c":{"य":1,"न":2,"्":2,"ड":1,"े":1,"क":2,"स":1,"अ":1,"ु":1,"व":1,"ा":1,"द":1},"t":"YandexTranslate"},"Yandex ተርጓሚ":{"s":{"n","d","ሚ","y","ተ","a","ር","e","ጓ","x"},"l":3.1622776601683795,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"YandexTranslate"},"یاندکس ترجمه":{"s":{"ک","ی","س","ا","م","ر","ت","ه","ج","ن","د"},"l":3.3166247903554,"c":{"ی":1,"ا":1,"ن":1,"د":1,"ک":1,"س":1,"ت":1,"ر":1,"ج":1,"م":1,"ه":1},"t":"YandexTranslate"},"ಯಾಂಡೆಕ್ಸ್ ಅನುವಾದಕ API":{"s":{"ವ","a","ಕ","ಡ","ಸ","್","p","ಅ","ಂ","ನ","ಾ","ೆ","ದ","ಯ","ು","i"},"l":5.0,"c":{"ಯ":1,"ಾ":2,"ಂ":1,"ಡ":1,"ೆ":1,"ಕ":2,"್":2,"ಸ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ದ":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"यैंडेक्स अनुवाद":{"s":{"े","ड","ु","न","्","अ","द","ा","स","ं","क","व","ै","य"},"l":3.7416573867739413,"c":{"य":1,"ै":1,"ं":1,"ड":1,"े":1,"क":1,"्":1,"स":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"YandexTranslate"},"អ្នកបកប្រែ Yandex":{"s":{"ប","រ","n","្","ែ","d","ក","y","អ","a","e","ន","x"},"l":4.69041575982343,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex Dudziro":{"s":{"n","d","u","r","y","z","a","o","e","i","x"},"l":4.358898943540674,"c":{"y":1,"a":1,"n":1,"d":3,"e":1,"x":1,"u":1,"z":1,"i":1,"r":1,"o":1},"t":"YandexTranslate"},"ୟାଣ୍ଡେକ୍ସ ଅନୁବାଦକ API |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଡ","େ","ୟ","ସ","|","ଅ","ଣ","କ","a","p","i"},"l":5.0990195135927845,"c":{"ୟ":1,"ା":2,"ଣ":1,"୍":2,"ଡ":1,"େ":1,"କ":2,"ସ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ଦ":1,"a":1,"p":1,"i":1,"|":1},"t":"YandexTranslate"},"Tradutor de Yandex":{"s":{"n","d","t","u","r","y","a","o","e","x"},"l":5.477225575051661,"c":{"t":2,"r":2,"a":2,"d":3,"u":1,"o":1,"e":2,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Womasulira Yandex":{"s":{"n","d","w","l","u","r","y","s","m","a","o","e","i","x"},"l":4.69041575982343,"c":{"w":1,"o":1,"m":1,"a":3,"s":1,"u":1,"l":1,"i":1,"r":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"얀덱스":{"s":{"덱","얀","스"},"l":1.7320508075688772,"c":{"얀":1,"덱":1,"스":1},"t":"YandexTranslate"},"Яндекс котормочу":{"s":{"к","н","ч","м","р","я","с","д","о","у","е","т"},"l":4.795831523312719,"c":{"я":1,"н":1,"д":1,"е":1,"к":2,"с":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1},"t":"YandexTranslate"},"Yandex prevoditi":{"s":{"n","o","d","t","v","r","y","a","p","e","i","x"},"l":4.58257569495584,"c":{"y":1,"a":1,"n":1,"d":2,"e":2,"x":1,"p":1,"r":1,"v":1,"o":1,"i":2,"t":1},"t":"YandexTranslate"},"Yandex വിവർത്തക API":{"s":{"ി","n","ത","d","വ","ർ","്","ക","y","a","p","e","i","x"},"l":4.795831523312719,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ക":1,"p":1,"i":1},"t":"YandexTranslate"},"I-Yandex Translator API":{"s":{"n","d","t","l","p","r","y","-","s","a","o","e","i","x"},"l":6.4031242374328485,"c":{"i":2,"-":1,"y":1,"a":4,"n":2,"d":1,"e":1,"x":1,"t":2,"r":2,"s":1,"l":1,"o":1,"p":1},"t":"YandexTranslate"},"Yandex itzultzailea":{"s":{"n","d","t","l","u","y","z","a","e","i","x"},"l":5.830951894845301,"c":{"y":1,"a":3,"n":1,"d":1,"e":2,"x":1,"i":2,"t":2,"z":2,"u":1,"l":2},"t":"YandexTranslate"},"Yandex تەرجىمىسى":{"s":{"n","d","ى","س","ە","ر","y","ت","م","a","ج","e","x"},"l":4.58257569495584,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":3,"م":1,"س":1},"t":"YandexTranslate"},"Яндсияи Transforcater api":{"s":{"н","n","f","и","я","t","p","с","c","r","s","д","a","o","e","i"},"l":6.4031242374328485,"c":{"я":2,"н":1,"д":1,"с":1,"и":2,"t":2,"r":3,"a":3,"n":1,"s":1,"f":1,"o":1,"c":1,"e":1,"p":1,"i":1},"t":"YandexTranslate"},"Transx preachd api":{"s":{"n","h","d","t","c","r","s","a","p","e","i","x"},"l":5.0990195135927845,"c":{"t":1,"r":2,"a":3,"n":1,"s":1,"x":1,"p":2,"e":1,"c":1,"h":1,"d":1,"i":1},"t":"YandexTranslate"},"યાન્ડેક્સ અનુવાદક એ.પી.આઈ.":{"s":{"ા","ન","ડ","સ","ુ",".","પ","ી","ઈ","એ","્","ય","ે","ક","અ","આ","દ","વ"},"l":6.164414002968976,"c":{"ય":1,"ા":2,"ન":2,"્":2,"ડ":1,"ે":1,"ક":2,"સ":1,"અ":1,"ુ":1,"વ":1,"દ":1,"એ":1,".":3,"પ":1,"ી":1,"આ":1,"ઈ":1},"t":"YandexTranslate"},"Radaris Faq":{"s":{"f","d","q","r","s","a","i"},"l":4.242640687119285,"c":{"r":2,"a":3,"d":1,"i":1,"s":1,"f":1,"q":1},"t":"YandexTranslate"},"yandex បកប្រែ":{"s":{"ប","រ","n","្","d","ែ","ក","y","a","e","x"},"l":3.7416573867739413,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ប":2,"ក":1,"្":1,"រ":1,"ែ":1},"t":"YandexTranslate"},"Yandex വിവർത്തകൻ":{"s":{"ൻ","ി","n","ത","d","വ","ർ","്","ക","y","a","e","x"},"l":4.358898943540674,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ക":1,"ൻ":1},"t":"YandexTranslate"},"Cyfieithu yandex":{"s":{"a","n","h","f","d","t","u","y","c","e","i","x"},"l":4.58257569495584,"c":{"c":1,"y":2,"f":1,"i":2,"e":2,"t":1,"h":1,"u":1,"a":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"यैंडेक्स अनुवादक":{"s":{"े","ड","ु","न","्","अ","द","ा","स","ं","क","व","ै","य"},"l":4.123105625617661,"c":{"य":1,"ै":1,"ं":1,"ड":1,"े":1,"क":2,"्":1,"स":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"YandexTranslate"},"يوندڪس ترجمو":{"s":{"و","ي","س","م","ر","ت","ڪ","ج","ن","د"},"l":3.605551275463989,"c":{"ي":1,"و":2,"ن":1,"د":1,"ڪ":1,"س":1,"ت":1,"ر":1,"ج":1,"م":1},"t":"YandexTranslate"},"Mtafsiri wa Yandex":{"s":{"n","f","d","w","t","r","y","s","m","a","e","i","x"},"l":4.898979485566356,"c":{"m":1,"t":1,"a":3,"f":1,"s":1,"i":2,"r":1,"w":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex mpandika teny":{"s":{"n","d","t","y","m","k","a","p","e","i","x"},"l":6.0,"c":{"y":2,"a":3,"n":3,"d":2,"e":2,"x":1,"m":1,"p":1,"i":1,"k":1,"t":1},"t":"YandexTranslate"},"Aistrigh yandex":{"s":{"g","n","h","d","t","r","y","s","a","e","i","x"},"l":4.242640687119285,"c":{"a":2,"i":2,"s":1,"t":1,"r":1,"g":1,"h":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Яндекс":{"s":{"к","н","я","с","д","е"},"l":2.449489742783178,"c":{"я":1,"н":1,"д":1,"е":1,"к":1,"с":1},"t":"YandexTranslate"},"Yandex Translate":{"s":{"n","d","t","l","r","y","s","a","e","x"},"l":5.196152422706632,"c":{"y":1,"a":3,"n":2,"d":1,"e":2,"x":1,"t":2,"r":1,"s":1,"l":1},"t":"YandexTranslate"},"Yandex traduttore api":{"s":{"n","d","t","p","u","r","y","a","o","e","i","x"},"l":6.082762530298219,"c":{"y":1,"a":3,"n":1,"d":2,"e":2,"x":1,"t":3,"r":2,"u":1,"o":1,"p":1,"i":1},"t":"YandexTranslate"},"يوندڪس ترجمو ڪندڙ API":{"s":{"و","ي","ڙ","س","p","م","ر","ت","ڪ","a","ج","ن","i","د"},"l":5.0990195135927845,"c":{"ي":1,"و":2,"ن":2,"د":2,"ڪ":2,"س":1,"ت":1,"ر":1,"ج":1,"م":1,"ڙ":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"Traducteur de yandex":{"s":{"n","d","t","u","c","r","y","a","e","x"},"l":6.164414002968976,"c":{"t":2,"r":2,"a":2,"d":3,"u":2,"c":1,"e":3,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex tərcüməçi":{"s":{"n","ü","d","t","c","ə","y","r","m","ç","a","e","i","x"},"l":4.123105625617661,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":1},"t":"YandexTranslate"},"Kaiwhakamaori yandex":{"s":{"n","h","d","w","r","y","m","k","a","o","e","i","x"},"l":6.557438524302,"c":{"k":2,"a":5,"i":2,"w":1,"h":1,"m":1,"o":1,"r":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"د Yandex ژباړونکي":{"s":{"ب","n","و","x","d","ک","ي","ړ","ا","ن","y","ژ","a","e","د"},"l":3.872983346207417,"c":{"د":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"و":1,"ن":1,"ک":1,"ي":1},"t":"YandexTranslate"},"Yandex-oersetter":{"s":{"n","d","t","r","y","-","s","a","o","e","x"},"l":5.656854249492381,"c":{"y":1,"a":1,"n":1,"d":1,"e":4,"x":1,"-":1,"o":1,"r":2,"s":1,"t":2},"t":"YandexTranslate"},"Biri":{"s":{"r","b","i"},"l":2.449489742783178,"c":{"b":1,"i":2,"r":1},"t":"YandexTranslate"},"Yandex ဘာသာပြန်သူ":{"s":{"ူ","n","ပ","d","်","ဘ","ာ","ြ","y","န","သ","a","e","x"},"l":4.47213595499958,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1},"t":"YandexTranslate"},"Turjubaan yarex":{"s":{"n","b","j","t","u","r","y","a","e","x"},"l":4.898979485566356,"c":{"t":1,"u":2,"r":2,"j":1,"b":1,"a":3,"n":1,"y":1,"e":1,"x":1},"t":"YandexTranslate"},"API i përkthyesit Yandex":{"s":{"ë","n","h","d","t","r","y","s","k","a","p","e","i","x"},"l":6.082762530298219,"c":{"a":2,"p":2,"i":3,"ë":1,"r":1,"k":1,"t":2,"h":1,"y":2,"e":2,"s":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"იანდექსი":{"s":{"დ","ს","ა","ე","ნ","ქ","ი"},"l":3.1622776601683795,"c":{"ი":2,"ა":1,"ნ":1,"დ":1,"ე":1,"ქ":1,"ს":1},"t":"YandexTranslate"},"Yandex översätter":{"s":{"n","d","t","v","ö","y","r","s","ä","a","e","x"},"l":5.0990195135927845,"c":{"y":1,"a":1,"n":1,"d":1,"e":3,"x":1,"ö":1,"v":1,"r":2,"s":1,"ä":1,"t":2},"t":"YandexTranslate"},"นักแปล Yandex":{"s":{"n","ล","น","d","แ","ก","y","ั","ป","a","e","x"},"l":3.4641016151377544,"c":{"น":1,"ั":1,"ก":1,"แ":1,"ป":1,"ล":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"यन्डेक्स अनुवाद अनुवाद":{"s":{"े","ड","ु","न","्","अ","द","ा","स","क","व","य"},"l":6.164414002968976,"c":{"य":1,"न":3,"्":2,"ड":1,"े":1,"क":1,"स":1,"अ":2,"ु":2,"व":2,"ा":2,"द":2},"t":"YandexTranslate"},"Yandex dịch":{"s":{"n","h","d","c","y","ị","a","e","x"},"l":3.4641016151377544,"c":{"y":1,"a":1,"n":1,"d":2,"e":1,"x":1,"ị":1,"c":1,"h":1},"t":"YandexTranslate"},"Yandex tulkotāja API":{"s":{"n","d","ā","j","t","l","p","u","y","k","a","o","e","i","x"},"l":5.0990195135927845,"c":{"y":1,"a":3,"n":1,"d":1,"e":1,"x":1,"t":2,"u":1,"l":1,"k":1,"o":1,"ā":1,"j":1,"p":1,"i":1},"t":"YandexTranslate"},"yandex ဘာသာပြန်ဆို":{"s":{"ိ","n","ု","ပ","d","်","ဘ","ာ","ြ","ဆ","y","န","သ","a","e","x"},"l":4.358898943540674,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1,"်":1,"ဆ":1,"ိ":1,"ု":1},"t":"YandexTranslate"},"Yandex preložiť":{"s":{"n","o","d","ť","l","r","y","ž","a","p","e","i","x"},"l":4.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":2,"x":1,"p":1,"r":1,"l":1,"o":1,"ž":1,"i":1,"ť":1},"t":"YandexTranslate"},"Tłumacz Yandex":{"s":{"n","d","t","ł","u","c","y","z","m","a","e","x"},"l":3.872983346207417,"c":{"t":1,"ł":1,"u":1,"m":1,"a":2,"c":1,"z":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"API Yandex Překladatel":{"s":{"n","d","ř","l","t","y","k","a","p","e","i","x"},"l":6.6332495807108,"c":{"a":4,"p":2,"i":1,"y":1,"n":1,"d":2,"e":3,"x":1,"ř":1,"k":1,"l":2,"t":1},"t":"YandexTranslate"},"ਯਾਂਡੇਕਸ":{"s":{"ਂ","ੇ","ਾ","ਕ","ਯ","ਸ","ਡ"},"l":2.6457513110645907,"c":{"ਯ":1,"ਾ":1,"ਂ":1,"ਡ":1,"ੇ":1,"ਕ":1,"ਸ":1},"t":"YandexTranslate"},"AKIYESI FILEEx onitumọ":{"s":{"n","f","l","t","u","y","s","m","ọ","k","a","o","e","i","x"},"l":6.164414002968976,"c":{"a":1,"k":1,"i":4,"y":1,"e":3,"s":1,"f":1,"l":1,"x":1,"o":1,"n":1,"t":1,"u":1,"m":1,"ọ":1},"t":"YandexTranslate"},"Yandex API Penterjemah":{"s":{"n","h","d","j","t","r","y","m","a","p","e","i","x"},"l":6.48074069840786,"c":{"y":1,"a":3,"n":2,"d":1,"e":4,"x":1,"p":2,"i":1,"t":1,"r":1,"j":1,"m":1,"h":1},"t":"YandexTranslate"},"Traduttur Yandex":{"s":{"n","d","t","u","r","y","a","e","x"},"l":5.385164807134504,"c":{"t":3,"r":2,"a":2,"d":2,"u":2,"y":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"„Yandex“ vertimas":{"s":{"„","n","d","“","t","v","r","y","s","m","a","e","i","x"},"l":4.47213595499958,"c":{"„":1,"y":1,"a":2,"n":1,"d":1,"e":2,"x":1,"“":1,"v":1,"r":1,"t":1,"i":1,"m":1,"s":1},"t":"YandexTranslate"},"Yandex -vertaler":{"s":{"n","d","t","l","v","r","y","-","a","e","x"},"l":5.0,"c":{"y":1,"a":2,"n":1,"d":1,"e":3,"x":1,"-":1,"v":1,"r":2,"t":1,"l":1},"t":"YandexTranslate"},"יאַנדעקס":{"s":{"נ","י","ע","ק","ס","ַ","ד","א"},"l":2.8284271247461903,"c":{"י":1,"א":1,"ַ":1,"נ":1,"ד":1,"ע":1,"ק":1,"ס":1},"t":"YandexTranslate"},"ইয়ানডেক্স অনুবাদক":{"s":{"য","অ","ু","ই","ন","দ","ক","্","়","া","ব","স","ড","ে"},"l":4.795831523312719,"c":{"ই":1,"য":1,"়":1,"া":2,"ন":2,"ড":1,"ে":1,"ক":2,"্":1,"স":1,"অ":1,"ু":1,"ব":1,"দ":1},"t":"YandexTranslate"},"ୟାଣ୍ଡେକ୍ସ ଅନୁବାଦକ |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଡ","େ","ୟ","ସ","|","ଅ","ଣ","କ"},"l":4.795831523312719,"c":{"ୟ":1,"ା":2,"ଣ":1,"୍":2,"ଡ":1,"େ":1,"କ":2,"ସ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ଦ":1,"|":1},"t":"YandexTranslate"},"యాండెక్స్":{"s":{"స","ె","య","డ","క","ా","ం","్"},"l":3.3166247903554,"c":{"య":1,"ా":1,"ం":1,"డ":1,"ె":1,"క":1,"్":2,"స":1},"t":"YandexTranslate"},"Yandex თარგმანი":{"s":{"თ","n","d","ი","ა","რ","მ","გ","ნ","y","a","e","x"},"l":4.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"თ":1,"ა":2,"რ":1,"გ":1,"მ":1,"ნ":1,"ი":1},"t":"YandexTranslate"},"Yanch":{"s":{"n","h","c","y","a"},"l":2.23606797749979,"c":{"y":1,"a":1,"n":1,"c":1,"h":1},"t":"YandexTranslate"},"Yandex тарҷума":{"s":{"n","м","d","а","y","р","ҷ","у","a","e","т","x"},"l":3.872983346207417,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1},"t":"YandexTranslate"},"Umhumushi we-Yandex":{"s":{"n","h","d","w","u","-","s","m","y","a","e","i","x"},"l":5.477225575051661,"c":{"u":3,"m":2,"h":2,"s":1,"i":1,"w":1,"e":2,"-":1,"y":1,"a":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"Yandex Translator API":{"s":{"n","d","t","l","p","r","y","s","a","o","e","i","x"},"l":6.082762530298219,"c":{"y":1,"a":4,"n":2,"d":1,"e":1,"x":1,"t":2,"r":2,"s":1,"l":1,"o":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex -kääntäjän sovellusliittymä":{"s":{"n","d","j","t","l","v","u","y","-","ä","s","m","k","a","o","e","i","x"},"l":8.831760866327848,"c":{"y":2,"a":1,"n":3,"d":1,"e":2,"x":1,"-":1,"k":1,"ä":5,"t":3,"j":1,"s":2,"o":1,"v":1,"l":3,"u":1,"i":2,"m":1},"t":"YandexTranslate"},"Yandex překládat":{"s":{"n","d","ř","l","t","á","y","k","a","p","e","x"},"l":4.58257569495584,"c":{"y":1,"a":2,"n":1,"d":2,"e":2,"x":1,"p":1,"ř":1,"k":1,"l":1,"á":1,"t":1},"t":"YandexTranslate"},"Yandex-oersetter API":{"s":{"n","d","t","p","r","y","-","s","a","o","e","i","x"},"l":6.082762530298219,"c":{"y":1,"a":2,"n":1,"d":1,"e":4,"x":1,"-":1,"o":1,"r":2,"s":1,"t":2,"p":1,"i":1},"t":"YandexTranslate"},"yandex ဘာသာပြန်သူ API":{"s":{"ူ","n","ပ","d","်","ဘ","ာ","ြ","y","န","သ","a","p","e","i","x"},"l":5.0,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1,"p":1,"i":1},"t":"YandexTranslate"},"ਯਾਂਡੇਡ ਅਨੁਵਾਦਕ":{"s":{"ਂ","ੇ","ਅ","ਾ","ਕ","ਵ","ੁ","ਯ","ਡ","ਨ","ਦ"},"l":4.123105625617661,"c":{"ਯ":1,"ਾ":2,"ਂ":1,"ਡ":2,"ੇ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1,"ਕ":1},"t":"YandexTranslate"},"Yandex Translator":{"s":{"n","d","t","l","r","y","s","a","o","e","x"},"l":5.291502622129181,"c":{"y":1,"a":3,"n":2,"d":1,"e":1,"x":1,"t":2,"r":2,"s":1,"l":1,"o":1},"t":"YandexTranslate"},"ୟାଣ୍ଡେକ୍ସ":{"s":{"ା","୍","ଡ","େ","ୟ","ସ","ଣ","କ"},"l":3.3166247903554,"c":{"ୟ":1,"ା":1,"ଣ":1,"୍":2,"ଡ":1,"େ":1,"କ":1,"ସ":1},"t":"YandexTranslate"},"Jezera":{"s":{"j","r","z","a","e"},"l":2.8284271247461903,"c":{"j":1,"e":2,"z":1,"r":1,"a":1},"t":"YandexTranslate"},"Yandex":{"s":{"n","d","y","a","e","x"},"l":2.449489742783178,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex tarjima qilinadi":{"s":{"n","d","j","t","l","q","r","y","m","a","e","i","x"},"l":7.0,"c":{"y":1,"a":4,"n":2,"d":2,"e":1,"x":1,"t":1,"r":1,"j":1,"i":4,"m":1,"q":1,"l":1},"t":"YandexTranslate"},"Yandex 번역기":{"s":{"n","번","d","기","역","y","a","e","x"},"l":3.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"번":1,"역":1,"기":1},"t":"YandexTranslate"},"Yandex faaliliu":{"s":{"n","f","d","l","u","y","a","e","i","x"},"l":4.898979485566356,"c":{"y":1,"a":3,"n":1,"d":1,"e":1,"x":1,"f":1,"l":2,"i":2,"u":1},"t":"YandexTranslate"},"Aistritheoir Yandex API":{"s":{"n","h","d","t","p","r","y","s","a","o","e","i","x"},"l":6.708203932499369,"c":{"a":3,"i":4,"s":1,"t":2,"r":2,"h":1,"e":2,"o":1,"y":1,"n":1,"d":1,"x":1,"p":1},"t":"YandexTranslate"},"Andex fassara":{"s":{"n","f","d","r","s","a","e","x"},"l":5.0990195135927845,"c":{"a":4,"n":1,"d":1,"e":1,"x":1,"f":1,"s":2,"r":1},"t":"YandexTranslate"},"API del traductor de Yandex":{"s":{"n","o","d","l","t","u","c","r","y","a","p","e","i","x"},"l":7.14142842854285,"c":{"a":3,"p":1,"i":1,"d":4,"e":3,"l":1,"t":2,"r":2,"u":1,"c":1,"o":1,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex Tugharia":{"s":{"g","n","h","d","t","u","r","y","a","e","i","x"},"l":4.47213595499958,"c":{"y":1,"a":3,"n":1,"d":1,"e":1,"x":1,"t":1,"u":1,"g":1,"h":1,"r":1,"i":1},"t":"YandexTranslate"},"ياندكس ترجمة":{"s":{"ك","ي","ة","س","ا","م","ر","ت","ج","ن","د"},"l":3.3166247903554,"c":{"ي":1,"ا":1,"ن":1,"د":1,"ك":1,"س":1,"ت":1,"ر":1,"ج":1,"م":1,"ة":1},"t":"YandexTranslate"},"Yandex 번역":{"s":{"n","번","d","역","y","a","e","x"},"l":2.8284271247461903,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"번":1,"역":1},"t":"YandexTranslate"},"Mofetoleli oa YandEx":{"s":{"n","f","d","t","l","y","m","a","o","e","i","x"},"l":5.830951894845301,"c":{"m":1,"o":3,"f":1,"e":3,"t":1,"l":2,"i":1,"a":2,"y":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"Traductor de Yandex":{"s":{"n","d","t","u","c","r","y","a","o","e","x"},"l":5.5677643628300215,"c":{"t":2,"r":2,"a":2,"d":3,"u":1,"c":1,"o":1,"e":2,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"ياندكس":{"s":{"ك","ي","س","ا","ن","د"},"l":2.449489742783178,"c":{"ي":1,"ا":1,"ن":1,"د":1,"ك":1,"س":1},"t":"YandexTranslate"},"Иандек":{"s":{"к","н","и","а","д","е"},"l":2.449489742783178,"c":{"и":1,"а":1,"н":1,"д":1,"е":1,"к":1},"t":"YandexTranslate"},"යැන්ඩෙක්ස් පරිවර්තනය කරන්න":{"s":{"ි","න","ව","ැ","ඩ","ප","ත","ක","ෙ","්","ස","ය","ර"},"l":8.12403840463596,"c":{"ය":2,"ැ":1,"න":4,"්":5,"ඩ":1,"ෙ":1,"ක":2,"ස":1,"ප":1,"ර":3,"ි":1,"ව":1,"ත":1},"t":"YandexTranslate"},"Yandex Terjemahan":{"s":{"n","h","d","j","t","r","y","m","a","e","x"},"l":5.477225575051661,"c":{"y":1,"a":3,"n":2,"d":1,"e":3,"x":1,"t":1,"r":1,"j":1,"m":1,"h":1},"t":"YandexTranslate"},"Yandex diterjemahkan":{"s":{"n","h","d","j","t","r","y","m","k","a","e","i","x"},"l":5.916079783099616,"c":{"y":1,"a":3,"n":2,"d":2,"e":3,"x":1,"i":1,"t":1,"r":1,"j":1,"m":1,"h":1,"k":1},"t":"YandexTranslate"},"Překladatel Yandex":{"s":{"n","d","ř","l","t","y","k","a","p","e","x"},"l":5.744562646538029,"c":{"p":1,"ř":1,"e":3,"k":1,"l":2,"a":3,"d":2,"t":1,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Penerjemah Yandex":{"s":{"n","h","j","d","r","y","m","a","p","e","x"},"l":5.656854249492381,"c":{"p":1,"e":4,"n":2,"r":1,"j":1,"m":1,"a":2,"h":1,"y":1,"d":1,"x":1},"t":"YandexTranslate"},"ਯਾਂਡੇਕਸ ਅਨੁਵਾਦਕ ਏਪੀਆਈ":{"s":{"ਏ","ੀ","ਈ","ਂ","ੇ","ਅ","ਾ","ਕ","ਵ","ੁ","ਪ","ਯ","ਆ","ਸ","ਡ","ਨ","ਦ"},"l":4.795831523312719,"c":{"ਯ":1,"ਾ":2,"ਂ":1,"ਡ":1,"ੇ":1,"ਕ":2,"ਸ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1,"ਏ":1,"ਪ":1,"ੀ":1,"ਆ":1,"ਈ":1},"t":"YandexTranslate"},"د Yanderxp ژباړونکي API":{"s":{"ب","n","و","x","d","ک","ي","ړ","ا","r","y","ژ","ن","a","p","e","i","د"},"l":4.898979485566356,"c":{"د":1,"y":1,"a":2,"n":1,"d":1,"e":1,"r":1,"x":1,"p":2,"ژ":1,"ب":1,"ا":1,"ړ":1,"و":1,"ن":1,"ک":1,"ي":1,"i":1},"t":"YandexTranslate"},"Yandex traducir":{"s":{"n","d","t","u","c","r","y","a","e","i","x"},"l":4.47213595499958,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"t":1,"r":2,"u":1,"c":1,"i":1},"t":"YandexTranslate"},"Yandèks":{"s":{"n","d","y","s","k","a","è"},"l":2.6457513110645907,"c":{"y":1,"a":1,"n":1,"d":1,"è":1,"k":1,"s":1},"t":"YandexTranslate"},"יאַנדעקס טראַנסלאַטאָר":{"s":{"נ","י","ָ","ע","ק","ס","ט","ל","ַ","ד","א","ר"},"l":6.855654600401044,"c":{"י":1,"א":4,"ַ":3,"נ":2,"ד":1,"ע":1,"ק":1,"ס":2,"ט":2,"ר":2,"ל":1,"ָ":1},"t":"YandexTranslate"},"yandex":{"s":{"n","d","y","a","e","x"},"l":2.449489742783178,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Traduttore Yandex":{"s":{"n","d","t","u","r","y","a","o","e","x"},"l":5.477225575051661,"c":{"t":3,"r":2,"a":2,"d":2,"u":1,"o":1,"e":2,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex narjamahkeun":{"s":{"n","h","d","j","u","r","y","m","k","a","e","x"},"l":6.164414002968976,"c":{"y":1,"a":4,"n":3,"d":1,"e":2,"x":1,"r":1,"j":1,"m":1,"h":1,"k":1,"u":1},"t":"YandexTranslate"},"Yandex تەرجىمانى":{"s":{"n","d","ى","ا","ە","ر","y","ت","م","ن","a","ج","e","x"},"l":4.123105625617661,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1},"t":"YandexTranslate"},"API dịch Yandex":{"s":{"n","h","d","c","y","ị","a","p","e","i","x"},"l":4.123105625617661,"c":{"a":2,"p":1,"i":1,"d":2,"ị":1,"c":1,"h":1,"y":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex превод":{"s":{"е","n","п","d","в","y","д","р","о","a","e","x"},"l":3.4641016151377544,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1},"t":"YandexTranslate"},"Onitumọ Yanndex":{"s":{"n","d","t","u","y","ọ","m","a","o","e","i","x"},"l":4.47213595499958,"c":{"o":1,"n":3,"i":1,"t":1,"u":1,"m":1,"ọ":1,"y":1,"a":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex تەرجىمانى api":{"s":{"n","d","ى","p","ا","ە","ر","y","ت","م","ن","a","ج","e","i","x"},"l":4.69041575982343,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1,"p":1,"i":1},"t":"YandexTranslate"},"អ្នកបកប្រែភាសា ayix":{"s":{"ប","រ","i","្","ែ","ភ","ក","ា","y","អ","ស","a","ន","x"},"l":5.0990195135927845,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"ភ":1,"ា":2,"ស":1,"a":1,"y":1,"i":1,"x":1},"t":"YandexTranslate"},"Το Yandex μετάφραση":{"s":{"ρ","α","n","d","η","μ","ο","y","ε","σ","ά","a","φ","e","τ","x"},"l":4.358898943540674,"c":{"τ":2,"ο":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"μ":1,"ε":1,"ά":1,"φ":1,"ρ":1,"α":1,"σ":1,"η":1},"t":"YandexTranslate"},"ୟାଣ୍ଡେକ୍ସ ଅନୁବାଦ |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଡ","େ","ୟ","ସ","|","ଅ","ଣ","କ"},"l":4.47213595499958,"c":{"ୟ":1,"ା":2,"ଣ":1,"୍":2,"ଡ":1,"େ":1,"କ":1,"ସ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ଦ":1,"|":1},"t":"YandexTranslate"},"Yandex แปล":{"s":{"n","ล","d","แ","y","ป","a","e","x"},"l":3.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"แ":1,"ป":1,"ล":1},"t":"YandexTranslate"},"यॅन्डेक्स ट्रान्सलेटर एपीआय":{"s":{"े","ी","ए","प","ड","ॅ","न","्","ा","स","ट","र","ल","क","आ","य"},"l":7.0,"c":{"य":2,"ॅ":1,"न":2,"्":4,"ड":1,"े":2,"क":1,"स":2,"ट":2,"र":2,"ा":1,"ल":1,"ए":1,"प":1,"ी":1,"आ":1},"t":"YandexTranslate"},"Yandex tradwi":{"s":{"n","d","w","t","r","y","a","e","i","x"},"l":4.0,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"t":1,"r":1,"w":1,"i":1},"t":"YandexTranslate"},"Yandex Iwwersetzer API":{"s":{"n","d","w","t","r","y","s","z","a","p","e","i","x"},"l":6.324555320336759,"c":{"y":1,"a":2,"n":1,"d":1,"e":4,"x":1,"i":2,"w":2,"r":2,"s":1,"t":1,"z":1,"p":1},"t":"YandexTranslate"},"ಯಾಂಡೆಕ್ಸ್ ಭಾಷಾಂತರಕಾರ":{"s":{"ರ","ಕ","ಡ","ಸ","್","ಷ","ಂ","ಭ","ತ","ಾ","ೆ","ಯ"},"l":6.244997998398398,"c":{"ಯ":1,"ಾ":4,"ಂ":2,"ಡ":1,"ೆ":1,"ಕ":2,"್":2,"ಸ":1,"ಭ":1,"ಷ":1,"ತ":1,"ರ":2},"t":"YandexTranslate"},"Yandex mushanduri":{"s":{"n","h","d","u","r","y","s","m","a","e","i","x"},"l":4.898979485566356,"c":{"y":1,"a":2,"n":2,"d":2,"e":1,"x":1,"m":1,"u":2,"s":1,"h":1,"r":1,"i":1},"t":"YandexTranslate"},"Phatlalatso ea YandEx":{"s":{"n","h","o","d","t","l","y","s","a","p","e","x"},"l":6.708203932499369,"c":{"p":1,"h":1,"a":5,"t":2,"l":2,"s":1,"o":1,"e":2,"y":1,"n":1,"d":1,"x":1},"t":"YandexTranslate"},"Traducător Yandex":{"s":{"n","o","d","t","u","c","r","y","a","ă","e","x"},"l":4.898979485566356,"c":{"t":2,"r":2,"a":2,"d":2,"u":1,"c":1,"ă":1,"o":1,"y":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex çevirmen API":{"s":{"n","d","v","r","y","m","ç","a","p","e","i","x"},"l":5.385164807134504,"c":{"y":1,"a":2,"n":2,"d":1,"e":3,"x":1,"ç":1,"v":1,"i":2,"r":1,"m":1,"p":1},"t":"YandexTranslate"},"યાંદેક્સ અનુવાદક":{"s":{"ા","સ","ન","ુ","્","ય","ે","ક","ં","અ","દ","વ"},"l":4.58257569495584,"c":{"ય":1,"ા":2,"ં":1,"દ":2,"ે":1,"ક":2,"્":1,"સ":1,"અ":1,"ન":1,"ુ":1,"વ":1},"t":"YandexTranslate"},"Yandex tarjimoni API":{"s":{"n","d","j","t","p","r","y","m","a","o","e","i","x"},"l":5.656854249492381,"c":{"y":1,"a":3,"n":2,"d":1,"e":1,"x":1,"t":1,"r":1,"j":1,"i":3,"m":1,"o":1,"p":1},"t":"YandexTranslate"},"Cyfieithydd Yandex":{"s":{"a","n","h","f","d","t","y","c","e","i","x"},"l":5.744562646538029,"c":{"c":1,"y":3,"f":1,"i":2,"e":2,"t":1,"h":1,"d":3,"a":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex interpres":{"s":{"n","d","t","r","y","s","a","p","e","i","x"},"l":5.0,"c":{"y":1,"a":1,"n":2,"d":1,"e":3,"x":1,"i":1,"t":1,"r":2,"p":1,"s":1},"t":"YandexTranslate"},"Yandex wergerandin":{"s":{"g","n","d","w","r","y","a","e","i","x"},"l":5.916079783099616,"c":{"y":1,"a":2,"n":3,"d":2,"e":3,"x":1,"w":1,"r":2,"g":1,"i":1},"t":"YandexTranslate"},"Yandex tradiktè api":{"s":{"n","è","d","t","r","y","k","a","p","e","i","x"},"l":5.385164807134504,"c":{"y":1,"a":3,"n":1,"d":2,"e":1,"x":1,"t":2,"r":1,"i":2,"k":1,"è":1,"p":1},"t":"YandexTranslate"},"Yandex Tərcüməçi API":{"s":{"n","ü","d","t","c","ə","y","r","m","ç","a","p","e","i","x"},"l":4.898979485566356,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":2,"p":1},"t":"YandexTranslate"},"Yandex орчуулагч":{"s":{"л","ч","n","d","а","г","y","р","о","у","a","e","x"},"l":4.358898943540674,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1},"t":"YandexTranslate"},"Tradutor do Yandex":{"s":{"n","d","t","u","r","y","a","o","e","x"},"l":5.477225575051661,"c":{"t":2,"r":2,"a":2,"d":3,"u":1,"o":2,"y":1,"n":1,"e":1,"x":1},"t":"YandexTranslate"},"యాండెక్స్ అనువాదకుడు API":{"s":{"స","ె","య","డ","క","ా","ం","్","న","ద","వ","ు","a","p","అ","i"},"l":6.0,"c":{"య":1,"ా":2,"ం":1,"డ":2,"ె":1,"క":2,"్":2,"స":1,"అ":1,"న":1,"ు":3,"వ":1,"ద":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex çevirmen":{"s":{"n","d","v","r","y","m","ç","a","e","i","x"},"l":4.69041575982343,"c":{"y":1,"a":1,"n":2,"d":1,"e":3,"x":1,"ç":1,"v":1,"i":1,"r":1,"m":1},"t":"YandexTranslate"},"Яндекс переводчик API":{"s":{"к","a","н","ч","и","р","я","в","с","д","о","п","p","е","i"},"l":5.385164807134504,"c":{"я":1,"н":1,"д":2,"е":3,"к":2,"с":1,"п":1,"р":1,"в":1,"о":1,"ч":1,"и":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"یاندکس مترجم":{"s":{"ک","ی","س","ا","م","ر","ت","ج","ن","د"},"l":3.605551275463989,"c":{"ی":1,"ا":1,"ن":1,"د":1,"ک":1,"س":1,"م":2,"ت":1,"ر":1,"ج":1},"t":"YandexTranslate"},"API prekladateľa Yandex":{"s":{"n","d","ľ","l","t","r","y","k","a","p","e","i","x"},"l":7.14142842854285,"c":{"a":5,"p":2,"i":1,"r":1,"e":3,"k":1,"l":1,"d":2,"t":1,"ľ":1,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex translator API":{"s":{"n","d","t","l","p","r","y","s","a","o","e","i","x"},"l":6.082762530298219,"c":{"y":1,"a":4,"n":2,"d":1,"e":1,"x":1,"t":2,"r":2,"s":1,"l":1,"o":1,"p":1,"i":1},"t":"YandexTranslate"},"Иандек Транслате":{"s":{"к","н","л","и","р","с","а","д","е","т"},"l":5.196152422706632,"c":{"и":1,"а":3,"н":2,"д":1,"е":2,"к":1,"т":2,"р":1,"с":1,"л":1},"t":"YandexTranslate"},"Yandex Которуу Комментарий":{"s":{"к","е","н","n","м","d","и","а","й","y","р","о","у","a","e","т","x"},"l":6.324555320336759,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"к":2,"о":3,"т":2,"р":2,"у":2,"м":2,"е":1,"н":1,"а":1,"и":1,"й":1},"t":"YandexTranslate"},"ಯಾಂಡೆಕ್ಸ್ ಅನುವಾದ":{"s":{"ವ","ಕ","ಡ","ಸ","್","ಅ","ಂ","ನ","ಾ","ೆ","ದ","ಯ","ು"},"l":4.358898943540674,"c":{"ಯ":1,"ಾ":2,"ಂ":1,"ಡ":1,"ೆ":1,"ಕ":1,"್":2,"ಸ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ದ":1},"t":"YandexTranslate"},"Tradukisto de Yandex":{"s":{"n","d","t","u","r","y","s","k","a","o","e","i","x"},"l":5.477225575051661,"c":{"t":2,"r":1,"a":2,"d":3,"u":1,"k":1,"i":1,"s":1,"o":1,"e":2,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex թարգմանիչ":{"s":{"թ","ա","ի","n","չ","ն","d","գ","y","ր","մ","a","e","x"},"l":4.123105625617661,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"թ":1,"ա":2,"ր":1,"գ":1,"մ":1,"ն":1,"ի":1,"չ":1},"t":"YandexTranslate"},"Јандекс":{"s":{"к","н","с","а","ј","д","е"},"l":2.6457513110645907,"c":{"ј":1,"а":1,"н":1,"д":1,"е":1,"к":1,"с":1},"t":"YandexTranslate"},"ಕವಣೆ":{"s":{"ವ","ಕ","ೆ","ಣ"},"l":2.0,"c":{"ಕ":1,"ವ":1,"ಣ":1,"ೆ":1},"t":"YandexTranslate"},"Яндекс аударады":{"s":{"к","н","р","я","ы","с","а","д","у","е"},"l":5.0990195135927845,"c":{"я":1,"н":1,"д":3,"е":1,"к":1,"с":1,"а":3,"у":1,"р":1,"ы":1},"t":"YandexTranslate"},"ນັກແປພາສາ Yandex":{"s":{"ພ","ນ","ປ","ກ","n","ສ","d","ັ","າ","y","a","ແ","e","x"},"l":4.123105625617661,"c":{"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"يوندڪس ترجمو ڪندڙ":{"s":{"و","ي","ڙ","س","م","ر","ت","ڪ","ج","ن","د"},"l":4.795831523312719,"c":{"ي":1,"و":2,"ن":2,"د":2,"ڪ":2,"س":1,"ت":1,"ر":1,"ج":1,"م":1,"ڙ":1},"t":"YandexTranslate"},"Lan Translator API":{"s":{"n","l","t","p","r","s","a","o","i"},"l":6.0,"c":{"l":2,"a":4,"n":2,"t":2,"r":2,"s":1,"o":1,"p":1,"i":1},"t":"ReversoTranslate"},"API ya Mtafsiri ya Yandex":{"s":{"n","f","d","t","r","y","s","m","a","p","e","i","x"},"l":7.280109889280518,"c":{"a":5,"p":1,"i":3,"y":3,"m":1,"t":1,"f":1,"s":1,"r":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex oversetter":{"s":{"n","d","t","v","r","y","s","a","o","e","x"},"l":5.656854249492381,"c":{"y":1,"a":1,"n":1,"d":1,"e":4,"x":1,"o":1,"v":1,"r":2,"s":1,"t":2},"t":"YandexTranslate"},"யாண்டெக்ஸ் மொழிபெயர்ப்பு":{"s":{"ட","ெ","ொ","ு","ம","ர","ண","க","்","ா","ய","ப","ழ","ஸ","ி"},"l":7.280109889280518,"c":{"ய":2,"ா":1,"ண":1,"்":5,"ட":1,"ெ":2,"க":1,"ஸ":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ர":1,"ு":1},"t":"YandexTranslate"},"API du traducteur de yandex":{"s":{"n","d","t","u","c","r","y","a","p","e","i","x"},"l":7.54983443527075,"c":{"a":3,"p":1,"i":1,"d":4,"u":3,"t":2,"r":2,"c":1,"e":3,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Йандекс":{"s":{"к","н","с","а","й","д","е"},"l":2.6457513110645907,"c":{"й":1,"а":1,"н":1,"д":1,"е":1,"к":1,"с":1},"t":"YandexTranslate"},"yandex翻译器":{"s":{"n","d","译","y","翻","器","a","e","x"},"l":3.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"翻":1,"译":1,"器":1},"t":"YandexTranslate"},"Yandex þýða":{"s":{"þ","ð","n","d","ý","y","a","e","x"},"l":3.4641016151377544,"c":{"y":1,"a":2,"n":1,"d":1,"e":1,"x":1,"þ":1,"ý":1,"ð":1},"t":"YandexTranslate"},"Ioe":{"s":{"o","e","i"},"l":1.7320508075688772,"c":{"i":1,"o":1,"e":1},"t":"YandexTranslate"},"Tha Yandex ag eadar-theangachadh":{"s":{"g","n","h","d","t","c","r","y","-","a","e","x"},"l":10.723805294763608,"c":{"t":2,"h":4,"a":8,"y":1,"n":2,"d":3,"e":3,"x":1,"g":2,"r":1,"-":1,"c":1},"t":"YandexTranslate"},"Yandex Wotanthauzira API":{"s":{"n","h","d","w","t","p","u","r","y","z","a","o","e","i","x"},"l":6.928203230275509,"c":{"y":1,"a":5,"n":2,"d":1,"e":1,"x":1,"w":1,"o":1,"t":2,"h":1,"u":1,"z":1,"i":2,"r":1,"p":1},"t":"YandexTranslate"},"Penerjemén yandex":{"s":{"n","j","d","r","y","m","a","p","e","é","x"},"l":5.830951894845301,"c":{"p":1,"e":4,"n":3,"r":1,"j":1,"m":1,"é":1,"y":1,"a":1,"d":1,"x":1},"t":"YandexTranslate"},"Јандекс преведувач":{"s":{"к","н","ч","р","в","с","а","ј","д","у","п","е"},"l":5.385164807134504,"c":{"ј":1,"а":2,"н":1,"д":2,"е":3,"к":1,"с":1,"п":1,"р":1,"в":2,"у":1,"ч":1},"t":"YandexTranslate"},"Yandex turjubaan API":{"s":{"n","b","d","j","t","u","r","y","a","p","e","i","x"},"l":5.830951894845301,"c":{"y":1,"a":4,"n":2,"d":1,"e":1,"x":1,"t":1,"u":2,"r":1,"j":1,"b":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandexx":{"s":{"n","d","y","a","e","x"},"l":3.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":2},"t":"YandexTranslate"},"Yandex翻訳":{"s":{"n","訳","d","y","翻","a","e","x"},"l":2.8284271247461903,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"翻":1,"訳":1},"t":"YandexTranslate"},"Jandekss":{"s":{"n","d","j","s","k","a","e"},"l":3.1622776601683795,"c":{"j":1,"a":1,"n":1,"d":1,"e":1,"k":1,"s":2},"t":"YandexTranslate"},"યાન્ડેક્સ અનુવાદ":{"s":{"ા","ન","ડ","સ","ુ","્","ય","ે","ક","અ","દ","વ"},"l":4.58257569495584,"c":{"ય":1,"ા":2,"ન":2,"્":2,"ડ":1,"ે":1,"ક":1,"સ":1,"અ":1,"ુ":1,"વ":1,"દ":1},"t":"YandexTranslate"},"مترجم Yandex":{"s":{"n","d","م","ر","y","ت","a","ج","e","x"},"l":3.605551275463989,"c":{"م":2,"ت":1,"ر":1,"ج":1,"y":1,"a":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Иандек Транслатор":{"s":{"к","н","л","и","р","с","а","д","о","е","т"},"l":5.291502622129181,"c":{"и":1,"а":3,"н":2,"д":1,"е":1,"к":1,"т":2,"р":2,"с":1,"л":1,"о":1},"t":"YandexTranslate"},"Yandex fordító":{"s":{"ó","n","f","d","t","í","r","y","a","o","e","x"},"l":3.872983346207417,"c":{"y":1,"a":1,"n":1,"d":2,"e":1,"x":1,"f":1,"o":1,"r":1,"í":1,"t":1,"ó":1},"t":"YandexTranslate"},"یاندیکس مترجم":{"s":{"ک","ی","س","ا","م","ر","ت","ج","ن","د"},"l":4.0,"c":{"ی":2,"ا":1,"ن":1,"د":1,"ک":1,"س":1,"م":2,"ت":1,"ر":1,"ج":1},"t":"YandexTranslate"},"Yandex Übersetzer -API":{"s":{"n","b","ü","d","t","r","y","s","z","-","a","p","e","i","x"},"l":6.0,"c":{"y":1,"a":2,"n":1,"d":1,"e":4,"x":1,"ü":1,"b":1,"r":2,"s":1,"t":1,"z":1,"-":1,"p":1,"i":1},"t":"YandexTranslate"},"साउदेव":{"s":{"े","द","ा","स","व","उ"},"l":2.449489742783178,"c":{"स":1,"ा":1,"उ":1,"द":1,"े":1,"व":1},"t":"YandexTranslate"},"Yandex орчуулга":{"s":{"л","ч","n","d","а","г","y","р","о","у","a","e","x"},"l":4.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1},"t":"YandexTranslate"},"Yandex traduki":{"s":{"n","d","t","u","r","y","k","a","e","i","x"},"l":4.123105625617661,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"t":1,"r":1,"u":1,"k":1,"i":1},"t":"YandexTranslate"},"Yandex преводач":{"s":{"е","ч","n","п","d","в","а","y","д","р","о","a","e","x"},"l":3.7416573867739413,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"а":1,"ч":1},"t":"YandexTranslate"},"ਯਾਂਡੇਕਸ ਅਨੁਵਾਦ":{"s":{"ਂ","ੇ","ਅ","ਾ","ਕ","ਵ","ੁ","ਯ","ਸ","ਡ","ਨ","ਦ"},"l":3.872983346207417,"c":{"ਯ":1,"ਾ":2,"ਂ":1,"ਡ":1,"ੇ":1,"ਕ":1,"ਸ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1},"t":"YandexTranslate"},"Eadar-theangaire Yandex":{"s":{"g","n","h","d","t","r","-","y","a","e","i","x"},"l":7.745966692414834,"c":{"e":4,"a":5,"d":2,"r":2,"-":1,"t":1,"h":1,"n":2,"g":1,"i":1,"y":1,"x":1},"t":"YandexTranslate"},"Yandex traduit":{"s":{"n","d","t","u","r","y","a","e","i","x"},"l":4.358898943540674,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"t":2,"r":1,"u":1,"i":1},"t":"YandexTranslate"},"API Cyfieithydd Yandex":{"s":{"a","n","h","f","d","t","y","c","p","e","i","x"},"l":6.48074069840786,"c":{"a":2,"p":1,"i":3,"c":1,"y":3,"f":1,"e":2,"t":1,"h":1,"d":3,"n":1,"x":1},"t":"YandexTranslate"},"යැන්ඩෙක්ස් ට්රාන්ස්ලේටර් API":{"s":{"න","ැ","ඩ","ේ","ක","ෙ","ල","්","ස","ා","ය","ට","a","p","i","ර"},"l":8.717797887081348,"c":{"ය":1,"ැ":1,"න":2,"්":7,"ඩ":1,"ෙ":1,"ක":1,"ස":2,"ට":2,"ර":2,"ා":1,"ල":1,"ේ":1,"a":1,"p":1,"i":1},"t":"YandexTranslate"},"Yandex -Übersetzer":{"s":{"n","b","ü","d","t","r","y","-","s","z","a","e","x"},"l":5.5677643628300215,"c":{"y":1,"a":1,"n":1,"d":1,"e":4,"x":1,"-":1,"ü":1,"b":1,"r":2,"s":1,"t":1,"z":1},"t":"YandexTranslate"},"ইয়ানডেক্স অনুবাদক এপিআই":{"s":{"য","অ","ি","ু","আ","এ","ই","ন","দ","ক","্","়","া","ব","স","ড","ে","প"},"l":5.477225575051661,"c":{"ই":2,"য":1,"়":1,"া":2,"ন":2,"ড":1,"ে":1,"ক":2,"্":1,"স":1,"অ":1,"ু":1,"ব":1,"দ":1,"এ":1,"প":1,"ি":1,"আ":1},"t":"YandexTranslate"},"Yandexi tõlkija API":{"s":{"n","d","j","t","l","y","k","õ","a","p","e","i","x"},"l":5.385164807134504,"c":{"y":1,"a":3,"n":1,"d":1,"e":1,"x":1,"i":3,"t":1,"õ":1,"l":1,"k":1,"j":1,"p":1},"t":"YandexTranslate"},"Oureka":{"s":{"u","r","k","a","o","e"},"l":2.449489742783178,"c":{"o":1,"u":1,"r":1,"e":1,"k":1,"a":1},"t":"YandexTranslate"},"Yandex Çevir":{"s":{"n","d","v","r","y","ç","a","e","i","x"},"l":3.605551275463989,"c":{"y":1,"a":1,"n":1,"d":1,"e":2,"x":1,"ç":1,"v":1,"i":1,"r":1},"t":"YandexTranslate"},"API YANDEX traduttore":{"s":{"n","o","d","t","u","r","y","a","p","e","i","x"},"l":6.082762530298219,"c":{"a":3,"p":1,"i":1,"y":1,"n":1,"d":2,"e":2,"x":1,"t":3,"r":2,"u":1,"o":1},"t":"YandexTranslate"},"Yandex翻訳者":{"s":{"n","訳","d","者","y","翻","a","e","x"},"l":3.0,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"翻":1,"訳":1,"者":1},"t":"YandexTranslate"},"यैंडेक्स अनुवादक एपीआई":{"s":{"ड","ई","क","य","े","ी","न","्","द","स","ं","ै","ए","प","अ","ु","ा","व","आ"},"l":4.69041575982343,"c":{"य":1,"ै":1,"ं":1,"ड":1,"े":1,"क":2,"्":1,"स":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"YandexTranslate"},"Yandex përkthen":{"s":{"ë","n","h","d","t","r","y","k","a","p","e","x"},"l":4.242640687119285,"c":{"y":1,"a":1,"n":2,"d":1,"e":2,"x":1,"p":1,"ë":1,"r":1,"k":1,"t":1,"h":1},"t":"YandexTranslate"},"Yandex þýðandi":{"s":{"þ","ð","n","d","ý","y","a","e","i","x"},"l":4.358898943540674,"c":{"y":1,"a":2,"n":2,"d":2,"e":1,"x":1,"þ":1,"ý":1,"ð":1,"i":1},"t":"YandexTranslate"},"Radaris":{"s":{"d","r","s","a","i"},"l":3.3166247903554,"c":{"r":2,"a":2,"d":1,"i":1,"s":1},"t":"YandexTranslate"},"Yandex tradiktè":{"s":{"n","è","d","t","r","y","k","a","e","i","x"},"l":4.47213595499958,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"t":2,"r":1,"i":1,"k":1,"è":1},"t":"YandexTranslate"},"Yandex jittraduċi":{"s":{"n","d","j","t","u","r","y","ċ","a","e","i","x"},"l":4.898979485566356,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"j":1,"i":2,"t":2,"r":1,"u":1,"ċ":1},"t":"YandexTranslate"},"Yandex vertalen":{"s":{"n","d","t","l","v","r","y","a","e","x"},"l":4.898979485566356,"c":{"y":1,"a":2,"n":2,"d":1,"e":3,"x":1,"v":1,"r":1,"t":1,"l":1},"t":"YandexTranslate"},"ইয়ানডেক্স":{"s":{"য","ই","ন","ক","্","়","া","স","ড","ে"},"l":3.1622776601683795,"c":{"ই":1,"য":1,"়":1,"া":1,"ন":1,"ড":1,"ে":1,"ক":1,"্":1,"স":1},"t":"YandexTranslate"},"Yandex ترجمہ":{"s":{"n","d","ہ","م","ر","y","ت","a","ج","e","x"},"l":3.3166247903554,"c":{"y":1,"a":1,"n":1,"d":1,"e":1,"x":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1},"t":"YandexTranslate"},"ያሻል ተርጓሚ":{"s":{"ሻ","ል","ሚ","ተ","ር","ጓ","ያ"},"l":2.6457513110645907,"c":{"ያ":1,"ሻ":1,"ል":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"YandexTranslate"},"API do tradutor de Yandex":{"s":{"n","d","t","p","u","r","y","a","o","e","i","x"},"l":6.855654600401044,"c":{"a":3,"p":1,"i":1,"d":4,"o":2,"t":2,"r":2,"u":1,"e":2,"y":1,"n":1,"x":1},"t":"YandexTranslate"},"Yandex tərcümə edin":{"s":{"n","ü","d","t","c","ə","y","r","m","a","e","i","x"},"l":5.0,"c":{"y":1,"a":1,"n":2,"d":2,"e":2,"x":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"i":1},"t":"YandexTranslate"},"Yandex traduz":{"s":{"n","d","t","u","r","y","z","a","e","x"},"l":4.0,"c":{"y":1,"a":2,"n":1,"d":2,"e":1,"x":1,"t":1,"r":1,"u":1,"z":1},"t":"YandexTranslate"},"API перакладчыка Yandex":{"s":{"к","л","ч","п","n","d","а","e","д","y","р","ы","a","p","е","i","x"},"l":5.5677643628300215,"c":{"a":2,"p":1,"i":1,"п":1,"е":1,"р":1,"а":3,"к":2,"л":1,"д":1,"ч":1,"ы":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"ယန်":{"s":{"ယ","န","်"},"l":1.7320508075688772,"c":{"ယ":1,"န":1,"်":1},"t":"YandexTranslate"},"Tagasalin ng Yandex":{"s":{"g","n","d","t","l","y","s","a","e","i","x"},"l":6.082762530298219,"c":{"t":1,"a":4,"g":2,"s":1,"l":1,"i":1,"n":3,"y":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"API μεταφραστή Yandex":{"s":{"τ","α","ρ","ή","n","d","μ","φ","y","ε","σ","a","p","e","i","x"},"l":5.0,"c":{"a":2,"p":1,"i":1,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"y":1,"n":1,"d":1,"e":1,"x":1},"t":"YandexTranslate"},"Yandex prevodilac":{"s":{"n","o","d","l","v","c","r","y","a","p","e","i","x"},"l":4.69041575982343,"c":{"y":1,"a":2,"n":1,"d":2,"e":2,"x":1,"p":1,"r":1,"v":1,"o":1,"i":1,"l":1,"c":1},"t":"YandexTranslate"},"Яндекс переводчик":{"s":{"к","н","ч","и","р","я","в","с","д","о","п","е"},"l":5.0990195135927845,"c":{"я":1,"н":1,"д":2,"е":3,"к":2,"с":1,"п":1,"р":1,"в":1,"о":1,"ч":1,"и":1},"t":"YandexTranslate"},"ଲିବ୍ରେ":{"s":{"ି","୍","ବ","େ","ଲ","ର"},"l":2.449489742783178,"c":{"ଲ":1,"ି":1,"ବ":1,"୍":1,"ର":1,"େ":1},"t":"LibreTranslate"},"Libu Tugharia":{"s":{"g","b","h","l","t","u","r","a","i"},"l":4.242640687119285,"c":{"l":1,"i":2,"b":1,"u":2,"t":1,"g":1,"h":1,"a":2,"r":1},"t":"LibreTranslate"},"Libre Aistritheoir":{"s":{"b","h","l","t","r","s","a","o","e","i"},"l":6.244997998398398,"c":{"l":1,"i":4,"b":1,"r":3,"e":2,"a":1,"s":1,"t":2,"h":1,"o":1},"t":"LibreTranslate"},"API i përkthyesit Libre":{"s":{"ë","h","b","t","l","r","y","s","k","a","p","e","i"},"l":6.324555320336759,"c":{"a":1,"p":2,"i":4,"ë":1,"r":2,"k":1,"t":2,"h":1,"y":1,"e":2,"s":1,"l":1,"b":1},"t":"LibreTranslate"},"Libre traduce":{"s":{"b","d","l","t","u","c","r","a","e","i"},"l":4.0,"c":{"l":1,"i":1,"b":1,"r":2,"e":2,"t":1,"a":1,"d":1,"u":1,"c":1},"t":"LibreTranslate"},"API Penerjemah Libre":{"s":{"n","h","b","j","l","r","m","a","p","e","i"},"l":6.164414002968976,"c":{"a":2,"p":2,"i":2,"e":4,"n":1,"r":2,"j":1,"m":1,"h":1,"l":1,"b":1},"t":"LibreTranslate"},"لبر":{"s":{"ب","ل","ر"},"l":1.7320508075688772,"c":{"ل":1,"ب":1,"ر":1},"t":"LibreTranslate"},"Libre þýðandi API":{"s":{"þ","ð","n","b","d","l","ý","r","a","p","e","i"},"l":4.795831523312719,"c":{"l":1,"i":3,"b":1,"r":1,"e":1,"þ":1,"ý":1,"ð":1,"a":2,"n":1,"d":1,"p":1},"t":"LibreTranslate"},"Libre kääntää":{"s":{"n","b","l","t","r","ä","k","e","i"},"l":4.898979485566356,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"k":1,"ä":4,"n":1,"t":1},"t":"LibreTranslate"},"Libre Terjemahan":{"s":{"n","b","h","j","l","t","r","m","a","e","i"},"l":5.0,"c":{"l":1,"i":1,"b":1,"r":2,"e":3,"t":1,"j":1,"m":1,"a":2,"h":1,"n":1},"t":"LibreTranslate"},"Libre cyfieithu":{"s":{"b","f","h","l","t","u","r","y","c","e","i"},"l":4.69041575982343,"c":{"l":1,"i":3,"b":1,"r":1,"e":2,"c":1,"y":1,"f":1,"t":1,"h":1,"u":1},"t":"LibreTranslate"},"Pukapuka pukapuka":{"s":{"u","k","a","p"},"l":8.0,"c":{"p":4,"u":4,"k":4,"a":4},"t":"LibreTranslate"},"Libre dịch":{"s":{"b","h","d","l","r","ị","c","e","i"},"l":3.0,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"d":1,"ị":1,"c":1,"h":1},"t":"LibreTranslate"},"API LIBRE Translator API":{"s":{"n","b","o","l","t","r","s","a","p","e","i"},"l":7.14142842854285,"c":{"a":4,"p":2,"i":3,"l":2,"b":1,"r":3,"e":1,"t":2,"n":1,"s":1,"o":1},"t":"LibreTranslate"},"Libre tradwi":{"s":{"b","d","w","l","t","r","a","e","i"},"l":3.872983346207417,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":1,"a":1,"d":1,"w":1},"t":"LibreTranslate"},"Перакладчык Libre":{"s":{"к","л","ч","b","l","а","e","r","д","р","ы","п","е","i"},"l":4.47213595499958,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Libre 번역기":{"s":{"번","b","기","l","역","r","e","i"},"l":2.8284271247461903,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"번":1,"역":1,"기":1},"t":"LibreTranslate"},"Libre Translate":{"s":{"n","b","l","t","r","s","a","e","i"},"l":4.898979485566356,"c":{"l":2,"i":1,"b":1,"r":2,"e":2,"t":2,"a":2,"n":1,"s":1},"t":"LibreTranslate"},"API מתרגם Libre":{"s":{"ת","ג","ר","b","l","r","ם","a","p","e","i","מ"},"l":3.872983346207417,"c":{"a":1,"p":1,"i":2,"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Traducció libre":{"s":{"ó","b","d","t","l","u","c","r","a","e","i"},"l":4.47213595499958,"c":{"t":1,"r":2,"a":1,"d":1,"u":1,"c":2,"i":2,"ó":1,"l":1,"b":1,"e":1},"t":"LibreTranslate"},"Libre Translator":{"s":{"n","b","l","t","r","s","a","o","e","i"},"l":5.196152422706632,"c":{"l":2,"i":1,"b":1,"r":3,"e":1,"t":2,"a":2,"n":1,"s":1,"o":1},"t":"LibreTranslate"},"Traductor de Libre":{"s":{"b","d","t","l","u","c","r","a","o","e","i"},"l":5.291502622129181,"c":{"t":2,"r":3,"a":1,"d":2,"u":1,"c":1,"o":1,"e":2,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"Eadar-theangair Libre":{"s":{"g","n","h","b","d","t","l","r","-","a","e","i"},"l":6.782329983125268,"c":{"e":3,"a":4,"d":1,"r":3,"-":1,"t":1,"h":1,"n":1,"g":1,"i":2,"l":1,"b":1},"t":"LibreTranslate"},"បកប្រែការបកប្រែ":{"s":{"ប","រ","្","ែ","ក","ា"},"l":6.557438524302,"c":{"ប":4,"ក":3,"្":2,"រ":3,"ែ":2,"ា":1},"t":"LibreTranslate"},"لیبر وژباړه":{"s":{"ب","و","ی","ل","ړ","ا","ر","ژ","ه"},"l":3.4641016151377544,"c":{"ل":1,"ی":1,"ب":2,"ر":1,"و":1,"ژ":1,"ا":1,"ړ":1,"ه":1},"t":"LibreTranslate"},"Lib Translatete":{"s":{"n","b","l","t","r","s","a","e","i"},"l":5.0990195135927845,"c":{"l":2,"i":1,"b":1,"t":3,"r":1,"a":2,"n":1,"s":1,"e":2},"t":"LibreTranslate"},"لبر مترجم":{"s":{"ب","ل","م","ر","ت","ج"},"l":3.4641016151377544,"c":{"ل":1,"ب":1,"ر":2,"م":2,"ت":1,"ج":1},"t":"LibreTranslate"},"Либре превод":{"s":{"б","л","и","в","д","р","о","п","е"},"l":3.872983346207417,"c":{"л":1,"и":1,"б":1,"р":2,"е":2,"п":1,"в":1,"о":1,"д":1},"t":"LibreTranslate"},"API tłumacza libre":{"s":{"b","t","l","ł","u","c","r","z","m","a","p","e","i"},"l":4.898979485566356,"c":{"a":3,"p":1,"i":2,"t":1,"ł":1,"u":1,"m":1,"c":1,"z":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"ଲିବ୍ରେ ଅନୁବାଦ |":{"s":{"ି","ୁ","ା","୍","ଦ","ବ","ନ","େ","|","ଲ","ର","ଅ"},"l":3.872983346207417,"c":{"ଲ":1,"ି":1,"ବ":2,"୍":1,"ର":1,"େ":1,"ଅ":1,"ନ":1,"ୁ":1,"ା":1,"ଦ":1,"|":1},"t":"LibreTranslate"},"Libre prevesti":{"s":{"b","l","t","v","r","s","p","e","i"},"l":4.795831523312719,"c":{"l":1,"i":2,"b":1,"r":2,"e":3,"p":1,"v":1,"s":1,"t":1},"t":"LibreTranslate"},"Tinfnutan":{"s":{"n","f","t","u","a","i"},"l":4.123105625617661,"c":{"t":2,"i":1,"n":3,"f":1,"u":1,"a":1},"t":"LibreTranslate"},"Libera Tradukisto":{"s":{"b","d","l","t","u","r","s","k","a","o","e","i"},"l":4.898979485566356,"c":{"l":1,"i":2,"b":1,"e":1,"r":2,"a":2,"t":2,"d":1,"u":1,"k":1,"s":1,"o":1},"t":"LibreTranslate"},"Libre çevirmen API":{"s":{"n","b","l","v","r","m","ç","a","p","e","i"},"l":5.477225575051661,"c":{"l":1,"i":3,"b":1,"r":2,"e":3,"ç":1,"v":1,"m":1,"n":1,"a":1,"p":1},"t":"LibreTranslate"},"מתרגם Libre":{"s":{"ת","ג","b","l","r","ם","ר","e","i","מ"},"l":3.1622776601683795,"c":{"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"लिब अनुवाद":{"s":{"ु","ि","न","अ","द","ा","ब","ल","व"},"l":3.0,"c":{"ल":1,"ि":1,"ब":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"LibreTranslate"},"I-Liner Guqula":{"s":{"g","n","l","u","q","r","-","a","e","i"},"l":4.358898943540674,"c":{"i":2,"-":1,"l":2,"n":1,"e":1,"r":1,"g":1,"u":2,"q":1,"a":1},"t":"LibreTranslate"},"Civildəmək":{"s":{"d","l","v","ə","m","k","c","i"},"l":3.7416573867739413,"c":{"c":1,"i":2,"v":1,"l":1,"d":1,"ə":2,"m":1,"k":1},"t":"LibreTranslate"},"Libre turjuma":{"s":{"b","j","l","t","u","r","m","a","e","i"},"l":4.0,"c":{"l":1,"i":1,"b":1,"r":2,"e":1,"t":1,"u":2,"j":1,"m":1,"a":1},"t":"LibreTranslate"},"Liabre Tranfaictor API":{"s":{"n","b","f","l","t","p","c","r","a","o","e","i"},"l":6.782329983125268,"c":{"l":1,"i":3,"a":4,"b":1,"r":3,"e":1,"t":2,"n":1,"f":1,"c":1,"o":1,"p":1},"t":"LibreTranslate"},"Besplatno prevoditelj API":{"s":{"n","b","o","d","j","l","t","v","r","s","a","p","e","i"},"l":6.708203932499369,"c":{"b":1,"e":3,"s":1,"p":3,"l":2,"a":2,"t":2,"n":1,"o":2,"r":1,"v":1,"d":1,"i":2,"j":1},"t":"LibreTranslate"},"Traduttore libre":{"s":{"b","d","t","l","u","r","a","o","e","i"},"l":5.385164807134504,"c":{"t":3,"r":3,"a":1,"d":1,"u":1,"o":1,"e":2,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"Libre अनुवाद":{"s":{"b","l","ु","न","अ","द","r","ा","व","e","i"},"l":3.3166247903554,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"LibreTranslate"},"Tafsiri ya libre":{"s":{"b","f","t","l","r","y","s","a","e","i"},"l":4.898979485566356,"c":{"t":1,"a":2,"f":1,"s":1,"i":3,"r":2,"y":1,"l":1,"b":1,"e":1},"t":"LibreTranslate"},"Libre 번역기 API":{"s":{"번","b","기","l","역","r","a","p","e","i"},"l":3.605551275463989,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"번":1,"역":1,"기":1,"a":1,"p":1},"t":"LibreTranslate"},"ሊብራር":{"s":{"ብ","ሊ","ራ","ር"},"l":2.0,"c":{"ሊ":1,"ብ":1,"ራ":1,"ር":1},"t":"LibreTranslate"},"Libre traduit":{"s":{"b","d","l","t","u","r","a","e","i"},"l":4.242640687119285,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":2,"a":1,"d":1,"u":1},"t":"LibreTranslate"},"libre ترجمه":{"s":{"b","l","م","r","ت","ر","ه","ج","e","i"},"l":3.1622776601683795,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"ت":1,"ر":1,"ج":1,"م":1,"ه":1},"t":"LibreTranslate"},"Либра":{"s":{"б","л","и","а","р"},"l":2.23606797749979,"c":{"л":1,"и":1,"б":1,"р":1,"а":1},"t":"LibreTranslate"},"लिबरे अनुवादक":{"s":{"े","ु","ि","न","अ","द","ा","र","ब","ल","क","व"},"l":3.4641016151377544,"c":{"ल":1,"ि":1,"ब":1,"र":1,"े":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"LibreTranslate"},"Mail":{"s":{"a","i","l","m"},"l":2.0,"c":{"m":1,"a":1,"i":1,"l":1},"t":"LibreTranslate"},"Libre аудармасы":{"s":{"b","р","l","ы","с","а","r","д","м","у","e","i"},"l":4.47213595499958,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"а":3,"у":1,"д":1,"р":1,"м":1,"с":1,"ы":1},"t":"LibreTranslate"},"Libre tulkotāja API":{"s":{"b","j","l","t","p","u","r","k","a","o","e","i","ā"},"l":5.0,"c":{"l":2,"i":2,"b":1,"r":1,"e":1,"t":2,"u":1,"k":1,"o":1,"ā":1,"j":1,"a":2,"p":1},"t":"LibreTranslate"},"Translator Libre":{"s":{"n","b","t","l","r","s","a","o","e","i"},"l":5.196152422706632,"c":{"t":2,"r":3,"a":2,"n":1,"s":1,"l":2,"o":1,"i":1,"b":1,"e":1},"t":"LibreTranslate"},"Libre fassarar API":{"s":{"b","f","l","r","s","a","p","e","i"},"l":6.164414002968976,"c":{"l":1,"i":2,"b":1,"r":3,"e":1,"f":1,"a":4,"s":2,"p":1},"t":"LibreTranslate"},"లిబ్రే అనువాదకుడు API":{"s":{"ర","ల","్","ద","క","ా","డ","వ","ి","బ","ే","న","ు","a","p","అ","i"},"l":5.0,"c":{"ల":1,"ి":1,"బ":1,"్":1,"ర":1,"ే":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"Libre fordító":{"s":{"ó","b","f","d","l","t","í","r","o","e","i"},"l":3.7416573867739413,"c":{"l":1,"i":1,"b":1,"r":2,"e":1,"f":1,"o":1,"d":1,"í":1,"t":1,"ó":1},"t":"LibreTranslate"},"Libre Spurity Api":{"s":{"b","l","t","u","r","y","s","a","p","e","i"},"l":5.0,"c":{"l":1,"i":3,"b":1,"r":2,"e":1,"s":1,"p":2,"u":1,"t":1,"y":1,"a":1},"t":"LibreTranslate"},"Tok Pisin":{"s":{"n","t","p","s","k","o","i"},"l":3.1622776601683795,"c":{"t":1,"o":1,"k":1,"p":1,"i":2,"s":1,"n":1},"t":"LibreTranslate"},"Libre faaliliu":{"s":{"b","f","l","u","r","a","e","i"},"l":5.196152422706632,"c":{"l":3,"i":3,"b":1,"r":1,"e":1,"f":1,"a":2,"u":1},"t":"LibreTranslate"},"Libre Iwwersetzer API":{"s":{"b","w","l","t","r","s","z","a","p","e","i"},"l":6.708203932499369,"c":{"l":1,"i":3,"b":1,"r":3,"e":4,"w":2,"s":1,"t":1,"z":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre übersetzt":{"s":{"b","ü","l","t","r","s","z","e","i"},"l":5.0990195135927845,"c":{"l":1,"i":1,"b":2,"r":2,"e":3,"ü":1,"s":1,"t":2,"z":1},"t":"LibreTranslate"},"ترجمة ليبر":{"s":{"ب","ة","ل","ي","م","ر","ت","ج"},"l":3.3166247903554,"c":{"ت":1,"ر":2,"ج":1,"م":1,"ة":1,"ل":1,"ي":1,"ب":1},"t":"LibreTranslate"},"لیبری ترجمہ کریں":{"s":{"ب","ک","ی","ل","ہ","م","ر","ت","ں","ج"},"l":5.0990195135927845,"c":{"ل":1,"ی":3,"ب":1,"ر":3,"ت":1,"ج":1,"م":1,"ہ":1,"ک":1,"ں":1},"t":"LibreTranslate"},"Libre орчуулагч API":{"s":{"л","ч","b","l","а","r","г","р","о","у","a","p","e","i"},"l":4.795831523312719,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"a":1,"p":1},"t":"LibreTranslate"},"Libree turjubaan API":{"s":{"n","b","j","l","t","u","r","a","p","e","i"},"l":5.830951894845301,"c":{"l":1,"i":2,"b":2,"r":2,"e":2,"t":1,"u":2,"j":1,"a":3,"n":1,"p":1},"t":"LibreTranslate"},"Байланыс":{"s":{"б","л","н","с","а","й","ы"},"l":3.1622776601683795,"c":{"б":1,"а":2,"й":1,"л":1,"н":1,"ы":1,"с":1},"t":"LibreTranslate"},"Libre თარჯიმანი API":{"s":{"თ","b","ჯ","l","ა","რ","მ","r","ნ","a","p","e","i","ი"},"l":4.795831523312719,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"a":1,"p":1},"t":"LibreTranslate"},"Либр Тарҷума":{"s":{"б","л","м","и","а","р","ҷ","у","т"},"l":3.872983346207417,"c":{"л":1,"и":1,"б":1,"р":2,"т":1,"а":2,"ҷ":1,"у":1,"м":1},"t":"LibreTranslate"},"Prevoditelj libre":{"s":{"b","d","j","t","l","p","v","r","o","e","i"},"l":5.291502622129181,"c":{"p":1,"r":2,"e":3,"v":1,"o":1,"d":1,"i":2,"t":1,"l":2,"j":1,"b":1},"t":"LibreTranslate"},"Libre þýða":{"s":{"þ","ð","b","l","ý","r","a","e","i"},"l":3.0,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"þ":1,"ý":1,"ð":1,"a":1},"t":"LibreTranslate"},"Libre аудармашы API":{"s":{"b","ш","р","l","ы","а","r","д","м","у","a","p","e","i"},"l":5.0,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1,"a":1,"p":1},"t":"LibreTranslate"},"API на Libre Translator":{"s":{"н","n","b","o","l","t","а","r","s","a","p","e","i"},"l":6.164414002968976,"c":{"a":3,"p":1,"i":2,"н":1,"а":1,"l":2,"b":1,"r":3,"e":1,"t":2,"n":1,"s":1,"o":1},"t":"LibreTranslate"},"लिब्रे अनुवादक एपीआई":{"s":{"े","ी","ए","प","ु","ई","ि","न","्","अ","द","ा","र","ब","ल","क","व","आ"},"l":4.242640687119285,"c":{"ल":1,"ि":1,"ब":1,"्":1,"र":1,"े":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"LibreTranslate"},"LIBLI Dudziro":{"s":{"b","d","l","u","r","z","o","i"},"l":4.69041575982343,"c":{"l":2,"i":3,"b":1,"d":2,"u":1,"z":1,"r":1,"o":1},"t":"LibreTranslate"},"Libre -Übersetzer":{"s":{"b","ü","l","t","r","-","s","z","e","i"},"l":6.0,"c":{"l":1,"i":1,"b":2,"r":3,"e":4,"-":1,"ü":1,"s":1,"t":1,"z":1},"t":"LibreTranslate"},"Liter Spetator":{"s":{"o","l","t","r","s","a","p","e","i"},"l":4.795831523312719,"c":{"l":1,"i":1,"t":3,"e":2,"r":2,"s":1,"p":1,"a":1,"o":1},"t":"LibreTranslate"},"Libre tulkotājs":{"s":{"b","j","l","t","u","r","s","k","o","e","i","ā"},"l":4.242640687119285,"c":{"l":2,"i":1,"b":1,"r":1,"e":1,"t":2,"u":1,"k":1,"o":1,"ā":1,"j":1,"s":1},"t":"LibreTranslate"},"Libre Tradukisto API":{"s":{"b","d","l","t","p","u","r","s","k","a","o","e","i"},"l":5.477225575051661,"c":{"l":1,"i":3,"b":1,"r":2,"e":1,"t":2,"a":2,"d":1,"u":1,"k":1,"s":1,"o":1,"p":1},"t":"LibreTranslate"},"লিব্রে":{"s":{"ি","ল","ব","র","্","ে"},"l":2.449489742783178,"c":{"ল":1,"ি":1,"ব":1,"্":1,"র":1,"ে":1},"t":"LibreTranslate"},"Purwadi":{"s":{"d","w","u","r","a","p","i"},"l":2.6457513110645907,"c":{"p":1,"u":1,"r":1,"w":1,"a":1,"d":1,"i":1},"t":"LibreTranslate"},"Ляре":{"s":{"л","я","е","р"},"l":2.0,"c":{"л":1,"я":1,"р":1,"е":1},"t":"LibreTranslate"},"આળસતું":{"s":{"સ","ુ","ળ","ત","ં","આ"},"l":2.449489742783178,"c":{"આ":1,"ળ":1,"સ":1,"ત":1,"ુ":1,"ં":1},"t":"LibreTranslate"},"Libre Translator Api":{"s":{"n","b","l","t","p","r","s","a","o","e","i"},"l":6.0,"c":{"l":2,"i":2,"b":1,"r":3,"e":1,"t":2,"a":3,"n":1,"s":1,"o":1,"p":1},"t":"LibreTranslate"},"Libre tõlkija API":{"s":{"b","j","l","t","r","k","õ","a","p","e","i"},"l":5.0,"c":{"l":2,"i":3,"b":1,"r":1,"e":1,"t":1,"õ":1,"k":1,"j":1,"a":2,"p":1},"t":"LibreTranslate"},"Mabre Whakawhiti":{"s":{"b","h","w","t","r","m","k","a","e","i"},"l":5.196152422706632,"c":{"m":1,"a":3,"b":1,"r":1,"e":1,"w":2,"h":2,"k":1,"i":2,"t":1},"t":"LibreTranslate"},"Libre çevirmen":{"s":{"n","b","l","v","r","m","ç","e","i"},"l":4.795831523312719,"c":{"l":1,"i":2,"b":1,"r":2,"e":3,"ç":1,"v":1,"m":1,"n":1},"t":"LibreTranslate"},"Libre itzultzailea APIa":{"s":{"b","l","t","u","r","z","a","p","e","i"},"l":7.54983443527075,"c":{"l":3,"i":4,"b":1,"r":1,"e":2,"t":2,"z":2,"u":1,"a":4,"p":1},"t":"LibreTranslate"},"Traducteur de libre":{"s":{"b","d","t","l","u","c","r","a","e","i"},"l":5.916079783099616,"c":{"t":2,"r":3,"a":1,"d":2,"u":2,"c":1,"e":3,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"API Whakawhitiwhiti able":{"s":{"h","b","w","t","l","k","a","p","e","i"},"l":8.246211251235321,"c":{"a":4,"p":1,"i":5,"w":3,"h":3,"k":1,"t":2,"b":1,"l":1,"e":1},"t":"LibreTranslate"},"Libre diterjemahkan":{"s":{"n","b","h","d","j","l","t","r","m","k","a","e","i"},"l":5.477225575051661,"c":{"l":1,"i":2,"b":1,"r":2,"e":3,"d":1,"t":1,"j":1,"m":1,"a":2,"h":1,"k":1,"n":1},"t":"LibreTranslate"},"Libre itzultzailea":{"s":{"b","l","t","u","r","z","a","e","i"},"l":6.082762530298219,"c":{"l":3,"i":3,"b":1,"r":1,"e":2,"t":2,"z":2,"u":1,"a":2},"t":"LibreTranslate"},"Libre Iwwersetzer":{"s":{"b","w","l","t","r","s","z","e","i"},"l":6.164414002968976,"c":{"l":1,"i":2,"b":1,"r":3,"e":4,"w":2,"s":1,"t":1,"z":1},"t":"LibreTranslate"},"Rebu onye ntụgharị API":{"s":{"g","n","b","h","t","p","u","r","y","ụ","ị","a","o","e","i"},"l":5.196152422706632,"c":{"r":2,"e":2,"b":1,"u":1,"o":1,"n":2,"y":1,"t":1,"ụ":1,"g":1,"h":1,"a":2,"ị":1,"p":1,"i":1},"t":"LibreTranslate"},"Libre ಅನುವಾದಿಸಿ":{"s":{"ವ","b","ು","ಸ","l","ಿ","ಅ","r","ನ","ಾ","ದ","e","i"},"l":4.0,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಿ":2,"ಸ":1},"t":"LibreTranslate"},"लिबरे अनुवादक एपीआई":{"s":{"े","ी","ए","प","ु","ई","ि","न","अ","द","ा","र","ब","ल","क","व","आ"},"l":4.123105625617661,"c":{"ल":1,"ि":1,"ब":1,"र":1,"े":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"LibreTranslate"},"API do tradutor Libre":{"s":{"b","d","t","l","p","u","r","a","o","e","i"},"l":5.830951894845301,"c":{"a":2,"p":1,"i":2,"d":2,"o":2,"t":2,"r":3,"u":1,"l":1,"b":1,"e":1},"t":"LibreTranslate"},"ವಿಘಟಿತ":{"s":{"ವ","ಿ","ಘ","ಟ","ತ"},"l":2.8284271247461903,"c":{"ವ":1,"ಿ":2,"ಘ":1,"ಟ":1,"ತ":1},"t":"LibreTranslate"},"Лабр":{"s":{"а","б","л","р"},"l":2.0,"c":{"л":1,"а":1,"б":1,"р":1},"t":"LibreTranslate"},"LIBRE Translat":{"s":{"n","b","l","t","r","s","a","e","i"},"l":4.58257569495584,"c":{"l":2,"i":1,"b":1,"r":2,"e":1,"t":2,"a":2,"n":1,"s":1},"t":"LibreTranslate"},"Onitumọ libre":{"s":{"n","b","t","l","u","r","ọ","m","o","e","i"},"l":3.7416573867739413,"c":{"o":1,"n":1,"i":2,"t":1,"u":1,"m":1,"ọ":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Libre котормочу API":{"s":{"к","ч","b","м","l","r","р","о","у","a","p","e","i","т"},"l":5.0,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"к":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre fordító API":{"s":{"ó","b","f","d","l","t","í","p","r","a","o","e","i"},"l":4.358898943540674,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"f":1,"o":1,"d":1,"í":1,"t":1,"ó":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre অনুবাদ":{"s":{"অ","ু","b","ন","দ","l","ব","r","া","e","i"},"l":3.3166247903554,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"অ":1,"ন":1,"ু":1,"ব":1,"া":1,"দ":1},"t":"LibreTranslate"},"Slobodan":{"s":{"n","b","d","l","s","a","o"},"l":3.1622776601683795,"c":{"s":1,"l":1,"o":2,"b":1,"d":1,"a":1,"n":1},"t":"LibreTranslate"},"Penerjemah Libre":{"s":{"n","h","b","j","l","r","m","a","p","e","i"},"l":5.385164807134504,"c":{"p":1,"e":4,"n":1,"r":2,"j":1,"m":1,"a":1,"h":1,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"Libre орчуулагч":{"s":{"л","ч","b","l","а","r","г","р","о","у","e","i"},"l":4.242640687119285,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1},"t":"LibreTranslate"},"អ្នកបកប្រែរបស់ Libre":{"s":{"ប","រ","i","្","b","ែ","ក","l","e","r","អ","ស","់","ន"},"l":5.5677643628300215,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":3,"រ":2,"ែ":1,"ស":1,"់":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"काम करना":{"s":{"न","ा","र","क","म"},"l":3.3166247903554,"c":{"क":2,"ा":2,"म":1,"र":1,"न":1},"t":"LibreTranslate"},"Libo":{"s":{"l","o","b","i"},"l":2.0,"c":{"l":1,"i":1,"b":1,"o":1},"t":"LibreTranslate"},"Libre Которуу Комментарий":{"s":{"к","е","н","b","м","и","l","а","r","й","р","о","у","e","i","т"},"l":6.244997998398398,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"к":2,"о":3,"т":2,"р":2,"у":2,"м":2,"е":1,"н":1,"а":1,"и":1,"й":1},"t":"LibreTranslate"},"ມິດ":{"s":{"ດ","ມ","ິ"},"l":1.7320508075688772,"c":{"ມ":1,"ິ":1,"ດ":1},"t":"LibreTranslate"},"Libre tõlge":{"s":{"g","b","l","t","r","õ","e","i"},"l":3.7416573867739413,"c":{"l":2,"i":1,"b":1,"r":1,"e":2,"t":1,"õ":1,"g":1},"t":"LibreTranslate"},"ဘာသာပြန်":{"s":{"ဘ","ြ","ာ","န","သ","ပ","်"},"l":3.1622776601683795,"c":{"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1,"်":1},"t":"TranslateComTranslate"},"API Libre Translator":{"s":{"n","b","o","l","t","r","s","a","p","e","i"},"l":6.0,"c":{"a":3,"p":1,"i":2,"l":2,"b":1,"r":3,"e":1,"t":2,"n":1,"s":1,"o":1},"t":"LibreTranslate"},"Libre vertimas":{"s":{"b","l","t","v","r","s","m","a","e","i"},"l":4.358898943540674,"c":{"l":1,"i":2,"b":1,"r":2,"e":2,"v":1,"t":1,"m":1,"a":1,"s":1},"t":"LibreTranslate"},"API Libre API":{"s":{"b","l","r","a","p","e","i"},"l":4.58257569495584,"c":{"a":2,"p":2,"i":3,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"लिब्ब्ल अनुवादक":{"s":{"ु","ि","न","्","अ","द","ा","ब","ल","क","व"},"l":4.47213595499958,"c":{"ल":2,"ि":1,"ब":2,"्":2,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"LibreTranslate"},"Libre trans":{"s":{"n","b","l","t","r","s","a","e","i"},"l":3.4641016151377544,"c":{"l":1,"i":1,"b":1,"r":2,"e":1,"t":1,"a":1,"n":1,"s":1},"t":"LibreTranslate"},"អ្នកបកប្រែ Libre":{"s":{"ប","រ","i","្","b","ែ","ក","l","r","អ","e","ន"},"l":4.58257569495584,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Libre vertalen":{"s":{"n","b","l","t","v","r","a","e","i"},"l":4.795831523312719,"c":{"l":2,"i":1,"b":1,"r":2,"e":3,"v":1,"t":1,"a":1,"n":1},"t":"LibreTranslate"},"Либре":{"s":{"б","л","и","р","е"},"l":2.23606797749979,"c":{"л":1,"и":1,"б":1,"р":1,"е":1},"t":"LibreTranslate"},"ຜູ້ແປພາສາ LIRY API":{"s":{"ພ","ປ","ສ","l","ແ","p","້","າ","ູ","r","y","a","ຜ","i"},"l":4.47213595499958,"c":{"ຜ":1,"ູ":1,"້":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"l":1,"i":2,"r":1,"y":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre vertėjas":{"s":{"b","j","l","t","v","r","s","a","e","i","ė"},"l":4.123105625617661,"c":{"l":1,"i":1,"b":1,"r":2,"e":2,"v":1,"t":1,"ė":1,"j":1,"a":1,"s":1},"t":"LibreTranslate"},"Eadar-theangachadh Libre":{"s":{"g","n","h","b","d","t","l","c","r","-","a","e","i"},"l":7.681145747868608,"c":{"e":3,"a":5,"d":2,"r":2,"-":1,"t":1,"h":3,"n":1,"g":1,"c":1,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"Itabia":{"s":{"a","t","b","i"},"l":3.1622776601683795,"c":{"i":2,"t":1,"a":2,"b":1},"t":"LibreTranslate"},"Besplatni prevodilac":{"s":{"n","b","o","d","l","t","v","c","r","s","a","p","e","i"},"l":5.385164807134504,"c":{"b":1,"e":2,"s":1,"p":2,"l":2,"a":2,"t":1,"n":1,"i":2,"r":1,"v":1,"o":1,"d":1,"c":1},"t":"LibreTranslate"},"Liblofelo ea libōpo":{"s":{"b","f","l","p","ō","a","o","e","i"},"l":6.4031242374328485,"c":{"l":4,"i":2,"b":2,"o":3,"f":1,"e":2,"a":1,"ō":1,"p":1},"t":"LibreTranslate"},"ליברע איבערזעצן":{"s":{"י","צ","ע","ז","ן","ל","א","ב","ר"},"l":5.0990195135927845,"c":{"ל":1,"י":2,"ב":2,"ר":2,"ע":3,"א":1,"ז":1,"צ":1,"ן":1},"t":"LibreTranslate"},"Libre":{"s":{"b","l","r","e","i"},"l":2.23606797749979,"c":{"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"لیبری مترجم":{"s":{"ب","ی","ل","م","ر","ت","ج"},"l":4.0,"c":{"ل":1,"ی":2,"ب":1,"ر":2,"م":2,"ت":1,"ج":1},"t":"LibreTranslate"},"लिब्रे अनुवादक":{"s":{"े","ु","ि","न","्","अ","द","ा","र","ब","ल","क","व"},"l":3.605551275463989,"c":{"ल":1,"ि":1,"ब":1,"्":1,"र":1,"े":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"LibreTranslate"},"Khuphela":{"s":{"h","l","u","k","a","p","e"},"l":3.1622776601683795,"c":{"k":1,"h":2,"u":1,"p":1,"e":1,"l":1,"a":1},"t":"LibreTranslate"},"Omasulira a Libre API":{"s":{"b","l","p","u","r","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"o":1,"m":1,"a":4,"s":1,"u":1,"l":2,"i":3,"r":2,"b":1,"e":1,"p":1},"t":"LibreTranslate"},"મુક્તિ":{"s":{"ુ","ત","્","ક","િ","મ"},"l":2.449489742783178,"c":{"મ":1,"ુ":1,"ક":1,"્":1,"ત":1,"િ":1},"t":"LibreTranslate"},"Wergera libre api":{"s":{"g","b","w","l","r","a","p","e","i"},"l":5.5677643628300215,"c":{"w":1,"e":3,"r":3,"g":1,"a":2,"l":1,"i":2,"b":1,"p":1},"t":"LibreTranslate"},"Libre แปล":{"s":{"b","ล","l","แ","r","ป","e","i"},"l":2.8284271247461903,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"แ":1,"ป":1,"ล":1},"t":"LibreTranslate"},"Libre -kääntäjä API":{"s":{"n","b","j","l","t","r","-","ä","k","a","p","e","i"},"l":5.5677643628300215,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"-":1,"k":1,"ä":4,"n":1,"t":1,"j":1,"a":1,"p":1},"t":"LibreTranslate"},"Dhuxul":{"s":{"h","d","l","u","x"},"l":2.8284271247461903,"c":{"d":1,"h":1,"u":2,"x":1,"l":1},"t":"LibreTranslate"},"API LIBRE traduttore":{"s":{"b","o","d","l","t","u","r","a","p","e","i"},"l":6.0,"c":{"a":2,"p":1,"i":2,"l":1,"b":1,"r":3,"e":2,"t":3,"d":1,"u":1,"o":1},"t":"LibreTranslate"},"Libre interpres":{"s":{"n","b","l","t","r","s","p","e","i"},"l":5.291502622129181,"c":{"l":1,"i":2,"b":1,"r":3,"e":3,"n":1,"t":1,"p":1,"s":1},"t":"LibreTranslate"},"LIBRE Tagasalin ng API":{"s":{"g","n","b","l","t","r","s","a","p","e","i"},"l":6.557438524302,"c":{"l":2,"i":3,"b":1,"r":1,"e":1,"t":1,"a":4,"g":2,"s":1,"n":2,"p":1},"t":"LibreTranslate"},"د لېسانیک ژباړونکی":{"s":{"ب","و","ک","ې","ی","ل","ړ","س","ا","ژ","ن","د"},"l":4.898979485566356,"c":{"د":1,"ل":1,"ې":1,"س":1,"ا":2,"ن":2,"ی":2,"ک":2,"ژ":1,"ب":1,"ړ":1,"و":1},"t":"LibreTranslate"},"Libre traduki":{"s":{"b","d","l","t","u","r","k","a","e","i"},"l":4.0,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":1,"a":1,"d":1,"u":1,"k":1},"t":"LibreTranslate"},"Përkthyes libre":{"s":{"ë","h","b","t","l","r","y","s","k","p","e","i"},"l":4.242640687119285,"c":{"p":1,"ë":1,"r":2,"k":1,"t":1,"h":1,"y":1,"e":2,"s":1,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"libre翻译":{"s":{"b","l","译","r","翻","e","i"},"l":2.6457513110645907,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"翻":1,"译":1},"t":"LibreTranslate"},"Libre tulkot":{"s":{"b","l","t","u","r","k","o","e","i"},"l":3.872983346207417,"c":{"l":2,"i":1,"b":1,"r":1,"e":1,"t":2,"u":1,"k":1,"o":1},"t":"LibreTranslate"},"Libre თარგმნა":{"s":{"თ","b","l","ა","რ","მ","r","ნ","გ","e","i"},"l":3.7416573867739413,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"თ":1,"ა":2,"რ":1,"გ":1,"მ":1,"ნ":1},"t":"LibreTranslate"},"תרגום ליברה":{"s":{"ת","ג","י","ב","ה","ל","ם","ר","ו"},"l":3.4641016151377544,"c":{"ת":1,"ר":2,"ג":1,"ו":1,"ם":1,"ל":1,"י":1,"ב":1,"ה":1},"t":"LibreTranslate"},"ליברע איבערזעצער אַפּי":{"s":{"י","צ","ע","ז","פ","ּ","ל","ַ","א","ב","ר"},"l":6.928203230275509,"c":{"ל":1,"י":3,"ב":2,"ר":3,"ע":4,"א":2,"ז":1,"צ":1,"ַ":1,"פ":1,"ּ":1},"t":"LibreTranslate"},"libre 번역":{"s":{"번","b","l","역","r","e","i"},"l":2.6457513110645907,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"번":1,"역":1},"t":"LibreTranslate"},"Libre Penterjemah API":{"s":{"n","b","h","j","l","t","r","m","a","p","e","i"},"l":6.244997998398398,"c":{"l":1,"i":2,"b":1,"r":2,"e":4,"p":2,"n":1,"t":1,"j":1,"m":1,"a":2,"h":1},"t":"LibreTranslate"},"लिब्रे":{"s":{"े","ि","्","र","ब","ल"},"l":2.449489742783178,"c":{"ल":1,"ि":1,"ब":1,"्":1,"र":1,"े":1},"t":"LibreTranslate"},"لياري":{"s":{"ي","ل","ر","ا"},"l":2.6457513110645907,"c":{"ل":1,"ي":2,"ا":1,"ر":1},"t":"LibreTranslate"},"Bwalobi":{"s":{"b","w","l","a","o","i"},"l":3.0,"c":{"b":2,"w":1,"a":1,"l":1,"o":1,"i":1},"t":"LibreTranslate"},"Libratu":{"s":{"b","l","t","u","r","a","i"},"l":2.6457513110645907,"c":{"l":1,"i":1,"b":1,"r":1,"a":1,"t":1,"u":1},"t":"LibreTranslate"},"Libre þýðandi":{"s":{"þ","ð","n","b","d","l","ý","r","a","e","i"},"l":3.7416573867739413,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"þ":1,"ý":1,"ð":1,"a":1,"n":1,"d":1},"t":"LibreTranslate"},"லிப்ரே மொழிபெயர்ப்பாளர் ஏபிஐ":{"s":{"ல","ெ","ொ","ஐ","ம","ர","ய","ஏ","ே","்","ப","ி","ா","ழ","ள"},"l":8.366600265340756,"c":{"ல":1,"ி":3,"ப":5,"்":4,"ர":3,"ே":1,"ம":1,"ொ":1,"ழ":1,"ெ":1,"ய":1,"ா":1,"ள":1,"ஏ":1,"ஐ":1},"t":"LibreTranslate"},"لبر مترجم API":{"s":{"ب","ل","p","م","ر","ت","a","ج","i"},"l":3.872983346207417,"c":{"ل":1,"ب":1,"ر":2,"م":2,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"Libre traduci":{"s":{"b","d","l","t","u","c","r","a","e","i"},"l":4.0,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":1,"a":1,"d":1,"u":1,"c":1},"t":"LibreTranslate"},"Libre аудармашы":{"s":{"b","ш","р","l","ы","а","r","д","м","у","e","i"},"l":4.47213595499958,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1},"t":"LibreTranslate"},"Prekladateľ Libre":{"s":{"b","d","ľ","l","t","r","k","a","p","e","i"},"l":5.291502622129181,"c":{"p":1,"r":2,"e":3,"k":1,"l":2,"a":2,"d":1,"t":1,"ľ":1,"i":1,"b":1},"t":"LibreTranslate"},"ലിബ്രെ ട്രാറ്റർ API":{"s":{"ല","ബ","ി","i","്","ർ","ാ","ട","റ","a","p","ര","െ"},"l":5.196152422706632,"c":{"ല":1,"ി":1,"ബ":1,"്":3,"ര":2,"െ":1,"ട":1,"ാ":1,"റ":2,"ർ":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"Libre tradiktè":{"s":{"b","è","d","l","t","r","k","a","e","i"},"l":4.358898943540674,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":2,"a":1,"d":1,"k":1,"è":1},"t":"LibreTranslate"},"Лібре":{"s":{"б","л","р","і","е"},"l":2.23606797749979,"c":{"л":1,"і":1,"б":1,"р":1,"е":1},"t":"LibreTranslate"},"Penterjemah Libre":{"s":{"n","h","b","j","t","l","r","m","a","p","e","i"},"l":5.477225575051661,"c":{"p":1,"e":4,"n":1,"t":1,"r":2,"j":1,"m":1,"a":1,"h":1,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"Libre котормочу":{"s":{"к","ч","b","м","l","r","р","о","у","e","i","т"},"l":4.47213595499958,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"к":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1},"t":"LibreTranslate"},"Libre Übersetzer -API":{"s":{"b","ü","l","t","r","-","s","z","a","p","e","i"},"l":6.4031242374328485,"c":{"l":1,"i":2,"b":2,"r":3,"e":4,"ü":1,"s":1,"t":1,"z":1,"-":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre vertaal":{"s":{"b","l","t","v","r","a","e","i"},"l":4.47213595499958,"c":{"l":2,"i":1,"b":1,"r":2,"e":2,"v":1,"t":1,"a":2},"t":"LibreTranslate"},"Libre oversætter":{"s":{"b","l","t","v","r","æ","s","o","e","i"},"l":5.385164807134504,"c":{"l":1,"i":1,"b":1,"r":3,"e":3,"o":1,"v":1,"s":1,"æ":1,"t":2},"t":"LibreTranslate"},"API Translator Libre":{"s":{"n","b","o","t","l","r","s","a","p","e","i"},"l":6.0,"c":{"a":3,"p":1,"i":2,"t":2,"r":3,"n":1,"s":1,"l":2,"o":1,"b":1,"e":1},"t":"LibreTranslate"},"Dịch giả Libre":{"s":{"g","h","b","d","l","r","ả","ị","c","e","i"},"l":3.7416573867739413,"c":{"d":1,"ị":1,"c":1,"h":1,"g":1,"i":2,"ả":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"API مترجم Libre":{"s":{"b","l","ج","م","ر","ت","r","a","p","e","i"},"l":4.123105625617661,"c":{"a":1,"p":1,"i":2,"م":2,"ت":1,"ر":1,"ج":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Libre traduzido":{"s":{"b","d","l","t","u","r","z","a","o","e","i"},"l":4.47213595499958,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":1,"a":1,"d":2,"u":1,"z":1,"o":1},"t":"LibreTranslate"},"లిబ్రే అనువాదకుడు":{"s":{"ర","ల","్","ద","క","ా","డ","వ","ి","బ","ే","న","ు","అ"},"l":4.69041575982343,"c":{"ల":1,"ి":1,"బ":1,"్":1,"ర":1,"ే":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1},"t":"LibreTranslate"},"د لیسکر ژباړونکی API":{"s":{"ب","و","ک","ی","ل","ړ","س","ا","ر","ژ","a","p","ن","i","د"},"l":4.58257569495584,"c":{"د":1,"ل":1,"ی":2,"س":1,"ک":2,"ر":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"و":1,"ن":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"Tłumacz libre":{"s":{"b","t","l","ł","u","c","r","z","m","a","e","i"},"l":3.4641016151377544,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Apiri Ariri Libre API":{"s":{"b","l","r","a","p","e","i"},"l":8.246211251235321,"c":{"a":3,"p":2,"i":6,"r":4,"l":1,"b":1,"e":1},"t":"LibreTranslate"},"Libre wergerandin":{"s":{"g","n","b","d","w","l","r","a","e","i"},"l":5.656854249492381,"c":{"l":1,"i":2,"b":1,"r":3,"e":3,"w":1,"g":1,"a":1,"n":2,"d":1},"t":"LibreTranslate"},"API du traducteur libre":{"s":{"b","d","t","l","u","c","r","a","p","e","i"},"l":6.48074069840786,"c":{"a":2,"p":1,"i":2,"d":2,"u":3,"t":2,"r":3,"c":1,"e":2,"l":1,"b":1},"t":"LibreTranslate"},"Libre tarjimon":{"s":{"n","b","j","l","t","r","m","a","o","e","i"},"l":4.123105625617661,"c":{"l":1,"i":2,"b":1,"r":2,"e":1,"t":1,"a":1,"j":1,"m":1,"o":1,"n":1},"t":"LibreTranslate"},"API dịch giả Libre":{"s":{"g","h","b","d","l","c","r","ả","ị","a","p","e","i"},"l":4.58257569495584,"c":{"a":1,"p":1,"i":3,"d":1,"ị":1,"c":1,"h":1,"g":1,"ả":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Mahhala Humusha":{"s":{"h","l","u","s","m","a"},"l":6.48074069840786,"c":{"m":2,"a":4,"h":4,"l":1,"u":2,"s":1},"t":"LibreTranslate"},"Vulsutu libre lire":{"s":{"b","l","t","v","u","r","s","e","i"},"l":5.830951894845301,"c":{"v":1,"u":3,"l":3,"s":1,"t":1,"i":2,"b":1,"r":2,"e":2},"t":"LibreTranslate"},"ලිබ්රේ පරිවර්තකය":{"s":{"ි","ව","ප","ේ","ත","ක","ල","්","ය","බ","ර"},"l":5.0,"c":{"ල":1,"ි":2,"බ":1,"්":2,"ර":3,"ේ":1,"ප":1,"ව":1,"ත":1,"ක":1,"ය":1},"t":"LibreTranslate"},"libre ဘာသာပြန်သူ API":{"s":{"ူ","b","ပ","l","ဘ","ာ","ြ","r","န","သ","a","p","e","i","်"},"l":4.898979485566356,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre Traduttur API":{"s":{"b","d","l","t","u","r","a","p","e","i"},"l":5.916079783099616,"c":{"l":1,"i":2,"b":1,"r":3,"e":1,"t":3,"a":2,"d":1,"u":2,"p":1},"t":"LibreTranslate"},"ਲਿਬਰੇ":{"s":{"ਲ","ੇ","ਬ","ਿ","ਰ"},"l":2.23606797749979,"c":{"ਲ":1,"ਿ":1,"ਬ":1,"ਰ":1,"ੇ":1},"t":"LibreTranslate"},"લિબ્રે અનુવાદક API":{"s":{"ા","ન","ુ","્","િ","ર","ે","ક","બ","અ","દ","a","p","વ","i","લ"},"l":4.0,"c":{"લ":1,"િ":1,"બ":1,"્":1,"ર":1,"ે":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"ક":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"Liagre тарҷумон api":{"s":{"g","н","м","l","о","а","r","р","ҷ","у","a","p","e","i","т"},"l":4.58257569495584,"c":{"l":1,"i":2,"a":2,"g":1,"r":1,"e":1,"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"p":1},"t":"LibreTranslate"},"Переводчик Libre":{"s":{"к","ч","b","и","в","l","e","r","д","р","о","п","е","i"},"l":4.123105625617661,"c":{"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"లిబ్రే":{"s":{"ర","ల","్","ి","బ","ే"},"l":2.449489742783178,"c":{"ల":1,"ి":1,"బ":1,"్":1,"ర":1,"ే":1},"t":"LibreTranslate"},"లిబ్రే అనువాదం":{"s":{"ర","ల","్","ద","ా","ం","వ","ి","బ","ే","న","ు","అ"},"l":3.605551275463989,"c":{"ల":1,"ి":1,"బ":1,"్":1,"ర":1,"ే":1,"అ":1,"న":1,"ు":1,"వ":1,"ా":1,"ద":1,"ం":1},"t":"LibreTranslate"},"Libre Translator API":{"s":{"n","b","l","t","p","r","s","a","o","e","i"},"l":6.0,"c":{"l":2,"i":2,"b":1,"r":3,"e":1,"t":2,"a":3,"n":1,"s":1,"o":1,"p":1},"t":"LibreTranslate"},"Libre орчуулах":{"s":{"л","ч","b","l","а","r","р","о","х","у","e","i"},"l":3.872983346207417,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"а":1,"х":1},"t":"LibreTranslate"},"Traductor de libra":{"s":{"b","d","t","l","u","c","r","a","o","e","i"},"l":5.291502622129181,"c":{"t":2,"r":3,"a":2,"d":2,"u":1,"c":1,"o":1,"e":1,"l":1,"i":1,"b":1},"t":"LibreTranslate"},"Libre itzulpena":{"s":{"n","b","l","t","u","r","z","a","p","e","i"},"l":4.47213595499958,"c":{"l":2,"i":2,"b":1,"r":1,"e":2,"t":1,"z":1,"u":1,"p":1,"n":1,"a":1},"t":"LibreTranslate"},"Uguqulelwa ngu-API":{"s":{"g","n","w","l","u","q","-","a","p","e","i"},"l":5.916079783099616,"c":{"u":4,"g":2,"q":1,"l":2,"e":1,"w":1,"a":2,"n":1,"-":1,"p":1,"i":1},"t":"LibreTranslate"},"متصدی":{"s":{"ی","ص","م","ت","د"},"l":2.23606797749979,"c":{"م":1,"ت":1,"ص":1,"د":1,"ی":1},"t":"LibreTranslate"},"Libre -kääntäjä":{"s":{"n","b","j","l","t","r","-","ä","k","e","i"},"l":5.0990195135927845,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"-":1,"k":1,"ä":4,"n":1,"t":1,"j":1},"t":"LibreTranslate"},"Cyfieithydd Libre":{"s":{"h","f","d","b","t","l","r","y","c","e","i"},"l":5.291502622129181,"c":{"c":1,"y":2,"f":1,"i":3,"e":2,"t":1,"h":1,"d":2,"l":1,"b":1,"r":1},"t":"LibreTranslate"},"મુખતે અનુવાદક":{"s":{"ા","ન","ુ","ત","ે","ક","ખ","મ","અ","દ","વ"},"l":3.7416573867739413,"c":{"મ":1,"ુ":2,"ખ":1,"ત":1,"ે":1,"અ":1,"ન":1,"વ":1,"ા":1,"દ":1,"ક":1},"t":"LibreTranslate"},"Լիբր":{"s":{"ի","բ","ր","լ"},"l":2.0,"c":{"լ":1,"ի":1,"բ":1,"ր":1},"t":"LibreTranslate"},"Libre translate":{"s":{"n","b","l","t","r","s","a","e","i"},"l":4.898979485566356,"c":{"l":2,"i":1,"b":1,"r":2,"e":2,"t":2,"a":2,"n":1,"s":1},"t":"LibreTranslate"},"ਲਿਬਰੇ ਅਨੁਵਾਦ":{"s":{"ਲ","ੇ","ਾ","ਬ","ਵ","ਿ","ੁ","ਰ","ਅ","ਨ","ਦ"},"l":3.3166247903554,"c":{"ਲ":1,"ਿ":1,"ਬ":1,"ਰ":1,"ੇ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1},"t":"LibreTranslate"},"Libre traducir":{"s":{"b","d","l","t","u","c","r","a","e","i"},"l":4.58257569495584,"c":{"l":1,"i":2,"b":1,"r":3,"e":1,"t":1,"a":1,"d":1,"u":1,"c":1},"t":"LibreTranslate"},"libre":{"s":{"b","l","r","e","i"},"l":2.23606797749979,"c":{"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"مترجم libre":{"s":{"b","l","م","ر","ت","r","ج","e","i"},"l":3.4641016151377544,"c":{"م":2,"ت":1,"ر":1,"ج":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Либре преводилац":{"s":{"б","л","и","в","а","д","р","о","п","ц","е"},"l":4.795831523312719,"c":{"л":2,"и":2,"б":1,"р":2,"е":2,"п":1,"в":1,"о":1,"д":1,"а":1,"ц":1},"t":"LibreTranslate"},"Translator API maca":{"s":{"n","t","l","p","c","r","s","m","a","o","i"},"l":6.4031242374328485,"c":{"t":2,"r":2,"a":5,"n":1,"s":1,"l":1,"o":1,"p":1,"i":1,"m":1,"c":1},"t":"LibreTranslate"},"লিব্রে অনুবাদক এপিআই":{"s":{"অ","ি","ু","আ","এ","ন","দ","ই","ল","ক","ব","র","া","্","ে","প"},"l":4.69041575982343,"c":{"ল":1,"ি":2,"ব":2,"্":1,"র":1,"ে":1,"অ":1,"ন":1,"ু":1,"া":1,"দ":1,"ক":1,"এ":1,"প":1,"আ":1,"ই":1},"t":"LibreTranslate"},"АПИ на преведувач на либери":{"s":{"б","н","ч","л","и","в","а","д","р","у","п","е"},"l":7.416198487095663,"c":{"а":4,"п":2,"и":3,"н":2,"р":2,"е":3,"в":2,"д":1,"у":1,"ч":1,"л":1,"б":1},"t":"LibreTranslate"},"Mahhala":{"s":{"a","l","h","m"},"l":3.872983346207417,"c":{"m":1,"a":3,"h":2,"l":1},"t":"LibreTranslate"},"Tərcüməçi":{"s":{"ü","t","r","ə","m","ç","c","i"},"l":3.3166247903554,"c":{"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":1},"t":"LibreTranslate"},"ලිබ්රේ පරිවර්තක API":{"s":{"ි","i","ව","ප","ේ","ත","ක","ල","්","a","p","බ","ර"},"l":5.196152422706632,"c":{"ල":1,"ි":2,"බ":1,"්":2,"ර":3,"ේ":1,"ප":1,"ව":1,"ත":1,"ක":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"Libre tarjima qiling":{"s":{"g","n","b","j","l","t","q","r","m","a","e","i"},"l":6.0,"c":{"l":2,"i":4,"b":1,"r":2,"e":1,"t":1,"a":2,"j":1,"m":1,"q":1,"n":1,"g":1},"t":"LibreTranslate"},"ലിബ്രെ വിവർത്തനം":{"s":{"ല","ന","ബ","ി","ത","വ","്","ർ","ം","ര","െ"},"l":4.795831523312719,"c":{"ല":1,"ി":2,"ബ":1,"്":2,"ര":1,"െ":1,"വ":2,"ർ":1,"ത":2,"ന":1,"ം":1},"t":"LibreTranslate"},"Traducător Libre":{"s":{"b","o","d","t","l","u","c","r","a","ă","e","i"},"l":4.795831523312719,"c":{"t":2,"r":3,"a":1,"d":1,"u":1,"c":1,"ă":1,"o":1,"l":1,"i":1,"b":1,"e":1},"t":"LibreTranslate"},"കള്ളം":{"s":{"ള","ം","്","ക"},"l":2.6457513110645907,"c":{"ക":1,"ള":2,"്":1,"ം":1},"t":"LibreTranslate"},"लिब्रे ट्रान्सलेटर एपीआय":{"s":{"े","ी","ए","प","ि","न","्","ा","र","ट","स","ब","ल","आ","य"},"l":6.324555320336759,"c":{"ल":2,"ि":1,"ब":1,"्":3,"र":3,"े":2,"ट":2,"ा":1,"न":1,"स":1,"ए":1,"प":1,"ी":1,"आ":1,"य":1},"t":"LibreTranslate"},"I gjallë":{"s":{"ë","g","j","l","a","i"},"l":3.0,"c":{"i":1,"g":1,"j":1,"a":1,"l":2,"ë":1},"t":"LibreTranslate"},"Libre përkthen":{"s":{"ë","n","b","h","l","t","r","k","p","e","i"},"l":4.123105625617661,"c":{"l":1,"i":1,"b":1,"r":2,"e":2,"p":1,"ë":1,"k":1,"t":1,"h":1,"n":1},"t":"LibreTranslate"},"ଲିବ୍ରେ ଅନୁବାଦକ |":{"s":{"ି","ୁ","ା","୍","ଦ","ବ","ନ","େ","|","ଲ","ର","ଅ","କ"},"l":4.0,"c":{"ଲ":1,"ି":1,"ବ":2,"୍":1,"ର":1,"େ":1,"ଅ":1,"ନ":1,"ୁ":1,"ା":1,"ଦ":1,"କ":1,"|":1},"t":"LibreTranslate"},"Librafetoleli tsa Lib":{"s":{"b","f","l","t","r","s","a","o","e","i"},"l":6.708203932499369,"c":{"l":4,"i":3,"b":2,"r":1,"a":2,"f":1,"e":2,"t":2,"o":1,"s":1},"t":"LibreTranslate"},"Libhre mushanduri":{"s":{"n","b","h","d","l","u","r","s","m","a","e","i"},"l":4.898979485566356,"c":{"l":1,"i":2,"b":1,"h":2,"r":2,"e":1,"m":1,"u":2,"s":1,"a":1,"n":1,"d":1},"t":"LibreTranslate"},"ਲਿਬਰੇ ਅਨੁਵਾਦਕ ਏਪੀਆਈ":{"s":{"ਏ","ੀ","ਈ","ਲ","ੇ","ਾ","ਕ","ਬ","ਵ","ਿ","ੁ","ਪ","ਰ","ਅ","ਆ","ਨ","ਦ"},"l":4.123105625617661,"c":{"ਲ":1,"ਿ":1,"ਬ":1,"ਰ":1,"ੇ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਕ":1,"ਏ":1,"ਪ":1,"ੀ":1,"ਆ":1,"ਈ":1},"t":"LibreTranslate"},"ಲಿವ್ರೆ ಭಾಷಾಂತರಕಾರ":{"s":{"ಲ","ರ","ವ","ಕ","ಿ","್","ಂ","ಭ","ತ","ಾ","ೆ","ಷ"},"l":5.291502622129181,"c":{"ಲ":1,"ಿ":1,"ವ":1,"್":1,"ರ":3,"ೆ":1,"ಭ":1,"ಾ":3,"ಷ":1,"ಂ":1,"ತ":1,"ಕ":1},"t":"LibreTranslate"},"Libre oersetter api":{"s":{"b","l","t","p","r","s","a","o","e","i"},"l":6.244997998398398,"c":{"l":1,"i":2,"b":1,"r":3,"e":4,"o":1,"s":1,"t":2,"a":1,"p":1},"t":"LibreTranslate"},"Pajak Libe API":{"s":{"b","j","l","k","a","p","e","i"},"l":4.69041575982343,"c":{"p":2,"a":3,"j":1,"k":1,"l":1,"i":2,"b":1,"e":1},"t":"LibreTranslate"},"লিব্রে অনুবাদক":{"s":{"অ","ি","ু","ন","দ","ল","ক","ব","র","া","্","ে"},"l":3.872983346207417,"c":{"ল":1,"ি":1,"ব":2,"্":1,"র":1,"ে":1,"অ":1,"ন":1,"ু":1,"া":1,"দ":1,"ক":1},"t":"LibreTranslate"},"„Libre“ vertėjo API":{"s":{"„","b","j","“","l","t","v","p","r","a","o","e","i","ė"},"l":4.795831523312719,"c":{"„":1,"l":1,"i":2,"b":1,"r":2,"e":2,"“":1,"v":1,"t":1,"ė":1,"j":1,"o":1,"a":1,"p":1},"t":"LibreTranslate"},"Либре преводилац АПИ":{"s":{"б","л","и","в","а","д","р","о","п","ц","е"},"l":5.830951894845301,"c":{"л":2,"и":3,"б":1,"р":2,"е":2,"п":2,"в":1,"о":1,"д":1,"а":2,"ц":1},"t":"LibreTranslate"},"افترا":{"s":{"ر","ت","ف","ا"},"l":2.6457513110645907,"c":{"ا":2,"ف":1,"ت":1,"ر":1},"t":"LibreTranslate"},"ሊብራይስጥ ተርጓሚ ኤፒአይ":{"s":{"ሊ","ራ","ይ","ሚ","ስ","አ","ብ","ፒ","ተ","ኤ","ጥ","ር","ጓ"},"l":4.0,"c":{"ሊ":1,"ብ":1,"ራ":1,"ይ":2,"ስ":1,"ጥ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1},"t":"LibreTranslate"},"Umhumushi we-Libre":{"s":{"h","b","w","l","u","r","-","s","m","e","i"},"l":5.5677643628300215,"c":{"u":3,"m":2,"h":2,"s":1,"i":2,"w":1,"e":2,"-":1,"l":1,"b":1,"r":1},"t":"LibreTranslate"},"An bhisiú":{"s":{"ú","n","b","h","s","a","i"},"l":3.1622776601683795,"c":{"a":1,"n":1,"b":1,"h":1,"i":2,"s":1,"ú":1},"t":"LibreTranslate"},"Libre tõlk":{"s":{"b","l","t","r","k","õ","e","i"},"l":3.3166247903554,"c":{"l":2,"i":1,"b":1,"r":1,"e":1,"t":1,"õ":1,"k":1},"t":"LibreTranslate"},"Kaiwhakamaori able":{"s":{"h","b","w","l","r","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"k":2,"a":5,"i":2,"w":1,"h":1,"m":1,"o":1,"r":1,"b":1,"l":1,"e":1},"t":"LibreTranslate"},"Libre narjamahkeun":{"s":{"n","b","h","j","l","u","r","m","k","a","e","i"},"l":5.385164807134504,"c":{"l":1,"i":1,"b":1,"r":2,"e":2,"n":2,"a":3,"j":1,"m":1,"h":1,"k":1,"u":1},"t":"LibreTranslate"},"ሊብራ":{"s":{"ብ","ሊ","ራ"},"l":1.7320508075688772,"c":{"ሊ":1,"ብ":1,"ራ":1},"t":"LibreTranslate"},"Λουρί":{"s":{"ρ","υ","ο","ί","λ"},"l":2.23606797749979,"c":{"λ":1,"ο":1,"υ":1,"ρ":1,"ί":1},"t":"LibreTranslate"},"API del traductor de Libre":{"s":{"b","o","d","l","t","u","c","r","a","p","e","i"},"l":6.928203230275509,"c":{"a":2,"p":1,"i":2,"d":3,"e":3,"l":2,"t":2,"r":3,"u":1,"c":1,"o":1,"b":1},"t":"LibreTranslate"},"Libre překladatel":{"s":{"b","d","ř","l","t","r","k","a","p","e","i"},"l":5.477225575051661,"c":{"l":3,"i":1,"b":1,"r":1,"e":3,"p":1,"ř":1,"k":1,"a":2,"d":1,"t":1},"t":"LibreTranslate"},"API ya mtafsiri wa Libre":{"s":{"b","f","w","t","l","r","y","s","m","a","p","e","i"},"l":6.782329983125268,"c":{"a":4,"p":1,"i":4,"y":1,"m":1,"t":1,"f":1,"s":1,"r":2,"w":1,"l":1,"b":1,"e":1},"t":"LibreTranslate"},"Libre prevajalec API":{"s":{"b","j","l","v","c","r","a","p","e","i"},"l":6.164414002968976,"c":{"l":2,"i":2,"b":1,"r":2,"e":3,"p":2,"v":1,"a":3,"j":1,"c":1},"t":"LibreTranslate"},"Libre-Translé":{"s":{"é","n","b","l","t","r","-","s","a","e","i"},"l":4.123105625617661,"c":{"l":2,"i":1,"b":1,"r":2,"e":1,"-":1,"t":1,"a":1,"n":1,"s":1,"é":1},"t":"LibreTranslate"},"Libre ಭಾಷಾಂತರಕಾರ API":{"s":{"ರ","b","ಕ","l","p","ಂ","r","ಭ","ತ","ಾ","a","ಷ","e","i"},"l":5.291502622129181,"c":{"l":1,"i":2,"b":1,"r":1,"e":1,"ಭ":1,"ಾ":3,"ಷ":1,"ಂ":1,"ತ":1,"ರ":2,"ಕ":1,"a":1,"p":1},"t":"LibreTranslate"},"Libre preložiť":{"s":{"b","o","ť","l","r","ž","p","e","i"},"l":4.58257569495584,"c":{"l":2,"i":2,"b":1,"r":2,"e":2,"p":1,"o":1,"ž":1,"ť":1},"t":"LibreTranslate"},"ឆាប់រហ័ស":{"s":{"ប","រ","ឆ","ា","ស","ហ","់","័"},"l":2.8284271247461903,"c":{"ឆ":1,"ា":1,"ប":1,"់":1,"រ":1,"ហ":1,"័":1,"ស":1},"t":"LibreTranslate"},"Tərcümə edən Tərcümə":{"s":{"n","ü","d","t","r","ə","m","c","e"},"l":6.928203230275509,"c":{"t":2,"ə":5,"r":2,"c":2,"ü":2,"m":2,"e":1,"d":1,"n":1},"t":"LibreTranslate"},"Libre översättare":{"s":{"b","l","t","v","r","ö","s","ä","a","e","i"},"l":5.477225575051661,"c":{"l":1,"i":1,"b":1,"r":3,"e":3,"ö":1,"v":1,"s":1,"ä":1,"t":2,"a":1},"t":"LibreTranslate"},"ლიბრ":{"s":{"რ","ლ","ი","ბ"},"l":2.0,"c":{"ლ":1,"ი":1,"ბ":1,"რ":1},"t":"LibreTranslate"},"Besplatno Prevedi":{"s":{"n","b","o","d","l","t","v","r","s","a","p","e","i"},"l":4.898979485566356,"c":{"b":1,"e":3,"s":1,"p":2,"l":1,"a":1,"t":1,"n":1,"o":1,"r":1,"v":1,"d":1,"i":1},"t":"LibreTranslate"},"Mtafsiri wa libre":{"s":{"b","f","w","t","l","r","s","m","a","e","i"},"l":5.0,"c":{"m":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":2,"w":1,"l":1,"b":1,"e":1},"t":"LibreTranslate"},"لیبری":{"s":{"ی","ل","ب","ر"},"l":2.6457513110645907,"c":{"ل":1,"ی":2,"ب":1,"ر":1},"t":"LibreTranslate"},"Libre interpres API":{"s":{"n","b","l","t","r","s","a","p","e","i"},"l":6.082762530298219,"c":{"l":1,"i":3,"b":1,"r":3,"e":3,"n":1,"t":1,"p":2,"s":1,"a":1},"t":"LibreTranslate"},"Libre fordítása":{"s":{"b","f","d","l","t","í","á","r","s","a","o","e","i"},"l":4.0,"c":{"l":1,"i":1,"b":1,"r":2,"e":1,"f":1,"o":1,"d":1,"í":1,"t":1,"á":1,"s":1,"a":1},"t":"LibreTranslate"},"Libre Translatatatal":{"s":{"n","b","l","t","r","s","a","e","i"},"l":7.681145747868608,"c":{"l":3,"i":1,"b":1,"r":2,"e":1,"t":4,"a":5,"n":1,"s":1},"t":"LibreTranslate"},"لیبری مترجم API":{"s":{"ب","ی","ل","p","م","ر","ت","a","ج","i"},"l":4.358898943540674,"c":{"ل":1,"ی":2,"ب":1,"ر":2,"م":2,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"LibreTranslate"},"ലിബ്രെ വിവർത്തകൻ":{"s":{"ല","ൻ","ബ","ി","ത","വ","്","ർ","ക","ര","െ"},"l":4.795831523312719,"c":{"ല":1,"ി":2,"ബ":1,"്":2,"ര":1,"െ":1,"വ":2,"ർ":1,"ത":2,"ക":1,"ൻ":1},"t":"LibreTranslate"},"Tagasalin ng Libre":{"s":{"g","n","b","t","l","r","s","a","e","i"},"l":5.477225575051661,"c":{"t":1,"a":3,"g":2,"s":1,"l":2,"i":2,"n":2,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Lili":{"s":{"l","i"},"l":2.8284271247461903,"c":{"l":2,"i":2},"t":"LibreTranslate"},"Либе преведувач":{"s":{"б","л","ч","и","в","а","д","р","у","п","е"},"l":4.69041575982343,"c":{"л":1,"и":1,"б":1,"е":3,"п":1,"р":1,"в":2,"д":1,"у":1,"а":1,"ч":1},"t":"LibreTranslate"},"Libre თარჯიმანი":{"s":{"თ","b","ჯ","l","ა","რ","მ","r","ნ","e","i","ი"},"l":4.242640687119285,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"LibreTranslate"},"Libre vertaler":{"s":{"b","l","t","v","r","a","e","i"},"l":5.196152422706632,"c":{"l":2,"i":1,"b":1,"r":3,"e":3,"v":1,"t":1,"a":1},"t":"LibreTranslate"},"லிபர்":{"s":{"ல","ர","்","ப","ி"},"l":2.23606797749979,"c":{"ல":1,"ி":1,"ப":1,"ர":1,"்":1},"t":"LibreTranslate"},"Libre ဘာသာပြန်သူ":{"s":{"ူ","b","ပ","l","ဘ","ာ","ြ","r","န","သ","e","i","်"},"l":4.358898943540674,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1},"t":"LibreTranslate"},"Перекладач Libre":{"s":{"к","л","ч","b","l","а","e","r","д","р","п","е","i"},"l":4.358898943540674,"c":{"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Libre prevoditelj API":{"s":{"b","o","d","j","l","t","v","r","a","p","e","i"},"l":6.082762530298219,"c":{"l":2,"i":3,"b":1,"r":2,"e":3,"p":2,"v":1,"o":1,"d":1,"t":1,"j":1,"a":1},"t":"LibreTranslate"},"API перакладчыка Libre":{"s":{"к","л","ч","п","b","l","а","e","r","д","р","ы","a","p","е","i"},"l":5.477225575051661,"c":{"a":1,"p":1,"i":2,"п":1,"е":1,"р":1,"а":3,"к":2,"л":1,"д":1,"ч":1,"ы":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Libre tarjimon API":{"s":{"n","b","j","l","t","p","r","m","a","o","e","i"},"l":5.0990195135927845,"c":{"l":1,"i":3,"b":1,"r":2,"e":1,"t":1,"a":2,"j":1,"m":1,"o":1,"n":1,"p":1},"t":"LibreTranslate"},"Libre Translatatal api":{"s":{"n","b","l","t","r","s","a","p","e","i"},"l":7.483314773547883,"c":{"l":3,"i":2,"b":1,"r":2,"e":1,"t":3,"a":5,"n":1,"s":1,"p":1},"t":"LibreTranslate"},"لبر ترجمو":{"s":{"ب","و","ل","م","ر","ت","ج"},"l":3.1622776601683795,"c":{"ل":1,"ب":1,"ر":2,"ت":1,"ج":1,"م":1,"و":1},"t":"LibreTranslate"},"Libre översätter":{"s":{"b","l","t","v","r","ö","s","ä","e","i"},"l":5.385164807134504,"c":{"l":1,"i":1,"b":1,"r":3,"e":3,"ö":1,"v":1,"s":1,"ä":1,"t":2},"t":"LibreTranslate"},"Trust Pustaka":{"s":{"t","u","r","s","k","a","p"},"l":4.898979485566356,"c":{"t":3,"r":1,"u":2,"s":2,"p":1,"a":2,"k":1},"t":"LibreTranslate"},"Libre Çevir":{"s":{"b","l","v","r","ç","e","i"},"l":4.0,"c":{"l":1,"i":2,"b":1,"r":2,"e":2,"ç":1,"v":1},"t":"LibreTranslate"},"लिब्रे भाषांतर":{"s":{"भ","े","ि","त","्","ा","र","ं","ब","ल","ष"},"l":4.123105625617661,"c":{"ल":1,"ि":1,"ब":1,"्":1,"र":2,"े":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1},"t":"LibreTranslate"},"libre translator":{"s":{"n","b","l","t","r","s","a","o","e","i"},"l":5.196152422706632,"c":{"l":2,"i":1,"b":1,"r":3,"e":1,"t":2,"a":2,"n":1,"s":1,"o":1},"t":"LibreTranslate"},"Libre překlad":{"s":{"b","d","ř","l","r","k","a","p","e","i"},"l":4.0,"c":{"l":2,"i":1,"b":1,"r":1,"e":2,"p":1,"ř":1,"k":1,"a":1,"d":1},"t":"LibreTranslate"},"ליברע איבערזעצער":{"s":{"י","צ","ע","ז","ל","א","ב","ר"},"l":6.082762530298219,"c":{"ל":1,"י":2,"ב":2,"ר":3,"ע":4,"א":1,"ז":1,"צ":1},"t":"LibreTranslate"},"API μεταφραστή Libre":{"s":{"τ","α","ρ","ή","b","l","μ","φ","r","ε","σ","a","p","e","i"},"l":4.898979485566356,"c":{"a":1,"p":1,"i":2,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"l":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Тарҷумони Ланд":{"s":{"н","л","м","и","о","а","д","р","ҷ","у","т"},"l":4.123105625617661,"c":{"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":2,"и":1,"л":1,"д":1},"t":"LibreTranslate"},"นักแปล libre":{"s":{"ล","b","น","แ","l","ก","r","ั","ป","e","i"},"l":3.3166247903554,"c":{"น":1,"ั":1,"ก":1,"แ":1,"ป":1,"ล":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Μετάφραση Libre":{"s":{"ρ","α","i","b","l","μ","e","r","ε","σ","ά","φ","η","τ"},"l":3.7416573867739413,"c":{"μ":1,"ε":1,"τ":1,"ά":1,"φ":1,"ρ":1,"α":1,"σ":1,"η":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"ເຊື່ອມຕໍ່ເຊື່ອມຕໍ່":{"s":{"ອ","່","ເ","ຊ","ຕ","ື","ໍ","ມ"},"l":6.6332495807108,"c":{"ເ":2,"ຊ":2,"ື":2,"່":4,"ອ":2,"ມ":2,"ຕ":2,"ໍ":2},"t":"LibreTranslate"},"லிப்ரே மொழிபெயர்ப்பாளர்":{"s":{"ல","ெ","ொ","ம","ர","ய","ே","்","ப","ி","ா","ழ","ள"},"l":7.3484692283495345,"c":{"ல":1,"ி":2,"ப":4,"்":4,"ர":3,"ே":1,"ம":1,"ொ":1,"ழ":1,"ெ":1,"ய":1,"ா":1,"ள":1},"t":"LibreTranslate"},"Libre vertaler API":{"s":{"b","l","t","v","r","a","p","e","i"},"l":5.830951894845301,"c":{"l":2,"i":2,"b":1,"r":3,"e":3,"v":1,"t":1,"a":2,"p":1},"t":"LibreTranslate"},"Libre prevajalec":{"s":{"b","j","l","v","c","r","a","p","e","i"},"l":5.196152422706632,"c":{"l":2,"i":1,"b":1,"r":2,"e":3,"p":1,"v":1,"a":2,"j":1,"c":1},"t":"LibreTranslate"},"Libre oversetter":{"s":{"b","l","t","v","r","s","o","e","i"},"l":5.916079783099616,"c":{"l":1,"i":1,"b":1,"r":3,"e":4,"o":1,"v":1,"s":1,"t":2},"t":"LibreTranslate"},"Либр":{"s":{"и","л","б","р"},"l":2.0,"c":{"л":1,"и":1,"б":1,"р":1},"t":"LibreTranslate"},"Libre fassarar":{"s":{"b","f","l","r","s","a","e","i"},"l":5.196152422706632,"c":{"l":1,"i":1,"b":1,"r":3,"e":1,"f":1,"a":3,"s":2},"t":"LibreTranslate"},"ນັກແປພາສາ Libre":{"s":{"ພ","ນ","ປ","ກ","b","ສ","ັ","l","າ","r","ແ","e","i"},"l":4.0,"c":{"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"லிப்ரே மொழிபெயர்க்கிறார்":{"s":{"ல","ெ","ொ","ம","ர","ற","ய","க","ே","்","ப","ி","ா","ழ"},"l":7.14142842854285,"c":{"ல":1,"ி":3,"ப":2,"்":4,"ர":3,"ே":1,"ம":1,"ொ":1,"ழ":1,"ெ":1,"ய":1,"க":2,"ற":1,"ா":1},"t":"LibreTranslate"},"Tərcüməçi API":{"s":{"a","ü","t","r","ə","m","ç","c","p","i"},"l":4.0,"c":{"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":2,"a":1,"p":1},"t":"LibreTranslate"},"Transluj translator":{"s":{"n","j","t","l","u","r","s","a","o"},"l":6.48074069840786,"c":{"t":3,"r":3,"a":3,"n":2,"s":2,"l":2,"u":1,"j":1,"o":1},"t":"LibreTranslate"},"Μεταφραστής Libre":{"s":{"α","ρ","ή","b","ς","l","μ","r","ε","σ","τ","φ","e","i"},"l":4.47213595499958,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1,"l":1,"i":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"Uguquleli":{"s":{"g","l","u","q","e","i"},"l":4.123105625617661,"c":{"u":3,"g":1,"q":1,"l":2,"e":1,"i":1},"t":"LibreTranslate"},"Libre oersetter":{"s":{"b","l","t","r","s","o","e","i"},"l":5.830951894845301,"c":{"l":1,"i":1,"b":1,"r":3,"e":4,"o":1,"s":1,"t":2},"t":"LibreTranslate"},"Womasulira wa Libre":{"s":{"b","w","l","u","r","s","m","a","o","e","i"},"l":5.5677643628300215,"c":{"w":2,"o":1,"m":1,"a":3,"s":1,"u":1,"l":2,"i":2,"r":2,"b":1,"e":1},"t":"LibreTranslate"},"Traduttur Libre":{"s":{"b","d","t","l","u","r","a","e","i"},"l":5.291502622129181,"c":{"t":3,"r":3,"a":1,"d":1,"u":2,"l":1,"i":1,"b":1,"e":1},"t":"LibreTranslate"},"ලිබ්රේ":{"s":{"ි","ේ","ල","්","බ","ර"},"l":2.449489742783178,"c":{"ල":1,"ි":1,"බ":1,"්":1,"ර":1,"ේ":1},"t":"LibreTranslate"},"Libre turjubaanka":{"s":{"n","b","j","l","t","u","r","k","a","e","i"},"l":5.291502622129181,"c":{"l":1,"i":1,"b":2,"r":2,"e":1,"t":1,"u":2,"j":1,"a":3,"n":1,"k":1},"t":"LibreTranslate"},"ଲିବ୍ରେ ଅନୁବାଦକ API |":{"s":{"ି","ୁ","ା","୍","ଦ","ବ","ନ","େ","|","ଲ","ର","ଅ","କ","a","p","i"},"l":4.358898943540674,"c":{"ଲ":1,"ି":1,"ବ":2,"୍":1,"ର":1,"େ":1,"ଅ":1,"ନ":1,"ୁ":1,"ା":1,"ଦ":1,"କ":1,"a":1,"p":1,"i":1,"|":1},"t":"LibreTranslate"},"Libff":{"s":{"f","l","b","i"},"l":2.6457513110645907,"c":{"l":1,"i":1,"b":1,"f":2},"t":"LibreTranslate"},"Libre පරිවර්තනය":{"s":{"ි","න","b","ව","ප","ත","l","්","r","ය","e","i","ර"},"l":4.0,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"න":1,"ය":1},"t":"LibreTranslate"},"Libre traduttore Api":{"s":{"b","d","l","t","p","u","r","a","o","e","i"},"l":6.0,"c":{"l":1,"i":2,"b":1,"r":3,"e":2,"t":3,"a":2,"d":1,"u":1,"o":1,"p":1},"t":"LibreTranslate"},"Libre Fassara":{"s":{"b","f","l","r","s","a","e","i"},"l":4.69041575982343,"c":{"l":1,"i":1,"b":1,"r":2,"e":1,"f":1,"a":3,"s":2},"t":"LibreTranslate"},"Libre tradiktè API":{"s":{"b","è","d","l","t","r","k","a","p","e","i"},"l":5.291502622129181,"c":{"l":1,"i":3,"b":1,"r":2,"e":1,"t":2,"a":2,"d":1,"k":1,"è":1,"p":1},"t":"LibreTranslate"},"Isinalin ng libre":{"s":{"g","n","b","l","r","s","a","e","i"},"l":5.916079783099616,"c":{"i":4,"s":1,"n":3,"a":1,"l":2,"g":1,"b":1,"r":1,"e":1},"t":"LibreTranslate"},"libre translator api":{"s":{"n","b","l","t","p","r","s","a","o","e","i"},"l":6.0,"c":{"l":2,"i":2,"b":1,"r":3,"e":1,"t":2,"a":3,"n":1,"s":1,"o":1,"p":1},"t":"LibreTranslate"},"लाइब्रेरी":{"s":{"े","ी","इ","्","ा","र","ब","ल"},"l":3.3166247903554,"c":{"ल":1,"ा":1,"इ":1,"ब":1,"्":1,"र":2,"े":1,"ी":1},"t":"LibreTranslate"},"ပျက်လိမ့်မည်":{"s":{"ိ","ျ","လ","့","ည","က","မ","ပ","်"},"l":4.47213595499958,"c":{"ပ":1,"ျ":1,"က":1,"်":3,"လ":1,"ိ":1,"မ":2,"့":1,"ည":1},"t":"LibreTranslate"},"Libre Перевод":{"s":{"е","b","в","l","r","д","р","о","п","e","i"},"l":3.7416573867739413,"c":{"l":1,"i":1,"b":1,"r":1,"e":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1},"t":"LibreTranslate"},"Бінг перакладзе":{"s":{"к","б","н","л","а","з","г","д","р","п","і","е"},"l":4.242640687119285,"c":{"б":1,"і":1,"н":1,"г":1,"п":1,"е":2,"р":1,"а":2,"к":1,"л":1,"д":1,"з":1},"t":"BingTranslate"},"Bing Mai Fassara API":{"s":{"g","n","b","f","r","s","m","a","p","i"},"l":6.708203932499369,"c":{"b":1,"i":3,"n":1,"g":1,"m":1,"a":5,"f":1,"s":2,"r":1,"p":1},"t":"BingTranslate"},"Bing torgelator ap":{"s":{"g","n","b","t","l","p","r","a","o","e","i"},"l":5.0990195135927845,"c":{"b":1,"i":1,"n":1,"g":2,"t":2,"o":2,"r":2,"e":1,"l":1,"a":2,"p":1},"t":"BingTranslate"},"Bing Çeviri":{"s":{"g","n","b","v","r","ç","e","i"},"l":4.0,"c":{"b":1,"i":3,"n":1,"g":1,"ç":1,"e":1,"v":1,"r":1},"t":"BingTranslate"},"Перакладчык бінга":{"s":{"к","б","л","ч","н","а","г","д","р","ы","п","і","е"},"l":4.898979485566356,"c":{"п":1,"е":1,"р":1,"а":3,"к":2,"л":1,"д":1,"ч":1,"ы":1,"б":1,"і":1,"н":1,"г":1},"t":"BingTranslate"},"นักแปล Bing":{"s":{"g","n","ล","b","น","แ","ก","ั","ป","i"},"l":3.1622776601683795,"c":{"น":1,"ั":1,"ก":1,"แ":1,"ป":1,"ล":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Përkthyes bing":{"s":{"ë","g","n","h","b","t","r","y","s","k","p","e","i"},"l":3.605551275463989,"c":{"p":1,"ë":1,"r":1,"k":1,"t":1,"h":1,"y":1,"e":1,"s":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"بنغ":{"s":{"غ","ب","ن"},"l":1.7320508075688772,"c":{"ب":1,"ن":1,"غ":1},"t":"BingTranslate"},"Bing翻訳者":{"s":{"g","n","b","者","翻","訳","i"},"l":2.6457513110645907,"c":{"b":1,"i":1,"n":1,"g":1,"翻":1,"訳":1,"者":1},"t":"BingTranslate"},"Bing translator API":{"s":{"g","n","b","t","l","p","r","s","a","o","i"},"l":5.5677643628300215,"c":{"b":1,"i":2,"n":2,"g":1,"t":2,"r":2,"a":3,"s":1,"l":1,"o":1,"p":1},"t":"BingTranslate"},"Bing翻译器":{"s":{"g","n","b","译","翻","器","i"},"l":2.6457513110645907,"c":{"b":1,"i":1,"n":1,"g":1,"翻":1,"译":1,"器":1},"t":"BingTranslate"},"بنگ مترجم API":{"s":{"ب","p","م","ر","ت","a","ج","ن","i","گ"},"l":3.605551275463989,"c":{"ب":1,"ن":1,"گ":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"Bing Tercüman API":{"s":{"a","g","n","b","ü","t","r","m","c","p","e","i"},"l":4.58257569495584,"c":{"b":1,"i":2,"n":2,"g":1,"t":1,"e":1,"r":1,"c":1,"ü":1,"m":1,"a":2,"p":1},"t":"BingTranslate"},"બિંગ અનુવાદક":{"s":{"ગ","ન","ા","ુ","િ","ક","ં","બ","અ","દ","વ"},"l":3.3166247903554,"c":{"બ":1,"િ":1,"ં":1,"ગ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"ક":1},"t":"BingTranslate"},"Bing tulkotāja API":{"s":{"g","n","b","j","t","l","p","u","k","a","o","i","ā"},"l":4.69041575982343,"c":{"b":1,"i":2,"n":1,"g":1,"t":2,"u":1,"l":1,"k":1,"o":1,"ā":1,"j":1,"a":2,"p":1},"t":"BingTranslate"},"ବିଙ୍ଗ":{"s":{"ି","୍","ବ","ଙ","ଗ"},"l":2.23606797749979,"c":{"ବ":1,"ି":1,"ଙ":1,"୍":1,"ଗ":1},"t":"BingTranslate"},"بولی":{"s":{"ب","ل","و","ی"},"l":2.0,"c":{"ب":1,"و":1,"ل":1,"ی":1},"t":"BingTranslate"},"Bidh bing eadar-theangachadh":{"s":{"g","n","h","b","d","t","c","r","-","a","e","i"},"l":8.602325267042627,"c":{"b":2,"i":2,"d":3,"h":4,"n":2,"g":2,"e":2,"a":5,"r":1,"-":1,"t":1,"c":1},"t":"BingTranslate"},"Bing diterjemahkan":{"s":{"g","n","b","h","d","j","t","r","m","k","a","e","i"},"l":5.0,"c":{"b":1,"i":2,"n":2,"g":1,"d":1,"t":1,"e":2,"r":1,"j":1,"m":1,"a":2,"h":1,"k":1},"t":"BingTranslate"},"د Bing ژباړونکي API":{"s":{"g","ب","n","b","و","ک","ي","ړ","ا","ژ","a","p","ن","i","د"},"l":4.242640687119285,"c":{"د":1,"b":1,"i":2,"n":1,"g":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"و":1,"ن":1,"ک":1,"ي":1,"a":1,"p":1},"t":"BingTranslate"},"Bing Prevedi":{"s":{"g","n","b","d","v","r","p","e","i"},"l":3.872983346207417,"c":{"b":1,"i":2,"n":1,"g":1,"p":1,"r":1,"e":2,"v":1,"d":1},"t":"BingTranslate"},"የ Bing ተርጓሚ ኤፒአይ":{"s":{"g","n","b","ይ","ሚ","የ","አ","ተ","ኤ","ፒ","ጓ","ር","i"},"l":3.605551275463989,"c":{"የ":1,"b":1,"i":1,"n":1,"g":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"BingTranslate"},"બિંગ":{"s":{"ગ","ં","બ","િ"},"l":2.0,"c":{"બ":1,"િ":1,"ં":1,"ગ":1},"t":"BingTranslate"},"Bing översättare":{"s":{"g","n","b","t","v","ö","r","s","ä","a","e","i"},"l":4.58257569495584,"c":{"b":1,"i":1,"n":1,"g":1,"ö":1,"v":1,"e":2,"r":2,"s":1,"ä":1,"t":2,"a":1},"t":"BingTranslate"},"Turjumaanka Bing Api":{"s":{"g","n","b","j","t","u","r","m","k","a","p","i"},"l":6.0,"c":{"t":1,"u":2,"r":1,"j":1,"m":1,"a":4,"n":2,"k":1,"b":1,"i":2,"g":1,"p":1},"t":"BingTranslate"},"Bing prevoditelj API":{"s":{"g","n","b","o","d","j","t","l","v","r","a","p","e","i"},"l":5.291502622129181,"c":{"b":1,"i":3,"n":1,"g":1,"p":2,"r":1,"e":2,"v":1,"o":1,"d":1,"t":1,"l":1,"j":1,"a":1},"t":"BingTranslate"},"בינג איבערזעצער":{"s":{"נ","ג","י","צ","ע","ז","א","ב","ר"},"l":5.0990195135927845,"c":{"ב":2,"י":2,"נ":1,"ג":1,"א":1,"ע":3,"ר":2,"ז":1,"צ":1},"t":"BingTranslate"},"API de traductor de Bing":{"s":{"g","n","b","o","d","t","u","c","r","a","p","e","i"},"l":6.0,"c":{"a":2,"p":1,"i":2,"d":3,"e":2,"t":2,"r":2,"u":1,"c":1,"o":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing орчуулагч API":{"s":{"g","л","ч","n","b","а","г","р","о","у","a","p","i"},"l":4.69041575982343,"c":{"b":1,"i":2,"n":1,"g":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"a":1,"p":1},"t":"BingTranslate"},"Тарҷумони Bing":{"s":{"g","н","i","м","b","n","и","о","а","р","ҷ","у","т"},"l":3.605551275463989,"c":{"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"и":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing अनुवादक एपीआई":{"s":{"g","n","b","ी","ए","प","ु","ई","न","अ","द","ा","आ","क","व","i"},"l":4.0,"c":{"b":1,"i":1,"n":1,"g":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"BingTranslate"},"ቢንግ":{"s":{"ግ","ን","ቢ"},"l":1.7320508075688772,"c":{"ቢ":1,"ን":1,"ግ":1},"t":"BingTranslate"},"Бинг":{"s":{"б","н","и","г"},"l":2.0,"c":{"б":1,"и":1,"н":1,"г":1},"t":"BingTranslate"},"Bol":{"s":{"l","o","b"},"l":1.7320508075688772,"c":{"b":1,"o":1,"l":1},"t":"BingTranslate"},"ການແປພາສາ Bing API":{"s":{"g","ພ","ນ","ປ","ກ","b","ສ","n","p","າ","a","ແ","i"},"l":4.898979485566356,"c":{"ກ":1,"າ":3,"ນ":1,"ແ":1,"ປ":1,"ພ":1,"ສ":1,"b":1,"i":2,"n":1,"g":1,"a":1,"p":1},"t":"BingTranslate"},"Bing çeviricisi":{"s":{"g","n","b","v","r","s","ç","c","e","i"},"l":5.830951894845301,"c":{"b":1,"i":5,"n":1,"g":1,"ç":1,"e":1,"v":1,"r":1,"c":1,"s":1},"t":"BingTranslate"},"Bing þýða":{"s":{"g","þ","ð","n","b","ý","a","i"},"l":2.8284271247461903,"c":{"b":1,"i":1,"n":1,"g":1,"þ":1,"ý":1,"ð":1,"a":1},"t":"BingTranslate"},"Bing แปล":{"s":{"g","n","b","ล","แ","ป","i"},"l":2.6457513110645907,"c":{"b":1,"i":1,"n":1,"g":1,"แ":1,"ป":1,"ล":1},"t":"BingTranslate"},"ਬਿੰਗ ਅਨੁਵਾਦਕ":{"s":{"ੰ","ਗ","ਾ","ਕ","ਬ","ਵ","ਿ","ੁ","ਅ","ਨ","ਦ"},"l":3.3166247903554,"c":{"ਬ":1,"ਿ":1,"ੰ":1,"ਗ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਕ":1},"t":"BingTranslate"},"Traducteur Bing":{"s":{"g","n","b","d","t","u","c","r","a","e","i"},"l":4.47213595499958,"c":{"t":2,"r":2,"a":1,"d":1,"u":2,"c":1,"e":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Humushela incazelo emuva ku-i-Bing Humusha":{"s":{"g","n","h","b","l","v","u","c","-","s","m","z","k","a","o","e","i"},"l":10.862780491200215,"c":{"h":4,"u":6,"m":3,"s":2,"e":3,"l":2,"a":4,"i":3,"n":2,"c":1,"z":1,"o":1,"v":1,"k":1,"-":2,"b":1,"g":1},"t":"BingTranslate"},"Aṣoju Bing API":{"s":{"g","n","ṣ","b","j","p","u","a","o","i"},"l":4.0,"c":{"a":2,"ṣ":1,"o":1,"j":1,"u":1,"b":1,"i":2,"n":1,"g":1,"p":1},"t":"BingTranslate"},"Api eadar-theangaire bing":{"s":{"g","n","h","b","d","t","r","-","a","p","e","i"},"l":7.810249675906654,"c":{"a":5,"p":1,"i":3,"e":3,"d":1,"r":2,"-":1,"t":1,"h":1,"n":2,"g":2,"b":1},"t":"BingTranslate"},"tradutor Bing":{"s":{"g","n","b","d","t","u","r","a","o","i"},"l":4.0,"c":{"t":2,"r":2,"a":1,"d":1,"u":1,"o":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing dịch":{"s":{"g","n","b","h","d","ị","c","i"},"l":2.8284271247461903,"c":{"b":1,"i":1,"n":1,"g":1,"d":1,"ị":1,"c":1,"h":1},"t":"BingTranslate"},"I-Bing Translator API":{"s":{"g","n","b","t","l","p","r","-","s","a","o","i"},"l":6.082762530298219,"c":{"i":3,"-":1,"b":1,"n":2,"g":1,"t":2,"r":2,"a":3,"s":1,"l":1,"o":1,"p":1},"t":"BingTranslate"},"Перекладач Bing":{"s":{"к","g","л","ч","n","b","а","д","р","п","е","i"},"l":4.242640687119285,"c":{"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"API traducător Bing":{"s":{"g","n","b","o","d","t","ă","u","c","r","a","p","i"},"l":5.0,"c":{"a":2,"p":1,"i":2,"t":2,"r":2,"d":1,"u":1,"c":1,"ă":1,"o":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"بيڪلٽس":{"s":{"ب","ي","ل","س","ٽ","ڪ"},"l":2.449489742783178,"c":{"ب":1,"ي":1,"ڪ":1,"ل":1,"ٽ":1,"س":1},"t":"BingTranslate"},"Bring womasulira":{"s":{"g","n","b","w","l","u","r","s","m","a","o","i"},"l":4.58257569495584,"c":{"b":1,"r":2,"i":2,"n":1,"g":1,"w":1,"o":1,"m":1,"a":2,"s":1,"u":1,"l":1},"t":"BingTranslate"},"„Bing“ vertėjo API":{"s":{"g","„","n","b","j","“","t","v","p","r","a","o","e","i","ė"},"l":4.242640687119285,"c":{"„":1,"b":1,"i":2,"n":1,"g":1,"“":1,"v":1,"e":1,"r":1,"t":1,"ė":1,"j":1,"o":1,"a":1,"p":1},"t":"BingTranslate"},"ಬಿರಡೆ":{"s":{"ರ","ಡ","ಿ","ಬ","ೆ"},"l":2.23606797749979,"c":{"ಬ":1,"ಿ":1,"ರ":1,"ಡ":1,"ೆ":1},"t":"BingTranslate"},"Bing аудармашы API":{"s":{"g","n","b","ш","р","ы","а","д","м","у","a","p","i"},"l":4.898979485566356,"c":{"b":1,"i":2,"n":1,"g":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1,"a":1,"p":1},"t":"BingTranslate"},"Bing Translator Api":{"s":{"g","n","b","t","l","p","r","s","a","o","i"},"l":5.5677643628300215,"c":{"b":1,"i":2,"n":2,"g":1,"t":2,"r":2,"a":3,"s":1,"l":1,"o":1,"p":1},"t":"BingTranslate"},"빙":{"s":{"빙"},"l":1.0,"c":{"빙":1},"t":"BingTranslate"},"Tłumacz Bing":{"s":{"g","n","b","t","ł","u","c","z","m","a","i"},"l":3.3166247903554,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"பிங் மொழிபெயர்ப்பாளர் ஏபிஐ":{"s":{"ெ","ொ","ஐ","ம","ர","ய","ஏ","்","ப","ி","ா","ழ","ள","ங"},"l":8.0,"c":{"ப":5,"ி":3,"ங":1,"்":4,"ம":1,"ொ":1,"ழ":1,"ெ":1,"ய":1,"ர":2,"ா":1,"ள":1,"ஏ":1,"ஐ":1},"t":"BingTranslate"},"Bing Translateor Api":{"s":{"g","n","b","t","l","p","r","s","a","o","e","i"},"l":5.656854249492381,"c":{"b":1,"i":2,"n":2,"g":1,"t":2,"r":2,"a":3,"s":1,"l":1,"e":1,"o":1,"p":1},"t":"BingTranslate"},"बिंग":{"s":{"ग","ि","ं","ब"},"l":2.0,"c":{"ब":1,"ि":1,"ं":1,"ग":1},"t":"BingTranslate"},"Traductor de Bing":{"s":{"g","n","b","d","t","u","c","r","a","o","e","i"},"l":4.58257569495584,"c":{"t":2,"r":2,"a":1,"d":2,"u":1,"c":1,"o":1,"e":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing þýðandi API":{"s":{"g","þ","ð","n","b","d","ý","a","p","i"},"l":4.898979485566356,"c":{"b":1,"i":3,"n":2,"g":1,"þ":1,"ý":1,"ð":1,"a":2,"d":1,"p":1},"t":"BingTranslate"},"Bing traduce":{"s":{"g","n","b","d","t","u","c","r","a","e","i"},"l":3.3166247903554,"c":{"b":1,"i":1,"n":1,"g":1,"t":1,"r":1,"a":1,"d":1,"u":1,"c":1,"e":1},"t":"BingTranslate"},"빙 번역기 API":{"s":{"번","기","역","빙","a","p","i"},"l":2.6457513110645907,"c":{"빙":1,"번":1,"역":1,"기":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"Traducător Bing":{"s":{"g","n","b","o","d","t","u","c","r","a","ă","i"},"l":4.242640687119285,"c":{"t":2,"r":2,"a":1,"d":1,"u":1,"c":1,"ă":1,"o":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"بی پروا":{"s":{"ب","و","ی","ا","ر","پ"},"l":2.449489742783178,"c":{"ب":1,"ی":1,"پ":1,"ر":1,"و":1,"ا":1},"t":"BingTranslate"},"بنگ ترجمو":{"s":{"ب","و","م","ر","ت","ج","ن","گ"},"l":2.8284271247461903,"c":{"ب":1,"ن":1,"گ":1,"ت":1,"ر":1,"ج":1,"م":1,"و":1},"t":"BingTranslate"},"Bing isalin":{"s":{"g","n","b","l","s","a","i"},"l":4.242640687119285,"c":{"b":1,"i":3,"n":2,"g":1,"s":1,"a":1,"l":1},"t":"BingTranslate"},"ବିଙ୍ଗ ଅନୁବାଦ |":{"s":{"ି","ୁ","ା","୍","ଦ","ବ","ନ","|","ଙ","ଅ","ଗ"},"l":3.7416573867739413,"c":{"ବ":2,"ି":1,"ଙ":1,"୍":1,"ଗ":1,"ଅ":1,"ନ":1,"ୁ":1,"ା":1,"ଦ":1,"|":1},"t":"BingTranslate"},"Bing -kääntäjä API":{"s":{"g","n","b","j","t","-","ä","k","a","p","i"},"l":5.656854249492381,"c":{"b":1,"i":2,"n":2,"g":1,"-":1,"k":1,"ä":4,"t":1,"j":1,"a":1,"p":1},"t":"BingTranslate"},"Onitumọ bing":{"s":{"g","n","b","t","u","ọ","m","o","i"},"l":3.872983346207417,"c":{"o":1,"n":2,"i":2,"t":1,"u":1,"m":1,"ọ":1,"b":1,"g":1},"t":"BingTranslate"},"API dịch giả Bing":{"s":{"g","n","h","b","d","c","ả","ị","a","p","i"},"l":4.69041575982343,"c":{"a":1,"p":1,"i":3,"d":1,"ị":1,"c":1,"h":1,"g":2,"ả":1,"b":1,"n":1},"t":"BingTranslate"},"Bing Tradukisto API":{"s":{"g","n","b","d","t","p","u","r","s","k","a","o","i"},"l":5.196152422706632,"c":{"b":1,"i":3,"n":1,"g":1,"t":2,"r":1,"a":2,"d":1,"u":1,"k":1,"s":1,"o":1,"p":1},"t":"BingTranslate"},"Onye ntụgharị Bing":{"s":{"g","n","h","b","t","r","y","ụ","ị","a","o","e","i"},"l":4.898979485566356,"c":{"o":1,"n":3,"y":1,"e":1,"t":1,"ụ":1,"g":2,"h":1,"a":1,"r":1,"ị":1,"b":1,"i":1},"t":"BingTranslate"},"បេល":{"s":{"ប","េ","ល"},"l":1.7320508075688772,"c":{"ប":1,"េ":1,"ល":1},"t":"BingTranslate"},"مترجم بينغ":{"s":{"ب","ي","م","ر","ت","غ","ج","ن"},"l":3.3166247903554,"c":{"م":2,"ت":1,"ر":1,"ج":1,"ب":1,"ي":1,"ن":1,"غ":1},"t":"BingTranslate"},"Bing penjemak API":{"s":{"g","n","b","j","m","k","a","p","e","i"},"l":5.0,"c":{"b":1,"i":2,"n":2,"g":1,"p":2,"e":2,"j":1,"m":1,"a":2,"k":1},"t":"BingTranslate"},"တင်ထားသော":{"s":{"ာ","င","တ","ထ","သ","း","ေ","်"},"l":3.3166247903554,"c":{"တ":1,"င":1,"်":1,"ထ":1,"ာ":2,"း":1,"သ":1,"ေ":1},"t":"BingTranslate"},"Bing تەرجىمانى":{"s":{"g","n","b","ى","ا","ە","ر","ت","م","ج","ن","i"},"l":3.872983346207417,"c":{"b":1,"i":1,"n":1,"g":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1},"t":"BingTranslate"},"Traduttore biscuti":{"s":{"b","d","t","u","c","r","s","a","o","e","i"},"l":5.916079783099616,"c":{"t":4,"r":2,"a":1,"d":1,"u":2,"o":1,"e":1,"b":1,"i":2,"s":1,"c":1},"t":"BingTranslate"},"Kockica":{"s":{"c","k","a","o","i"},"l":3.3166247903554,"c":{"k":2,"o":1,"c":2,"i":1,"a":1},"t":"BingTranslate"},"ਬਿੰਗ":{"s":{"ੰ","ਬ","ਗ","ਿ"},"l":2.0,"c":{"ਬ":1,"ਿ":1,"ੰ":1,"ਗ":1},"t":"BingTranslate"},"penterjemah Bing":{"s":{"g","n","h","b","j","t","r","m","a","p","e","i"},"l":4.795831523312719,"c":{"p":1,"e":3,"n":2,"t":1,"r":1,"j":1,"m":1,"a":1,"h":1,"b":1,"i":1,"g":1},"t":"BingTranslate"},"Bing перекладати":{"s":{"к","g","л","n","b","и","а","д","р","п","е","i","т"},"l":4.358898943540674,"c":{"b":1,"i":1,"n":1,"g":1,"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"т":1,"и":1},"t":"BingTranslate"},"АПИ ТРАНСЛОРАД БИНГ":{"s":{"б","н","л","и","с","а","г","д","р","о","п","т"},"l":5.385164807134504,"c":{"а":3,"п":1,"и":2,"т":1,"р":2,"н":2,"с":1,"л":1,"о":1,"д":1,"б":1,"г":1},"t":"BingTranslate"},"Bing fordító":{"s":{"g","ó","n","b","f","d","t","í","r","o","i"},"l":3.3166247903554,"c":{"b":1,"i":1,"n":1,"g":1,"f":1,"o":1,"r":1,"d":1,"í":1,"t":1,"ó":1},"t":"BingTranslate"},"Bing Übersetzer -API":{"s":{"g","n","b","ü","t","r","-","s","z","a","p","e","i"},"l":5.477225575051661,"c":{"b":2,"i":2,"n":1,"g":1,"ü":1,"e":3,"r":2,"s":1,"t":1,"z":1,"-":1,"a":1,"p":1},"t":"BingTranslate"},"API překladatelů Bing":{"s":{"g","n","b","ů","d","ř","l","t","k","a","p","e","i"},"l":5.744562646538029,"c":{"a":3,"p":2,"i":2,"ř":1,"e":2,"k":1,"l":2,"d":1,"t":1,"ů":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Бинг преведувач API":{"s":{"a","б","н","ч","и","в","а","г","д","р","у","п","p","е","i"},"l":4.58257569495584,"c":{"б":1,"и":1,"н":1,"г":1,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"а":1,"ч":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"Bzela":{"s":{"b","l","z","a","e"},"l":2.23606797749979,"c":{"b":1,"z":1,"e":1,"l":1,"a":1},"t":"BingTranslate"},"د بینګ ژباړونکی":{"s":{"ب","و","ک","ی","ړ","ا","ن","ژ","ګ","د"},"l":4.358898943540674,"c":{"د":1,"ب":2,"ی":2,"ن":2,"ګ":1,"ژ":1,"ا":1,"ړ":1,"و":1,"ک":1},"t":"BingTranslate"},"Bing vertaler":{"s":{"g","n","b","t","l","v","r","a","e","i"},"l":4.0,"c":{"b":1,"i":1,"n":1,"g":1,"v":1,"e":2,"r":2,"t":1,"a":1,"l":1},"t":"BingTranslate"},"Bing prekladač":{"s":{"g","č","n","b","d","l","r","k","a","p","e","i"},"l":3.872983346207417,"c":{"b":1,"i":1,"n":1,"g":1,"p":1,"r":1,"e":1,"k":1,"l":1,"a":2,"d":1,"č":1},"t":"BingTranslate"},"બિંગ અનુવાદક API":{"s":{"ગ","ન","ા","ુ","િ","ક","ં","બ","અ","દ","a","p","વ","i"},"l":3.7416573867739413,"c":{"બ":1,"િ":1,"ં":1,"ગ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"ક":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"Bing prevajalec":{"s":{"g","n","b","j","l","v","c","r","a","p","e","i"},"l":4.242640687119285,"c":{"b":1,"i":1,"n":1,"g":1,"p":1,"r":1,"e":2,"v":1,"a":2,"j":1,"l":1,"c":1},"t":"BingTranslate"},"Преведувач на Бинг":{"s":{"б","н","ч","и","в","р","а","г","д","у","п","е"},"l":4.898979485566356,"c":{"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"а":2,"ч":1,"н":2,"б":1,"и":1,"г":1},"t":"BingTranslate"},"Bing preložiť":{"s":{"g","n","b","o","ť","l","r","ž","p","e","i"},"l":3.7416573867739413,"c":{"b":1,"i":2,"n":1,"g":1,"p":1,"r":1,"e":1,"l":1,"o":1,"ž":1,"ť":1},"t":"BingTranslate"},"בינג זעץ":{"s":{"נ","ג","י","ע","ז","ץ","ב"},"l":2.6457513110645907,"c":{"ב":1,"י":1,"נ":1,"ג":1,"ז":1,"ע":1,"ץ":1},"t":"BingTranslate"},"Bing itzultzailea":{"s":{"g","n","b","t","l","u","z","a","e","i"},"l":5.477225575051661,"c":{"b":1,"i":3,"n":1,"g":1,"t":2,"z":2,"u":1,"l":2,"a":2,"e":1},"t":"BingTranslate"},"Ọ sụgharịrị":{"s":{"g","h","r","s","ọ","ụ","ị","a"},"l":3.7416573867739413,"c":{"ọ":1,"s":1,"ụ":1,"g":1,"h":1,"a":1,"r":2,"ị":2},"t":"BingTranslate"},"Bining Translënz":{"s":{"ë","g","n","b","t","l","r","s","z","a","i"},"l":5.385164807134504,"c":{"b":1,"i":2,"n":4,"g":1,"t":1,"r":1,"a":1,"s":1,"l":1,"ë":1,"z":1},"t":"BingTranslate"},"Bing تەرجىمانى API":{"s":{"g","n","b","ى","p","ا","ە","ر","ت","م","a","ج","ن","i"},"l":4.47213595499958,"c":{"b":1,"i":2,"n":1,"g":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1,"a":1,"p":1},"t":"BingTranslate"},"Tafsiri ya Bing":{"s":{"g","n","b","f","t","r","y","s","a","i"},"l":4.58257569495584,"c":{"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"y":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"I-Bing Translation":{"s":{"g","n","b","t","l","r","-","s","a","o","i"},"l":5.744562646538029,"c":{"i":3,"-":1,"b":1,"n":3,"g":1,"t":2,"r":1,"a":2,"s":1,"l":1,"o":1},"t":"BingTranslate"},"ဘာသာပြန်သူဘာသာပြန်ဆိုသူ":{"s":{"ိ","ူ","ု","ဘ","ြ","ာ","ဆ","န","သ","ပ","်"},"l":7.681145747868608,"c":{"ဘ":2,"ာ":4,"သ":4,"ပ":2,"ြ":2,"န":2,"်":2,"ူ":2,"ဆ":1,"ိ":1,"ု":1},"t":"BingTranslate"},"API di traduttore bing":{"s":{"g","n","b","o","d","t","u","r","a","p","e","i"},"l":6.082762530298219,"c":{"a":2,"p":1,"i":3,"d":2,"t":3,"r":2,"u":1,"o":1,"e":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"ಬಿಂಗ್ ಅನುವಾದಿಸು":{"s":{"ವ","ಗ","ಸ","್","ಿ","ಬ","ಅ","ಂ","ನ","ಾ","ದ","ು"},"l":4.242640687119285,"c":{"ಬ":1,"ಿ":2,"ಂ":1,"ಗ":1,"್":1,"ಅ":1,"ನ":1,"ು":2,"ವ":1,"ಾ":1,"ದ":1,"ಸ":1},"t":"BingTranslate"},"بنگ":{"s":{"ب","ن","گ"},"l":1.7320508075688772,"c":{"ب":1,"ن":1,"گ":1},"t":"BingTranslate"},"ترجمة بينج":{"s":{"ب","ة","ي","م","ر","ت","ج","ن"},"l":3.3166247903554,"c":{"ت":1,"ر":1,"ج":2,"م":1,"ة":1,"ب":1,"ي":1,"ن":1},"t":"BingTranslate"},"Bing איבערזעצער אַפּי":{"s":{"g","י","n","b","ע","ר","ז","צ","פ","ּ","ַ","א","ב","i"},"l":5.5677643628300215,"c":{"b":1,"i":1,"n":1,"g":1,"א":2,"י":2,"ב":1,"ע":3,"ר":2,"ז":1,"צ":1,"ַ":1,"פ":1,"ּ":1},"t":"BingTranslate"},"Mtafsiri wa Bing":{"s":{"g","n","b","f","w","t","r","s","m","a","i"},"l":4.69041575982343,"c":{"m":1,"t":1,"a":2,"f":1,"s":1,"i":3,"r":1,"w":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"API tłumacza Bing":{"s":{"g","n","b","t","ł","u","c","z","m","a","p","i"},"l":4.795831523312719,"c":{"a":3,"p":1,"i":2,"t":1,"ł":1,"u":1,"m":1,"c":1,"z":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"API Penerjemah Bing":{"s":{"g","n","h","b","j","r","m","a","p","e","i"},"l":5.5677643628300215,"c":{"a":2,"p":2,"i":2,"e":3,"n":2,"r":1,"j":1,"m":1,"h":1,"b":1,"g":1},"t":"BingTranslate"},"బింగ్ అనువాదకుడు":{"s":{"గ","్","ద","క","ం","ా","డ","బ","ి","న","వ","ు","అ"},"l":4.58257569495584,"c":{"బ":1,"ి":1,"ం":1,"గ":1,"్":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1},"t":"BingTranslate"},"תרגום של בינג":{"s":{"ת","נ","ג","י","ש","ב","ל","ם","ר","ו"},"l":3.605551275463989,"c":{"ת":1,"ר":1,"ג":2,"ו":1,"ם":1,"ש":1,"ל":1,"ב":1,"י":1,"נ":1},"t":"BingTranslate"},"Bing vertaling":{"s":{"g","n","b","t","l","v","r","a","e","i"},"l":4.358898943540674,"c":{"b":1,"i":2,"n":2,"g":2,"v":1,"e":1,"r":1,"t":1,"a":1,"l":1},"t":"BingTranslate"},"Bing переводчик":{"s":{"к","g","ч","n","b","и","в","д","р","о","п","е","i"},"l":4.0,"c":{"b":1,"i":1,"n":1,"g":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1},"t":"BingTranslate"},"Bing Penterjemah API":{"s":{"g","n","b","h","j","t","r","m","a","p","e","i"},"l":5.656854249492381,"c":{"b":1,"i":2,"n":2,"g":1,"p":2,"e":3,"t":1,"r":1,"j":1,"m":1,"a":2,"h":1},"t":"BingTranslate"},"Bing vertimas":{"s":{"g","n","b","t","v","r","s","m","a","e","i"},"l":3.7416573867739413,"c":{"b":1,"i":2,"n":1,"g":1,"v":1,"e":1,"r":1,"t":1,"m":1,"a":1,"s":1},"t":"BingTranslate"},"Bing tradwi":{"s":{"g","n","b","d","w","t","r","a","i"},"l":3.4641016151377544,"c":{"b":1,"i":2,"n":1,"g":1,"t":1,"r":1,"a":1,"d":1,"w":1},"t":"BingTranslate"},"Béieren":{"s":{"é","n","b","r","e","i"},"l":3.0,"c":{"b":1,"é":1,"i":1,"e":2,"r":1,"n":1},"t":"BingTranslate"},"Суусон":{"s":{"о","у","н","с"},"l":3.1622776601683795,"c":{"с":2,"у":2,"о":1,"н":1},"t":"BingTranslate"},"బింగ్":{"s":{"గ","్","ం","బ","ి"},"l":2.23606797749979,"c":{"బ":1,"ి":1,"ం":1,"గ":1,"్":1},"t":"BingTranslate"},"BIN Fassara":{"s":{"n","b","f","r","s","a","i"},"l":4.242640687119285,"c":{"b":1,"i":1,"n":1,"f":1,"a":3,"s":2,"r":1},"t":"BingTranslate"},"Bing аудармашысы":{"s":{"g","n","b","ш","р","ы","с","а","д","м","у","i"},"l":4.795831523312719,"c":{"b":1,"i":1,"n":1,"g":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1},"t":"BingTranslate"},"Bing tarjimoni":{"s":{"g","n","b","j","t","r","m","a","o","i"},"l":4.58257569495584,"c":{"b":1,"i":3,"n":2,"g":1,"t":1,"a":1,"r":1,"j":1,"m":1,"o":1},"t":"BingTranslate"},"Bing Übersetzer":{"s":{"g","n","b","ü","t","r","s","z","e","i"},"l":4.898979485566356,"c":{"b":2,"i":1,"n":1,"g":1,"ü":1,"e":3,"r":2,"s":1,"t":1,"z":1},"t":"BingTranslate"},"বিং অনুবাদ":{"s":{"অ","ি","ু","ন","দ","ব","ং","া"},"l":3.3166247903554,"c":{"ব":2,"ি":1,"ং":1,"অ":1,"ন":1,"ু":1,"া":1,"দ":1},"t":"BingTranslate"},"مترجم بینگ":{"s":{"ب","ی","م","ر","ت","ج","ن","گ"},"l":3.3166247903554,"c":{"م":2,"ت":1,"ر":1,"ج":1,"ب":1,"ی":1,"ن":1,"گ":1},"t":"BingTranslate"},"Bing පරිවර්තනය":{"s":{"ි","g","න","n","b","ව","ප","ත","්","ය","i","ර"},"l":3.872983346207417,"c":{"b":1,"i":1,"n":1,"g":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"න":1,"ය":1},"t":"BingTranslate"},"बिग्रो":{"s":{"ग","ि","्","र","ब","ो"},"l":2.449489742783178,"c":{"ब":1,"ि":1,"ग":1,"्":1,"र":1,"ो":1},"t":"BingTranslate"},"Bing Terjemahan":{"s":{"g","n","b","h","j","t","r","m","a","e","i"},"l":4.47213595499958,"c":{"b":1,"i":1,"n":2,"g":1,"t":1,"e":2,"r":1,"j":1,"m":1,"a":2,"h":1},"t":"BingTranslate"},"ბინგ":{"s":{"გ","ნ","ი","ბ"},"l":2.0,"c":{"ბ":1,"ი":1,"ნ":1,"გ":1},"t":"BingTranslate"},"Tarjamah Tarjamahkeun":{"s":{"n","h","j","t","u","r","m","k","a","e"},"l":7.745966692414834,"c":{"t":2,"a":6,"r":2,"j":2,"m":2,"h":2,"k":1,"e":1,"u":1,"n":1},"t":"BingTranslate"},"Tradutor Bing":{"s":{"g","n","b","d","t","u","r","a","o","i"},"l":4.0,"c":{"t":2,"r":2,"a":1,"d":1,"u":1,"o":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing ଅନୁବାଦକ |":{"s":{"g","ୁ","ା","n","b","ଦ","ବ","ନ","|","ଅ","କ","i"},"l":3.4641016151377544,"c":{"b":1,"i":1,"n":1,"g":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"|":1},"t":"BingTranslate"},"Μεταφραστικό Bing":{"s":{"α","ρ","g","n","b","ι","μ","ό","ε","σ","κ","τ","φ","i"},"l":4.47213595499958,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ι":1,"κ":1,"ό":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"ຂ້ອຢ":{"s":{"້","ອ","ຢ","ຂ"},"l":2.0,"c":{"ຂ":1,"້":1,"ອ":1,"ຢ":1},"t":"BingTranslate"},"Bing fordítás":{"s":{"g","n","b","f","d","t","í","á","r","s","o","i"},"l":3.4641016151377544,"c":{"b":1,"i":1,"n":1,"g":1,"f":1,"o":1,"r":1,"d":1,"í":1,"t":1,"á":1,"s":1},"t":"BingTranslate"},"Bing traduit":{"s":{"g","n","b","d","t","u","r","a","i"},"l":3.872983346207417,"c":{"b":1,"i":2,"n":1,"g":1,"t":2,"r":1,"a":1,"d":1,"u":1},"t":"BingTranslate"},"Phatlalatso ea Bing Api":{"s":{"g","n","h","o","b","t","l","s","a","p","e","i"},"l":6.928203230275509,"c":{"p":2,"h":1,"a":5,"t":2,"l":2,"s":1,"o":1,"e":1,"b":1,"i":2,"n":1,"g":1},"t":"BingTranslate"},"Onye ntụgharị Bing Api":{"s":{"g","n","h","b","t","p","r","y","ụ","ị","a","o","e","i"},"l":5.5677643628300215,"c":{"o":1,"n":3,"y":1,"e":1,"t":1,"ụ":1,"g":2,"h":1,"a":2,"r":1,"ị":1,"b":1,"i":2,"p":1},"t":"BingTranslate"},"Bing prevodilac":{"s":{"g","n","b","o","d","l","v","c","r","a","p","e","i"},"l":4.0,"c":{"b":1,"i":2,"n":1,"g":1,"p":1,"r":1,"e":1,"v":1,"o":1,"d":1,"l":1,"a":1,"c":1},"t":"BingTranslate"},"బింగ్ అనువాదకుడు API":{"s":{"గ","్","ద","క","ం","ా","డ","బ","ి","న","వ","ు","a","p","అ","i"},"l":4.898979485566356,"c":{"బ":1,"ి":1,"ం":1,"గ":1,"్":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"ਬਿੰਗ ਅਨੁਵਾਦ":{"s":{"ੰ","ਗ","ਾ","ਬ","ਵ","ਿ","ੁ","ਅ","ਨ","ਦ"},"l":3.1622776601683795,"c":{"ਬ":1,"ਿ":1,"ੰ":1,"ਗ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1},"t":"BingTranslate"},"B":{"s":{"b"},"l":1.0,"c":{"b":1},"t":"BingTranslate"},"ខាប់បកប្រែ":{"s":{"ប","រ","្","ែ","ក","ា","ខ","់"},"l":4.0,"c":{"ខ":1,"ា":1,"ប":3,"់":1,"ក":1,"្":1,"រ":1,"ែ":1},"t":"BingTranslate"},"Tulks":{"s":{"t","l","u","s","k"},"l":2.23606797749979,"c":{"t":1,"u":1,"l":1,"k":1,"s":1},"t":"BingTranslate"},"Bing თარჯიმანი":{"s":{"g","თ","n","b","ჯ","ა","რ","მ","ნ","ი","i"},"l":4.123105625617661,"c":{"b":1,"i":1,"n":1,"g":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"BingTranslate"},"Bing tulkot":{"s":{"g","n","b","t","l","u","k","o","i"},"l":3.4641016151377544,"c":{"b":1,"i":1,"n":1,"g":1,"t":2,"u":1,"l":1,"k":1,"o":1},"t":"BingTranslate"},"ബിംഗ്":{"s":{"ബ","ി","്","ഗ","ം"},"l":2.23606797749979,"c":{"ബ":1,"ി":1,"ം":1,"ഗ":1,"്":1},"t":"BingTranslate"},"Traduzzione Bing":{"s":{"g","n","b","d","t","u","r","z","a","o","e","i"},"l":4.58257569495584,"c":{"t":1,"r":1,"a":1,"d":1,"u":1,"z":2,"i":2,"o":1,"n":2,"e":1,"b":1,"g":1},"t":"BingTranslate"},"Бинг преводилац":{"s":{"б","н","л","и","в","а","г","д","р","о","п","ц","е"},"l":4.0,"c":{"б":1,"и":2,"н":1,"г":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"л":1,"а":1,"ц":1},"t":"BingTranslate"},"Bing fassara":{"s":{"g","n","b","f","r","s","a","i"},"l":4.358898943540674,"c":{"b":1,"i":1,"n":1,"g":1,"f":1,"a":3,"s":2,"r":1},"t":"BingTranslate"},"API Translator Bing":{"s":{"g","n","b","o","t","l","r","s","a","p","i"},"l":5.5677643628300215,"c":{"a":3,"p":1,"i":2,"t":2,"r":2,"n":2,"s":1,"l":1,"o":1,"b":1,"g":1},"t":"BingTranslate"},"Bing faaliliu upu":{"s":{"g","n","b","f","l","u","a","p","i"},"l":5.5677643628300215,"c":{"b":1,"i":3,"n":1,"g":1,"f":1,"a":2,"l":2,"u":3,"p":1},"t":"BingTranslate"},"बिंग अनुवादक एपीआई":{"s":{"ी","ए","प","ग","ु","ई","ि","न","अ","द","ा","ं","ब","क","व","आ"},"l":4.0,"c":{"ब":1,"ि":1,"ं":1,"ग":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"BingTranslate"},"Beanna":{"s":{"e","a","n","b"},"l":3.1622776601683795,"c":{"b":1,"e":1,"a":2,"n":2},"t":"BingTranslate"},"Bing -tradukisto":{"s":{"g","n","b","d","t","u","r","-","s","k","a","o","i"},"l":4.358898943540674,"c":{"b":1,"i":2,"n":1,"g":1,"-":1,"t":2,"r":1,"a":1,"d":1,"u":1,"k":1,"s":1,"o":1},"t":"BingTranslate"},"பிங் மொழிமாற்றி":{"s":{"ெ","ம","ற","்","ப","ி","ா","ழ","ங"},"l":5.385164807134504,"c":{"ப":1,"ி":3,"ங":1,"்":2,"ம":2,"ெ":1,"ா":2,"ழ":1,"ற":2},"t":"BingTranslate"},"ビング":{"s":{"ビ","グ","ン"},"l":1.7320508075688772,"c":{"ビ":1,"ン":1,"グ":1},"t":"BingTranslate"},"Bing turjuma":{"s":{"g","n","b","j","t","u","r","m","a","i"},"l":3.605551275463989,"c":{"b":1,"i":1,"n":1,"g":1,"t":1,"u":2,"r":1,"j":1,"m":1,"a":1},"t":"BingTranslate"},"Bing Которуу Комментарий":{"s":{"к","g","н","n","b","м","и","а","й","р","о","у","е","i","т"},"l":6.164414002968976,"c":{"b":1,"i":1,"n":1,"g":1,"к":2,"о":3,"т":2,"р":2,"у":2,"м":2,"е":1,"н":1,"а":1,"и":1,"й":1},"t":"BingTranslate"},"Bing Iwwersetzer API":{"s":{"g","n","b","w","t","r","s","z","a","p","e","i"},"l":5.830951894845301,"c":{"b":1,"i":3,"n":1,"g":1,"w":2,"e":3,"r":2,"s":1,"t":1,"z":1,"a":1,"p":1},"t":"BingTranslate"},"Bing translate":{"s":{"g","n","b","t","l","r","s","a","e","i"},"l":4.358898943540674,"c":{"b":1,"i":1,"n":2,"g":1,"t":2,"r":1,"a":2,"s":1,"l":1,"e":1},"t":"BingTranslate"},"ಬಿಂಗ್ ಅನುವಾದಕ ಎಪಿಐ":{"s":{"ವ","ಎ","ಗ","ಕ","ಐ","್","ಿ","ಬ","ಅ","ಂ","ನ","ಾ","ಪ","ದ","ು"},"l":4.242640687119285,"c":{"ಬ":1,"ಿ":2,"ಂ":1,"ಗ":1,"್":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಕ":1,"ಎ":1,"ಪ":1,"ಐ":1},"t":"BingTranslate"},"Bing interpres API":{"s":{"g","n","b","t","r","s","a","p","e","i"},"l":5.477225575051661,"c":{"b":1,"i":3,"n":2,"g":1,"t":1,"e":2,"r":2,"p":2,"s":1,"a":1},"t":"BingTranslate"},"Ibhitonye":{"s":{"n","b","h","t","y","o","e","i"},"l":3.3166247903554,"c":{"i":2,"b":1,"h":1,"t":1,"o":1,"n":1,"y":1,"e":1},"t":"BingTranslate"},"ນັກແປພາສາ Bing":{"s":{"g","ພ","ນ","ປ","ກ","b","ສ","n","ັ","າ","ແ","i"},"l":3.872983346207417,"c":{"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing μεταφραστής":{"s":{"α","g","ρ","ή","n","b","ς","μ","ε","σ","τ","φ","i"},"l":4.358898943540674,"c":{"b":1,"i":1,"n":1,"g":1,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1},"t":"BingTranslate"},"Bing翻译":{"s":{"g","n","b","译","翻","i"},"l":2.449489742783178,"c":{"b":1,"i":1,"n":1,"g":1,"翻":1,"译":1},"t":"BingTranslate"},"Πινγκόν":{"s":{"γ","ν","ι","π","κ","ό"},"l":3.0,"c":{"π":1,"ι":1,"ν":2,"γ":1,"κ":1,"ό":1},"t":"BingTranslate"},"Turjubaan Bing":{"s":{"g","n","b","j","t","u","r","a","i"},"l":4.58257569495584,"c":{"t":1,"u":2,"r":1,"j":1,"b":2,"a":2,"n":2,"i":1,"g":1},"t":"BingTranslate"},"překladač Bing":{"s":{"g","č","n","b","d","ř","l","k","a","p","e","i"},"l":3.872983346207417,"c":{"p":1,"ř":1,"e":1,"k":1,"l":1,"a":2,"d":1,"č":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Whakawhitiwhiti a Bing":{"s":{"g","n","h","b","w","t","k","a","i"},"l":7.745966692414834,"c":{"w":3,"h":3,"a":3,"k":1,"i":5,"t":2,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing Iwwersetzer":{"s":{"g","n","b","w","t","r","s","z","e","i"},"l":5.196152422706632,"c":{"b":1,"i":2,"n":1,"g":1,"w":2,"e":3,"r":2,"s":1,"t":1,"z":1},"t":"BingTranslate"},"Bing Թարգմանել":{"s":{"լ","թ","g","ա","n","b","ն","ե","գ","ր","մ","i"},"l":3.872983346207417,"c":{"b":1,"i":1,"n":1,"g":1,"թ":1,"ա":2,"ր":1,"գ":1,"մ":1,"ն":1,"ե":1,"լ":1},"t":"BingTranslate"},"API du traducteur Bing":{"s":{"g","n","b","d","t","u","c","r","a","p","e","i"},"l":5.916079783099616,"c":{"a":2,"p":1,"i":2,"d":2,"u":3,"t":2,"r":2,"c":1,"e":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Mpandika teny bing":{"s":{"g","n","b","d","t","y","m","k","a","p","e","i"},"l":5.0990195135927845,"c":{"m":1,"p":1,"a":2,"n":3,"d":1,"i":2,"k":1,"t":1,"e":1,"y":1,"b":1,"g":1},"t":"BingTranslate"},"traduttore Bing":{"s":{"g","n","b","d","t","u","r","a","o","e","i"},"l":4.69041575982343,"c":{"t":3,"r":2,"a":1,"d":1,"u":1,"o":1,"e":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Бинг Перевод":{"s":{"б","н","и","в","г","д","р","о","п","е"},"l":3.605551275463989,"c":{"б":1,"и":1,"н":1,"г":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1},"t":"BingTranslate"},"Bing vertaal":{"s":{"g","n","b","t","l","v","r","a","e","i"},"l":3.605551275463989,"c":{"b":1,"i":1,"n":1,"g":1,"v":1,"e":1,"r":1,"t":1,"a":2,"l":1},"t":"BingTranslate"},"빙 번역기":{"s":{"빙","번","역","기"},"l":2.0,"c":{"빙":1,"번":1,"역":1,"기":1},"t":"BingTranslate"},"ဘာသာပြန်သူ API bing":{"s":{"g","ူ","n","b","ဘ","ြ","ာ","န","သ","a","p","ပ","i","်"},"l":4.795831523312719,"c":{"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1,"a":1,"p":1,"i":2,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Pī":{"s":{"p","ī"},"l":1.4142135623730951,"c":{"p":1,"ī":1},"t":"BingTranslate"},"Bing itzulpena":{"s":{"g","n","b","t","l","u","z","a","p","e","i"},"l":4.123105625617661,"c":{"b":1,"i":2,"n":2,"g":1,"t":1,"z":1,"u":1,"l":1,"p":1,"e":1,"a":1},"t":"BingTranslate"},"API do tradutor de Bing":{"s":{"g","n","b","d","t","p","u","r","a","o","e","i"},"l":5.916079783099616,"c":{"a":2,"p":1,"i":2,"d":3,"o":2,"t":2,"r":2,"u":1,"e":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"API ya mtafsiri wa Bing":{"s":{"g","n","b","f","w","t","r","y","s","m","a","p","i"},"l":6.557438524302,"c":{"a":4,"p":1,"i":4,"y":1,"m":1,"t":1,"f":1,"s":1,"r":1,"w":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"API на Bing Translator":{"s":{"g","н","n","b","o","t","l","а","r","s","a","p","i"},"l":5.744562646538029,"c":{"a":3,"p":1,"i":2,"н":1,"а":1,"b":1,"n":2,"g":1,"t":2,"r":2,"s":1,"l":1,"o":1},"t":"BingTranslate"},"Kutanthauzira":{"s":{"n","h","t","u","r","z","k","a","i"},"l":4.795831523312719,"c":{"k":1,"u":2,"t":2,"a":3,"n":1,"h":1,"z":1,"i":1,"r":1},"t":"ReversoTranslate"},"Bing traduz":{"s":{"g","n","b","d","t","u","r","z","a","i"},"l":3.1622776601683795,"c":{"b":1,"i":1,"n":1,"g":1,"t":1,"r":1,"a":1,"d":1,"u":1,"z":1},"t":"BingTranslate"},"Bing Aistritheoir API":{"s":{"g","n","b","h","t","p","r","s","a","o","e","i"},"l":6.708203932499369,"c":{"b":1,"i":5,"n":1,"g":1,"a":2,"s":1,"t":2,"r":2,"h":1,"e":1,"o":1,"p":1},"t":"BingTranslate"},"Бинг превод":{"s":{"б","н","и","в","г","д","р","о","п","е"},"l":3.1622776601683795,"c":{"б":1,"и":1,"н":1,"г":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1},"t":"BingTranslate"},"Mofetoleli oa Bing":{"s":{"g","n","b","f","t","l","m","a","o","e","i"},"l":5.291502622129181,"c":{"m":1,"o":3,"f":1,"e":2,"t":1,"l":2,"i":2,"a":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"பிங்":{"s":{"்","ப","ங","ி"},"l":2.0,"c":{"ப":1,"ி":1,"ங":1,"்":1},"t":"BingTranslate"},"Bing překládat":{"s":{"g","n","b","d","ř","l","t","á","k","a","p","e","i"},"l":3.605551275463989,"c":{"b":1,"i":1,"n":1,"g":1,"p":1,"ř":1,"e":1,"k":1,"l":1,"á":1,"d":1,"a":1,"t":1},"t":"BingTranslate"},"I-Bing Guqula":{"s":{"g","n","b","l","u","q","-","a","i"},"l":4.242640687119285,"c":{"i":2,"-":1,"b":1,"n":1,"g":2,"u":2,"q":1,"l":1,"a":1},"t":"BingTranslate"},"Бинг Транслате":{"s":{"б","н","л","и","с","а","г","р","е","т"},"l":4.358898943540674,"c":{"б":1,"и":1,"н":2,"г":1,"т":2,"р":1,"а":2,"с":1,"л":1,"е":1},"t":"BingTranslate"},"బింగ్ అనువాదం":{"s":{"గ","్","ద","ం","ా","బ","ి","న","వ","ు","అ"},"l":3.7416573867739413,"c":{"బ":1,"ి":1,"ం":2,"గ":1,"్":1,"అ":1,"న":1,"ు":1,"వ":1,"ా":1,"ద":1},"t":"BingTranslate"},"Bing अनुवादक":{"s":{"g","n","b","ु","न","अ","द","ा","क","व","i"},"l":3.3166247903554,"c":{"b":1,"i":1,"n":1,"g":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"BingTranslate"},"API prekladateľa Bing":{"s":{"g","n","b","d","ľ","l","t","r","k","a","p","e","i"},"l":6.082762530298219,"c":{"a":4,"p":2,"i":2,"r":1,"e":2,"k":1,"l":1,"d":1,"t":1,"ľ":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing Tərcümə":{"s":{"g","n","b","ü","t","ə","r","m","c","i"},"l":3.605551275463989,"c":{"b":1,"i":1,"n":1,"g":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1},"t":"BingTranslate"},"Сууплох орчуулагч":{"s":{"л","ч","с","а","г","р","о","у","п","х"},"l":5.830951894845301,"c":{"с":1,"у":4,"п":1,"л":2,"о":2,"х":1,"р":1,"ч":2,"а":1,"г":1},"t":"BingTranslate"},"बिंग भाषांतर":{"s":{"भ","ग","ि","त","ा","र","ं","ब","ष"},"l":3.872983346207417,"c":{"ब":1,"ि":1,"ं":2,"ग":1,"भ":1,"ा":2,"ष":1,"त":1,"र":1},"t":"BingTranslate"},"Bing ትርጉም":{"s":{"g","n","b","ም","ር","ጉ","ት","i"},"l":2.8284271247461903,"c":{"b":1,"i":1,"n":1,"g":1,"ት":1,"ር":1,"ጉ":1,"ም":1},"t":"BingTranslate"},"Bing oersetter":{"s":{"g","n","b","t","r","s","o","e","i"},"l":4.795831523312719,"c":{"b":1,"i":1,"n":1,"g":1,"o":1,"e":3,"r":2,"s":1,"t":2},"t":"BingTranslate"},"Tagasalin ng bing":{"s":{"g","n","b","t","l","s","a","i"},"l":5.916079783099616,"c":{"t":1,"a":3,"g":3,"s":1,"l":1,"i":2,"n":3,"b":1},"t":"BingTranslate"},"Bing kääntää":{"s":{"g","n","b","t","ä","k","i"},"l":5.0,"c":{"b":1,"i":1,"n":2,"g":1,"k":1,"ä":4,"t":1},"t":"BingTranslate"},"penerjemah bing":{"s":{"g","n","h","b","j","r","m","a","p","e","i"},"l":4.69041575982343,"c":{"p":1,"e":3,"n":2,"r":1,"j":1,"m":1,"a":1,"h":1,"b":1,"i":1,"g":1},"t":"BingTranslate"},"Pakultas Bukaan":{"s":{"n","b","l","t","u","s","k","a","p"},"l":5.477225575051661,"c":{"p":1,"a":4,"k":2,"u":2,"l":1,"t":1,"s":1,"b":1,"n":1},"t":"BingTranslate"},"Bing ଅନୁବାଦକ API |":{"s":{"g","ୁ","ା","n","b","ଦ","ବ","ନ","|","ଅ","କ","a","p","i"},"l":4.123105625617661,"c":{"b":1,"i":2,"n":1,"g":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"a":1,"p":1,"|":1},"t":"BingTranslate"},"Bingas":{"s":{"g","n","b","s","a","i"},"l":2.449489742783178,"c":{"b":1,"i":1,"n":1,"g":1,"a":1,"s":1},"t":"BingTranslate"},"বিং":{"s":{"ব","ি","ং"},"l":1.7320508075688772,"c":{"ব":1,"ি":1,"ং":1},"t":"BingTranslate"},"Բինգ":{"s":{"ի","գ","բ","ն"},"l":2.0,"c":{"բ":1,"ի":1,"ն":1,"գ":1},"t":"BingTranslate"},"Bing itzultzailea APIa":{"s":{"g","n","b","t","l","u","z","a","p","e","i"},"l":7.0710678118654755,"c":{"b":1,"i":4,"n":1,"g":1,"t":2,"z":2,"u":1,"l":2,"a":4,"e":1,"p":1},"t":"BingTranslate"},"বিং অনুবাদক এপিআই":{"s":{"অ","ি","ু","আ","এ","ন","দ","ই","ক","ব","ং","া","প"},"l":4.358898943540674,"c":{"ব":2,"ি":2,"ং":1,"অ":1,"ন":1,"ু":1,"া":1,"দ":1,"ক":1,"এ":1,"প":1,"আ":1,"ই":1},"t":"BingTranslate"},"બિંગ ભાષાંતર":{"s":{"ગ","ા","ષ","ત","િ","ર","ં","બ","ભ"},"l":3.872983346207417,"c":{"બ":1,"િ":1,"ં":2,"ગ":1,"ભ":1,"ા":2,"ષ":1,"ત":1,"ર":1},"t":"BingTranslate"},"Bing cyfieithydd api":{"s":{"a","g","n","b","f","h","d","t","y","c","p","e","i"},"l":5.830951894845301,"c":{"b":1,"i":4,"n":1,"g":1,"c":1,"y":2,"f":1,"e":1,"t":1,"h":1,"d":2,"a":1,"p":1},"t":"BingTranslate"},"Bing prevajalec API":{"s":{"g","n","b","j","l","v","c","r","a","p","e","i"},"l":5.385164807134504,"c":{"b":1,"i":2,"n":1,"g":1,"p":2,"r":1,"e":2,"v":1,"a":3,"j":1,"l":1,"c":1},"t":"BingTranslate"},"ബിംഗ് വിവർത്തകൻ":{"s":{"ൻ","ബ","ി","ത","വ","്","ർ","ക","ഗ","ം"},"l":4.69041575982343,"c":{"ബ":1,"ി":2,"ം":1,"ഗ":1,"്":2,"വ":2,"ർ":1,"ത":2,"ക":1,"ൻ":1},"t":"BingTranslate"},"Pisa":{"s":{"a","p","s","i"},"l":2.0,"c":{"p":1,"i":1,"s":1,"a":1},"t":"BingTranslate"},"អ្នកបកប្រែ Bing":{"s":{"ប","រ","g","i","្","b","ែ","n","ក","អ","ន"},"l":4.47213595499958,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing muturikiri API":{"s":{"g","n","b","t","u","r","m","k","a","p","i"},"l":6.4031242374328485,"c":{"b":1,"i":5,"n":1,"g":1,"m":1,"u":2,"t":1,"r":2,"k":1,"a":1,"p":1},"t":"BingTranslate"},"بنگ مترجم":{"s":{"ب","م","ر","ت","ج","ن","گ"},"l":3.1622776601683795,"c":{"ب":1,"ن":1,"گ":1,"م":2,"ت":1,"ر":1,"ج":1},"t":"BingTranslate"},"БИДЭНД ОРУУЛАХ":{"s":{"б","н","л","и","р","а","д","э","о","у","х"},"l":4.123105625617661,"c":{"б":1,"и":1,"д":2,"э":1,"н":1,"о":1,"р":1,"у":2,"л":1,"а":1,"х":1},"t":"BingTranslate"},"ແປພາສາ Bing ແປ":{"s":{"g","ພ","ປ","b","n","ສ","າ","ແ","i"},"l":4.242640687119285,"c":{"ແ":2,"ປ":2,"ພ":1,"າ":2,"ສ":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"பிங் மொழிபெயர்ப்பு":{"s":{"ெ","ொ","ு","ம","ர","ய","்","ப","ி","ழ","ங"},"l":6.082762530298219,"c":{"ப":4,"ி":2,"ங":1,"்":3,"ம":1,"ொ":1,"ழ":1,"ெ":1,"ய":1,"ர":1,"ு":1},"t":"BingTranslate"},"Bing Tarjoriator API":{"s":{"g","n","b","j","t","p","r","a","o","i"},"l":6.324555320336759,"c":{"b":1,"i":3,"n":1,"g":1,"t":2,"a":3,"r":3,"j":1,"o":2,"p":1},"t":"BingTranslate"},"API перакладчыка Bing":{"s":{"к","g","л","ч","п","b","n","а","д","р","ы","a","p","е","i"},"l":5.385164807134504,"c":{"a":1,"p":1,"i":2,"п":1,"е":1,"р":1,"а":3,"к":2,"л":1,"д":1,"ч":1,"ы":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing tradiktè":{"s":{"g","n","b","d","t","r","k","a","è","i"},"l":4.0,"c":{"b":1,"i":2,"n":1,"g":1,"t":2,"r":1,"a":1,"d":1,"k":1,"è":1},"t":"BingTranslate"},"बिंग ट्रान्सलेटर एपीआय":{"s":{"े","ी","ए","प","ग","ि","न","्","ा","ट","र","ं","ब","स","ल","आ","य"},"l":5.0990195135927845,"c":{"ब":1,"ि":1,"ं":1,"ग":1,"ट":2,"्":2,"र":2,"ा":1,"न":1,"स":1,"ल":1,"े":1,"ए":1,"प":1,"ी":1,"आ":1,"य":1},"t":"BingTranslate"},"بنگ ترجمہ":{"s":{"ب","ہ","م","ر","ت","ج","ن","گ"},"l":2.8284271247461903,"c":{"ب":1,"ن":1,"گ":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1},"t":"BingTranslate"},"bing翻訳":{"s":{"g","n","b","翻","訳","i"},"l":2.449489742783178,"c":{"b":1,"i":1,"n":1,"g":1,"翻":1,"訳":1},"t":"BingTranslate"},"Bingi tõlkija":{"s":{"g","n","b","j","t","l","k","õ","a","i"},"l":4.242640687119285,"c":{"b":1,"i":3,"n":1,"g":1,"t":1,"õ":1,"l":1,"k":1,"j":1,"a":1},"t":"BingTranslate"},"ဘာသာပြန်ဆိုခြင်း":{"s":{"ိ","ု","ဘ","ြ","ာ","ဆ","ခ","င","န","သ","း","ပ","်"},"l":4.69041575982343,"c":{"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":2,"န":1,"်":2,"ဆ":1,"ိ":1,"ု":1,"ခ":1,"င":1,"း":1},"t":"BingTranslate"},"Bing വിവർത്തനം":{"s":{"g","ി","n","b","ത","വ","ർ","്","ം","i","ന"},"l":4.123105625617661,"c":{"b":1,"i":1,"n":1,"g":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1},"t":"BingTranslate"},"ಬಿಂಗ್ ಭಾಷಾಂತರಕಾರ":{"s":{"ರ","ಗ","ಕ","್","ಿ","ಬ","ಂ","ಭ","ತ","ಾ","ಷ"},"l":5.0,"c":{"ಬ":1,"ಿ":1,"ಂ":2,"ಗ":1,"್":1,"ಭ":1,"ಾ":3,"ಷ":1,"ತ":1,"ರ":2,"ಕ":1},"t":"BingTranslate"},"Translator API KANG":{"s":{"g","n","t","l","p","r","s","k","a","o","i"},"l":5.916079783099616,"c":{"t":2,"r":2,"a":4,"n":2,"s":1,"l":1,"o":1,"p":1,"i":1,"k":1,"g":1},"t":"BingTranslate"},"የ Bing አስተርጓሚ":{"s":{"g","n","b","ሚ","የ","አ","ስ","ተ","ጓ","ር","i"},"l":3.3166247903554,"c":{"የ":1,"b":1,"i":1,"n":1,"g":1,"አ":1,"ስ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"BingTranslate"},"Bing Dudziro":{"s":{"g","n","b","d","u","r","z","o","i"},"l":3.872983346207417,"c":{"b":1,"i":2,"n":1,"g":1,"d":2,"u":1,"z":1,"r":1,"o":1},"t":"BingTranslate"},"බිං පරිවර්තකය":{"s":{"ි","ව","ප","ත","ක","්","ය","ං","බ","ර"},"l":4.0,"c":{"බ":1,"ි":2,"ං":1,"ප":1,"ර":2,"ව":1,"්":1,"ත":1,"ක":1,"ය":1},"t":"BingTranslate"},"Bing -vertaler":{"s":{"g","n","b","t","l","v","r","-","a","e","i"},"l":4.123105625617661,"c":{"b":1,"i":1,"n":1,"g":1,"-":1,"v":1,"e":2,"r":2,"t":1,"a":1,"l":1},"t":"BingTranslate"},"Bing þýðandi":{"s":{"g","þ","ð","n","b","d","ý","a","i"},"l":3.872983346207417,"c":{"b":1,"i":2,"n":2,"g":1,"þ":1,"ý":1,"ð":1,"a":1,"d":1},"t":"BingTranslate"},"traductor Bing":{"s":{"g","n","b","d","t","u","c","r","a","o","i"},"l":4.123105625617661,"c":{"t":2,"r":2,"a":1,"d":1,"u":1,"c":1,"o":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bins":{"s":{"s","n","b","i"},"l":2.0,"c":{"b":1,"i":1,"n":1,"s":1},"t":"BingTranslate"},"Kaiwhakamaori a Bing":{"s":{"g","n","h","b","w","r","m","k","a","o","i"},"l":6.782329983125268,"c":{"k":2,"a":5,"i":3,"w":1,"h":1,"m":1,"o":1,"r":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Traduttore bis":{"s":{"b","d","t","u","r","s","a","o","e","i"},"l":4.58257569495584,"c":{"t":3,"r":2,"a":1,"d":1,"u":1,"o":1,"e":1,"b":1,"i":1,"s":1},"t":"BingTranslate"},"Бінг":{"s":{"б","н","г","і"},"l":2.0,"c":{"б":1,"і":1,"н":1,"г":1},"t":"BingTranslate"},"بینګ ژباړه":{"s":{"ب","ی","ړ","ا","ن","ژ","ه","ګ"},"l":3.3166247903554,"c":{"ب":2,"ی":1,"ن":1,"ګ":1,"ژ":1,"ا":1,"ړ":1,"ه":1},"t":"BingTranslate"},"Cyfieithydd bing":{"s":{"g","n","h","f","d","b","t","y","c","e","i"},"l":5.0,"c":{"c":1,"y":2,"f":1,"i":3,"e":1,"t":1,"h":1,"d":2,"b":1,"n":1,"g":1},"t":"BingTranslate"},"API del traductor de bing":{"s":{"g","n","b","o","d","l","t","u","c","r","a","p","e","i"},"l":6.082762530298219,"c":{"a":2,"p":1,"i":2,"d":3,"e":2,"l":1,"t":2,"r":2,"u":1,"c":1,"o":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"„Bing“ vertėjas":{"s":{"g","„","n","b","j","“","t","v","r","s","a","e","i","ė"},"l":3.7416573867739413,"c":{"„":1,"b":1,"i":1,"n":1,"g":1,"“":1,"v":1,"e":1,"r":1,"t":1,"ė":1,"j":1,"a":1,"s":1},"t":"BingTranslate"},"Bing مترجم API":{"s":{"g","n","b","p","م","ر","ت","a","ج","i"},"l":4.0,"c":{"b":1,"i":2,"n":1,"g":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1},"t":"BingTranslate"},"Bing":{"s":{"g","n","b","i"},"l":2.0,"c":{"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing аудармасы":{"s":{"g","n","b","р","ы","с","а","д","м","у","i"},"l":4.358898943540674,"c":{"b":1,"i":1,"n":1,"g":1,"а":3,"у":1,"д":1,"р":1,"м":1,"с":1,"ы":1},"t":"BingTranslate"},"Bing übersetzen":{"s":{"g","n","b","ü","t","r","s","z","e","i"},"l":4.898979485566356,"c":{"b":2,"i":1,"n":2,"g":1,"ü":1,"e":3,"r":1,"s":1,"t":1,"z":1},"t":"BingTranslate"},"Birasi Translator":{"s":{"n","b","t","l","r","s","a","o","i"},"l":5.830951894845301,"c":{"b":1,"i":2,"r":3,"a":3,"s":2,"t":2,"n":1,"l":1,"o":1},"t":"BingTranslate"},"מתרגם בינג":{"s":{"ת","נ","ג","י","ב","ם","ר","מ"},"l":3.3166247903554,"c":{"מ":1,"ת":1,"ר":1,"ג":2,"ם":1,"ב":1,"י":1,"נ":1},"t":"BingTranslate"},"Bing cyfieithu":{"s":{"g","n","b","f","h","t","u","y","c","e","i"},"l":4.358898943540674,"c":{"b":1,"i":3,"n":1,"g":1,"c":1,"y":1,"f":1,"e":1,"t":1,"h":1,"u":1},"t":"BingTranslate"},"बिंग अनुवाद":{"s":{"ग","ु","ि","न","अ","द","ा","ं","ब","व"},"l":3.1622776601683795,"c":{"ब":1,"ि":1,"ं":1,"ग":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"BingTranslate"},"Umguquleli we-Bing":{"s":{"g","n","b","w","l","u","q","-","m","e","i"},"l":5.5677643628300215,"c":{"u":3,"m":1,"g":2,"q":1,"l":2,"e":2,"i":2,"w":1,"-":1,"b":1,"n":1},"t":"BingTranslate"},"Bing Թարգմանիչ":{"s":{"թ","g","ա","n","b","ն","ի","չ","գ","ր","մ","i"},"l":3.872983346207417,"c":{"b":1,"i":1,"n":1,"g":1,"թ":1,"ա":2,"ր":1,"գ":1,"մ":1,"ն":1,"ի":1,"չ":1},"t":"BingTranslate"},"בינג":{"s":{"נ","ג","י","ב"},"l":2.0,"c":{"ב":1,"י":1,"נ":1,"ג":1},"t":"BingTranslate"},"बिंग का अनुवाद":{"s":{"ग","ु","ि","न","अ","द","ा","ं","ब","क","व"},"l":3.7416573867739413,"c":{"ब":1,"ि":1,"ं":1,"ग":1,"क":1,"ा":2,"अ":1,"न":1,"ु":1,"व":1,"द":1},"t":"BingTranslate"},"बिंग अनुवादक":{"s":{"ग","ु","ि","न","अ","द","ा","ं","ब","क","व"},"l":3.3166247903554,"c":{"ब":1,"ि":1,"ं":1,"ग":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"BingTranslate"},"API μεταφραστή Bing":{"s":{"τ","α","ρ","ή","n","b","g","μ","φ","ε","σ","a","p","i"},"l":4.795831523312719,"c":{"a":1,"p":1,"i":2,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing kääntäjä":{"s":{"g","n","b","j","t","ä","k","i"},"l":5.0990195135927845,"c":{"b":1,"i":1,"n":2,"g":1,"k":1,"ä":4,"t":1,"j":1},"t":"BingTranslate"},"Bing тарҷумон api":{"s":{"g","н","n","b","м","о","а","р","ҷ","у","a","p","i","т"},"l":4.123105625617661,"c":{"b":1,"i":2,"n":1,"g":1,"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"a":1,"p":1},"t":"BingTranslate"},"ბინგის თარგმანი":{"s":{"თ","ბ","ს","ა","რ","მ","ნ","გ","ი"},"l":5.0990195135927845,"c":{"ბ":1,"ი":3,"ნ":2,"გ":2,"ს":1,"თ":1,"ა":2,"რ":1,"მ":1},"t":"BingTranslate"},"Bing tərcüməçi api":{"s":{"a","g","n","b","ü","t","ə","r","m","ç","c","p","i"},"l":4.898979485566356,"c":{"b":1,"i":3,"n":1,"g":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"a":1,"p":1},"t":"BingTranslate"},"Bing översätta":{"s":{"g","n","b","t","v","ö","r","s","ä","a","e","i"},"l":3.872983346207417,"c":{"b":1,"i":1,"n":1,"g":1,"ö":1,"v":1,"e":1,"r":1,"s":1,"ä":1,"t":2,"a":1},"t":"BingTranslate"},"Aistritheoir bing":{"s":{"g","n","h","b","t","r","s","a","o","e","i"},"l":5.656854249492381,"c":{"a":1,"i":4,"s":1,"t":2,"r":2,"h":1,"e":1,"o":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Бинг преводач":{"s":{"б","н","ч","и","в","а","г","д","р","о","п","е"},"l":3.4641016151377544,"c":{"б":1,"и":1,"н":1,"г":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"а":1,"ч":1},"t":"BingTranslate"},"Bing oversetter":{"s":{"g","n","b","t","v","r","s","o","e","i"},"l":4.898979485566356,"c":{"b":1,"i":1,"n":1,"g":1,"o":1,"v":1,"e":3,"r":2,"s":1,"t":2},"t":"BingTranslate"},"Bing jittraduċi":{"s":{"g","n","b","j","d","t","u","r","ċ","a","i"},"l":4.69041575982343,"c":{"b":1,"i":3,"n":1,"g":1,"j":1,"t":2,"r":1,"a":1,"d":1,"u":1,"ċ":1},"t":"BingTranslate"},"Bing tradiktè API":{"s":{"g","n","b","d","t","r","k","a","p","è","i"},"l":5.0,"c":{"b":1,"i":3,"n":1,"g":1,"t":2,"r":1,"a":2,"d":1,"k":1,"è":1,"p":1},"t":"BingTranslate"},"ਬਿੰਗ ਅਨੁਵਾਦਕ API":{"s":{"ੰ","ਗ","i","ਾ","ਕ","ਬ","ਵ","ਿ","ੁ","ਅ","a","p","ਨ","ਦ"},"l":3.7416573867739413,"c":{"ਬ":1,"ਿ":1,"ੰ":1,"ਗ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਕ":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"Bing Translator":{"s":{"g","n","b","t","l","r","s","a","o","i"},"l":4.69041575982343,"c":{"b":1,"i":1,"n":2,"g":1,"t":2,"r":2,"a":2,"s":1,"l":1,"o":1},"t":"BingTranslate"},"Bing prevoditelj":{"s":{"g","n","b","o","d","j","t","l","v","r","p","e","i"},"l":4.358898943540674,"c":{"b":1,"i":2,"n":1,"g":1,"p":1,"r":1,"e":2,"v":1,"o":1,"d":1,"t":1,"l":1,"j":1},"t":"BingTranslate"},"Bing Oersetter API":{"s":{"g","n","b","t","p","r","s","a","o","e","i"},"l":5.291502622129181,"c":{"b":1,"i":2,"n":1,"g":1,"o":1,"e":3,"r":2,"s":1,"t":2,"a":1,"p":1},"t":"BingTranslate"},"Birdhooan lahaa":{"s":{"n","h","b","d","l","r","a","o","i"},"l":5.477225575051661,"c":{"b":1,"i":1,"r":1,"d":1,"h":2,"o":2,"a":4,"n":1,"l":1},"t":"BingTranslate"},"Umhumushi we-Bing":{"s":{"g","n","h","b","w","u","-","s","m","e","i"},"l":5.291502622129181,"c":{"u":3,"m":2,"h":2,"s":1,"i":2,"w":1,"e":1,"-":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing tərcüməçi":{"s":{"g","n","b","ü","t","ə","r","m","ç","c","i"},"l":4.123105625617661,"c":{"b":1,"i":2,"n":1,"g":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1},"t":"BingTranslate"},"Bing Omasulira API":{"s":{"g","n","b","l","p","u","r","s","m","a","o","i"},"l":5.291502622129181,"c":{"b":1,"i":3,"n":1,"g":1,"o":1,"m":1,"a":3,"s":1,"u":1,"l":1,"r":1,"p":1},"t":"BingTranslate"},"Bing tõlkib":{"s":{"g","n","b","t","l","k","õ","i"},"l":3.7416573867739413,"c":{"b":2,"i":2,"n":1,"g":1,"t":1,"õ":1,"l":1,"k":1},"t":"BingTranslate"},"බිං":{"s":{"ි","ං","බ"},"l":1.7320508075688772,"c":{"බ":1,"ි":1,"ං":1},"t":"BingTranslate"},"API של מתרגם בינג":{"s":{"ת","נ","ג","י","ש","ר","ב","ל","ם","a","p","i","מ"},"l":4.0,"c":{"a":1,"p":1,"i":1,"ש":1,"ל":1,"מ":1,"ת":1,"ר":1,"ג":2,"ם":1,"ב":1,"י":1,"נ":1},"t":"BingTranslate"},"Penerjemah bing":{"s":{"g","n","h","b","j","r","m","a","p","e","i"},"l":4.69041575982343,"c":{"p":1,"e":3,"n":2,"r":1,"j":1,"m":1,"a":1,"h":1,"b":1,"i":1,"g":1},"t":"BingTranslate"},"ബിംഗ് ട്രാറ്റർ API":{"s":{"ബ","ി","റ","i","്","ർ","ാ","ഗ","ട","ം","a","p","ര"},"l":4.898979485566356,"c":{"ബ":1,"ി":1,"ം":1,"ഗ":1,"്":3,"ട":1,"ര":1,"ാ":1,"റ":2,"ർ":1,"a":1,"p":1,"i":1},"t":"BingTranslate"},"tłumacz Bing":{"s":{"g","n","b","t","ł","u","c","z","m","a","i"},"l":3.3166247903554,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing Tradukas":{"s":{"g","n","b","d","t","u","r","s","k","a","i"},"l":3.7416573867739413,"c":{"b":1,"i":1,"n":1,"g":1,"t":1,"r":1,"a":2,"d":1,"u":1,"k":1,"s":1},"t":"BingTranslate"},"Bing тарҷума":{"s":{"g","n","b","м","а","р","ҷ","у","i","т"},"l":3.605551275463989,"c":{"b":1,"i":1,"n":1,"g":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1},"t":"BingTranslate"},"Bing werger":{"s":{"g","n","b","w","r","e","i"},"l":4.0,"c":{"b":1,"i":1,"n":1,"g":2,"w":1,"e":2,"r":2},"t":"BingTranslate"},"Bing përkthen":{"s":{"ë","g","n","b","h","t","r","k","p","e","i"},"l":3.7416573867739413,"c":{"b":1,"i":1,"n":2,"g":1,"p":1,"ë":1,"r":1,"k":1,"t":1,"h":1,"e":1},"t":"BingTranslate"},"Bing Translator API":{"s":{"g","n","b","t","l","p","r","s","a","o","i"},"l":5.5677643628300215,"c":{"b":1,"i":2,"n":2,"g":1,"t":2,"r":2,"a":3,"s":1,"l":1,"o":1,"p":1},"t":"BingTranslate"},"Aturdir":{"s":{"d","t","u","r","a","i"},"l":3.0,"c":{"a":1,"t":1,"u":1,"r":2,"d":1,"i":1},"t":"BingTranslate"},"Bing traducir":{"s":{"g","n","b","d","t","u","c","r","a","i"},"l":4.0,"c":{"b":1,"i":2,"n":1,"g":1,"t":1,"r":2,"a":1,"d":1,"u":1,"c":1},"t":"BingTranslate"},"بینگ ترجمه":{"s":{"ب","ی","م","ر","ت","ه","ج","ن","گ"},"l":3.0,"c":{"ب":1,"ی":1,"ن":1,"گ":1,"ت":1,"ر":1,"ج":1,"م":1,"ه":1},"t":"BingTranslate"},"Bing Traduttur":{"s":{"g","n","b","d","t","u","r","a","i"},"l":4.795831523312719,"c":{"b":1,"i":1,"n":1,"g":1,"t":3,"r":2,"a":1,"d":1,"u":2},"t":"BingTranslate"},"អ្នកបកប្រែ Bing API":{"s":{"ប","រ","g","i","្","b","ែ","n","ក","អ","a","p","ន"},"l":5.0,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"b":1,"i":2,"n":1,"g":1,"a":1,"p":1},"t":"BingTranslate"},"Bing tõlkija API":{"s":{"g","n","b","j","t","l","k","õ","a","p","i"},"l":4.69041575982343,"c":{"b":1,"i":3,"n":1,"g":1,"t":1,"õ":1,"l":1,"k":1,"j":1,"a":2,"p":1},"t":"BingTranslate"},"API do Bing Translator":{"s":{"g","n","b","d","t","l","p","r","s","a","o","i"},"l":5.916079783099616,"c":{"a":3,"p":1,"i":2,"d":1,"o":2,"b":1,"n":2,"g":1,"t":2,"r":2,"s":1,"l":1},"t":"BingTranslate"},"বিং অনুবাদক":{"s":{"অ","ি","ু","ন","দ","ক","ব","ং","া"},"l":3.4641016151377544,"c":{"ব":2,"ি":1,"ং":1,"অ":1,"ন":1,"ু":1,"া":1,"দ":1,"ক":1},"t":"BingTranslate"},"빙 번역":{"s":{"빙","번","역"},"l":1.7320508075688772,"c":{"빙":1,"번":1,"역":1},"t":"BingTranslate"},"Dịch thuật Bing":{"s":{"ậ","g","n","h","b","d","t","u","ị","c","i"},"l":4.123105625617661,"c":{"d":1,"ị":1,"c":1,"h":2,"t":2,"u":1,"ậ":1,"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"I-Bing":{"s":{"g","n","b","-","i"},"l":2.8284271247461903,"c":{"i":2,"-":1,"b":1,"n":1,"g":1},"t":"BingTranslate"},"Bing Translate":{"s":{"g","n","b","t","l","r","s","a","e","i"},"l":4.358898943540674,"c":{"b":1,"i":1,"n":2,"g":1,"t":2,"r":1,"a":2,"s":1,"l":1,"e":1},"t":"BingTranslate"},"API tat-Traduttur Bing":{"s":{"g","n","b","d","t","u","r","-","a","p","i"},"l":7.211102550927978,"c":{"a":3,"p":1,"i":2,"t":5,"-":1,"r":2,"d":1,"u":2,"b":1,"n":1,"g":1},"t":"BingTranslate"},"bing":{"s":{"g","n","b","i"},"l":2.0,"c":{"b":1,"i":1,"n":1,"g":1},"t":"BingTranslate"},"Bing თარჯიმანი API":{"s":{"g","თ","n","b","ჯ","ა","რ","მ","ნ","a","p","ი","i"},"l":4.69041575982343,"c":{"b":1,"i":2,"n":1,"g":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"a":1,"p":1},"t":"BingTranslate"},"Eadar-theangaiche bing":{"s":{"g","n","h","b","d","t","c","r","-","a","e","i"},"l":6.855654600401044,"c":{"e":3,"a":4,"d":1,"r":1,"-":1,"t":1,"h":2,"n":2,"g":2,"i":2,"c":1,"b":1},"t":"BingTranslate"},"DeEBL VEEBLORS API":{"s":{"b","d","l","v","p","r","s","a","o","e","i"},"l":5.656854249492381,"c":{"d":1,"e":4,"b":2,"l":2,"v":1,"o":1,"r":1,"s":1,"a":1,"p":1,"i":1},"t":"DeeplTranslate"},"Деепл преводилац":{"s":{"л","и","в","а","д","р","о","п","ц","е"},"l":5.196152422706632,"c":{"д":2,"е":3,"п":2,"л":2,"р":1,"в":1,"о":1,"и":1,"а":1,"ц":1},"t":"DeeplTranslate"},"ጥልቅ አስተርጓሚ":{"s":{"ል","ሚ","አ","ስ","ቅ","ተ","ጥ","ር","ጓ"},"l":3.0,"c":{"ጥ":1,"ል":1,"ቅ":1,"አ":1,"ስ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"DeeplTranslate"},"Deepl itzultzailea":{"s":{"d","l","t","u","z","a","p","e","i"},"l":6.082762530298219,"c":{"d":1,"e":3,"p":1,"l":3,"i":2,"t":2,"z":2,"u":1,"a":2},"t":"DeeplTranslate"},"Dwfn":{"s":{"w","n","f","d"},"l":2.0,"c":{"d":1,"w":1,"f":1,"n":1},"t":"DeeplTranslate"},"API tat-Traduttur DEEPL":{"s":{"d","t","l","u","r","-","a","p","e","i"},"l":7.54983443527075,"c":{"a":3,"p":2,"i":1,"t":5,"-":1,"r":2,"d":2,"u":2,"e":2,"l":1},"t":"DeeplTranslate"},"डीपल ट्रान्सलेटर":{"s":{"ी","े","प","ड","न","्","ा","ट","र","स","ल"},"l":4.795831523312719,"c":{"ड":1,"ी":1,"प":1,"ल":2,"ट":2,"्":2,"र":2,"ा":1,"न":1,"स":1,"े":1},"t":"DeeplTranslate"},"Traducció de DeePL":{"s":{"ó","d","t","l","u","c","r","a","p","e","i"},"l":5.477225575051661,"c":{"t":1,"r":1,"a":1,"d":3,"u":1,"c":2,"i":1,"ó":1,"e":3,"p":1,"l":1},"t":"DeeplTranslate"},"API Deepl Placetor API":{"s":{"o","d","l","t","c","r","a","p","e","i"},"l":6.855654600401044,"c":{"a":3,"p":4,"i":2,"d":1,"e":3,"l":2,"c":1,"t":1,"o":1,"r":1},"t":"DeeplTranslate"},"Deepl API prevoditelja":{"s":{"o","d","j","l","t","v","r","a","p","e","i"},"l":6.782329983125268,"c":{"d":2,"e":4,"p":3,"l":2,"a":2,"i":2,"r":1,"v":1,"o":1,"t":1,"j":1},"t":"DeeplTranslate"},"ਦਾਗ":{"s":{"ਾ","ਗ","ਦ"},"l":1.7320508075688772,"c":{"ਦ":1,"ਾ":1,"ਗ":1},"t":"DeeplTranslate"},"DEEPL TRANSLASI":{"s":{"n","d","l","t","r","s","a","p","e","i"},"l":4.69041575982343,"c":{"d":1,"e":2,"p":1,"l":2,"t":1,"r":1,"a":2,"n":1,"s":2,"i":1},"t":"DeeplTranslate"},"API de tradutor DEEPL":{"s":{"o","d","t","l","u","r","a","p","e","i"},"l":6.164414002968976,"c":{"a":2,"p":2,"i":1,"d":3,"e":3,"t":2,"r":2,"u":1,"o":1,"l":1},"t":"DeeplTranslate"},"deepl":{"s":{"l","p","e","d"},"l":2.6457513110645907,"c":{"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl വിവർത്തക API":{"s":{"ി","ത","d","വ","l","ർ","്","ക","a","p","e","i"},"l":4.898979485566356,"c":{"d":1,"e":2,"p":2,"l":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ക":1,"a":1,"i":1},"t":"DeeplTranslate"},"Tłumacz deepl":{"s":{"d","t","l","ł","u","c","z","m","a","p","e"},"l":3.7416573867739413,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl Tradukisto":{"s":{"o","d","l","t","u","r","s","k","a","p","e","i"},"l":4.58257569495584,"c":{"d":2,"e":2,"p":1,"l":1,"t":2,"r":1,"a":1,"u":1,"k":1,"i":1,"s":1,"o":1},"t":"DeeplTranslate"},"Deepl tradwi":{"s":{"d","w","l","t","r","a","p","e","i"},"l":3.872983346207417,"c":{"d":2,"e":2,"p":1,"l":1,"t":1,"r":1,"a":1,"w":1,"i":1},"t":"DeeplTranslate"},"Traductor de Deepl":{"s":{"d","t","l","p","u","c","r","a","o","e"},"l":5.656854249492381,"c":{"t":2,"r":2,"a":1,"d":3,"u":1,"c":1,"o":1,"e":3,"p":1,"l":1},"t":"DeeplTranslate"},"Dhiza Delator Api":{"s":{"h","d","l","t","p","r","z","a","o","e","i"},"l":5.0,"c":{"d":2,"h":1,"i":2,"z":1,"a":3,"e":1,"l":1,"t":1,"o":1,"r":1,"p":1},"t":"DeeplTranslate"},"Preplator tapi domhainn":{"s":{"n","h","o","d","l","t","r","m","a","p","e","i"},"l":6.557438524302,"c":{"p":3,"r":2,"e":1,"l":1,"a":3,"t":2,"o":2,"i":2,"d":1,"m":1,"h":1,"n":2},"t":"DeeplTranslate"},"Deepl თარჯიმანი":{"s":{"თ","d","ჯ","l","ა","რ","მ","ნ","p","e","ი"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"DeeplTranslate"},"Deldl Dudziro":{"s":{"d","l","u","r","z","o","e","i"},"l":5.0990195135927845,"c":{"d":4,"e":1,"l":2,"u":1,"z":1,"i":1,"r":1,"o":1},"t":"DeeplTranslate"},"Risultatu traduce":{"s":{"d","l","t","u","c","r","s","a","e","i"},"l":5.656854249492381,"c":{"r":2,"i":1,"s":1,"u":3,"l":1,"t":3,"a":2,"d":1,"c":1,"e":1},"t":"DeeplTranslate"},"Eadar-theangaire domhainn":{"s":{"g","n","h","d","t","r","-","m","a","o","e","i"},"l":8.0,"c":{"e":3,"a":5,"d":2,"r":2,"-":1,"t":1,"h":2,"n":3,"g":1,"i":2,"o":1,"m":1},"t":"DeeplTranslate"},"API Translator API":{"s":{"n","o","t","l","r","s","a","p","i"},"l":6.0,"c":{"a":4,"p":2,"i":2,"t":2,"r":2,"n":1,"s":1,"l":1,"o":1},"t":"DeeplTranslate"},"API i përkthyesit deepl":{"s":{"ë","h","d","t","l","r","y","s","k","a","p","e","i"},"l":6.324555320336759,"c":{"a":1,"p":3,"i":3,"ë":1,"r":1,"k":1,"t":2,"h":1,"y":1,"e":3,"s":1,"d":1,"l":1},"t":"DeeplTranslate"},"Перекладач Deepl":{"s":{"к","л","ч","d","l","а","e","д","р","п","p","е"},"l":4.58257569495584,"c":{"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"گندي ترجمو ڪندڙ":{"s":{"و","ي","ڙ","م","ر","ت","گ","ڪ","ج","ن","د"},"l":4.123105625617661,"c":{"گ":1,"ن":2,"د":2,"ي":1,"ت":1,"ر":1,"ج":1,"م":1,"و":1,"ڪ":1,"ڙ":1},"t":"DeeplTranslate"},"Дипл":{"s":{"и","л","п","д"},"l":2.0,"c":{"д":1,"и":1,"п":1,"л":1},"t":"DeeplTranslate"},"Deepl tradiktè":{"s":{"è","d","l","t","r","k","a","p","e","i"},"l":4.358898943540674,"c":{"d":2,"e":2,"p":1,"l":1,"t":2,"r":1,"a":1,"i":1,"k":1,"è":1},"t":"DeeplTranslate"},"Deeph transplator Api":{"s":{"n","h","o","d","t","l","r","s","a","p","e","i"},"l":6.082762530298219,"c":{"d":1,"e":2,"p":3,"h":1,"t":2,"r":2,"a":3,"n":1,"s":1,"l":1,"o":1,"i":1},"t":"DeeplTranslate"},"Derinlemesine":{"s":{"n","d","l","r","s","m","e","i"},"l":5.385164807134504,"c":{"d":1,"e":4,"r":1,"i":2,"n":2,"l":1,"m":1,"s":1},"t":"DeeplTranslate"},"deepl ဘာသာပြန်":{"s":{"ပ","d","ဘ","l","ာ","ြ","န","သ","p","e","်"},"l":4.123105625617661,"c":{"d":1,"e":2,"p":1,"l":1,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1,"်":1},"t":"DeeplTranslate"},"Перакладчык Deepl":{"s":{"к","л","ч","d","l","а","e","д","р","ы","п","p","е"},"l":4.69041575982343,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl -oversætter":{"s":{"o","d","l","t","v","r","-","s","æ","p","e"},"l":5.656854249492381,"c":{"d":1,"e":4,"p":1,"l":1,"-":1,"o":1,"v":1,"r":2,"s":1,"æ":1,"t":2},"t":"DeeplTranslate"},"Deepl Перакласці":{"s":{"к","е","л","d","l","с","а","ц","і","р","п","p","e"},"l":4.358898943540674,"c":{"d":1,"e":2,"p":1,"l":1,"п":1,"е":1,"р":1,"а":2,"к":1,"л":1,"с":1,"ц":1,"і":1},"t":"DeeplTranslate"},"Womasulira":{"s":{"w","l","u","r","s","m","a","o","i"},"l":3.4641016151377544,"c":{"w":1,"o":1,"m":1,"a":2,"s":1,"u":1,"l":1,"i":1,"r":1},"t":"DeeplTranslate"},"डीप्ल ट्रांसलेटर एपीआई":{"s":{"ी","े","ए","प","ड","ई","्","ा","ट","र","ं","स","ल","आ"},"l":5.656854249492381,"c":{"ड":1,"ी":2,"प":2,"्":2,"ल":2,"ट":2,"र":2,"ा":1,"ं":1,"स":1,"े":1,"ए":1,"आ":1,"ई":1},"t":"DeeplTranslate"},"Deepl преведувач":{"s":{"е","ч","d","в","l","а","д","р","у","п","p","e"},"l":4.58257569495584,"c":{"d":1,"e":2,"p":1,"l":1,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"а":1,"ч":1},"t":"DeeplTranslate"},"مترجم":{"s":{"م","ر","ت","ج"},"l":2.6457513110645907,"c":{"م":2,"ت":1,"ر":1,"ج":1},"t":"TranslateComTranslate"},"ژوره":{"s":{"ر","و","ژ","ه"},"l":2.0,"c":{"ژ":1,"و":1,"ر":1,"ه":1},"t":"DeeplTranslate"},"API dịch DEEPL":{"s":{"h","d","l","c","ị","a","p","e","i"},"l":4.242640687119285,"c":{"a":1,"p":2,"i":1,"d":2,"ị":1,"c":1,"h":1,"e":2,"l":1},"t":"DeeplTranslate"},"Deepl tłumaczenie":{"s":{"n","d","l","t","ł","u","c","z","m","a","p","e","i"},"l":5.291502622129181,"c":{"d":1,"e":4,"p":1,"l":1,"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"n":1,"i":1},"t":"DeeplTranslate"},"Deepl អ្នកបកប្រែ API":{"s":{"ប","រ","i","្","d","ែ","ក","l","អ","a","p","e","ន"},"l":5.291502622129181,"c":{"d":1,"e":2,"p":2,"l":1,"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"a":1,"i":1},"t":"DeeplTranslate"},"Penerjemén deecl":{"s":{"n","j","d","l","r","m","c","p","e","é"},"l":6.082762530298219,"c":{"p":1,"e":5,"n":2,"r":1,"j":1,"m":1,"é":1,"d":1,"c":1,"l":1},"t":"DeeplTranslate"},"Deepl अनुवाद":{"s":{"d","l","ु","न","अ","द","ा","व","p","e"},"l":3.605551275463989,"c":{"d":1,"e":2,"p":1,"l":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"DeeplTranslate"},"Dzakadzika":{"s":{"d","z","k","a","i"},"l":4.69041575982343,"c":{"d":2,"z":2,"a":3,"k":2,"i":1},"t":"DeeplTranslate"},"Demin Tarjamahkeun":{"s":{"n","h","d","j","t","u","r","m","k","a","e","i"},"l":5.385164807134504,"c":{"d":1,"e":2,"m":2,"i":1,"n":2,"t":1,"a":3,"r":1,"j":1,"h":1,"k":1,"u":1},"t":"DeeplTranslate"},"Դետալ":{"s":{"ա","ե","դ","տ","լ"},"l":2.23606797749979,"c":{"դ":1,"ե":1,"տ":1,"ա":1,"լ":1},"t":"DeeplTranslate"},"Deepl tõlkib":{"s":{"b","d","l","t","k","õ","p","e","i"},"l":3.872983346207417,"c":{"d":1,"e":2,"p":1,"l":2,"t":1,"õ":1,"k":1,"i":1,"b":1},"t":"DeeplTranslate"},"Prevajalec DEEPL":{"s":{"j","d","l","v","c","r","a","p","e"},"l":5.744562646538029,"c":{"p":2,"r":1,"e":4,"v":1,"a":2,"j":1,"l":2,"c":1,"d":1},"t":"DeeplTranslate"},"දීප් පරිවර්තක API":{"s":{"ි","i","ව","ප","ත","ක","ද","්","a","p","ී","ර"},"l":4.58257569495584,"c":{"ද":1,"ී":1,"ප":2,"්":2,"ර":2,"ි":1,"ව":1,"ත":1,"ක":1,"a":1,"p":1,"i":1},"t":"DeeplTranslate"},"I-inzulu":{"s":{"n","l","u","-","z","i"},"l":3.4641016151377544,"c":{"i":2,"-":1,"n":1,"z":1,"u":2,"l":1},"t":"DeeplTranslate"},"DEPL Oversættelse":{"s":{"o","d","l","t","v","r","æ","s","p","e"},"l":5.830951894845301,"c":{"d":1,"e":4,"p":1,"l":2,"o":1,"v":1,"r":1,"s":2,"æ":1,"t":2},"t":"DeeplTranslate"},"ДЕЕПЛ":{"s":{"л","п","е","д"},"l":2.6457513110645907,"c":{"д":1,"е":2,"п":1,"л":1},"t":"DeeplTranslate"},"ಡೀಪ್ಲ್ ಅನುವಾದಕ ಎಪಿಐ":{"s":{"ಲ","ವ","ಎ","ಕ","ಡ","ಐ","್","ಿ","ಅ","ನ","ೀ","ಾ","ಪ","ದ","ು"},"l":4.58257569495584,"c":{"ಡ":1,"ೀ":1,"ಪ":2,"್":2,"ಲ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಕ":1,"ಎ":1,"ಿ":1,"ಐ":1},"t":"DeeplTranslate"},"Profundo traducir":{"s":{"n","f","o","d","t","u","c","r","a","p","i"},"l":5.291502622129181,"c":{"p":1,"r":3,"o":2,"f":1,"u":2,"n":1,"d":2,"t":1,"a":1,"c":1,"i":1},"t":"DeeplTranslate"},"Deepl Translator Api":{"s":{"n","o","d","l","t","r","s","a","p","e","i"},"l":5.830951894845301,"c":{"d":1,"e":2,"p":2,"l":2,"t":2,"r":2,"a":3,"n":1,"s":1,"o":1,"i":1},"t":"DeeplTranslate"},"چوڭقۇر تەرجىمە":{"s":{"و","ق","ى","ڭ","ە","ر","ت","م","ۇ","ج","چ"},"l":4.123105625617661,"c":{"چ":1,"و":1,"ڭ":1,"ق":1,"ۇ":1,"ر":2,"ت":1,"ە":2,"ج":1,"ى":1,"م":1},"t":"DeeplTranslate"},"Deepl prevajalski API":{"s":{"d","j","l","v","r","s","k","a","p","e","i"},"l":6.4031242374328485,"c":{"d":1,"e":3,"p":3,"l":2,"r":1,"v":1,"a":3,"j":1,"s":1,"k":1,"i":2},"t":"DeeplTranslate"},"API de traductor de Deeppl":{"s":{"o","d","t","l","u","c","r","a","p","e","i"},"l":7.615773105863909,"c":{"a":2,"p":3,"i":1,"d":4,"e":4,"t":2,"r":2,"u":1,"c":1,"o":1,"l":1},"t":"DeeplTranslate"},"API μεταφραστή Deepl":{"s":{"τ","α","ρ","ή","d","l","μ","φ","ε","σ","a","p","e","i"},"l":5.0990195135927845,"c":{"a":1,"p":2,"i":1,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"ಗಾಡಿ":{"s":{"ಡ","ಿ","ಾ","ಗ"},"l":2.0,"c":{"ಗ":1,"ಾ":1,"ಡ":1,"ಿ":1},"t":"DeeplTranslate"},"Traduttore deepl":{"s":{"d","t","l","p","u","r","a","o","e"},"l":5.5677643628300215,"c":{"t":3,"r":2,"a":1,"d":2,"u":1,"o":1,"e":3,"p":1,"l":1},"t":"DeeplTranslate"},"Traducător Deepl":{"s":{"o","d","t","l","p","u","c","r","a","ă","e"},"l":4.795831523312719,"c":{"t":2,"r":2,"a":1,"d":2,"u":1,"c":1,"ă":1,"o":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"นักแปล deepl":{"s":{"ล","น","d","แ","l","ก","ั","ป","p","e"},"l":3.605551275463989,"c":{"น":1,"ั":1,"ก":1,"แ":1,"ป":1,"ล":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"ژوره وژباړه":{"s":{"ب","و","ړ","ا","ر","ژ","ه"},"l":4.0,"c":{"ژ":2,"و":2,"ر":1,"ه":2,"ب":1,"ا":1,"ړ":1},"t":"DeeplTranslate"},"Deepl prevođenje":{"s":{"n","đ","o","d","j","l","v","r","p","e"},"l":6.082762530298219,"c":{"d":1,"e":5,"p":2,"l":1,"r":1,"v":1,"o":1,"đ":1,"n":1,"j":1},"t":"DeeplTranslate"},"Umguquleli wenzululwazi":{"s":{"g","n","w","l","u","q","z","m","a","e","i"},"l":7.874007874011811,"c":{"u":5,"m":1,"g":1,"q":1,"l":4,"e":2,"i":2,"w":2,"n":1,"z":2,"a":1},"t":"DeeplTranslate"},"Deepl translate":{"s":{"n","d","l","t","r","s","a","p","e"},"l":5.0990195135927845,"c":{"d":1,"e":3,"p":1,"l":2,"t":2,"r":1,"a":2,"n":1,"s":1},"t":"DeeplTranslate"},"DEEPL TRANSLATE":{"s":{"n","d","l","t","r","s","a","p","e"},"l":5.0990195135927845,"c":{"d":1,"e":3,"p":1,"l":2,"t":2,"r":1,"a":2,"n":1,"s":1},"t":"DeeplTranslate"},"Dhidha Dhivhelator":{"s":{"h","d","l","t","v","r","a","o","e","i"},"l":6.244997998398398,"c":{"d":3,"h":4,"i":2,"a":2,"v":1,"e":1,"l":1,"t":1,"o":1,"r":1},"t":"DeeplTranslate"},"DEEPL Tulkotāja API":{"s":{"o","d","j","l","t","u","k","a","p","e","i","ā"},"l":5.196152422706632,"c":{"d":1,"e":2,"p":2,"l":2,"t":2,"u":1,"k":1,"o":1,"ā":1,"j":1,"a":2,"i":1},"t":"DeeplTranslate"},"Deepl Tercüman API":{"s":{"a","n","ü","d","l","t","r","m","c","p","e","i"},"l":5.0990195135927845,"c":{"d":1,"e":3,"p":2,"l":1,"t":1,"r":1,"c":1,"ü":1,"m":1,"a":2,"n":1,"i":1},"t":"DeeplTranslate"},"DEEPL diterjemahkan":{"s":{"n","h","d","j","l","t","r","m","k","a","p","e","i"},"l":5.830951894845301,"c":{"d":2,"e":4,"p":1,"l":1,"i":1,"t":1,"r":1,"j":1,"m":1,"a":2,"h":1,"k":1,"n":1},"t":"DeeplTranslate"},"Prezio inglese api":{"s":{"g","n","o","l","r","z","s","a","p","e","i"},"l":5.477225575051661,"c":{"p":2,"r":1,"e":3,"z":1,"i":3,"o":1,"n":1,"g":1,"l":1,"s":1,"a":1},"t":"DeeplTranslate"},"डीईपीएल भाषांतर":{"s":{"भ","ी","ए","प","ड","ई","त","ा","र","ं","ल","ष"},"l":4.242640687119285,"c":{"ड":1,"ी":2,"ई":1,"प":1,"ए":1,"ल":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1,"र":1},"t":"DeeplTranslate"},"DeepL Которуу Комментарий":{"s":{"к","е","н","м","d","и","l","а","й","р","о","у","p","e","т"},"l":6.4031242374328485,"c":{"d":1,"e":2,"p":1,"l":1,"к":2,"о":3,"т":2,"р":2,"у":2,"м":2,"е":1,"н":1,"а":1,"и":1,"й":1},"t":"DeeplTranslate"},"गहिरो अनुवादक":{"s":{"ह","ग","ु","ि","न","अ","द","व","र","ा","क","ो"},"l":3.4641016151377544,"c":{"ग":1,"ह":1,"ि":1,"र":1,"ो":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"DeeplTranslate"},"ڈی ای پی ایل مترجم":{"s":{"ڈ","ی","ل","ا","م","ر","ت","پ","ج"},"l":5.477225575051661,"c":{"ڈ":1,"ی":4,"ا":2,"پ":1,"ل":1,"م":2,"ت":1,"ر":1,"ج":1},"t":"DeeplTranslate"},"„Deepl“ vertimas":{"s":{"„","d","“","l","t","v","r","s","m","a","p","e","i"},"l":4.58257569495584,"c":{"„":1,"d":1,"e":3,"p":1,"l":1,"“":1,"v":1,"r":1,"t":1,"i":1,"m":1,"a":1,"s":1},"t":"DeeplTranslate"},"Aistritheoir Deepl":{"s":{"h","d","t","l","p","r","s","a","o","e","i"},"l":5.744562646538029,"c":{"a":1,"i":3,"s":1,"t":2,"r":2,"h":1,"e":3,"o":1,"d":1,"p":1,"l":1},"t":"DeeplTranslate"},"Deepepl þýðandi":{"s":{"þ","ð","n","d","l","ý","a","p","e","i"},"l":4.898979485566356,"c":{"d":2,"e":3,"p":2,"l":1,"þ":1,"ý":1,"ð":1,"a":1,"n":1,"i":1},"t":"DeeplTranslate"},"డీప్ల్":{"s":{"ల","ీ","్","డ","ప"},"l":2.8284271247461903,"c":{"డ":1,"ీ":1,"ప":1,"్":2,"ల":1},"t":"DeeplTranslate"},"API translator translator":{"s":{"n","o","t","l","r","s","a","p","i"},"l":8.660254037844387,"c":{"a":5,"p":1,"i":1,"t":4,"r":4,"n":2,"s":2,"l":2,"o":2},"t":"DeeplTranslate"},"Hohonu":{"s":{"u","n","o","h"},"l":3.1622776601683795,"c":{"h":2,"o":2,"n":1,"u":1},"t":"DeeplTranslate"},"Deepl Traduki":{"s":{"d","l","t","u","r","k","a","p","e","i"},"l":4.0,"c":{"d":2,"e":2,"p":1,"l":1,"t":1,"r":1,"a":1,"u":1,"k":1,"i":1},"t":"DeeplTranslate"},"ڈی ای پی ایل مترجم API":{"s":{"ڈ","ی","ل","p","ا","م","ر","ت","پ","a","ج","i"},"l":5.744562646538029,"c":{"ڈ":1,"ی":4,"ا":2,"پ":1,"ل":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1,"i":1},"t":"DeeplTranslate"},"Деепл Транслате":{"s":{"л","н","р","с","а","д","п","е","т"},"l":5.0990195135927845,"c":{"д":1,"е":3,"п":1,"л":2,"т":2,"р":1,"а":2,"н":1,"с":1},"t":"DeeplTranslate"},"Detuup":{"s":{"d","t","u","p","e"},"l":2.8284271247461903,"c":{"d":1,"e":1,"t":1,"u":2,"p":1},"t":"DeeplTranslate"},"Deepl itzultzailea APIa":{"s":{"d","l","t","u","z","a","p","e","i"},"l":7.54983443527075,"c":{"d":1,"e":3,"p":2,"l":3,"i":3,"t":2,"z":2,"u":1,"a":4},"t":"DeeplTranslate"},"Tagasalin ng DEEPL":{"s":{"g","n","d","t","l","s","a","p","e","i"},"l":5.477225575051661,"c":{"t":1,"a":3,"g":2,"s":1,"l":2,"i":1,"n":2,"d":1,"e":2,"p":1},"t":"DeeplTranslate"},"Chuqur tarjima qiling":{"s":{"a","g","n","h","j","t","l","u","q","r","m","c","i"},"l":5.744562646538029,"c":{"c":1,"h":1,"u":2,"q":2,"r":2,"t":1,"a":2,"j":1,"i":3,"m":1,"l":1,"n":1,"g":1},"t":"DeeplTranslate"},"گندي ترجمو ڪندڙ API":{"s":{"و","ي","ڙ","p","م","ر","ت","گ","ڪ","a","ج","ن","i","د"},"l":4.47213595499958,"c":{"گ":1,"ن":2,"د":2,"ي":1,"ت":1,"ر":1,"ج":1,"م":1,"و":1,"ڪ":1,"ڙ":1,"a":1,"p":1,"i":1},"t":"DeeplTranslate"},"Syvän kääntäminen":{"s":{"n","t","v","ä","y","s","m","k","e","i"},"l":6.324555320336759,"c":{"s":1,"y":1,"v":1,"ä":4,"n":4,"k":1,"t":1,"m":1,"i":1,"e":1},"t":"DeeplTranslate"},"Traduttore Deepl":{"s":{"d","t","l","p","u","r","a","o","e"},"l":5.5677643628300215,"c":{"t":3,"r":2,"a":1,"d":2,"u":1,"o":1,"e":3,"p":1,"l":1},"t":"DeeplTranslate"},"Depl аудармашы API":{"s":{"d","ш","р","l","ы","а","д","м","у","a","p","e","i"},"l":4.898979485566356,"c":{"d":1,"e":1,"p":2,"l":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1,"a":1,"i":1},"t":"DeeplTranslate"},"Dightl translatal":{"s":{"g","n","h","d","t","l","r","s","a","i"},"l":5.830951894845301,"c":{"d":1,"i":1,"g":1,"h":1,"t":3,"l":3,"r":1,"a":3,"n":1,"s":1},"t":"DeeplTranslate"},"ڈی ای پی ایل کا ترجمہ":{"s":{"ک","ڈ","ی","ل","ا","ہ","م","ر","ت","پ","ج"},"l":5.830951894845301,"c":{"ڈ":1,"ی":4,"ا":3,"پ":1,"ل":1,"ک":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1},"t":"DeeplTranslate"},"गहिरो अनुवादक एपीआई":{"s":{"ी","ए","ह","ग","ु","प","ि","न","ई","अ","द","व","र","ा","क","ो","आ"},"l":4.123105625617661,"c":{"ग":1,"ह":1,"ि":1,"र":1,"ो":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"DeeplTranslate"},"Penterjemah Deepl":{"s":{"n","h","j","d","t","l","r","m","a","p","e"},"l":6.164414002968976,"c":{"p":2,"e":5,"n":1,"t":1,"r":1,"j":1,"m":1,"a":1,"h":1,"d":1,"l":1},"t":"DeeplTranslate"},"Deepl ترجمه":{"s":{"d","l","ج","م","ر","ت","ه","p","e"},"l":3.4641016151377544,"c":{"d":1,"e":2,"p":1,"l":1,"ت":1,"ر":1,"ج":1,"م":1,"ه":1},"t":"DeeplTranslate"},"ডিপল অনুবাদক এপিআই":{"s":{"অ","ি","ু","আ","এ","ন","দ","ই","ল","ক","ব","া","ড","প"},"l":4.47213595499958,"c":{"ড":1,"ি":2,"প":2,"ল":1,"অ":1,"ন":1,"ু":1,"ব":1,"া":1,"দ":1,"ক":1,"এ":1,"আ":1,"ই":1},"t":"DeeplTranslate"},"API مترجم Deepl":{"s":{"d","l","ج","م","ر","ت","a","p","e","i"},"l":4.358898943540674,"c":{"a":1,"p":2,"i":1,"م":2,"ت":1,"ر":1,"ج":1,"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"I-nvell":{"s":{"n","l","v","-","e","i"},"l":3.0,"c":{"i":1,"-":1,"n":1,"v":1,"e":1,"l":2},"t":"DeeplTranslate"},"ଗଭୀର":{"s":{"ର","ଭ","ଗ","ୀ"},"l":2.0,"c":{"ଗ":1,"ଭ":1,"ୀ":1,"ର":1},"t":"DeeplTranslate"},"Deepl преводач":{"s":{"е","ч","d","в","l","а","д","р","о","п","p","e"},"l":3.872983346207417,"c":{"d":1,"e":2,"p":1,"l":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"а":1,"ч":1},"t":"DeeplTranslate"},"Kaiwhakamaori hohonu":{"s":{"n","h","w","u","r","m","k","a","o","i"},"l":6.855654600401044,"c":{"k":2,"a":4,"i":2,"w":1,"h":3,"m":1,"o":3,"r":1,"n":1,"u":1},"t":"DeeplTranslate"},"Dīļa":{"s":{"ļ","a","ī","d"},"l":2.0,"c":{"d":1,"ī":1,"ļ":1,"a":1},"t":"DeeplTranslate"},"Deepl Tercüman":{"s":{"a","n","ü","d","l","t","r","m","c","p","e"},"l":4.358898943540674,"c":{"d":1,"e":3,"p":1,"l":1,"t":1,"r":1,"c":1,"ü":1,"m":1,"a":1,"n":1},"t":"DeeplTranslate"},"Kumakumakuma":{"s":{"k","a","m","u"},"l":6.0,"c":{"k":3,"u":3,"m":3,"a":3},"t":"DeeplTranslate"},"Nkan se nkan":{"s":{"n","s","k","a","e"},"l":5.0990195135927845,"c":{"n":4,"k":2,"a":2,"s":1,"e":1},"t":"DeeplTranslate"},"Deepl prevaja":{"s":{"d","j","l","v","r","a","p","e"},"l":4.69041575982343,"c":{"d":1,"e":3,"p":2,"l":1,"r":1,"v":1,"a":2,"j":1},"t":"DeeplTranslate"},"Дэндүү":{"s":{"ү","н","э","д"},"l":3.1622776601683795,"c":{"д":2,"э":1,"н":1,"ү":2},"t":"DeeplTranslate"},"Դեպի թարգմանիչ":{"s":{"թ","ա","չ","ն","պ","ե","գ","դ","ի","մ","ր"},"l":4.123105625617661,"c":{"դ":1,"ե":1,"պ":1,"ի":2,"թ":1,"ա":2,"ր":1,"գ":1,"մ":1,"ն":1,"չ":1},"t":"DeeplTranslate"},"Deepl turjubaan":{"s":{"n","b","d","j","l","t","u","r","a","p","e"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":1,"t":1,"u":2,"r":1,"j":1,"b":1,"a":2,"n":1},"t":"DeeplTranslate"},"Deepl Tərcüməçi API":{"s":{"a","ü","d","l","t","ə","r","m","ç","c","p","e","i"},"l":5.0,"c":{"d":1,"e":2,"p":2,"l":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":2,"a":1},"t":"DeeplTranslate"},"Деепл Транслатор АПИ":{"s":{"л","н","и","р","с","а","д","о","п","е","т"},"l":5.830951894845301,"c":{"д":1,"е":2,"п":2,"л":2,"т":2,"р":2,"а":3,"н":1,"с":1,"о":1,"и":1},"t":"DeeplTranslate"},"Syvä":{"s":{"ä","y","s","v"},"l":2.0,"c":{"s":1,"y":1,"v":1,"ä":1},"t":"DeeplTranslate"},"Deepl Tradukisto API":{"s":{"o","d","l","t","u","r","s","k","a","p","e","i"},"l":5.477225575051661,"c":{"d":2,"e":2,"p":2,"l":1,"t":2,"r":1,"a":2,"u":1,"k":1,"i":2,"s":1,"o":1},"t":"DeeplTranslate"},"Chuqur tarjimon API":{"s":{"a","n","h","j","t","p","u","q","r","m","c","o","i"},"l":5.0,"c":{"c":1,"h":1,"u":2,"q":1,"r":2,"t":1,"a":2,"j":1,"i":2,"m":1,"o":1,"n":1,"p":1},"t":"DeeplTranslate"},"Deepl turjubaan API":{"s":{"n","b","d","j","l","t","u","r","a","p","e","i"},"l":5.385164807134504,"c":{"d":1,"e":2,"p":2,"l":1,"t":1,"u":2,"r":1,"j":1,"b":1,"a":3,"n":1,"i":1},"t":"DeeplTranslate"},"Deepl 번역":{"s":{"번","d","l","역","p","e"},"l":3.0,"c":{"d":1,"e":2,"p":1,"l":1,"번":1,"역":1},"t":"DeeplTranslate"},"API DEEPL traduttore":{"s":{"o","d","l","t","u","r","a","p","e","i"},"l":6.164414002968976,"c":{"a":2,"p":2,"i":1,"d":2,"e":3,"l":1,"t":3,"r":2,"u":1,"o":1},"t":"DeeplTranslate"},"Deepl tulkot":{"s":{"o","d","l","t","u","k","p","e"},"l":4.123105625617661,"c":{"d":1,"e":2,"p":1,"l":2,"t":2,"u":1,"k":1,"o":1},"t":"DeeplTranslate"},"ಡೀಪ್ಲ್ ಭಾಷಾಂತರಕಾರ":{"s":{"ಲ","ರ","ಕ","ಡ","್","ಂ","ಭ","ತ","ೀ","ಾ","ಪ","ಷ"},"l":5.0990195135927845,"c":{"ಡ":1,"ೀ":1,"ಪ":1,"್":2,"ಲ":1,"ಭ":1,"ಾ":3,"ಷ":1,"ಂ":1,"ತ":1,"ರ":2,"ಕ":1},"t":"DeeplTranslate"},"Cyfieithu dwfn":{"s":{"n","h","f","d","w","t","u","y","c","e","i"},"l":4.123105625617661,"c":{"c":1,"y":1,"f":2,"i":2,"e":1,"t":1,"h":1,"u":1,"d":1,"w":1,"n":1},"t":"DeeplTranslate"},"Deepl ဘာသာပြန် API":{"s":{"ပ","d","ဘ","l","ာ","ြ","န","သ","a","p","e","i","်"},"l":4.69041575982343,"c":{"d":1,"e":2,"p":2,"l":1,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1,"်":1,"a":1,"i":1},"t":"DeeplTranslate"},"Chuqurcha":{"s":{"a","h","u","q","r","c"},"l":3.872983346207417,"c":{"c":2,"h":2,"u":2,"q":1,"r":1,"a":1},"t":"DeeplTranslate"},"API на преведувач на Deepl":{"s":{"н","ч","п","d","в","l","а","e","д","р","у","a","p","е","i"},"l":6.164414002968976,"c":{"a":1,"p":2,"i":1,"н":2,"а":3,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"ч":1,"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"Tradutor de Deepl":{"s":{"d","t","l","p","u","r","a","o","e"},"l":5.5677643628300215,"c":{"t":2,"r":2,"a":1,"d":3,"u":1,"o":1,"e":3,"p":1,"l":1},"t":"DeeplTranslate"},"Tief übersetzt":{"s":{"b","ü","f","t","r","s","z","e","i"},"l":5.0,"c":{"t":3,"i":1,"e":3,"f":1,"ü":1,"b":1,"r":1,"s":1,"z":1},"t":"DeeplTranslate"},"Deepl翻訳者":{"s":{"d","l","者","翻","訳","p","e"},"l":3.1622776601683795,"c":{"d":1,"e":2,"p":1,"l":1,"翻":1,"訳":1,"者":1},"t":"DeeplTranslate"},"TRLANSERA DEPHL":{"s":{"n","h","d","t","l","r","s","a","p","e"},"l":4.69041575982343,"c":{"t":1,"r":2,"l":2,"a":2,"n":1,"s":1,"e":2,"d":1,"p":1,"h":1},"t":"DeeplTranslate"},"දීප් පරිවර්තකය":{"s":{"ි","ව","ප","ත","ක","ද","්","ය","ී","ර"},"l":4.358898943540674,"c":{"ද":1,"ී":1,"ප":2,"්":2,"ර":2,"ි":1,"ව":1,"ත":1,"ක":1,"ය":1},"t":"DeeplTranslate"},"Deeppl איבערזעצן":{"s":{"י","ב","צ","ע","d","ז","ן","l","א","p","e","ר"},"l":4.58257569495584,"c":{"d":1,"e":2,"p":2,"l":1,"א":1,"י":1,"ב":1,"ע":2,"ר":1,"ז":1,"צ":1,"ן":1},"t":"DeeplTranslate"},"डीपल ट्रान्सलेटर एपीआय":{"s":{"ी","े","ए","प","ड","न","्","ा","ट","र","स","ल","आ","य"},"l":5.656854249492381,"c":{"ड":1,"ी":2,"प":2,"ल":2,"ट":2,"्":2,"र":2,"ा":1,"न":1,"स":1,"े":1,"ए":1,"आ":1,"य":1},"t":"DeeplTranslate"},"Loloto le tranlator ap":{"s":{"n","l","t","p","r","a","o","e"},"l":7.54983443527075,"c":{"l":4,"o":4,"t":3,"e":1,"r":2,"a":3,"n":1,"p":1},"t":"DeeplTranslate"},"מתרגם DEEPL":{"s":{"ת","ג","d","l","p","ם","ר","e","מ"},"l":3.4641016151377544,"c":{"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"ژور ژباړونکی API":{"s":{"ب","و","ک","ی","ړ","ا","ر","ژ","a","p","ن","i"},"l":4.242640687119285,"c":{"ژ":2,"و":2,"ر":1,"ب":1,"ا":1,"ړ":1,"ن":1,"ک":1,"ی":1,"a":1,"p":1,"i":1},"t":"DeeplTranslate"},"Deepepl þýða":{"s":{"þ","ð","d","l","ý","a","p","e"},"l":4.358898943540674,"c":{"d":1,"e":3,"p":2,"l":1,"þ":1,"ý":1,"ð":1,"a":1},"t":"DeeplTranslate"},"Traduttur Deepl":{"s":{"d","t","l","u","r","a","p","e"},"l":5.291502622129181,"c":{"t":3,"r":2,"a":1,"d":2,"u":2,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Sheki":{"s":{"h","s","k","e","i"},"l":2.23606797749979,"c":{"s":1,"h":1,"e":1,"k":1,"i":1},"t":"DeeplTranslate"},"Deepl翻訳者API":{"s":{"a","d","l","者","翻","訳","p","e","i"},"l":3.872983346207417,"c":{"d":1,"e":2,"p":2,"l":1,"翻":1,"訳":1,"者":1,"a":1,"i":1},"t":"DeeplTranslate"},"Deeppl":{"s":{"l","p","e","d"},"l":3.1622776601683795,"c":{"d":1,"e":2,"p":2,"l":1},"t":"DeeplTranslate"},"deepl翻译":{"s":{"d","l","译","翻","p","e"},"l":3.0,"c":{"d":1,"e":2,"p":1,"l":1,"翻":1,"译":1},"t":"DeeplTranslate"},"Deepl Tərcümə":{"s":{"ü","d","l","t","ə","r","m","c","p","e"},"l":4.0,"c":{"d":1,"e":2,"p":1,"l":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1},"t":"DeeplTranslate"},"Глубокий":{"s":{"к","б","л","и","г","й","о","у"},"l":2.8284271247461903,"c":{"г":1,"л":1,"у":1,"б":1,"о":1,"к":1,"и":1,"й":1},"t":"DeeplTranslate"},"Deepl interpres":{"s":{"n","d","l","t","r","s","p","e","i"},"l":5.477225575051661,"c":{"d":1,"e":4,"p":2,"l":1,"i":1,"n":1,"t":1,"r":2,"s":1},"t":"DeeplTranslate"},"Deply":{"s":{"d","l","y","p","e"},"l":2.23606797749979,"c":{"d":1,"e":1,"p":1,"l":1,"y":1},"t":"DeeplTranslate"},"Deepl sụgharịa":{"s":{"g","h","d","l","r","s","ụ","ị","a","p","e"},"l":4.123105625617661,"c":{"d":1,"e":2,"p":1,"l":1,"s":1,"ụ":1,"g":1,"h":1,"a":2,"r":1,"ị":1},"t":"DeeplTranslate"},"Mai fassara Deepl":{"s":{"f","d","l","r","s","m","a","p","e","i"},"l":5.5677643628300215,"c":{"m":1,"a":4,"i":1,"f":1,"s":2,"r":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Mtafsiri wa Deepl":{"s":{"f","d","w","t","l","r","s","m","a","p","e","i"},"l":4.58257569495584,"c":{"m":1,"t":1,"a":2,"f":1,"s":1,"i":2,"r":1,"w":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl Translator API":{"s":{"n","o","d","l","t","r","s","a","p","e","i"},"l":5.830951894845301,"c":{"d":1,"e":2,"p":2,"l":2,"t":2,"r":2,"a":3,"n":1,"s":1,"o":1,"i":1},"t":"DeeplTranslate"},"Deep vertalen":{"s":{"n","d","t","l","v","r","a","p","e"},"l":4.898979485566356,"c":{"d":1,"e":4,"p":1,"v":1,"r":1,"t":1,"a":1,"l":1,"n":1},"t":"DeeplTranslate"},"API ya mtafsiri wa Deepl":{"s":{"f","d","w","t","l","r","y","s","m","a","p","e","i"},"l":6.48074069840786,"c":{"a":4,"p":2,"i":3,"y":1,"m":1,"t":1,"f":1,"s":1,"r":1,"w":1,"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"Deepl-oersetter API":{"s":{"o","d","l","t","r","-","s","a","p","e","i"},"l":6.6332495807108,"c":{"d":1,"e":5,"p":2,"l":1,"-":1,"o":1,"r":2,"s":1,"t":2,"a":1,"i":1},"t":"DeeplTranslate"},"Deepl vertaler API":{"s":{"d","l","t","v","r","a","p","e","i"},"l":6.0,"c":{"d":1,"e":4,"p":2,"l":2,"v":1,"r":2,"t":1,"a":2,"i":1},"t":"DeeplTranslate"},"Deep":{"s":{"p","e","d"},"l":2.449489742783178,"c":{"d":1,"e":2,"p":1},"t":"DeeplTranslate"},"Lucling Omasulira API":{"s":{"a","g","n","l","p","u","r","s","m","c","o","i"},"l":6.244997998398398,"c":{"l":3,"u":2,"c":1,"i":3,"n":1,"g":1,"o":1,"m":1,"a":3,"s":1,"r":1,"p":1},"t":"DeeplTranslate"},"مترجم ديب":{"s":{"ب","ي","م","ر","ت","ج","د"},"l":3.1622776601683795,"c":{"م":2,"ت":1,"ر":1,"ج":1,"د":1,"ي":1,"ب":1},"t":"DeeplTranslate"},"ડીપલ અનુવાદક":{"s":{"ા","ડ","ન","દ","ુ","પ","ક","અ","ી","વ","લ"},"l":3.3166247903554,"c":{"ડ":1,"ી":1,"પ":1,"લ":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"ક":1},"t":"DeeplTranslate"},"Глубокий переводчик":{"s":{"к","б","л","ч","и","в","г","й","д","р","о","у","п","е"},"l":5.0990195135927845,"c":{"г":1,"л":1,"у":1,"б":1,"о":2,"к":2,"и":2,"й":1,"п":1,"е":2,"р":1,"в":1,"д":1,"ч":1},"t":"DeeplTranslate"},"Depl аударма":{"s":{"d","р","l","а","д","м","у","p","e"},"l":4.123105625617661,"c":{"d":1,"e":1,"p":1,"l":1,"а":3,"у":1,"д":1,"р":1,"м":1},"t":"DeeplTranslate"},"DeePl Translate":{"s":{"n","d","l","t","r","s","a","p","e"},"l":5.0990195135927845,"c":{"d":1,"e":3,"p":1,"l":2,"t":2,"r":1,"a":2,"n":1,"s":1},"t":"DeeplTranslate"},"Deepl preložiť":{"s":{"o","d","ť","l","r","ž","p","e","i"},"l":4.795831523312719,"c":{"d":1,"e":3,"p":2,"l":2,"r":1,"o":1,"ž":1,"i":1,"ť":1},"t":"DeeplTranslate"},"Deepl איבערזעצער אַפּי":{"s":{"י","ב","צ","ע","d","ז","פ","l","ּ","ַ","א","p","e","ר"},"l":5.830951894845301,"c":{"d":1,"e":2,"p":1,"l":1,"א":2,"י":2,"ב":1,"ע":3,"ר":2,"ז":1,"צ":1,"ַ":1,"פ":1,"ּ":1},"t":"DeeplTranslate"},"Translate LLGE":{"s":{"g","n","t","l","r","s","a","e"},"l":5.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":3,"e":2,"g":1},"t":"DeeplTranslate"},"Deepl traduit":{"s":{"d","l","t","u","r","a","p","e","i"},"l":4.242640687119285,"c":{"d":2,"e":2,"p":1,"l":1,"t":2,"r":1,"a":1,"u":1,"i":1},"t":"DeeplTranslate"},"deepl translator api":{"s":{"n","o","d","l","t","r","s","a","p","e","i"},"l":5.830951894845301,"c":{"d":1,"e":2,"p":2,"l":2,"t":2,"r":2,"a":3,"n":1,"s":1,"o":1,"i":1},"t":"DeeplTranslate"},"DEEPL Þýðandi API":{"s":{"þ","ð","n","d","l","ý","a","p","e","i"},"l":5.0,"c":{"d":2,"e":2,"p":2,"l":1,"þ":1,"ý":1,"ð":1,"a":2,"n":1,"i":2},"t":"DeeplTranslate"},"Deepl Werger":{"s":{"g","d","w","l","r","p","e"},"l":5.0,"c":{"d":1,"e":4,"p":1,"l":1,"w":1,"r":2,"g":1},"t":"DeeplTranslate"},"Tradutor deepl":{"s":{"d","t","l","p","u","r","a","o","e"},"l":4.58257569495584,"c":{"t":2,"r":2,"a":1,"d":2,"u":1,"o":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"ຢອມຮັບ":{"s":{"ບ","ອ","ຢ","ຮ","ັ","ມ"},"l":2.449489742783178,"c":{"ຢ":1,"ອ":1,"ມ":1,"ຮ":1,"ັ":1,"ບ":1},"t":"DeeplTranslate"},"Deep тарҷумон api":{"s":{"н","i","м","d","о","а","р","ҷ","у","a","p","e","т"},"l":4.358898943540674,"c":{"d":1,"e":2,"p":2,"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"a":1,"i":1},"t":"DeeplTranslate"},"Dəli":{"s":{"ə","l","i","d"},"l":2.0,"c":{"d":1,"ə":1,"l":1,"i":1},"t":"DeeplTranslate"},"Ọrọ sẹyin":{"s":{"n","r","ẹ","y","s","ọ","i"},"l":3.1622776601683795,"c":{"ọ":2,"r":1,"s":1,"ẹ":1,"y":1,"i":1,"n":1},"t":"DeeplTranslate"},"ផាបអិលអឹម":{"s":{"ប","ឹ","ម","ល","ា","អ","ផ","ិ"},"l":3.3166247903554,"c":{"ផ":1,"ា":1,"ប":1,"អ":2,"ិ":1,"ល":1,"ឹ":1,"ម":1},"t":"DeeplTranslate"},"DEEPL თარჯიმანი API":{"s":{"თ","d","ჯ","l","ა","რ","მ","ნ","a","p","e","i","ი"},"l":5.0,"c":{"d":1,"e":2,"p":2,"l":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"a":1,"i":1},"t":"DeeplTranslate"},"ديب":{"s":{"ي","ب","د"},"l":1.7320508075688772,"c":{"د":1,"ي":1,"ب":1},"t":"DeeplTranslate"},"Deepl Humusha":{"s":{"h","d","l","u","s","m","a","p","e"},"l":4.242640687119285,"c":{"d":1,"e":2,"p":1,"l":1,"h":2,"u":2,"m":1,"s":1,"a":1},"t":"DeeplTranslate"},"Deepl איבערזעצער":{"s":{"י","ב","צ","ע","d","ז","l","א","p","e","ר"},"l":5.0,"c":{"d":1,"e":2,"p":1,"l":1,"א":1,"י":1,"ב":1,"ע":3,"ר":2,"ז":1,"צ":1},"t":"DeeplTranslate"},"Tiefes Übersetzer":{"s":{"b","f","ü","t","r","s","z","e","i"},"l":6.48074069840786,"c":{"t":2,"i":1,"e":5,"f":1,"s":2,"ü":1,"b":1,"r":2,"z":1},"t":"DeeplTranslate"},"API cyfieithydd dwfn":{"s":{"a","n","h","f","d","w","t","y","c","p","e","i"},"l":5.830951894845301,"c":{"a":1,"p":1,"i":3,"c":1,"y":2,"f":2,"e":1,"t":1,"h":1,"d":3,"w":1,"n":1},"t":"DeeplTranslate"},"ಡೀಪ್ಲ್ ಅನುವಾದ":{"s":{"ಲ","ವ","ಡ","್","ಅ","ನ","ೀ","ಾ","ಪ","ದ","ು"},"l":3.7416573867739413,"c":{"ಡ":1,"ೀ":1,"ಪ":1,"್":2,"ಲ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1},"t":"DeeplTranslate"},"Deepl μεταφράζεται":{"s":{"α","ρ","d","ι","l","μ","φ","ε","ά","τ","p","e","ζ"},"l":5.0,"c":{"d":1,"e":2,"p":1,"l":1,"μ":1,"ε":2,"τ":2,"α":2,"φ":1,"ρ":1,"ά":1,"ζ":1,"ι":1},"t":"DeeplTranslate"},"Depl":{"s":{"l","p","e","d"},"l":2.0,"c":{"d":1,"e":1,"p":1,"l":1},"t":"DeeplTranslate"},"ترجمة ديب":{"s":{"ب","ة","ي","م","ر","ت","ج","د"},"l":2.8284271247461903,"c":{"ت":1,"ر":1,"ج":1,"م":1,"ة":1,"د":1,"ي":1,"ب":1},"t":"DeeplTranslate"},"API du traducteur profond":{"s":{"n","o","d","f","t","u","c","r","a","p","e","i"},"l":6.928203230275509,"c":{"a":2,"p":2,"i":1,"d":3,"u":3,"t":2,"r":3,"c":1,"e":1,"o":2,"f":1,"n":1},"t":"DeeplTranslate"},"API de tradutor de Deepl":{"s":{"o","d","t","l","u","r","a","p","e","i"},"l":7.211102550927978,"c":{"a":2,"p":2,"i":1,"d":4,"e":4,"t":2,"r":2,"u":1,"o":1,"l":1},"t":"DeeplTranslate"},"I-AP":{"s":{"a","-","p","i"},"l":2.0,"c":{"i":1,"-":1,"a":1,"p":1},"t":"DeeplTranslate"},"Tebileng":{"s":{"g","n","b","t","l","e","i"},"l":3.1622776601683795,"c":{"t":1,"e":2,"b":1,"i":1,"l":1,"n":1,"g":1},"t":"DeeplTranslate"},"ນັກແປພາສາ Deepl":{"s":{"ພ","ນ","ປ","ກ","d","ສ","ັ","l","p","າ","ແ","e"},"l":4.242640687119285,"c":{"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"DEEPL மொழிபெயர்ப்பாளர் API":{"s":{"d","ொ","ெ","l","ம","ர","ய","ப","்","ி","ா","ழ","a","p","e","i","ள"},"l":6.48074069840786,"c":{"d":1,"e":2,"p":2,"l":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ெ":1,"ய":1,"ர":2,"்":3,"ா":1,"ள":1,"a":1,"i":1},"t":"DeeplTranslate"},"ਦੀਪ ਸੂਚੀ API":{"s":{"ੀ","i","p","ੂ","ਪ","a","ਸ","ਚ","ਦ"},"l":3.4641016151377544,"c":{"ਦ":1,"ੀ":2,"ਪ":1,"ਸ":1,"ੂ":1,"ਚ":1,"a":1,"p":1,"i":1},"t":"DeeplTranslate"},"LEDL Translation":{"s":{"n","d","l","t","r","s","a","o","e","i"},"l":5.196152422706632,"c":{"l":3,"e":1,"d":1,"t":2,"r":1,"a":2,"n":2,"s":1,"i":1,"o":1},"t":"DeeplTranslate"},"DEEPL అనువాదకుడు API":{"s":{"d","l","ద","క","డ","ా","న","వ","ు","a","p","e","i","అ"},"l":5.291502622129181,"c":{"d":1,"e":2,"p":2,"l":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1,"a":1,"i":1},"t":"DeeplTranslate"},"Deepl Translator":{"s":{"n","o","d","l","t","r","s","a","p","e"},"l":5.0,"c":{"d":1,"e":2,"p":1,"l":2,"t":2,"r":2,"a":2,"n":1,"s":1,"o":1},"t":"DeeplTranslate"},"Δελτίο":{"s":{"ο","ί","δ","ε","τ","λ"},"l":2.449489742783178,"c":{"δ":1,"ε":1,"λ":1,"τ":1,"ί":1,"ο":1},"t":"DeeplTranslate"},"Deeper DELLy":{"s":{"d","l","r","y","p","e"},"l":5.196152422706632,"c":{"d":2,"e":4,"p":1,"r":1,"l":2,"y":1},"t":"DeeplTranslate"},"گندي ترجمو":{"s":{"و","ي","م","ر","ت","گ","ج","ن","د"},"l":3.0,"c":{"گ":1,"ن":1,"د":1,"ي":1,"ت":1,"ر":1,"ج":1,"م":1,"و":1},"t":"DeeplTranslate"},"Deepl תרגם":{"s":{"ת","ג","d","l","ם","p","e","ר"},"l":3.3166247903554,"c":{"d":1,"e":2,"p":1,"l":1,"ת":1,"ר":1,"ג":1,"ם":1},"t":"DeeplTranslate"},"Deepl traduz":{"s":{"d","l","t","u","r","z","a","p","e"},"l":3.872983346207417,"c":{"d":2,"e":2,"p":1,"l":1,"t":1,"r":1,"a":1,"u":1,"z":1},"t":"DeeplTranslate"},"Demse":{"s":{"s","e","m","d"},"l":2.6457513110645907,"c":{"d":1,"e":2,"m":1,"s":1},"t":"DeeplTranslate"},"ချစ်သူ":{"s":{"စ","ျ","ူ","ခ","သ","်"},"l":2.449489742783178,"c":{"ခ":1,"ျ":1,"စ":1,"်":1,"သ":1,"ူ":1},"t":"DeeplTranslate"},"Deepl tradiktè API":{"s":{"è","d","l","t","r","k","a","p","e","i"},"l":5.291502622129181,"c":{"d":2,"e":2,"p":2,"l":1,"t":2,"r":1,"a":2,"i":2,"k":1,"è":1},"t":"DeeplTranslate"},"Depl Translate":{"s":{"n","d","l","t","r","s","a","p","e"},"l":4.58257569495584,"c":{"d":1,"e":2,"p":1,"l":2,"t":2,"r":1,"a":2,"n":1,"s":1},"t":"DeeplTranslate"},"Depon":{"s":{"n","o","d","p","e"},"l":2.23606797749979,"c":{"d":1,"e":1,"p":1,"o":1,"n":1},"t":"DeeplTranslate"},"ການແປພາສາ Deepl":{"s":{"ພ","ນ","ປ","ກ","d","ສ","l","p","າ","ແ","e"},"l":4.69041575982343,"c":{"ກ":1,"າ":3,"ນ":1,"ແ":1,"ປ":1,"ພ":1,"ສ":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"ડીપલ ભાષાંતર":{"s":{"ા","ડ","પ","ષ","ત","ભ","ર","ં","ી","લ"},"l":3.605551275463989,"c":{"ડ":1,"ી":1,"પ":1,"લ":1,"ભ":1,"ા":2,"ષ":1,"ં":1,"ત":1,"ર":1},"t":"DeeplTranslate"},"Absumus":{"s":{"b","u","s","m","a"},"l":3.3166247903554,"c":{"a":1,"b":1,"s":2,"u":2,"m":1},"t":"DeeplTranslate"},"API de traductor profundo":{"s":{"n","o","d","f","t","u","c","r","a","p","e","i"},"l":6.928203230275509,"c":{"a":2,"p":2,"i":1,"d":3,"e":1,"t":2,"r":3,"u":2,"c":1,"o":3,"f":1,"n":1},"t":"DeeplTranslate"},"Deepl traduce":{"s":{"d","l","t","u","c","r","a","p","e"},"l":4.47213595499958,"c":{"d":2,"e":3,"p":1,"l":1,"t":1,"r":1,"a":1,"u":1,"c":1},"t":"DeeplTranslate"},"API tłumacza deepl":{"s":{"d","t","l","ł","u","c","z","m","a","p","e","i"},"l":5.0990195135927845,"c":{"a":3,"p":2,"i":1,"t":1,"ł":1,"u":1,"m":1,"c":1,"z":1,"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"API перекладача Deepl":{"s":{"к","л","ч","п","d","l","а","e","д","р","a","p","е","i"},"l":5.5677643628300215,"c":{"a":1,"p":2,"i":1,"п":1,"е":2,"р":1,"к":1,"л":1,"а":3,"д":1,"ч":1,"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"ਡੀਪੈਲ ਅਨੁਵਾਦਕ":{"s":{"ੀ","ੈ","ਲ","ਾ","ਕ","ਵ","ੁ","ਪ","ਅ","ਡ","ਨ","ਦ"},"l":3.4641016151377544,"c":{"ਡ":1,"ੀ":1,"ਪ":1,"ੈ":1,"ਲ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਕ":1},"t":"DeeplTranslate"},"Deepl орчуулга":{"s":{"л","ч","d","l","а","г","р","о","у","p","e"},"l":4.123105625617661,"c":{"d":1,"e":2,"p":1,"l":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1},"t":"DeeplTranslate"},"Përkthyes i Deepl":{"s":{"ë","h","d","t","l","r","y","s","k","p","e","i"},"l":4.795831523312719,"c":{"p":2,"ë":1,"r":1,"k":1,"t":1,"h":1,"y":1,"e":3,"s":1,"i":1,"d":1,"l":1},"t":"DeeplTranslate"},"Deeplor turjuma":{"s":{"o","d","j","l","t","u","r","m","a","p","e"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":1,"o":1,"r":2,"t":1,"u":2,"j":1,"m":1,"a":1},"t":"DeeplTranslate"},"深色":{"s":{"深","色"},"l":1.4142135623730951,"c":{"深":1,"色":1},"t":"DeeplTranslate"},"Dịch giả DEEPL":{"s":{"g","h","d","l","ả","ị","c","p","e","i"},"l":4.0,"c":{"d":2,"ị":1,"c":1,"h":1,"g":1,"i":1,"ả":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"API -ul traducătorului Deepl":{"s":{"o","d","l","t","ă","u","c","r","-","a","p","e","i"},"l":7.54983443527075,"c":{"a":2,"p":2,"i":2,"-":1,"u":4,"l":3,"t":2,"r":2,"d":2,"c":1,"ă":1,"o":1,"e":2},"t":"DeeplTranslate"},"Deepl":{"s":{"l","p","e","d"},"l":2.6457513110645907,"c":{"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Μεταφραστής Deepl":{"s":{"α","ρ","ή","ς","d","l","p","μ","ε","σ","τ","φ","e"},"l":4.69041575982343,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"डीप्ल अनुवादक":{"s":{"ी","प","ड","ु","न","्","अ","द","ा","ल","क","व"},"l":3.4641016151377544,"c":{"ड":1,"ी":1,"प":1,"्":1,"ल":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"DeeplTranslate"},"Deepl 번역기":{"s":{"번","d","기","l","역","p","e"},"l":3.1622776601683795,"c":{"d":1,"e":2,"p":1,"l":1,"번":1,"역":1,"기":1},"t":"DeeplTranslate"},"Deepl umhumushi api":{"s":{"h","d","l","u","s","m","a","p","e","i"},"l":5.744562646538029,"c":{"d":1,"e":2,"p":2,"l":1,"u":3,"m":2,"h":2,"s":1,"i":2,"a":1},"t":"DeeplTranslate"},"Deepl përkthen":{"s":{"ë","n","h","d","l","t","r","k","p","e"},"l":4.58257569495584,"c":{"d":1,"e":3,"p":2,"l":1,"ë":1,"r":1,"k":1,"t":1,"h":1,"n":1},"t":"DeeplTranslate"},"Deepl Перевод":{"s":{"е","d","в","l","д","р","о","п","p","e"},"l":4.0,"c":{"d":1,"e":2,"p":1,"l":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1},"t":"DeeplTranslate"},"اهوقي":{"s":{"و","ق","ي","ا","ه"},"l":2.23606797749979,"c":{"ا":1,"ه":1,"و":1,"ق":1,"ي":1},"t":"DeeplTranslate"},"Deepl மொழிபெயர்க்கவும்":{"s":{"வ","d","ொ","ெ","ு","l","ம","ர","ய","க","ப","்","ி","ழ","p","e"},"l":5.744562646538029,"c":{"d":1,"e":2,"p":1,"l":1,"ம":2,"ொ":1,"ழ":1,"ி":1,"ப":1,"ெ":1,"ய":1,"ர":1,"்":3,"க":2,"வ":1,"ு":1},"t":"DeeplTranslate"},"Onye ntụgharị DEEPP":{"s":{"g","n","h","d","t","p","r","y","ụ","ị","a","o","e"},"l":5.196152422706632,"c":{"o":1,"n":2,"y":1,"e":3,"t":1,"ụ":1,"g":1,"h":1,"a":1,"r":1,"ị":1,"d":1,"p":2},"t":"DeeplTranslate"},"Tief":{"s":{"f","t","e","i"},"l":2.0,"c":{"t":1,"i":1,"e":1,"f":1},"t":"DeeplTranslate"},"ጥልቅ ትርጉም ትርጉም":{"s":{"ም","ል","ቅ","ጥ","ጉ","ር","ት"},"l":4.358898943540674,"c":{"ጥ":1,"ል":1,"ቅ":1,"ት":2,"ር":2,"ጉ":2,"ም":2},"t":"DeeplTranslate"},"ディープ":{"s":{"ィ","ー","プ","デ"},"l":2.0,"c":{"デ":1,"ィ":1,"ー":1,"プ":1},"t":"DeeplTranslate"},"දීප්ලය පරිවර්තනය":{"s":{"ි","න","ව","ප","ත","ල","ද","්","ය","ී","ර"},"l":4.795831523312719,"c":{"ද":1,"ී":1,"ප":2,"්":2,"ල":1,"ය":2,"ර":2,"ි":1,"ව":1,"ත":1,"න":1},"t":"DeeplTranslate"},"Deepl แปล":{"s":{"ล","d","แ","l","ป","p","e"},"l":3.1622776601683795,"c":{"d":1,"e":2,"p":1,"l":1,"แ":1,"ป":1,"ล":1},"t":"DeeplTranslate"},"Traductor profundo":{"s":{"n","f","d","t","p","u","c","r","a","o"},"l":5.916079783099616,"c":{"t":2,"r":3,"a":1,"d":2,"u":2,"c":1,"o":3,"p":1,"f":1,"n":1},"t":"DeeplTranslate"},"Ал":{"s":{"а","л"},"l":1.4142135623730951,"c":{"а":1,"л":1},"t":"DeeplTranslate"},"Deep Translate":{"s":{"n","d","t","l","r","s","a","p","e"},"l":4.795831523312719,"c":{"d":1,"e":3,"p":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1},"t":"DeeplTranslate"},"API Translator":{"s":{"n","o","t","l","r","s","a","p","i"},"l":4.795831523312719,"c":{"a":3,"p":1,"i":1,"t":2,"r":2,"n":1,"s":1,"l":1,"o":1},"t":"DeeplTranslate"},"ડિપલ":{"s":{"ડ","િ","પ","લ"},"l":2.0,"c":{"ડ":1,"િ":1,"પ":1,"લ":1},"t":"DeeplTranslate"},"ڈی ای پی ایل":{"s":{"ڈ","ی","ل","ا","پ"},"l":4.795831523312719,"c":{"ڈ":1,"ی":4,"ا":2,"پ":1,"ل":1},"t":"DeeplTranslate"},"Deepl prevoditelj":{"s":{"o","d","j","l","t","v","r","p","e","i"},"l":5.830951894845301,"c":{"d":2,"e":4,"p":2,"l":2,"r":1,"v":1,"o":1,"i":1,"t":1,"j":1},"t":"DeeplTranslate"},"Deepl орчуулагч API":{"s":{"л","ч","d","l","а","г","р","о","у","a","p","e","i"},"l":5.0,"c":{"d":1,"e":2,"p":2,"l":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"a":1,"i":1},"t":"DeeplTranslate"},"ਦੀਪੈਲ":{"s":{"ੀ","ੈ","ਲ","ਪ","ਦ"},"l":2.23606797749979,"c":{"ਦ":1,"ੀ":1,"ਪ":1,"ੈ":1,"ਲ":1},"t":"DeeplTranslate"},"Traducteur profond":{"s":{"n","o","d","f","t","u","c","r","a","p","e"},"l":5.5677643628300215,"c":{"t":2,"r":3,"a":1,"d":2,"u":2,"c":1,"e":1,"p":1,"o":2,"f":1,"n":1},"t":"DeeplTranslate"},"Deepl翻译器":{"s":{"d","l","译","翻","器","p","e"},"l":3.1622776601683795,"c":{"d":1,"e":2,"p":1,"l":1,"翻":1,"译":1,"器":1},"t":"DeeplTranslate"},"DEEPL Translator API":{"s":{"n","o","d","l","t","r","s","a","p","e","i"},"l":5.830951894845301,"c":{"d":1,"e":2,"p":2,"l":2,"t":2,"r":2,"a":3,"n":1,"s":1,"o":1,"i":1},"t":"DeeplTranslate"},"ଗଭୀର ଅନୁବାଦ |":{"s":{"ୁ","ା","|","ଦ","ବ","ନ","ର","ଅ","ଭ","ଗ","ୀ"},"l":3.3166247903554,"c":{"ଗ":1,"ଭ":1,"ୀ":1,"ର":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"|":1},"t":"DeeplTranslate"},"டீப்ல் மொழிபெயர்ப்பாளர்":{"s":{"ட","ல","ெ","ொ","ம","ர","ய","ீ","ப","்","ி","ா","ழ","ள"},"l":7.483314773547883,"c":{"ட":1,"ீ":1,"ப":4,"்":5,"ல":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ெ":1,"ய":1,"ர":2,"ா":1,"ள":1},"t":"DeeplTranslate"},"Deep Fassara":{"s":{"f","d","r","s","a","p","e"},"l":4.58257569495584,"c":{"d":1,"e":2,"p":1,"f":1,"a":3,"s":2,"r":1},"t":"DeeplTranslate"},"DEEPL TRANSLATER API":{"s":{"n","d","l","t","r","s","a","p","e","i"},"l":6.164414002968976,"c":{"d":1,"e":3,"p":2,"l":2,"t":2,"r":2,"a":3,"n":1,"s":1,"i":1},"t":"DeeplTranslate"},"Deepl tulkotājs":{"s":{"o","d","j","l","t","u","s","k","p","e","ā"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":2,"t":2,"u":1,"k":1,"o":1,"ā":1,"j":1,"s":1},"t":"DeeplTranslate"},"डीएप्ल":{"s":{"ी","ए","प","ड","्","ल"},"l":2.449489742783178,"c":{"ड":1,"ी":1,"ए":1,"प":1,"्":1,"ल":1},"t":"DeeplTranslate"},"డీప్ల్ అనువదించండి":{"s":{"ల","ీ","్","డ","ద","ం","చ","న","ి","వ","ు","ప","అ"},"l":5.0,"c":{"డ":2,"ీ":1,"ప":1,"్":2,"ల":1,"అ":1,"న":1,"ు":1,"వ":1,"ద":1,"ి":2,"ం":2,"చ":1},"t":"DeeplTranslate"},"ଗଭୀର ଅନୁବାଦକ":{"s":{"ୁ","ା","ଦ","ବ","ନ","ର","ଅ","ଭ","ଗ","ୀ","କ"},"l":3.3166247903554,"c":{"ଗ":1,"ଭ":1,"ୀ":1,"ର":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1},"t":"DeeplTranslate"},"Phetolelo ea Translit Api":{"s":{"n","h","o","t","l","r","s","a","p","e","i"},"l":7.211102550927978,"c":{"p":2,"h":1,"e":3,"t":3,"o":2,"l":3,"a":3,"r":1,"n":1,"s":1,"i":2},"t":"DeeplTranslate"},"„Deepl“ vertėjo API":{"s":{"„","o","d","“","j","l","t","v","r","a","p","e","i","ė"},"l":5.0,"c":{"„":1,"d":1,"e":3,"p":2,"l":1,"“":1,"v":1,"r":1,"t":1,"ė":1,"j":1,"o":1,"a":1,"i":1},"t":"DeeplTranslate"},"Deepl prevodilac":{"s":{"o","d","l","v","c","r","a","p","e","i"},"l":5.196152422706632,"c":{"d":2,"e":3,"p":2,"l":2,"r":1,"v":1,"o":1,"i":1,"a":1,"c":1},"t":"DeeplTranslate"},"Deepl വിവർത്തനം":{"s":{"ി","ത","d","വ","l","ർ","്","ം","p","e","ന"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1},"t":"DeeplTranslate"},"Deepllate":{"s":{"d","l","t","a","p","e"},"l":4.123105625617661,"c":{"d":1,"e":3,"p":1,"l":2,"a":1,"t":1},"t":"DeeplTranslate"},"Deepl fordító":{"s":{"ó","f","d","o","l","t","í","r","p","e"},"l":4.0,"c":{"d":2,"e":2,"p":1,"l":1,"f":1,"o":1,"r":1,"í":1,"t":1,"ó":1},"t":"DeeplTranslate"},"ژوره ژباړونکی":{"s":{"ب","و","ک","ی","ړ","ا","ر","ژ","ه","ن"},"l":4.0,"c":{"ژ":2,"و":2,"ر":1,"ه":1,"ب":1,"ا":1,"ړ":1,"ن":1,"ک":1,"ی":1},"t":"DeeplTranslate"},"Tafsiri ya Deepl":{"s":{"f","d","t","l","r","y","s","a","p","e","i"},"l":4.47213595499958,"c":{"t":1,"a":2,"f":1,"s":1,"i":2,"r":1,"y":1,"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl tərcüməçisi":{"s":{"ü","d","l","t","ə","r","s","m","ç","c","p","e","i"},"l":4.69041575982343,"c":{"d":1,"e":2,"p":1,"l":1,"t":1,"ə":2,"r":1,"c":1,"ü":1,"m":1,"ç":1,"i":2,"s":1},"t":"DeeplTranslate"},"Sefel translatal Api":{"s":{"n","f","l","t","r","s","a","p","e","i"},"l":6.48074069840786,"c":{"s":2,"e":2,"f":1,"l":3,"t":2,"r":1,"a":4,"n":1,"p":1,"i":1},"t":"DeeplTranslate"},"ডিপল":{"s":{"ড","ি","ল","প"},"l":2.0,"c":{"ড":1,"ি":1,"প":1,"ল":1},"t":"DeeplTranslate"},"Deepl vertaler":{"s":{"d","l","t","v","r","a","p","e"},"l":5.385164807134504,"c":{"d":1,"e":4,"p":1,"l":2,"v":1,"r":2,"t":1,"a":1},"t":"DeeplTranslate"},"ଗଭୀର ଅନୁବାଦକ API |":{"s":{"ୁ","ା","|","ଦ","ବ","ନ","ର","ଅ","ଭ","ଗ","ୀ","କ","a","p","i"},"l":3.872983346207417,"c":{"ଗ":1,"ଭ":1,"ୀ":1,"ର":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"a":1,"p":1,"i":1,"|":1},"t":"DeeplTranslate"},"Mpandika teny lalina":{"s":{"n","d","t","l","y","m","k","a","p","e","i"},"l":6.324555320336759,"c":{"m":1,"p":1,"a":4,"n":3,"d":1,"i":2,"k":1,"t":1,"e":1,"y":1,"l":2},"t":"DeeplTranslate"},"ডিপল অনুবাদক":{"s":{"অ","ি","ু","ন","দ","ল","ক","ব","া","ড","প"},"l":3.3166247903554,"c":{"ড":1,"ি":1,"প":1,"ল":1,"অ":1,"ন":1,"ু":1,"ব":1,"া":1,"দ":1,"ক":1},"t":"DeeplTranslate"},"Mofetoleli oa Durtal":{"s":{"f","d","t","l","u","r","m","a","o","e","i"},"l":6.0,"c":{"m":1,"o":3,"f":1,"e":2,"t":2,"l":3,"i":1,"a":2,"d":1,"u":1,"r":1},"t":"DeeplTranslate"},"Profundo":{"s":{"n","f","o","d","u","r","p"},"l":3.1622776601683795,"c":{"p":1,"r":1,"o":2,"f":1,"u":1,"n":1,"d":1},"t":"DeeplTranslate"},"„Deepl“ vertėjas":{"s":{"„","d","“","j","l","t","v","r","s","a","p","e","ė"},"l":4.58257569495584,"c":{"„":1,"d":1,"e":3,"p":1,"l":1,"“":1,"v":1,"r":1,"t":1,"ė":1,"j":1,"a":1,"s":1},"t":"DeeplTranslate"},"DEEPL prevodilac API":{"s":{"o","d","l","v","c","r","a","p","e","i"},"l":6.164414002968976,"c":{"d":2,"e":3,"p":3,"l":2,"r":1,"v":1,"o":1,"i":2,"a":2,"c":1},"t":"DeeplTranslate"},"DEEPL":{"s":{"l","p","e","d"},"l":2.6457513110645907,"c":{"d":1,"e":2,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl വിവർത്തകൻ":{"s":{"ൻ","ി","ത","d","വ","l","ർ","്","ക","p","e"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ക":1,"ൻ":1},"t":"DeeplTranslate"},"Loloto le faaliliu":{"s":{"f","l","t","u","a","o","e","i"},"l":6.782329983125268,"c":{"l":5,"o":3,"t":1,"e":1,"f":1,"a":2,"i":2,"u":1},"t":"DeeplTranslate"},"deepl翻訳":{"s":{"d","l","翻","訳","p","e"},"l":3.0,"c":{"d":1,"e":2,"p":1,"l":1,"翻":1,"訳":1},"t":"DeeplTranslate"},"Api aistritheoir Deepl":{"s":{"h","o","d","t","l","r","s","a","p","e","i"},"l":6.782329983125268,"c":{"a":2,"p":2,"i":4,"s":1,"t":2,"r":2,"h":1,"e":3,"o":1,"d":1,"l":1},"t":"DeeplTranslate"},"Deepl vertaal":{"s":{"d","l","t","v","r","a","p","e"},"l":4.69041575982343,"c":{"d":1,"e":3,"p":1,"l":2,"v":1,"r":1,"t":1,"a":2},"t":"DeeplTranslate"},"Deepl Çeviri":{"s":{"d","l","v","r","ç","p","e","i"},"l":4.358898943540674,"c":{"d":1,"e":3,"p":1,"l":1,"ç":1,"v":1,"i":2,"r":1},"t":"DeeplTranslate"},"Translate translate":{"s":{"n","t","l","r","s","a","e"},"l":7.211102550927978,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2},"t":"TranslateComTranslate"},"व्याकालिक":{"s":{"ि","्","ा","ल","क","व","य"},"l":3.605551275463989,"c":{"व":1,"्":1,"य":1,"ा":2,"क":2,"ल":1,"ि":1},"t":"DeeplTranslate"},"Deepl អ្នកបកប្រែ":{"s":{"ប","រ","្","d","ែ","ក","l","អ","p","e","ន"},"l":4.795831523312719,"c":{"d":1,"e":2,"p":1,"l":1,"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1},"t":"DeeplTranslate"},"Deepl översätta":{"s":{"d","l","t","v","ö","r","s","ä","a","p","e"},"l":4.69041575982343,"c":{"d":1,"e":3,"p":1,"l":1,"ö":1,"v":1,"r":1,"s":1,"ä":1,"t":2,"a":1},"t":"DeeplTranslate"},"API на Deepl Translator":{"s":{"н","n","o","d","l","t","а","r","s","a","p","e","i"},"l":6.0,"c":{"a":3,"p":2,"i":1,"н":1,"а":1,"d":1,"e":2,"l":2,"t":2,"r":2,"n":1,"s":1,"o":1},"t":"DeeplTranslate"},"Cyfieithydd Deepl":{"s":{"h","f","d","t","l","y","c","p","e","i"},"l":5.656854249492381,"c":{"c":1,"y":2,"f":1,"i":2,"e":3,"t":1,"h":1,"d":3,"p":1,"l":1},"t":"DeeplTranslate"},"Syvän kääntäjä":{"s":{"n","j","t","v","ä","y","s","k"},"l":5.916079783099616,"c":{"s":1,"y":1,"v":1,"ä":5,"n":2,"k":1,"t":1,"j":1},"t":"DeeplTranslate"},"డీప్ల్ అనువాదకుడు":{"s":{"ల","ీ","్","డ","ద","ా","క","న","వ","ు","ప","అ"},"l":5.0990195135927845,"c":{"డ":2,"ీ":1,"ప":1,"్":2,"ల":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1},"t":"DeeplTranslate"},"ডিপল অনুবাদ":{"s":{"অ","ি","ু","ন","দ","ল","ব","া","ড","প"},"l":3.1622776601683795,"c":{"ড":1,"ি":1,"প":1,"ল":1,"অ":1,"ন":1,"ু":1,"ব":1,"া":1,"দ":1},"t":"DeeplTranslate"},"دنباله دار":{"s":{"ب","ل","ا","ر","ه","ن","د"},"l":3.605551275463989,"c":{"د":2,"ن":1,"ب":1,"ا":2,"ل":1,"ه":1,"ر":1},"t":"DeeplTranslate"},"Тарҷумони Deeple":{"s":{"н","м","d","и","о","l","а","р","ҷ","у","p","e","т"},"l":4.58257569495584,"c":{"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"и":1,"d":1,"e":3,"p":1,"l":1},"t":"DeeplTranslate"},"Deepation onitumọ API":{"s":{"n","o","d","t","u","ọ","m","a","p","e","i"},"l":6.082762530298219,"c":{"d":1,"e":2,"p":2,"a":2,"t":2,"i":3,"o":2,"n":2,"u":1,"m":1,"ọ":1},"t":"DeeplTranslate"},"Sügav":{"s":{"g","ü","v","s","a"},"l":2.23606797749979,"c":{"s":1,"ü":1,"g":1,"a":1,"v":1},"t":"DeeplTranslate"},"Tolu faaliliu upu":{"s":{"f","t","l","p","u","a","o","i"},"l":6.082762530298219,"c":{"t":1,"o":1,"l":3,"u":4,"f":1,"a":2,"i":2,"p":1},"t":"DeeplTranslate"},"Deep បកប្រែ":{"s":{"ប","រ","្","d","ែ","ក","p","e"},"l":3.7416573867739413,"c":{"d":1,"e":2,"p":1,"ប":2,"ក":1,"្":1,"រ":1,"ែ":1},"t":"DeeplTranslate"},"Дыеп":{"s":{"ы","п","е","д"},"l":2.0,"c":{"д":1,"ы":1,"е":1,"п":1},"t":"DeeplTranslate"},"Deepl превод":{"s":{"е","d","в","l","д","р","о","п","p","e"},"l":3.605551275463989,"c":{"d":1,"e":2,"p":1,"l":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1},"t":"DeeplTranslate"},"Deepl oversett":{"s":{"o","d","l","t","v","r","s","p","e"},"l":5.196152422706632,"c":{"d":1,"e":4,"p":1,"l":1,"o":1,"v":1,"r":1,"s":1,"t":2},"t":"DeeplTranslate"},"Deepl ဘာသာပြန်သူ":{"s":{"ူ","ပ","d","ဘ","l","ာ","ြ","န","သ","p","e","်"},"l":4.58257569495584,"c":{"d":1,"e":2,"p":1,"l":1,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1},"t":"DeeplTranslate"},"Translate de Deepl":{"s":{"n","d","t","l","r","s","a","p","e"},"l":6.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":2,"e":4,"d":2,"p":1},"t":"DeeplTranslate"},"DEEPL API Penerjemah":{"s":{"n","h","d","j","l","r","m","a","p","e","i"},"l":6.782329983125268,"c":{"d":1,"e":5,"p":3,"l":1,"a":2,"i":1,"n":1,"r":1,"j":1,"m":1,"h":1},"t":"DeeplTranslate"},"Kûr":{"s":{"k","r","û"},"l":1.7320508075688772,"c":{"k":1,"û":1,"r":1},"t":"DeeplTranslate"},"Deepl tõlk":{"s":{"d","l","t","k","õ","p","e"},"l":3.605551275463989,"c":{"d":1,"e":2,"p":1,"l":2,"t":1,"õ":1,"k":1},"t":"DeeplTranslate"},"Deepl Transporor API":{"s":{"n","o","d","l","t","r","s","a","p","e","i"},"l":6.0,"c":{"d":1,"e":2,"p":3,"l":1,"t":1,"r":3,"a":2,"n":1,"s":1,"o":2,"i":1},"t":"DeeplTranslate"},"Deel":{"s":{"l","e","d"},"l":2.449489742783178,"c":{"d":1,"e":2,"l":1},"t":"DeeplTranslate"},"Deepl орчуулагч":{"s":{"л","ч","d","l","а","г","р","о","у","p","e"},"l":4.47213595499958,"c":{"d":1,"e":2,"p":1,"l":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1},"t":"DeeplTranslate"},"Deepl Translate":{"s":{"n","d","l","t","r","s","a","p","e"},"l":5.0990195135927845,"c":{"d":1,"e":3,"p":1,"l":2,"t":2,"r":1,"a":2,"n":1,"s":1},"t":"DeeplTranslate"},"Chuqur tarjimon":{"s":{"a","n","h","j","t","u","q","r","m","c","o","i"},"l":4.242640687119285,"c":{"c":1,"h":1,"u":2,"q":1,"r":2,"t":1,"a":1,"j":1,"i":1,"m":1,"o":1,"n":1},"t":"DeeplTranslate"},"Penerjemah DEEPL":{"s":{"n","h","j","d","l","r","m","a","p","e"},"l":6.082762530298219,"c":{"p":2,"e":5,"n":1,"r":1,"j":1,"m":1,"a":1,"h":1,"d":1,"l":1},"t":"DeeplTranslate"},"Deepl тарҷума":{"s":{"м","d","l","а","р","ҷ","у","p","e","т"},"l":4.0,"c":{"d":1,"e":2,"p":1,"l":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1},"t":"DeeplTranslate"},"डीप्ल":{"s":{"ी","प","ड","्","ल"},"l":2.23606797749979,"c":{"ड":1,"ी":1,"प":1,"्":1,"ल":1},"t":"DeeplTranslate"},"Loloto":{"s":{"l","o","t"},"l":3.7416573867739413,"c":{"l":2,"o":3,"t":1},"t":"DeeplTranslate"},"Depl Iwwersetzer":{"s":{"d","w","l","t","r","s","z","p","e","i"},"l":5.5677643628300215,"c":{"d":1,"e":4,"p":1,"l":1,"i":1,"w":2,"r":2,"s":1,"t":1,"z":1},"t":"DeeplTranslate"},"गहिरो अनुवाद":{"s":{"ह","ग","ु","ि","न","अ","द","व","र","ा","ो"},"l":3.3166247903554,"c":{"ग":1,"ह":1,"ि":1,"र":1,"ो":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"DeeplTranslate"},"Eadar-theangachadh domhainn eadar-theangachadh":{"s":{"g","n","h","d","t","c","r","-","m","a","o","e","i"},"l":15.811388300841896,"c":{"e":4,"a":11,"d":5,"r":2,"-":2,"t":2,"h":7,"n":4,"g":2,"c":2,"o":1,"m":1,"i":1},"t":"DeeplTranslate"},"Deepl dịch":{"s":{"h","d","l","ị","c","p","e"},"l":3.605551275463989,"c":{"d":2,"e":2,"p":1,"l":1,"ị":1,"c":1,"h":1},"t":"DeeplTranslate"},"Deepl tõlkija API":{"s":{"d","j","l","t","k","õ","a","p","e","i"},"l":5.0,"c":{"d":1,"e":2,"p":2,"l":2,"t":1,"õ":1,"k":1,"i":2,"j":1,"a":2},"t":"DeeplTranslate"},"Mély":{"s":{"y","é","l","m"},"l":2.0,"c":{"m":1,"é":1,"l":1,"y":1},"t":"DeeplTranslate"},"Isigaxa senda lezembuzane":{"s":{"g","n","b","d","l","u","s","z","m","a","e","i","x"},"l":7.416198487095663,"c":{"i":2,"s":2,"g":1,"a":4,"x":1,"e":4,"n":2,"d":1,"l":1,"z":2,"m":1,"b":1,"u":1},"t":"DeeplTranslate"},"Umhumushi we-Deepl":{"s":{"h","d","w","l","u","-","s","m","p","e","i"},"l":5.744562646538029,"c":{"u":3,"m":2,"h":2,"s":1,"i":1,"w":1,"e":3,"-":1,"d":1,"p":1,"l":1},"t":"DeeplTranslate"},"ጥልቀት":{"s":{"ቀ","ጥ","ት","ል"},"l":2.0,"c":{"ጥ":1,"ል":1,"ቀ":1,"ት":1},"t":"DeeplTranslate"},"Depl аудармашы":{"s":{"d","ш","р","l","ы","а","д","м","у","p","e"},"l":4.358898943540674,"c":{"d":1,"e":1,"p":1,"l":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1},"t":"DeeplTranslate"},"Depl Iwwersetzer API":{"s":{"d","w","l","t","r","s","z","a","p","e","i"},"l":6.164414002968976,"c":{"d":1,"e":4,"p":2,"l":1,"i":2,"w":2,"r":2,"s":1,"t":1,"z":1,"a":1},"t":"DeeplTranslate"},"Onitumọ dieplu":{"s":{"n","d","t","l","p","u","ọ","m","o","e","i"},"l":4.123105625617661,"c":{"o":1,"n":1,"i":2,"t":1,"u":2,"m":1,"ọ":1,"d":1,"e":1,"p":1,"l":1},"t":"DeeplTranslate"},"Deepl-oersetter":{"s":{"o","d","l","t","r","-","s","p","e"},"l":6.244997998398398,"c":{"d":1,"e":5,"p":1,"l":1,"-":1,"o":1,"r":2,"s":1,"t":2},"t":"DeeplTranslate"},"Promt":{"s":{"o","t","r","m","p"},"l":2.23606797749979,"c":{"p":1,"r":1,"o":1,"m":1,"t":1},"t":"DeeplTranslate"},"Deepl -kääntäjän sovellusliittymä":{"s":{"n","o","d","j","l","t","v","u","-","ä","s","y","m","k","p","e","i"},"l":9.0,"c":{"d":1,"e":3,"p":1,"l":4,"-":1,"k":1,"ä":5,"n":2,"t":3,"j":1,"s":2,"o":1,"v":1,"u":1,"i":2,"y":1,"m":1},"t":"DeeplTranslate"},"Deepl თარგმანი":{"s":{"თ","d","l","ა","რ","მ","ნ","გ","p","e","ი"},"l":4.123105625617661,"c":{"d":1,"e":2,"p":1,"l":1,"თ":1,"ა":2,"რ":1,"გ":1,"მ":1,"ნ":1,"ი":1},"t":"DeeplTranslate"},"Prekladateľ Deepl":{"s":{"d","ľ","l","t","r","k","a","p","e"},"l":6.0,"c":{"p":2,"r":1,"e":4,"k":1,"l":2,"a":2,"d":2,"t":1,"ľ":1},"t":"DeeplTranslate"},"Mai fassara Deepl API":{"s":{"f","d","l","r","s","m","a","p","e","i"},"l":6.782329983125268,"c":{"m":1,"a":5,"i":2,"f":1,"s":2,"r":1,"d":1,"e":2,"p":2,"l":1},"t":"DeeplTranslate"},"ගැඹුර":{"s":{"ග","ැ","ඹ","ු","ර"},"l":2.23606797749979,"c":{"ග":1,"ැ":1,"ඹ":1,"ු":1,"ර":1},"t":"DeeplTranslate"},"ጥልቅ ተርጓሚ ኤፒአይ":{"s":{"ል","ይ","ሚ","አ","ቅ","ፒ","ተ","ኤ","ጥ","ር","ጓ"},"l":3.3166247903554,"c":{"ጥ":1,"ል":1,"ቅ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"DeeplTranslate"},"Миний дурсамж":{"s":{"ж","н","и","р","с","а","й","д","м","у"},"l":4.0,"c":{"м":2,"и":2,"н":1,"й":1,"д":1,"у":1,"р":1,"с":1,"а":1,"ж":1},"t":"MyMemoryTranslate"},"میممري ژباړه":{"s":{"ب","ی","ي","ړ","ا","م","ر","ژ","ه"},"l":4.123105625617661,"c":{"م":3,"ی":1,"ر":1,"ي":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1},"t":"MyMemoryTranslate"},"MyMemory 번역":{"s":{"번","역","r","y","m","o","e"},"l":4.242640687119285,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"번":1,"역":1},"t":"MyMemoryTranslate"},"Mymemory översätta":{"s":{"t","v","r","y","ö","m","s","ä","a","o","e"},"l":5.5677643628300215,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"ö":1,"v":1,"s":1,"ä":1,"t":2,"a":1},"t":"MyMemoryTranslate"},"ນັກແປພາສາ MYMEMORY API":{"s":{"ພ","ນ","ປ","ກ","o","ສ","ັ","p","າ","r","y","m","a","ແ","e","i"},"l":5.477225575051661,"c":{"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"m":3,"y":2,"e":1,"o":1,"r":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Përkthyesi i MyMemory":{"s":{"ë","h","o","t","r","y","s","m","k","p","e","i"},"l":6.082762530298219,"c":{"p":1,"ë":1,"r":2,"k":1,"t":1,"h":1,"y":3,"e":2,"s":1,"i":2,"m":3,"o":1},"t":"MyMemoryTranslate"},"MyMemory თარჯიმანი API":{"s":{"თ","ჯ","ა","რ","მ","p","r","y","ნ","m","a","o","e","i","ი"},"l":5.656854249492381,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Bộ nhớ của tôi":{"s":{"a","n","b","h","ộ","ủ","t","ớ","ô","c","i"},"l":3.3166247903554,"c":{"b":1,"ộ":1,"n":1,"h":1,"ớ":1,"c":1,"ủ":1,"a":1,"t":1,"ô":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory અનુવાદક":{"s":{"ા","ન","ુ","ક","r","y","અ","m","વ","દ","o","e"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"અ":1,"ન":1,"ુ":1,"વ":1,"ા":1,"દ":1,"ક":1},"t":"MyMemoryTranslate"},"මගේ මතකය":{"s":{"ම","ත","ේ","ක","ය","ග"},"l":3.0,"c":{"ම":2,"ග":1,"ේ":1,"ත":1,"ක":1,"ය":1},"t":"MyMemoryTranslate"},"MyMemory Dudziro":{"s":{"d","u","r","y","z","m","o","e","i"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":1,"o":2,"r":2,"d":2,"u":1,"z":1,"i":1},"t":"MyMemoryTranslate"},"నా జ్ఞాపకశక్తి":{"s":{"ఞ","్","క","ా","జ","ి","త","ప","న","శ"},"l":4.358898943540674,"c":{"న":1,"ా":2,"జ":1,"్":2,"ఞ":1,"ప":1,"క":2,"శ":1,"త":1,"ి":1},"t":"MyMemoryTranslate"},"Mimo":{"s":{"o","i","m"},"l":2.449489742783178,"c":{"m":2,"i":1,"o":1},"t":"MyMemoryTranslate"},"Mymemory preklad":{"s":{"d","l","p","r","y","m","k","a","o","e"},"l":5.196152422706632,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"p":1,"k":1,"l":1,"a":1,"d":1},"t":"MyMemoryTranslate"},"Muistini":{"s":{"n","t","u","s","m","i"},"l":3.7416573867739413,"c":{"m":1,"u":1,"i":3,"s":1,"t":1,"n":1},"t":"MyMemoryTranslate"},"I-MyMememory API":{"s":{"p","r","y","-","m","a","o","e","i"},"l":5.744562646538029,"c":{"i":2,"-":1,"m":4,"y":2,"e":2,"o":1,"r":1,"a":1,"p":1},"t":"MyMemoryTranslate"},"Мімея":{"s":{"м","я","і","е"},"l":2.6457513110645907,"c":{"м":2,"і":1,"е":1,"я":1},"t":"MyMemoryTranslate"},"អ្នកបកប្រែ IPI អ្នកបកប្រែ MyMemory":{"s":{"ប","រ","i","្","o","ែ","ក","r","y","អ","m","p","e","ន"},"l":9.219544457292887,"c":{"អ":2,"្":4,"ន":2,"ក":4,"ប":4,"រ":2,"ែ":2,"i":2,"p":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Mymemory Котор":{"s":{"к","r","y","m","р","о","o","e","т"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"к":1,"о":2,"т":1,"р":1},"t":"MyMemoryTranslate"},"ماميميٽر ترجمو":{"s":{"و","ي","ا","ٽ","م","ر","ت","ج"},"l":5.385164807134504,"c":{"م":4,"ا":1,"ي":2,"ٽ":1,"ر":2,"ت":1,"ج":1,"و":1},"t":"MyMemoryTranslate"},"Mymemory översättare":{"s":{"t","v","r","y","ö","m","s","ä","a","o","e"},"l":6.4031242374328485,"c":{"m":3,"y":2,"e":3,"o":1,"r":3,"ö":1,"v":1,"s":1,"ä":1,"t":2,"a":1},"t":"MyMemoryTranslate"},"Паметта ми":{"s":{"и","а","м","п","е","т"},"l":3.872983346207417,"c":{"п":1,"а":2,"м":2,"е":1,"т":2,"и":1},"t":"MyMemoryTranslate"},"MyMemory Përkthyesi API":{"s":{"ë","h","t","p","r","y","s","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"m":3,"y":3,"e":2,"o":1,"r":2,"p":2,"ë":1,"k":1,"t":1,"h":1,"s":1,"i":2,"a":1},"t":"MyMemoryTranslate"},"API di traduttore mymemory":{"s":{"o","d","t","u","r","y","m","a","p","e","i"},"l":7.280109889280518,"c":{"a":2,"p":1,"i":2,"d":2,"t":3,"r":3,"u":1,"o":2,"e":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"MyMemory prevodilac API":{"s":{"d","l","p","v","c","r","y","m","a","o","e","i"},"l":6.4031242374328485,"c":{"m":3,"y":2,"e":2,"o":2,"r":2,"p":2,"v":1,"d":1,"i":2,"l":1,"a":2,"c":1},"t":"MyMemoryTranslate"},"Traduttur MyMemory":{"s":{"d","t","u","r","y","m","a","o","e"},"l":6.244997998398398,"c":{"t":3,"r":3,"a":1,"d":1,"u":2,"m":3,"y":2,"e":1,"o":1},"t":"MyMemoryTranslate"},"Mymarmory":{"s":{"r","y","m","a","o"},"l":4.358898943540674,"c":{"m":3,"y":2,"a":1,"r":2,"o":1},"t":"MyMemoryTranslate"},"ماميمي":{"s":{"ي","م","ا"},"l":3.7416573867739413,"c":{"م":3,"ا":1,"ي":2},"t":"MyMemoryTranslate"},"Traducteur mymémoire":{"s":{"i","d","t","u","c","r","y","m","a","o","e","é"},"l":6.082762530298219,"c":{"t":2,"r":3,"a":1,"d":1,"u":2,"c":1,"e":2,"m":3,"y":1,"é":1,"o":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory tulkot":{"s":{"t","l","u","r","y","m","k","o","e"},"l":5.0990195135927845,"c":{"m":3,"y":2,"e":1,"o":2,"r":1,"t":2,"u":1,"l":1,"k":1},"t":"MyMemoryTranslate"},"My geheue":{"s":{"g","h","u","y","m","e"},"l":3.7416573867739413,"c":{"m":1,"y":1,"g":1,"e":3,"h":1,"u":1},"t":"MyMemoryTranslate"},"Memoria mea":{"s":{"r","m","a","o","e","i"},"l":4.47213595499958,"c":{"m":3,"e":2,"o":1,"r":1,"i":1,"a":2},"t":"MyMemoryTranslate"},"Миремия тарҷумон api":{"s":{"н","i","и","у","я","о","а","р","м","ҷ","a","p","е","т"},"l":5.291502622129181,"c":{"м":3,"и":2,"р":2,"е":1,"я":1,"т":1,"а":1,"ҷ":1,"у":1,"о":1,"н":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"„MyMemory“ vertimas":{"s":{"„","“","t","v","r","y","s","m","a","o","e","i"},"l":6.0,"c":{"„":1,"m":4,"y":2,"e":2,"o":1,"r":2,"“":1,"v":1,"t":1,"i":1,"a":1,"s":1},"t":"MyMemoryTranslate"},"MyMemory þýðandi":{"s":{"þ","ð","n","d","ý","r","y","m","a","o","e","i"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"þ":1,"ý":1,"ð":1,"a":1,"n":1,"d":1,"i":1},"t":"MyMemoryTranslate"},"माझी स्मृती":{"s":{"ी","झ","त","्","ा","स","ृ","म"},"l":3.7416573867739413,"c":{"म":2,"ा":1,"झ":1,"ी":2,"स":1,"्":1,"ृ":1,"त":1},"t":"MyMemoryTranslate"},"ນັກແປພາຍຸ":{"s":{"ພ","ນ","ປ","ກ","ຸ","ັ","າ","ຍ","ແ"},"l":3.0,"c":{"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":1,"ຍ":1,"ຸ":1},"t":"MyMemoryTranslate"},"Mymemory अनुवादक एपीआई":{"s":{"ी","ए","प","ु","ई","न","अ","द","r","y","ा","m","क","व","o","e","आ"},"l":5.291502622129181,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"MyMemoryTranslate"},"Менин эс тутумум":{"s":{"н","и","с","э","м","у","е","т"},"l":5.477225575051661,"c":{"м":3,"е":1,"н":2,"и":1,"э":1,"с":1,"т":2,"у":3},"t":"MyMemoryTranslate"},"mymemory مترجم":{"s":{"ج","م","r","y","ت","m","ر","o","e"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"م":2,"ت":1,"ر":1,"ج":1},"t":"MyMemoryTranslate"},"Minha memória":{"s":{"ó","n","h","r","m","a","e","i"},"l":4.69041575982343,"c":{"m":3,"i":2,"n":1,"h":1,"a":2,"e":1,"ó":1,"r":1},"t":"MyMemoryTranslate"},"Mymory පරිවර්තනය":{"s":{"ි","න","ව","ප","ත","්","r","y","ය","m","o","ර"},"l":4.58257569495584,"c":{"m":2,"y":2,"o":1,"r":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"න":1,"ය":1},"t":"MyMemoryTranslate"},"Mymemory fordítás":{"s":{"f","d","t","í","á","r","y","s","m","o","e"},"l":5.291502622129181,"c":{"m":3,"y":2,"e":1,"o":2,"r":2,"f":1,"d":1,"í":1,"t":1,"á":1,"s":1},"t":"MyMemoryTranslate"},"MyMemory បកប្រែ":{"s":{"ប","រ","្","ែ","ក","r","y","m","o","e"},"l":4.898979485566356,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ប":2,"ក":1,"្":1,"រ":1,"ែ":1},"t":"MyMemoryTranslate"},"ମେମୋମେୋରୀ ଅନୁବାଦକ |":{"s":{"ୁ","ା","|","ଦ","ବ","ନ","େ","ର","ମ","ଅ","ୀ","ୋ","କ"},"l":5.196152422706632,"c":{"ମ":3,"େ":2,"ୋ":2,"ର":1,"ୀ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"|":1},"t":"MyMemoryTranslate"},"MYMEMORIA":{"s":{"r","y","m","a","o","e","i"},"l":3.872983346207417,"c":{"m":3,"y":1,"e":1,"o":1,"r":1,"i":1,"a":1},"t":"MyMemoryTranslate"},"I-MyMemory":{"s":{"r","y","-","m","o","e","i"},"l":4.242640687119285,"c":{"i":1,"-":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"మైమెమోరీ అనువాదకుడు":{"s":{"మ","ర","ె","ై","ీ","ు","ద","ా","క","డ","న","వ","ో","అ"},"l":5.477225575051661,"c":{"మ":3,"ై":1,"ె":1,"ో":1,"ర":1,"ీ":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1},"t":"MyMemoryTranslate"},"حافظه من":{"s":{"ح","ظ","ف","ا","م","ه","ن"},"l":2.6457513110645907,"c":{"ح":1,"ا":1,"ف":1,"ظ":1,"ه":1,"م":1,"ن":1},"t":"MyMemoryTranslate"},"API Cyfieithydd MyMemory":{"s":{"a","h","f","d","o","t","r","y","m","c","p","e","i"},"l":7.0710678118654755,"c":{"a":1,"p":1,"i":3,"c":1,"y":4,"f":1,"e":2,"t":1,"h":1,"d":2,"m":3,"o":1,"r":1},"t":"MyMemoryTranslate"},"Mymamory अनुवादक":{"s":{"ु","न","अ","द","r","y","व","m","ा","क","a","o"},"l":4.795831523312719,"c":{"m":3,"y":2,"a":1,"o":1,"r":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"MyMemoryTranslate"},"Mymemory translate":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":5.744562646538029,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"মাইমেমরি অনুবাদক এপিআই":{"s":{"অ","ি","ু","আ","এ","ই","ম","ন","দ","ক","র","ব","া","ে","প"},"l":5.656854249492381,"c":{"ম":3,"া":2,"ই":2,"ে":1,"র":1,"ি":2,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1,"ক":1,"এ":1,"প":1,"আ":1},"t":"MyMemoryTranslate"},"מימעמערי איבערזעצער":{"s":{"י","ב","צ","ע","ז","א","ר","מ"},"l":7.483314773547883,"c":{"מ":3,"י":3,"ע":5,"ר":3,"א":1,"ב":1,"ז":1,"צ":1},"t":"MyMemoryTranslate"},"Mymomory":{"s":{"o","r","y","m"},"l":4.242640687119285,"c":{"m":3,"y":2,"o":2,"r":1},"t":"MyMemoryTranslate"},"MyMemory translate":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":5.744562646538029,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"ਮਾਇਮੇਮੀ":{"s":{"ੀ","ਮ","ੇ","ਇ","ਾ"},"l":3.605551275463989,"c":{"ਮ":3,"ਾ":1,"ਇ":1,"ੇ":1,"ੀ":1},"t":"MyMemoryTranslate"},"מימעמאָרי זעץ":{"s":{"י","ָ","ע","ז","ץ","א","ר","מ"},"l":4.69041575982343,"c":{"מ":3,"י":2,"ע":2,"א":1,"ָ":1,"ר":1,"ז":1,"ץ":1},"t":"MyMemoryTranslate"},"MyMemory oersetter":{"s":{"t","r","y","s","m","o","e"},"l":6.855654600401044,"c":{"m":3,"y":2,"e":4,"o":2,"r":3,"s":1,"t":2},"t":"MyMemoryTranslate"},"Ma mémoire":{"s":{"i","r","m","a","o","e","é"},"l":3.872983346207417,"c":{"m":3,"a":1,"é":1,"o":1,"i":1,"r":1,"e":1},"t":"MyMemoryTranslate"},"Mymemory traducir":{"s":{"d","t","u","c","r","y","m","a","o","e","i"},"l":5.477225575051661,"c":{"m":3,"y":2,"e":1,"o":1,"r":3,"t":1,"a":1,"d":1,"u":1,"c":1,"i":1},"t":"MyMemoryTranslate"},"માય મેમરી અનુવાદક":{"s":{"ા","ન","દ","ુ","ે","ર","ય","ક","મ","અ","ી","વ"},"l":4.795831523312719,"c":{"મ":3,"ા":2,"ય":1,"ે":1,"ર":1,"ી":1,"અ":1,"ન":1,"ુ":1,"વ":1,"દ":1,"ક":1},"t":"MyMemoryTranslate"},"Min hukommelse":{"s":{"n","h","l","u","s","m","k","o","e","i"},"l":4.58257569495584,"c":{"m":3,"i":1,"n":1,"h":1,"u":1,"k":1,"o":1,"e":2,"l":1,"s":1},"t":"MyMemoryTranslate"},"మైమెమోరీ అనువాదకుడు API":{"s":{"మ","ర","ె","ై","ీ","ు","ద","ా","క","డ","న","వ","ో","a","p","అ","i"},"l":5.744562646538029,"c":{"మ":3,"ై":1,"ె":1,"ో":1,"ర":1,"ీ":1,"అ":1,"న":1,"ు":3,"వ":1,"ా":1,"ద":1,"క":1,"డ":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Мои воспоминания":{"s":{"н","и","в","о","я","с","а","м","п"},"l":5.5677643628300215,"c":{"м":2,"о":3,"и":3,"в":1,"с":1,"п":1,"н":2,"а":1,"я":1},"t":"MyMemoryTranslate"},"Mymemory अनुवादक":{"s":{"ु","न","अ","द","r","y","ा","m","क","व","o","e"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"MyMemoryTranslate"},"Mijn geheugen":{"s":{"g","n","h","j","u","m","e","i"},"l":4.69041575982343,"c":{"m":1,"i":1,"j":1,"n":2,"g":2,"e":3,"h":1,"u":1},"t":"MyMemoryTranslate"},"MyMemory þýða":{"s":{"þ","ð","ý","r","y","m","a","o","e"},"l":4.47213595499958,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"þ":1,"ý":1,"ð":1,"a":1},"t":"MyMemoryTranslate"},"Womasulira Mymemary API":{"s":{"w","l","p","u","r","y","s","m","a","o","e","i"},"l":7.14142842854285,"c":{"w":1,"o":1,"m":4,"a":4,"s":1,"u":1,"l":1,"i":2,"r":2,"y":2,"e":1,"p":1},"t":"MyMemoryTranslate"},"Перакладчык Mymemory":{"s":{"к","л","ч","а","e","r","д","y","m","р","ы","п","o","е"},"l":5.5677643628300215,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"MYMEMORY Oersetter API":{"s":{"t","p","r","y","s","m","a","o","e","i"},"l":7.0710678118654755,"c":{"m":3,"y":2,"e":4,"o":2,"r":3,"s":1,"t":2,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"ការ​ចងចាំ​របស់ខ្ញុំ":{"s":{"រ","ប","ង","្","ក","ច","ា","ំ","ញ","ស","ខ","ុ","់"},"l":5.0,"c":{"ក":1,"ា":2,"រ":2,"ច":2,"ង":1,"ំ":2,"ប":1,"ស":1,"់":1,"ខ":1,"្":1,"ញ":1,"ុ":1},"t":"MyMemoryTranslate"},"Mymemointer ተርጓሚ ኤፒአይ":{"s":{"n","ይ","t","ሚ","አ","ር","r","y","m","ተ","ኤ","ፒ","ጓ","o","e","i"},"l":5.196152422706632,"c":{"m":3,"y":1,"e":2,"o":1,"i":1,"n":1,"t":1,"r":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"MyMemoryTranslate"},"Moje paměť":{"s":{"o","j","ě","ť","m","a","p","e"},"l":3.3166247903554,"c":{"m":2,"o":1,"j":1,"e":1,"p":1,"a":1,"ě":1,"ť":1},"t":"MyMemoryTranslate"},"MyMemory ترجمة":{"s":{"ة","ج","م","r","y","ت","m","ر","o","e"},"l":4.58257569495584,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ت":1,"ر":1,"ج":1,"م":1,"ة":1},"t":"MyMemoryTranslate"},"MyMemory Translate":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":5.744562646538029,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"Mitt minne":{"s":{"n","t","m","e","i"},"l":4.123105625617661,"c":{"m":2,"i":2,"t":2,"n":2,"e":1},"t":"MyMemoryTranslate"},"Mymemory Translator API":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":6.708203932499369,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":3,"n":1,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory Translator":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":6.164414002968976,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"Mpandika Mymemory":{"s":{"n","o","d","r","y","m","k","a","p","e","i"},"l":5.656854249492381,"c":{"m":4,"p":1,"a":2,"n":1,"d":1,"i":1,"k":1,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"ମେମୋମେୋରୀ":{"s":{"େ","ର","ମ","ୀ","ୋ"},"l":4.358898943540674,"c":{"ମ":3,"େ":2,"ୋ":2,"ର":1,"ୀ":1},"t":"MyMemoryTranslate"},"Meine Erinnerung":{"s":{"g","n","u","r","m","e","i"},"l":6.557438524302,"c":{"m":1,"e":4,"i":2,"n":4,"r":2,"u":1,"g":1},"t":"MyMemoryTranslate"},"Mymemory ተርጉም":{"s":{"ም","ር","r","y","m","ተ","ጉ","o","e"},"l":4.47213595499958,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ተ":1,"ር":1,"ጉ":1,"ም":1},"t":"MyMemoryTranslate"},"Η μνήμη μου":{"s":{"ν","υ","μ","ο","ή","η"},"l":4.123105625617661,"c":{"η":2,"μ":3,"ν":1,"ή":1,"ο":1,"υ":1},"t":"MyMemoryTranslate"},"Aistrigh mymemory":{"s":{"g","h","t","r","y","s","m","a","o","e","i"},"l":5.291502622129181,"c":{"a":1,"i":2,"s":1,"t":1,"r":2,"g":1,"h":1,"m":3,"y":2,"e":1,"o":1},"t":"MyMemoryTranslate"},"MyMemory Translator":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":6.164414002968976,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"Mymemory turjuma":{"s":{"j","t","u","r","y","m","a","o","e"},"l":5.744562646538029,"c":{"m":4,"y":2,"e":1,"o":1,"r":2,"t":1,"u":2,"j":1,"a":1},"t":"MyMemoryTranslate"},"MyMemory Tradukisto":{"s":{"d","t","u","r","y","s","m","k","a","o","e","i"},"l":5.656854249492381,"c":{"m":3,"y":2,"e":1,"o":2,"r":2,"t":2,"a":1,"d":1,"u":1,"k":1,"i":1,"s":1},"t":"MyMemoryTranslate"},"Te whakamaoritanga o te Mymemory":{"s":{"g","n","h","w","t","r","y","m","k","a","o","e","i"},"l":9.055385138137417,"c":{"t":3,"e":3,"w":1,"h":1,"a":5,"k":1,"m":4,"o":3,"r":2,"i":1,"n":1,"g":1,"y":2},"t":"MyMemoryTranslate"},"Hafızam":{"s":{"ı","h","f","z","m","a"},"l":3.0,"c":{"h":1,"a":2,"f":1,"ı":1,"z":1,"m":1},"t":"MyMemoryTranslate"},"MyMemory tradu":{"s":{"d","t","u","r","y","m","a","o","e"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"t":1,"a":1,"d":1,"u":1},"t":"MyMemoryTranslate"},"Mai fassara Mymemory":{"s":{"f","r","y","s","m","a","o","e","i"},"l":6.928203230275509,"c":{"m":4,"a":4,"i":1,"f":1,"s":2,"r":2,"y":2,"e":1,"o":1},"t":"MyMemoryTranslate"},"Mymemory Translate":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":5.744562646538029,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"내 기억":{"s":{"억","내","기"},"l":1.7320508075688772,"c":{"내":1,"기":1,"억":1},"t":"MyMemoryTranslate"},"Mymemory dịch":{"s":{"h","d","r","y","m","ị","c","o","e"},"l":4.47213595499958,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"d":1,"ị":1,"c":1,"h":1},"t":"MyMemoryTranslate"},"นักแปล MyMemory":{"s":{"ล","น","แ","ก","r","y","ั","ป","m","o","e"},"l":4.69041575982343,"c":{"น":1,"ั":1,"ก":1,"แ":1,"ป":1,"ล":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"MyMemory Tłumacz":{"s":{"t","ł","u","c","r","y","z","m","a","o","e"},"l":5.385164807134504,"c":{"m":4,"y":2,"e":1,"o":1,"r":1,"t":1,"ł":1,"u":1,"a":1,"c":1,"z":1},"t":"MyMemoryTranslate"},"Kukhuzidwa":{"s":{"h","d","w","u","z","k","a","i"},"l":3.7416573867739413,"c":{"k":2,"u":2,"h":1,"z":1,"i":1,"d":1,"w":1,"a":1},"t":"MyMemoryTranslate"},"MyMemory tõlge":{"s":{"g","t","l","r","y","m","õ","o","e"},"l":4.795831523312719,"c":{"m":3,"y":2,"e":2,"o":1,"r":1,"t":1,"õ":1,"l":1,"g":1},"t":"MyMemoryTranslate"},"MyMemory மொழிபெயர்ப்பு":{"s":{"ெ","ொ","ு","ம","ர","ய","r","y","ப","m","ி","்","ழ","o","e"},"l":6.082762530298219,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ெ":1,"ய":1,"ர":1,"்":2,"ு":1},"t":"MyMemoryTranslate"},"എന്റെ ഓർമ്മ":{"s":{"എ","മ","്","ർ","ഓ","റ","ന","െ"},"l":3.7416573867739413,"c":{"എ":1,"ന":1,"്":2,"റ":1,"െ":1,"ഓ":1,"ർ":1,"മ":2},"t":"MyMemoryTranslate"},"Перекладач Mymemory":{"s":{"к","л","ч","а","e","r","д","y","m","р","п","o","е"},"l":5.477225575051661,"c":{"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Womasulira mymemary":{"s":{"w","l","u","r","y","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"w":1,"o":1,"m":4,"a":3,"s":1,"u":1,"l":1,"i":1,"r":2,"y":2,"e":1},"t":"MyMemoryTranslate"},"Mymemory fordító API":{"s":{"ó","f","d","t","í","p","r","y","m","a","o","e","i"},"l":5.477225575051661,"c":{"m":3,"y":2,"e":1,"o":2,"r":2,"f":1,"d":1,"í":1,"t":1,"ó":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymementor Translator API":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":7.280109889280518,"c":{"m":3,"y":1,"e":2,"n":2,"t":3,"o":2,"r":3,"a":3,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"អ្នកបកប្រែ MyMemory":{"s":{"ប","រ","្","ែ","ក","r","y","អ","m","o","e","ន"},"l":5.656854249492381,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Ami mymento":{"s":{"n","t","y","m","a","o","e","i"},"l":4.0,"c":{"a":1,"m":3,"i":1,"y":1,"e":1,"n":1,"t":1,"o":1},"t":"MyMemoryTranslate"},"MyMemory prevodilac":{"s":{"d","l","p","v","c","r","y","m","a","o","e","i"},"l":5.656854249492381,"c":{"m":3,"y":2,"e":2,"o":2,"r":2,"p":1,"v":1,"d":1,"i":1,"l":1,"a":1,"c":1},"t":"MyMemoryTranslate"},"Minu mälestus":{"s":{"n","l","t","u","ä","s","m","e","i"},"l":4.242640687119285,"c":{"m":2,"i":1,"n":1,"u":2,"ä":1,"l":1,"e":1,"s":2,"t":1},"t":"MyMemoryTranslate"},"„MyMemory“ vertėjo API":{"s":{"„","j","“","t","v","p","r","y","m","a","o","e","i","ė"},"l":5.830951894845301,"c":{"„":1,"m":3,"y":2,"e":2,"o":2,"r":2,"“":1,"v":1,"t":1,"ė":1,"j":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Мімемарыя перакладзе":{"s":{"к","л","я","а","з","д","р","м","ы","п","і","е"},"l":6.244997998398398,"c":{"м":3,"і":1,"е":3,"а":3,"р":2,"ы":1,"я":1,"п":1,"к":1,"л":1,"д":1,"з":1},"t":"MyMemoryTranslate"},"mymemory翻訳":{"s":{"r","y","m","翻","訳","o","e"},"l":4.242640687119285,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"翻":1,"訳":1},"t":"MyMemoryTranslate"},"I-MyMemory Trat":{"s":{"t","r","y","-","m","a","o","e","i"},"l":5.0990195135927845,"c":{"i":1,"-":1,"m":3,"y":2,"e":1,"o":1,"r":2,"t":2,"a":1},"t":"MyMemoryTranslate"},"MyMemory çevirmen":{"s":{"n","v","r","y","m","ç","o","e","i"},"l":6.164414002968976,"c":{"m":4,"y":2,"e":3,"o":1,"r":2,"ç":1,"v":1,"i":1,"n":1},"t":"MyMemoryTranslate"},"MyMemory Çeviri":{"s":{"v","r","y","m","ç","o","e","i"},"l":5.291502622129181,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"ç":1,"v":1,"i":2},"t":"MyMemoryTranslate"},"Moje pamćenje":{"s":{"n","o","j","ć","m","a","p","e"},"l":4.69041575982343,"c":{"m":2,"o":1,"j":2,"e":3,"p":1,"a":1,"ć":1,"n":1},"t":"MyMemoryTranslate"},"Mylymory Translation Api":{"s":{"n","l","t","p","r","y","s","m","a","o","i"},"l":6.928203230275509,"c":{"m":2,"y":3,"l":2,"o":2,"r":2,"t":2,"a":3,"n":2,"s":1,"i":2,"p":1},"t":"MyMemoryTranslate"},"מתרגם MyMemory API":{"s":{"ת","ג","o","p","r","y","m","ם","a","ר","e","i","מ"},"l":4.898979485566356,"c":{"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"m":3,"y":2,"e":1,"o":1,"r":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory تەرجىمانى":{"s":{"ى","ج","ا","ە","r","y","ت","m","ر","م","ن","o","e"},"l":5.196152422706632,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1},"t":"MyMemoryTranslate"},"Textatory mymemory API":{"s":{"t","p","r","y","m","a","o","e","i","x"},"l":6.782329983125268,"c":{"t":3,"e":2,"x":1,"a":2,"o":2,"r":2,"y":3,"m":3,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory Tərcüməçi":{"s":{"ü","t","r","y","ə","m","ç","c","o","e","i"},"l":5.916079783099616,"c":{"m":4,"y":2,"e":1,"o":1,"r":2,"t":1,"ə":2,"c":1,"ü":1,"ç":1,"i":1},"t":"MyMemoryTranslate"},"API du traducteur mymémoire":{"s":{"é","o","d","t","u","c","r","y","m","a","p","e","i"},"l":7.211102550927978,"c":{"a":2,"p":1,"i":2,"d":2,"u":3,"t":2,"r":3,"c":1,"e":2,"m":3,"y":1,"é":1,"o":1},"t":"MyMemoryTranslate"},"MyMemory Translator API":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":6.708203932499369,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":3,"n":1,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory тарҷума":{"s":{"м","а","r","y","m","р","ҷ","у","o","e","т"},"l":5.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1},"t":"MyMemoryTranslate"},"Тарҷумони Мамадия":{"s":{"н","м","и","о","я","а","д","р","ҷ","у","т"},"l":5.477225575051661,"c":{"т":1,"а":3,"р":1,"ҷ":1,"у":1,"м":3,"о":1,"н":1,"и":2,"д":1,"я":1},"t":"MyMemoryTranslate"},"ମେମୋମେୋରୀ ଅନୁବାଦକ API |":{"s":{"ୁ","ା","|","ଦ","ବ","ନ","େ","ର","ମ","ଅ","ୀ","ୋ","କ","a","p","i"},"l":5.477225575051661,"c":{"ମ":3,"େ":2,"ୋ":2,"ର":1,"ୀ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"a":1,"p":1,"i":1,"|":1},"t":"MyMemoryTranslate"},"Ingatan saya":{"s":{"g","n","t","y","s","a","i"},"l":5.0,"c":{"i":1,"n":2,"g":1,"a":4,"t":1,"s":1,"y":1},"t":"MyMemoryTranslate"},"Mymemory mai fassara API":{"s":{"f","p","r","y","s","m","a","o","e","i"},"l":7.810249675906654,"c":{"m":4,"y":2,"e":1,"o":1,"r":2,"a":5,"i":2,"f":1,"s":2,"p":1},"t":"MyMemoryTranslate"},"Mofetoleli oa MyMemory":{"s":{"f","t","l","r","y","m","a","o","e","i"},"l":7.3484692283495345,"c":{"m":4,"o":4,"f":1,"e":3,"t":1,"l":2,"i":1,"a":1,"y":2,"r":1},"t":"MyMemoryTranslate"},"Myamory":{"s":{"r","y","m","a","o"},"l":3.3166247903554,"c":{"m":2,"y":2,"a":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"MyMemory Prevoditelja":{"s":{"d","j","t","l","p","v","r","y","m","a","o","e","i"},"l":6.164414002968976,"c":{"m":3,"y":2,"e":3,"o":2,"r":2,"p":1,"v":1,"d":1,"i":1,"t":1,"l":1,"j":1,"a":1},"t":"MyMemoryTranslate"},"MyMemory மொழிபெயர்ப்பாளர்":{"s":{"ெ","ொ","ம","ர","ய","r","y","ப","m","ி","்","ழ","ா","o","e","ள"},"l":6.782329983125268,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ெ":1,"ய":1,"ர":2,"்":3,"ா":1,"ள":1},"t":"MyMemoryTranslate"},"Cyfieithu mymemory":{"s":{"h","f","t","u","r","y","m","c","o","e","i"},"l":5.744562646538029,"c":{"c":1,"y":3,"f":1,"i":2,"e":2,"t":1,"h":1,"u":1,"m":3,"o":1,"r":1},"t":"MyMemoryTranslate"},"Mymory පරිවර්තක API":{"s":{"ි","ව","ප","ත","ක","p","්","r","y","m","a","o","i","ර"},"l":4.795831523312719,"c":{"m":2,"y":2,"o":1,"r":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"ක":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"API dịch thuật MyMemory":{"s":{"ậ","h","o","d","t","u","c","r","y","m","ị","a","p","e","i"},"l":5.656854249492381,"c":{"a":1,"p":1,"i":1,"d":1,"ị":1,"c":1,"h":2,"t":2,"u":1,"ậ":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Umhumushi we-MyMemory Api":{"s":{"h","w","p","u","r","-","s","m","y","a","o","e","i"},"l":7.54983443527075,"c":{"u":3,"m":5,"h":2,"s":1,"i":2,"w":1,"e":2,"-":1,"y":2,"o":1,"r":1,"a":1,"p":1},"t":"MyMemoryTranslate"},"တေးရေး":{"s":{"တ","း","ေ","ရ"},"l":3.1622776601683795,"c":{"တ":1,"ေ":2,"း":2,"ရ":1},"t":"MyMemoryTranslate"},"Mymemory fordító":{"s":{"ó","f","d","t","í","r","y","m","o","e"},"l":5.196152422706632,"c":{"m":3,"y":2,"e":1,"o":2,"r":2,"f":1,"d":1,"í":1,"t":1,"ó":1},"t":"MyMemoryTranslate"},"Preplator preplartor Mymeator":{"s":{"o","l","t","r","y","m","a","p","e"},"l":9.848857801796104,"c":{"p":4,"r":6,"e":3,"l":2,"a":3,"t":3,"o":3,"m":2,"y":1},"t":"MyMemoryTranslate"},"MyMemory مترجم API":{"s":{"p","ج","م","r","y","ت","m","ر","a","o","e","i"},"l":5.0990195135927845,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory翻译":{"s":{"译","r","y","m","翻","o","e"},"l":4.242640687119285,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"翻":1,"译":1},"t":"MyMemoryTranslate"},"MyMemory орчуулагч":{"s":{"л","ч","а","r","y","г","m","р","о","у","o","e"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1},"t":"MyMemoryTranslate"},"MYMEMORY -Übersetzer -API":{"s":{"b","ü","t","p","r","y","-","m","s","z","a","o","e","i"},"l":7.14142842854285,"c":{"m":3,"y":2,"e":4,"o":1,"r":3,"-":2,"ü":1,"b":1,"s":1,"t":1,"z":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory പരിഭാഷകൻ":{"s":{"ഭ","ൻ","ി","ാ","ക","ഷ","r","y","പ","m","o","e","ര"},"l":4.898979485566356,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"പ":1,"ര":1,"ി":1,"ഭ":1,"ാ":1,"ഷ":1,"ക":1,"ൻ":1},"t":"MyMemoryTranslate"},"Kaiwhakamaori Mymemory":{"s":{"h","w","r","y","m","k","a","o","e","i"},"l":7.416198487095663,"c":{"k":2,"a":4,"i":2,"w":1,"h":1,"m":4,"o":2,"r":2,"y":2,"e":1},"t":"MyMemoryTranslate"},"માય મેમોર":{"s":{"ા","ે","ય","ર","મ","ો"},"l":3.7416573867739413,"c":{"મ":3,"ા":1,"ય":1,"ે":1,"ો":1,"ર":1},"t":"MyMemoryTranslate"},"MyMemory traduit":{"s":{"d","t","u","r","y","m","a","o","e","i"},"l":5.196152422706632,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"t":2,"a":1,"d":1,"u":1,"i":1},"t":"MyMemoryTranslate"},"Traduttore mymemory":{"s":{"d","t","u","r","y","m","a","o","e"},"l":6.48074069840786,"c":{"t":3,"r":3,"a":1,"d":1,"u":1,"o":2,"e":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"میری یاداشت":{"s":{"ی","ا","م","ر","ت","ش","د"},"l":4.242640687119285,"c":{"م":1,"ی":3,"ر":1,"ا":2,"د":1,"ش":1,"ت":1},"t":"MyMemoryTranslate"},"Mtafsiri wa MyMemory":{"s":{"f","w","t","r","y","s","m","a","o","e","i"},"l":6.164414002968976,"c":{"m":4,"t":1,"a":2,"f":1,"s":1,"i":2,"r":2,"w":1,"y":2,"e":1,"o":1},"t":"MyMemoryTranslate"},"Wergêrê mymemory":{"s":{"g","w","r","y","m","ê","o","e"},"l":5.744562646538029,"c":{"w":1,"e":2,"r":3,"g":1,"ê":2,"m":3,"y":2,"o":1},"t":"MyMemoryTranslate"},"Traducător MyMemory":{"s":{"o","d","t","u","c","r","y","m","a","ă","e"},"l":6.0,"c":{"t":2,"r":3,"a":1,"d":1,"u":1,"c":1,"ă":1,"o":2,"m":3,"y":2,"e":1},"t":"MyMemoryTranslate"},"MyMemory Tradukisto API":{"s":{"d","t","p","u","r","y","s","m","k","a","o","e","i"},"l":6.244997998398398,"c":{"m":3,"y":2,"e":1,"o":2,"r":2,"t":2,"a":2,"d":1,"u":1,"k":1,"i":2,"s":1,"p":1},"t":"MyMemoryTranslate"},"MyMemory תרגם":{"s":{"ת","ג","r","y","m","ם","o","e","ר"},"l":4.47213595499958,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ת":1,"ר":1,"ג":1,"ם":1},"t":"MyMemoryTranslate"},"MyMemory jittraduċi":{"s":{"j","d","t","u","r","y","ċ","m","a","o","e","i"},"l":5.656854249492381,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"j":1,"i":2,"t":2,"a":1,"d":1,"u":1,"ċ":1},"t":"MyMemoryTranslate"},"mymemory ترجمہ":{"s":{"ج","ہ","م","r","y","ت","m","ر","o","e"},"l":4.58257569495584,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ت":1,"ر":1,"ج":1,"م":1,"ہ":1},"t":"MyMemoryTranslate"},"Mymemory орчуулагч API":{"s":{"л","ч","p","а","r","y","г","m","р","о","у","a","o","e","i"},"l":5.656854249492381,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory tõlk":{"s":{"t","l","r","y","m","k","õ","o","e"},"l":4.47213595499958,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"t":1,"õ":1,"l":1,"k":1},"t":"MyMemoryTranslate"},"Pengerjemah mymemory":{"s":{"g","n","h","o","j","r","y","m","a","p","e"},"l":6.855654600401044,"c":{"p":1,"e":4,"n":1,"g":1,"r":2,"j":1,"m":4,"a":1,"h":1,"y":2,"o":1},"t":"MyMemoryTranslate"},"MyMemory மொழிபெயர்ப்பாளர் API":{"s":{"ொ","y","a","ி","r","்","m","o","ள","i","ம","ப","ா","e","ெ","ர","ய","ழ","p"},"l":7.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ெ":1,"ய":1,"ர":2,"்":3,"ா":1,"ள":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"МиМемори Транслатор АПИ":{"s":{"н","л","и","о","с","а","р","м","п","е","т"},"l":7.0,"c":{"м":3,"и":3,"е":1,"о":2,"р":3,"т":2,"а":3,"н":1,"с":1,"л":1,"п":1},"t":"MyMemoryTranslate"},"MyMemory преведувач API":{"s":{"a","е","ч","в","p","а","r","y","д","m","р","у","п","o","e","i"},"l":5.744562646538029,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"а":1,"ч":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory prevajalec":{"s":{"j","l","p","v","c","r","y","m","a","o","e"},"l":6.0,"c":{"m":3,"y":2,"e":3,"o":1,"r":2,"p":1,"v":1,"a":2,"j":1,"l":1,"c":1},"t":"MyMemoryTranslate"},"Onitumọ mymemory":{"s":{"n","t","u","r","y","ọ","m","o","e","i"},"l":5.5677643628300215,"c":{"o":2,"n":1,"i":1,"t":1,"u":1,"m":4,"ọ":1,"y":2,"e":1,"r":1},"t":"MyMemoryTranslate"},"Mymory පරිවර්තකය":{"s":{"ි","ව","ප","ත","ක","්","r","y","ය","m","o","ර"},"l":4.58257569495584,"c":{"m":2,"y":2,"o":1,"r":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"ක":1,"ය":1},"t":"MyMemoryTranslate"},"MyMemory":{"s":{"r","y","m","o","e"},"l":4.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"МиМемори преводилац":{"s":{"л","и","в","о","а","д","р","м","п","ц","е"},"l":6.0,"c":{"м":3,"и":3,"е":2,"о":2,"р":2,"п":1,"в":1,"д":1,"л":1,"а":1,"ц":1},"t":"MyMemoryTranslate"},"API de traductor mymemory":{"s":{"o","d","t","u","c","r","y","m","a","p","e","i"},"l":6.782329983125268,"c":{"a":2,"p":1,"i":1,"d":2,"e":2,"t":2,"r":3,"u":1,"c":1,"o":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"MyMemy tarjimasi":{"s":{"j","t","r","y","s","m","a","e","i"},"l":5.744562646538029,"c":{"m":4,"y":2,"e":1,"t":1,"a":2,"r":1,"j":1,"i":2,"s":1},"t":"MyMemoryTranslate"},"API do tradutor de MyMemory":{"s":{"d","t","p","u","r","y","m","a","o","e","i"},"l":7.416198487095663,"c":{"a":2,"p":1,"i":1,"d":3,"o":3,"t":2,"r":3,"u":1,"e":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"MyMemory interpres API":{"s":{"n","t","p","r","y","s","m","a","o","e","i"},"l":6.6332495807108,"c":{"m":3,"y":2,"e":3,"o":1,"r":3,"i":2,"n":1,"t":1,"p":2,"s":1,"a":1},"t":"MyMemoryTranslate"},"mymemory翻訳者":{"s":{"r","y","者","m","翻","訳","o","e"},"l":4.358898943540674,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"翻":1,"訳":1,"者":1},"t":"MyMemoryTranslate"},"Mymymory":{"s":{"o","r","y","m"},"l":4.47213595499958,"c":{"m":3,"y":3,"o":1,"r":1},"t":"MyMemoryTranslate"},"Mymemory Котормочу":{"s":{"к","ч","м","r","y","m","р","о","у","o","e","т"},"l":5.5677643628300215,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"к":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1},"t":"MyMemoryTranslate"},"私の思い出":{"s":{"い","出","思","私","の"},"l":2.23606797749979,"c":{"私":1,"の":1,"思":1,"い":1,"出":1},"t":"MyMemoryTranslate"},"MyMemory -vertaler":{"s":{"t","l","v","r","y","-","m","a","o","e"},"l":6.082762530298219,"c":{"m":3,"y":2,"e":3,"o":1,"r":3,"-":1,"v":1,"t":1,"a":1,"l":1},"t":"MyMemoryTranslate"},"میممي مور ژباړونکی":{"s":{"ب","و","ک","ی","ي","ړ","ا","م","ر","ژ","ن"},"l":5.656854249492381,"c":{"م":4,"ی":2,"ي":1,"و":2,"ر":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ن":1,"ک":1},"t":"MyMemoryTranslate"},"Mymememery ntụgharị":{"s":{"g","n","h","t","r","y","m","ụ","ị","a","e"},"l":6.324555320336759,"c":{"m":4,"y":2,"e":3,"r":2,"n":1,"t":1,"ụ":1,"g":1,"h":1,"a":1,"ị":1},"t":"MyMemoryTranslate"},"Mymemory tradueix":{"s":{"d","t","u","r","y","m","a","o","e","i","x"},"l":5.291502622129181,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"t":1,"a":1,"d":1,"u":1,"i":1,"x":1},"t":"MyMemoryTranslate"},"Mymmerortlandese olu":{"s":{"n","d","t","l","u","r","y","s","m","a","o","e"},"l":6.082762530298219,"c":{"m":3,"y":1,"e":3,"r":2,"o":2,"t":1,"l":2,"a":1,"n":1,"d":1,"s":1,"u":1},"t":"MyMemoryTranslate"},"Tradiktè mymemory":{"s":{"d","t","e","r","y","m","k","a","o","è","i"},"l":5.291502622129181,"c":{"t":2,"r":2,"a":1,"d":1,"i":1,"k":1,"è":1,"m":3,"y":2,"e":1,"o":1},"t":"MyMemoryTranslate"},"ماميميٽر مترجم":{"s":{"ي","ا","ٽ","م","ر","ت","ج"},"l":6.082762530298219,"c":{"م":5,"ا":1,"ي":2,"ٽ":1,"ر":2,"ت":1,"ج":1},"t":"MyMemoryTranslate"},"MyMemory vertaal":{"s":{"t","l","v","r","y","m","a","o","e"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"v":1,"t":1,"a":2,"l":1},"t":"MyMemoryTranslate"},"Tafsiri ya MyMemory":{"s":{"f","t","r","y","s","m","a","o","e","i"},"l":5.916079783099616,"c":{"t":1,"a":2,"f":1,"s":1,"i":2,"r":2,"y":3,"m":3,"e":1,"o":1},"t":"MyMemoryTranslate"},"Mymemory аудармашысы API":{"s":{"ш","р","ы","p","с","а","r","y","m","д","м","у","a","o","e","i"},"l":6.164414002968976,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"ಮೈಮೆಮರಿ ಅನುವಾದಕ":{"s":{"ವ","ರ","ಕ","ೈ","ಿ","ಅ","ನ","ಾ","ೆ","ದ","ಮ","ು"},"l":4.47213595499958,"c":{"ಮ":3,"ೈ":1,"ೆ":1,"ರ":1,"ಿ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಕ":1},"t":"MyMemoryTranslate"},"Mymemory":{"s":{"r","y","m","o","e"},"l":4.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Moja pamięć":{"s":{"j","ć","p","m","ę","a","o","i"},"l":3.7416573867739413,"c":{"m":2,"o":1,"j":1,"a":2,"p":1,"i":1,"ę":1,"ć":1},"t":"MyMemoryTranslate"},"MyMemory itzultzailea":{"s":{"t","l","u","r","y","z","m","a","o","e","i"},"l":6.324555320336759,"c":{"m":3,"y":2,"e":2,"o":1,"r":1,"i":2,"t":2,"z":2,"u":1,"l":2,"a":2},"t":"MyMemoryTranslate"},"मायमेमरी ट्रान्सलेटर":{"s":{"े","ी","न","्","ा","र","ट","स","ल","म","य"},"l":6.244997998398398,"c":{"म":3,"ा":2,"य":1,"े":2,"र":3,"ी":1,"ट":2,"्":2,"न":1,"स":1,"ल":1},"t":"MyMemoryTranslate"},"ਮਾਇਮੇਮੋਰੀ ਅਨੁਵਾਦਕ":{"s":{"ੀ","ਮ","ੇ","ਇ","ੋ","ਾ","ਕ","ਵ","ੁ","ਰ","ਅ","ਨ","ਦ"},"l":4.898979485566356,"c":{"ਮ":3,"ਾ":2,"ਇ":1,"ੇ":1,"ੋ":1,"ਰ":1,"ੀ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1,"ਕ":1},"t":"MyMemoryTranslate"},"MyMemory अनुवाद":{"s":{"ु","न","अ","द","r","y","ा","m","व","o","e"},"l":4.69041575982343,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"MyMemoryTranslate"},"Mymetore अनुवाद":{"s":{"t","ु","न","अ","द","r","y","ा","m","व","o","e"},"l":4.242640687119285,"c":{"m":2,"y":1,"e":2,"t":1,"o":1,"r":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"MyMemoryTranslate"},"MyMemory איבערזעצער אַפּי":{"s":{"י","ב","צ","ע","ז","פ","ּ","r","y","m","ַ","א","o","e","ר"},"l":6.557438524302,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"א":2,"י":2,"ב":1,"ע":3,"ר":2,"ז":1,"צ":1,"ַ":1,"פ":1,"ּ":1},"t":"MyMemoryTranslate"},"Mymemory аудармашысы":{"s":{"ш","р","ы","с","а","r","y","m","д","м","у","o","e"},"l":5.916079783099616,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1},"t":"MyMemoryTranslate"},"Eadar-theangair Mymemory":{"s":{"g","n","h","d","t","r","-","y","m","a","o","e","i"},"l":7.416198487095663,"c":{"e":3,"a":4,"d":1,"r":3,"-":1,"t":1,"h":1,"n":1,"g":1,"i":1,"m":3,"y":2,"o":1},"t":"MyMemoryTranslate"},"מתרגם mymemory":{"s":{"ת","ג","o","r","y","m","ם","ר","e","מ"},"l":4.58257569495584,"c":{"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"ذاكرتي":{"s":{"ك","ي","ا","ر","ت","ذ"},"l":2.449489742783178,"c":{"ذ":1,"ا":1,"ك":1,"ر":1,"ت":1,"ي":1},"t":"MyMemoryTranslate"},"La mia memoria":{"s":{"l","r","m","a","o","e","i"},"l":5.0990195135927845,"c":{"l":1,"a":3,"m":3,"i":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"MyMemory Penterjemah API":{"s":{"n","h","j","t","p","r","y","m","a","o","e","i"},"l":7.3484692283495345,"c":{"m":4,"y":2,"e":4,"o":1,"r":2,"p":2,"n":1,"t":1,"j":1,"a":2,"h":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory Tercüman API":{"s":{"a","n","ü","t","p","r","y","m","c","o","e","i"},"l":6.244997998398398,"c":{"m":4,"y":2,"e":2,"o":1,"r":2,"t":1,"c":1,"ü":1,"a":2,"n":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"మైమెమోరీ అనువాదం":{"s":{"మ","ర","ె","ై","ీ","ు","ద","ా","ం","న","వ","ో","అ"},"l":4.58257569495584,"c":{"మ":3,"ై":1,"ె":1,"ో":1,"ర":1,"ీ":1,"అ":1,"న":1,"ు":1,"వ":1,"ా":1,"ద":1,"ం":1},"t":"MyMemoryTranslate"},"MYMEMEMEMY ဘာသာပြန်":{"s":{"ပ","ဘ","ာ","ြ","y","m","န","သ","e","်"},"l":6.928203230275509,"c":{"m":5,"y":2,"e":3,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1,"်":1},"t":"MyMemoryTranslate"},"मायमेमरी भाषांतर":{"s":{"भ","े","ी","त","ा","र","ष","ं","म","य"},"l":5.385164807134504,"c":{"म":3,"ा":3,"य":1,"े":1,"र":2,"ी":1,"भ":1,"ष":1,"ं":1,"त":1},"t":"MyMemoryTranslate"},"Moja pamäť":{"s":{"j","ť","p","ä","m","a","o"},"l":3.605551275463989,"c":{"m":2,"o":1,"j":1,"a":2,"p":1,"ä":1,"ť":1},"t":"MyMemoryTranslate"},"MyMemory تەرجىمىسى":{"s":{"ى","س","ج","ە","r","y","ت","m","ر","م","o","e"},"l":5.5677643628300215,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":3,"م":1,"س":1},"t":"MyMemoryTranslate"},"MyMemory Translator APIa":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":7.211102550927978,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":4,"n":1,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory prevaja":{"s":{"j","p","v","r","y","m","a","o","e"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"p":1,"v":1,"a":2,"j":1},"t":"MyMemoryTranslate"},"Mymemor narjamahkeun":{"s":{"n","h","j","u","r","y","m","k","a","o","e"},"l":6.557438524302,"c":{"m":4,"y":1,"e":2,"o":1,"r":2,"n":2,"a":3,"j":1,"h":1,"k":1,"u":1},"t":"MyMemoryTranslate"},"MyMemory übersetzt":{"s":{"b","ü","t","r","y","s","m","z","o","e"},"l":5.916079783099616,"c":{"m":3,"y":2,"e":3,"o":1,"r":2,"ü":1,"b":1,"s":1,"t":2,"z":1},"t":"MyMemoryTranslate"},"ମେମୋମା ଫ୍ରେମ୍ଲେଲେଟ୍ |":{"s":{"ଫ","ା","୍","|","େ","ଟ","ଲ","ମ","ର","ୋ"},"l":7.14142842854285,"c":{"ମ":4,"େ":4,"ୋ":1,"ା":1,"ଫ":1,"୍":3,"ର":1,"ଲ":2,"ଟ":1,"|":1},"t":"MyMemoryTranslate"},"MyMemory interpres":{"s":{"n","t","p","r","y","s","m","o","e","i"},"l":6.082762530298219,"c":{"m":3,"y":2,"e":3,"o":1,"r":3,"i":1,"n":1,"t":1,"p":1,"s":1},"t":"MyMemoryTranslate"},"Mymemore":{"s":{"r","y","m","o","e"},"l":4.0,"c":{"m":3,"y":1,"e":2,"o":1,"r":1},"t":"MyMemoryTranslate"},"MyMemory Prevedi":{"s":{"d","p","v","r","y","m","o","e","i"},"l":5.5677643628300215,"c":{"m":3,"y":2,"e":3,"o":1,"r":2,"p":1,"v":1,"d":1,"i":1},"t":"MyMemoryTranslate"},"ಮೈಮೆಮರಿ ಅನುವಾದಕ ಎಪಿಐ":{"s":{"ವ","ರ","ಎ","ಕ","ಐ","ೈ","ಿ","ಅ","ನ","ಾ","ೆ","ಪ","ದ","ಮ","ು"},"l":5.0990195135927845,"c":{"ಮ":3,"ೈ":1,"ೆ":1,"ರ":1,"ಿ":2,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಕ":1,"ಎ":1,"ಪ":1,"ಐ":1},"t":"MyMemoryTranslate"},"MyMemory oversetter":{"s":{"t","v","r","y","s","m","o","e"},"l":6.928203230275509,"c":{"m":3,"y":2,"e":4,"o":2,"r":3,"v":1,"s":1,"t":2},"t":"MyMemoryTranslate"},"MyMemory μετάφραση":{"s":{"ρ","α","η","μ","φ","r","y","m","ε","σ","ά","τ","o","e"},"l":5.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"μ":1,"ε":1,"τ":1,"ά":1,"φ":1,"ρ":1,"α":1,"σ":1,"η":1},"t":"MyMemoryTranslate"},"MyMemory Traduki":{"s":{"d","t","u","r","y","m","k","a","o","e","i"},"l":5.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"t":1,"a":1,"d":1,"u":1,"k":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory tõlkija API":{"s":{"j","t","l","p","r","y","m","k","õ","a","o","e","i"},"l":5.477225575051661,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"t":1,"õ":1,"l":1,"k":1,"i":2,"j":1,"a":2,"p":1},"t":"MyMemoryTranslate"},"Người dịch MyMemory":{"s":{"g","n","h","d","c","r","y","m","ư","ị","ờ","o","e","i"},"l":5.0,"c":{"n":1,"g":1,"ư":1,"ờ":1,"i":1,"d":1,"ị":1,"c":1,"h":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Prekladateľ Mymemory":{"s":{"o","d","ľ","l","t","r","y","m","k","a","p","e"},"l":6.082762530298219,"c":{"p":1,"r":2,"e":3,"k":1,"l":1,"a":2,"d":1,"t":1,"ľ":1,"m":3,"y":2,"o":1},"t":"MyMemoryTranslate"},"Terjemahan MyMemory":{"s":{"n","h","j","t","r","y","m","a","o","e"},"l":6.48074069840786,"c":{"t":1,"e":3,"r":2,"j":1,"m":4,"a":2,"h":1,"n":1,"y":2,"o":1},"t":"MyMemoryTranslate"},"ความทรงจำของฉัน":{"s":{"ท","ค","ม","ฉ","น","ว","ง","า","จ","ำ","อ","ข","ั","ร"},"l":4.123105625617661,"c":{"ค":1,"ว":1,"า":1,"ม":1,"ท":1,"ร":1,"ง":2,"จ":1,"ำ":1,"ข":1,"อ":1,"ฉ":1,"ั":1,"น":1},"t":"MyMemoryTranslate"},"MyMemory Werger":{"s":{"g","w","r","y","m","o","e"},"l":5.830951894845301,"c":{"m":3,"y":2,"e":3,"o":1,"r":3,"w":1,"g":1},"t":"MyMemoryTranslate"},"Kujtesa ime":{"s":{"j","t","u","s","m","k","a","e","i"},"l":3.4641016151377544,"c":{"k":1,"u":1,"j":1,"t":1,"e":2,"s":1,"a":1,"i":1,"m":1},"t":"MyMemoryTranslate"},"Mi memoria":{"s":{"r","m","a","o","e","i"},"l":4.123105625617661,"c":{"m":3,"i":2,"e":1,"o":1,"r":1,"a":1},"t":"MyMemoryTranslate"},"MyMemory Humusha":{"s":{"h","u","r","y","s","m","a","o","e"},"l":5.744562646538029,"c":{"m":4,"y":2,"e":1,"o":1,"r":1,"h":2,"u":2,"s":1,"a":1},"t":"MyMemoryTranslate"},"Ჩემი მეხსიერება":{"s":{"ჩ","ბ","ს","რ","მ","ა","ხ","ე","ი"},"l":5.477225575051661,"c":{"ჩ":1,"ე":4,"მ":2,"ი":2,"ხ":1,"ს":1,"რ":1,"ბ":1,"ა":1},"t":"MyMemoryTranslate"},"میممي":{"s":{"ی","م","ي"},"l":3.3166247903554,"c":{"م":3,"ی":1,"ي":1},"t":"MyMemoryTranslate"},"Mymemory tulkotājs":{"s":{"j","t","l","u","r","y","s","m","k","o","e","ā"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":1,"o":2,"r":1,"t":2,"u":1,"l":1,"k":1,"ā":1,"j":1,"s":1},"t":"MyMemoryTranslate"},"MyMemory Penterjemah":{"s":{"n","h","j","t","p","r","y","m","a","o","e"},"l":6.855654600401044,"c":{"m":4,"y":2,"e":4,"o":1,"r":2,"p":1,"n":1,"t":1,"j":1,"a":1,"h":1},"t":"MyMemoryTranslate"},"ನನ್ನ ನೆನಪು":{"s":{"್","ನ","ೆ","ಪ","ು"},"l":5.385164807134504,"c":{"ನ":5,"್":1,"ೆ":1,"ಪ":1,"ು":1},"t":"MyMemoryTranslate"},"ਮਾਇਮੇਮੋਰੀ ਅਨੁਵਾਦਕ ਏਪੀਆਈ":{"s":{"ੀ","ਮ","ਏ","ਈ","ੇ","ਇ","ੋ","ਾ","ਕ","ਵ","ੁ","ਪ","ਰ","ਅ","ਆ","ਨ","ਦ"},"l":5.5677643628300215,"c":{"ਮ":3,"ਾ":2,"ਇ":1,"ੇ":1,"ੋ":1,"ਰ":1,"ੀ":2,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1,"ਕ":1,"ਏ":1,"ਪ":1,"ਆ":1,"ਈ":1},"t":"MyMemoryTranslate"},"Mymemory翻译器":{"s":{"器","译","r","y","m","翻","o","e"},"l":4.358898943540674,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"翻":1,"译":1,"器":1},"t":"MyMemoryTranslate"},"MyMemory Tərcümə":{"s":{"ü","t","r","y","ə","m","c","o","e"},"l":5.744562646538029,"c":{"m":4,"y":2,"e":1,"o":1,"r":2,"t":1,"ə":2,"c":1,"ü":1},"t":"MyMemoryTranslate"},"Mymemory -kääntäjä":{"s":{"n","j","t","r","y","-","m","ä","k","o","e"},"l":6.082762530298219,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"-":1,"k":1,"ä":4,"n":1,"t":1,"j":1},"t":"MyMemoryTranslate"},"د مینی ژباړونکي API":{"s":{"ب","و","ک","ی","ي","ړ","ا","م","ژ","a","p","ن","i","د"},"l":4.47213595499958,"c":{"د":1,"م":1,"ی":2,"ن":2,"ژ":1,"ب":1,"ا":1,"ړ":1,"و":1,"ک":1,"ي":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Traduttore myMemory":{"s":{"d","t","u","r","y","m","a","o","e"},"l":6.48074069840786,"c":{"t":3,"r":3,"a":1,"d":1,"u":1,"o":2,"e":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"Mymemory орчуулга":{"s":{"л","ч","а","r","y","г","m","р","о","у","o","e"},"l":5.0990195135927845,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"г":1,"а":1},"t":"MyMemoryTranslate"},"Mymemory വിവർത്തനം":{"s":{"ി","ത","വ","ർ","്","r","y","m","ം","o","e","ന"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1},"t":"MyMemoryTranslate"},"Mymemory Iwwersetzer API":{"s":{"w","t","p","r","y","s","m","z","a","o","e","i"},"l":7.211102550927978,"c":{"m":3,"y":2,"e":4,"o":1,"r":3,"i":2,"w":2,"s":1,"t":1,"z":1,"a":1,"p":1},"t":"MyMemoryTranslate"},"Mymemory аудармасы":{"s":{"р","ы","с","а","r","y","m","д","м","у","o","e"},"l":5.5677643628300215,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"а":3,"у":1,"д":1,"р":1,"м":1,"с":1,"ы":1},"t":"MyMemoryTranslate"},"mymemory翻译器API":{"s":{"器","译","p","r","y","m","翻","a","o","e","i"},"l":4.69041575982343,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"翻":1,"译":1,"器":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory Translore API":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"m":3,"y":2,"e":2,"o":2,"r":3,"t":1,"a":2,"n":1,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Isilmemory":{"s":{"l","r","y","s","m","o","e","i"},"l":3.7416573867739413,"c":{"i":2,"s":1,"l":1,"m":2,"e":1,"o":1,"r":1,"y":1},"t":"MyMemoryTranslate"},"Mymamory अनुवादक API":{"s":{"ु","p","न","अ","द","r","y","व","m","ा","क","a","o","i"},"l":5.291502622129181,"c":{"m":3,"y":2,"a":2,"o":1,"r":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"זכרוני":{"s":{"נ","י","ז","ו","ר","כ"},"l":2.449489742783178,"c":{"ז":1,"כ":1,"ר":1,"ו":1,"נ":1,"י":1},"t":"MyMemoryTranslate"},"Mymetory":{"s":{"t","r","y","m","o","e"},"l":3.4641016151377544,"c":{"m":2,"y":2,"e":1,"t":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"API перакладчыка MyMemory":{"s":{"к","л","ч","п","o","а","e","r","д","y","m","р","ы","a","p","е","i"},"l":6.244997998398398,"c":{"a":1,"p":1,"i":1,"п":1,"е":1,"р":1,"а":3,"к":2,"л":1,"д":1,"ч":1,"ы":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"МиМемори Транслате":{"s":{"н","л","и","о","с","а","р","м","е","т"},"l":5.744562646538029,"c":{"м":3,"и":2,"е":2,"о":1,"р":2,"т":2,"а":2,"н":1,"с":1,"л":1},"t":"MyMemoryTranslate"},"Umhumushi we-MyMemory":{"s":{"h","w","u","r","-","s","m","y","o","e","i"},"l":7.211102550927978,"c":{"u":3,"m":5,"h":2,"s":1,"i":1,"w":1,"e":2,"-":1,"y":2,"o":1,"r":1},"t":"MyMemoryTranslate"},"مترجم MyMemory":{"s":{"o","م","ر","ت","y","m","r","ج","e"},"l":4.795831523312719,"c":{"م":2,"ت":1,"ر":1,"ج":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"مترجم mymemory":{"s":{"o","م","ر","ت","y","m","r","ج","e"},"l":4.795831523312719,"c":{"م":2,"ت":1,"ر":1,"ج":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"MyMemy Translatortion API":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":7.14142842854285,"c":{"m":3,"y":2,"e":1,"t":3,"r":2,"a":3,"n":2,"s":1,"l":1,"o":2,"i":2,"p":1},"t":"MyMemoryTranslate"},"ಮೈಮೆಮರಿ ಅನುವಾದ":{"s":{"ವ","ರ","ೈ","ಿ","ಅ","ನ","ಾ","ೆ","ದ","ಮ","ು"},"l":4.358898943540674,"c":{"ಮ":3,"ೈ":1,"ೆ":1,"ರ":1,"ಿ":1,"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1},"t":"MyMemoryTranslate"},"Mymemory faaliliu upu":{"s":{"f","l","p","u","r","y","m","a","o","e","i"},"l":6.244997998398398,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"f":1,"a":2,"l":2,"i":2,"u":3,"p":1},"t":"MyMemoryTranslate"},"Μεταφραστής μυκήτων":{"s":{"α","ρ","ή","ν","ς","υ","μ","ε","ω","σ","κ","τ","φ"},"l":5.477225575051661,"c":{"μ":2,"ε":1,"τ":3,"α":2,"φ":1,"ρ":1,"σ":1,"ή":2,"ς":1,"υ":1,"κ":1,"ω":1,"ν":1},"t":"MyMemoryTranslate"},"Traductor de MyMemory":{"s":{"d","t","u","c","r","y","m","a","o","e"},"l":6.4031242374328485,"c":{"t":2,"r":3,"a":1,"d":2,"u":1,"c":1,"o":2,"e":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"API tat-Traduttur MyMemory":{"s":{"o","d","t","u","r","-","y","m","a","p","e","i"},"l":8.12403840463596,"c":{"a":3,"p":1,"i":1,"t":5,"-":1,"r":3,"d":1,"u":2,"m":3,"y":2,"e":1,"o":1},"t":"MyMemoryTranslate"},"ລິງໂທ":{"s":{"ລ","ໂ","ງ","ິ","ທ"},"l":2.23606797749979,"c":{"ລ":1,"ິ":1,"ງ":1,"ໂ":1,"ທ":1},"t":"MyMemoryTranslate"},"MYMEMORY -Übersetzer":{"s":{"b","ü","t","r","y","-","m","s","z","o","e"},"l":6.708203932499369,"c":{"m":3,"y":2,"e":4,"o":1,"r":3,"-":1,"ü":1,"b":1,"s":1,"t":1,"z":1},"t":"MyMemoryTranslate"},"ਮਾਈਮੇਰੀ ਅਨੁਵਾਦ":{"s":{"ੀ","ਮ","ਈ","ੇ","ਾ","ਵ","ੁ","ਰ","ਅ","ਨ","ਦ"},"l":4.123105625617661,"c":{"ਮ":2,"ਾ":2,"ਈ":1,"ੇ":1,"ਰ":1,"ੀ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਦ":1},"t":"MyMemoryTranslate"},"Mymemory translator API":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":6.708203932499369,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":3,"n":1,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Umguquleli weMemmemory":{"s":{"g","w","l","u","q","r","y","m","o","e","i"},"l":7.810249675906654,"c":{"u":3,"m":5,"g":1,"q":1,"l":2,"e":4,"i":1,"w":1,"o":1,"r":1,"y":1},"t":"MyMemoryTranslate"},"Onye ntụgharị mmmemory API":{"s":{"g","n","h","t","p","r","y","m","ụ","ị","a","o","e","i"},"l":6.855654600401044,"c":{"o":2,"n":2,"y":2,"e":2,"t":1,"ụ":1,"g":1,"h":1,"a":2,"r":2,"ị":1,"m":4,"p":1,"i":1},"t":"MyMemoryTranslate"},"Contorion":{"s":{"n","t","r","c","o","i"},"l":4.123105625617661,"c":{"c":1,"o":3,"n":2,"t":1,"r":1,"i":1},"t":"MyMemoryTranslate"},"Mymemory terjemahan":{"s":{"n","h","j","t","r","y","m","a","o","e"},"l":6.48074069840786,"c":{"m":4,"y":2,"e":3,"o":1,"r":2,"t":1,"j":1,"a":2,"h":1,"n":1},"t":"MyMemoryTranslate"},"MyMemory თარჯიმანი":{"s":{"თ","ჯ","ა","რ","მ","r","y","ნ","m","o","e","ი"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"MyMemoryTranslate"},"Az én emlékem":{"s":{"n","l","z","m","k","a","e","é"},"l":4.123105625617661,"c":{"a":1,"z":1,"é":2,"n":1,"e":2,"m":2,"l":1,"k":1},"t":"MyMemoryTranslate"},"Gyfieithydd":{"s":{"g","h","f","d","t","y","e","i"},"l":4.123105625617661,"c":{"g":1,"y":2,"f":1,"i":2,"e":1,"t":1,"h":1,"d":2},"t":"MyMemoryTranslate"},"MyMemory 번역기":{"s":{"번","기","역","r","y","m","o","e"},"l":4.358898943540674,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"번":1,"역":1,"기":1},"t":"MyMemoryTranslate"},"মাইমেমরি অনুবাদ":{"s":{"অ","ি","ু","ই","ম","ন","দ","র","ব","া","ে"},"l":4.69041575982343,"c":{"ম":3,"া":2,"ই":1,"ে":1,"র":1,"ি":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1},"t":"MyMemoryTranslate"},"Mymemory tradui":{"s":{"d","t","u","r","y","m","a","o","e","i"},"l":4.898979485566356,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"t":1,"a":1,"d":1,"u":1,"i":1},"t":"MyMemoryTranslate"},"Mina":{"s":{"a","n","i","m"},"l":2.0,"c":{"m":1,"i":1,"n":1,"a":1},"t":"MyMemoryTranslate"},"Mymemory Перевод":{"s":{"е","в","r","y","д","m","р","о","п","o","e"},"l":5.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1},"t":"MyMemoryTranslate"},"MyMemory ترجمه":{"s":{"ج","م","r","y","ت","m","ر","ه","o","e"},"l":4.58257569495584,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ت":1,"ر":1,"ج":1,"م":1,"ه":1},"t":"MyMemoryTranslate"},"Onye ntụgharị MyMemory":{"s":{"g","n","h","t","r","y","m","ụ","ị","a","o","e"},"l":6.324555320336759,"c":{"o":2,"n":2,"y":3,"e":2,"t":1,"ụ":1,"g":1,"h":1,"a":1,"r":2,"ị":1,"m":3},"t":"MyMemoryTranslate"},"Traductor mymemory":{"s":{"d","t","u","c","r","y","m","a","o","e"},"l":5.916079783099616,"c":{"t":2,"r":3,"a":1,"d":1,"u":1,"c":1,"o":2,"m":3,"y":2,"e":1},"t":"MyMemoryTranslate"},"MyMemory tradiktè API":{"s":{"è","d","t","p","r","y","m","k","a","o","e","i"},"l":5.916079783099616,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"t":2,"a":2,"d":1,"i":2,"k":1,"è":1,"p":1},"t":"MyMemoryTranslate"},"Překladatel MyMemory":{"s":{"o","d","ř","l","t","r","y","m","k","a","p","e"},"l":6.082762530298219,"c":{"p":1,"ř":1,"e":3,"k":1,"l":2,"a":2,"d":1,"t":1,"m":3,"y":2,"o":1,"r":1},"t":"MyMemoryTranslate"},"Tuhinga o mua":{"s":{"g","n","h","t","u","m","a","o","i"},"l":3.872983346207417,"c":{"t":1,"u":2,"h":1,"i":1,"n":1,"g":1,"a":2,"o":1,"m":1},"t":"ReversoTranslate"},"MyMemory prevajalec API":{"s":{"j","l","p","v","c","r","y","m","a","o","e","i"},"l":6.708203932499369,"c":{"m":3,"y":2,"e":3,"o":1,"r":2,"p":2,"v":1,"a":3,"j":1,"l":1,"c":1,"i":1},"t":"MyMemoryTranslate"},"ماميميٽر مترجم API":{"s":{"ي","p","ا","ٽ","م","ر","ت","a","ج","i"},"l":6.324555320336759,"c":{"م":5,"ا":1,"ي":2,"ٽ":1,"ر":2,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Pupulazione di mymemori":{"s":{"n","o","d","l","u","r","y","z","m","a","p","e","i"},"l":6.4031242374328485,"c":{"p":2,"u":2,"l":1,"a":1,"z":1,"i":3,"o":2,"n":1,"e":2,"d":1,"m":3,"y":1,"r":1},"t":"MyMemoryTranslate"},"MYMEMORY ແປ":{"s":{"ປ","ແ","r","y","m","o","e"},"l":4.242640687119285,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ແ":1,"ປ":1},"t":"MyMemoryTranslate"},"Mymemory turjuman Api":{"s":{"n","j","t","p","u","r","y","m","a","o","e","i"},"l":6.244997998398398,"c":{"m":4,"y":2,"e":1,"o":1,"r":2,"t":1,"u":2,"j":1,"a":2,"n":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"mymemory مترجم API":{"s":{"p","ج","م","r","y","ت","m","ر","a","o","e","i"},"l":5.0990195135927845,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"م":2,"ت":1,"ر":1,"ج":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory -kääntäjä API":{"s":{"n","j","t","p","r","y","-","m","ä","k","a","o","e","i"},"l":6.324555320336759,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"-":1,"k":1,"ä":4,"n":1,"t":1,"j":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"我的记忆":{"s":{"忆","记","我","的"},"l":2.0,"c":{"我":1,"的":1,"记":1,"忆":1},"t":"MyMemoryTranslate"},"मायमेमरी ट्रान्सलेटर एपीआय":{"s":{"े","ी","ए","प","न","्","ा","र","ट","स","ल","म","आ","य"},"l":6.928203230275509,"c":{"म":3,"ा":2,"य":2,"े":2,"र":3,"ी":2,"ट":2,"्":2,"न":1,"स":1,"ल":1,"ए":1,"प":1,"आ":1},"t":"MyMemoryTranslate"},"Myn ûnthâld":{"s":{"n","h","d","t","l","û","y","m","â"},"l":3.4641016151377544,"c":{"m":1,"y":1,"n":2,"û":1,"t":1,"h":1,"â":1,"l":1,"d":1},"t":"MyMemoryTranslate"},"Mymemory translator":{"s":{"n","t","l","r","y","s","m","a","o","e"},"l":6.164414002968976,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"Mymemor":{"s":{"r","y","m","o","e"},"l":3.605551275463989,"c":{"m":3,"y":1,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Mymemory kääntää":{"s":{"n","t","r","y","ä","m","k","o","e"},"l":5.916079783099616,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"k":1,"ä":4,"n":1,"t":1},"t":"MyMemoryTranslate"},"Mymemory თარგმნა":{"s":{"თ","ა","რ","მ","r","y","ნ","m","გ","o","e"},"l":5.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"თ":1,"ა":2,"რ":1,"გ":1,"მ":1,"ნ":1},"t":"MyMemoryTranslate"},"Turjubaan mymemory ah":{"s":{"n","b","h","j","t","u","r","y","m","a","o","e"},"l":6.082762530298219,"c":{"t":1,"u":2,"r":2,"j":1,"b":1,"a":3,"n":1,"m":3,"y":2,"e":1,"o":1,"h":1},"t":"MyMemoryTranslate"},"MyMemory تەرجىمانى API":{"s":{"ى","p","ج","ا","ە","r","y","ت","m","ر","م","ن","a","o","e","i"},"l":5.477225575051661,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory përkthen":{"s":{"ë","n","h","t","p","r","y","m","k","o","e"},"l":5.291502622129181,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"p":1,"ë":1,"k":1,"t":1,"h":1,"n":1},"t":"MyMemoryTranslate"},"Mymemory перекладати":{"s":{"к","е","л","и","а","r","y","д","m","р","п","o","e","т"},"l":5.5677643628300215,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"т":1,"и":1},"t":"MyMemoryTranslate"},"Kutanthauzira kwa mymemary":{"s":{"n","h","w","t","u","r","y","z","m","k","a","e","i"},"l":7.745966692414834,"c":{"k":2,"u":2,"t":2,"a":5,"n":1,"h":1,"z":1,"i":1,"r":2,"w":1,"m":3,"y":2,"e":1},"t":"MyMemoryTranslate"},"Mymemointer አስተርጓሚ":{"s":{"n","t","አ","ሚ","ስ","ር","r","y","m","ተ","ጓ","o","e","i"},"l":5.0,"c":{"m":3,"y":1,"e":2,"o":1,"i":1,"n":1,"t":1,"r":1,"አ":1,"ስ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1},"t":"MyMemoryTranslate"},"Aistritheoir MyMemory API":{"s":{"h","t","p","r","y","s","m","a","o","e","i"},"l":7.54983443527075,"c":{"a":2,"i":4,"s":1,"t":2,"r":3,"h":1,"e":2,"o":2,"m":3,"y":2,"p":1},"t":"MyMemoryTranslate"},"API Penerjemah MyMemory":{"s":{"n","h","o","j","r","y","m","a","p","e","i"},"l":7.280109889280518,"c":{"a":2,"p":2,"i":1,"e":4,"n":1,"r":2,"j":1,"m":4,"h":1,"y":2,"o":1},"t":"MyMemoryTranslate"},"মাইমেমরি অনুবাদক":{"s":{"অ","ি","ু","ই","ম","ন","দ","ক","র","ব","া","ে"},"l":4.795831523312719,"c":{"ম":3,"া":2,"ই":1,"ে":1,"র":1,"ি":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1,"ক":1},"t":"MyMemoryTranslate"},"Mymemory tulkotāja API":{"s":{"j","t","l","p","u","r","y","m","k","a","o","e","i","ā"},"l":5.830951894845301,"c":{"m":3,"y":2,"e":1,"o":2,"r":1,"t":2,"u":1,"l":1,"k":1,"ā":1,"j":1,"a":2,"p":1,"i":1},"t":"MyMemoryTranslate"},"Преведувач на MyMemory":{"s":{"н","ч","в","р","а","e","r","y","m","д","у","п","o","е"},"l":5.830951894845301,"c":{"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"а":2,"ч":1,"н":1,"m":3,"y":2,"e":1,"o":1,"r":1},"t":"MyMemoryTranslate"},"Mymemory ભાષાંતર":{"s":{"ા","ષ","ત","ર","ં","r","y","m","ભ","o","e"},"l":5.0,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"ભ":1,"ા":2,"ષ":1,"ં":1,"ત":1,"ર":1},"t":"MyMemoryTranslate"},"मेरी याद":{"s":{"ी","े","द","ा","र","म","य"},"l":2.6457513110645907,"c":{"म":1,"े":1,"र":1,"ी":1,"य":1,"ा":1,"द":1},"t":"MyMemoryTranslate"},"מימעמאָרי":{"s":{"י","ָ","ע","א","ר","מ"},"l":4.123105625617661,"c":{"מ":3,"י":2,"ע":1,"א":1,"ָ":1,"ר":1},"t":"MyMemoryTranslate"},"আমার স্মৃতি":{"s":{"ি","ৃ","আ","ম","ত","র","া","স","্"},"l":3.4641016151377544,"c":{"আ":1,"ম":2,"া":1,"র":1,"স":1,"্":1,"ৃ":1,"ত":1,"ি":1},"t":"MyMemoryTranslate"},"Mymemory Iwwersetzer":{"s":{"w","t","r","y","s","m","z","o","e","i"},"l":6.855654600401044,"c":{"m":3,"y":2,"e":4,"o":1,"r":3,"i":1,"w":2,"s":1,"t":1,"z":1},"t":"MyMemoryTranslate"},"Միօրինակ":{"s":{"ա","ն","օ","կ","ի","մ","ր"},"l":3.1622776601683795,"c":{"մ":1,"ի":2,"օ":1,"ր":1,"ն":1,"ա":1,"կ":1},"t":"MyMemoryTranslate"},"മൈമോറി ട്രാറ്റർ API":{"s":{"ി","i","മ","ൈ","്","ർ","ാ","ോ","ട","റ","a","p","ര"},"l":5.196152422706632,"c":{"മ":2,"ൈ":1,"ോ":1,"റ":3,"ി":1,"ട":1,"്":2,"ര":1,"ാ":1,"ർ":1,"a":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mymementy ဘာသာပြန်":{"s":{"n","ပ","t","ဘ","ာ","ြ","y","m","န","သ","e","်"},"l":5.385164807134504,"c":{"m":3,"y":2,"e":2,"n":1,"t":1,"ဘ":1,"ာ":2,"သ":1,"ပ":1,"ြ":1,"န":1,"်":1},"t":"MyMemoryTranslate"},"MyMemory vertaalt":{"s":{"t","l","v","r","y","m","a","o","e"},"l":5.656854249492381,"c":{"m":3,"y":2,"e":2,"o":1,"r":2,"v":1,"t":2,"a":2,"l":1},"t":"MyMemoryTranslate"},"API MyMemory Translator API":{"s":{"n","o","t","l","r","y","s","m","a","p","e","i"},"l":7.615773105863909,"c":{"a":4,"p":2,"i":2,"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"n":1,"s":1,"l":1},"t":"MyMemoryTranslate"},"API ya mtafsiri wa MyMemory":{"s":{"f","o","w","t","r","y","s","m","a","p","e","i"},"l":7.810249675906654,"c":{"a":4,"p":1,"i":3,"y":3,"m":4,"t":1,"f":1,"s":1,"r":2,"w":1,"e":1,"o":1},"t":"MyMemoryTranslate"},"API del traductor de mymemory":{"s":{"o","d","l","t","u","c","r","y","m","a","p","e","i"},"l":7.54983443527075,"c":{"a":2,"p":1,"i":1,"d":3,"e":3,"l":1,"t":2,"r":3,"u":1,"c":1,"o":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"MyMemytiv tarjimon":{"s":{"n","j","t","v","r","y","m","a","o","e","i"},"l":5.916079783099616,"c":{"m":4,"y":2,"e":1,"t":2,"i":2,"v":1,"a":1,"r":1,"j":1,"o":1,"n":1},"t":"MyMemoryTranslate"},"Penerjemah MyMemory":{"s":{"n","h","o","j","r","y","m","a","p","e"},"l":6.782329983125268,"c":{"p":1,"e":4,"n":1,"r":2,"j":1,"m":4,"a":1,"h":1,"y":2,"o":1},"t":"MyMemoryTranslate"},"Mymemory Fassara":{"s":{"f","r","y","s","m","a","o","e"},"l":5.744562646538029,"c":{"m":3,"y":2,"e":1,"o":1,"r":2,"f":1,"a":3,"s":2},"t":"MyMemoryTranslate"},"Mano atmintis":{"s":{"n","t","s","m","a","o","i"},"l":4.69041575982343,"c":{"m":2,"a":2,"n":2,"o":1,"t":2,"i":2,"s":1},"t":"MyMemoryTranslate"},"MyMemory Translator Api":{"s":{"n","t","l","p","r","y","s","m","a","o","e","i"},"l":6.708203932499369,"c":{"m":3,"y":2,"e":1,"o":2,"r":3,"t":2,"a":3,"n":1,"s":1,"l":1,"p":1,"i":1},"t":"MyMemoryTranslate"},"Mofetoleli oa MyMemory Api":{"s":{"f","t","l","p","r","y","m","a","o","e","i"},"l":7.810249675906654,"c":{"m":4,"o":4,"f":1,"e":3,"t":1,"l":2,"i":2,"a":2,"y":2,"r":1,"p":1},"t":"MyMemoryTranslate"},"Aistritheoir MyMemory":{"s":{"h","t","r","y","s","m","a","o","e","i"},"l":6.782329983125268,"c":{"a":1,"i":3,"s":1,"t":2,"r":3,"h":1,"e":2,"o":2,"m":3,"y":2},"t":"MyMemoryTranslate"},"Моје сећање":{"s":{"њ","о","с","а","ћ","ј","м","е"},"l":4.0,"c":{"м":1,"о":1,"ј":1,"е":3,"с":1,"ћ":1,"а":1,"њ":1},"t":"MyMemoryTranslate"},"Eadar-theangachadh Mymeay":{"s":{"g","n","h","d","t","c","r","-","y","m","a","e"},"l":8.48528137423857,"c":{"e":3,"a":6,"d":2,"r":1,"-":1,"t":1,"h":3,"n":1,"g":1,"c":1,"m":2,"y":2},"t":"MyMemoryTranslate"},"MyMemory mushanduri":{"s":{"n","h","d","u","r","y","s","m","a","o","e","i"},"l":6.0,"c":{"m":4,"y":2,"e":1,"o":1,"r":2,"u":2,"s":1,"h":1,"a":1,"n":1,"d":1,"i":1},"t":"MyMemoryTranslate"},"MyMemory преводач":{"s":{"е","ч","в","а","r","y","д","m","р","о","п","o","e"},"l":4.898979485566356,"c":{"m":3,"y":2,"e":1,"o":1,"r":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"а":1,"ч":1},"t":"MyMemoryTranslate"},"„MyMemory“ vertėjas":{"s":{"„","j","“","t","v","r","y","s","m","a","o","e","ė"},"l":5.477225575051661,"c":{"„":1,"m":3,"y":2,"e":2,"o":1,"r":2,"“":1,"v":1,"t":1,"ė":1,"j":1,"a":1,"s":1},"t":"MyMemoryTranslate"},"ରେଭର୍ସୋ ଅନୁବାଦକ |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","େ","|","ସ","ର","ଅ","ଭ","ୋ","କ"},"l":4.123105625617661,"c":{"ର":2,"େ":1,"ଭ":1,"୍":1,"ସ":1,"ୋ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"|":1},"t":"ReversoTranslate"},"Tradutor de reverso":{"s":{"d","t","v","u","r","s","a","o","e"},"l":6.4031242374328485,"c":{"t":2,"r":4,"a":1,"d":2,"u":1,"o":2,"e":3,"v":1,"s":1},"t":"ReversoTranslate"},"ပြန်ပြောင်း":{"s":{"ပ","ာ","င","န","ြ","း","ေ","်"},"l":4.123105625617661,"c":{"ပ":2,"ြ":2,"န":1,"်":2,"ေ":1,"ာ":1,"င":1,"း":1},"t":"ReversoTranslate"},"Reverso dịch":{"s":{"h","d","v","r","s","ị","c","o","e"},"l":3.872983346207417,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"d":1,"ị":1,"c":1,"h":1},"t":"ReversoTranslate"},"API du traducteur reverso":{"s":{"o","d","t","v","u","c","r","s","a","p","e","i"},"l":7.211102550927978,"c":{"a":2,"p":1,"i":1,"d":2,"u":3,"t":2,"r":4,"c":1,"e":3,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso Tafsiri":{"s":{"f","t","v","r","s","a","o","e","i"},"l":5.0990195135927845,"c":{"r":3,"e":2,"v":1,"s":2,"o":1,"t":1,"a":1,"f":1,"i":2},"t":"ReversoTranslate"},"API перакладчыка Reverso":{"s":{"к","л","ч","п","o","v","а","e","r","д","s","р","ы","a","p","е","i"},"l":5.830951894845301,"c":{"a":1,"p":1,"i":1,"п":1,"е":1,"р":1,"а":3,"к":2,"л":1,"д":1,"ч":1,"ы":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Реверсо преводилац":{"s":{"л","и","в","с","а","д","р","о","п","ц","е"},"l":5.744562646538029,"c":{"р":3,"е":3,"в":2,"с":1,"о":2,"п":1,"д":1,"и":1,"л":1,"а":1,"ц":1},"t":"ReversoTranslate"},"रिव्हर्सो ट्रान्सलेटर एपीआय":{"s":{"े","ी","ो","ह","ए","प","ि","न","्","ा","र","स","ट","ल","व","आ","य"},"l":7.280109889280518,"c":{"र":4,"ि":1,"व":1,"्":4,"ह":1,"स":2,"ो":1,"ट":2,"ा":1,"न":1,"ल":1,"े":1,"ए":1,"प":1,"ी":1,"आ":1,"य":1},"t":"ReversoTranslate"},"Eadar-theangair Reverso Eadar-theangaiche":{"s":{"g","n","h","d","t","v","c","r","-","s","a","o","e","i"},"l":13.228756555322953,"c":{"e":7,"a":8,"d":2,"r":5,"-":2,"t":2,"h":3,"n":2,"g":2,"i":2,"v":1,"s":1,"o":1,"c":1},"t":"ReversoTranslate"},"លោក Reverso":{"s":{"ក","v","ល","r","ោ","s","o","e"},"l":3.7416573867739413,"c":{"ល":1,"ោ":1,"ក":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"রিভার্সো":{"s":{"ি","ভ","র","া","স","ো","্"},"l":3.1622776601683795,"c":{"র":2,"ি":1,"ভ":1,"া":1,"্":1,"স":1,"ো":1},"t":"ReversoTranslate"},"Reverso превод":{"s":{"е","в","v","r","д","s","р","о","п","o","e"},"l":4.123105625617661,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1},"t":"ReversoTranslate"},"API مترجم Reverso":{"s":{"o","v","ج","م","ر","ت","r","s","a","p","e","i"},"l":4.58257569495584,"c":{"a":1,"p":1,"i":1,"م":2,"ت":1,"ر":1,"ج":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Kääntää":{"s":{"k","n","ä","t"},"l":4.358898943540674,"c":{"k":1,"ä":4,"n":1,"t":1},"t":"ReversoTranslate"},"レベルソ":{"s":{"ル","ソ","レ","ベ"},"l":2.0,"c":{"レ":1,"ベ":1,"ル":1,"ソ":1},"t":"ReversoTranslate"},"Reverso котормочу":{"s":{"к","ч","м","v","r","s","р","о","у","o","e","т"},"l":5.0990195135927845,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"к":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1},"t":"ReversoTranslate"},"Revendo":{"s":{"n","d","v","r","o","e"},"l":3.0,"c":{"r":1,"e":2,"v":1,"n":1,"d":1,"o":1},"t":"ReversoTranslate"},"Reverso traduce":{"s":{"d","t","v","u","c","r","s","a","o","e"},"l":5.0990195135927845,"c":{"r":3,"e":3,"v":1,"s":1,"o":1,"t":1,"a":1,"d":1,"u":1,"c":1},"t":"ReversoTranslate"},"ରେଭର୍ସୋ |":{"s":{"୍","|","େ","ସ","ର","ଭ","ୋ"},"l":3.1622776601683795,"c":{"ର":2,"େ":1,"ଭ":1,"୍":1,"ସ":1,"ୋ":1,"|":1},"t":"ReversoTranslate"},"Rarerso тарҷума":{"s":{"м","а","r","s","р","ҷ","у","a","o","e","т"},"l":4.69041575982343,"c":{"r":3,"a":1,"e":1,"s":1,"o":1,"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1},"t":"ReversoTranslate"},"Перекладач Реверсо":{"s":{"к","л","ч","в","с","а","д","р","о","п","е"},"l":6.082762530298219,"c":{"п":1,"е":4,"р":3,"к":1,"л":1,"а":2,"д":1,"ч":1,"в":1,"с":1,"о":1},"t":"ReversoTranslate"},"Реверсо переводчик":{"s":{"к","ч","и","в","с","д","р","о","п","е"},"l":6.244997998398398,"c":{"р":3,"е":4,"в":2,"с":1,"о":2,"п":1,"д":1,"ч":1,"и":1,"к":1},"t":"ReversoTranslate"},"REVERSO Translator API":{"s":{"n","t","l","v","p","r","s","a","o","e","i"},"l":6.782329983125268,"c":{"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":3,"n":1,"l":1,"p":1,"i":1},"t":"ReversoTranslate"},"Reverso tərcümə":{"s":{"ü","t","v","r","ə","s","m","c","o","e"},"l":4.898979485566356,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":1,"ə":2,"c":1,"ü":1,"m":1},"t":"ReversoTranslate"},"နောက်ဆက်တွဲ":{"s":{"ဲ","ာ","က","ဆ","တ","န","ွ","ေ","်"},"l":3.872983346207417,"c":{"န":1,"ေ":1,"ာ":1,"က":2,"်":2,"ဆ":1,"တ":1,"ွ":1,"ဲ":1},"t":"ReversoTranslate"},"Reverso fordító API":{"s":{"ó","f","d","t","v","í","p","r","s","a","o","e","i"},"l":5.196152422706632,"c":{"r":3,"e":2,"v":1,"s":1,"o":2,"f":1,"d":1,"í":1,"t":1,"ó":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"API Penerjemah Reverso":{"s":{"n","h","o","j","v","r","s","m","a","p","e","i"},"l":7.0710678118654755,"c":{"a":2,"p":2,"i":1,"e":5,"n":1,"r":3,"j":1,"m":1,"h":1,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"ರಿವರ್ಸೊ ಅನುವಾದಕ API":{"s":{"ವ","ರ","a","ಸ","ಕ","ಿ","್","ಅ","ೊ","ನ","ಾ","ದ","p","ು","i"},"l":4.58257569495584,"c":{"ರ":2,"ಿ":1,"ವ":2,"್":1,"ಸ":1,"ೊ":1,"ಅ":1,"ನ":1,"ು":1,"ಾ":1,"ದ":1,"ಕ":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"വിപരീത വിവർത്തക API":{"s":{"ി","i","ത","ീ","വ","ർ","്","ക","പ","a","p","ര"},"l":5.5677643628300215,"c":{"വ":3,"ി":2,"പ":1,"ര":1,"ീ":1,"ത":3,"ർ":1,"്":1,"ക":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Reverso traduire":{"s":{"d","t","v","u","r","s","a","o","e","i"},"l":5.744562646538029,"c":{"r":4,"e":3,"v":1,"s":1,"o":1,"t":1,"a":1,"d":1,"u":1,"i":1},"t":"ReversoTranslate"},"Reverso Котор":{"s":{"к","v","r","s","р","о","o","e","т"},"l":4.242640687119285,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"к":1,"о":2,"т":1,"р":1},"t":"ReversoTranslate"},"Refer transtor Api":{"s":{"n","f","t","p","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"r":4,"e":2,"f":1,"t":2,"a":2,"n":1,"s":1,"o":1,"p":1,"i":1},"t":"ReversoTranslate"},"Реверсо преведувач":{"s":{"ч","в","с","а","д","р","о","у","п","е"},"l":6.4031242374328485,"c":{"р":3,"е":4,"в":3,"с":1,"о":1,"п":1,"д":1,"у":1,"а":1,"ч":1},"t":"ReversoTranslate"},"API tat-Traduttur Reverso":{"s":{"o","d","t","v","u","r","-","s","a","p","e","i"},"l":8.06225774829855,"c":{"a":3,"p":1,"i":1,"t":5,"-":1,"r":4,"d":1,"u":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso vertaler":{"s":{"t","l","v","r","s","a","o","e"},"l":6.4031242374328485,"c":{"r":4,"e":4,"v":2,"s":1,"o":1,"t":1,"a":1,"l":1},"t":"ReversoTranslate"},"Reverso -vertaler":{"s":{"t","l","v","r","-","s","a","o","e"},"l":6.48074069840786,"c":{"r":4,"e":4,"v":2,"s":1,"o":1,"-":1,"t":1,"a":1,"l":1},"t":"ReversoTranslate"},"Cyfieithydd Reverso":{"s":{"h","f","d","t","v","r","y","s","c","o","e","i"},"l":5.656854249492381,"c":{"c":1,"y":2,"f":1,"i":2,"e":3,"t":1,"h":1,"d":2,"r":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Haere atu":{"s":{"h","t","u","r","a","e"},"l":3.4641016151377544,"c":{"h":1,"a":2,"e":2,"r":1,"t":1,"u":1},"t":"ReversoTranslate"},"Penerjemah Reverso":{"s":{"n","h","o","j","v","r","s","m","a","p","e"},"l":6.557438524302,"c":{"p":1,"e":5,"n":1,"r":3,"j":1,"m":1,"a":1,"h":1,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reversre traduci":{"s":{"d","t","v","u","c","r","s","a","e","i"},"l":5.744562646538029,"c":{"r":4,"e":3,"v":1,"s":1,"t":1,"a":1,"d":1,"u":1,"c":1,"i":1},"t":"ReversoTranslate"},"Reverso itzultzailea APIa":{"s":{"t","l","v","p","u","r","s","z","a","o","e","i"},"l":7.416198487095663,"c":{"r":2,"e":3,"v":1,"s":1,"o":1,"i":3,"t":2,"z":2,"u":1,"l":2,"a":4,"p":1},"t":"ReversoTranslate"},"Trenso tumọ":{"s":{"n","t","u","r","s","m","ọ","o","e"},"l":3.4641016151377544,"c":{"t":2,"r":1,"e":1,"n":1,"s":1,"o":1,"u":1,"m":1,"ọ":1},"t":"ReversoTranslate"},"Реверсо переводит":{"s":{"и","в","с","д","р","о","п","е","т"},"l":6.164414002968976,"c":{"р":3,"е":4,"в":2,"с":1,"о":2,"п":1,"д":1,"и":1,"т":1},"t":"ReversoTranslate"},"Reverso vertaal":{"s":{"t","l","v","r","s","a","o","e"},"l":5.477225575051661,"c":{"r":3,"e":3,"v":2,"s":1,"o":1,"t":1,"a":2,"l":1},"t":"ReversoTranslate"},"Kudzoreredza Turuki API":{"s":{"d","t","p","u","r","z","k","a","o","e","i"},"l":6.708203932499369,"c":{"k":2,"u":3,"d":2,"z":2,"o":1,"r":3,"e":2,"a":2,"t":1,"i":2,"p":1},"t":"ReversoTranslate"},"Reverso þýðandi":{"s":{"þ","ð","n","d","ý","v","r","s","a","o","e","i"},"l":4.242640687119285,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"þ":1,"ý":1,"ð":1,"a":1,"n":1,"d":1,"i":1},"t":"ReversoTranslate"},"API на Reverso Translator":{"s":{"н","n","o","t","l","v","а","r","s","a","p","e","i"},"l":6.928203230275509,"c":{"a":3,"p":1,"i":1,"н":1,"а":1,"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"n":1,"l":1},"t":"ReversoTranslate"},"Reverso ترجمه":{"s":{"v","ج","م","r","ت","s","ر","ه","o","e"},"l":4.0,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"ت":1,"ر":1,"ج":1,"م":1,"ه":1},"t":"ReversoTranslate"},"تەرجىمان":{"s":{"ى","ا","ە","ر","ت","م","ج","ن"},"l":2.8284271247461903,"c":{"ت":1,"ە":1,"ر":1,"ج":1,"ى":1,"م":1,"ا":1,"ن":1},"t":"ReversoTranslate"},"د ریګیس ژباړونکي API":{"s":{"ب","و","ک","ی","ي","ړ","س","ا","ر","ن","ژ","a","p","ګ","i","د"},"l":4.358898943540674,"c":{"د":1,"ر":1,"ی":2,"ګ":1,"س":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"و":1,"ن":1,"ک":1,"ي":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Reverse traduce":{"s":{"d","t","v","u","c","r","s","a","e"},"l":5.656854249492381,"c":{"r":3,"e":4,"v":1,"s":1,"t":1,"a":1,"d":1,"u":1,"c":1},"t":"ReversoTranslate"},"Reverso tradwi":{"s":{"d","w","t","v","r","s","a","o","e","i"},"l":4.58257569495584,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":1,"a":1,"d":1,"w":1,"i":1},"t":"ReversoTranslate"},"Womasulira womasulira":{"s":{"w","l","u","r","s","m","a","o","i"},"l":6.928203230275509,"c":{"w":2,"o":2,"m":2,"a":4,"s":2,"u":2,"l":2,"i":2,"r":2},"t":"ReversoTranslate"},"Reverso Tarjamahkeun API":{"s":{"n","h","j","t","v","p","u","r","s","m","k","a","o","e","i"},"l":6.782329983125268,"c":{"r":3,"e":3,"v":1,"s":1,"o":1,"t":1,"a":4,"j":1,"m":1,"h":1,"k":1,"u":1,"n":1,"p":1,"i":1},"t":"ReversoTranslate"},"רעווערסאָ יבערזעצער":{"s":{"י","ב","ָ","ע","ז","צ","ס","א","ר","ו"},"l":7.211102550927978,"c":{"ר":4,"ע":5,"ו":2,"ס":1,"א":1,"ָ":1,"י":1,"ב":1,"ז":1,"צ":1},"t":"ReversoTranslate"},"API μεταφραστή Reverso":{"s":{"τ","α","ρ","ή","o","v","μ","φ","r","s","ε","σ","a","p","e","i"},"l":5.291502622129181,"c":{"a":1,"p":1,"i":1,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso tradutor":{"s":{"d","t","v","u","r","s","a","o","e"},"l":5.744562646538029,"c":{"r":4,"e":2,"v":1,"s":1,"o":2,"t":2,"a":1,"d":1,"u":1},"t":"ReversoTranslate"},"API i përkthyesit të kthyeshëm":{"s":{"ë","h","t","r","y","s","m","k","a","p","e","i"},"l":8.12403840463596,"c":{"a":1,"p":2,"i":3,"ë":3,"r":1,"k":2,"t":4,"h":3,"y":2,"e":2,"s":2,"m":1},"t":"ReversoTranslate"},"Reverso преведувач API":{"s":{"a","е","ч","в","v","p","а","r","д","s","р","у","п","o","e","i"},"l":5.291502622129181,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"п":1,"р":1,"е":2,"в":2,"д":1,"у":1,"а":1,"ч":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Kudzokorora Dudziro":{"s":{"d","u","r","z","k","a","o","i"},"l":6.928203230275509,"c":{"k":2,"u":2,"d":3,"z":2,"o":4,"r":3,"a":1,"i":1},"t":"ReversoTranslate"},"REBRSO Whakawhiti":{"s":{"b","h","w","t","r","s","k","a","o","e","i"},"l":5.0990195135927845,"c":{"r":2,"e":1,"b":1,"s":1,"o":1,"w":2,"h":2,"a":2,"k":1,"i":2,"t":1},"t":"ReversoTranslate"},"API перекладача Reverso":{"s":{"к","л","ч","п","o","v","а","e","r","д","s","р","a","p","е","i"},"l":5.744562646538029,"c":{"a":1,"p":1,"i":1,"п":1,"е":2,"р":1,"к":1,"л":1,"а":3,"д":1,"ч":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso translator API":{"s":{"n","t","l","v","p","r","s","a","o","e","i"},"l":6.782329983125268,"c":{"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":3,"n":1,"l":1,"p":1,"i":1},"t":"ReversoTranslate"},"Trình dịch Reverso":{"s":{"n","ì","h","d","t","v","r","s","ị","c","o","e"},"l":5.0990195135927845,"c":{"t":1,"r":3,"ì":1,"n":1,"h":2,"d":1,"ị":1,"c":1,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso翻译":{"s":{"v","译","r","s","翻","o","e"},"l":3.605551275463989,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"翻":1,"译":1},"t":"ReversoTranslate"},"Reverso -oversetter":{"s":{"t","v","r","-","s","o","e"},"l":7.615773105863909,"c":{"r":4,"e":5,"v":2,"s":2,"o":2,"-":1,"t":2},"t":"ReversoTranslate"},"ريورسو ترجمو":{"s":{"و","ي","س","م","ر","ت","ج"},"l":4.795831523312719,"c":{"ر":3,"ي":1,"و":3,"س":1,"ت":1,"ج":1,"م":1},"t":"ReversoTranslate"},"Reverso -tradukisto API":{"s":{"d","t","v","p","u","r","-","s","k","a","o","e","i"},"l":6.244997998398398,"c":{"r":3,"e":2,"v":1,"s":2,"o":2,"-":1,"t":2,"a":2,"d":1,"u":1,"k":1,"i":2,"p":1},"t":"ReversoTranslate"},"Traducător reverso":{"s":{"o","d","t","v","u","c","r","s","a","ă","e"},"l":5.916079783099616,"c":{"t":2,"r":4,"a":1,"d":1,"u":1,"c":1,"ă":1,"o":2,"e":2,"v":1,"s":1},"t":"ReversoTranslate"},"Omkearing":{"s":{"g","n","r","m","k","a","o","e","i"},"l":3.0,"c":{"o":1,"m":1,"k":1,"e":1,"a":1,"r":1,"i":1,"n":1,"g":1},"t":"ReversoTranslate"},"レベルソ翻訳者":{"s":{"ル","ソ","ベ","者","翻","訳","レ"},"l":2.6457513110645907,"c":{"レ":1,"ベ":1,"ル":1,"ソ":1,"翻":1,"訳":1,"者":1},"t":"ReversoTranslate"},"Traductor de reverso":{"s":{"d","t","v","u","c","r","s","a","o","e"},"l":6.48074069840786,"c":{"t":2,"r":4,"a":1,"d":2,"u":1,"c":1,"o":2,"e":3,"v":1,"s":1},"t":"ReversoTranslate"},"Rarrivero тарҷумон":{"s":{"н","м","о","v","а","r","р","ҷ","у","a","o","e","i","т"},"l":5.385164807134504,"c":{"r":4,"a":1,"i":1,"v":1,"e":1,"o":1,"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1},"t":"ReversoTranslate"},"Ressosso sliverlator ap":{"s":{"l","t","v","p","r","s","a","o","e","i"},"l":7.681145747868608,"c":{"r":3,"e":2,"s":5,"o":3,"l":2,"i":1,"v":1,"a":2,"t":1,"p":1},"t":"ReversoTranslate"},"Kudzora muturikiri":{"s":{"d","t","u","r","z","m","k","a","o","i"},"l":6.082762530298219,"c":{"k":2,"u":3,"d":1,"z":1,"o":1,"r":3,"a":1,"m":1,"t":1,"i":3},"t":"ReversoTranslate"},"Wiki Swtor":{"s":{"w","t","r","s","k","o","i"},"l":3.605551275463989,"c":{"w":2,"i":2,"k":1,"s":1,"t":1,"o":1,"r":1},"t":"ReversoTranslate"},"Reverso tradiktè API":{"s":{"è","d","t","v","p","r","s","k","a","o","e","i"},"l":5.656854249492381,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":2,"a":2,"d":1,"i":2,"k":1,"è":1,"p":1},"t":"ReversoTranslate"},"ರಿವರ್ಸೊ ಭಾಷಾಂತರಕಾರ":{"s":{"ವ","ರ","ಸ","ಕ","ಿ","್","ೊ","ಭ","ಂ","ತ","ಾ","ಷ"},"l":5.916079783099616,"c":{"ರ":4,"ಿ":1,"ವ":1,"್":1,"ಸ":1,"ೊ":1,"ಭ":1,"ಾ":3,"ಷ":1,"ಂ":1,"ತ":1,"ಕ":1},"t":"ReversoTranslate"},"Omasulira Omasulira API":{"s":{"l","p","u","r","s","m","a","o","i"},"l":7.681145747868608,"c":{"o":2,"m":2,"a":5,"s":2,"u":2,"l":2,"i":3,"r":2,"p":1},"t":"ReversoTranslate"},"रेवर्सो अनुवाद":{"s":{"े","ो","ु","न","्","अ","द","ा","स","र","व"},"l":4.123105625617661,"c":{"र":2,"े":1,"व":2,"्":1,"स":1,"ो":1,"अ":1,"न":1,"ु":1,"ा":1,"द":1},"t":"ReversoTranslate"},"რევერსო თარგმნა":{"s":{"თ","ო","ს","რ","ა","მ","ე","ნ","ვ","გ"},"l":4.898979485566356,"c":{"რ":3,"ე":2,"ვ":1,"ს":1,"ო":1,"თ":1,"ა":2,"გ":1,"მ":1,"ნ":1},"t":"ReversoTranslate"},"רעווערסאָ איבערזעצער אַפּי":{"s":{"י","ב","ָ","ע","ז","צ","פ","ס","ּ","ַ","א","ר","ו"},"l":8.12403840463596,"c":{"ר":4,"ע":5,"ו":2,"ס":1,"א":3,"ָ":1,"י":2,"ב":1,"ז":1,"צ":1,"ַ":1,"פ":1,"ּ":1},"t":"ReversoTranslate"},"રિવર્સો ભાષાંતર કરે છે":{"s":{"સ","ા","ષ","ત","્","િ","ર","ક","ે","ં","ો","છ","ભ","વ"},"l":5.916079783099616,"c":{"ર":4,"િ":1,"વ":1,"્":1,"સ":1,"ો":1,"ભ":1,"ા":2,"ષ":1,"ં":1,"ત":1,"ક":1,"ે":2,"છ":1},"t":"ReversoTranslate"},"Reverso Iwwersetzer":{"s":{"w","t","v","r","s","z","o","e","i"},"l":7.3484692283495345,"c":{"r":4,"e":5,"v":1,"s":2,"o":1,"i":1,"w":2,"t":1,"z":1},"t":"ReversoTranslate"},"Reverso орчуулах":{"s":{"л","ч","v","а","r","s","р","о","у","o","e","х"},"l":4.58257569495584,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"о":1,"р":1,"ч":1,"у":2,"л":1,"а":1,"х":1},"t":"ReversoTranslate"},"Reverso -kääntäjän sovellusliittymä":{"s":{"n","j","t","l","v","u","r","-","s","ä","y","m","k","o","e","i"},"l":9.327379053088816,"c":{"r":2,"e":3,"v":2,"s":3,"o":2,"-":1,"k":1,"ä":5,"n":2,"t":3,"j":1,"l":3,"u":1,"i":2,"y":1,"m":1},"t":"ReversoTranslate"},"Reverso tulkot":{"s":{"t","l","v","u","r","s","k","o","e"},"l":4.58257569495584,"c":{"r":2,"e":2,"v":1,"s":1,"o":2,"t":2,"u":1,"l":1,"k":1},"t":"ReversoTranslate"},"Onitumọ rẹ":{"s":{"n","t","u","r","ẹ","ọ","m","o","i"},"l":3.0,"c":{"o":1,"n":1,"i":1,"t":1,"u":1,"m":1,"ọ":1,"r":1,"ẹ":1},"t":"ReversoTranslate"},"Reverso译者":{"s":{"v","译","r","者","s","o","e"},"l":3.605551275463989,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"译":1,"者":1},"t":"ReversoTranslate"},"I-reves iguqulela":{"s":{"g","l","v","u","q","r","-","s","a","e","i"},"l":5.291502622129181,"c":{"i":2,"-":1,"r":1,"e":3,"v":1,"s":1,"g":1,"u":2,"q":1,"l":2,"a":1},"t":"ReversoTranslate"},"Prekladateľ reversu":{"s":{"d","ľ","l","t","v","u","r","s","k","a","p","e"},"l":6.164414002968976,"c":{"p":1,"r":3,"e":4,"k":1,"l":1,"a":2,"d":1,"t":1,"ľ":1,"v":1,"s":1,"u":1},"t":"ReversoTranslate"},"Reverso fassara api":{"s":{"f","v","p","r","s","a","o","e","i"},"l":6.557438524302,"c":{"r":3,"e":2,"v":1,"s":3,"o":1,"f":1,"a":4,"p":1,"i":1},"t":"ReversoTranslate"},"Reverso jittraduċi":{"s":{"j","d","t","v","u","r","ċ","s","a","o","e","i"},"l":5.385164807134504,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"j":1,"i":2,"t":2,"a":1,"d":1,"u":1,"ċ":1},"t":"ReversoTranslate"},"রিভার্সো অনুবাদ":{"s":{"অ","ি","ভ","ু","ন","দ","র","ব","া","স","ো","্"},"l":4.242640687119285,"c":{"র":2,"ি":1,"ভ":1,"া":2,"্":1,"স":1,"ো":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1},"t":"ReversoTranslate"},"Refer protor":{"s":{"f","t","p","r","o","e"},"l":5.196152422706632,"c":{"r":4,"e":2,"f":1,"p":1,"o":2,"t":1},"t":"ReversoTranslate"},"Reverso translate":{"s":{"n","t","l","v","r","s","a","o","e"},"l":5.830951894845301,"c":{"r":3,"e":3,"v":1,"s":2,"o":1,"t":2,"a":2,"n":1,"l":1},"t":"ReversoTranslate"},"വിപരീത വിവർത്തനം":{"s":{"ി","ത","ീ","വ","ർ","്","പ","ം","ര","ന"},"l":5.385164807134504,"c":{"വ":3,"ി":2,"പ":1,"ര":1,"ീ":1,"ത":3,"ർ":1,"്":1,"ന":1,"ം":1},"t":"ReversoTranslate"},"Reverso tõlge":{"s":{"g","t","l","v","r","s","õ","o","e"},"l":4.47213595499958,"c":{"r":2,"e":3,"v":1,"s":1,"o":1,"t":1,"õ":1,"l":1,"g":1},"t":"ReversoTranslate"},"Ukuphimbuka":{"s":{"h","b","u","m","k","a","p","i"},"l":4.358898943540674,"c":{"u":3,"k":2,"p":1,"h":1,"i":1,"m":1,"b":1,"a":1},"t":"ReversoTranslate"},"Traduttore in reverso":{"s":{"n","d","t","v","u","r","s","a","o","e","i"},"l":6.708203932499369,"c":{"t":3,"r":4,"a":1,"d":1,"u":1,"o":2,"e":3,"i":1,"n":1,"v":1,"s":1},"t":"ReversoTranslate"},"Hertero":{"s":{"h","t","r","o","e"},"l":3.3166247903554,"c":{"h":1,"e":2,"r":2,"t":1,"o":1},"t":"ReversoTranslate"},"I-Reves Transotor Translator API":{"s":{"n","t","l","v","p","r","-","s","a","o","e","i"},"l":9.539392014169456,"c":{"i":2,"-":1,"r":5,"e":2,"v":1,"s":3,"t":4,"a":4,"n":2,"o":3,"l":1,"p":1},"t":"ReversoTranslate"},"Reverso аудармасы":{"s":{"р","ы","v","с","а","r","s","д","м","у","o","e"},"l":5.0990195135927845,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"а":3,"у":1,"д":1,"р":1,"м":1,"с":1,"ы":1},"t":"ReversoTranslate"},"Реверсо":{"s":{"в","с","р","о","е"},"l":3.3166247903554,"c":{"р":2,"е":2,"в":1,"с":1,"о":1},"t":"ReversoTranslate"},"Aistritheoir Reverso":{"s":{"h","t","v","r","s","a","o","e","i"},"l":7.0,"c":{"a":1,"i":3,"s":2,"t":2,"r":4,"h":1,"e":3,"o":2,"v":1},"t":"ReversoTranslate"},"Reverso eadar-theangaire api":{"s":{"g","n","h","d","t","v","p","r","-","s","a","o","e","i"},"l":8.94427190999916,"c":{"r":4,"e":5,"v":1,"s":1,"o":1,"a":5,"d":1,"-":1,"t":1,"h":1,"n":1,"g":1,"i":2,"p":1},"t":"ReversoTranslate"},"ரெவர்சோ":{"s":{"வ","ச","ெ","ர","்","ோ"},"l":3.0,"c":{"ர":2,"ெ":1,"வ":1,"்":1,"ச":1,"ோ":1},"t":"ReversoTranslate"},"রিভার্সো অনুবাদক":{"s":{"অ","ি","ভ","ু","ন","দ","ক","র","ব","া","স","ো","্"},"l":4.358898943540674,"c":{"র":2,"ি":1,"ভ":1,"া":2,"্":1,"স":1,"ো":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1,"ক":1},"t":"ReversoTranslate"},"การพลิกกลับ":{"s":{"ล","พ","า","ก","ิ","บ","ั","ร"},"l":4.358898943540674,"c":{"ก":3,"า":1,"ร":1,"พ":1,"ล":2,"ิ":1,"ั":1,"บ":1},"t":"ReversoTranslate"},"Reverso는 번역합니다":{"s":{"번","다","v","는","역","r","s","합","니","o","e"},"l":4.123105625617661,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"는":1,"번":1,"역":1,"합":1,"니":1,"다":1},"t":"ReversoTranslate"},"ಪ್ರತಿಧ್ವನಿ":{"s":{"ವ","ರ","ಿ","್","ಧ","ತ","ನ","ಪ"},"l":3.7416573867739413,"c":{"ಪ":1,"್":2,"ರ":1,"ತ":1,"ಿ":2,"ಧ":1,"ವ":1,"ನ":1},"t":"ReversoTranslate"},"ريورسو مترجم":{"s":{"و","ي","س","م","ر","ت","ج"},"l":4.58257569495584,"c":{"ر":3,"ي":1,"و":2,"س":1,"م":2,"ت":1,"ج":1},"t":"ReversoTranslate"},"Reverso μεταφράζεται":{"s":{"α","ρ","ι","v","μ","φ","r","s","ε","ά","τ","o","e","ζ"},"l":5.385164807134504,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"μ":1,"ε":2,"τ":2,"α":2,"φ":1,"ρ":1,"ά":1,"ζ":1,"ι":1},"t":"ReversoTranslate"},"Перакладчык Reverso":{"s":{"к","л","ч","v","а","e","r","д","s","р","ы","п","o","е"},"l":5.0990195135927845,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Raverso":{"s":{"v","r","s","a","o","e"},"l":3.0,"c":{"r":2,"a":1,"v":1,"e":1,"s":1,"o":1},"t":"ReversoTranslate"},"Repro":{"s":{"r","p","e","o"},"l":2.6457513110645907,"c":{"r":2,"e":1,"p":1,"o":1},"t":"ReversoTranslate"},"Inverso":{"s":{"n","v","r","s","o","e","i"},"l":2.6457513110645907,"c":{"i":1,"n":1,"v":1,"e":1,"r":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso TransLator Api":{"s":{"n","t","l","v","p","r","s","a","o","e","i"},"l":6.782329983125268,"c":{"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":3,"n":1,"l":1,"p":1,"i":1},"t":"ReversoTranslate"},"Umhumushi weReverso":{"s":{"h","w","v","u","r","s","m","o","e","i"},"l":6.164414002968976,"c":{"u":3,"m":2,"h":2,"s":2,"i":1,"w":1,"e":3,"r":2,"v":1,"o":1},"t":"ReversoTranslate"},"ରେଭର୍ସୋ ଅନୁବାଦ |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","େ","|","ସ","ର","ଅ","ଭ","ୋ"},"l":4.0,"c":{"ର":2,"େ":1,"ଭ":1,"୍":1,"ସ":1,"ୋ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"|":1},"t":"ReversoTranslate"},"مترجم Reverso":{"s":{"o","v","م","r","ر","ت","s","ج","e"},"l":4.242640687119285,"c":{"م":2,"ت":1,"ر":1,"ج":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso Traducir":{"s":{"d","t","v","u","c","r","s","a","o","e","i"},"l":5.385164807134504,"c":{"r":4,"e":2,"v":1,"s":1,"o":1,"t":1,"a":1,"d":1,"u":1,"c":1,"i":1},"t":"ReversoTranslate"},"Traduttore di Revererso":{"s":{"d","t","v","u","r","s","a","o","e","i"},"l":7.937253933193772,"c":{"t":3,"r":5,"a":1,"d":2,"u":1,"o":2,"e":4,"i":1,"v":1,"s":1},"t":"ReversoTranslate"},"Reverso oversetter":{"s":{"t","v","r","s","o","e"},"l":7.54983443527075,"c":{"r":4,"e":5,"v":2,"s":2,"o":2,"t":2},"t":"ReversoTranslate"},"Kthim":{"s":{"h","t","m","k","i"},"l":2.23606797749979,"c":{"k":1,"t":1,"h":1,"i":1,"m":1},"t":"ReversoTranslate"},"API -ul traducătorului reverso":{"s":{"o","d","l","t","v","ă","u","c","r","-","s","a","p","e","i"},"l":7.937253933193772,"c":{"a":2,"p":1,"i":2,"-":1,"u":4,"l":2,"t":2,"r":4,"d":1,"c":1,"ă":1,"o":2,"e":2,"v":1,"s":1},"t":"ReversoTranslate"},"Reverso Traductor":{"s":{"d","t","v","u","c","r","s","a","o","e"},"l":5.830951894845301,"c":{"r":4,"e":2,"v":1,"s":1,"o":2,"t":2,"a":1,"d":1,"u":1,"c":1},"t":"ReversoTranslate"},"REVERSO תרגם":{"s":{"ת","ג","v","r","s","ם","o","e","ר"},"l":3.872983346207417,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"ת":1,"ר":1,"ג":1,"ם":1},"t":"ReversoTranslate"},"Реверсо преводилац АПИ":{"s":{"л","и","в","с","а","д","р","о","п","ц","е"},"l":6.48074069840786,"c":{"р":3,"е":3,"в":2,"с":1,"о":2,"п":2,"д":1,"и":2,"л":1,"а":2,"ц":1},"t":"ReversoTranslate"},"Reverso prekladateľ API":{"s":{"d","ľ","l","t","v","p","r","s","k","a","o","e","i"},"l":6.855654600401044,"c":{"r":3,"e":4,"v":1,"s":1,"o":1,"p":2,"k":1,"l":1,"a":3,"d":1,"t":1,"ľ":1,"i":1},"t":"ReversoTranslate"},"రెవెర్సో అనువాదకుడు API":{"s":{"స","ర","ె","్","ు","ద","ా","క","డ","న","వ","ో","a","p","అ","i"},"l":5.744562646538029,"c":{"ర":2,"ె":2,"వ":2,"్":1,"స":1,"ో":1,"అ":1,"న":1,"ు":3,"ా":1,"ద":1,"క":1,"డ":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"ریګیو ژباړونکی":{"s":{"ب","و","ک","ی","ړ","ا","ر","ن","ژ","ګ"},"l":4.58257569495584,"c":{"ر":1,"ی":3,"ګ":1,"و":2,"ژ":1,"ب":1,"ا":1,"ړ":1,"ن":1,"ک":1},"t":"ReversoTranslate"},"API Reverso Translator":{"s":{"n","o","t","l","v","r","s","a","p","e","i"},"l":6.782329983125268,"c":{"a":3,"p":1,"i":1,"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"n":1,"l":1},"t":"ReversoTranslate"},"Atstāt":{"s":{"a","s","t","ā"},"l":3.4641016151377544,"c":{"a":1,"t":3,"s":1,"ā":1},"t":"ReversoTranslate"},"ريورسو ترجمو ڪندڙ API":{"s":{"و","ي","ڙ","س","p","م","ر","ت","ن","a","ج","ڪ","i","د"},"l":5.477225575051661,"c":{"ر":3,"ي":1,"و":3,"س":1,"ت":1,"ج":1,"م":1,"ڪ":1,"ن":1,"د":1,"ڙ":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Përkthen kthimin":{"s":{"ë","n","h","t","r","m","k","p","e","i"},"l":5.0,"c":{"p":1,"ë":1,"r":1,"k":2,"t":2,"h":2,"e":1,"n":2,"i":2,"m":1},"t":"ReversoTranslate"},"អ្នកបកប្រែវេបសាយ":{"s":{"ប","រ","្","ែ","ក","យ","ា","អ","ស","េ","វ","ន"},"l":5.0990195135927845,"c":{"អ":1,"្":2,"ន":1,"ក":2,"ប":3,"រ":1,"ែ":1,"វ":1,"េ":1,"ស":1,"ា":1,"យ":1},"t":"ReversoTranslate"},"API de tradutor de reverso":{"s":{"o","d","t","v","u","r","s","a","p","e","i"},"l":7.615773105863909,"c":{"a":2,"p":1,"i":1,"d":3,"e":4,"t":2,"r":4,"u":1,"o":2,"v":1,"s":1},"t":"ReversoTranslate"},"רעווערסאָ איבערזעצן":{"s":{"י","ב","ָ","ע","ז","צ","ן","ס","א","ר","ו"},"l":6.324555320336759,"c":{"ר":3,"ע":4,"ו":2,"ס":1,"א":2,"ָ":1,"י":1,"ב":1,"ז":1,"צ":1,"ן":1},"t":"ReversoTranslate"},"Mtafsiri wa Reverso":{"s":{"f","w","t","v","r","s","m","a","o","e","i"},"l":5.5677643628300215,"c":{"m":1,"t":1,"a":2,"f":1,"s":2,"i":2,"r":3,"w":1,"e":2,"v":1,"o":1},"t":"ReversoTranslate"},"Reverso -kääntäjä":{"s":{"n","j","t","v","r","-","s","ä","k","o","e"},"l":5.656854249492381,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"-":1,"k":1,"ä":4,"n":1,"t":1,"j":1},"t":"ReversoTranslate"},"Reverso vertalen":{"s":{"n","t","l","v","r","s","a","o","e"},"l":5.916079783099616,"c":{"r":3,"e":4,"v":2,"s":1,"o":1,"t":1,"a":1,"l":1,"n":1},"t":"ReversoTranslate"},"レベルソ翻訳":{"s":{"ル","ソ","ベ","翻","訳","レ"},"l":2.449489742783178,"c":{"レ":1,"ベ":1,"ル":1,"ソ":1,"翻":1,"訳":1},"t":"ReversoTranslate"},"Prevajalec Reverzo":{"s":{"o","j","l","v","c","r","z","a","p","e"},"l":6.244997998398398,"c":{"p":1,"r":3,"e":4,"v":2,"a":2,"j":1,"l":1,"c":1,"z":1,"o":1},"t":"ReversoTranslate"},"रिव्हर्सो":{"s":{"ो","ह","ि","्","र","स","व"},"l":3.605551275463989,"c":{"र":2,"ि":1,"व":1,"्":2,"ह":1,"स":1,"ो":1},"t":"ReversoTranslate"},"Soke":{"s":{"e","k","o","s"},"l":2.0,"c":{"s":1,"o":1,"k":1,"e":1},"t":"ReversoTranslate"},"Reverso translation":{"s":{"n","t","l","v","r","s","a","o","e","i"},"l":6.0,"c":{"r":3,"e":2,"v":1,"s":2,"o":2,"t":2,"a":2,"n":2,"l":1,"i":1},"t":"ReversoTranslate"},"రెవెర్సో అనువాదకుడు":{"s":{"స","ర","ె","్","ు","ద","ా","క","డ","న","వ","ో","అ"},"l":5.477225575051661,"c":{"ర":2,"ె":2,"వ":2,"్":1,"స":1,"ో":1,"అ":1,"న":1,"ు":3,"ా":1,"ద":1,"క":1,"డ":1},"t":"ReversoTranslate"},"Fitar da Fassara":{"s":{"f","d","t","r","s","a","i"},"l":6.324555320336759,"c":{"f":2,"i":1,"t":1,"a":5,"r":2,"d":1,"s":2},"t":"ReversoTranslate"},"Reverso traduzir":{"s":{"d","t","v","u","r","s","z","a","o","e","i"},"l":5.385164807134504,"c":{"r":4,"e":2,"v":1,"s":1,"o":1,"t":1,"a":1,"d":1,"u":1,"z":1,"i":1},"t":"ReversoTranslate"},"Reverse":{"s":{"r","s","e","v"},"l":3.872983346207417,"c":{"r":2,"e":3,"v":1,"s":1},"t":"ReversoTranslate"},"מתרגם רוורסו":{"s":{"ת","ג","ס","ו","ם","ר","מ"},"l":4.795831523312719,"c":{"מ":1,"ת":1,"ר":3,"ג":1,"ם":1,"ו":3,"ס":1},"t":"ReversoTranslate"},"reverso ນັກແປພາສາ":{"s":{"ພ","ນ","ປ","ກ","ສ","ັ","v","ແ","າ","r","s","o","e"},"l":4.69041575982343,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"ນ":1,"ັ":1,"ກ":1,"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1},"t":"ReversoTranslate"},"„Reverso“ vertėjas":{"s":{"„","j","“","t","v","r","s","a","o","e","ė"},"l":5.744562646538029,"c":{"„":1,"r":3,"e":3,"v":2,"s":2,"o":1,"“":1,"t":1,"ė":1,"j":1,"a":1},"t":"ReversoTranslate"},"Revero":{"s":{"r","o","e","v"},"l":3.1622776601683795,"c":{"r":2,"e":2,"v":1,"o":1},"t":"ReversoTranslate"},"បកប្រែ Reverso បកប្រែ":{"s":{"ប","រ","្","ែ","ក","v","r","s","o","e"},"l":6.557438524302,"c":{"ប":4,"ក":2,"្":2,"រ":2,"ែ":2,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso Translator":{"s":{"n","t","l","v","r","s","a","o","e"},"l":6.244997998398398,"c":{"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":2,"n":1,"l":1},"t":"ReversoTranslate"},"Penterjemah reverso":{"s":{"n","h","o","j","t","v","r","s","m","a","p","e"},"l":6.6332495807108,"c":{"p":1,"e":5,"n":1,"t":1,"r":3,"j":1,"m":1,"a":1,"h":1,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso tõlkija API":{"s":{"j","t","l","v","p","r","s","k","õ","a","o","e","i"},"l":5.0,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"t":1,"õ":1,"l":1,"k":1,"i":2,"j":1,"a":2,"p":1},"t":"ReversoTranslate"},"రెవెర్సో":{"s":{"స","ర","ె","్","వ","ో"},"l":3.4641016151377544,"c":{"ర":2,"ె":2,"వ":1,"్":1,"స":1,"ో":1},"t":"ReversoTranslate"},"API del traductor de reverso":{"s":{"o","d","l","t","v","u","c","r","s","a","p","e","i"},"l":7.745966692414834,"c":{"a":2,"p":1,"i":1,"d":3,"e":4,"l":1,"t":2,"r":4,"u":1,"c":1,"o":2,"v":1,"s":1},"t":"ReversoTranslate"},"ပြန်လည်ရှင်သန်ပါ":{"s":{"ရ","ါ","သ","လ","ည","င","န","ှ","ြ","ပ","်"},"l":5.656854249492381,"c":{"ပ":2,"ြ":1,"န":2,"်":4,"လ":1,"ည":1,"ရ":1,"ှ":1,"င":1,"သ":1,"ါ":1},"t":"ReversoTranslate"},"تذکر":{"s":{"ر","ت","ذ","ک"},"l":2.0,"c":{"ت":1,"ذ":1,"ک":1,"ر":1},"t":"ReversoTranslate"},"Tłumacz reverso":{"s":{"t","v","ł","u","c","r","z","m","s","a","o","e"},"l":4.242640687119285,"c":{"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"ሪልሮር ተርጓሚ":{"s":{"ሪ","ል","ሮ","ሚ","ተ","ር","ጓ"},"l":3.1622776601683795,"c":{"ሪ":1,"ል":1,"ሮ":1,"ር":2,"ተ":1,"ጓ":1,"ሚ":1},"t":"ReversoTranslate"},"Reverso kääntää":{"s":{"n","t","v","r","ä","s","k","o","e"},"l":5.477225575051661,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"k":1,"ä":4,"n":1,"t":1},"t":"ReversoTranslate"},"Reverso itzultzailea":{"s":{"t","l","v","u","r","s","z","a","o","e","i"},"l":6.082762530298219,"c":{"r":2,"e":3,"v":1,"s":1,"o":1,"i":2,"t":2,"z":2,"u":1,"l":2,"a":2},"t":"ReversoTranslate"},"रिव्हर्सो ट्रान्सलेटर":{"s":{"े","ो","ह","ि","न","्","ा","र","स","ट","ल","व"},"l":6.928203230275509,"c":{"र":4,"ि":1,"व":1,"्":4,"ह":1,"स":2,"ो":1,"ट":2,"ा":1,"न":1,"ल":1,"े":1},"t":"ReversoTranslate"},"Reverso -tradukisto":{"s":{"d","t","v","u","r","-","s","k","a","o","e","i"},"l":5.656854249492381,"c":{"r":3,"e":2,"v":1,"s":2,"o":2,"-":1,"t":2,"a":1,"d":1,"u":1,"k":1,"i":1},"t":"ReversoTranslate"},"ආපසු හැරවීම":{"s":{"ව","ැ","ප","ම","ආ","ස","හ","ී","ු","ර"},"l":3.1622776601683795,"c":{"ආ":1,"ප":1,"ස":1,"ු":1,"හ":1,"ැ":1,"ර":1,"ව":1,"ී":1,"ම":1},"t":"ReversoTranslate"},"ਰੀਵਰਸੋ":{"s":{"ੀ","ੋ","ਵ","ਰ","ਸ"},"l":2.8284271247461903,"c":{"ਰ":2,"ੀ":1,"ਵ":1,"ਸ":1,"ੋ":1},"t":"ReversoTranslate"},"उल्टो अनुवादक":{"s":{"ु","न","्","अ","द","व","ट","ा","ल","क","ो","उ"},"l":3.4641016151377544,"c":{"उ":1,"ल":1,"्":1,"ट":1,"ो":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1,"क":1},"t":"ReversoTranslate"},"Reverso traduki":{"s":{"d","t","v","u","r","s","k","a","o","e","i"},"l":4.69041575982343,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":1,"a":1,"d":1,"u":1,"k":1,"i":1},"t":"ReversoTranslate"},"Reverso Terjemahan":{"s":{"n","h","j","t","v","r","s","m","a","o","e"},"l":6.082762530298219,"c":{"r":3,"e":4,"v":1,"s":1,"o":1,"t":1,"j":1,"m":1,"a":2,"h":1,"n":1},"t":"ReversoTranslate"},"ترجمة ريفيرو":{"s":{"و","ة","ي","ف","م","ر","ت","ج"},"l":4.358898943540674,"c":{"ت":1,"ر":3,"ج":1,"م":1,"ة":1,"ي":2,"ف":1,"و":1},"t":"ReversoTranslate"},"Reverso翻訳者API":{"s":{"a","v","p","r","者","s","翻","訳","o","e","i"},"l":4.123105625617661,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"翻":1,"訳":1,"者":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Reverso cyfieithu":{"s":{"h","f","t","v","u","r","y","s","c","o","e","i"},"l":5.0990195135927845,"c":{"r":2,"e":3,"v":1,"s":1,"o":1,"c":1,"y":1,"f":1,"i":2,"t":1,"h":1,"u":1},"t":"ReversoTranslate"},"Reverso diterjemahkan":{"s":{"n","h","d","j","t","v","r","s","m","k","a","o","e","i"},"l":6.324555320336759,"c":{"r":3,"e":4,"v":1,"s":1,"o":1,"d":1,"i":1,"t":1,"j":1,"m":1,"a":2,"h":1,"k":1,"n":1},"t":"ReversoTranslate"},"ريفيرو":{"s":{"ي","ر","و","ف"},"l":3.1622776601683795,"c":{"ر":2,"ي":2,"ف":1,"و":1},"t":"ReversoTranslate"},"Шалено":{"s":{"л","н","ш","а","о","е"},"l":2.449489742783178,"c":{"ш":1,"а":1,"л":1,"е":1,"н":1,"о":1},"t":"ReversoTranslate"},"Reverso تەرجىمە":{"s":{"ى","v","ج","ە","r","ت","s","ر","م","o","e"},"l":4.47213595499958,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1},"t":"ReversoTranslate"},"Raggah":{"s":{"a","g","r","h"},"l":3.1622776601683795,"c":{"r":1,"a":2,"g":2,"h":1},"t":"ReversoTranslate"},"ରେଭର୍ସୋ ଅନୁବାଦକ API |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","େ","|","ସ","ର","ଅ","ଭ","ୋ","କ","a","p","i"},"l":4.47213595499958,"c":{"ର":2,"େ":1,"ଭ":1,"୍":1,"ସ":1,"ୋ":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"a":1,"p":1,"i":1,"|":1},"t":"ReversoTranslate"},"Përkthyes i kthyeshëm":{"s":{"ë","h","t","r","y","s","m","k","p","e","i"},"l":6.082762530298219,"c":{"p":1,"ë":2,"r":1,"k":2,"t":2,"h":3,"y":2,"e":2,"s":2,"i":1,"m":1},"t":"ReversoTranslate"},"Inversazione traduttore api":{"s":{"n","d","t","v","p","u","r","s","z","a","o","e","i"},"l":7.681145747868608,"c":{"i":3,"n":2,"v":1,"e":3,"r":3,"s":1,"a":3,"z":1,"o":2,"t":3,"d":1,"u":1,"p":1},"t":"ReversoTranslate"},"Reverso Tərcüməçi API":{"s":{"a","ü","t","v","p","r","ə","s","m","ç","c","o","e","i"},"l":5.5677643628300215,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":1,"ə":2,"c":1,"ü":1,"m":1,"ç":1,"i":2,"a":1,"p":1},"t":"ReversoTranslate"},"ریورسو مترجم API":{"s":{"و","ی","س","p","م","ر","ت","a","ج","i"},"l":4.898979485566356,"c":{"ر":3,"ی":1,"و":2,"س":1,"م":2,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"I-Reverso Translator API":{"s":{"n","t","l","v","p","r","-","s","a","o","e","i"},"l":7.0710678118654755,"c":{"i":2,"-":1,"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":3,"n":1,"l":1,"p":1},"t":"ReversoTranslate"},"Tarjamah ulasan":{"s":{"n","h","j","t","l","u","r","s","m","a"},"l":5.830951894845301,"c":{"t":1,"a":5,"r":1,"j":1,"m":1,"h":1,"u":1,"l":1,"s":1,"n":1},"t":"ReversoTranslate"},"רעווערסאָ":{"s":{"ָ","ע","ס","א","ר","ו"},"l":3.872983346207417,"c":{"ר":2,"ע":2,"ו":2,"ס":1,"א":1,"ָ":1},"t":"ReversoTranslate"},"Reverso tərcüməçi":{"s":{"ü","t","v","r","ə","s","m","ç","c","o","e","i"},"l":5.0990195135927845,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":1,"ə":2,"c":1,"ü":1,"m":1,"ç":1,"i":1},"t":"ReversoTranslate"},"Reverso පරිවර්තනය":{"s":{"ි","න","ව","ප","ත","v","්","r","ය","s","o","e","ර"},"l":4.69041575982343,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"න":1,"ය":1},"t":"ReversoTranslate"},"ರೆವರ್ಸೊ ಅನುವಾದ":{"s":{"ವ","ರ","ಸ","್","ಅ","ೊ","ನ","ಾ","ೆ","ದ","ು"},"l":4.123105625617661,"c":{"ರ":2,"ೆ":1,"ವ":2,"್":1,"ಸ":1,"ೊ":1,"ಅ":1,"ನ":1,"ು":1,"ಾ":1,"ದ":1},"t":"ReversoTranslate"},"Реверсо переводчик API":{"s":{"к","a","ч","и","в","с","д","р","о","п","p","е","i"},"l":6.48074069840786,"c":{"р":3,"е":4,"в":2,"с":1,"о":2,"п":1,"д":1,"ч":1,"и":1,"к":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"رګو ژباړل":{"s":{"ب","و","ل","ړ","ا","ر","ژ","ګ"},"l":2.8284271247461903,"c":{"ر":1,"ګ":1,"و":1,"ژ":1,"ب":1,"ا":1,"ړ":1,"ل":1},"t":"ReversoTranslate"},"Revero tarjima qiling":{"s":{"g","n","j","t","l","v","q","r","m","a","o","e","i"},"l":5.916079783099616,"c":{"r":3,"e":2,"v":1,"o":1,"t":1,"a":2,"j":1,"i":3,"m":1,"q":1,"l":1,"n":1,"g":1},"t":"ReversoTranslate"},"Reverso орчуулагч API":{"s":{"л","ч","v","p","а","r","г","s","р","о","у","a","o","e","i"},"l":5.196152422706632,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Mpandika tranombarotra Reverso":{"s":{"n","b","o","d","t","v","r","s","m","k","a","p","e","i"},"l":9.055385138137417,"c":{"m":2,"p":1,"a":5,"n":2,"d":1,"i":1,"k":1,"t":2,"r":5,"o":3,"b":1,"e":2,"v":1,"s":1},"t":"ReversoTranslate"},"Reverso fordító":{"s":{"ó","f","d","t","v","í","r","s","o","e"},"l":4.898979485566356,"c":{"r":3,"e":2,"v":1,"s":1,"o":2,"f":1,"d":1,"í":1,"t":1,"ó":1},"t":"ReversoTranslate"},"Mai fassara fassarar":{"s":{"f","r","s","m","a","i"},"l":8.94427190999916,"c":{"m":1,"a":7,"i":1,"f":2,"s":4,"r":3},"t":"ReversoTranslate"},"വിവർത്തക വിവർത്തകൻ":{"s":{"ൻ","ി","ത","വ","്","ർ","ക"},"l":7.0,"c":{"വ":4,"ി":2,"ർ":2,"ത":4,"്":2,"ക":2,"ൻ":1},"t":"ReversoTranslate"},"प्रतिवाद करना":{"s":{"प","ि","त","्","न","द","ा","र","क","व"},"l":4.0,"c":{"प":1,"्":1,"र":2,"त":1,"ि":1,"व":1,"ा":2,"द":1,"क":1,"न":1},"t":"ReversoTranslate"},"Reverso tõlkija":{"s":{"j","t","l","v","r","s","k","õ","a","o","e","i"},"l":4.242640687119285,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"t":1,"õ":1,"l":1,"k":1,"i":1,"j":1,"a":1},"t":"ReversoTranslate"},"Omkearing oersetter":{"s":{"g","n","t","r","s","m","k","a","o","e","i"},"l":6.324555320336759,"c":{"o":2,"m":1,"k":1,"e":4,"a":1,"r":3,"i":1,"n":1,"g":1,"s":1,"t":2},"t":"ReversoTranslate"},"Reverso перакласці":{"s":{"к","е","л","v","с","а","r","ц","s","і","р","п","o","e"},"l":4.795831523312719,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"п":1,"е":1,"р":1,"а":2,"к":1,"л":1,"с":1,"ц":1,"і":1},"t":"ReversoTranslate"},"Μεταφραστής Reverso":{"s":{"α","ρ","ή","o","ς","v","μ","r","s","ε","σ","τ","φ","e"},"l":5.0990195135927845,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Revero tarjimon":{"s":{"n","j","t","v","r","m","a","o","e","i"},"l":4.898979485566356,"c":{"r":3,"e":2,"v":1,"o":2,"t":1,"a":1,"j":1,"i":1,"m":1,"n":1},"t":"ReversoTranslate"},"Reverso vertimas":{"s":{"t","v","r","s","m","a","o","e","i"},"l":5.5677643628300215,"c":{"r":3,"e":3,"v":2,"s":2,"o":1,"t":1,"i":1,"m":1,"a":1},"t":"ReversoTranslate"},"API del traduttore Revereso":{"s":{"o","d","l","t","v","u","r","s","a","p","e","i"},"l":8.246211251235321,"c":{"a":2,"p":1,"i":1,"d":2,"e":5,"l":1,"t":3,"r":4,"u":1,"o":2,"v":1,"s":1},"t":"ReversoTranslate"},"ਰੀਵਰਸੋ ਅਨੁਵਾਦਕ ਏਪੀਆਈ":{"s":{"ੀ","ਏ","ਈ","ੋ","ਾ","ਕ","ਵ","ੁ","ਪ","ਰ","ਅ","ਆ","ਸ","ਨ","ਦ"},"l":4.898979485566356,"c":{"ਰ":2,"ੀ":2,"ਵ":2,"ਸ":1,"ੋ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਾ":1,"ਦ":1,"ਕ":1,"ਏ":1,"ਪ":1,"ਆ":1,"ਈ":1},"t":"ReversoTranslate"},"Traduttur tar-Reverso":{"s":{"d","t","v","u","r","-","s","a","o","e"},"l":7.615773105863909,"c":{"t":4,"r":5,"a":2,"d":1,"u":2,"-":1,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso preložiť":{"s":{"ť","l","v","p","r","s","ž","o","e","i"},"l":5.385164807134504,"c":{"r":3,"e":3,"v":1,"s":1,"o":2,"p":1,"l":1,"ž":1,"i":1,"ť":1},"t":"ReversoTranslate"},"RevorsO Tarjumay":{"s":{"j","t","v","u","r","y","s","m","a","o","e"},"l":5.0,"c":{"r":3,"e":1,"v":1,"o":2,"s":1,"t":1,"a":2,"j":1,"u":1,"m":1,"y":1},"t":"ReversoTranslate"},"API Reverso Translator API":{"s":{"n","o","t","l","v","r","s","a","p","e","i"},"l":7.681145747868608,"c":{"a":4,"p":2,"i":2,"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"n":1,"l":1},"t":"ReversoTranslate"},"Faaaliga":{"s":{"g","f","l","a","i"},"l":4.47213595499958,"c":{"f":1,"a":4,"l":1,"i":1,"g":1},"t":"ReversoTranslate"},"Reverso Translate":{"s":{"n","t","l","v","r","s","a","o","e"},"l":5.830951894845301,"c":{"r":3,"e":3,"v":1,"s":2,"o":1,"t":2,"a":2,"n":1,"l":1},"t":"ReversoTranslate"},"Revelso تەرجىمان API":{"s":{"l","ى","v","ج","ا","p","ە","r","ت","s","ر","م","ن","a","o","e","i"},"l":4.47213595499958,"c":{"r":1,"e":2,"v":1,"l":1,"s":1,"o":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":1,"م":1,"ا":1,"ن":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Reverso aistrithe":{"s":{"h","t","v","r","s","a","o","e","i"},"l":5.830951894845301,"c":{"r":3,"e":3,"v":1,"s":2,"o":1,"a":1,"i":2,"t":2,"h":1},"t":"ReversoTranslate"},"उल्टो":{"s":{"्","ट","ल","ो","उ"},"l":2.23606797749979,"c":{"उ":1,"ल":1,"्":1,"ट":1,"ो":1},"t":"ReversoTranslate"},"Такрори":{"s":{"к","и","а","р","о","т"},"l":3.0,"c":{"т":1,"а":1,"к":1,"р":2,"о":1,"и":1},"t":"ReversoTranslate"},"Reverso Werger":{"s":{"g","w","v","r","s","o","e"},"l":6.082762530298219,"c":{"r":4,"e":4,"v":1,"s":1,"o":1,"w":1,"g":1},"t":"ReversoTranslate"},"അംഗീകാര":{"s":{"ീ","അ","ക","ാ","ഗ","ം","ര"},"l":2.6457513110645907,"c":{"അ":1,"ം":1,"ഗ":1,"ീ":1,"ക":1,"ാ":1,"ര":1},"t":"ReversoTranslate"},"Prevoditelj":{"s":{"d","j","t","l","p","v","r","o","e","i"},"l":3.605551275463989,"c":{"p":1,"r":1,"e":2,"v":1,"o":1,"d":1,"i":1,"t":1,"l":1,"j":1},"t":"ReversoTranslate"},"RESERO ပြန်ပြောင်း API":{"s":{"ေ","p","ာ","င","e","r","s","န","း","ြ","a","o","ပ","i","်"},"l":5.477225575051661,"c":{"r":2,"e":2,"s":1,"o":1,"ပ":2,"ြ":2,"န":1,"်":2,"ေ":1,"ာ":1,"င":1,"း":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Ανάγνωσμος":{"s":{"α","γ","ν","ς","μ","ο","ω","ά","σ"},"l":3.4641016151377544,"c":{"α":1,"ν":2,"ά":1,"γ":1,"ω":1,"σ":1,"μ":1,"ο":1,"ς":1},"t":"ReversoTranslate"},"Reverso çevirmen API":{"s":{"n","v","p","r","s","m","ç","a","o","e","i"},"l":6.324555320336759,"c":{"r":3,"e":4,"v":2,"s":1,"o":1,"ç":1,"i":2,"m":1,"n":1,"a":1,"p":1},"t":"ReversoTranslate"},"რევერსო თარჯიმანი API":{"s":{"თ","ო","ჯ","ს","რ","ა","მ","ე","ნ","ვ","a","p","ი","i"},"l":5.5677643628300215,"c":{"რ":3,"ე":2,"ვ":1,"ს":1,"ო":1,"თ":1,"ა":2,"ჯ":1,"ი":2,"მ":1,"ნ":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Traducteur de Reverso":{"s":{"d","t","v","u","c","r","s","a","o","e"},"l":7.0,"c":{"t":2,"r":4,"a":1,"d":2,"u":2,"c":1,"e":4,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"API Penterjemah Reverso":{"s":{"n","h","o","j","t","v","r","s","m","a","p","e","i"},"l":7.14142842854285,"c":{"a":2,"p":2,"i":1,"e":5,"n":1,"t":1,"r":3,"j":1,"m":1,"h":1,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso tulks":{"s":{"t","l","v","u","r","s","k","o","e"},"l":4.242640687119285,"c":{"r":2,"e":2,"v":1,"s":2,"o":1,"t":1,"u":1,"l":1,"k":1},"t":"ReversoTranslate"},"Reverzo translate":{"s":{"n","t","l","v","r","z","s","a","o","e"},"l":5.656854249492381,"c":{"r":3,"e":3,"v":1,"z":1,"o":1,"t":2,"a":2,"n":1,"s":1,"l":1},"t":"ReversoTranslate"},"Mpandika teny reverso":{"s":{"n","o","d","t","v","r","y","s","m","k","a","p","e","i"},"l":5.5677643628300215,"c":{"m":1,"p":1,"a":2,"n":2,"d":1,"i":1,"k":1,"t":1,"e":3,"y":1,"r":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Ngabalikeun":{"s":{"g","n","b","l","u","k","a","e","i"},"l":3.872983346207417,"c":{"n":2,"g":1,"a":2,"b":1,"l":1,"i":1,"k":1,"e":1,"u":1},"t":"ReversoTranslate"},"Reverso prevesti":{"s":{"t","v","p","r","s","o","e","i"},"l":6.082762530298219,"c":{"r":3,"e":4,"v":2,"s":2,"o":1,"p":1,"t":1,"i":1},"t":"ReversoTranslate"},"REVERSO ແປ":{"s":{"ປ","v","ແ","r","s","o","e"},"l":3.605551275463989,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"ແ":1,"ປ":1},"t":"ReversoTranslate"},"Reverso орчуулагч":{"s":{"л","ч","v","а","r","г","s","р","о","у","o","e"},"l":4.898979485566356,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"о":1,"р":1,"ч":2,"у":2,"л":1,"а":1,"г":1},"t":"ReversoTranslate"},"Reversso Translate":{"s":{"n","t","l","v","r","s","a","o","e"},"l":6.244997998398398,"c":{"r":3,"e":3,"v":1,"s":3,"o":1,"t":2,"a":2,"n":1,"l":1},"t":"ReversoTranslate"},"ریورسو ترجمہ":{"s":{"و","ی","س","ہ","م","ر","ت","ج"},"l":4.358898943540674,"c":{"ر":3,"ی":1,"و":2,"س":1,"ت":1,"ج":1,"م":1,"ہ":1},"t":"ReversoTranslate"},"Dib u noqosho":{"s":{"n","b","h","d","u","q","s","o","i"},"l":4.123105625617661,"c":{"d":1,"i":1,"b":1,"u":1,"n":1,"o":3,"q":1,"s":1,"h":1},"t":"ReversoTranslate"},"Rerso Translate":{"s":{"n","t","l","r","s","a","o","e"},"l":5.291502622129181,"c":{"r":3,"e":2,"s":2,"o":1,"t":2,"a":2,"n":1,"l":1},"t":"ReversoTranslate"},"Reverso tradiktè":{"s":{"è","d","t","v","r","s","k","a","o","e","i"},"l":5.0,"c":{"r":3,"e":2,"v":1,"s":1,"o":1,"t":2,"a":1,"d":1,"i":1,"k":1,"è":1},"t":"ReversoTranslate"},"Reverso Transfotolelo Api":{"s":{"n","f","t","l","v","p","r","s","a","o","e","i"},"l":7.416198487095663,"c":{"r":3,"e":3,"v":1,"s":2,"o":4,"t":2,"a":2,"n":1,"f":1,"l":2,"p":1,"i":1},"t":"ReversoTranslate"},"ரெவர்சோ மொழிபெயர்ப்பாளர்":{"s":{"வ","ச","ெ","ொ","ம","ர","ய","்","ோ","ி","ப","ழ","ா","ள"},"l":7.416198487095663,"c":{"ர":4,"ெ":2,"வ":1,"்":4,"ச":1,"ோ":1,"ம":1,"ொ":1,"ழ":1,"ி":1,"ப":3,"ய":1,"ா":1,"ள":1},"t":"ReversoTranslate"},"Reverso oversætter":{"s":{"t","v","r","æ","s","o","e"},"l":7.0,"c":{"r":4,"e":4,"v":2,"s":2,"o":2,"æ":1,"t":2},"t":"ReversoTranslate"},"ரெவர்சோ மொழிபெயர்ப்பாளர் ஏபிஐ":{"s":{"வ","ச","ெ","ொ","ஐ","ம","ர","ய","ஏ","்","ோ","ி","ப","ழ","ா","ள"},"l":8.18535277187245,"c":{"ர":4,"ெ":2,"வ":1,"்":4,"ச":1,"ோ":1,"ம":1,"ொ":1,"ழ":1,"ி":2,"ப":4,"ய":1,"ா":1,"ள":1,"ஏ":1,"ஐ":1},"t":"ReversoTranslate"},"Котормочу API":{"s":{"к","ч","i","м","р","о","у","a","p","т"},"l":4.242640687119285,"c":{"к":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"API Translator Reverso":{"s":{"n","o","t","l","v","r","s","a","p","e","i"},"l":6.782329983125268,"c":{"a":3,"p":1,"i":1,"t":2,"r":4,"n":1,"s":2,"l":1,"o":2,"e":2,"v":1},"t":"ReversoTranslate"},"Tarjumida turjubaan API":{"s":{"n","b","j","d","t","u","r","m","a","p","i"},"l":7.416198487095663,"c":{"t":2,"a":5,"r":2,"j":2,"u":3,"m":1,"i":2,"d":1,"b":1,"n":1,"p":1},"t":"ReversoTranslate"},"API phiên dịch Reverso":{"s":{"a","n","h","o","d","v","c","r","s","ị","ê","p","e","i"},"l":5.385164807134504,"c":{"a":1,"p":2,"i":2,"h":2,"ê":1,"n":1,"d":1,"ị":1,"c":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"ප්රතිවර්තන පරිවර්තකය":{"s":{"ි","න","ව","ප","ත","ක","්","ය","ර"},"l":7.0,"c":{"ප":2,"්":3,"ර":4,"ත":3,"ි":2,"ව":2,"න":1,"ක":1,"ය":1},"t":"ReversoTranslate"},"ریورسو مترجم":{"s":{"و","ی","س","م","ر","ت","ج"},"l":4.58257569495584,"c":{"ر":3,"ی":1,"و":2,"س":1,"م":2,"ت":1,"ج":1},"t":"ReversoTranslate"},"Turjubaanka dib u noqoshada":{"s":{"n","b","h","j","d","t","u","q","r","s","k","a","o","i"},"l":7.615773105863909,"c":{"t":1,"u":3,"r":1,"j":1,"b":2,"a":5,"n":2,"k":1,"d":2,"i":1,"o":2,"q":1,"s":1,"h":1},"t":"ReversoTranslate"},"Revero ይተረጉማል":{"s":{"ማ","ረ","ል","ይ","v","r","ተ","ጉ","o","e"},"l":4.0,"c":{"r":2,"e":2,"v":1,"o":1,"ይ":1,"ተ":1,"ረ":1,"ጉ":1,"ማ":1,"ል":1},"t":"ReversoTranslate"},"რევერსი":{"s":{"ს","რ","ე","ვ","ი"},"l":3.3166247903554,"c":{"რ":2,"ე":2,"ვ":1,"ს":1,"ი":1},"t":"ReversoTranslate"},"Reverso übersetzen":{"s":{"n","b","ü","t","v","r","s","z","o","e"},"l":6.708203932499369,"c":{"r":3,"e":5,"v":1,"s":2,"o":1,"ü":1,"b":1,"t":1,"z":1,"n":1},"t":"ReversoTranslate"},"Revereso":{"s":{"v","r","s","o","e"},"l":4.0,"c":{"r":2,"e":3,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Հակադարձ":{"s":{"հ","ա","կ","դ","ր","ձ"},"l":3.7416573867739413,"c":{"հ":1,"ա":3,"կ":1,"դ":1,"ր":1,"ձ":1},"t":"ReversoTranslate"},"रेवरसो अनुवादक एपीआई":{"s":{"े","ी","ए","प","ु","ई","न","अ","द","व","स","र","ा","क","ो","आ"},"l":4.69041575982343,"c":{"र":2,"े":1,"व":2,"स":1,"ो":1,"अ":1,"न":1,"ु":1,"ा":1,"द":1,"क":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"ReversoTranslate"},"Reverso prevodilac API":{"s":{"d","l","v","p","c","r","s","a","o","e","i"},"l":6.48074069840786,"c":{"r":3,"e":3,"v":2,"s":1,"o":2,"p":2,"d":1,"i":2,"l":1,"a":2,"c":1},"t":"ReversoTranslate"},"Reverso fordítása":{"s":{"f","d","t","v","í","á","r","s","a","o","e"},"l":5.291502622129181,"c":{"r":3,"e":2,"v":1,"s":2,"o":2,"f":1,"d":1,"í":1,"t":1,"á":1,"a":1},"t":"ReversoTranslate"},"Reverso":{"s":{"v","r","s","o","e"},"l":3.3166247903554,"c":{"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso þýða":{"s":{"þ","ð","ý","v","r","s","a","o","e"},"l":3.872983346207417,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"þ":1,"ý":1,"ð":1,"a":1},"t":"ReversoTranslate"},"API REVERSO prevoditelja":{"s":{"o","d","j","t","l","v","r","s","a","p","e","i"},"l":7.0710678118654755,"c":{"a":2,"p":2,"i":2,"r":3,"e":4,"v":2,"s":1,"o":2,"d":1,"t":1,"l":1,"j":1},"t":"ReversoTranslate"},"Reverso prevodilac":{"s":{"d","l","v","p","c","r","s","a","o","e","i"},"l":5.744562646538029,"c":{"r":3,"e":3,"v":2,"s":1,"o":2,"p":1,"d":1,"i":1,"l":1,"a":1,"c":1},"t":"ReversoTranslate"},"API של מתרגם REVERSO":{"s":{"ת","ג","ש","ר","o","v","r","ל","s","ם","a","p","e","i","מ"},"l":4.58257569495584,"c":{"a":1,"p":1,"i":1,"ש":1,"ל":1,"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"r":2,"e":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso Iwwersetzer API":{"s":{"w","t","v","p","r","s","z","a","o","e","i"},"l":7.681145747868608,"c":{"r":4,"e":5,"v":1,"s":2,"o":1,"i":2,"w":2,"t":1,"z":1,"a":1,"p":1},"t":"ReversoTranslate"},"Reverso аудармашы API":{"s":{"ш","р","ы","v","p","а","r","s","д","м","у","a","o","e","i"},"l":5.385164807134504,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Revero tarjimoni API":{"s":{"n","j","t","v","p","r","m","a","o","e","i"},"l":6.0,"c":{"r":3,"e":2,"v":1,"o":2,"t":1,"a":2,"j":1,"i":3,"m":1,"n":1,"p":1},"t":"ReversoTranslate"},"ສະໄລ":{"s":{"ສ","ະ","ໄ","ລ"},"l":2.0,"c":{"ສ":1,"ະ":1,"ໄ":1,"ລ":1},"t":"ReversoTranslate"},"Реверсо аудармашы":{"s":{"м","ш","в","ы","с","а","д","р","о","у","е"},"l":5.477225575051661,"c":{"р":3,"е":2,"в":1,"с":1,"о":1,"а":3,"у":1,"д":1,"м":1,"ш":1,"ы":1},"t":"ReversoTranslate"},"ਰੀਵਰਸੋ ਅਨੁਵਾਦ":{"s":{"ੀ","ੋ","ਾ","ਵ","ੁ","ਰ","ਅ","ਸ","ਨ","ਦ"},"l":4.0,"c":{"ਰ":2,"ੀ":1,"ਵ":2,"ਸ":1,"ੋ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਾ":1,"ਦ":1},"t":"ReversoTranslate"},"श्रवण अनुवादक":{"s":{"ु","न","्","ण","अ","ा","र","द","श","क","व"},"l":3.7416573867739413,"c":{"श":1,"्":1,"र":1,"व":2,"ण":1,"अ":1,"न":1,"ु":1,"ा":1,"द":1,"क":1},"t":"ReversoTranslate"},"रिव्हर्सो भाषांतर":{"s":{"भ","ो","ह","ि","त","्","ा","र","स","ं","व","ष"},"l":5.0990195135927845,"c":{"र":3,"ि":1,"व":1,"्":2,"ह":1,"स":1,"ो":1,"भ":1,"ा":2,"ष":1,"ं":1,"त":1},"t":"ReversoTranslate"},"ਰੀਵਰਸੋ ਅਨੁਵਾਦਕ":{"s":{"ੀ","ੋ","ਾ","ਕ","ਵ","ੁ","ਰ","ਅ","ਸ","ਨ","ਦ"},"l":4.123105625617661,"c":{"ਰ":2,"ੀ":1,"ਵ":2,"ਸ":1,"ੋ":1,"ਅ":1,"ਨ":1,"ੁ":1,"ਾ":1,"ਦ":1,"ਕ":1},"t":"ReversoTranslate"},"Ommekeer":{"s":{"r","m","k","o","e"},"l":4.0,"c":{"o":1,"m":2,"e":3,"k":1,"r":1},"t":"ReversoTranslate"},"Reverso itzulpena":{"s":{"n","t","l","v","p","u","r","s","z","a","o","e","i"},"l":4.898979485566356,"c":{"r":2,"e":3,"v":1,"s":1,"o":1,"i":1,"t":1,"z":1,"u":1,"l":1,"p":1,"n":1,"a":1},"t":"ReversoTranslate"},"RARRERSO тарҷумон api":{"s":{"н","i","м","о","p","а","r","s","р","ҷ","у","a","o","e","т"},"l":5.744562646538029,"c":{"r":4,"a":2,"e":1,"s":1,"o":1,"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"p":1,"i":1},"t":"ReversoTranslate"},"Reverso oersetter API":{"s":{"t","v","p","r","s","a","o","e","i"},"l":7.54983443527075,"c":{"r":4,"e":5,"v":1,"s":2,"o":2,"t":2,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"రెవెర్సో అనువదించండి":{"s":{"స","ర","ె","్","ు","ద","ం","చ","డ","న","ి","వ","ో","అ"},"l":5.385164807134504,"c":{"ర":2,"ె":2,"వ":2,"్":1,"స":1,"ో":1,"అ":1,"న":1,"ు":1,"ద":1,"ి":2,"ం":2,"చ":1,"డ":1},"t":"ReversoTranslate"},"Překladatel Reverso":{"s":{"o","d","ř","l","t","v","r","s","k","a","p","e"},"l":6.0,"c":{"p":1,"ř":1,"e":4,"k":1,"l":2,"a":2,"d":1,"t":1,"r":2,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso Aistritheoir API":{"s":{"h","t","v","p","r","s","a","o","e","i"},"l":7.745966692414834,"c":{"r":4,"e":3,"v":1,"s":2,"o":2,"a":2,"i":4,"t":2,"h":1,"p":1},"t":"ReversoTranslate"},"Phetolelo ea Reverso":{"s":{"h","o","t","l","v","r","s","a","p","e"},"l":6.928203230275509,"c":{"p":1,"h":1,"e":5,"t":1,"o":3,"l":2,"a":1,"r":2,"v":1,"s":1},"t":"ReversoTranslate"},"Kubwelera":{"s":{"b","w","l","u","r","k","a","e"},"l":3.3166247903554,"c":{"k":1,"u":1,"b":1,"w":1,"e":2,"l":1,"r":1,"a":1},"t":"ReversoTranslate"},"API do tradutor de reverso":{"s":{"d","t","p","v","u","r","s","a","o","e","i"},"l":7.483314773547883,"c":{"a":2,"p":1,"i":1,"d":3,"o":3,"t":2,"r":4,"u":1,"e":3,"v":1,"s":1},"t":"ReversoTranslate"},"રિવરો અનુવાદક એ.પી.આઈ.":{"s":{"ા","ન",".","ુ","પ","ી","ઈ","એ","િ","ક","ર","ો","અ","આ","દ","વ"},"l":5.477225575051661,"c":{"ર":2,"િ":1,"વ":2,"ો":1,"અ":1,"ન":1,"ુ":1,"ા":1,"દ":1,"ક":1,"એ":1,".":3,"પ":1,"ી":1,"આ":1,"ઈ":1},"t":"ReversoTranslate"},"Teskari":{"s":{"t","r","s","k","a","e","i"},"l":2.6457513110645907,"c":{"t":1,"e":1,"s":1,"k":1,"a":1,"r":1,"i":1},"t":"ReversoTranslate"},"उल्टो ट्रान्सरटर API":{"s":{"a","न","्","ा","ट","र","स","ल","ो","p","i","उ"},"l":6.0,"c":{"उ":1,"ल":1,"्":3,"ट":3,"ो":1,"र":3,"ा":1,"न":1,"स":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"Referso ntụgharị":{"s":{"g","n","h","f","t","r","s","ụ","ị","a","o","e"},"l":4.795831523312719,"c":{"r":3,"e":2,"f":1,"s":1,"o":1,"n":1,"t":1,"ụ":1,"g":1,"h":1,"a":1,"ị":1},"t":"ReversoTranslate"},"Reverso แปล":{"s":{"ล","แ","v","r","s","ป","o","e"},"l":3.7416573867739413,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"แ":1,"ป":1,"ล":1},"t":"ReversoTranslate"},"شاتړ":{"s":{"ش","ړ","ت","ا"},"l":2.0,"c":{"ش":1,"ا":1,"ت":1,"ړ":1},"t":"ReversoTranslate"},"Reverso oversættes":{"s":{"t","v","r","æ","s","o","e"},"l":6.855654600401044,"c":{"r":3,"e":4,"v":2,"s":3,"o":2,"æ":1,"t":2},"t":"ReversoTranslate"},"ફરી":{"s":{"ફ","ી","ર"},"l":1.7320508075688772,"c":{"ફ":1,"ર":1,"ી":1},"t":"ReversoTranslate"},"Rovero ተርጓሚ ኤፒአይ":{"s":{"ይ","ሚ","አ","v","ር","r","ተ","ኤ","ፒ","o","e","ጓ"},"l":4.242640687119285,"c":{"r":2,"o":2,"v":1,"e":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"ReversoTranslate"},"რევერსო თარჯიმანი":{"s":{"თ","ო","ჯ","ს","რ","ა","მ","ე","ნ","ვ","ი"},"l":5.291502622129181,"c":{"რ":3,"ე":2,"ვ":1,"ს":1,"ო":1,"თ":1,"ა":2,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"ReversoTranslate"},"દેશનો દેશ":{"s":{"ન","શ","ે","ો","દ"},"l":3.7416573867739413,"c":{"દ":2,"ે":2,"શ":2,"ન":1,"ો":1},"t":"ReversoTranslate"},"Ressosso faaliliu":{"s":{"f","l","u","r","s","a","o","e","i"},"l":6.0,"c":{"r":1,"e":1,"s":4,"o":2,"f":1,"a":2,"l":2,"i":2,"u":1},"t":"ReversoTranslate"},"avi អ្នកបកប្រែ Reverso Reverso":{"s":{"ប","រ","្","ែ","ក","v","ន","r","s","អ","a","o","e","i"},"l":8.18535277187245,"c":{"a":1,"v":3,"i":1,"អ":1,"្":2,"ន":1,"ក":2,"ប":2,"រ":1,"ែ":1,"r":4,"e":4,"s":2,"o":2},"t":"ReversoTranslate"},"Yipada":{"s":{"d","y","a","p","i"},"l":2.8284271247461903,"c":{"y":1,"i":1,"p":1,"a":2,"d":1},"t":"ReversoTranslate"},"Reverso translator":{"s":{"n","t","l","v","r","s","a","o","e"},"l":6.244997998398398,"c":{"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":2,"n":1,"l":1},"t":"ReversoTranslate"},"Reverzne":{"s":{"n","v","r","z","e"},"l":4.0,"c":{"r":2,"e":3,"v":1,"z":1,"n":1},"t":"ReversoTranslate"},"리버소 번역기":{"s":{"번","기","역","리","소","버"},"l":2.449489742783178,"c":{"리":1,"버":1,"소":1,"번":1,"역":1,"기":1},"t":"ReversoTranslate"},"API de traductor de reverso":{"s":{"o","d","t","v","u","c","r","s","a","p","e","i"},"l":7.681145747868608,"c":{"a":2,"p":1,"i":1,"d":3,"e":4,"t":2,"r":4,"u":1,"c":1,"o":2,"v":1,"s":1},"t":"ReversoTranslate"},"Redserco onitumọ API":{"s":{"a","n","d","t","p","u","r","s","m","ọ","c","o","e","i"},"l":5.0990195135927845,"c":{"r":2,"e":2,"d":1,"s":1,"c":1,"o":2,"n":1,"i":2,"t":1,"u":1,"m":1,"ọ":1,"a":1,"p":1},"t":"ReversoTranslate"},"Reverso översättare":{"s":{"t","v","r","ö","s","ä","a","o","e"},"l":6.928203230275509,"c":{"r":4,"e":4,"v":2,"s":2,"o":1,"ö":1,"ä":1,"t":2,"a":1},"t":"ReversoTranslate"},"Reverso -Übersetzer":{"s":{"b","ü","t","v","r","-","s","z","o","e"},"l":7.211102550927978,"c":{"r":4,"e":5,"v":1,"s":2,"o":1,"-":1,"ü":1,"b":1,"t":1,"z":1},"t":"ReversoTranslate"},"उल्टो अनुवाद":{"s":{"ु","न","्","अ","द","व","ट","ा","ल","ो","उ"},"l":3.3166247903554,"c":{"उ":1,"ल":1,"्":1,"ट":1,"ो":1,"अ":1,"न":1,"ु":1,"व":1,"ा":1,"द":1},"t":"ReversoTranslate"},"Reverzo prevajalec API":{"s":{"j","l","v","p","c","r","z","a","o","e","i"},"l":6.928203230275509,"c":{"r":3,"e":4,"v":2,"z":1,"o":1,"p":2,"a":3,"j":1,"l":1,"c":1,"i":1},"t":"ReversoTranslate"},"Kaiwhakamaori":{"s":{"h","w","r","m","k","a","o","i"},"l":5.385164807134504,"c":{"k":2,"a":4,"i":2,"w":1,"h":1,"m":1,"o":1,"r":1},"t":"ReversoTranslate"},"Revero Çevir":{"s":{"v","r","ç","o","e","i"},"l":5.0,"c":{"r":3,"e":3,"v":2,"o":1,"ç":1,"i":1},"t":"ReversoTranslate"},"Reverso tłumaczyć":{"s":{"ć","t","v","ł","u","c","r","y","s","m","z","a","o","e"},"l":4.47213595499958,"c":{"r":2,"e":2,"v":1,"s":1,"o":1,"t":1,"ł":1,"u":1,"m":1,"a":1,"c":1,"z":1,"y":1,"ć":1},"t":"ReversoTranslate"},"Ath-thilleadh air ais":{"s":{"h","d","t","l","r","-","s","a","e","i"},"l":6.855654600401044,"c":{"a":4,"t":2,"h":3,"-":1,"i":3,"l":2,"e":1,"d":1,"r":1,"s":1},"t":"ReversoTranslate"},"I-reves cocator yomguquleli":{"s":{"a","g","t","l","v","u","q","r","-","s","y","m","c","o","e","i"},"l":6.855654600401044,"c":{"i":2,"-":1,"r":2,"e":3,"v":1,"s":1,"c":2,"o":3,"a":1,"t":1,"y":1,"m":1,"g":1,"u":2,"q":1,"l":2},"t":"ReversoTranslate"},"ரெவர்சோ மொழிபெயர்க்கவும்":{"s":{"வ","ச","ெ","ொ","ு","ம","ர","ய","க","்","ோ","ி","ப","ழ"},"l":7.0,"c":{"ர":3,"ெ":2,"வ":2,"்":4,"ச":1,"ோ":1,"ம":2,"ொ":1,"ழ":1,"ி":1,"ப":1,"ய":1,"க":2,"ு":1},"t":"ReversoTranslate"},"Reverso Humusha":{"s":{"h","v","u","r","s","m","a","o","e"},"l":4.898979485566356,"c":{"r":2,"e":2,"v":1,"s":2,"o":1,"h":2,"u":2,"m":1,"a":1},"t":"ReversoTranslate"},"Reverso çevirmen":{"s":{"n","v","r","s","m","ç","o","e","i"},"l":5.916079783099616,"c":{"r":3,"e":4,"v":2,"s":1,"o":1,"ç":1,"i":1,"m":1,"n":1},"t":"ReversoTranslate"},"ريورو":{"s":{"ي","ر","و"},"l":3.0,"c":{"ر":2,"ي":1,"و":2},"t":"ReversoTranslate"},"Reverso Translator API":{"s":{"n","t","l","v","p","r","s","a","o","e","i"},"l":6.782329983125268,"c":{"r":4,"e":2,"v":1,"s":2,"o":2,"t":2,"a":3,"n":1,"l":1,"p":1,"i":1},"t":"ReversoTranslate"},"Реверсо Транслате":{"s":{"н","л","в","с","а","р","о","е","т"},"l":5.830951894845301,"c":{"р":3,"е":3,"в":1,"с":2,"о":1,"т":2,"а":2,"н":1,"л":1},"t":"ReversoTranslate"},"„Reverso“ vertėjo API":{"s":{"„","j","“","t","v","p","r","s","a","o","e","i","ė"},"l":5.916079783099616,"c":{"„":1,"r":3,"e":3,"v":2,"s":1,"o":2,"“":1,"t":1,"ė":1,"j":1,"a":1,"p":1,"i":1},"t":"ReversoTranslate"},"ریورسو":{"s":{"ی","ر","س","و"},"l":3.1622776601683795,"c":{"ر":2,"ی":1,"و":2,"س":1},"t":"ReversoTranslate"},"Reverso tulkotāja API":{"s":{"j","t","l","v","p","u","r","s","k","a","o","e","i","ā"},"l":5.385164807134504,"c":{"r":2,"e":2,"v":1,"s":1,"o":2,"t":2,"u":1,"l":1,"k":1,"ā":1,"j":1,"a":2,"p":1,"i":1},"t":"ReversoTranslate"},"রিভার্সো অনুবাদক এপিআই":{"s":{"অ","ি","ভ","ু","আ","এ","ন","দ","ই","ক","র","ব","া","স","ো","্","প"},"l":5.0990195135927845,"c":{"র":2,"ি":2,"ভ":1,"া":2,"্":1,"স":1,"ো":1,"অ":1,"ন":1,"ু":1,"ব":1,"দ":1,"ক":1,"এ":1,"প":1,"আ":1,"ই":1},"t":"ReversoTranslate"},"Wergêr Reverso":{"s":{"g","w","v","r","s","ê","o","e"},"l":5.5677643628300215,"c":{"w":1,"e":3,"r":4,"g":1,"ê":1,"v":1,"s":1,"o":1},"t":"ReversoTranslate"},"Reverso översätter":{"s":{"t","v","r","ö","s","ä","o","e"},"l":6.855654600401044,"c":{"r":4,"e":4,"v":2,"s":2,"o":1,"ö":1,"ä":1,"t":2},"t":"ReversoTranslate"},"Traducir.com":{"s":{".","d","t","u","c","r","m","a","o","i"},"l":4.0,"c":{"t":1,"r":2,"a":1,"d":1,"u":1,"c":2,"i":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Cyfieithu.com cyfieithu":{"s":{".","h","f","t","u","y","m","c","o","e","i"},"l":7.211102550927978,"c":{"c":3,"y":2,"f":2,"i":4,"e":2,"t":2,"h":2,"u":2,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Guqula.com Guqula":{"s":{"g",".","l","q","u","c","m","a","o"},"l":6.0,"c":{"g":2,"u":4,"q":2,"l":2,"a":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Prekladateľ Translate.com":{"s":{".","n","o","d","ľ","l","t","c","r","s","m","k","a","p","e"},"l":7.211102550927978,"c":{"p":1,"r":2,"e":3,"k":1,"l":2,"a":4,"d":1,"t":3,"ľ":1,"n":1,"s":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom مترجم API":{"s":{"n","t","l","p","ج","c","r","م","s","m","ت","ر","a","o","e","i"},"l":5.477225575051661,"c":{"t":2,"r":1,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"م":2,"ت":1,"ر":1,"ج":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com tradiktè apitranslatecom":{"s":{".","n","è","d","t","l","p","c","r","s","m","k","a","o","e","i"},"l":10.862780491200215,"c":{"t":6,"r":3,"a":6,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"d":1,"i":2,"k":1,"è":1,"p":1},"t":"TranslateComTranslate"},"Tradukilo Translate.com":{"s":{".","n","d","t","l","u","c","r","s","m","k","a","o","e","i"},"l":6.324555320336759,"c":{"t":3,"r":2,"a":3,"d":1,"u":1,"k":1,"i":1,"l":2,"o":2,"n":1,"s":1,"e":1,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"ແປພາສາແປພາສາແປພາສາ":{"s":{"ພ","ປ","ສ","າ","ແ"},"l":8.48528137423857,"c":{"ແ":3,"ປ":3,"ພ":3,"າ":6,"ສ":3},"t":"TranslateComTranslate"},"Translator.com Translator.com":{"s":{".","n","t","l","c","r","s","m","a","o"},"l":9.38083151964686,"c":{"t":4,"r":4,"a":4,"n":2,"s":2,"l":2,"o":4,".":2,"c":2,"m":2},"t":"TranslateComTranslate"},"Tõlkekom Transor API":{"s":{"n","t","l","p","r","s","m","k","õ","a","o","e","i"},"l":5.291502622129181,"c":{"t":2,"õ":1,"l":1,"k":2,"e":1,"o":2,"m":1,"r":2,"a":2,"n":1,"s":1,"p":1,"i":1},"t":"TranslateComTranslate"},"மொழிபெயர்ப்பு.காம் மொழிபெயர்க்கவும்":{"s":{".","வ","ெ","ொ","ு","ம","ர","ய","க","ப","்","ி","ா","ழ"},"l":10.392304845413264,"c":{"ம":4,"ொ":2,"ழ":2,"ி":2,"ப":4,"ெ":2,"ய":2,"ர":2,"்":6,"ு":2,".":1,"க":3,"ா":1,"வ":1},"t":"TranslateComTranslate"},"Translatecom þýðandi API":{"s":{"þ","ð","n","d","t","l","ý","p","c","r","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"t":2,"r":1,"a":4,"n":2,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"þ":1,"ý":1,"ð":1,"d":1,"i":2,"p":1},"t":"TranslateComTranslate"},"Faʻaliliu upu":{"s":{"f","l","u","ʻ","a","p","i"},"l":4.898979485566356,"c":{"f":1,"a":2,"ʻ":1,"l":2,"i":2,"u":3,"p":1},"t":"TranslateComTranslate"},"Tradukado de Translatecom":{"s":{"n","d","t","l","u","c","r","s","m","k","a","o","e"},"l":7.280109889280518,"c":{"t":3,"r":2,"a":4,"d":3,"u":1,"k":1,"o":2,"e":2,"n":1,"s":1,"l":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Transolat tarjimoni API":{"s":{"n","j","t","l","p","r","s","m","a","o","i"},"l":7.14142842854285,"c":{"t":3,"r":2,"a":4,"n":2,"s":1,"o":2,"l":1,"j":1,"i":3,"m":1,"p":1},"t":"TranslateComTranslate"},"অনুবাদ ডট কম":{"s":{"অ","ু","ন","দ","ম","ট","ব","ক","া","ড"},"l":3.1622776601683795,"c":{"অ":1,"ন":1,"ু":1,"ব":1,"া":1,"দ":1,"ড":1,"ট":1,"ক":1,"ম":1},"t":"TranslateComTranslate"},"Wergerandin.com wergerandin":{"s":{"g",".","n","d","w","c","r","m","a","o","e","i"},"l":8.48528137423857,"c":{"w":2,"e":4,"r":4,"g":2,"a":2,"n":4,"d":2,"i":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Përkthyes i Përkthyesit":{"s":{"ë","h","t","r","y","s","k","p","e","i"},"l":6.708203932499369,"c":{"p":2,"ë":2,"r":2,"k":2,"t":3,"h":2,"y":2,"e":2,"s":2,"i":2},"t":"TranslateComTranslate"},"Përkthyesi.com Përkthyesi Apitranslatecom":{"s":{"ë","a",".","n","h","o","t","l","r","y","s","m","k","c","p","e","i"},"l":10.04987562112089,"c":{"p":3,"ë":2,"r":3,"k":2,"t":4,"h":2,"y":2,"e":3,"s":3,"i":3,".":1,"c":2,"o":2,"m":2,"a":3,"n":1,"l":1},"t":"TranslateComTranslate"},"පරිවර්තන ක්රම පරිවර්තක API":{"s":{"ි","න","ව","ප","ම","ත","ක","්","a","p","i","ර"},"l":7.681145747868608,"c":{"ප":2,"ර":5,"ි":2,"ව":2,"්":3,"ත":2,"න":1,"ක":2,"ම":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Перекладач Translatecom":{"s":{"к","a","л","ч","n","t","l","а","e","c","r","д","s","m","р","п","o","е"},"l":5.477225575051661,"c":{"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"अनुवाद अनुवाद अनुवाद":{"s":{"ु","न","अ","द","ा","व"},"l":7.3484692283495345,"c":{"अ":3,"न":3,"ु":3,"व":3,"ा":3,"द":3},"t":"TranslateComTranslate"},"Translate.com oatder abitranslatecom":{"s":{".","n","b","d","t","l","c","r","s","m","a","o","e","i"},"l":10.583005244258363,"c":{"t":5,"r":3,"a":6,"n":2,"s":2,"l":2,"e":3,".":1,"c":2,"o":3,"m":2,"d":1,"b":1,"i":1},"t":"TranslateComTranslate"},"Translate.com Käännä":{"s":{".","n","t","l","c","r","ä","s","m","k","a","o","e"},"l":5.916079783099616,"c":{"t":2,"r":1,"a":2,"n":3,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"k":1,"ä":3},"t":"TranslateComTranslate"},"Përkthyesi i përkthimit.com":{"s":{"ë",".","h","o","t","r","y","s","m","k","c","p","e","i"},"l":7.416198487095663,"c":{"p":2,"ë":2,"r":2,"k":2,"t":3,"h":2,"y":1,"e":1,"s":1,"i":4,"m":2,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Translate.com Traduttore":{"s":{".","n","d","t","l","u","c","r","s","m","a","o","e"},"l":7.681145747868608,"c":{"t":5,"r":3,"a":3,"n":1,"s":1,"l":1,"e":2,".":1,"c":1,"o":2,"m":1,"d":1,"u":1},"t":"TranslateComTranslate"},"Aistrigh.com":{"s":{"g",".","h","t","c","r","s","m","a","o","i"},"l":3.7416573867739413,"c":{"a":1,"i":2,"s":1,"t":1,"r":1,"g":1,"h":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Humusha.com Umhumushi":{"s":{".","h","u","c","s","m","a","o","i"},"l":8.12403840463596,"c":{"h":4,"u":5,"m":4,"s":2,"a":1,".":1,"c":1,"o":1,"i":1},"t":"TranslateComTranslate"},"Phetolelo ea Phetolelo ea Phetolelo Api":{"s":{"h","o","t","l","a","p","e","i"},"l":13.416407864998739,"c":{"p":4,"h":3,"e":8,"t":3,"o":6,"l":6,"a":3,"i":1},"t":"TranslateComTranslate"},"API dịch chuyển dịch":{"s":{"n","h","d","u","c","y","ể","ị","a","p","i"},"l":5.744562646538029,"c":{"a":1,"p":1,"i":1,"d":2,"ị":2,"c":3,"h":3,"u":1,"y":1,"ể":1,"n":1},"t":"TranslateComTranslate"},"Translate.com translate":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":7.483314773547883,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom prevodilac":{"s":{"n","d","t","l","p","v","c","r","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"t":2,"r":2,"a":3,"n":1,"s":1,"l":2,"e":2,"c":2,"o":2,"m":1,"p":1,"v":1,"d":1,"i":1},"t":"TranslateComTranslate"},"Translate.com Translator ApitranslateCom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.328828005937952,"c":{"t":6,"r":4,"a":7,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Translatecom vertaler":{"s":{"n","t","l","v","c","r","s","m","a","o","e"},"l":6.782329983125268,"c":{"t":3,"r":3,"a":3,"n":1,"s":1,"l":2,"e":3,"c":1,"o":1,"m":1,"v":1},"t":"TranslateComTranslate"},"Translate.com преводач":{"s":{"l","д","п","a","а","r","m","o","n","t","s","о","c","e",".","ч","в","р","е"},"l":5.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1,"а":1,"ч":1},"t":"TranslateComTranslate"},"ترجمو ڪريو ترجمو ڪندڙ API":{"s":{"و","ي","ڙ","p","م","ر","ت","ن","a","ج","ڪ","i","د"},"l":6.4031242374328485,"c":{"ت":2,"ر":3,"ج":2,"م":2,"و":3,"ڪ":2,"ي":1,"ن":1,"د":1,"ڙ":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Prekladateľ prekladateľa API":{"s":{"d","ľ","l","t","r","k","a","p","e","i"},"l":9.273618495495704,"c":{"p":3,"r":2,"e":4,"k":2,"l":2,"a":6,"d":2,"t":2,"ľ":2,"i":1},"t":"TranslateComTranslate"},"भाषांतर.कॉम ट्रान्सलेटर":{"s":{"भ",".","े","ॉ","त","न","्","ा","र","ट","ं","स","ल","क","म","ष"},"l":6.164414002968976,"c":{"भ":1,"ा":3,"ष":1,"ं":1,"त":1,"र":3,".":1,"क":1,"ॉ":1,"म":1,"ट":2,"्":2,"न":1,"स":1,"ल":1,"े":1},"t":"TranslateComTranslate"},"மொழிபெயர்ப்பு.காம் மொழிபெயர்ப்பாளர்":{"s":{".","ெ","ொ","ு","ம","ர","ய","க","ப","்","ி","ா","ழ","ள"},"l":10.862780491200215,"c":{"ம":3,"ொ":2,"ழ":2,"ி":2,"ப":6,"ெ":2,"ய":2,"ர":3,"்":6,"ு":1,".":1,"க":1,"ா":2,"ள":1},"t":"TranslateComTranslate"},"ترجمہ ڈاٹ کام کا ترجمہ کریں":{"s":{"ک","ڈ","ی","ا","ہ","م","ر","ت","ٹ","ں","ج"},"l":7.211102550927978,"c":{"ت":2,"ر":3,"ج":2,"م":3,"ہ":2,"ڈ":1,"ا":3,"ٹ":1,"ک":3,"ی":1,"ں":1},"t":"TranslateComTranslate"},"Traducere Translate.com":{"s":{".","n","d","t","l","u","c","r","s","m","a","o","e"},"l":6.928203230275509,"c":{"t":3,"r":3,"a":3,"d":1,"u":1,"c":2,"e":3,"n":1,"s":1,"l":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Transuning.com Mpandika":{"s":{"g",".","n","d","t","p","u","c","r","s","m","k","a","o","i"},"l":6.6332495807108,"c":{"t":1,"r":1,"a":3,"n":4,"s":1,"u":1,"i":2,"g":1,".":1,"c":1,"o":1,"m":2,"p":1,"d":1,"k":1},"t":"TranslateComTranslate"},"مترجم Translatecom":{"s":{"n","o","t","l","م","ر","ت","r","s","c","m","a","ج","e"},"l":4.795831523312719,"c":{"م":2,"ت":1,"ر":1,"ج":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ແປພາສາແປພາສາ ApitranslateCom":{"s":{"ພ","ປ","n","o","ສ","t","l","p","າ","r","c","s","m","a","ແ","e","i"},"l":7.416198487095663,"c":{"ແ":2,"ປ":2,"ພ":2,"າ":4,"ສ":2,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Iwwersetzer.com Iwwersetzer Apenslatcom":{"s":{"a",".","n","w","t","l","p","r","s","z","m","c","o","e","i"},"l":11.269427669584644,"c":{"i":2,"w":4,"e":7,"r":4,"s":3,"t":3,"z":2,".":1,"c":2,"o":2,"m":2,"a":2,"p":1,"n":1,"l":1},"t":"TranslateComTranslate"},"TRADLE.COM TRADURADOR APITRANSLATECOM":{"s":{".","n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":10.816653826391969,"c":{"t":4,"r":5,"a":6,"d":3,"l":2,"e":2,".":1,"c":2,"o":3,"m":2,"u":1,"p":1,"i":1,"n":1,"s":1},"t":"TranslateComTranslate"},"अनुवादक अनुवादक एपीआई":{"s":{"ी","ए","प","ु","ई","न","अ","द","ा","क","व","आ"},"l":5.744562646538029,"c":{"अ":2,"न":2,"ु":2,"व":2,"ा":2,"द":2,"क":2,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"TranslateComTranslate"},"TRANDATECOM TRANDATOR API":{"s":{"n","d","t","p","c","r","m","a","o","e","i"},"l":8.18535277187245,"c":{"t":4,"r":3,"a":5,"n":2,"d":2,"e":1,"c":1,"o":2,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com Μεταφραστής":{"s":{"α","l","a","ρ","r","m","ε","σ","o","n","ς","t","s","c","ή","e","τ",".","μ","φ"},"l":5.656854249492381,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1},"t":"TranslateComTranslate"},"Prevodite prevoditelj":{"s":{"d","j","t","l","p","v","r","o","e","i"},"l":6.782329983125268,"c":{"p":2,"r":2,"e":4,"v":2,"o":2,"d":2,"i":2,"t":2,"l":1,"j":1},"t":"TranslateComTranslate"},"Tercüme.com Çeviri":{"s":{".","ü","t","v","r","m","ç","c","o","e","i"},"l":5.5677643628300215,"c":{"t":1,"e":3,"r":2,"c":2,"ü":1,"m":2,".":1,"o":1,"ç":1,"v":1,"i":2},"t":"TranslateComTranslate"},"Translatecom-oersetter":{"s":{"n","t","l","c","r","-","s","m","a","o","e"},"l":7.615773105863909,"c":{"t":4,"r":3,"a":2,"n":1,"s":2,"l":1,"e":4,"c":1,"o":2,"m":1,"-":1},"t":"TranslateComTranslate"},"Cyfieithydd cyfieithu.com":{"s":{".","h","f","d","t","u","y","m","c","o","e","i"},"l":7.615773105863909,"c":{"c":3,"y":3,"f":2,"i":4,"e":2,"t":2,"h":2,"d":2,"u":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom prevodilac API":{"s":{"n","d","t","l","p","v","c","r","s","m","a","o","e","i"},"l":7.280109889280518,"c":{"t":2,"r":2,"a":4,"n":1,"s":1,"l":2,"e":2,"c":2,"o":2,"m":1,"p":2,"v":1,"d":1,"i":2},"t":"TranslateComTranslate"},"Translate.com аудару":{"s":{".","n","р","t","l","а","c","r","s","m","д","у","a","o","e"},"l":5.196152422706632,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"а":2,"у":2,"д":1,"р":1},"t":"TranslateComTranslate"},"ແປພາສາແປພາສາ":{"s":{"ພ","ປ","ສ","າ","ແ"},"l":5.656854249492381,"c":{"ແ":2,"ປ":2,"ພ":2,"າ":4,"ສ":2},"t":"TranslateComTranslate"},"ਅਨੁਵਾਦਕ ਅਨੁਵਾਦਕ API":{"s":{"i","ਾ","ਕ","ਵ","ੁ","ਅ","a","p","ਨ","ਦ"},"l":5.5677643628300215,"c":{"ਅ":2,"ਨ":2,"ੁ":2,"ਵ":2,"ਾ":2,"ਦ":2,"ਕ":2,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"ট্রান্সল্যাটেকম অনুবাদ":{"s":{"য","অ","ু","ন","ম","দ","ল","ট","র","ক","া","ব","স","্","ে"},"l":6.082762530298219,"c":{"ট":2,"্":3,"র":1,"া":3,"ন":2,"স":1,"ল":1,"য":1,"ে":1,"ক":1,"ম":1,"অ":1,"ু":1,"ব":1,"দ":1},"t":"TranslateComTranslate"},"Tõlkekom":{"s":{"t","l","m","k","õ","o","e"},"l":3.1622776601683795,"c":{"t":1,"õ":1,"l":1,"k":2,"e":1,"o":1,"m":1},"t":"TranslateComTranslate"},"መተርጎም የሁሉም ተርጓሚ አተያይ Apitrscomcom":{"s":{"ሁ","a","ሚ","ይ","የ","አ","r","m","ር","o","i","ያ","t","መ","ጎ","s","c","ሉ","ም","ተ","p","ጓ"},"l":6.708203932499369,"c":{"መ":1,"ተ":3,"ር":2,"ጎ":1,"ም":2,"የ":1,"ሁ":1,"ሉ":1,"ጓ":1,"ሚ":1,"አ":1,"ያ":1,"ይ":1,"a":1,"p":1,"i":1,"t":1,"r":1,"s":1,"c":2,"o":2,"m":2},"t":"TranslateComTranslate"},"Spurtlatecom Dudziro":{"s":{"o","d","t","l","u","c","r","s","m","z","a","p","e","i"},"l":5.385164807134504,"c":{"s":1,"p":1,"u":2,"r":2,"t":2,"l":1,"a":1,"e":1,"c":1,"o":2,"m":1,"d":2,"z":1,"i":1},"t":"TranslateComTranslate"},"ट्रान्सलेटम अनुवाद":{"s":{"े","ु","न","्","अ","द","ा","ट","र","स","ल","व","म"},"l":5.0,"c":{"ट":2,"्":2,"र":1,"ा":2,"न":2,"स":1,"ल":1,"े":1,"म":1,"अ":1,"ु":1,"व":1,"द":1},"t":"TranslateComTranslate"},"Translate.com vertaal":{"s":{".","n","t","l","v","c","r","s","m","a","o","e"},"l":6.6332495807108,"c":{"t":3,"r":2,"a":4,"n":1,"s":1,"l":2,"e":2,".":1,"c":1,"o":1,"m":1,"v":1},"t":"TranslateComTranslate"},"Translat tarjimon":{"s":{"n","j","t","l","r","s","m","a","o","i"},"l":5.656854249492381,"c":{"t":3,"r":2,"a":3,"n":2,"s":1,"l":1,"j":1,"i":1,"m":1,"o":1},"t":"TranslateComTranslate"},"API de traductrice Translatecom":{"s":{"n","o","d","t","l","u","c","r","s","m","a","p","e","i"},"l":8.602325267042627,"c":{"a":4,"p":1,"i":2,"d":2,"e":3,"t":4,"r":3,"u":1,"c":3,"n":1,"s":1,"l":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Prevesti.com Prevedi":{"s":{".","o","d","t","v","r","s","m","c","p","e","i"},"l":6.244997998398398,"c":{"p":2,"r":2,"e":4,"v":2,"s":1,"t":1,"i":2,".":1,"c":1,"o":1,"m":1,"d":1},"t":"TranslateComTranslate"},"ଅନୁବାଦକ ଅନୁବାଦ |":{"s":{"ୁ","ା","|","ଦ","ବ","ନ","ଅ","କ"},"l":5.0990195135927845,"c":{"ଅ":2,"ନ":2,"ୁ":2,"ବ":2,"ା":2,"ଦ":2,"କ":1,"|":1},"t":"TranslateComTranslate"},"TranstateCom превод":{"s":{"е","n","п","в","t","c","r","д","s","m","р","о","a","o","e"},"l":5.0990195135927845,"c":{"t":3,"r":1,"a":2,"n":1,"s":1,"e":1,"c":1,"o":1,"m":1,"п":1,"р":1,"е":1,"в":1,"о":1,"д":1},"t":"TranslateComTranslate"},"Preložiť":{"s":{"o","ť","l","r","ž","p","e","i"},"l":2.8284271247461903,"c":{"p":1,"r":1,"e":1,"l":1,"o":1,"ž":1,"i":1,"ť":1},"t":"TranslateComTranslate"},"Translatecom þýðandi":{"s":{"þ","ð","n","d","t","l","ý","c","r","s","m","a","o","e","i"},"l":5.385164807134504,"c":{"t":2,"r":1,"a":3,"n":2,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"þ":1,"ý":1,"ð":1,"d":1,"i":1},"t":"TranslateComTranslate"},"API traductor de traducción":{"s":{"ó","n","o","d","t","u","c","r","a","p","e","i"},"l":7.615773105863909,"c":{"a":3,"p":1,"i":2,"t":3,"r":3,"d":3,"u":2,"c":3,"o":1,"e":1,"ó":1,"n":1},"t":"TranslateComTranslate"},"Translate.com Перакласці":{"s":{"l","п","a","і","а","r","m","o","к","л","n","t","с","s","c","e",".","р","ц","е"},"l":5.385164807134504,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"п":1,"е":1,"р":1,"а":2,"к":1,"л":1,"с":1,"ц":1,"і":1},"t":"TranslateComTranslate"},"TranslateCom Tarjuma":{"s":{"n","j","t","l","u","c","r","s","m","a","o","e"},"l":6.4031242374328485,"c":{"t":3,"r":2,"a":4,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":2,"j":1,"u":1},"t":"TranslateComTranslate"},"Перакладчык Translate.com":{"s":{"l","д","a","п","а","r","m","o","к","л","n","t","s","c","e",".","ч","р","ы","е"},"l":5.656854249492381,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"翻訳翻訳者":{"s":{"訳","者","翻"},"l":3.0,"c":{"翻":2,"訳":2,"者":1},"t":"TranslateComTranslate"},"Translal Translator":{"s":{"n","t","l","r","s","a","o"},"l":7.211102550927978,"c":{"t":3,"r":3,"a":4,"n":2,"s":2,"l":3,"o":1},"t":"TranslateComTranslate"},"Traducir.com Tradutor":{"s":{".","d","t","u","c","r","m","a","o","i"},"l":6.928203230275509,"c":{"t":3,"r":4,"a":2,"d":2,"u":2,"c":2,"i":1,".":1,"o":2,"m":1},"t":"TranslateComTranslate"},"ແປພາສາ TranslateCom API":{"s":{"ພ","ປ","n","o","ສ","t","l","p","າ","r","c","s","m","a","ແ","e","i"},"l":5.5677643628300215,"c":{"ແ":1,"ປ":1,"ພ":1,"າ":2,"ສ":1,"t":2,"r":1,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translatecom Translator API":{"s":{"n","t","l","p","c","r","s","m","a","o","e","i"},"l":8.426149773176359,"c":{"t":4,"r":3,"a":5,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"API TranslateCom Translator":{"s":{"n","o","t","l","c","r","s","m","a","p","e","i"},"l":8.426149773176359,"c":{"a":5,"p":1,"i":1,"t":4,"r":3,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"ট্রান্সল্যাটেকম অনুবাদক এপিআই":{"s":{"অ","ম","ল","া","্","ে","ি","আ","ব","স","ু","ই","ক","র","য","এ","ন","দ","ট","প"},"l":6.708203932499369,"c":{"ট":2,"্":3,"র":1,"া":3,"ন":2,"স":1,"ল":1,"য":1,"ে":1,"ক":2,"ম":1,"অ":1,"ু":1,"ব":1,"দ":1,"এ":1,"প":1,"ি":1,"আ":1,"ই":1},"t":"TranslateComTranslate"},"Tõlke.com tõlge":{"s":{"g",".","t","l","m","k","õ","c","o","e"},"l":4.69041575982343,"c":{"t":2,"õ":2,"l":2,"k":1,"e":2,".":1,"c":1,"o":1,"m":1,"g":1},"t":"TranslateComTranslate"},"Dịch.com Dịch":{"s":{".","h","d","m","ị","c","o"},"l":4.898979485566356,"c":{"d":2,"ị":2,"c":3,"h":2,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Trantelate.com Tranfaictor Apitiranstelec":{"s":{".","n","f","t","l","p","c","r","s","m","a","o","e","i"},"l":12.529964086141668,"c":{"t":7,"r":4,"a":6,"n":3,"e":4,"l":2,".":1,"c":3,"o":2,"m":1,"f":1,"i":3,"p":1,"s":1},"t":"TranslateComTranslate"},"Tarjamah Tarjamah APPPRanslatecom":{"s":{"n","h","o","j","t","l","c","r","s","m","a","p","e"},"l":11.445523142259598,"c":{"t":3,"a":9,"r":3,"j":2,"m":3,"h":2,"p":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Translatecom vertalen":{"s":{"n","t","l","v","c","r","s","m","a","o","e"},"l":6.6332495807108,"c":{"t":3,"r":2,"a":3,"n":2,"s":1,"l":2,"e":3,"c":1,"o":1,"m":1,"v":1},"t":"TranslateComTranslate"},"Перакладчык Translate.com Apitranslatecom":{"s":{"l","д","a","п","а","r","m","o","i","к","л","n","t","s","c","e",".","ч","р","ы","p","е"},"l":9.539392014169456,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Tradiktè translatecom":{"s":{"n","d","t","l","e","c","r","s","m","k","a","o","è","i"},"l":6.324555320336759,"c":{"t":4,"r":2,"a":3,"d":1,"i":1,"k":1,"è":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom Translator Api":{"s":{"n","t","l","p","c","r","s","m","a","o","e","i"},"l":8.426149773176359,"c":{"t":4,"r":3,"a":5,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Traduci a traduttore API":{"s":{"d","t","p","u","c","r","a","o","e","i"},"l":7.54983443527075,"c":{"t":4,"r":3,"a":4,"d":2,"u":2,"c":1,"i":2,"o":1,"e":1,"p":1},"t":"TranslateComTranslate"},"ಅನುವಾದಿಸಿ. ಅನುವಾದಿಸಿ":{"s":{"ವ",".","ಸ","ಿ","ಅ","ನ","ಾ","ದ","ು"},"l":6.708203932499369,"c":{"ಅ":2,"ನ":2,"ು":2,"ವ":2,"ಾ":2,"ದ":2,"ಿ":4,"ಸ":2,".":1},"t":"TranslateComTranslate"},"Folklor":{"s":{"f","l","r","k","o"},"l":3.3166247903554,"c":{"f":1,"o":2,"l":2,"k":1,"r":1},"t":"TranslateComTranslate"},"TranslateCOM Oversættelse":{"s":{"n","t","l","v","c","r","æ","s","m","a","o","e"},"l":7.874007874011811,"c":{"t":4,"r":2,"a":2,"n":1,"s":3,"l":2,"e":4,"c":1,"o":2,"m":1,"v":1,"æ":1},"t":"TranslateComTranslate"},"TərcüməCom Tərcümə":{"s":{"ü","t","r","ə","m","c","o"},"l":6.855654600401044,"c":{"t":2,"ə":4,"r":2,"c":3,"ü":2,"m":3,"o":1},"t":"TranslateComTranslate"},"Translate.com Translator Apitranaslatecom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.922847983320086,"c":{"t":6,"r":4,"a":8,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"ترجمة Translatecom":{"s":{"n","o","ة","t","l","م","ر","ت","r","s","c","m","a","ج","e"},"l":4.58257569495584,"c":{"ت":1,"ر":1,"ج":1,"م":1,"ة":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ભાષાંતર ભાષાંતર":{"s":{"ા","ષ","ત","ર","ં","ભ"},"l":6.0,"c":{"ભ":2,"ા":4,"ષ":2,"ં":2,"ત":2,"ર":2},"t":"TranslateComTranslate"},"Oersettecom oersette api":{"s":{"a","t","p","r","s","m","c","o","e","i"},"l":8.602325267042627,"c":{"o":3,"e":6,"r":2,"s":2,"t":4,"c":1,"m":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com penerjemah apitranslatecom":{"s":{".","n","h","j","t","l","p","c","r","s","m","a","o","e","i"},"l":11.313708498984761,"c":{"t":4,"r":3,"a":6,"n":3,"s":2,"l":2,"e":5,".":1,"c":2,"o":2,"m":3,"p":2,"j":1,"h":1,"i":1},"t":"TranslateComTranslate"},"Translatercom Translator":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":8.18535277187245,"c":{"t":4,"r":4,"a":4,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Transatecom kääntää":{"s":{"n","t","c","r","ä","s","m","k","a","o","e"},"l":6.324555320336759,"c":{"t":3,"r":1,"a":2,"n":2,"s":1,"e":1,"c":1,"o":1,"m":1,"k":1,"ä":4},"t":"TranslateComTranslate"},"ترجمہ مترجم":{"s":{"ہ","م","ر","ت","ج"},"l":4.69041575982343,"c":{"ت":2,"ر":2,"ج":2,"م":3,"ہ":1},"t":"TranslateComTranslate"},"Prevajalec translate.com":{"s":{".","n","o","j","l","t","v","c","r","s","m","a","p","e"},"l":7.0,"c":{"p":1,"r":2,"e":3,"v":1,"a":4,"j":1,"l":2,"c":2,"t":2,"n":1,"s":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Переводчик":{"s":{"l","д","п","a","и","r","m","o","к","n","t","s","о","c","e",".","ч","в","р","е"},"l":5.385164807134504,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1},"t":"TranslateComTranslate"},"TranslateCom Translate":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Traduttore TranslaTeCom":{"s":{"n","d","t","l","u","c","r","s","m","a","o","e"},"l":7.615773105863909,"c":{"t":5,"r":3,"a":3,"d":1,"u":1,"o":2,"e":2,"n":1,"s":1,"l":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Traduttur TranslateCom":{"s":{"n","d","t","l","u","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"t":5,"r":3,"a":3,"d":1,"u":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Tõlkija tõlkija":{"s":{"j","t","l","k","õ","a","i"},"l":5.291502622129181,"c":{"t":2,"õ":2,"l":2,"k":2,"i":2,"j":2,"a":2},"t":"TranslateComTranslate"},"ಅನುವಾದ.ಕಾಮ್ ಅನುವಾದಕ":{"s":{"ವ",".","ಕ","್","ಅ","ನ","ಾ","ದ","ಮ","ು"},"l":6.0,"c":{"ಅ":2,"ನ":2,"ು":2,"ವ":2,"ಾ":3,"ದ":2,".":1,"ಕ":2,"ಮ":1,"್":1},"t":"TranslateComTranslate"},"Humusha.com Umhumushi Apitranslatecom":{"s":{".","n","h","t","l","p","u","c","r","s","m","a","o","e","i"},"l":10.63014581273465,"c":{"h":4,"u":5,"m":5,"s":3,"a":4,".":1,"c":2,"o":2,"i":2,"p":1,"t":2,"r":1,"n":1,"l":1,"e":1},"t":"TranslateComTranslate"},"translate.com แปล":{"s":{".","n","ล","t","l","แ","c","r","s","m","ป","a","o","e"},"l":4.47213595499958,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"แ":1,"ป":1,"ล":1},"t":"TranslateComTranslate"},"Translatecom Itzultzailea APIa":{"s":{"n","t","l","p","u","c","r","s","m","z","a","o","e","i"},"l":9.273618495495704,"c":{"t":4,"r":1,"a":6,"n":1,"s":1,"l":3,"e":2,"c":1,"o":1,"m":1,"i":3,"z":2,"u":1,"p":1},"t":"TranslateComTranslate"},"மொழிபெயர்ப்பு.காம் மொழிபெயர்ப்பாளர் apitranslatecom":{"s":{"ொ","l","க","a","ி","r","்","m","o","ள","i","n","ம","t","ப","ா","s","c","e",".","ெ","ு","ர","ய","ழ","p"},"l":11.874342087037917,"c":{"ம":3,"ொ":2,"ழ":2,"ி":2,"ப":6,"ெ":2,"ய":2,"ர":3,"்":6,"ு":1,".":1,"க":1,"ா":2,"ள":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Vertėjas vertėjas":{"s":{"j","t","v","r","s","a","e","ė"},"l":5.656854249492381,"c":{"v":2,"e":2,"r":2,"t":2,"ė":2,"j":2,"a":2,"s":2},"t":"TranslateComTranslate"},"Translatecom аудармашысы":{"s":{"n","ш","р","t","l","ы","с","а","c","r","s","m","д","м","у","a","o","e"},"l":5.916079783099616,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1},"t":"TranslateComTranslate"},"Tarjumida.com Tarjumida":{"s":{".","j","d","t","u","c","r","m","a","o","i"},"l":7.211102550927978,"c":{"t":2,"a":4,"r":2,"j":2,"u":2,"m":3,"i":2,"d":2,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"ಅನುವಾದ ಅನುವಾದಕ API":{"s":{"ವ","a","ಕ","ಅ","ನ","ಾ","ದ","p","ು","i"},"l":5.291502622129181,"c":{"ಅ":2,"ನ":2,"ು":2,"ವ":2,"ಾ":2,"ದ":2,"ಕ":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Tarjamah Torthelecom API":{"s":{"h","j","t","l","p","c","r","m","a","o","e","i"},"l":7.0710678118654755,"c":{"t":3,"a":4,"r":2,"j":1,"m":2,"h":2,"o":2,"e":2,"l":1,"c":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translatecom аудармашы API":{"s":{"l","д","м","a","ш","а","r","m","o","i","n","у","t","s","c","e","р","ы","p"},"l":6.164414002968976,"c":{"t":2,"r":1,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Transcolate.com womasulira":{"s":{".","n","w","t","l","u","c","r","s","m","a","o","e","i"},"l":7.416198487095663,"c":{"t":2,"r":2,"a":4,"n":1,"s":2,"c":2,"o":3,"l":2,"e":1,".":1,"m":2,"w":1,"u":1,"i":1},"t":"TranslateComTranslate"},"అనువాదం.కామ్ అనువాదం":{"s":{"మ",".","ద","క","్","ా","ం","వ","ు","న","అ"},"l":6.082762530298219,"c":{"అ":2,"న":2,"ు":2,"వ":2,"ా":3,"ద":2,"ం":2,".":1,"క":1,"మ":1,"్":1},"t":"TranslateComTranslate"},"Traduce.com traducir":{"s":{".","d","t","u","c","r","m","a","o","e","i"},"l":6.244997998398398,"c":{"t":2,"r":3,"a":2,"d":2,"u":2,"c":3,"e":1,".":1,"o":1,"m":1,"i":1},"t":"TranslateComTranslate"},"Translatecom translate":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"అనువాదం.కామ్ అనువాదకుడు":{"s":{"మ",".","ద","క","్","ా","ం","డ","వ","ు","న","అ"},"l":7.0710678118654755,"c":{"అ":2,"న":2,"ు":4,"వ":2,"ా":3,"ద":2,"ం":1,".":1,"క":2,"మ":1,"్":1,"డ":1},"t":"TranslateComTranslate"},"Translate.com Μετάφραση":{"s":{"α","l","a","ρ","r","m","ε","σ","o","n","t","s","c","ά","e","τ","η",".","μ","φ"},"l":5.0990195135927845,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"μ":1,"ε":1,"τ":1,"ά":1,"φ":1,"ρ":1,"α":1,"σ":1,"η":1},"t":"TranslateComTranslate"},"Орчуулах орчуулга орчуулах":{"s":{"л","ч","а","г","р","о","у","х"},"l":9.273618495495704,"c":{"о":3,"р":3,"ч":3,"у":6,"л":3,"а":3,"х":2,"г":1},"t":"TranslateComTranslate"},"Translate.com Oversetter Apitranslatecom":{"s":{".","n","t","l","v","p","c","r","s","m","a","o","e","i"},"l":11.832159566199232,"c":{"t":6,"r":4,"a":5,"n":2,"s":3,"l":2,"e":5,".":1,"c":2,"o":3,"m":2,"v":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Орчуулагч орчуулагч API":{"s":{"л","ч","а","г","р","о","у","a","p","i"},"l":7.416198487095663,"c":{"о":2,"р":2,"ч":4,"у":4,"л":2,"а":2,"г":2,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Ntụgharị ntụgharị.com":{"s":{"g",".","n","h","t","c","r","m","ụ","ị","a","o"},"l":6.0,"c":{"n":2,"t":2,"ụ":2,"g":2,"h":2,"a":2,"r":2,"ị":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Tulkot.com tulkot":{"s":{".","t","l","u","m","k","c","o"},"l":6.324555320336759,"c":{"t":4,"u":2,"l":2,"k":2,"o":3,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"អ្នកបកប្រែភាសាខ្មែរ api":{"s":{"ប","រ","i","្","ែ","ភ","ក","ម","ា","អ","ស","ខ","a","p","ន"},"l":6.164414002968976,"c":{"អ":1,"្":3,"ន":1,"ក":2,"ប":2,"រ":2,"ែ":2,"ភ":1,"ា":2,"ស":1,"ខ":1,"ម":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Tłumacz.com Tłumacz Apitranslatecom":{"s":{".","n","t","l","p","ł","u","c","r","z","m","s","a","o","e","i"},"l":9.848857801796104,"c":{"t":4,"ł":2,"u":2,"m":4,"a":5,"c":4,"z":2,".":1,"o":2,"p":1,"i":1,"r":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"Translatecom":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":4.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ترجمہ ترجمہ":{"s":{"ہ","م","ر","ت","ج"},"l":4.47213595499958,"c":{"ت":2,"ر":2,"ج":2,"م":2,"ہ":2},"t":"TranslateComTranslate"},"Inguqulelo yoTekati":{"s":{"g","n","l","t","q","u","y","k","a","o","e","i"},"l":5.477225575051661,"c":{"i":2,"n":1,"g":1,"u":2,"q":1,"l":2,"e":2,"o":2,"y":1,"t":2,"k":1,"a":1},"t":"TranslateComTranslate"},"Translatecom -kääntäjä":{"s":{"n","j","t","l","c","r","-","s","m","ä","k","a","o","e"},"l":6.557438524302,"c":{"t":3,"r":1,"a":2,"n":2,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"-":1,"k":1,"ä":4,"j":1},"t":"TranslateComTranslate"},"ترجمو. com ترجمو ڪندڙ":{"s":{".","و","o","ڙ","م","ر","ت","ن","m","c","ج","ڪ","د"},"l":5.291502622129181,"c":{"ت":2,"ر":2,"ج":2,"م":2,"و":2,".":1,"c":1,"o":1,"m":1,"ڪ":1,"ن":1,"د":1,"ڙ":1},"t":"TranslateComTranslate"},"Translate.com tõlkija ApitranslateCom":{"s":{".","n","j","t","l","p","c","r","s","m","k","õ","a","o","e","i"},"l":10.344080432788601,"c":{"t":5,"r":2,"a":6,"n":2,"s":2,"l":3,"e":2,".":1,"c":2,"o":2,"m":2,"õ":1,"k":1,"i":2,"j":1,"p":1},"t":"TranslateComTranslate"},"ట్రాన్స్‌లేట్‌కామ్ అనువాదకుడు API":{"s":{"మ","స","ర","ల","్","క","ద","ా","డ","వ","ే","ట","ు","a","p","న","i","అ"},"l":8.18535277187245,"c":{"ట":2,"్":5,"ర":1,"ా":3,"న":2,"స":1,"ల":1,"ే":1,"క":2,"మ":1,"అ":1,"ు":3,"వ":1,"ద":1,"డ":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com котормочу apitranslantom":{"s":{"l","м","a","т","r","m","o","i","к","n","t","s","о","c","e",".","ч","р","у","p"},"l":9.486832980505138,"c":{"t":4,"r":2,"a":5,"n":3,"s":2,"l":2,"e":1,".":1,"c":1,"o":2,"m":2,"к":1,"о":3,"т":1,"р":1,"м":1,"ч":1,"у":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Përkthen.com përkthen":{"s":{"ë",".","n","h","o","t","r","m","k","c","p","e"},"l":6.0,"c":{"p":2,"ë":2,"r":2,"k":2,"t":2,"h":2,"e":2,"n":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Translator ApitranSlateCom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.328828005937952,"c":{"t":6,"r":4,"a":7,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Translitikacom Mpandika":{"s":{"n","d","t","l","p","c","r","s","m","k","a","o","i"},"l":6.928203230275509,"c":{"t":2,"r":1,"a":4,"n":2,"s":1,"l":1,"i":3,"k":2,"c":1,"o":1,"m":2,"p":1,"d":1},"t":"TranslateComTranslate"},"Tłumacz tłumacz":{"s":{"t","ł","u","c","z","m","a"},"l":5.291502622129181,"c":{"t":2,"ł":2,"u":2,"m":2,"a":2,"c":2,"z":2},"t":"TranslateComTranslate"},"Translatecom വിവർത്തനം വിവർത്തനം":{"s":{"ി","n","ത","വ","t","l","ർ","്","c","r","s","m","ം","a","o","e","ന"},"l":8.246211251235321,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"വ":4,"ി":2,"ർ":2,"ത":4,"്":2,"ന":2,"ം":2},"t":"TranslateComTranslate"},"TranslateCom Tratirment api":{"s":{"n","t","l","p","c","r","s","m","a","o","e","i"},"l":8.426149773176359,"c":{"t":5,"r":3,"a":4,"n":2,"s":1,"l":1,"e":2,"c":1,"o":1,"m":2,"i":2,"p":1},"t":"TranslateComTranslate"},"Translate.com þýðandi apitranslatecom":{"s":{".","þ","n","ð","d","t","l","ý","p","c","r","s","m","a","o","e","i"},"l":9.9498743710662,"c":{"t":4,"r":2,"a":6,"n":3,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"þ":1,"ý":1,"ð":1,"d":1,"i":2,"p":1},"t":"TranslateComTranslate"},"ТранслатЕЦом Транслате":{"s":{"н","л","м","с","а","р","о","ц","е","т"},"l":7.416198487095663,"c":{"т":4,"р":2,"а":4,"н":2,"с":2,"л":2,"е":2,"ц":1,"о":1,"м":1},"t":"TranslateComTranslate"},"Traduire.com":{"s":{".","d","t","u","c","r","m","a","o","e","i"},"l":3.7416573867739413,"c":{"t":1,"r":2,"a":1,"d":1,"u":1,"i":1,"e":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Përkthimi i përkthimit":{"s":{"ë","h","t","r","m","k","p","i"},"l":7.615773105863909,"c":{"p":2,"ë":2,"r":2,"k":2,"t":3,"h":2,"i":5,"m":2},"t":"TranslateComTranslate"},"Translate.com Übersetzer":{"s":{".","n","b","ü","t","l","c","r","s","m","z","a","o","e"},"l":7.14142842854285,"c":{"t":3,"r":3,"a":2,"n":1,"s":2,"l":1,"e":4,".":1,"c":1,"o":1,"m":1,"ü":1,"b":1,"z":1},"t":"TranslateComTranslate"},"Vertės vertėjas":{"s":{"j","t","v","r","s","a","e","ė"},"l":5.0990195135927845,"c":{"v":2,"e":2,"r":2,"t":2,"ė":2,"s":2,"j":1,"a":1},"t":"TranslateComTranslate"},"Fetolela.com Phetolelo ea Afritranslalcom":{"s":{".","n","h","f","t","l","p","c","r","s","m","a","o","e","i"},"l":11.916375287812984,"c":{"f":2,"e":5,"t":3,"o":5,"l":6,"a":5,".":1,"c":2,"m":2,"p":1,"h":1,"r":2,"i":1,"n":1,"s":1},"t":"TranslateComTranslate"},"Translate.com թարգմանիչ":{"s":{"թ","ա","ն","l","գ","a","r","m","o","n","t","s","ի","c","e",".","չ","ր","մ"},"l":5.291502622129181,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"թ":1,"ա":2,"ր":1,"գ":1,"մ":1,"ն":1,"ի":1,"չ":1},"t":"TranslateComTranslate"},"Translate.com מתרגם":{"s":{"ת",".","ג","n","t","l","c","r","s","m","ם","a","o","e","ר","מ"},"l":4.69041575982343,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"מ":1,"ת":1,"ר":1,"ג":1,"ם":1},"t":"TranslateComTranslate"},"Cyfieithydd cyfieithu":{"s":{"h","f","d","t","u","y","c","e","i"},"l":7.0710678118654755,"c":{"c":2,"y":3,"f":2,"i":4,"e":2,"t":2,"h":2,"d":2,"u":1},"t":"TranslateComTranslate"},"Translate.com Tarjima":{"s":{".","n","j","t","l","c","r","s","m","a","o","e","i"},"l":6.48074069840786,"c":{"t":3,"r":2,"a":4,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":2,"j":1,"i":1},"t":"TranslateComTranslate"},"Translate.com පරිවර්තනය":{"s":{"ි","ව","ප","l","ය","a","න","r","m","o","n","ත","t","s","c","e",".","්","ර"},"l":5.291502622129181,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"න":1,"ය":1},"t":"TranslateComTranslate"},"Translatecom traduce":{"s":{"n","d","t","l","u","c","r","s","m","a","o","e"},"l":6.082762530298219,"c":{"t":3,"r":2,"a":3,"n":1,"s":1,"l":1,"e":2,"c":2,"o":1,"m":1,"d":1,"u":1},"t":"TranslateComTranslate"},"অনুবাদক অনুবাদক":{"s":{"অ","ু","ন","দ","ক","ব","া"},"l":5.291502622129181,"c":{"অ":2,"ন":2,"ু":2,"ব":2,"া":2,"দ":2,"ক":2},"t":"TranslateComTranslate"},"અનુવાદક અનુવાદક":{"s":{"ા","ન","ુ","ક","અ","દ","વ"},"l":5.291502622129181,"c":{"અ":2,"ન":2,"ુ":2,"વ":2,"ા":2,"દ":2,"ક":2},"t":"TranslateComTranslate"},"Oversæt.com oversætter":{"s":{".","t","v","r","æ","s","m","c","o","e"},"l":7.14142842854285,"c":{"o":3,"v":2,"e":3,"r":3,"s":2,"æ":2,"t":3,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Traductor":{"s":{".","n","d","t","l","u","c","r","s","m","a","o","e"},"l":7.0710678118654755,"c":{"t":4,"r":3,"a":3,"n":1,"s":1,"l":1,"e":1,".":1,"c":2,"o":2,"m":1,"d":1,"u":1},"t":"TranslateComTranslate"},"ဘာသာပြန်သူဘာသာပြန်":{"s":{"ူ","ဘ","ြ","ာ","န","သ","ပ","်"},"l":6.782329983125268,"c":{"ဘ":2,"ာ":4,"သ":3,"ပ":2,"ြ":2,"န":2,"်":2,"ူ":1},"t":"TranslateComTranslate"},"translate.com អ្នកបកប្រែសកលបកប្រែ":{"s":{"ប","ក","l","a","r","m","o","រ","n","ែ","t","ល","s","អ","ស","c","e","ន",".","្"},"l":8.366600265340756,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"អ":1,"្":3,"ន":1,"ក":4,"ប":4,"រ":2,"ែ":2,"ស":1,"ល":1},"t":"TranslateComTranslate"},"Translal Translal API":{"s":{"n","t","l","r","s","a","p","i"},"l":7.681145747868608,"c":{"t":2,"r":2,"a":5,"n":2,"s":2,"l":4,"p":1,"i":1},"t":"TranslateComTranslate"},"Тарҷумони тарҷумон":{"s":{"н","м","и","о","а","р","ҷ","у","т"},"l":5.744562646538029,"c":{"т":2,"а":2,"р":2,"ҷ":2,"у":2,"м":2,"о":2,"н":2,"и":1},"t":"TranslateComTranslate"},"Транслате.цом Транслате":{"s":{"н","л",".","м","с","а","р","о","ц","е","т"},"l":7.483314773547883,"c":{"т":4,"р":2,"а":4,"н":2,"с":2,"л":2,"е":2,".":1,"ц":1,"о":1,"м":1},"t":"TranslateComTranslate"},"Translate.com eadar-theangachadh":{"s":{"g",".","n","h","d","t","l","c","r","-","s","m","a","o","e"},"l":9.9498743710662,"c":{"t":3,"r":2,"a":7,"n":2,"s":1,"l":1,"e":3,".":1,"c":2,"o":1,"m":1,"d":2,"-":1,"h":3,"g":1},"t":"TranslateComTranslate"},"Преведувач преведувач":{"s":{"ч","в","р","а","д","у","п","е"},"l":7.483314773547883,"c":{"п":2,"р":2,"е":4,"в":4,"д":2,"у":2,"а":2,"ч":2},"t":"TranslateComTranslate"},"API do tradutor de tradução":{"s":{"d","t","p","u","ã","r","ç","a","o","e","i"},"l":7.810249675906654,"c":{"a":3,"p":1,"i":1,"d":4,"o":3,"t":3,"r":3,"u":2,"e":1,"ç":1,"ã":1},"t":"TranslateComTranslate"},"TranslateCom Translator":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.745966692414834,"c":{"t":4,"r":3,"a":4,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Translatecom Translator":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.745966692414834,"c":{"t":4,"r":3,"a":4,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"ترجمو ترجمو ترجمو":{"s":{"و","م","ر","ت","ج"},"l":6.708203932499369,"c":{"ت":3,"ر":3,"ج":3,"م":3,"و":3},"t":"TranslateComTranslate"},"Транслате.цом":{"s":{"н","л",".","м","с","а","р","о","ц","е","т"},"l":4.123105625617661,"c":{"т":2,"р":1,"а":2,"н":1,"с":1,"л":1,"е":1,".":1,"ц":1,"о":1,"м":1},"t":"TranslateComTranslate"},"Traduït.com Traductor ApitranslaTecom":{"s":{".","n","d","t","l","p","u","c","r","ï","s","m","a","o","e","i"},"l":10.723805294763608,"c":{"t":6,"r":4,"a":5,"d":2,"u":2,"ï":1,".":1,"c":3,"o":3,"m":2,"p":1,"i":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"د باوريزو ژباړونکي API":{"s":{"ب","و","ک","ي","ړ","ا","ر","ژ","ز","a","p","ن","i","د"},"l":5.5677643628300215,"c":{"د":1,"ب":2,"ا":2,"و":3,"ر":1,"ي":2,"ز":1,"ژ":1,"ړ":1,"ن":1,"ک":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com Translator APITranslatecom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.328828005937952,"c":{"t":6,"r":4,"a":7,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"ТранслателЦом Транслатор АПИ":{"s":{"н","л","м","и","с","а","р","о","п","ц","е","т"},"l":8.717797887081348,"c":{"т":4,"р":3,"а":5,"н":2,"с":2,"л":3,"е":1,"ц":1,"о":2,"м":1,"п":1,"и":1},"t":"TranslateComTranslate"},"Aistrigh translatecom":{"s":{"g","n","h","t","l","c","r","s","m","a","o","e","i"},"l":6.164414002968976,"c":{"a":3,"i":2,"s":2,"t":3,"r":2,"g":1,"h":1,"n":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Translator":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":7.810249675906654,"c":{"t":4,"r":3,"a":4,"n":2,"s":2,"l":2,"e":1,".":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Prevesti prevod":{"s":{"o","d","t","v","r","s","p","e","i"},"l":5.0990195135927845,"c":{"p":2,"r":2,"e":3,"v":2,"s":1,"t":1,"i":1,"o":1,"d":1},"t":"TranslateComTranslate"},"TranslateCom تەرجىمانى API":{"s":{"l","م","a","r","m","ج","ن","o","i","n","t","ى","ا","ر","s","c","e","ە","ت","p"},"l":5.830951894845301,"c":{"t":2,"r":1,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com çevirmen":{"s":{".","n","t","l","v","c","r","s","m","ç","a","o","e","i"},"l":6.082762530298219,"c":{"t":2,"r":2,"a":2,"n":2,"s":1,"l":1,"e":3,".":1,"c":1,"o":1,"m":2,"ç":1,"v":1,"i":1},"t":"TranslateComTranslate"},"Translate.com interpres apitranslatercom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":11.575836902790225,"c":{"t":5,"r":5,"a":5,"n":3,"s":3,"l":2,"e":4,".":1,"c":2,"o":2,"m":2,"i":2,"p":2},"t":"TranslateComTranslate"},"ଅନୁବାଦ ଡଟ୍":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଡ","ଟ","ଅ"},"l":3.0,"c":{"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"ଡ":1,"ଟ":1,"୍":1},"t":"TranslateComTranslate"},"បកប្រែ":{"s":{"ប","រ","្","ែ","ក"},"l":2.8284271247461903,"c":{"ប":2,"ក":1,"្":1,"រ":1,"ែ":1},"t":"TranslateComTranslate"},"مترجم ترجمه":{"s":{"م","ر","ت","ه","ج"},"l":4.69041575982343,"c":{"م":3,"ت":2,"ر":2,"ج":2,"ه":1},"t":"TranslateComTranslate"},"Которууга которуу":{"s":{"к","а","г","р","о","у","т"},"l":6.782329983125268,"c":{"к":2,"о":4,"т":2,"р":2,"у":4,"г":1,"а":1},"t":"TranslateComTranslate"},"Tarjamah narjamahkeun":{"s":{"n","h","j","t","u","r","m","k","a","e"},"l":7.745966692414834,"c":{"t":1,"a":6,"r":2,"j":2,"m":2,"h":2,"n":2,"k":1,"e":1,"u":1},"t":"TranslateComTranslate"},"Dranslate.com Translator":{"s":{".","n","d","l","t","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"d":1,"r":3,"a":4,"n":2,"s":2,"l":2,"t":3,"e":1,".":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"மொழிபெயர்ப்பு மொழிபெயர்ப்பாளர்":{"s":{"ெ","ொ","ு","ம","ர","ய","ப","்","ி","ா","ழ","ள"},"l":9.848857801796104,"c":{"ம":2,"ொ":2,"ழ":2,"ி":2,"ப":6,"ெ":2,"ய":2,"ர":3,"்":5,"ு":1,"ா":1,"ள":1},"t":"TranslateComTranslate"},"Aistritheoir translate.com":{"s":{".","n","h","t","l","c","r","s","m","a","o","e","i"},"l":7.810249675906654,"c":{"a":3,"i":3,"s":2,"t":4,"r":3,"h":1,"e":2,"o":2,"n":1,"l":1,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"অনুবাদ ডটকম অনুবাদক":{"s":{"অ","ু","ন","দ","ম","ট","ব","ক","া","ড"},"l":5.5677643628300215,"c":{"অ":2,"ন":2,"ু":2,"ব":2,"া":2,"দ":2,"ড":1,"ট":1,"ক":2,"ম":1},"t":"TranslateComTranslate"},"Орчуулах.com орчуулагч":{"s":{"л","ч",".","а","г","m","р","о","у","c","o","х"},"l":6.855654600401044,"c":{"о":2,"р":2,"ч":3,"у":4,"л":2,"а":2,"х":1,".":1,"c":1,"o":1,"m":1,"г":1},"t":"TranslateComTranslate"},"Tụgharịa asụsụ.com":{"s":{"g",".","h","t","c","r","s","m","ụ","ị","a","o"},"l":5.5677643628300215,"c":{"t":1,"ụ":3,"g":1,"h":1,"a":3,"r":1,"ị":1,"s":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com vertaler":{"s":{".","n","t","l","v","c","r","s","m","a","o","e"},"l":6.855654600401044,"c":{"t":3,"r":3,"a":3,"n":1,"s":1,"l":2,"e":3,".":1,"c":1,"o":1,"m":1,"v":1},"t":"TranslateComTranslate"},"ترجمہ ڈاٹ کام مترجم apitranslatecom":{"s":{"l","م","a","ڈ","ہ","r","ٹ","m","ج","o","i","n","t","ا","ر","s","c","e","ک","ت","p"},"l":7.681145747868608,"c":{"ت":2,"ر":2,"ج":2,"م":4,"ہ":1,"ڈ":1,"ا":2,"ٹ":1,"ک":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom аудармасы":{"s":{"n","р","t","l","ы","с","а","c","r","s","m","д","м","у","a","o","e"},"l":5.5677643628300215,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"а":3,"у":1,"д":1,"р":1,"м":1,"с":1,"ы":1},"t":"TranslateComTranslate"},"Translatecom diterjemahkan":{"s":{"n","h","d","j","t","l","c","r","s","m","k","a","o","e","i"},"l":7.416198487095663,"c":{"t":3,"r":2,"a":4,"n":2,"s":1,"l":1,"e":3,"c":1,"o":1,"m":2,"d":1,"i":1,"j":1,"h":1,"k":1},"t":"TranslateComTranslate"},"Translate.com Թարգմանել":{"s":{"թ","ա","ն","l","գ","a","r","m","o","լ","n","t","ե","s","c","e",".","ր","մ"},"l":5.291502622129181,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"թ":1,"ա":2,"ր":1,"գ":1,"մ":1,"ն":1,"ե":1,"լ":1},"t":"TranslateComTranslate"},"Prevajalec translateCom":{"s":{"n","o","j","l","t","v","c","r","s","m","a","p","e"},"l":6.928203230275509,"c":{"p":1,"r":2,"e":3,"v":1,"a":4,"j":1,"l":2,"c":2,"t":2,"n":1,"s":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ट्रान्जेक्ट वार्ता अनुवादक":{"s":{"े","ु","त","न","्","अ","द","ा","ट","र","ज","क","व"},"l":7.615773105863909,"c":{"ट":2,"्":4,"र":2,"ा":4,"न":2,"ज":1,"े":1,"क":2,"व":2,"त":1,"अ":1,"ु":1,"द":1},"t":"TranslateComTranslate"},"Dịch.com dịch":{"s":{".","h","d","m","ị","c","o"},"l":4.898979485566356,"c":{"d":2,"ị":2,"c":3,"h":2,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"TranslateCom Пераклад":{"s":{"к","е","л","n","п","t","l","а","c","r","д","s","m","р","a","o","e"},"l":5.0990195135927845,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"п":1,"е":1,"р":1,"а":2,"к":1,"л":1,"д":1},"t":"TranslateComTranslate"},"ТранслатЕЦом Транслатор":{"s":{"н","л","м","с","а","р","о","ц","е","т"},"l":7.745966692414834,"c":{"т":4,"р":3,"а":4,"н":2,"с":2,"л":2,"е":1,"ц":1,"о":2,"м":1},"t":"TranslateComTranslate"},"ट्रान्सलेट डॉट कॉम ट्रान्सलेटर apitranslatecom":{"s":{"ड","l","ट","र","क","a","े","न","्","r","स","m","ल","o","i","n","t","ॉ","s","c","म","e","ा","p"},"l":10.0,"c":{"ट":5,"्":4,"र":3,"ा":2,"न":2,"स":2,"ल":2,"े":2,"ड":1,"ॉ":2,"क":1,"म":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"טראַנסלוסאָם טראַנסלאַטאָר":{"s":{"נ","ָ","ס","ט","ל","ם","ַ","א","ר","ו"},"l":8.660254037844387,"c":{"ט":3,"ר":3,"א":5,"ַ":3,"נ":2,"ס":3,"ל":2,"ו":1,"ָ":2,"ם":1},"t":"TranslateComTranslate"},"Translatorcom API":{"s":{"n","t","l","p","c","r","s","m","a","o","i"},"l":5.291502622129181,"c":{"t":2,"r":2,"a":3,"n":1,"s":1,"l":1,"o":2,"c":1,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Cyfieithu cyfieithu":{"s":{"h","f","t","u","y","c","e","i"},"l":6.6332495807108,"c":{"c":2,"y":2,"f":2,"i":4,"e":2,"t":2,"h":2,"u":2},"t":"TranslateComTranslate"},"API на Translatecom Translator":{"s":{"н","n","o","t","l","а","c","r","s","m","a","p","e","i"},"l":8.54400374531753,"c":{"a":5,"p":1,"i":1,"н":1,"а":1,"t":4,"r":3,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Translatecom tradiktè API":{"s":{"n","è","d","t","l","p","c","r","s","m","k","a","o","e","i"},"l":7.14142842854285,"c":{"t":4,"r":2,"a":4,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"d":1,"i":2,"k":1,"è":1,"p":1},"t":"TranslateComTranslate"},"અનુવાદ.કોમ અનુવાદક apitranslatecom":{"s":{"ન","l","ો","a","ુ","ક","r","મ","અ","m","દ","o","i","n","t","s","c","e","ા",".","p","વ"},"l":7.3484692283495345,"c":{"અ":2,"ન":2,"ુ":2,"વ":2,"ા":2,"દ":2,".":1,"ક":2,"ો":1,"મ":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom tarjimasi":{"s":{"n","j","t","l","c","r","s","m","a","o","e","i"},"l":6.855654600401044,"c":{"t":3,"r":2,"a":4,"n":1,"s":2,"l":1,"e":1,"c":1,"o":1,"m":2,"j":1,"i":2},"t":"TranslateComTranslate"},"மொழிபெயர்ப்பு மொழிபெயர்ப்பாளர் API":{"s":{"ெ","ொ","ு","ம","ர","ய","ப","்","ி","ா","ழ","a","p","ள","i"},"l":10.0,"c":{"ம":2,"ொ":2,"ழ":2,"ி":2,"ப":6,"ெ":2,"ய":2,"ர":3,"்":5,"ு":1,"ா":1,"ள":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"ژباړه":{"s":{"ب","ړ","ا","ژ","ه"},"l":2.23606797749979,"c":{"ژ":1,"ب":1,"ا":1,"ړ":1,"ه":1},"t":"TranslateComTranslate"},"Translate.com Tərcüməçi":{"s":{".","n","ü","t","l","c","r","ə","s","m","ç","a","o","e","i"},"l":6.164414002968976,"c":{"t":3,"r":2,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":2,"o":1,"m":2,"ə":2,"ü":1,"ç":1,"i":1},"t":"TranslateComTranslate"},"„Translatecom“ vertimas":{"s":{"„","n","“","t","l","v","c","r","s","m","a","o","e","i"},"l":6.48074069840786,"c":{"„":1,"t":3,"r":2,"a":3,"n":1,"s":2,"l":1,"e":2,"c":1,"o":1,"m":2,"“":1,"v":1,"i":1},"t":"TranslateComTranslate"},"Translation.com വിവർത്തനം":{"s":{".","ി","n","ത","വ","t","l","ർ","്","c","r","s","m","ം","a","o","i","ന"},"l":6.0,"c":{"t":2,"r":1,"a":2,"n":2,"s":1,"l":1,"i":1,"o":2,".":1,"c":1,"m":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ന":1,"ം":1},"t":"TranslateComTranslate"},"Turjubaan turjubaan turjubaan turjubaan":{"s":{"n","b","j","t","u","r","a"},"l":14.422205101855956,"c":{"t":4,"u":8,"r":4,"j":4,"b":4,"a":8,"n":4},"t":"TranslateComTranslate"},"API tat-Traduttur TranslateCom":{"s":{"n","o","d","t","l","u","c","r","-","s","m","a","p","e","i"},"l":9.899494936611665,"c":{"a":5,"p":1,"i":1,"t":7,"-":1,"r":3,"d":1,"u":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Перекладати перекладач":{"s":{"к","л","ч","и","а","д","р","п","е","т"},"l":7.416198487095663,"c":{"п":2,"е":4,"р":2,"к":2,"л":2,"а":4,"д":2,"т":1,"и":1,"ч":1},"t":"TranslateComTranslate"},"Translate.com itzultzailea apitranslatecom":{"s":{".","n","t","l","p","u","c","r","s","m","z","a","o","e","i"},"l":12.24744871391589,"c":{"t":6,"r":2,"a":7,"n":2,"s":2,"l":4,"e":3,".":1,"c":2,"o":2,"m":2,"i":3,"z":2,"u":1,"p":1},"t":"TranslateComTranslate"},"Translat.com വിവർത്തക APITRANSLATECOM":{"s":{"ത","വ","l","ർ","a","ി","r","m","o","i","n","t","്","s","c","e",".","ക","p"},"l":9.219544457292887,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,".":1,"c":2,"o":2,"m":2,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ക":1,"p":1,"i":1,"e":1},"t":"TranslateComTranslate"},"Translatecom tulkotāja API":{"s":{"n","j","t","l","p","u","c","r","s","m","k","a","o","e","i","ā"},"l":7.211102550927978,"c":{"t":4,"r":1,"a":4,"n":1,"s":1,"l":2,"e":1,"c":1,"o":2,"m":1,"u":1,"k":1,"ā":1,"j":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com аудармашысы":{"s":{"l","д","м","a","ш","а","r","m","o","n","у","t","с","s","c","e",".","р","ы"},"l":6.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":2,"с":1},"t":"TranslateComTranslate"},"API de traducció traductora Translatecom":{"s":{"ó","n","o","d","t","l","u","c","r","s","m","a","p","e","i"},"l":11.135528725660043,"c":{"a":6,"p":1,"i":2,"d":3,"e":2,"t":5,"r":4,"u":2,"c":4,"ó":1,"o":2,"n":1,"s":1,"l":1,"m":1},"t":"TranslateComTranslate"},"Tłumacz tłumacz API":{"s":{"t","ł","u","c","z","m","a","p","i"},"l":5.916079783099616,"c":{"t":2,"ł":2,"u":2,"m":2,"a":3,"c":2,"z":2,"p":1,"i":1},"t":"TranslateComTranslate"},"ትርጉም ትርጉም አስተርጓሚ":{"s":{"ም","ሚ","አ","ር","ስ","ተ","ጉ","ት","ጓ"},"l":5.0990195135927845,"c":{"ት":2,"ር":3,"ጉ":2,"ም":2,"አ":1,"ስ":1,"ተ":1,"ጓ":1,"ሚ":1},"t":"TranslateComTranslate"},"ट्रान्सलेट कॉमन ट्रान्सलेटर":{"s":{"े","ॉ","न","्","ा","ट","र","स","ल","क","म"},"l":8.306623862918075,"c":{"ट":4,"्":4,"र":3,"ा":2,"न":3,"स":2,"ल":2,"े":2,"क":1,"ॉ":1,"म":1},"t":"TranslateComTranslate"},"ट्रांसलेट.कॉम अनुवादक":{"s":{".","े","ु","ॉ","न","्","अ","द","ा","ट","र","ं","स","ल","क","व","म"},"l":5.0990195135927845,"c":{"ट":2,"्":1,"र":1,"ा":2,"ं":1,"स":1,"ल":1,"े":1,".":1,"क":2,"ॉ":1,"म":1,"अ":1,"न":1,"ु":1,"व":1,"द":1},"t":"TranslateComTranslate"},"अनुवादक अनुवादक apitransatcatcate अनुवाद":{"s":{"a","n","ु","t","न","अ","द","ा","r","s","c","क","व","p","e","i"},"l":10.44030650891055,"c":{"अ":3,"न":3,"ु":3,"व":3,"ा":3,"द":3,"क":2,"a":5,"p":1,"i":1,"t":4,"r":1,"n":1,"s":1,"c":2,"e":1},"t":"TranslateComTranslate"},"Translate.com Translator Apitrans Pasppoto":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.922847983320086,"c":{"t":6,"r":4,"a":7,"n":3,"s":4,"l":2,"e":1,".":1,"c":1,"o":4,"m":1,"p":4,"i":1},"t":"TranslateComTranslate"},"Которуу Комментарий":{"s":{"к","н","м","и","а","й","р","о","у","е","т"},"l":5.830951894845301,"c":{"к":2,"о":3,"т":2,"р":2,"у":2,"м":2,"е":1,"н":1,"а":1,"и":1,"й":1},"t":"TranslateComTranslate"},"Μεταφράστε σε translateCom":{"s":{"α","ρ","a","n","o","t","l","μ","c","r","s","ε","m","σ","ά","τ","φ","e"},"l":6.164414002968976,"c":{"μ":1,"ε":3,"τ":2,"α":1,"φ":1,"ρ":1,"ά":1,"σ":2,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ٹرانسلیٹکوم مترجم API":{"s":{"و","ک","ی","ل","س","p","ا","م","ر","ت","ٹ","a","ج","ن","i"},"l":5.385164807134504,"c":{"ٹ":2,"ر":2,"ا":1,"ن":1,"س":1,"ل":1,"ی":1,"ک":1,"و":1,"م":3,"ت":1,"ج":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com tradwi":{"s":{".","n","d","w","t","l","c","r","s","m","a","o","e","i"},"l":5.744562646538029,"c":{"t":3,"r":2,"a":3,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"d":1,"w":1,"i":1},"t":"TranslateComTranslate"},"Cyfieithwch.com":{"s":{".","h","f","w","t","y","m","c","o","e","i"},"l":5.0,"c":{"c":3,"y":1,"f":1,"i":2,"e":1,"t":1,"h":2,"w":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Transtions.com mpandika teny apitranslatecom":{"s":{".","n","d","t","l","p","c","r","y","s","m","k","a","o","e","i"},"l":11.958260743101398,"c":{"t":5,"r":2,"a":6,"n":5,"s":3,"i":3,"o":3,".":1,"c":2,"m":3,"p":2,"d":1,"k":1,"e":2,"y":1,"l":1},"t":"TranslateComTranslate"},"Tarjamah Panarjamah.com":{"s":{".","n","h","o","j","t","c","r","m","a","p"},"l":8.717797887081348,"c":{"t":1,"a":7,"r":2,"j":2,"m":3,"h":2,"p":1,"n":1,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Translate.com თარჯიმანი apitranslatecom":{"s":{"l","მ","a","ჯ","რ","r","m","o","ი","i","თ","n","t","ა","ნ","s","c","e",".","p"},"l":9.433981132056603,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Traducido por tradución":{"s":{"ó","n","d","t","p","u","c","r","a","o","i"},"l":6.708203932499369,"c":{"t":2,"r":3,"a":2,"d":3,"u":2,"c":2,"i":2,"o":2,"p":1,"ó":1,"n":1},"t":"TranslateComTranslate"},"Translate.com පරිවර්තක පරිවෘත්තීය":{"s":{"ි","ව","ප","l","ය","a","ී","r","ෘ","m","o","n","ත","t","s","c","e",".","ක","්","ර"},"l":7.416198487095663,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"ප":2,"ර":3,"ි":2,"ව":2,"්":2,"ත":3,"ක":1,"ෘ":1,"ී":1,"ය":1},"t":"TranslateComTranslate"},"مترجم Translate.com":{"s":{".","n","o","t","l","م","ر","ت","r","s","c","m","a","ج","e"},"l":4.898979485566356,"c":{"م":2,"ت":1,"ر":1,"ج":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"மொழிபெயர்ப்பு மொழிபெயர்ப்பு":{"s":{"ெ","ொ","ு","ம","ர","ய","ப","்","ி","ழ"},"l":9.16515138991168,"c":{"ம":2,"ொ":2,"ழ":2,"ி":2,"ப":6,"ெ":2,"ய":2,"ர":2,"்":4,"ு":2},"t":"TranslateComTranslate"},"Sụgharịa ntụgharị.com":{"s":{"g",".","n","h","t","c","r","s","m","ụ","ị","a","o"},"l":6.0,"c":{"s":1,"ụ":2,"g":2,"h":2,"a":3,"r":2,"ị":2,"n":1,"t":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom Tradukisto API":{"s":{"n","d","t","l","p","u","c","r","s","m","k","a","o","e","i"},"l":7.54983443527075,"c":{"t":4,"r":2,"a":4,"n":1,"s":2,"l":1,"e":1,"c":1,"o":2,"m":1,"d":1,"u":1,"k":1,"i":2,"p":1},"t":"TranslateComTranslate"},"Translate.com Traduki":{"s":{".","n","d","t","l","u","c","r","s","m","k","a","o","e","i"},"l":5.830951894845301,"c":{"t":3,"r":2,"a":3,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"d":1,"u":1,"k":1,"i":1},"t":"TranslateComTranslate"},"Tłumacz tłumacz.com":{"s":{".","t","ł","u","c","z","m","a","o"},"l":6.324555320336759,"c":{"t":2,"ł":2,"u":2,"m":3,"a":2,"c":3,"z":2,".":1,"o":1},"t":"TranslateComTranslate"},"Translatecom översättare":{"s":{"n","t","l","v","c","r","ö","s","m","ä","a","o","e"},"l":7.416198487095663,"c":{"t":4,"r":3,"a":3,"n":1,"s":2,"l":1,"e":3,"c":1,"o":1,"m":1,"ö":1,"v":1,"ä":1},"t":"TranslateComTranslate"},"ترجمہ ڈاٹ کام مترجم":{"s":{"ک","ڈ","ا","ہ","م","ر","ت","ٹ","ج"},"l":6.0,"c":{"ت":2,"ر":2,"ج":2,"م":4,"ہ":1,"ڈ":1,"ا":2,"ٹ":1,"ک":1},"t":"TranslateComTranslate"},"Trantella.com faaliliu":{"s":{".","n","f","t","l","u","c","r","m","a","o","e","i"},"l":7.0,"c":{"t":2,"r":1,"a":4,"n":1,"e":1,"l":4,".":1,"c":1,"o":1,"m":1,"f":1,"i":2,"u":1},"t":"TranslateComTranslate"},"Translatecom dịch":{"s":{"n","h","d","t","l","c","r","s","m","ị","a","o","e"},"l":4.69041575982343,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":2,"o":1,"m":1,"d":1,"ị":1,"h":1},"t":"TranslateComTranslate"},"Prevodite.com prevoditelj apitranslatecom":{"s":{"a",".","n","d","j","t","l","p","v","r","s","m","c","o","e","i"},"l":10.816653826391969,"c":{"p":3,"r":3,"e":5,"v":2,"o":4,"d":2,"i":3,"t":4,".":1,"c":2,"m":2,"l":2,"j":1,"a":3,"n":1,"s":1},"t":"TranslateComTranslate"},"অনুবাদ ডটকম অনুবাদ":{"s":{"অ","ু","ন","দ","ম","ট","ব","ক","া","ড"},"l":5.291502622129181,"c":{"অ":2,"ন":2,"ু":2,"ব":2,"া":2,"দ":2,"ড":1,"ট":1,"ক":1,"ম":1},"t":"TranslateComTranslate"},"Translate.com Prevoditelj":{"s":{".","n","d","j","t","l","p","v","c","r","s","m","a","o","e","i"},"l":6.6332495807108,"c":{"t":3,"r":2,"a":2,"n":1,"s":1,"l":2,"e":3,".":1,"c":1,"o":2,"m":1,"p":1,"v":1,"d":1,"i":1,"j":1},"t":"TranslateComTranslate"},"TranslateCom വിവർത്തകൻ":{"s":{"ൻ","ി","n","ത","വ","t","l","ർ","്","ക","c","r","s","m","a","o","e"},"l":5.385164807134504,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"വ":2,"ി":1,"ർ":1,"ത":2,"്":1,"ക":1,"ൻ":1},"t":"TranslateComTranslate"},"Aistritheoir translatecom":{"s":{"n","h","t","l","c","r","s","m","a","o","e","i"},"l":7.745966692414834,"c":{"a":3,"i":3,"s":2,"t":4,"r":3,"h":1,"e":2,"o":2,"n":1,"l":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Traductor de traduce.com":{"s":{".","d","t","u","c","r","m","a","o","e"},"l":7.3484692283495345,"c":{"t":3,"r":3,"a":2,"d":3,"u":2,"c":3,"o":2,"e":2,".":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Переводчик Apitranslatecom":{"s":{"l","д","п","a","и","r","m","o","i","к","n","t","s","о","c","e",".","ч","в","р","p","е"},"l":9.38083151964686,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Traduci u traduttore":{"s":{"d","t","u","c","r","a","o","e","i"},"l":6.782329983125268,"c":{"t":4,"r":3,"a":2,"d":2,"u":3,"c":1,"i":1,"o":1,"e":1},"t":"TranslateComTranslate"},"Μεταφραστής TranslateCom":{"s":{"α","l","a","ρ","r","ε","m","o","n","ς","t","s","c","ή","τ","e","μ","φ","σ"},"l":5.5677643628300215,"c":{"μ":1,"ε":1,"τ":2,"α":2,"φ":1,"ρ":1,"σ":1,"ή":1,"ς":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom çevirmen":{"s":{"n","t","l","v","c","r","s","m","ç","a","o","e","i"},"l":6.0,"c":{"t":2,"r":2,"a":2,"n":2,"s":1,"l":1,"e":3,"c":1,"o":1,"m":2,"ç":1,"v":1,"i":1},"t":"TranslateComTranslate"},"Dịch.com Dịch giả Apitranslatecom":{"s":{"a","g",".","n","h","d","t","l","p","r","s","m","ả","ị","c","o","e","i"},"l":7.874007874011811,"c":{"d":2,"ị":2,"c":4,"h":2,".":1,"o":2,"m":2,"g":1,"i":2,"ả":1,"a":3,"p":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"Translate.com Tərcüməçi APitranslatecom":{"s":{".","n","ü","t","l","p","c","r","ə","s","m","ç","a","o","e","i"},"l":10.44030650891055,"c":{"t":5,"r":3,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":3,"o":2,"m":3,"ə":2,"ü":1,"ç":1,"i":2,"p":1},"t":"TranslateComTranslate"},"ب trixtewe":{"s":{"ب","w","t","r","e","i","x"},"l":3.605551275463989,"c":{"ب":1,"t":2,"r":1,"i":1,"x":1,"e":2,"w":1},"t":"TranslateComTranslate"},"Whakamarama.com Whakawhitiwhiti a ApitranslateCom":{"s":{".","n","h","w","t","l","p","c","r","s","m","k","a","o","e","i"},"l":15.231546211727817,"c":{"w":4,"h":4,"a":11,"k":2,"m":4,"r":2,".":1,"c":2,"o":2,"i":5,"t":4,"p":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"تەرجىمە.com تەرجىمە":{"s":{".","o","ى","ە","ر","ت","م","m","c","ج"},"l":6.324555320336759,"c":{"ت":2,"ە":4,"ر":2,"ج":2,"ى":2,"م":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translllultcom Iwwersetzer API":{"s":{"n","w","t","l","p","u","c","r","s","m","z","a","o","e","i"},"l":8.12403840463596,"c":{"t":3,"r":3,"a":2,"n":1,"s":2,"l":4,"u":1,"c":1,"o":1,"m":1,"i":2,"w":2,"e":3,"z":1,"p":1},"t":"TranslateComTranslate"},"Eadar-theangaiche tar-tharraingeach":{"s":{"g","n","h","d","t","c","r","-","a","e","i"},"l":11.916375287812984,"c":{"e":4,"a":8,"d":1,"r":4,"-":2,"t":3,"h":4,"n":2,"g":2,"i":2,"c":2},"t":"TranslateComTranslate"},"번역닷컴":{"s":{"컴","번","역","닷"},"l":2.0,"c":{"번":1,"역":1,"닷":1,"컴":1},"t":"TranslateComTranslate"},"Wergera wergerandinê wergerîne":{"s":{"g","n","d","w","ê","r","î","a","e","i"},"l":10.954451150103322,"c":{"w":3,"e":7,"r":6,"g":3,"a":2,"n":3,"d":1,"i":1,"ê":1,"î":1},"t":"TranslateComTranslate"},"Tarjamahkeun.com Tarjamahkeun":{"s":{".","n","h","j","t","u","c","r","m","k","a","o","e"},"l":8.94427190999916,"c":{"t":2,"a":6,"r":2,"j":2,"m":3,"h":2,"k":2,"e":2,"u":2,"n":2,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"અનુવાદ.કોમ અનુવાદ":{"s":{"ા","ન",".","ુ","ક","મ","અ","ો","દ","વ"},"l":5.291502622129181,"c":{"અ":2,"ન":2,"ુ":2,"વ":2,"ા":2,"દ":2,".":1,"ક":1,"ો":1,"મ":1},"t":"TranslateComTranslate"},"ट्रान्सलेटमाक अनुवादक एपीआई":{"s":{"ई","ट","र","क","े","ी","न","्","द","स","ल","ए","प","अ","म","ु","ा","व","आ"},"l":6.244997998398398,"c":{"ट":2,"्":2,"र":1,"ा":3,"न":2,"स":1,"ल":1,"े":1,"म":1,"क":2,"अ":1,"ु":1,"व":1,"द":1,"ए":1,"प":1,"ी":1,"आ":1,"ई":1},"t":"TranslateComTranslate"},"Itzuli.com Itzuli":{"s":{".","t","l","u","z","m","c","o","i"},"l":6.0,"c":{"i":4,"t":2,"z":2,"u":2,"l":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"טראַנסלאָסיאָן זעץ":{"s":{"נ","י","ָ","ע","ז","ן","ס","ט","ל","ץ","ַ","א","ר"},"l":5.196152422706632,"c":{"ט":1,"ר":1,"א":3,"ַ":1,"נ":1,"ס":2,"ל":1,"ָ":2,"י":1,"ן":1,"ז":1,"ע":1,"ץ":1},"t":"TranslateComTranslate"},"Которууга котормочу API":{"s":{"к","ч","i","м","а","г","р","о","у","a","p","т"},"l":7.280109889280518,"c":{"к":2,"о":5,"т":2,"р":2,"у":3,"г":1,"а":1,"м":1,"ч":1,"a":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Преведувач.com преведувач apitranslatecom":{"s":{"l","д","a","п","а","r","m","o","i","n","t","s","c","e",".","ч","в","р","у","p","е"},"l":9.433981132056603,"c":{"п":2,"р":2,"е":4,"в":4,"д":2,"у":2,"а":2,"ч":2,".":1,"c":2,"o":2,"m":2,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"ແປພາສາແປພາສາແປ":{"s":{"ພ","ປ","ສ","າ","ແ"},"l":6.48074069840786,"c":{"ແ":3,"ປ":3,"ພ":2,"າ":4,"ສ":2},"t":"TranslateComTranslate"},"I-Geatory Translation":{"s":{"g","n","t","l","r","-","y","s","a","o","e","i"},"l":6.324555320336759,"c":{"i":2,"-":1,"g":1,"e":1,"a":3,"t":3,"o":2,"r":2,"y":1,"n":2,"s":1,"l":1},"t":"TranslateComTranslate"},"Translalic faaliliu":{"s":{"n","f","t","l","u","c","r","s","a","i"},"l":6.928203230275509,"c":{"t":1,"r":1,"a":4,"n":1,"s":1,"l":4,"i":3,"c":1,"f":1,"u":1},"t":"TranslateComTranslate"},"Translate.com interpres":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":6.782329983125268,"c":{"t":3,"r":3,"a":2,"n":2,"s":2,"l":1,"e":3,".":1,"c":1,"o":1,"m":1,"i":1,"p":1},"t":"TranslateComTranslate"},"Humushela Humusha":{"s":{"h","l","u","s","m","a","e"},"l":6.782329983125268,"c":{"h":4,"u":4,"m":2,"s":2,"e":1,"l":1,"a":2},"t":"TranslateComTranslate"},"Tradutor tradutor.com":{"s":{".","d","t","u","c","r","m","a","o"},"l":7.483314773547883,"c":{"t":4,"r":4,"a":2,"d":2,"u":2,"o":3,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"ଟ୍ରାନଡକମ୍ ଅନୁବାଦକ API |":{"s":{"ୁ","ା","୍","ଦ","ବ","ନ","ଡ","|","ଟ","ର","ଅ","ମ","କ","a","p","i"},"l":5.291502622129181,"c":{"ଟ":1,"୍":2,"ର":1,"ା":2,"ନ":2,"ଡ":1,"କ":2,"ମ":1,"ଅ":1,"ୁ":1,"ବ":1,"ଦ":1,"a":1,"p":1,"i":1,"|":1},"t":"TranslateComTranslate"},"זעץ €עס":{"s":{"ע","ז","ס","€","ץ"},"l":2.8284271247461903,"c":{"ז":1,"ע":2,"ץ":1,"€":1,"ס":1},"t":"TranslateComTranslate"},"TranslateCom თარჯიმანი":{"s":{"თ","n","ჯ","t","l","ა","რ","მ","c","r","ნ","s","m","a","o","e","ი"},"l":5.385164807134504,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"TranslateComTranslate"},"Traduttur tat-Traduzzjoni.com":{"s":{".","n","d","j","t","u","c","r","-","z","m","a","o","i"},"l":9.055385138137417,"c":{"t":6,"r":3,"a":3,"d":2,"u":3,"-":1,"z":2,"j":1,"o":2,"n":1,"i":1,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Translatecom tulkot":{"s":{"n","t","l","u","c","r","s","m","k","a","o","e"},"l":6.0,"c":{"t":4,"r":1,"a":2,"n":1,"s":1,"l":2,"e":1,"c":1,"o":2,"m":1,"u":1,"k":1},"t":"TranslateComTranslate"},"translate.com translator apitranslatecom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.328828005937952,"c":{"t":6,"r":4,"a":7,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"अनुवाद अनुवादक अनुवाद":{"s":{"ु","न","अ","द","ा","क","व"},"l":7.416198487095663,"c":{"अ":3,"न":3,"ु":3,"व":3,"ा":3,"द":3,"क":1},"t":"TranslateComTranslate"},"Traduci u traduttore.com":{"s":{".","d","t","u","c","r","m","a","o","e","i"},"l":7.3484692283495345,"c":{"t":4,"r":3,"a":2,"d":2,"u":3,"c":2,"i":1,"o":2,"e":1,".":1,"m":1},"t":"TranslateComTranslate"},"Tradlate.com Traduzir":{"s":{".","d","t","l","u","c","r","z","m","a","o","e","i"},"l":6.324555320336759,"c":{"t":3,"r":3,"a":3,"d":2,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"u":1,"z":1,"i":1},"t":"TranslateComTranslate"},"Penterjemah translatecom":{"s":{"n","h","o","j","t","l","c","r","s","m","a","p","e"},"l":7.280109889280518,"c":{"p":1,"e":4,"n":2,"t":3,"r":2,"j":1,"m":2,"a":3,"h":1,"s":1,"l":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Tulkot.com tulkotājs apitranslatecom":{"s":{"a",".","n","j","t","l","p","u","r","s","m","k","c","o","e","i","ā"},"l":9.899494936611665,"c":{"t":6,"u":2,"l":3,"k":2,"o":4,".":1,"c":2,"m":2,"ā":1,"j":1,"s":2,"a":3,"p":1,"i":1,"r":1,"n":1,"e":1},"t":"TranslateComTranslate"},"Transreatecom oersette":{"s":{"n","t","c","r","s","m","a","o","e"},"l":8.06225774829855,"c":{"t":4,"r":3,"a":2,"n":1,"s":2,"e":5,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Nwa translatecom":{"s":{"n","w","t","l","c","r","s","m","a","o","e"},"l":5.0,"c":{"n":2,"w":1,"a":3,"t":2,"r":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ట్రాన్స్‌లేట్‌కామ్ అనువాదకుడు":{"s":{"మ","స","ర","ల","్","క","ద","ా","డ","వ","ే","ట","ు","న","అ"},"l":8.0,"c":{"ట":2,"్":5,"ర":1,"ా":3,"న":2,"స":1,"ల":1,"ే":1,"క":2,"మ":1,"అ":1,"ు":3,"వ":1,"ద":1,"డ":1},"t":"TranslateComTranslate"},"Traduce. u traduce":{"s":{".","d","t","u","c","r","a","e"},"l":5.830951894845301,"c":{"t":2,"r":2,"a":2,"d":2,"u":3,"c":2,"e":2,".":1},"t":"TranslateComTranslate"},"መተርጎም":{"s":{"ም","መ","ጎ","ተ","ር"},"l":2.23606797749979,"c":{"መ":1,"ተ":1,"ር":1,"ጎ":1,"ም":1},"t":"TranslateComTranslate"},"Translatec Translator API":{"s":{"n","t","l","p","c","r","s","a","o","e","i"},"l":8.18535277187245,"c":{"t":4,"r":3,"a":5,"n":2,"s":2,"l":2,"e":1,"c":1,"o":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Комментарийлерди которуу":{"s":{"к","н","л","м","и","а","й","д","р","о","у","е","т"},"l":6.855654600401044,"c":{"к":2,"о":3,"м":2,"е":2,"н":1,"т":2,"а":1,"р":3,"и":2,"й":1,"л":1,"д":1,"у":2},"t":"TranslateComTranslate"},"Translate.com ଅନୁବାଦକ ଆପ୍ରାସେଟଲେଟ୍ |":{"s":{"ଦ","l","ଲ","ପ","a","ୁ","ା","୍","ବ","ନ","ର","ଅ","r","m","o","n","|","t","ଟ","s","c","e",".","ଆ","େ","ସ","କ"},"l":6.708203932499369,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":2,"ଦ":1,"କ":1,"ଆ":1,"ପ":1,"୍":2,"ର":1,"ସ":1,"େ":2,"ଟ":2,"ଲ":1,"|":1},"t":"TranslateComTranslate"},"TranslateCom womasulira":{"s":{"n","w","t","l","u","c","r","s","m","a","o","e","i"},"l":6.782329983125268,"c":{"t":2,"r":2,"a":4,"n":1,"s":2,"l":2,"e":1,"c":1,"o":2,"m":2,"w":1,"u":1,"i":1},"t":"TranslateComTranslate"},"Translate.com übersetzt":{"s":{".","n","b","ü","t","l","c","r","s","m","z","a","o","e"},"l":6.782329983125268,"c":{"t":4,"r":2,"a":2,"n":1,"s":2,"l":1,"e":3,".":1,"c":1,"o":1,"m":1,"ü":1,"b":1,"z":1},"t":"TranslateComTranslate"},"Tafsiri.com":{"s":{".","f","t","c","r","s","m","a","o","i"},"l":3.605551275463989,"c":{"t":1,"a":1,"f":1,"s":1,"i":2,"r":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"అనువాదం.కామ్ అనువాదకుడు Apitranslatecom":{"s":{"మ","l","ద","ం","ు","a","డ","r","m","o","అ","i","n","t","s","c","న","e",".","క","్","ా","వ","p"},"l":8.54400374531753,"c":{"అ":2,"న":2,"ు":4,"వ":2,"ా":3,"ద":2,"ం":1,".":1,"క":2,"మ":1,"్":1,"డ":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com مترجم Apitranslatecom":{"s":{".","n","t","l","p","ج","c","r","م","s","m","ت","ر","a","o","e","i"},"l":9.1104335791443,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"م":2,"ت":1,"ر":1,"ج":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Whakawhitiwhiti":{"s":{"h","w","t","k","a","i"},"l":6.557438524302,"c":{"w":3,"h":3,"a":2,"k":1,"i":4,"t":2},"t":"TranslateComTranslate"},"Translate.com -kääntäjä ApitransLatecom":{"s":{".","n","j","t","l","p","c","r","-","s","m","ä","k","a","o","e","i"},"l":10.44030650891055,"c":{"t":5,"r":2,"a":5,"n":3,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"-":1,"k":1,"ä":4,"j":1,"p":1,"i":1},"t":"TranslateComTranslate"},"თარგმნის თარგმანი":{"s":{"თ","ს","ა","მ","რ","ნ","გ","ი"},"l":5.830951894845301,"c":{"თ":2,"ა":3,"რ":2,"გ":2,"მ":2,"ნ":2,"ი":2,"ს":1},"t":"TranslateComTranslate"},"Translatcomo":{"s":{"n","t","l","c","r","s","m","a","o"},"l":4.242640687119285,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Translatecom Çeviri":{"s":{"n","t","l","v","c","r","s","m","ç","a","o","e","i"},"l":5.291502622129181,"c":{"t":2,"r":2,"a":2,"n":1,"s":1,"l":1,"e":2,"c":1,"o":1,"m":1,"ç":1,"v":1,"i":2},"t":"TranslateComTranslate"},"Humusha.com Humusha":{"s":{".","h","u","c","s","m","a","o"},"l":7.211102550927978,"c":{"h":4,"u":4,"m":3,"s":2,"a":2,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Translate.com Translator Apitranslatecom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.328828005937952,"c":{"t":6,"r":4,"a":7,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Penerjemah translate.com":{"s":{".","n","h","o","j","t","l","c","r","s","m","a","p","e"},"l":7.0,"c":{"p":1,"e":4,"n":2,"r":2,"j":1,"m":2,"a":3,"h":1,"t":2,"s":1,"l":1,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Traduce.com":{"s":{".","d","t","u","c","r","m","a","o","e"},"l":3.605551275463989,"c":{"t":1,"r":1,"a":1,"d":1,"u":1,"c":2,"e":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"แปลแปล":{"s":{"แ","ล","ป"},"l":3.4641016151377544,"c":{"แ":2,"ป":2,"ล":2},"t":"TranslateComTranslate"},"TranslateCom Tradukas":{"s":{"n","d","t","l","u","c","r","s","m","k","a","o","e"},"l":6.48074069840786,"c":{"t":3,"r":2,"a":4,"n":1,"s":2,"l":1,"e":1,"c":1,"o":1,"m":1,"d":1,"u":1,"k":1},"t":"TranslateComTranslate"},"Translate.com oversetter":{"s":{".","n","t","l","v","c","r","s","m","a","o","e"},"l":7.681145747868608,"c":{"t":4,"r":3,"a":2,"n":1,"s":2,"l":1,"e":4,".":1,"c":1,"o":2,"m":1,"v":1},"t":"TranslateComTranslate"},"TRADLATECOM TRANSTOR":{"s":{"n","d","t","l","c","r","s","m","a","o","e"},"l":6.708203932499369,"c":{"t":4,"r":3,"a":3,"d":1,"l":1,"e":1,"c":1,"o":2,"m":1,"n":1,"s":1},"t":"TranslateComTranslate"},"Translate.com tradiktè":{"s":{".","n","è","d","t","l","c","r","s","m","k","a","o","e","i"},"l":6.4031242374328485,"c":{"t":4,"r":2,"a":3,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"d":1,"i":1,"k":1,"è":1},"t":"TranslateComTranslate"},"Translatecom ဘာသာပြန်သူ API":{"s":{"l","ဘ","ြ","a","ပ","ူ","r","m","န","o","i","်","n","t","ာ","s","သ","c","e","p"},"l":6.082762530298219,"c":{"t":2,"r":1,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Tłumacz.com":{"s":{".","t","ł","u","c","z","m","a","o"},"l":3.872983346207417,"c":{"t":1,"ł":1,"u":1,"m":2,"a":1,"c":2,"z":1,".":1,"o":1},"t":"TranslateComTranslate"},"Translate.com Terjemahan":{"s":{".","n","h","j","t","l","c","r","s","m","a","o","e"},"l":7.280109889280518,"c":{"t":3,"r":2,"a":4,"n":2,"s":1,"l":1,"e":3,".":1,"c":1,"o":1,"m":2,"j":1,"h":1},"t":"TranslateComTranslate"},"ਅਨੁਵਾਦ ਕਰੋ ਅਨੁਵਾਦਕ":{"s":{"ਾ","ਕ","ੋ","ਵ","ੁ","ਰ","ਅ","ਨ","ਦ"},"l":5.477225575051661,"c":{"ਅ":2,"ਨ":2,"ੁ":2,"ਵ":2,"ਾ":2,"ਦ":2,"ਕ":2,"ਰ":1,"ੋ":1},"t":"TranslateComTranslate"},"Traduït.com Traductor":{"s":{".","d","t","u","c","r","ï","m","a","o"},"l":6.928203230275509,"c":{"t":4,"r":3,"a":2,"d":2,"u":2,"ï":1,".":1,"c":2,"o":2,"m":1},"t":"TranslateComTranslate"},"Translate.com Penterjemah Apitranslatecom":{"s":{".","n","h","j","t","l","p","c","r","s","m","a","o","e","i"},"l":11.704699910719626,"c":{"t":5,"r":3,"a":6,"n":3,"s":2,"l":2,"e":5,".":1,"c":2,"o":2,"m":3,"p":2,"j":1,"h":1,"i":1},"t":"TranslateComTranslate"},"Překladač překladu":{"s":{"č","d","ř","l","u","k","a","p","e"},"l":5.916079783099616,"c":{"p":2,"ř":2,"e":2,"k":2,"l":2,"a":3,"d":2,"č":1,"u":1},"t":"TranslateComTranslate"},"Транслате.цом преводилац Апитранслатецом":{"s":{"н","л",".","м","и","в","с","а","д","р","о","п","ц","е","т"},"l":10.954451150103322,"c":{"т":4,"р":3,"а":6,"н":2,"с":2,"л":3,"е":3,".":1,"ц":3,"о":3,"м":2,"п":2,"в":1,"д":1,"и":2},"t":"TranslateComTranslate"},"Fassarar fassara fassarar":{"s":{"r","a","s","f"},"l":12.288205727444508,"c":{"f":3,"a":9,"s":6,"r":5},"t":"TranslateComTranslate"},"Преведувач.com преведувач":{"s":{".","ч","в","р","а","c","m","д","у","п","o","е"},"l":7.745966692414834,"c":{"п":2,"р":2,"е":4,"в":4,"д":2,"у":2,"а":2,"ч":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"TranslateCom Translator API":{"s":{"n","t","l","p","c","r","s","m","a","o","e","i"},"l":8.426149773176359,"c":{"t":4,"r":3,"a":5,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translllultcom Iwwersetzer":{"s":{"n","w","t","l","u","c","r","s","m","z","a","o","e","i"},"l":7.681145747868608,"c":{"t":3,"r":3,"a":1,"n":1,"s":2,"l":4,"u":1,"c":1,"o":1,"m":1,"i":1,"w":2,"e":3,"z":1},"t":"TranslateComTranslate"},"ಅನುವಾದ.ಕಾಮ್ ಅನುವಾದಕ apitranslatecom":{"s":{"ವ","ಕ","l","್","a","r","m","ದ","ಮ","o","i","n","t","ಅ","s","ಾ","c","e","ು",".","ನ","p"},"l":7.681145747868608,"c":{"ಅ":2,"ನ":2,"ು":2,"ವ":2,"ಾ":3,"ದ":2,".":1,"ಕ":2,"ಮ":1,"್":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Dudziro.com Dudziro":{"s":{".","d","u","r","z","m","c","o","i"},"l":6.6332495807108,"c":{"d":4,"u":2,"z":2,"i":2,"r":2,"o":3,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Translate.com ترجمة":{"s":{".","n","ة","t","l","ج","c","r","ت","s","m","ر","م","a","o","e"},"l":4.69041575982343,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"ت":1,"ر":1,"ج":1,"م":1,"ة":1},"t":"TranslateComTranslate"},"Transwatecom -kääntäjän sovellusliittymä":{"s":{"l","v","ä","y","a","j","w","u","r","m","o","i","n","t","s","c","e","-","k"},"l":10.295630140987,"c":{"t":5,"r":1,"a":2,"n":3,"s":3,"w":1,"e":2,"c":1,"o":2,"m":2,"-":1,"k":1,"ä":5,"j":1,"v":1,"l":3,"u":1,"i":2,"y":1},"t":"TranslateComTranslate"},"Tłumaczenie tłumacza":{"s":{"n","t","ł","u","c","z","m","a","e","i"},"l":6.244997998398398,"c":{"t":2,"ł":2,"u":2,"m":2,"a":3,"c":2,"z":2,"e":2,"n":1,"i":1},"t":"TranslateComTranslate"},"Translatecom traduit":{"s":{"n","d","t","l","u","c","r","s","m","a","o","e","i"},"l":6.244997998398398,"c":{"t":4,"r":2,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"d":1,"u":1,"i":1},"t":"TranslateComTranslate"},"TranslateCom تەرجىمانى":{"s":{"n","t","l","ى","ج","ا","c","r","ت","s","m","ە","ر","م","ن","a","o","e"},"l":5.196152422706632,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"ت":1,"ە":1,"ر":1,"ج":1,"ى":2,"م":1,"ا":1,"ن":1},"t":"TranslateComTranslate"},"Turjubaan turjubaan turjubaan":{"s":{"n","b","j","t","u","r","a"},"l":10.816653826391969,"c":{"t":3,"u":6,"r":3,"j":3,"b":3,"a":6,"n":3},"t":"TranslateComTranslate"},"Tulkot.com tulkotājs":{"s":{".","j","t","l","u","s","m","k","c","o","ā"},"l":6.557438524302,"c":{"t":4,"u":2,"l":2,"k":2,"o":3,".":1,"c":1,"m":1,"ā":1,"j":1,"s":1},"t":"TranslateComTranslate"},"Transllultcom Translate":{"s":{"n","t","l","u","c","r","s","m","a","o","e"},"l":7.615773105863909,"c":{"t":4,"r":2,"a":3,"n":2,"s":2,"l":4,"u":1,"c":1,"o":1,"m":1,"e":1},"t":"TranslateComTranslate"},"Fetolela":{"s":{"f","t","l","a","o","e"},"l":3.4641016151377544,"c":{"f":1,"e":2,"t":1,"o":1,"l":2,"a":1},"t":"TranslateComTranslate"},"RecelleT.com ଅନୁବାଦକ |":{"s":{"ୁ",".","ା","|","ଦ","ବ","ନ","l","t","ଅ","r","m","କ","c","o","e"},"l":5.477225575051661,"c":{"r":1,"e":3,"c":2,"l":2,"t":1,".":1,"o":1,"m":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"|":1},"t":"TranslateComTranslate"},"Traductor Translatecom":{"s":{"n","d","t","l","u","c","r","s","m","a","o","e"},"l":7.0,"c":{"t":4,"r":3,"a":3,"d":1,"u":1,"c":2,"o":2,"n":1,"s":1,"l":1,"e":1,"m":1},"t":"TranslateComTranslate"},"Переводчик Translatecom":{"s":{"l","д","a","п","и","r","m","o","к","n","t","s","о","c","e","ч","в","р","е"},"l":5.291502622129181,"c":{"п":1,"е":2,"р":1,"в":1,"о":1,"д":1,"ч":1,"и":1,"к":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Cyfieithydd apitranslateCom":{"s":{".","n","h","f","d","t","l","p","c","r","y","s","m","a","o","e","i"},"l":10.63014581273465,"c":{"t":5,"r":2,"a":5,"n":2,"s":2,"l":2,"e":3,".":1,"c":3,"o":2,"m":2,"y":2,"f":1,"i":3,"h":1,"d":2,"p":1},"t":"TranslateComTranslate"},"Guqula.com Translarer Apitranssecom":{"s":{"g",".","n","l","t","p","q","u","c","r","s","m","a","o","e","i"},"l":9.327379053088816,"c":{"g":1,"u":2,"q":1,"l":2,"a":5,".":1,"c":2,"o":2,"m":2,"t":2,"r":4,"n":2,"s":3,"e":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Ntụgharị ntụgharị":{"s":{"g","n","h","t","r","ụ","ị","a"},"l":5.656854249492381,"c":{"n":2,"t":2,"ụ":2,"g":2,"h":2,"a":2,"r":2,"ị":2},"t":"TranslateComTranslate"},"Whakamahinga":{"s":{"g","n","h","w","m","k","a","i"},"l":5.0990195135927845,"c":{"w":1,"h":2,"a":4,"k":1,"m":1,"i":1,"n":1,"g":1},"t":"TranslateComTranslate"},"Translate.com prekladateľ apitranslattecom":{"s":{".","n","d","ľ","t","l","p","c","r","s","m","k","a","o","e","i"},"l":12.165525060596439,"c":{"t":6,"r":3,"a":7,"n":2,"s":2,"l":3,"e":4,".":1,"c":2,"o":2,"m":2,"p":2,"k":1,"d":1,"ľ":1,"i":1},"t":"TranslateComTranslate"},"Translate.com თარჯიმანი":{"s":{".","თ","n","ჯ","t","l","ა","რ","მ","c","r","ნ","s","m","a","o","e","ი"},"l":5.477225575051661,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1},"t":"TranslateComTranslate"},"Transatecom Übersetzer -API":{"s":{"n","b","ü","t","p","c","r","-","s","m","z","a","o","e","i"},"l":7.54983443527075,"c":{"t":3,"r":3,"a":3,"n":1,"s":2,"e":4,"c":1,"o":1,"m":1,"ü":1,"b":1,"z":1,"-":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translote.com amatanthauzira":{"s":{".","n","h","t","l","u","c","r","s","m","z","a","o","e","i"},"l":8.774964387392123,"c":{"t":4,"r":2,"a":6,"n":2,"s":1,"l":1,"o":2,"e":1,".":1,"c":1,"m":2,"h":1,"u":1,"z":1,"i":1},"t":"TranslateComTranslate"},"Tafsiri ya Translatecom":{"s":{"n","f","t","l","c","r","y","s","m","a","o","e","i"},"l":6.708203932499369,"c":{"t":3,"a":4,"f":1,"s":2,"i":2,"r":2,"y":1,"n":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"መተርጎም የሁሉም ተርጓሚ":{"s":{"ሉ","ሁ","ም","ሚ","የ","መ","ጎ","ተ","ር","ጓ"},"l":4.358898943540674,"c":{"መ":1,"ተ":2,"ር":2,"ጎ":1,"ም":2,"የ":1,"ሁ":1,"ሉ":1,"ጓ":1,"ሚ":1},"t":"TranslateComTranslate"},"ترجمو. com.com ترجمو ڪندڙ APITRANSLENCOM":{"s":{"l","م","a","د","ڙ","r","m","o","ن","ج","i","n","و","t","ر","s","c","e",".","ت","p","ڪ"},"l":8.366600265340756,"c":{"ت":2,"ر":2,"ج":2,"م":2,"و":2,".":2,"c":3,"o":3,"m":3,"ڪ":1,"ن":1,"د":1,"ڙ":1,"a":2,"p":1,"i":1,"t":1,"r":1,"n":2,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"translate.com translator":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":7.810249675906654,"c":{"t":4,"r":3,"a":4,"n":2,"s":2,"l":2,"e":1,".":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"translate.com翻訳":{"s":{".","n","訳","t","l","c","r","s","m","翻","a","o","e"},"l":4.358898943540674,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"翻":1,"訳":1},"t":"TranslateComTranslate"},"翻译翻译":{"s":{"译","翻"},"l":2.8284271247461903,"c":{"翻":2,"译":2},"t":"TranslateComTranslate"},"Translate.com Übersetzer Apitranslatecom":{"s":{".","n","b","ü","t","l","p","c","r","s","m","z","a","o","e","i"},"l":11.224972160321824,"c":{"t":5,"r":4,"a":5,"n":2,"s":3,"l":2,"e":5,".":1,"c":2,"o":2,"m":2,"ü":1,"b":1,"z":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Fetolela.com Mofetoleli":{"s":{".","f","t","l","c","m","a","o","e","i"},"l":8.0,"c":{"f":2,"e":4,"t":2,"o":4,"l":4,"a":1,".":1,"c":1,"m":2,"i":1},"t":"TranslateComTranslate"},"API translatoru TranslateCom":{"s":{"n","o","t","l","u","c","r","s","m","a","p","e","i"},"l":8.48528137423857,"c":{"a":5,"p":1,"i":1,"t":4,"r":3,"n":2,"s":2,"l":2,"o":2,"u":1,"e":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Translatecom tulkotājs":{"s":{"n","j","t","l","u","c","r","s","m","k","a","o","e","ā"},"l":6.4031242374328485,"c":{"t":4,"r":1,"a":2,"n":1,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1,"u":1,"k":1,"ā":1,"j":1},"t":"TranslateComTranslate"},"Te whakamaoritanga a te kaiwhakawhitiwhiti":{"s":{"g","n","h","w","t","r","m","k","a","o","e","i"},"l":13.856406460551018,"c":{"t":5,"e":2,"w":4,"h":4,"a":9,"k":3,"m":1,"o":1,"r":1,"i":6,"n":1,"g":1},"t":"TranslateComTranslate"},"Translate.com itzultzailea":{"s":{".","n","t","l","u","c","r","s","m","z","a","o","e","i"},"l":7.810249675906654,"c":{"t":4,"r":1,"a":4,"n":1,"s":1,"l":3,"e":2,".":1,"c":1,"o":1,"m":1,"i":2,"z":2,"u":1},"t":"TranslateComTranslate"},"Translate.com Tafsiri Apitranslatecom":{"s":{".","n","f","t","l","p","c","r","s","m","a","o","e","i"},"l":10.723805294763608,"c":{"t":5,"r":3,"a":6,"n":2,"s":3,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"f":1,"i":3,"p":1},"t":"TranslateComTranslate"},"Translate.com þýðandi":{"s":{".","þ","n","ð","d","t","l","ý","c","r","s","m","a","o","e","i"},"l":5.477225575051661,"c":{"t":2,"r":1,"a":3,"n":2,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"þ":1,"ý":1,"ð":1,"d":1,"i":1},"t":"TranslateComTranslate"},"Translate.com Translator apitranslatecom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.328828005937952,"c":{"t":6,"r":4,"a":7,"n":3,"s":3,"l":3,"e":2,".":1,"c":2,"o":3,"m":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Turjum.com":{"s":{".","j","t","u","r","m","c","o"},"l":3.7416573867739413,"c":{"t":1,"u":2,"r":1,"j":1,"m":2,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Traduir.com Translate":{"s":{".","n","d","t","l","u","c","r","s","m","a","o","e","i"},"l":6.164414002968976,"c":{"t":3,"r":3,"a":3,"d":1,"u":1,"i":1,".":1,"c":1,"o":1,"m":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"Орчуулагч орчуулагч":{"s":{"л","ч","а","г","р","о","у"},"l":7.211102550927978,"c":{"о":2,"р":2,"ч":4,"у":4,"л":2,"а":2,"г":2},"t":"TranslateComTranslate"},"Tu transltatecom":{"s":{"n","t","l","u","c","r","s","m","a","o","e"},"l":5.385164807134504,"c":{"t":4,"u":1,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Traduci Traducru":{"s":{"d","t","u","c","r","a","i"},"l":5.916079783099616,"c":{"t":2,"r":3,"a":2,"d":2,"u":3,"c":2,"i":1},"t":"TranslateComTranslate"},"Translate.com ဘာသာပြန်သူ apitranslatecom":{"s":{"l","ဘ","ြ","a","ပ","ူ","r","m","န","o","i","်","n","t","ာ","s","သ","c","e",".","p"},"l":9.486832980505138,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"ဘ":1,"ာ":2,"သ":2,"ပ":1,"ြ":1,"န":1,"်":1,"ူ":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Traducteur tradlate.com":{"s":{".","d","t","l","u","c","r","m","a","o","e"},"l":7.3484692283495345,"c":{"t":4,"r":3,"a":3,"d":2,"u":2,"c":2,"e":2,"l":1,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ترجمه ترجمه":{"s":{"م","ر","ت","ه","ج"},"l":4.47213595499958,"c":{"ت":2,"ر":2,"ج":2,"م":2,"ه":2},"t":"TranslateComTranslate"},"Oversæt.com oversætter Apitranslatecom":{"s":{"a",".","n","t","l","v","p","r","æ","s","m","c","o","e","i"},"l":10.583005244258363,"c":{"o":4,"v":2,"e":4,"r":4,"s":3,"æ":2,"t":5,".":1,"c":2,"m":2,"a":3,"p":1,"i":1,"n":1,"l":1},"t":"TranslateComTranslate"},"ترجمو ترجمو ڪندڙ":{"s":{"و","ڙ","م","ر","ت","ن","ج","ڪ","د"},"l":4.898979485566356,"c":{"ت":2,"ر":2,"ج":2,"م":2,"و":2,"ڪ":1,"ن":1,"د":1,"ڙ":1},"t":"TranslateComTranslate"},"અનુવાદ.કોમ અનુવાદક":{"s":{"ા","ન",".","ુ","ક","મ","અ","ો","દ","વ"},"l":5.5677643628300215,"c":{"અ":2,"ન":2,"ુ":2,"વ":2,"ા":2,"દ":2,".":1,"ક":2,"ો":1,"મ":1},"t":"TranslateComTranslate"},"ترجمو. com ترجمو":{"s":{".","و","o","م","ر","ت","m","c","ج"},"l":4.898979485566356,"c":{"ت":2,"ر":2,"ج":2,"م":2,"و":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Fetolela Mofetoleli oa phetolelo":{"s":{"h","f","t","l","p","m","a","o","e","i"},"l":11.357816691600547,"c":{"f":2,"e":6,"t":3,"o":6,"l":6,"a":2,"m":1,"i":1,"p":1,"h":1},"t":"TranslateComTranslate"},"د برتچيک ژباړونکي":{"s":{"ب","و","ک","ي","ړ","ا","د","ر","ت","ژ","ن","چ"},"l":4.58257569495584,"c":{"د":1,"ب":2,"ر":1,"ت":1,"چ":1,"ي":2,"ک":2,"ژ":1,"ا":1,"ړ":1,"و":1,"ن":1},"t":"TranslateComTranslate"},"Guqula ukuguqulela":{"s":{"g","l","q","u","k","a","e"},"l":7.681145747868608,"c":{"g":2,"u":6,"q":2,"l":3,"a":2,"k":1,"e":1},"t":"TranslateComTranslate"},"TərcüməCom Tərcüməçi API":{"s":{"a","ü","t","p","r","ə","m","ç","c","o","i"},"l":7.3484692283495345,"c":{"t":2,"ə":4,"r":2,"c":3,"ü":2,"m":3,"o":1,"ç":1,"i":2,"a":1,"p":1},"t":"TranslateComTranslate"},"TransLateCom Translator API":{"s":{"n","t","l","p","c","r","s","m","a","o","e","i"},"l":8.426149773176359,"c":{"t":4,"r":3,"a":5,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"ಅನುವಾದಕ":{"s":{"ವ","ಕ","ಅ","ನ","ಾ","ದ","ು"},"l":2.6457513110645907,"c":{"ಅ":1,"ನ":1,"ು":1,"ವ":1,"ಾ":1,"ದ":1,"ಕ":1},"t":"TranslateComTranslate"},"Übersetzer von transatecom":{"s":{"n","b","ü","t","v","c","r","s","z","m","a","o","e"},"l":7.483314773547883,"c":{"ü":1,"b":1,"e":4,"r":3,"s":2,"t":3,"z":1,"v":1,"o":2,"n":2,"a":2,"c":1,"m":1},"t":"TranslateComTranslate"},"Преводилац Транслате.цом":{"s":{"л","н",".","м","и","в","с","а","д","р","о","п","ц","е","т"},"l":6.4031242374328485,"c":{"п":1,"р":2,"е":2,"в":1,"о":2,"д":1,"и":1,"л":2,"а":3,"ц":2,"т":2,"н":1,"с":1,".":1,"м":1},"t":"TranslateComTranslate"},"Traductor traductor":{"s":{"d","t","u","c","r","a","o"},"l":7.211102550927978,"c":{"t":4,"r":4,"a":2,"d":2,"u":2,"c":2,"o":2},"t":"TranslateComTranslate"},"Translate.com Tradukisto Apitranslatecom":{"s":{".","n","d","t","l","p","u","c","r","s","m","k","a","o","e","i"},"l":11.313708498984761,"c":{"t":6,"r":3,"a":6,"n":2,"s":3,"l":2,"e":2,".":1,"c":2,"o":3,"m":2,"d":1,"u":1,"k":1,"i":2,"p":1},"t":"TranslateComTranslate"},"Traduci a traduce u scrittatore di traduttore apitranslatecom":{"s":{"n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":17.60681686165901,"c":{"t":10,"r":7,"a":8,"d":4,"u":4,"c":4,"i":4,"e":4,"s":2,"o":3,"p":1,"n":1,"l":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Tagasalin ng ApitranslateCom":{"s":{"g",".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.36931687685298,"c":{"t":5,"r":2,"a":8,"n":4,"s":3,"l":3,"e":2,".":1,"c":2,"o":2,"m":2,"g":2,"i":2,"p":1},"t":"TranslateComTranslate"},"TranslateCom Terjemahan":{"s":{"n","h","j","t","l","c","r","s","m","a","o","e"},"l":7.211102550927978,"c":{"t":3,"r":2,"a":4,"n":2,"s":1,"l":1,"e":3,"c":1,"o":1,"m":2,"j":1,"h":1},"t":"TranslateComTranslate"},"ଅନୁବାଦକ commantory":{"s":{"a","ୁ","ା","n","ଦ","ବ","ନ","t","ଅ","r","y","m","କ","c","o"},"l":4.58257569495584,"c":{"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"କ":1,"c":1,"o":2,"m":2,"a":1,"n":1,"t":1,"r":1,"y":1},"t":"TranslateComTranslate"},"TranslateCom перевод":{"s":{"е","n","п","в","t","l","c","r","д","s","m","р","о","a","o","e"},"l":5.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"п":1,"е":2,"р":1,"в":1,"о":1,"д":1},"t":"TranslateComTranslate"},"Transclate mushanduri":{"s":{"n","h","d","t","l","u","c","r","s","m","a","e","i"},"l":6.0,"c":{"t":2,"r":2,"a":3,"n":2,"s":2,"c":1,"l":1,"e":1,"m":1,"u":2,"h":1,"d":1,"i":1},"t":"TranslateComTranslate"},"ແປພາສາແປ":{"s":{"ພ","ປ","ສ","າ","ແ"},"l":3.7416573867739413,"c":{"ແ":2,"ປ":2,"ພ":1,"າ":2,"ສ":1},"t":"TranslateComTranslate"},"Tarjima.com Tarjimon":{"s":{".","n","j","t","c","r","m","a","o","i"},"l":6.4031242374328485,"c":{"t":2,"a":3,"r":2,"j":2,"i":2,"m":3,".":1,"c":1,"o":2,"n":1},"t":"TranslateComTranslate"},"Translate.com Translate":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":7.483314773547883,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Traduce.com Translate":{"s":{".","n","d","t","l","u","c","r","s","m","a","o","e"},"l":6.164414002968976,"c":{"t":3,"r":2,"a":3,"d":1,"u":1,"c":2,"e":2,".":1,"o":1,"m":1,"n":1,"s":1,"l":1},"t":"TranslateComTranslate"},"API traduttore traduttore":{"s":{"o","d","t","u","r","a","p","e","i"},"l":8.888194417315589,"c":{"a":3,"p":1,"i":1,"t":6,"r":4,"d":2,"u":2,"o":2,"e":2},"t":"TranslateComTranslate"},"ट्रान्सलेटेकॉम ट्रान्सलेटर एपीआय":{"s":{"े","ी","ए","प","ॉ","न","्","ा","ट","र","स","ल","क","म","आ","य"},"l":8.602325267042627,"c":{"ट":4,"्":4,"र":3,"ा":2,"न":2,"स":2,"ल":2,"े":3,"क":1,"ॉ":1,"म":1,"ए":1,"प":1,"ी":1,"आ":1,"य":1},"t":"TranslateComTranslate"},"Translate.com ဘာသာပြန်ထည့်ပါ":{"s":{"l","ဘ","ြ","a","ပ","ည","r","m","န","o","့","်","n","t","ာ","s","သ","c","e",".","ထ","ါ"},"l":6.082762530298219,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"ဘ":1,"ာ":2,"သ":1,"ပ":2,"ြ":1,"န":1,"်":2,"ထ":1,"ည":1,"့":1,"ါ":1},"t":"TranslateComTranslate"},"API do tradutor de tradución":{"s":{"ó","n","d","t","p","u","c","r","a","o","e","i"},"l":7.745966692414834,"c":{"a":3,"p":1,"i":2,"d":4,"o":2,"t":3,"r":3,"u":2,"e":1,"c":1,"ó":1,"n":1},"t":"TranslateComTranslate"},"Translate.com Tarjimpor qo'shanslatecom":{"s":{".","n","h","j","t","l","p","'","q","c","r","s","m","a","o","e","i"},"l":10.344080432788601,"c":{"t":4,"r":3,"a":5,"n":2,"s":3,"l":2,"e":2,".":1,"c":2,"o":4,"m":3,"j":1,"i":1,"p":1,"q":1,"'":1,"h":1},"t":"TranslateComTranslate"},"Fandikan-teny manefa mpandika api":{"s":{"n","f","d","t","-","y","m","k","a","p","e","i"},"l":10.488088481701515,"c":{"f":2,"a":7,"n":5,"d":2,"i":3,"k":2,"-":1,"t":1,"e":2,"y":1,"m":2,"p":2},"t":"TranslateComTranslate"},"Prekladateľ Translatecom":{"s":{"n","o","d","ľ","l","t","c","r","s","m","k","a","p","e"},"l":7.14142842854285,"c":{"p":1,"r":2,"e":3,"k":1,"l":2,"a":4,"d":1,"t":3,"ľ":1,"n":1,"s":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ਅਨੁਵਾਦ.":{"s":{".","ਾ","ਵ","ੁ","ਅ","ਨ","ਦ"},"l":2.6457513110645907,"c":{"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,".":1},"t":"TranslateComTranslate"},"Traducir.com ApitranslateCom":{"s":{".","n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":7.937253933193772,"c":{"t":3,"r":3,"a":4,"d":1,"u":1,"c":3,"i":2,".":1,"o":2,"m":2,"p":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"Tłumaczenie.com Tłumacz":{"s":{".","n","t","ł","u","c","z","m","a","o","e","i"},"l":6.782329983125268,"c":{"t":2,"ł":2,"u":2,"m":3,"a":2,"c":3,"z":2,"e":2,"n":1,"i":1,".":1,"o":1},"t":"TranslateComTranslate"},"Fassara.com":{"s":{".","f","c","r","s","m","a","o"},"l":4.358898943540674,"c":{"f":1,"a":3,"s":2,"r":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Орчуулах.com орчуулах":{"s":{"л","ч",".","а","m","р","о","у","c","o","х"},"l":6.6332495807108,"c":{"о":2,"р":2,"ч":2,"у":4,"л":2,"а":2,"х":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com Oetten oer oersetter":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":11.532562594670797,"c":{"t":6,"r":4,"a":2,"n":2,"s":2,"l":1,"e":7,".":1,"c":1,"o":4,"m":1},"t":"TranslateComTranslate"},"ಅನುವಾದ ಅನುವಾದ":{"s":{"ವ","ಅ","ನ","ಾ","ದ","ು"},"l":4.898979485566356,"c":{"ಅ":2,"ನ":2,"ು":2,"ವ":2,"ಾ":2,"ದ":2},"t":"TranslateComTranslate"},"Translate.com tagasalin":{"s":{"g",".","n","t","l","c","r","s","m","a","o","e","i"},"l":7.3484692283495345,"c":{"t":3,"r":1,"a":5,"n":2,"s":2,"l":2,"e":1,".":1,"c":1,"o":1,"m":1,"g":1,"i":1},"t":"TranslateComTranslate"},"Traducteur translatecom":{"s":{"n","d","t","l","u","c","r","s","m","a","o","e"},"l":7.211102550927978,"c":{"t":4,"r":3,"a":3,"d":1,"u":2,"c":2,"e":2,"n":1,"s":1,"l":1,"o":1,"m":1},"t":"TranslateComTranslate"},"API של TranslateCom API":{"s":{"ש","n","o","t","l","c","r","ל","s","m","a","p","e","i"},"l":6.164414002968976,"c":{"a":4,"p":2,"i":2,"ש":1,"ל":1,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"טראַנסלעקאָסאָם טראַנסלאַטאָר אַפּי":{"s":{"נ","י","ָ","ע","פ","ק","ס","ט","ּ","ל","ם","ַ","א","ר"},"l":10.723805294763608,"c":{"ט":3,"ר":3,"א":7,"ַ":4,"נ":2,"ס":3,"ל":2,"ע":1,"ק":1,"ָ":3,"ם":1,"פ":1,"ּ":1,"י":1},"t":"TranslateComTranslate"},"Translate.com Tafsiri":{"s":{".","n","f","t","l","c","r","s","m","a","o","e","i"},"l":6.164414002968976,"c":{"t":3,"r":2,"a":3,"n":1,"s":2,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"f":1,"i":2},"t":"TranslateComTranslate"},"Translate.com -kääntäjä":{"s":{".","n","j","t","l","c","r","-","s","m","ä","k","a","o","e"},"l":6.6332495807108,"c":{"t":3,"r":1,"a":2,"n":2,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"-":1,"k":1,"ä":4,"j":1},"t":"TranslateComTranslate"},"Translate.com Traduttur ApiTranslateCom":{"s":{".","n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":11.704699910719626,"c":{"t":7,"r":4,"a":6,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"d":1,"u":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Tarjumida turjubaanka Apitranslatecom":{"s":{"n","b","o","j","d","t","l","u","c","r","s","m","k","a","p","e","i"},"l":11.090536506409418,"c":{"t":4,"a":8,"r":3,"j":2,"u":3,"m":2,"i":2,"d":1,"b":1,"n":2,"k":1,"p":1,"s":1,"l":1,"e":1,"c":1,"o":1},"t":"TranslateComTranslate"},"TransclateCom Mushanduri API":{"s":{"n","h","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":7.3484692283495345,"c":{"t":2,"r":2,"a":4,"n":2,"s":2,"c":2,"l":1,"e":1,"o":1,"m":2,"u":2,"h":1,"d":1,"i":2,"p":1},"t":"TranslateComTranslate"},"TransLateCom Translate":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"API Penerjemah TranslateCom":{"s":{"n","h","o","j","t","l","c","r","s","m","a","p","e","i"},"l":7.681145747868608,"c":{"a":4,"p":2,"i":1,"e":4,"n":2,"r":2,"j":1,"m":2,"h":1,"t":2,"s":1,"l":1,"c":1,"o":1},"t":"TranslateComTranslate"},"भाषांतर.कॉम भाषांतर":{"s":{"भ",".","ॉ","त","ा","र","ं","क","म","ष"},"l":6.324555320336759,"c":{"भ":2,"ा":4,"ष":2,"ं":2,"त":2,"र":2,".":1,"क":1,"ॉ":1,"म":1},"t":"TranslateComTranslate"},"Translatecom itzultzailea":{"s":{"n","t","l","u","c","r","s","m","z","a","o","e","i"},"l":7.745966692414834,"c":{"t":4,"r":1,"a":4,"n":1,"s":1,"l":3,"e":2,"c":1,"o":1,"m":1,"i":2,"z":2,"u":1},"t":"TranslateComTranslate"},"អ្នកបកប្រែភាសាកាឡារ៉ុន":{"s":{"ប","រ","៉","្","ែ","ភ","ក","ឡ","ា","អ","ស","ុ","ន"},"l":6.928203230275509,"c":{"អ":1,"្":2,"ន":2,"ក":3,"ប":2,"រ":2,"ែ":1,"ភ":1,"ា":4,"ស":1,"ឡ":1,"៉":1,"ុ":1},"t":"TranslateComTranslate"},"تەرجىمە قىلىش.com تەرجىمانى":{"s":{".","o","ق","ل","ى","ا","ە","ر","ت","م","m","ش","c","ج","ن"},"l":7.681145747868608,"c":{"ت":2,"ە":3,"ر":2,"ج":2,"ى":5,"م":2,"ق":1,"ل":1,"ش":1,".":1,"c":1,"o":1,"m":1,"ا":1,"ن":1},"t":"TranslateComTranslate"},"ተርጉም.com":{"s":{".","ም","o","ተ","m","ጉ","c","ር"},"l":2.8284271247461903,"c":{"ተ":1,"ር":1,"ጉ":1,"ም":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translatecom vertaler API":{"s":{"n","t","l","v","p","c","r","s","m","a","o","e","i"},"l":7.416198487095663,"c":{"t":3,"r":3,"a":4,"n":1,"s":1,"l":2,"e":3,"c":1,"o":1,"m":1,"v":1,"p":1,"i":1},"t":"TranslateComTranslate"},"translate.com翻译":{"s":{".","n","t","l","译","c","r","s","m","翻","a","o","e"},"l":4.358898943540674,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"翻":1,"译":1},"t":"TranslateComTranslate"},"Орчуулах.com орчуулагч Apitranslatlecom":{"s":{"l","г","a","а","r","m","o","i","л","n","t","s","о","c","e","х",".","ч","р","у","p"},"l":8.888194417315589,"c":{"о":2,"р":2,"ч":3,"у":4,"л":2,"а":2,"х":1,".":1,"c":2,"o":2,"m":2,"г":1,"a":3,"p":1,"i":1,"t":2,"r":1,"n":1,"s":1,"l":2,"e":1},"t":"TranslateComTranslate"},"ትልሞሎጂክ ተርጓሚ ኤፒአይ":{"s":{"ሞ","ክ","ል","ይ","ሚ","አ","ር","ተ","ጂ","ኤ","ፒ","ጓ","ት","ሎ"},"l":3.7416573867739413,"c":{"ት":1,"ል":1,"ሞ":1,"ሎ":1,"ጂ":1,"ክ":1,"ተ":1,"ር":1,"ጓ":1,"ሚ":1,"ኤ":1,"ፒ":1,"አ":1,"ይ":1},"t":"TranslateComTranslate"},"TranslateCom თარჯიმანი API":{"s":{"l","მ","a","ჯ","რ","r","m","o","ი","i","თ","n","t","ა","ნ","s","c","e","p"},"l":6.0,"c":{"t":2,"r":1,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"თ":1,"ა":2,"რ":1,"ჯ":1,"ი":2,"მ":1,"ნ":1,"p":1,"i":1},"t":"TranslateComTranslate"},"API Translatecom API":{"s":{"n","o","t","l","c","r","s","m","a","p","e","i"},"l":6.0,"c":{"a":4,"p":2,"i":2,"t":2,"r":1,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Renel.let ଅନୁବାଦ |":{"s":{"ୁ",".","ା","n","|","ଦ","ବ","ନ","l","t","ଅ","r","e"},"l":4.898979485566356,"c":{"r":1,"e":3,"n":1,"l":2,".":1,"t":1,"ଅ":1,"ନ":1,"ୁ":1,"ବ":1,"ା":1,"ଦ":1,"|":1},"t":"TranslateComTranslate"},"Fassara.com fassara":{"s":{".","f","c","r","s","m","a","o"},"l":8.0,"c":{"f":2,"a":6,"s":4,"r":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Тарҷумаи Transection.com":{"s":{".","n","м","i","и","t","а","c","r","s","m","р","ҷ","у","a","o","e","т"},"l":5.744562646538029,"c":{"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"и":1,"t":2,"r":1,"a":1,"n":2,"s":1,"e":1,"c":2,"i":1,"o":2,".":1,"m":1},"t":"TranslateComTranslate"},"Translatecom tradwi":{"s":{"n","d","w","t","l","c","r","s","m","a","o","e","i"},"l":5.656854249492381,"c":{"t":3,"r":2,"a":3,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"d":1,"w":1,"i":1},"t":"TranslateComTranslate"},"API Translatecom Translator API":{"s":{"n","o","t","l","c","r","s","m","a","p","e","i"},"l":9.38083151964686,"c":{"a":6,"p":2,"i":2,"t":4,"r":3,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"clashatecom បកប្រែ":{"s":{"ប","រ","h","្","ែ","ក","l","t","c","s","m","a","o","e"},"l":4.795831523312719,"c":{"c":2,"l":1,"a":2,"s":1,"h":1,"t":1,"e":1,"o":1,"m":1,"ប":2,"ក":1,"្":1,"រ":1,"ែ":1},"t":"TranslateComTranslate"},"Whakamahinga Whakamarama":{"s":{"g","n","h","w","r","m","k","a","i"},"l":10.535653752852738,"c":{"w":2,"h":3,"a":9,"k":2,"m":3,"i":1,"n":1,"g":1,"r":1},"t":"TranslateComTranslate"},"ਅਨੁਵਾਦ":{"s":{"ਾ","ਵ","ੁ","ਅ","ਨ","ਦ"},"l":2.449489742783178,"c":{"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1},"t":"TranslateComTranslate"},"Tagasalin ng TransLateCom":{"s":{"g","n","t","l","c","r","s","m","a","o","e","i"},"l":7.810249675906654,"c":{"t":3,"a":5,"g":2,"s":2,"l":2,"i":1,"n":3,"r":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Traducir.com Traducir":{"s":{".","d","t","u","c","r","m","a","o","i"},"l":6.928203230275509,"c":{"t":2,"r":4,"a":2,"d":2,"u":2,"c":3,"i":2,".":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Dịch dịch dịch":{"s":{"ị","c","h","d"},"l":6.0,"c":{"d":3,"ị":3,"c":3,"h":3},"t":"TranslateComTranslate"},"TRETIKTI.com VERTRATE":{"s":{"a",".","t","v","r","m","k","c","o","e","i"},"l":7.3484692283495345,"c":{"t":5,"r":3,"e":3,"i":2,"k":1,".":1,"c":1,"o":1,"m":1,"v":1,"a":1},"t":"TranslateComTranslate"},"Tumọ.com Tumọ":{"s":{".","t","u","ọ","m","c","o"},"l":4.898979485566356,"c":{"t":2,"u":2,"m":3,"ọ":2,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Traductor.com traductor apitranslateCom":{"s":{".","n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":11.704699910719626,"c":{"t":6,"r":5,"a":5,"d":2,"u":2,"c":4,"o":4,".":1,"m":2,"p":1,"i":1,"n":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"Transubecom Tandialera":{"s":{"n","b","d","t","l","u","c","r","s","m","a","o","e","i"},"l":6.4031242374328485,"c":{"t":2,"r":2,"a":4,"n":2,"s":1,"u":1,"b":1,"e":2,"c":1,"o":1,"m":1,"d":1,"i":1,"l":1},"t":"TranslateComTranslate"},"Tarjumidda turjubaanka":{"s":{"n","b","j","d","t","u","r","m","k","a","i"},"l":7.416198487095663,"c":{"t":2,"a":5,"r":2,"j":2,"u":3,"m":1,"i":1,"d":2,"b":1,"n":1,"k":1},"t":"TranslateComTranslate"},"זעץ ענוועקטערז אָוווערטראַנסלאַטעקאָם":{"s":{"נ","ָ","ע","ז","ק","ס","ט","ל","ם","ץ","ַ","א","ר","ו"},"l":10.908712114635714,"c":{"ז":2,"ע":6,"ץ":1,"נ":2,"ו":5,"ק":2,"ט":3,"ר":3,"א":4,"ָ":2,"ַ":2,"ס":1,"ל":1,"ם":1},"t":"TranslateComTranslate"},"Translate.com аудармашы Apitranslatecom":{"s":{"l","д","м","a","ш","а","r","m","o","i","n","у","t","s","c","e",".","р","ы","p"},"l":9.539392014169456,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"а":3,"у":1,"д":1,"р":1,"м":1,"ш":1,"ы":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translatecom çevirmen API":{"s":{"n","t","l","v","p","c","r","s","m","ç","a","o","e","i"},"l":6.708203932499369,"c":{"t":2,"r":2,"a":3,"n":2,"s":1,"l":1,"e":3,"c":1,"o":1,"m":2,"ç":1,"v":1,"i":2,"p":1},"t":"TranslateComTranslate"},"Translate.com Prevodite":{"s":{".","n","d","t","l","p","v","c","r","s","m","a","o","e","i"},"l":6.324555320336759,"c":{"t":3,"r":2,"a":2,"n":1,"s":1,"l":1,"e":3,".":1,"c":1,"o":2,"m":1,"p":1,"v":1,"d":1,"i":1},"t":"TranslateComTranslate"},"Prevajalec.com prevajalec ApitranslateCom":{"s":{".","n","o","j","l","t","v","c","r","s","m","a","p","e","i"},"l":11.874342087037917,"c":{"p":3,"r":3,"e":5,"v":2,"a":7,"j":2,"l":3,"c":4,".":1,"o":2,"m":2,"i":1,"t":2,"n":1,"s":1},"t":"TranslateComTranslate"},"翻译网":{"s":{"网","译","翻"},"l":1.7320508075688772,"c":{"翻":1,"译":1,"网":1},"t":"TranslateComTranslate"},"Translate.com Penterjemah":{"s":{".","n","h","j","t","l","p","c","r","s","m","a","o","e"},"l":7.3484692283495345,"c":{"t":3,"r":2,"a":3,"n":2,"s":1,"l":1,"e":4,".":1,"c":1,"o":1,"m":2,"p":1,"j":1,"h":1},"t":"TranslateComTranslate"},"Guqula.com Umguquleli":{"s":{"g",".","l","q","u","c","m","a","o","e","i"},"l":7.211102550927978,"c":{"g":2,"u":5,"q":2,"l":3,"a":1,".":1,"c":1,"o":1,"m":2,"e":1,"i":1},"t":"TranslateComTranslate"},"Translate.com mtafsiri":{"s":{".","n","f","t","l","c","r","s","m","a","o","e","i"},"l":6.4031242374328485,"c":{"t":3,"r":2,"a":3,"n":1,"s":2,"l":1,"e":1,".":1,"c":1,"o":1,"m":2,"f":1,"i":2},"t":"TranslateComTranslate"},"Translate.com çevirmen apitranslatecom":{"s":{".","n","t","l","v","p","c","r","s","m","ç","a","o","e","i"},"l":10.392304845413264,"c":{"t":4,"r":3,"a":5,"n":3,"s":2,"l":2,"e":4,".":1,"c":2,"o":2,"m":3,"ç":1,"v":1,"i":2,"p":1},"t":"TranslateComTranslate"},"TranslateCom translator":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.745966692414834,"c":{"t":4,"r":3,"a":4,"n":2,"s":2,"l":2,"e":1,"c":1,"o":2,"m":1},"t":"TranslateComTranslate"},"Tərcüməçi Tərcüməçi":{"s":{"ü","t","r","ə","m","ç","c","i"},"l":6.6332495807108,"c":{"t":2,"ə":4,"r":2,"c":2,"ü":2,"m":2,"ç":2,"i":2},"t":"TranslateComTranslate"},"„Translatecom“ vertėjo API":{"s":{"„","n","j","“","t","l","v","p","c","r","s","m","a","o","e","i","ė"},"l":6.48074069840786,"c":{"„":1,"t":3,"r":2,"a":3,"n":1,"s":1,"l":1,"e":2,"c":1,"o":2,"m":1,"“":1,"v":1,"ė":1,"j":1,"p":1,"i":1},"t":"TranslateComTranslate"},"ትርጉም ትርጉም":{"s":{"ጉ","ት","ም","ር"},"l":4.0,"c":{"ት":2,"ር":2,"ጉ":2,"ም":2},"t":"TranslateComTranslate"},"TREČIŪLIS.com vertėjas „ApitransLatecom“":{"s":{"“","l","v","a","ė","j","r","m","o","i","ū","n","t","s","c","e","„","č",".","p"},"l":9.695359714832659,"c":{"t":4,"r":3,"e":3,"č":1,"i":3,"ū":1,"l":2,"s":3,".":1,"c":2,"o":2,"m":2,"v":1,"ė":1,"j":1,"a":4,"„":1,"p":1,"n":1,"“":1},"t":"TranslateComTranslate"},"Translate.com Eadar-theangaiche":{"s":{"g",".","n","h","d","t","l","c","r","-","s","m","a","o","e","i"},"l":9.273618495495704,"c":{"t":3,"r":2,"a":6,"n":2,"s":1,"l":1,"e":4,".":1,"c":2,"o":1,"m":1,"d":1,"-":1,"h":2,"g":1,"i":1},"t":"TranslateComTranslate"},"Translatecom -vertaler":{"s":{"n","t","l","v","c","r","-","s","m","a","o","e"},"l":6.855654600401044,"c":{"t":3,"r":3,"a":3,"n":1,"s":1,"l":2,"e":3,"c":1,"o":1,"m":1,"-":1,"v":1},"t":"TranslateComTranslate"},"Onitumọ transtorece API":{"s":{"n","t","p","u","c","r","ọ","m","s","a","o","e","i"},"l":6.244997998398398,"c":{"o":2,"n":2,"i":2,"t":3,"u":1,"m":1,"ọ":1,"r":2,"a":2,"s":1,"e":2,"c":1,"p":1},"t":"TranslateComTranslate"},"Translate.com Bungkus":{"s":{"g",".","n","b","t","l","u","c","r","s","m","k","a","o","e"},"l":5.477225575051661,"c":{"t":2,"r":1,"a":2,"n":2,"s":2,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"b":1,"u":2,"g":1,"k":1},"t":"TranslateComTranslate"},"Translate.com പരിഭാഷകൻ":{"s":{"l","a","ൻ","ി","r","m","o","ഭ","n","t","ാ","s","c","e",".","ക","ഷ","പ","ര"},"l":5.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"പ":1,"ര":1,"ി":1,"ഭ":1,"ാ":1,"ഷ":1,"ക":1,"ൻ":1},"t":"TranslateComTranslate"},"TranslatEcom Translate":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ژباړن":{"s":{"ب","ړ","ا","ژ","ن"},"l":2.23606797749979,"c":{"ژ":1,"ب":1,"ا":1,"ړ":1,"ن":1},"t":"TranslateComTranslate"},"Translatecom eadar-theangachadh":{"s":{"g","n","h","d","t","l","c","r","-","s","m","a","o","e"},"l":9.899494936611665,"c":{"t":3,"r":2,"a":7,"n":2,"s":1,"l":1,"e":3,"c":2,"o":1,"m":1,"d":2,"-":1,"h":3,"g":1},"t":"TranslateComTranslate"},"Translate.com vertaler apitranslatecom":{"s":{".","n","t","l","v","p","c","r","s","m","a","o","e","i"},"l":11.224972160321824,"c":{"t":5,"r":4,"a":6,"n":2,"s":2,"l":3,"e":4,".":1,"c":2,"o":2,"m":2,"v":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com Traduttore ApitransLatecom":{"s":{".","n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":12.0,"c":{"t":7,"r":4,"a":6,"n":2,"s":2,"l":2,"e":3,".":1,"c":2,"o":3,"m":2,"d":1,"u":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translate.com перекладач Apitranslatecom":{"s":{"l","д","п","a","а","r","m","o","i","к","л","n","t","s","c","e",".","ч","р","p","е"},"l":9.486832980505138,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"п":1,"е":2,"р":1,"к":1,"л":1,"а":2,"д":1,"ч":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Translatecom prenator":{"s":{"n","t","l","p","c","r","s","m","a","o","e"},"l":6.6332495807108,"c":{"t":3,"r":3,"a":3,"n":2,"s":1,"l":1,"e":2,"c":1,"o":2,"m":1,"p":1},"t":"TranslateComTranslate"},"API на преведувач преведувач":{"s":{"н","ч","п","в","а","д","р","у","a","p","е","i"},"l":8.06225774829855,"c":{"a":1,"p":1,"i":1,"н":1,"а":3,"п":2,"р":2,"е":4,"в":4,"д":2,"у":2,"ч":2},"t":"TranslateComTranslate"},"Translatecom prevajanje":{"s":{"n","j","t","l","p","v","c","r","s","m","a","o","e"},"l":6.928203230275509,"c":{"t":2,"r":2,"a":4,"n":2,"s":1,"l":1,"e":3,"c":1,"o":1,"m":1,"p":1,"v":1,"j":2},"t":"TranslateComTranslate"},"Skytrax Award":{"s":{"d","w","t","r","y","s","k","a","x"},"l":4.47213595499958,"c":{"s":1,"k":1,"y":1,"t":1,"r":2,"a":3,"x":1,"w":1,"d":1},"t":"TranslateComTranslate"},"Тарҷумаи Transe.com apitranslatecom":{"s":{"l","м","a","т","и","а","r","m","ҷ","o","i","n","t","s","c","e",".","р","у","p"},"l":8.18535277187245,"c":{"т":1,"а":2,"р":1,"ҷ":1,"у":1,"м":1,"и":1,"t":3,"r":2,"a":4,"n":2,"s":2,"e":2,".":1,"c":2,"o":2,"m":2,"p":1,"i":1,"l":1},"t":"TranslateComTranslate"},"Tumọ.com":{"s":{".","t","u","ọ","m","c","o"},"l":3.1622776601683795,"c":{"t":1,"u":1,"m":2,"ọ":1,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Transcolate.com womasulira apitranslatomomomocomo":{"s":{".","n","w","t","l","p","u","c","r","s","m","a","o","e","i"},"l":15.198684153570664,"c":{"t":4,"r":3,"a":7,"n":2,"s":3,"c":3,"o":9,"l":3,"e":1,".":1,"m":6,"w":1,"u":1,"i":2,"p":1},"t":"TranslateComTranslate"},"Tutumo Apetranslatecom":{"s":{"n","t","l","p","u","c","r","s","m","a","o","e"},"l":6.855654600401044,"c":{"t":4,"u":2,"m":2,"o":2,"a":3,"p":1,"e":2,"r":1,"n":1,"s":1,"l":1,"c":1},"t":"TranslateComTranslate"},"Translatecom Prevodite":{"s":{"n","d","t","l","p","v","c","r","s","m","a","o","e","i"},"l":6.244997998398398,"c":{"t":3,"r":2,"a":2,"n":1,"s":1,"l":1,"e":3,"c":1,"o":2,"m":1,"p":1,"v":1,"d":1,"i":1},"t":"TranslateComTranslate"},"Translator.com Translator ApitRanslatecom":{"s":{".","n","t","l","p","c","r","s","m","a","o","e","i"},"l":12.84523257866513,"c":{"t":6,"r":5,"a":7,"n":3,"s":3,"l":3,"o":4,".":1,"c":2,"m":2,"p":1,"i":1,"e":1},"t":"TranslateComTranslate"},"Ntụgharị ntụgharị asụsụ API":{"s":{"g","n","h","t","r","s","ụ","ị","a","p","i"},"l":7.874007874011811,"c":{"n":2,"t":2,"ụ":4,"g":2,"h":2,"a":4,"r":2,"ị":2,"s":2,"p":1,"i":1},"t":"TranslateComTranslate"},"Përkthyesi i Përkthyesit API":{"s":{"ë","h","t","r","y","s","k","a","p","e","i"},"l":7.937253933193772,"c":{"p":3,"ë":2,"r":2,"k":2,"t":3,"h":2,"y":2,"e":2,"s":2,"i":4,"a":1},"t":"TranslateComTranslate"},"Spurtlate.com Translator Apitranslatecom":{"s":{".","n","o","t","l","u","c","r","s","m","a","p","e","i"},"l":11.74734012447073,"c":{"s":3,"p":2,"u":1,"r":4,"t":6,"l":3,"a":6,"e":2,".":1,"c":2,"o":3,"m":2,"n":2,"i":1},"t":"TranslateComTranslate"},"Aistritheoir translatecom API":{"s":{"n","h","t","l","p","c","r","s","m","a","o","e","i"},"l":8.660254037844387,"c":{"a":4,"i":4,"s":2,"t":4,"r":3,"h":1,"e":2,"o":2,"n":1,"l":1,"c":1,"m":1,"p":1},"t":"TranslateComTranslate"},"అనువాదం అనువాదం":{"s":{"ద","ా","ం","వ","ు","న","అ"},"l":5.291502622129181,"c":{"అ":2,"న":2,"ు":2,"వ":2,"ా":2,"ద":2,"ం":2},"t":"TranslateComTranslate"},"Recate.com איבערזעצער":{"s":{".","י","ב","צ","ע","ז","t","c","r","א","m","a","o","e","ר"},"l":5.656854249492381,"c":{"r":1,"e":2,"c":2,"a":1,"t":1,".":1,"o":1,"m":1,"א":1,"י":1,"ב":1,"ע":3,"ר":2,"ז":1,"צ":1},"t":"TranslateComTranslate"},"Fassarar fassara Fassara API":{"s":{"f","r","s","a","p","i"},"l":12.767145334803704,"c":{"f":3,"a":10,"s":6,"r":4,"p":1,"i":1},"t":"TranslateComTranslate"},"अनुवाद अनुवाद":{"s":{"ु","न","अ","द","ा","व"},"l":4.898979485566356,"c":{"अ":2,"न":2,"ु":2,"व":2,"ा":2,"द":2},"t":"TranslateComTranslate"},"Translate.com":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":4.123105625617661,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"অনুবাদ ডটকম অনুবাদক এপিট্রান্সলটেকম":{"s":{"অ","ি","ু","এ","ন","দ","ম","ল","ট","ব","ক","া","্","র","স","ড","ে","প"},"l":8.246211251235321,"c":{"অ":2,"ন":3,"ু":2,"ব":2,"া":3,"দ":2,"ড":1,"ট":3,"ক":3,"ম":2,"এ":1,"প":1,"ি":1,"্":2,"র":1,"স":1,"ল":1,"ে":1},"t":"TranslateComTranslate"},"TranslateCom تەرجىمە":{"s":{"n","t","l","ى","ج","c","r","ت","s","m","ە","ر","م","a","o","e"},"l":5.0,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1,"ت":1,"ە":2,"ر":1,"ج":1,"ى":1,"م":1},"t":"TranslateComTranslate"},"Перакладчык TranslateCom":{"s":{"l","д","a","п","а","r","m","o","к","л","n","t","s","c","e","ч","р","ы","е"},"l":5.5677643628300215,"c":{"п":1,"е":1,"р":1,"а":2,"к":2,"л":1,"д":1,"ч":1,"ы":1,"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Iwwersetzer.com Iwwersetzer":{"s":{".","w","t","r","s","z","m","c","o","e","i"},"l":9.38083151964686,"c":{"i":2,"w":4,"e":6,"r":4,"s":2,"t":2,"z":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"පරිවර්තන පරිගණක පරිවර්තකය":{"s":{"ි","න","ග","ව","ණ","ප","ත","ක","්","ය","ර"},"l":7.937253933193772,"c":{"ප":3,"ර":5,"ි":3,"ව":2,"්":2,"ත":2,"න":1,"ග":1,"ණ":1,"ක":2,"ය":1},"t":"TranslateComTranslate"},"Traducir traducir":{"s":{"d","t","u","c","r","a","i"},"l":6.324555320336759,"c":{"t":2,"r":4,"a":2,"d":2,"u":2,"c":2,"i":2},"t":"TranslateComTranslate"},"Преведување.com превод":{"s":{"њ",".","в","р","а","c","m","д","о","у","п","o","е"},"l":6.708203932499369,"c":{"п":2,"р":2,"е":4,"в":3,"д":2,"у":1,"а":1,"њ":1,".":1,"c":1,"o":1,"m":1,"о":1},"t":"TranslateComTranslate"},"Тарҷумони TransatECOM API":{"s":{"м","a","т","и","а","r","m","ҷ","o","i","n","t","s","о","c","e","н","р","у","p"},"l":5.5677643628300215,"c":{"т":1,"а":1,"р":1,"ҷ":1,"у":1,"м":1,"о":1,"н":1,"и":1,"t":2,"r":1,"a":3,"n":1,"s":1,"e":1,"c":1,"o":1,"m":1,"p":1,"i":1},"t":"TranslateComTranslate"},"Tõlke.com tõlkija":{"s":{"a",".","j","t","l","m","k","õ","c","o","e","i"},"l":4.898979485566356,"c":{"t":2,"õ":2,"l":2,"k":2,"e":1,".":1,"c":1,"o":1,"m":1,"i":1,"j":1,"a":1},"t":"TranslateComTranslate"},"Transatecom Translate":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.211102550927978,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"e":2,"c":1,"o":1,"m":1,"l":1},"t":"TranslateComTranslate"},"Fetolela.com Fetolela":{"s":{".","f","t","l","c","m","a","o","e"},"l":7.483314773547883,"c":{"f":2,"e":4,"t":2,"o":3,"l":4,"a":2,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Translatecom vertaal":{"s":{"n","t","l","v","c","r","s","m","a","o","e"},"l":6.557438524302,"c":{"t":3,"r":2,"a":4,"n":1,"s":1,"l":2,"e":2,"c":1,"o":1,"m":1,"v":1},"t":"TranslateComTranslate"},"Penerjemah translateCom":{"s":{"n","h","o","j","t","l","c","r","s","m","a","p","e"},"l":6.928203230275509,"c":{"p":1,"e":4,"n":2,"r":2,"j":1,"m":2,"a":3,"h":1,"t":2,"s":1,"l":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Onitumọ transkam":{"s":{"n","t","u","r","ọ","m","s","k","a","o","i"},"l":4.795831523312719,"c":{"o":1,"n":2,"i":1,"t":2,"u":1,"m":2,"ọ":1,"r":1,"a":2,"s":1,"k":1},"t":"TranslateComTranslate"},"ਅਨੁਵਾਦ.ਕਾਮ ਦਾ ਅਨੁਵਾਦ":{"s":{"ਮ",".","ਾ","ਕ","ਵ","ੁ","ਅ","ਨ","ਦ"},"l":6.6332495807108,"c":{"ਅ":2,"ਨ":2,"ੁ":2,"ਵ":2,"ਾ":4,"ਦ":3,".":1,"ਕ":1,"ਮ":1},"t":"TranslateComTranslate"},"Тарҷума Тарҷума":{"s":{"м","а","р","ҷ","у","т"},"l":6.0,"c":{"т":2,"а":4,"р":2,"ҷ":2,"у":2,"м":2},"t":"TranslateComTranslate"},"Guqulela.com":{"s":{"g",".","l","q","u","c","m","a","o","e"},"l":4.0,"c":{"g":1,"u":2,"q":1,"l":2,"e":1,"a":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com מתרגם apitranslatecom":{"s":{"ת",".","ג","n","i","t","l","p","c","r","s","m","ם","a","o","e","ר","מ"},"l":9.0,"c":{"t":4,"r":2,"a":5,"n":2,"s":2,"l":2,"e":2,".":1,"c":2,"o":2,"m":2,"מ":1,"ת":1,"ר":1,"ג":1,"ם":1,"p":1,"i":1},"t":"TranslateComTranslate"},"පරිවර්තකය පරිවර්තනය කරන්න":{"s":{"ි","න","ව","ප","ත","ක","්","ය","ර"},"l":8.18535277187245,"c":{"ප":2,"ර":5,"ි":2,"ව":2,"්":3,"ත":2,"ක":2,"ය":2,"න":3},"t":"TranslateComTranslate"},"Fassara mai fassara":{"s":{"f","r","s","m","a","i"},"l":8.660254037844387,"c":{"f":2,"a":7,"s":4,"r":2,"m":1,"i":1},"t":"TranslateComTranslate"},"Translate.com prevaja":{"s":{".","n","j","t","l","p","v","c","r","s","m","a","o","e"},"l":6.164414002968976,"c":{"t":2,"r":2,"a":4,"n":1,"s":1,"l":1,"e":2,".":1,"c":1,"o":1,"m":1,"p":1,"v":1,"j":1},"t":"TranslateComTranslate"},"ट्रांसलेट.कॉम अनुवादक एपिट्रांसलटेकॉम":{"s":{"ट","र","क","े","ि","न","्","द","स","ं","ल","ए","प","ॉ","अ","म",".","ु","ा","व"},"l":8.660254037844387,"c":{"ट":4,"्":2,"र":2,"ा":3,"ं":2,"स":2,"ल":2,"े":2,".":1,"क":3,"ॉ":2,"म":2,"अ":1,"न":1,"ु":1,"व":1,"द":1,"ए":1,"प":1,"ि":1},"t":"TranslateComTranslate"},"පරිවර්තකය":{"s":{"ි","ව","ප","ත","ක","්","ය","ර"},"l":3.3166247903554,"c":{"ප":1,"ර":2,"ි":1,"ව":1,"්":1,"ත":1,"ක":1,"ය":1},"t":"TranslateComTranslate"},"translate.com":{"s":{".","n","t","l","c","r","s","m","a","o","e"},"l":4.123105625617661,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Translate.com vertalen":{"s":{".","n","t","l","v","c","r","s","m","a","o","e"},"l":6.708203932499369,"c":{"t":3,"r":2,"a":3,"n":2,"s":1,"l":2,"e":3,".":1,"c":1,"o":1,"m":1,"v":1},"t":"TranslateComTranslate"},"अनुवादक अनुवादक":{"s":{"ु","न","अ","द","ा","क","व"},"l":5.291502622129181,"c":{"अ":2,"न":2,"ु":2,"व":2,"ा":2,"द":2,"क":2},"t":"TranslateComTranslate"},"Translate.com Tərcümə edin":{"s":{".","n","ü","d","t","l","c","r","ə","s","m","a","o","e","i"},"l":6.6332495807108,"c":{"t":3,"r":2,"a":2,"n":2,"s":1,"l":1,"e":2,".":1,"c":2,"o":1,"m":2,"ə":2,"ü":1,"d":1,"i":1},"t":"TranslateComTranslate"},"Transe.com ਅਨੁਵਾਦਕ apitranslatecom":{"s":{"l","a","ਵ","r","m","o","i","ਦ","n","ਕ","t","s","c","e","ਨ",".","ਾ","ੁ","ਅ","p"},"l":8.0,"c":{"t":3,"r":2,"a":4,"n":2,"s":2,"e":2,".":1,"c":2,"o":2,"m":2,"ਅ":1,"ਨ":1,"ੁ":1,"ਵ":1,"ਾ":1,"ਦ":1,"ਕ":1,"p":1,"i":1,"l":1},"t":"TranslateComTranslate"},"អ្នកបកប្រែ.comអ្នកបកប្រែ":{"s":{"ប","រ",".","្","ែ","ក","អ","m","c","o","ន"},"l":8.246211251235321,"c":{"អ":2,"្":4,"ន":2,"ក":4,"ប":4,"រ":2,"ែ":2,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Přeložit.com Překlad":{"s":{"a",".","o","d","ř","l","t","ž","m","k","c","p","e","i"},"l":5.385164807134504,"c":{"p":2,"ř":2,"e":2,"l":2,"o":2,"ž":1,"i":1,"t":1,".":1,"c":1,"m":1,"k":1,"a":1,"d":1},"t":"TranslateComTranslate"},"تەرجىمە قىلىش. تەرجىماندىكى aprancanscom":{"s":{"م","a","د","ك","r","m","ش","ج","ن","o","n","ى","ا","ر","s","c",".","ق","ل","ە","ت","p"},"l":9.539392014169456,"c":{"ت":2,"ە":3,"ر":2,"ج":2,"ى":6,"م":2,"ق":1,"ل":1,"ش":1,".":1,"ا":1,"ن":1,"د":1,"ك":1,"a":3,"p":1,"r":1,"n":2,"c":2,"s":1,"o":1,"m":1},"t":"TranslateComTranslate"},"ट्रांसलेट डॉट कॉम ट्रांसलेट करें":{"s":{"े","ड","ॉ","्","ा","ट","र","ं","स","ल","क","म"},"l":8.831760866327848,"c":{"ट":5,"्":2,"र":3,"ा":2,"ं":3,"स":2,"ल":2,"े":3,"ड":1,"ॉ":2,"क":2,"म":1},"t":"TranslateComTranslate"},"Oversæt.com Oversæt":{"s":{".","t","v","r","æ","s","m","c","o","e"},"l":6.0,"c":{"o":3,"v":2,"e":2,"r":2,"s":2,"æ":2,"t":2,".":1,"c":1,"m":1},"t":"TranslateComTranslate"},"Tradlate.com Traductor apitranslatecom":{"s":{".","n","d","t","l","p","u","c","r","s","m","a","o","e","i"},"l":11.313708498984761,"c":{"t":6,"r":4,"a":6,"d":2,"l":2,"e":2,".":1,"c":3,"o":3,"m":2,"u":1,"p":1,"i":1,"n":1,"s":1},"t":"TranslateComTranslate"},"Комментарий котормочу":{"s":{"к","н","ч","м","и","а","й","р","о","у","е","т"},"l":6.6332495807108,"c":{"к":2,"о":4,"м":3,"е":1,"н":1,"т":2,"а":1,"р":2,"и":1,"й":1,"ч":1,"у":1},"t":"TranslateComTranslate"},"Tumọ Aṣoju":{"s":{"ṣ","j","t","u","ọ","m","a","o"},"l":3.3166247903554,"c":{"t":1,"u":2,"m":1,"ọ":1,"a":1,"ṣ":1,"o":1,"j":1},"t":"TranslateComTranslate"},"Тарҷумаи фармоишӣ":{"s":{"м","и","ш","о","ӣ","а","р","ҷ","у","т","ф"},"l":5.291502622129181,"c":{"т":1,"а":3,"р":2,"ҷ":1,"у":1,"м":2,"и":2,"ф":1,"о":1,"ш":1,"ӣ":1},"t":"TranslateComTranslate"},"د ژباړونکي سره ژباړن اپیټراسلیټ":{"s":{"ب","و","ک","ي","ی","ړ","ل","س","ا","ټ","ر","ژ","ه","پ","ن","د"},"l":7.416198487095663,"c":{"د":1,"ژ":2,"ب":2,"ا":4,"ړ":2,"و":1,"ن":2,"ک":1,"ي":1,"س":2,"ر":2,"ه":1,"پ":1,"ی":2,"ټ":2,"ل":1},"t":"TranslateComTranslate"},"API cyfieithydd cyfieithu":{"s":{"a","h","f","d","t","u","y","c","p","e","i"},"l":7.810249675906654,"c":{"a":1,"p":1,"i":5,"c":2,"y":3,"f":2,"e":2,"t":2,"h":2,"d":2,"u":1},"t":"TranslateComTranslate"},"Humusha.com":{"s":{".","h","u","c","s","m","a","o"},"l":4.123105625617661,"c":{"h":2,"u":2,"m":2,"s":1,"a":1,".":1,"c":1,"o":1},"t":"TranslateComTranslate"},"Translatecom překladatel":{"s":{"n","d","ř","t","l","p","c","r","s","m","k","a","o","e"},"l":7.280109889280518,"c":{"t":3,"r":1,"a":4,"n":1,"s":1,"l":3,"e":3,"c":1,"o":1,"m":1,"p":1,"ř":1,"k":1,"d":1},"t":"TranslateComTranslate"},"Translatecom Translate":{"s":{"n","t","l","c","r","s","m","a","o","e"},"l":7.416198487095663,"c":{"t":4,"r":2,"a":4,"n":2,"s":2,"l":2,"e":2,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Fassara Fassara":{"s":{"r","a","s","f"},"l":7.745966692414834,"c":{"f":2,"a":6,"s":4,"r":2},"t":"TranslateComTranslate"},"Translate.com თარგმნეთ":{"s":{".","თ","n","t","l","ა","რ","მ","გ","c","r","ნ","s","m","ე","a","o","e"},"l":5.196152422706632,"c":{"t":2,"r":1,"a":2,"n":1,"s":1,"l":1,"e":1,".":1,"c":1,"o":1,"m":1,"თ":2,"ა":1,"რ":1,"გ":1,"მ":1,"ნ":1,"ე":1},"t":"TranslateComTranslate"},"Traduït Translatecom Translate":{"s":{"n","d","t","l","u","c","r","ï","s","m","a","o","e"},"l":9.591663046625438,"c":{"t":6,"r":3,"a":5,"d":1,"u":1,"ï":1,"n":2,"s":2,"l":2,"e":2,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Whakawhitiwhiti Whakawhitiwhiti":{"s":{"h","w","t","k","a","i"},"l":13.114877048604,"c":{"w":6,"h":6,"a":4,"k":2,"i":8,"t":4},"t":"TranslateComTranslate"},"Tradlate.com Translate":{"s":{".","n","d","t","l","c","r","s","m","a","o","e"},"l":7.14142842854285,"c":{"t":4,"r":2,"a":4,"d":1,"l":2,"e":2,".":1,"c":1,"o":1,"m":1,"n":1,"s":1},"t":"TranslateComTranslate"},"Traduki.com":{"s":{".","d","t","u","c","r","m","k","a","o","i"},"l":3.3166247903554,"c":{"t":1,"r":1,"a":1,"d":1,"u":1,"k":1,"i":1,".":1,"c":1,"o":1,"m":1},"t":"TranslateComTranslate"},"Ntụgharị ntụgharị.com apitranslatecom":{"s":{"g",".","n","h","t","l","p","c","r","s","m","ụ","ị","a","o","e","i"},"l":9.643650760992955,"c":{"n":3,"t":4,"ụ":2,"g":2,"h":2,"a":5,"r":3,"ị":2,".":1,"c":2,"o":2,"m":2,"p":1,"i":1,"s":1,"l":1,"e":1},"t":"TranslateComTranslate"},"ट्रान्सलिटकॉम भाषांतर":{"s":{"भ","ॉ","ि","न","्","त","ा","ट","र","स","ष","ं","ल","क","म"},"l":5.656854249492381,"c":{"ट":2,"्":2,"र":2,"ा":3,"न":1,"स":1,"ल":1,"ि":1,"क":1,"ॉ":1,"म":1,"भ":1,"ष":1,"ं":1,"त":1},"t":"TranslateComTranslate"},"Translate.com aistritheoir apitranslatecom":{"s":{".","n","h","t","l","p","c","r","s","m","a","o","e","i"},"l":12.24744871391589,"c":{"t":6,"r":4,"a":6,"n":2,"s":3,"l":2,"e":3,".":1,"c":2,"o":3,"m":2,"i":4,"h":1,"p":1},"t":"TranslateComTranslate"}}
+"""
+The translators aliases, loaded from translatepy/utils/_data on first access
+
+VECTORS: {alias: (translator class name, vector norm, {character: count})}, for the fuzzy search
+(the vectors are the ones of the normalized aliases)
+"""
+
+from translatepy.utils.lazy import LazyMapping, load_data
+
+VECTORS = LazyMapping(lambda: load_data("importer_vectors.pickle"))
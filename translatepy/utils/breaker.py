@@ -0,0 +1,113 @@
+"""
+Circuit breakers to stop calling the services which keep failing
+"""
+
+from threading import Lock
+from time import time
+
+
+class CircuitBreaker():
+    """
+    A circuit breaker for a service
+
+    - closed: the calls are allowed
+    - open: the calls are not allowed, until `cooldown` seconds passed
+    - half-open: a single probe call is allowed, closing the circuit if it succeeds and opening it again if it fails
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 60) -> None:
+        """
+        Parameters:
+        ----------
+            failure_threshold : int, default = 5
+                The number of consecutive failures opening the circuit
+            cooldown : float, default = 60
+                The time (in seconds) to wait before letting a probe call through an open circuit
+        """
+        self.failure_threshold = int(failure_threshold)
+        self.cooldown = float(cooldown)
+
+        self.failures = 0
+        self.opened_at = None
+        self._state = self.CLOSED
+        self._probing = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        The current state of the circuit
+        """
+        with self._lock:
+            if self._state == self.OPEN and time() - self.opened_at >= self.cooldown:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Returns True if a call can be made to the service
+
+        When the cooldown of an open circuit is over, only the first caller gets allowed (as the probe).
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time() - self.opened_at < self.cooldown:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """
+        Records a successful call, closing the circuit
+        """
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._state = self.CLOSED
+            self._probing = False
+
+    def record_failure(self, rate_limited: bool = False) -> None:
+        """
+        Records a failed call, opening the circuit if the probe failed, if the service is rate limiting
+        the calls or if `failure_threshold` consecutive calls failed
+        """
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or rate_limited or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self.opened_at = time()
+            self._probing = False
+
+    def release(self) -> None:
+        """
+        Records a call which did not tell anything about the service health (i.e an unsupported method),
+        letting another probe through if needed
+        """
+        with self._lock:
+            self._probing = False
+
+    def as_dict(self) -> dict:
+        state = self.state
+        return {
+            "state": state,
+            "failures": self.failures,
+            "retry_in": max(self.cooldown - (time() - self.opened_at), 0) if state != self.CLOSED and self.opened_at is not None else None
+        }
+
+
+def is_rate_limit(exception: Exception) -> bool:
+    """
+    Returns True if the given exception means that the service is rate limiting the requests
+    """
+    if getattr(exception, "rate_limited", False):
+        return True
+    return getattr(exception, "status_code", None) == 429
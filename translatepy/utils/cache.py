@@ -0,0 +1,590 @@
+"""
+Pluggable cache backends for the translators results
+
+A backend gives out namespaces, which are dict-like views used as the `BaseTranslator` caches:
+>>> from translatepy.translators.base import BaseTranslator
+>>> from translatepy.utils.cache import SQLiteCacheBackend
+>>> BaseTranslator.use_cache_backend(SQLiteCacheBackend("translatepy.sqlite"))
+"""
+
+import atexit
+import json
+import logging
+import os
+import socket
+import sqlite3
+from base64 import b64decode, b64encode
+from abc import ABC, abstractmethod
+from threading import RLock
+from time import time
+from urllib.parse import parse_qs, unquote, urlparse
+
+from translatepy.exceptions import ParameterValueError, TranslatepyException
+from translatepy.utils.lru_cacher import LRUDictCache
+
+logger = logging.getLogger('translatepy')
+
+HOME_DIR = os.path.abspath(os.path.dirname(__file__))
+
+_MISSING = object()
+
+
+def _to_json(value):
+    """Internal function converting a cached value to JSON types, keeping the tuples and bytes apart from the lists and strings"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple):
+        return {"t": [_to_json(element) for element in value]}
+    if isinstance(value, list):
+        return [_to_json(element) for element in value]
+    if isinstance(value, bytes):
+        return {"b": b64encode(value).decode("ascii")}
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {"d": {key: _to_json(element) for key, element in value.items()}}
+    raise TypeError("{type} values can't be cached".format(type=type(value).__name__))
+
+
+def _from_json(value):
+    """Internal function converting back the result of `_to_json`"""
+    if isinstance(value, list):
+        return [_from_json(element) for element in value]
+    if isinstance(value, dict):
+        if "t" in value:
+            return tuple(_from_json(element) for element in value["t"])
+        if "b" in value:
+            return b64decode(value["b"])
+        return {key: _from_json(element) for key, element in value["d"].items()}
+    return value
+
+
+def serialize(value) -> bytes:
+    """
+    Serializes a value to store it in a persistent or shared backend
+
+    JSON is used rather than pickle, as loading a pickle from a store which can be written by someone else (i.e a shared Redis server)
+    would run their code. Only the types returned by the translators are supported: None, bool, int, float, str, bytes, tuple, list
+    and dict (with str keys). A TypeError is raised for the other ones.
+
+    i.e serialize(("en", "bonjour")) --> b'{"t": ["en", "bonjour"]}'
+    """
+    return json.dumps(_to_json(value), ensure_ascii=False).encode("utf-8")
+
+
+def deserialize(data: bytes):
+    """
+    Returns the value serialized by `serialize`, raising a ValueError if `data` is not a serialized value
+    """
+    try:
+        return _from_json(json.loads(bytes(data).decode("utf-8")))
+    except (KeyError, TypeError, UnicodeDecodeError) as exception:
+        raise ValueError("Invalid cached value") from exception
+
+
+class CacheNamespace():
+    """
+    A dict-like view on a namespace of a cache backend
+    """
+
+    def __init__(self, backend: "BaseCacheBackend", name: str) -> None:
+        self.backend = backend
+        self.name = str(name)
+
+    def get(self, key, default=None):
+        value = self.backend.get(self.name, key, _MISSING)
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, default=None) -> list:
+        return self.backend.get_many(self.name, keys, default)
+
+    def set_many(self, mapping) -> None:
+        self.backend.set_many(self.name, mapping)
+
+    def __contains__(self, key) -> bool:
+        return self.backend.get(self.name, key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key):
+        value = self.backend.get(self.name, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self.backend.set(self.name, key, value)
+
+    def __delitem__(self, key) -> None:
+        self.backend.delete(self.name, key)
+
+    def clear(self) -> None:
+        self.backend.clear(self.name)
+
+    def __repr__(self) -> str:
+        return "CacheNamespace({name!r}, {backend})".format(name=self.name, backend=self.backend)
+
+
+class BaseCacheBackend(ABC):
+    """
+    Base abstract class for a cache backend
+    """
+
+    def namespace(self, name: str, maxsize: int = 1024):
+        """
+        Returns a dict-like view on the given namespace
+
+        `maxsize` is the maximum number of entries the namespace should keep, if the backend bounds each namespace.
+        """
+        return CacheNamespace(self, name)
+
+    @abstractmethod
+    def get(self, namespace: str, key, default=None):
+        """
+        Returns the value cached for `key` in `namespace`, or `default` if there is none
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, namespace: str, key, value) -> None:
+        """
+        Caches `value` for `key` in `namespace`
+        """
+        raise NotImplementedError()
+
+    def get_many(self, namespace: str, keys, default=None) -> list:
+        """
+        Returns the values cached for each key of `keys` in `namespace`, with `default` for the missing ones
+        """
+        return [self.get(namespace, key, default) for key in keys]
+
+    def set_many(self, namespace: str, mapping) -> None:
+        """
+        Caches each value of `mapping` for its key in `namespace`
+        """
+        for key, value in mapping.items():
+            self.set(namespace, key, value)
+
+    @abstractmethod
+    def delete(self, namespace: str, key) -> None:
+        """
+        Removes `key` from `namespace`
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self, namespace: str = None) -> None:
+        """
+        Removes everything from `namespace`, or from every namespace if None
+        """
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """
+        Releases the resources used by the backend
+        """
+        pass
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """
+    The default in-process backend, with one `LRUDictCache` per namespace
+    """
+
+    def __init__(self) -> None:
+        self._namespaces = {}
+
+    def namespace(self, name: str, maxsize: int = 1024) -> LRUDictCache:
+        if name not in self._namespaces:
+            self._namespaces[name] = LRUDictCache(maxsize)
+        return self._namespaces[name]
+
+    def get(self, namespace: str, key, default=None):
+        try:
+            return self.namespace(namespace)[key]
+        except KeyError:
+            return default
+
+    def set(self, namespace: str, key, value) -> None:
+        self.namespace(namespace)[key] = value
+
+    def delete(self, namespace: str, key) -> None:
+        self.namespace(namespace).pop(key, None)
+
+    def clear(self, namespace: str = None) -> None:
+        if namespace is None:
+            for cache in self._namespaces.values():
+                cache.clear()
+        else:
+            self.namespace(namespace).clear()
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """
+    A persistent backend storing the cached values in a SQLite database
+
+    The database is opened in WAL mode so that multiple processes on the same host can share it.
+    The writes are buffered and committed by batches, and the least recently used entries
+    are evicted once the database holds more than `maxsize` entries.
+    """
+
+    def __init__(self, path: str = None, maxsize: int = 100000, batch_size: int = 64, flush_interval: float = 1, timeout: float = 10) -> None:
+        """
+        Parameters:
+        ----------
+            path : str, default = None
+                The path to the database file. Defaults to a file next to this module.
+            maxsize : int, default = 100000
+                The maximum number of entries kept in the database (all namespaces combined)
+            batch_size : int, default = 64
+                The number of buffered writes triggering a commit
+            flush_interval : float, default = 1
+                The maximum time (in seconds) a write can stay buffered before being committed (checked on each write)
+            timeout : float, default = 10
+                The time (in seconds) to wait for another process to release the database lock
+        """
+        self.path = str(path) if path is not None else os.path.join(HOME_DIR, ".translatepy_cache.sqlite")
+        self.maxsize = int(maxsize)
+        self.batch_size = int(batch_size)
+        self.flush_interval = float(flush_interval)
+
+        self._lock = RLock()
+        self._pending = {}  # (namespace, key) --> (serialized value or None if deleted, timestamp)
+        self._touched = {}  # (namespace, key) --> timestamp, for the entries read since the last flush
+        self._last_flush = time()
+
+        self._connection = sqlite3.connect(self.path, timeout=float(timeout), check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cache (namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, accessed REAL NOT NULL, PRIMARY KEY (namespace, key))")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+            self._connection.commit()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _serialize_key(key) -> str:
+        return key if isinstance(key, str) else repr(key)
+
+    def get(self, namespace: str, key, default=None):
+        entry = (namespace, self._serialize_key(key))
+        with self._lock:
+            if self._connection is None:
+                return default
+            if entry in self._pending:
+                value = self._pending[entry][0]
+            else:
+                row = self._connection.execute("SELECT value FROM cache WHERE namespace = ? AND key = ?", entry).fetchone()
+                value = row[0] if row is not None else None
+            if value is None:
+                return default
+            self._touched[entry] = time()
+        try:
+            return deserialize(value)
+        except ValueError:  # i.e written by an older version
+            return default
+
+    def set(self, namespace: str, key, value) -> None:
+        try:
+            value = serialize(value)
+        except Exception:
+            logger.debug("Could not serialize the value to cache in {namespace}, skipping".format(namespace=namespace), exc_info=True)
+            return
+        with self._lock:
+            self._pending[(namespace, self._serialize_key(key))] = (value, time())
+            self._maybe_flush()
+
+    def delete(self, namespace: str, key) -> None:
+        with self._lock:
+            self._pending[(namespace, self._serialize_key(key))] = (None, time())
+            self._maybe_flush()
+
+    def clear(self, namespace: str = None) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            if namespace is None:
+                self._pending.clear()
+                self._touched.clear()
+                self._connection.execute("DELETE FROM cache")
+            else:
+                for entries in (self._pending, self._touched):
+                    for entry in [entry for entry in entries if entry[0] == namespace]:
+                        del entries[entry]
+                self._connection.execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+            self._connection.commit()
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending) >= self.batch_size or time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Commits the buffered writes and evicts the least recently used entries if needed
+        """
+        with self._lock:
+            self._last_flush = time()
+            if self._connection is None or (not self._pending and not self._touched):
+                return
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, {}
+            with self._connection:  # a single transaction
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, accessed) VALUES (?, ?, ?, ?)",
+                    [(namespace, key, value, timestamp) for (namespace, key), (value, timestamp) in pending.items() if value is not None]
+                )
+                self._connection.executemany(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                    [entry for entry, (value, _) in pending.items() if value is None]
+                )
+                self._connection.executemany(
+                    "UPDATE cache SET accessed = ? WHERE namespace = ? AND key = ? AND accessed < ?",
+                    [(timestamp, namespace, key, timestamp) for (namespace, key), timestamp in touched.items() if (namespace, key) not in pending]
+                )
+                excess = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.maxsize
+                if excess > 0:
+                    self._connection.execute("DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache ORDER BY accessed ASC LIMIT ?)", (excess,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self.flush()
+            self._connection.close()
+            self._connection = None
+
+    def __repr__(self) -> str:
+        return "SQLiteCacheBackend({path!r})".format(path=self.path)
+
+
+class RedisError(TranslatepyException):
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args)
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    A backend storing the cached values in a Redis-compatible server, to share them between processes and hosts
+    (i.e the workers of the translatepy server)
+
+    The values are stored under "{prefix}:{namespace}:{key}", and expire after `ttl` seconds if given.
+    The server is spoken to with a minimal RESP client, so that no other dependency is needed.
+    If the server can't be reached, the cache behaves as if it was empty.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0, password: str = None, prefix: str = "translatepy", ttl: int = None, timeout: float = 5) -> None:
+        """
+        Parameters:
+        ----------
+            host : str, default = "127.0.0.1"
+                The host of the server
+            port : int, default = 6379
+                The port of the server
+            db : int, default = 0
+                The database index to use
+            password : str, default = None
+                The password to authenticate with
+            prefix : str, default = "translatepy"
+                The prefix of every key, to share the server with other applications
+            ttl : int, default = None
+                The time (in seconds) after which the cached values expire. They never expire if None.
+            timeout : float, default = 5
+                The socket timeout (in seconds)
+        """
+        self.host = str(host)
+        self.port = int(port)
+        self.db = int(db)
+        self.password = password
+        self.prefix = str(prefix)
+        self.ttl = int(ttl) if ttl else None
+        self.timeout = float(timeout)
+
+        self._lock = RLock()
+        self._socket = None
+        self._file = None
+
+    # RESP protocol
+
+    def _connect(self) -> None:
+        self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._file = self._socket.makefile("rb")
+        try:
+            if self.password is not None:
+                self._command("AUTH", self.password)
+            if self.db:
+                self._command("SELECT", self.db)
+        except Exception:  # not authenticated or on the wrong database: the connection can't be used
+            self._disconnect()
+            raise
+
+    def _disconnect(self) -> None:
+        for element in (self._file, self._socket):
+            if element is not None:
+                try:
+                    element.close()
+                except OSError:
+                    pass
+        self._socket = None
+        self._file = None
+
+    @staticmethod
+    def _encode(*args) -> bytes:
+        result = [b"*" + str(len(args)).encode() + b"\r\n"]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            result.append(b"$" + str(len(arg)).encode() + b"\r\n" + arg + b"\r\n")
+        return b"".join(result)
+
+    def _read_reply(self):
+        line = self._file.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("The connection to the cache server got closed")
+        kind, data = line[:1], line[1:-2]
+        if kind == b"+":
+            return data.decode("utf-8")
+        if kind == b"-":
+            raise RedisError(data.decode("utf-8"))
+        if kind == b":":
+            return int(data)
+        if kind == b"$":
+            length = int(data)
+            if length < 0:
+                return None
+            return self._file.read(length + 2)[:-2]
+        if kind == b"*":
+            length = int(data)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ConnectionError("Unexpected reply from the cache server: {line!r}".format(line=line))
+
+    def _pipeline(self, commands: list) -> list:
+        """
+        Sends all of the given commands at once and returns their replies
+        """
+        with self._lock:
+            for attempt in range(2):  # reconnecting once if the connection got lost
+                try:
+                    if self._socket is None:
+                        self._connect()
+                    self._socket.sendall(b"".join(self._encode(*command) for command in commands))
+                    return [self._read_reply() for _ in commands]
+                except (OSError, ConnectionError):
+                    self._disconnect()
+                    if attempt:
+                        raise
+                except Exception:
+                    # the replies of the next commands are left unread, and would be read as the replies of the next pipeline
+                    self._disconnect()
+                    raise
+
+    def _command(self, *args):
+        self._socket.sendall(self._encode(*args))
+        return self._read_reply()
+
+    # Cache backend
+
+    def _key(self, namespace: str, key) -> str:
+        return "{prefix}:{namespace}:{key}".format(prefix=self.prefix, namespace=namespace, key=key if isinstance(key, str) else repr(key))
+
+    def _set_command(self, namespace: str, key, value: bytes) -> tuple:
+        if self.ttl:
+            return ("SET", self._key(namespace, key), value, "EX", self.ttl)
+        return ("SET", self._key(namespace, key), value)
+
+    def get(self, namespace: str, key, default=None):
+        return self.get_many(namespace, [key], default)[0]
+
+    def get_many(self, namespace: str, keys, default=None) -> list:
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            values = self._pipeline([["MGET"] + [self._key(namespace, key) for key in keys]])[0]
+        except (OSError, ConnectionError, RedisError):
+            logger.debug("Could not get the cached values from {backend}".format(backend=self), exc_info=True)
+            return [default] * len(keys)
+        return [default if value is None else self._deserialize(value, default) for value in values]
+
+    @staticmethod
+    def _deserialize(value: bytes, default=None):
+        try:
+            return deserialize(value)
+        except ValueError:  # i.e written by an older version
+            return default
+
+    def set(self, namespace: str, key, value) -> None:
+        self.set_many(namespace, {key: value})
+
+    def set_many(self, namespace: str, mapping) -> None:
+        entries = {}
+        for key, value in mapping.items():
+            try:
+                entries[key] = serialize(value)
+            except Exception:
+                logger.debug("Could not serialize the value to cache in {namespace}, skipping".format(namespace=namespace), exc_info=True)
+        if not entries:
+            return
+        if self.ttl:  # MSET can't set an expiration time
+            commands = [self._set_command(namespace, key, value) for key, value in entries.items()]
+        else:
+            commands = [["MSET"] + [element for key, value in entries.items() for element in (self._key(namespace, key), value)]]
+        try:
+            self._pipeline(commands)
+        except (OSError, ConnectionError, RedisError):
+            logger.debug("Could not cache the values in {backend}".format(backend=self), exc_info=True)
+
+    def delete(self, namespace: str, key) -> None:
+        try:
+            self._pipeline([("DEL", self._key(namespace, key))])
+        except (OSError, ConnectionError, RedisError):
+            logger.debug("Could not delete the cached value from {backend}".format(backend=self), exc_info=True)
+
+    def clear(self, namespace: str = None) -> None:
+        pattern = "{prefix}:{namespace}:*".format(prefix=self.prefix, namespace="*" if namespace is None else namespace)
+        cursor = "0"
+        try:
+            while True:
+                cursor, keys = self._pipeline([("SCAN", cursor, "MATCH", pattern, "COUNT", 1000)])[0]
+                if keys:
+                    self._pipeline([["DEL"] + keys])
+                cursor = cursor.decode("utf-8") if isinstance(cursor, bytes) else str(cursor)
+                if cursor == "0":
+                    break
+        except (OSError, ConnectionError, RedisError):
+            logger.debug("Could not clear the cached values from {backend}".format(backend=self), exc_info=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def __repr__(self) -> str:
+        return "RedisCacheBackend('{host}:{port}/{db}')".format(host=self.host, port=self.port, db=self.db)
+
+
+def cache_backend_from_url(url: str) -> BaseCacheBackend:
+    """
+    Returns the cache backend described by the given URL
+
+    i.e
+        memory://
+        sqlite:///path/to/cache.sqlite?maxsize=100000
+        redis://:password@localhost:6379/0?prefix=translatepy&ttl=86400
+    """
+    parsed = urlparse(str(url))
+    options = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+    if parsed.scheme == "memory":
+        return MemoryCacheBackend()
+    if parsed.scheme == "sqlite":
+        path = parsed.netloc + parsed.path
+        return SQLiteCacheBackend(path=path or None, maxsize=int(options.get("maxsize", 100000)))
+    if parsed.scheme == "redis":
+        return RedisCacheBackend(
+            host=parsed.hostname or "127.0.0.1",
+            port=parsed.port or 6379,
+            db=int(parsed.path.strip("/") or 0),
+            password=unquote(parsed.password) if parsed.password else None,
+            prefix=options.get("prefix", "translatepy"),
+            ttl=int(options["ttl"]) if "ttl" in options else None
+        )
+    raise ParameterValueError("Unsupported cache backend URL scheme: {scheme}".format(scheme=parsed.scheme))
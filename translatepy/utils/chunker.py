@@ -0,0 +1,57 @@
+"""
+Splitting long texts in chunks which can be translated separately
+"""
+
+from re import compile
+
+from translatepy.utils.annotations import List
+
+# From the largest to the smallest boundary (the separators are kept at the end of the previous piece)
+BOUNDARIES_REGEXES = [
+    compile(r"\n\s*\n"),  # paragraphs
+    compile(r"\n"),  # lines
+    compile(r"(?<=[.!?:;。！？])\s+"),  # sentences (similar to DeepL's SENTENCES_SPLITTING_REGEX)
+    compile(r"\s+")  # words
+]
+
+
+def split_text(text: str, max_length: int, _level: int = 0) -> List[str]:
+    """
+    Splits the given text in chunks of at most `max_length` characters, at the largest possible boundaries
+    (paragraphs, then lines, then sentences, then words)
+
+    The chunks keep their whitespaces, so that "".join(chunks) == text.
+    Only the stripped chunks are limited, as the whitespaces around them are not sent to the services.
+    A word longer than `max_length` is cut.
+    """
+    if len(text.strip()) <= max_length:
+        return [text]
+    if _level >= len(BOUNDARIES_REGEXES):
+        return [text[index:index + max_length] for index in range(0, len(text), max_length)]
+
+    pieces = []
+    last = 0
+    for match in BOUNDARIES_REGEXES[_level].finditer(text):
+        if match.end() > last:
+            pieces.append(text[last:match.end()])
+            last = match.end()
+    if last < len(text):
+        pieces.append(text[last:])
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if len(piece.strip()) > max_length:
+            if current:
+                chunks.append(current)
+            sub_chunks = split_text(piece, max_length, _level + 1)
+            chunks.extend(sub_chunks[:-1])
+            current = sub_chunks[-1]  # the next pieces might still fit with the last one
+        elif len((current + piece).strip()) > max_length:
+            chunks.append(current)
+            current = piece
+        else:
+            current += piece
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,168 @@
+"""
+Bounding the time spent on a call, across every request it makes
+"""
+
+import asyncio
+import inspect
+from contextlib import contextmanager
+from functools import wraps
+from threading import local
+from time import monotonic
+
+from translatepy.exceptions import DeadlineExceeded
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7: the coroutines only get cancelled, their executor calls don't get the deadline
+    ContextVar = None
+
+_state = local()
+# The deadline of the current asyncio task (copied to the tasks it creates), as a thread deadline would be shared by every task of the event loop
+_task_deadline = None if ContextVar is None else ContextVar("translatepy_deadline", default=None)
+
+
+class Deadline():
+    """
+    A point in time after which a call should not make any more requests
+
+    >>> deadline = Deadline(timeout=5)
+    >>> deadline.remaining()
+    4.99...
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = float(timeout)
+        self.expires_at = monotonic() + self.timeout
+
+    def remaining(self) -> float:
+        """
+        Returns the number of seconds left before the deadline (negative once it passed)
+        """
+        return self.expires_at - monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """
+        Raises DeadlineExceeded if the deadline passed
+        """
+        if self.expired:
+            raise DeadlineExceeded("The deadline of {timeout}s passed".format(timeout=self.timeout))
+
+
+def current_deadline() -> Deadline:
+    """
+    Returns the deadline of the current thread (or of the current asyncio task), or None
+    """
+    deadline = getattr(_state, "deadline", None)
+    if deadline is None and _task_deadline is not None:
+        return _task_deadline.get()
+    return deadline
+
+
+def remaining_time() -> float:
+    """
+    Returns the number of seconds left before the deadline of the current thread, or None if there is no deadline
+    """
+    deadline = current_deadline()
+    return None if deadline is None else deadline.remaining()
+
+
+def check_deadline() -> None:
+    """
+    Raises DeadlineExceeded if the deadline of the current thread passed
+    """
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextmanager
+def use_deadline(deadline: Deadline):
+    """
+    Makes the given deadline the one of the current thread (an earlier enclosing deadline is kept)
+    """
+    previous = current_deadline()
+    if deadline is None or (previous is not None and previous.expires_at <= deadline.expires_at):
+        yield previous
+        return
+    _state.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _state.deadline = previous
+
+
+def deadline(timeout: float = None):
+    """
+    Returns a context manager giving the current thread a deadline in `timeout` seconds (nothing is changed if `timeout` is None)
+
+    >>> with deadline(5):
+    ...     service.translate("Hello", "French")
+    """
+    return use_deadline(None if timeout is None else Deadline(timeout))
+
+
+def bind_deadline(func, deadline: Deadline = None):
+    """
+    Returns a function calling `func` with the given deadline (or the deadline of the current thread),
+    so that it is kept when `func` runs in another thread
+    """
+    deadline = current_deadline() if deadline is None else deadline
+    if deadline is None:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with use_deadline(deadline):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def with_timeout(func):
+    """
+    Decorator making the `timeout` parameter of the decorated method bound the time spent on the whole call
+
+    The synchronous methods run with a thread deadline, used by every request they make (refer to `deadline`),
+    and the coroutines are cancelled once the deadline passes, their blocking calls run in an executor getting
+    the deadline with `bind_deadline`. DeadlineExceeded is raised in both cases.
+    """
+    parameters = list(inspect.signature(func).parameters)
+    position = parameters.index("timeout")
+
+    def _timeout(args, kwargs):
+        if "timeout" in kwargs:
+            return kwargs["timeout"]
+        return args[position] if len(args) > position else None
+
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            timeout = _timeout(args, kwargs)
+            if timeout is None:
+                return await func(*args, **kwargs)
+            start = monotonic()
+            token = None
+            if _task_deadline is not None:
+                # given to the blocking calls run in an executor (refer to `bind_deadline`), so that they stop with the coroutine
+                new_deadline, previous = Deadline(timeout), _task_deadline.get()
+                if previous is None or previous.expires_at > new_deadline.expires_at:
+                    token = _task_deadline.set(new_deadline)
+            try:
+                return await asyncio.wait_for(func(*args, **kwargs), timeout)
+            except asyncio.TimeoutError:
+                if monotonic() - start < timeout:  # raised by the call itself
+                    raise
+                raise DeadlineExceeded("The deadline of {timeout}s passed".format(timeout=timeout)) from None
+            finally:
+                if token is not None:
+                    _task_deadline.reset(token)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with deadline(_timeout(args, kwargs)):
+            return func(*args, **kwargs)
+    return wrapper
@@ -17,7 +17,8 @@ from translatepy.translators import (BingTranslate, DeeplTranslate,
                                      YandexTranslate)
 from translatepy.translators.base import BaseTranslator
 from translatepy.utils.sanitize import remove_spaces
-from translatepy.utils.similarity import fuzzy_search, StringVector
+from translatepy.utils.lazy import LazySequence
+from translatepy.utils.similarity import create_index, fuzzy_search, StringVector
 from translatepy.utils._importer_data import VECTORS
 
 
@@ -47,14 +48,9 @@ def translator_from_name(name: str) -> BaseTranslator:
     return None
 
 
-for alias, data in VECTORS.items():
-    translator = translator_from_name(data['t'])
-    if translator is None:  # RUNTIME NON-CRITICAL ERROR: translator not found
-        continue
-    data["t"] = translator
-
-
-LOADED_VECTORS = [StringVector(alias, data=data) for alias, data in VECTORS.items()]
+# the vectors are only prepared when a fuzzy search first happens
+LOADED_VECTORS = LazySequence(lambda: [StringVector(alias, data={"s": set(counter), "l": length, "c": counter}) for alias, (_, length, counter) in VECTORS.items()])
+VECTORS_INDEX = create_index(LOADED_VECTORS)
 
 
 class ErrorDuringImport(ImportError):
@@ -191,9 +187,12 @@ def get_translator(translator: str, threshold: float = 90, forceload: bool = Fal
     except ImportError:  # this also catches ErrorDuringImport
         pass
     normalized = remove_spaces(LANGUAGE_CLEANUP_REGEX.sub("", translator.lower()))
-    alias, similarity = fuzzy_search(LOADED_VECTORS, normalized)
+    alias, similarity = fuzzy_search(VECTORS_INDEX, normalized)
     similarity *= 100
-    result = VECTORS[alias]["t"]
+    name = VECTORS[alias][0]
+    result = translator_from_name(name)
+    if result is None:  # RUNTIME NON-CRITICAL ERROR: translator not found
+        result = name
     if similarity < threshold:
         raising_message = "Couldn't recognize the given translator ({0})\nDid you mean: {1} (Similarity: {2}%)?".format(translator, alias, round(similarity, 2))
         raise UnknownTranslator(result, similarity, raising_message)
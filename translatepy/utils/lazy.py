@@ -0,0 +1,89 @@
+"""
+Loading the data shipped with translatepy only when it is first needed
+"""
+
+import pickle
+from collections.abc import Mapping, Sequence
+from os import path
+from threading import Lock
+
+from translatepy.utils.annotations import Callable
+
+DATA_DIRECTORY = path.join(path.dirname(path.abspath(__file__)), "_data")
+
+
+def load_data(filename: str):
+    """
+    Loads one of the pickle files of the `_data` directory
+
+    i.e load_data("language_codes.pickle")
+    """
+    with open(path.join(DATA_DIRECTORY, filename), "rb") as data_file:
+        return pickle.load(data_file)
+
+
+class Lazy():
+    """
+    Calls `loader` the first time the value is needed, once even with multiple threads
+    """
+
+    def __init__(self, loader: Callable) -> None:
+        self._loader = loader
+        self._value = None
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def load(self):
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._loader()
+        return self._value
+
+
+class LazyMapping(Lazy, Mapping):
+    """
+    A read-only dict loaded on first access
+
+    >>> CODES = LazyMapping(lambda: load_data("language_codes.pickle"))
+    >>> CODES.loaded
+    False
+    >>> CODES["fr"]
+    'fra'
+    """
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.load()
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __repr__(self) -> str:
+        return "LazyMapping({state})".format(state="loaded" if self.loaded else "not loaded")
+
+
+class LazySequence(Lazy, Sequence):
+    """
+    A read-only list loaded on first access
+    """
+
+    def __getitem__(self, index):
+        return self.load()[index]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __repr__(self) -> str:
+        return "LazySequence({state})".format(state="loaded" if self.loaded else "not loaded")
@@ -1,34 +1,227 @@
 # Based on: https://github.com/ZhymabekRoman/platonus_api_wrapper/blob/main/platonus_api_wrapper/utils/lru_cacher.py
 
 import logging
+import sys
 from functools import lru_cache, wraps
 from datetime import datetime, timedelta
 from collections import OrderedDict
+from collections.abc import MutableMapping
+from threading import RLock
+from time import monotonic
 
 logger = logging.getLogger('translatepy')
 
 
-class LRUDictCache(OrderedDict):
-
-    def __init__(self, maxsize=1024, *args, **kwds):
+def sizeof(obj, _seen: set = None) -> int:
+    """
+    Returns an estimation of the memory used by the given object and by the objects it contains (in bytes)
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        return size + sum(sizeof(key, _seen) + sizeof(value, _seen) for key, value in obj.items())
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        return size + sum(sizeof(element, _seen) for element in obj)
+    if hasattr(obj, "__dict__"):
+        return size + sizeof(vars(obj), _seen)
+    return size
+
+
+class LRUDictCache(MutableMapping):
+    """
+    A thread-safe LRU cache, limited by its number of entries and optionally by its memory usage (in bytes)
+
+    The entries can expire after `ttl` seconds (set for the whole cache or per entry with `set`).
+    It wraps an `OrderedDict` (instead of subclassing it) so that every method goes through the lock,
+    skips the expired entries and keeps the memory usage up to date.
+    """
+
+    def __init__(self, maxsize=1024, *args, maxbytes: int = None, ttl: float = None, **kwds):
         self.maxsize = maxsize
-        super().__init__(*args, **kwds)
+        self.maxbytes = int(maxbytes) if maxbytes is not None else None
+        self.ttl = float(ttl) if ttl is not None else None
+
+        self.currentbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._lock = RLock()
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._expiries = {}
+        self.update(*args, **kwds)
+
+    def _is_expired(self, key) -> bool:
+        expiry = self._expiries.get(key)
+        if expiry is not None and monotonic() >= expiry:
+            self._remove(key)
+            self.expirations += 1
+            return True
+        return False
+
+    def _remove_expired(self) -> None:
+        """Internal function removing every expired entry"""
+        now = monotonic()
+        for key in [key for key, expiry in self._expiries.items() if now >= expiry]:
+            self._remove(key)
+            self.expirations += 1
+
+    def _remove(self, key) -> None:
+        del self._data[key]
+        self.currentbytes -= self._sizes.pop(key, 0)
+        self._expiries.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            if key in self._data and not self._is_expired(key):
+                return True
+            self.misses += 1
+            return False
 
     def __getitem__(self, key):
-        value = super().__getitem__(key)
-        self.move_to_end(key)
-        return value
+        with self._lock:
+            if key not in self._data or self._is_expired(key):
+                self.misses += 1
+                raise KeyError(key)
+            value = self._data[key]
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def set(self, key, value, ttl: float = None) -> None:
+        """
+        Caches `value` for `key`, expiring after `ttl` seconds (defaults to the cache `ttl`)
+        """
+        ttl = self.ttl if ttl is None else float(ttl)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            size = 0
+            if self.maxbytes is not None:
+                size = sizeof(key) + sizeof(value)
+                if size > self.maxbytes:  # would evict everything else
+                    return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.currentbytes += size
+            if ttl is not None:
+                self._expiries[key] = monotonic() + ttl
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self.currentbytes > self.maxbytes):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
 
     def __setitem__(self, key, value):
-        if key in self:
-            self.move_to_end(key)
-        super().__setitem__(key, value)
-        if len(self) > self.maxsize:
-            oldest = next(iter(self))
-            del self[oldest]
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key not in self._data or self._is_expired(key):
+                raise KeyError(key)
+            self._remove(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._remove_expired()
+            return len(self._data)
+
+    def __iter__(self):
+        """Iterates over a snapshot of the keys, from the least to the most recently used"""
+        return iter(self.keys())
+
+    def __repr__(self) -> str:
+        return "{name}({items})".format(name=self.__class__.__name__, items=self.items())
+
+    def keys(self) -> list:
+        """Returns the keys, from the least to the most recently used (without counting as an access)"""
+        with self._lock:
+            self._remove_expired()
+            return list(self._data.keys())
+
+    def values(self) -> list:
+        """Returns the values, from the least to the most recently used (without counting as an access)"""
+        with self._lock:
+            self._remove_expired()
+            return list(self._data.values())
+
+    def items(self) -> list:
+        """Returns the (key, value) pairs, from the least to the most recently used (without counting as an access)"""
+        with self._lock:
+            self._remove_expired()
+            return list(self._data.items())
+
+    def pop(self, key, *default):
+        with self._lock:
+            if key not in self._data or self._is_expired(key):
+                if default:
+                    return default[0]
+                raise KeyError(key)
+            value = self._data[key]
+            self._remove(key)
+            return value
+
+    def popitem(self, last: bool = True):
+        """Removes and returns the most recently used (key, value) pair, or the least recently used one if `last` is False"""
+        with self._lock:
+            self._remove_expired()
+            if not self._data:
+                raise KeyError("popitem(): cache is empty")
+            key = next(reversed(self._data)) if last else next(iter(self._data))
+            value = self._data[key]
+            self._remove(key)
+            return key, value
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            if key in self._data and not self._is_expired(key):
+                return self[key]
+            self.set(key, default)
+            return default
 
     def clear(self):
-        super().clear()
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._expiries.clear()
+            self.currentbytes = 0
+
+    def get_many(self, keys, default=None) -> list:
+        with self._lock:
+            return [self.get(key, default) for key in keys]
+
+    def set_many(self, mapping) -> None:
+        with self._lock:
+            for key, value in mapping.items():
+                self.set(key, value)
+
+    def stats(self) -> dict:
+        """
+        Returns the usage statistics of the cache
+
+        i.e {"entries": 12, "bytes": 3104, "hits": 40, "misses": 12, "evictions": 0, "expirations": 0}
+        """
+        with self._lock:
+            return {
+                "entries": len(self),
+                "bytes": self.currentbytes if self.maxbytes is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
 
 
 def timed_lru_cache(seconds: int, maxsize: int = 128):
@@ -0,0 +1,247 @@
+"""
+Translating the text nodes of HTML documents
+"""
+
+from collections import OrderedDict
+from html import escape, unescape
+from html.parser import HTMLParser
+from multiprocessing.pool import ThreadPool
+from typing import Iterator
+
+from bs4.element import PageElement, PreformattedString
+
+from translatepy.exceptions import DeadlineExceeded
+from translatepy.utils.annotations import List
+from translatepy.utils.deadline import bind_deadline
+from translatepy.utils.sanitize import remove_spaces
+
+
+def collect_text_nodes(page: PageElement) -> OrderedDict:
+    """
+    Returns the translatable text nodes of the given page, grouped by their text (without the surrounding whitespaces)
+
+    i.e OrderedDict([("Add to cart", [<node>, <node>, ...]), ("Checkout", [<node>])])
+    """
+    nodes = OrderedDict()
+    for node in page.find_all(string=True, recursive=True):
+        if isinstance(node, PreformattedString):
+            continue
+        text = node.strip()
+        if remove_spaces(text) == "":
+            continue
+        nodes.setdefault(text, []).append(node)
+    return nodes
+
+
+def with_whitespaces(original: str, text: str) -> str:
+    """
+    Returns `text` surrounded by the same leading and trailing whitespaces as `original`
+    """
+    stripped = original.strip()
+    if not stripped:
+        return text
+    start = original.find(stripped)
+    return original[:start] + text + original[start + len(stripped):]
+
+
+def translate_texts(texts: List[str], translate_batch, pack_batches, threads_limit: int = 100) -> dict:
+    """
+    Translates the given unique texts and returns a {text: translation} dictionary
+
+    The texts are grouped in batches by `pack_batches(texts)`, which are translated concurrently
+    (with at most `threads_limit` threads) by `translate_batch(texts)`, returning the translations
+    in the same order. The texts of a batch which failed are left out of the result (unless the deadline of the call passed).
+    """
+    batches = pack_batches(list(texts))
+    if not batches:
+        return {}
+
+    def _translate(batch: List[str]):
+        try:
+            return translate_batch(batch)
+        except DeadlineExceeded:
+            raise
+        except Exception:  # ignore if it couldn't find any result or an error occured
+            return None
+
+    if len(batches) == 1:
+        translations = [_translate(batches[0])]
+    else:
+        with ThreadPool(max(min(int(threads_limit), len(batches)), 1)) as pool:
+            translations = pool.map(bind_deadline(_translate), batches)
+
+    results = {}
+    for batch, batch_translations in zip(batches, translations):
+        if batch_translations is not None:
+            results.update(zip(batch, batch_translations))
+    return results
+
+
+def translate_text_nodes(page: PageElement, translate_batch, pack_batches, threads_limit: int = 100) -> None:
+    """
+    Translates the text nodes of the given page in place
+
+    Each unique text is only translated once (refer to `translate_texts`), and the nodes which
+    could not be translated are left untouched.
+    """
+    nodes = collect_text_nodes(page)
+    translations = translate_texts(list(nodes), translate_batch, pack_batches, threads_limit=threads_limit)
+
+    # the tree is only modified from this thread
+    for text, translation in translations.items():
+        for node in nodes[text]:
+            node.replace_with(with_whitespaces(str(node), translation))
+
+
+class _StreamingParser(HTMLParser):
+    """
+    An incremental HTML tokenizer, keeping the markup as is and separating the text runs
+
+    The tokens are stored in `tokens`, either as a raw markup string or as a list containing the raw text run.
+    """
+
+    # The elements which content should not be translated
+    RAW_TEXT_ELEMENTS = {"script", "style", "pre", "code", "textarea"}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.tokens = []
+        self.text_runs = 0
+        self._text = []
+        self._raw_depth = 0
+
+    def _flush_text(self) -> None:
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text = []
+        if self._raw_depth or remove_spaces(unescape(text)) == "":
+            self.tokens.append(text)
+        else:
+            self.tokens.append([text])
+            self.text_runs += 1
+
+    def _markup(self, markup: str) -> None:
+        self._flush_text()
+        self.tokens.append(markup)
+
+    def take(self, text_runs: int = None) -> list:
+        """
+        Returns the complete tokens parsed so far (the current text run might still continue) and forgets them
+
+        If `text_runs` is given, only the tokens up to the `text_runs`-th text run are returned.
+        """
+        end = len(self.tokens)
+        if text_runs is not None and self.text_runs > text_runs:
+            count = 0
+            for index, token in enumerate(self.tokens):
+                if isinstance(token, list):
+                    count += 1
+                    if count == text_runs:
+                        end = index + 1
+                        break
+        tokens, self.tokens = self.tokens[:end], self.tokens[end:]
+        self.text_runs -= sum(1 for token in tokens if isinstance(token, list))
+        return tokens
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+
+    def handle_starttag(self, tag, attrs):
+        self._markup(self.get_starttag_text())
+        if tag in self.RAW_TEXT_ELEMENTS:
+            self._raw_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._markup(self.get_starttag_text())
+
+    def parse_endtag(self, i):
+        # `HTMLParser` only gives the lowercased tag name to `handle_endtag`: the position is kept to pass the end tag through as is
+        self._endtag_start = i
+        try:
+            return super().parse_endtag(i)
+        finally:
+            self._endtag_start = None
+
+    def handle_endtag(self, tag):
+        start = getattr(self, "_endtag_start", None)
+        end = -1 if start is None else self.rawdata.find(">", start)
+        self._markup(self.rawdata[start:end + 1] if end >= 0 else "</{tag}>".format(tag=tag))
+        if tag in self.RAW_TEXT_ELEMENTS and self._raw_depth:
+            self._raw_depth -= 1
+
+    def handle_data(self, data):
+        self._text.append(data)
+
+    def handle_entityref(self, name):
+        self._text.append("&{name};".format(name=name))
+
+    def handle_charref(self, name):
+        self._text.append("&#{name};".format(name=name))
+
+    def handle_comment(self, data):
+        self._markup("<!--{data}-->".format(data=data))
+
+    def handle_decl(self, decl):
+        self._markup("<!{decl}>".format(decl=decl))
+
+    def handle_pi(self, data):
+        self._markup("<?{data}>".format(data=data))
+
+    def unknown_decl(self, data):
+        self._markup("<![{data}]>".format(data=data))
+
+
+def _iter_chunks(html, chunk_size: int) -> Iterator[str]:
+    if isinstance(html, bytes):
+        html = html.decode("utf-8")
+    if isinstance(html, str):
+        for index in range(0, len(html), chunk_size):
+            yield html[index:index + chunk_size]
+    elif hasattr(html, "read"):  # file-like object
+        while True:
+            chunk = html.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+    else:
+        for chunk in html:
+            yield chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+
+
+def stream_translate_html(html, translate_batch, pack_batches, window_size: int = 100, chunk_size: int = 65536, threads_limit: int = 100) -> Iterator[str]:
+    """
+    Translates the given HTML incrementally, yielding the translated HTML chunks
+
+    `html` can be a string, a file-like object or an iterable of strings. It is tokenized `chunk_size`
+    characters at a time, and the text runs are translated by windows of `window_size` runs
+    (refer to `translate_texts`), so that the memory usage does not grow with the size of the document.
+    The markup is kept as is and the content of the <script>, <style>, <pre>, <code> and <textarea> elements is not translated.
+    """
+    parser = _StreamingParser()
+    window_size = max(int(window_size), 1)
+
+    def _translate_window(tokens: list) -> str:
+        texts = OrderedDict()
+        for token in tokens:
+            if isinstance(token, list):
+                texts[unescape(token[0]).strip()] = None
+        translations = translate_texts(list(texts), translate_batch, pack_batches, threads_limit=threads_limit)
+        result = []
+        for token in tokens:
+            if isinstance(token, list):
+                raw = token[0]
+                translation = translations.get(unescape(raw).strip())
+                token = raw if translation is None else with_whitespaces(raw, escape(translation, quote=False))
+            result.append(token)
+        return "".join(result)
+
+    for chunk in _iter_chunks(html, int(chunk_size)):
+        parser.feed(chunk)
+        while parser.text_runs >= window_size:
+            yield _translate_window(parser.take(window_size))
+    parser.close()
+    result = _translate_window(parser.take())
+    if result:
+        yield result
@@ -1,17 +1,46 @@
+import asyncio
 from copy import copy
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 from json import loads
-from time import time
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep, time
 from typing import List, Union
+from urllib.parse import urlencode, urlparse
 
 import pyuseragents
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import cookiejar_from_dict, get_cookie_header
 from requests.models import CaseInsensitiveDict
-from translatepy.exceptions import RequestStatusError
+from requests.utils import get_encoding_from_headers
+from translatepy.exceptions import DeadlineExceeded, RequestStatusError
+from translatepy.utils.deadline import bind_deadline, check_deadline, remaining_time
 from translatepy.utils.lru_cacher import LRUDictCache
 
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, only used by AsyncRequest
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency, only used by HTTP2Transport
+    httpx = None
+
 
 class Response():
     def __init__(self, request_obj: requests.Response) -> None:
+        """
+        A wrapper around `requests.Response`
+
+        The fields which need to be computed (i.e `apparent_encoding`, which runs a charset detection,
+        or `links`, which parses the headers) are only computed when they are read.
+        """
+        self._response = request_obj
+
         #: Integer Code of responded HTTP Status, e.g. 404 or 200.
         self.status_code = request_obj.status_code
 
@@ -54,14 +83,37 @@ class Response():
         #: is a response.
         self.request = request_obj.request
 
-        # properties
-        self.content = request_obj.content
-        self.apparent_encoding = request_obj.apparent_encoding
-        self.is_redirect = request_obj.is_redirect
-        self.is_permanent_redirect = request_obj.is_permanent_redirect
-        self.links = request_obj.links
-        self.next = request_obj.next
-        self.ok = request_obj.ok
+    # properties
+
+    @property
+    def content(self) -> bytes:
+        """The content of the response, in bytes"""
+        return self._response.content
+
+    @property
+    def apparent_encoding(self) -> str:
+        """The encoding guessed from the content (slow, as it runs a charset detection)"""
+        return self._response.apparent_encoding
+
+    @property
+    def is_redirect(self) -> bool:
+        return self._response.is_redirect
+
+    @property
+    def is_permanent_redirect(self) -> bool:
+        return self._response.is_permanent_redirect
+
+    @property
+    def links(self) -> dict:
+        return self._response.links
+
+    @property
+    def next(self):
+        return self._response.next
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
 
     @property
     def text(self, encoding="utf-8") -> str:
@@ -71,6 +123,14 @@ class Response():
         except Exception:
             return str(self.content).encode(encoding).decode(encoding)
 
+    def iter_content(self, chunk_size: int = 1, decode_unicode: bool = False):
+        """Iterates over the content of the response, read as it comes with `stream=True`"""
+        return self._response.iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode)
+
+    def close(self) -> None:
+        """Releases the connection of a streamed response"""
+        self._response.close()
+
     def raise_for_status(self):
         """Raise an exception if the status code of the response is less than 400"""
         if self.status_code >= 400:
@@ -80,12 +140,581 @@ class Response():
         return loads(self.text, **kwargs)
 
 
+class TokenBucket():
+    def __init__(self, rate: Union[int, float], capacity: Union[int, float] = 1) -> None:
+        """
+        A thread-safe token bucket, refilled with `rate` tokens per second up to `capacity` tokens
+
+        The tokens are reserved in the order of the calls: a caller which has to wait reserves its token
+        in advance (the balance becomes negative), so that the next callers wait after it.
+
+        Parameters:
+        ----------
+            rate : int | float
+                The number of tokens added each second (i.e the allowed number of requests per second)
+            capacity : int | float
+                The maximum number of tokens (i.e the allowed burst of requests)
+        """
+        if rate <= 0:
+            raise ValueError("The rate of a TokenBucket must be positive")
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1)
+        self._tokens = self.capacity
+        self._last = monotonic()
+        self._lock = Lock()
+
+    def reserve(self, tokens: Union[int, float] = 1, timeout: float = None) -> float:
+        """
+        Reserves the given number of tokens and returns the number of seconds to wait before using them
+
+        If the wait would be `timeout` seconds or more, nothing is reserved and None is returned
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            delay = max(tokens - self._tokens, 0) / self.rate
+            if timeout is not None and delay > 0 and delay >= timeout:
+                return None
+            self._tokens -= tokens
+            return delay
+
+    def acquire(self, tokens: Union[int, float] = 1, timeout: float = None) -> bool:
+        """
+        Blocks until the given number of tokens are available
+
+        Returns False without waiting (or using any token) if they wouldn't be available within `timeout` seconds
+        """
+        delay = self.reserve(tokens, timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            sleep(delay)
+        return True
+
+    async def aacquire(self, tokens: Union[int, float] = 1, timeout: float = None) -> bool:
+        """
+        Asynchronous version of `acquire`, which does not block the event loop
+        """
+        delay = self.reserve(tokens, timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+
+class RateLimiter():
+    def __init__(self, rate: Union[int, float], capacity: Union[int, float] = 1, per_proxy: bool = True) -> None:
+        """
+        The rate limit of a service, with a `TokenBucket` for each proxy (if `per_proxy` is True)
+        or a single one shared by every proxy
+
+        Parameters:
+        ----------
+            rate : int | float
+                The allowed number of requests per second
+            capacity : int | float
+                The allowed burst of requests
+            per_proxy : bool
+                If the limit applies to each proxy separately (i.e when the service limits the requests by IP address)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.per_proxy = bool(per_proxy)
+        self._buckets = {}
+        self._lock = Lock()
+
+    def bucket(self, proxy: str = None) -> TokenBucket:
+        """
+        Returns the token bucket used for the given proxy
+        """
+        key = proxy if self.per_proxy else None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            return bucket
+
+    def acquire(self, proxy: str = None, timeout: float = None) -> bool:
+        """
+        Blocks until a request can be made with the given proxy
+
+        Returns False without waiting if it can't be made within `timeout` seconds (refer to `TokenBucket.acquire`)
+        """
+        return self.bucket(proxy).acquire(timeout=timeout)
+
+    async def aacquire(self, proxy: str = None, timeout: float = None) -> bool:
+        """
+        Asynchronous version of `acquire`
+        """
+        return await self.bucket(proxy).aacquire(timeout=timeout)
+
+
+class ProxyState():
+    def __init__(self, url: str = None) -> None:
+        """
+        The health of a proxy of a `ProxyPool` (None being the direct connection)
+        """
+        self.url = url
+        self.session = None
+        self.in_flight = 0
+        self.requests = 0
+        self.latency = None  # exponentially weighted moving average, in seconds
+        self.error_rate = 0.0  # exponentially weighted moving average
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0
+        self.last_used = 0
+
+    @property
+    def ejected(self) -> bool:
+        return monotonic() < self.ejected_until
+
+    def score(self) -> float:
+        """
+        The expected cost of a request through this proxy (lower is better)
+        """
+        return (self.latency or 0) * (1 + 4 * self.error_rate)
+
+    def as_dict(self) -> dict:
+        return {
+            "proxy": self.url,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "ejected": self.ejected,
+            "ejected_for": max(self.ejected_until - monotonic(), 0) if self.ejected else None
+        }
+
+
+class ProxyPool():
+    # The status codes meaning that the proxy itself (or its IP address) is refused
+    failure_status_codes = {407, 429}
+
+    def __init__(self, proxy_urls: Union[str, List] = None, failure_threshold: int = 3, ejection_time: float = 30, max_ejection_time: float = 300, smoothing: float = 0.3) -> None:
+        """
+        A thread-safe pool of proxies, each one with its own session (and connection pool)
+
+        The least loaded proxy is picked for each request (the one with the fewest requests in flight,
+        then the lowest latency and error rate, then the least recently used one).
+        A proxy failing `failure_threshold` times in a row is ejected for `ejection_time` seconds
+        (doubled on each consecutive ejection, up to `max_ejection_time`), after which it is tried again.
+
+        Parameters:
+        ----------
+            proxy_urls : str | list
+                The URL(s) for the proxies (None for the direct connection)
+            failure_threshold : int
+                The number of consecutive failures ejecting a proxy
+            ejection_time : float
+                The time (in seconds) a proxy is ejected for
+            max_ejection_time : float
+                The maximum time (in seconds) a proxy is ejected for
+            smoothing : float
+                The weight of the last request in the latency and error rate averages
+        """
+        proxies = [proxy_urls] if isinstance(proxy_urls, str) else list(proxy_urls) if proxy_urls is not None else []
+        self.proxies = [ProxyState(url) for url in (proxies or [None])]
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.ejection_time = float(ejection_time)
+        self.max_ejection_time = float(max_ejection_time)
+        self.smoothing = float(smoothing)
+        self._counter = 0
+        self._lock = Lock()
+
+    def attach(self, session: requests.Session) -> None:
+        """
+        Creates the session of each proxy, sharing the headers and the cookies of the given session
+        (which is used as is for the direct connection)
+        """
+        for proxy in self.proxies:
+            if proxy.url is None:
+                proxy.session = session
+                continue
+            proxy.session = requests.Session()
+            proxy.session.headers = session.headers
+            proxy.session.cookies = session.cookies
+            proxy.session.proxies = {"http": proxy.url, "https": proxy.url}
+
+    def acquire(self) -> ProxyState:
+        """
+        Picks the proxy to use for a request, which should then be given back with `release`
+        """
+        with self._lock:
+            if len(self.proxies) == 1:
+                proxy = self.proxies[0]
+            else:
+                now = monotonic()
+                available = [proxy for proxy in self.proxies if proxy.ejected_until <= now]
+                if available:
+                    proxy = min(available, key=lambda proxy: (proxy.in_flight, proxy.score(), proxy.last_used))
+                else:  # every proxy is ejected: the one coming back the soonest is used
+                    proxy = min(self.proxies, key=lambda proxy: proxy.ejected_until)
+            self._counter += 1
+            proxy.last_used = self._counter
+            proxy.in_flight += 1
+            return proxy
+
+    def release(self, proxy: ProxyState, latency: float = None, success: bool = True) -> None:
+        """
+        Gives back the given proxy, recording the outcome of the request made with it (None if it was not sent)
+        """
+        with self._lock:
+            proxy.in_flight -= 1
+            if latency is None:
+                return
+            proxy.requests += 1
+            proxy.latency = latency if proxy.latency is None else proxy.latency + self.smoothing * (latency - proxy.latency)
+            proxy.error_rate += self.smoothing * ((0.0 if success else 1.0) - proxy.error_rate)
+            if success:
+                proxy.consecutive_failures = 0
+                proxy.ejections = 0
+                return
+            proxy.consecutive_failures += 1
+            if proxy.consecutive_failures >= self.failure_threshold and len(self.proxies) > 1:
+                proxy.ejections += 1
+                proxy.ejected_until = monotonic() + min(self.ejection_time * 2 ** (proxy.ejections - 1), self.max_ejection_time)
+                proxy.consecutive_failures = self.failure_threshold - 1  # a single failure ejects it again once it is back
+
+    def stats(self) -> List[dict]:
+        """
+        Returns the health of each proxy
+
+        i.e [{"proxy": "http://proxy1:8080", "in_flight": 2, "requests": 120, "latency": 0.41, "error_rate": 0.02, "ejected": False, "ejected_for": None}, ...]
+        """
+        with self._lock:
+            return [proxy.as_dict() for proxy in self.proxies]
+
+    def close(self) -> None:
+        """
+        Closes the sessions of the proxies
+        """
+        for proxy in self.proxies:
+            if proxy.session is not None:
+                proxy.session.close()
+
+
+class BaseTransport():
+    """
+    The layer sending the requests of a `Request` through a proxy of its pool
+
+    A transport receives the `requests.Session.request` parameters and returns a `requests.Response`.
+    """
+
+    # The exceptions raised by the transport which can be retried (on top of the ones of the retry policy)
+    exceptions = ()
+
+    def send(self, proxy: ProxyState, method: str, url: str, **kwargs) -> requests.Response:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(BaseTransport):
+    """
+    The default HTTP/1.1 transport, using the `requests.Session` (and connection pool) of each proxy
+    """
+
+    def send(self, proxy: ProxyState, method: str, url: str, **kwargs) -> requests.Response:
+        return proxy.session.request(method, url, **kwargs)
+
+
+class HTTP2Transport(BaseTransport):
+    # The connection-specific headers, which are not allowed in HTTP/2
+    HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+
+    def __init__(self, http1: bool = True, max_connections: int = 100, keepalive_expiry: float = 5) -> None:
+        """
+        An HTTP/2 transport using `httpx` (`pip install "httpx[http2]"`)
+
+        Each proxy gets a single `httpx.Client`, which multiplexes the concurrent requests made to a host
+        over a single connection when the server supports HTTP/2 (the other servers are reached with HTTP/1.1).
+        The clients share the headers and the cookies of the sessions of the `Request`.
+
+        Parameters:
+        ----------
+            http1 : bool
+                If HTTP/1.1 is allowed. When False, HTTP/2 is used without negotiation (which also works without TLS).
+            max_connections : int
+                The maximum number of connections of each client
+            keepalive_expiry : float
+                The time (in seconds) an idle connection is kept alive
+        """
+        if httpx is None:
+            raise ImportError("HTTP2Transport needs httpx, which can be installed with: pip install \"httpx[http2]\"")
+        self.http1 = bool(http1)
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections, keepalive_expiry=keepalive_expiry)
+        self.exceptions = (httpx.TransportError,)
+        self._clients = {}
+        self._lock = Lock()
+
+    def _client(self, proxy: ProxyState, verify=True, cert=None):
+        """
+        Internal function returning the `httpx.Client` of the given proxy, created on first use
+
+        httpx only sets the TLS options (`verify` and `cert`) on the clients, so each set of options gets its own client
+        """
+        key = (proxy.url, verify, cert)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                options = {"http1": self.http1, "http2": True, "limits": self.limits, "cookies": proxy.session.cookies, "timeout": None, "verify": verify}
+                if cert is not None:
+                    options["cert"] = cert
+                if proxy.url is not None:
+                    try:
+                        client = httpx.Client(proxy=proxy.url, **options)
+                    except TypeError:  # httpx < 0.26
+                        client = httpx.Client(proxies=proxy.url, **options)
+                else:
+                    client = httpx.Client(**options)
+                self._clients[key] = client
+            return client
+
+    def send(self, proxy: ProxyState, method: str, url: str, params=None, data=None, json=None, headers=None, cookies=None, files=None, auth=None, timeout=None, allow_redirects: bool = True, stream: bool = False, verify=None, cert=None, **kwargs) -> requests.Response:
+        """
+        Sends the request with `httpx`
+
+        The cookies given for a request are added to the cookies of the session.
+        The content of the response is always read, even with `stream=True`.
+        A TypeError is raised for the `requests` parameters which have no `httpx` equivalent (i.e `proxies` or `hooks`),
+        so that switching the transport never silently changes how a request is sent.
+        """
+        if kwargs:
+            raise TypeError("HTTP2Transport does not support the {parameters} parameter(s)".format(parameters=", ".join(sorted(kwargs))))
+        verify = proxy.session.verify if verify is None else verify
+        cert = proxy.session.cert if cert is None else cert
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        _headers = {}
+        for key, value in list(proxy.session.headers.items()) + list((headers or {}).items()):
+            if value is None:
+                _headers.pop(key.lower(), None)
+            elif key.lower() not in self.HOP_BY_HOP_HEADERS:
+                _headers[key.lower()] = value
+        if cookies:
+            proxy.session.cookies.update(cookies)
+
+        if isinstance(params, dict):  # the values are converted like `requests` does (i.e True --> "True")
+            params = _to_pairs(params)
+
+        options = {}
+        if isinstance(data, (str, bytes)):
+            options["content"] = data
+        elif isinstance(data, dict) and data:
+            options["content"] = urlencode(_to_pairs(data))
+            _headers.setdefault("content-type", "application/x-www-form-urlencoded")
+        elif data:
+            options["data"] = data
+        if json is not None:
+            options["json"] = json
+        if files is not None:
+            options["files"] = files
+        if auth is not None:
+            options["auth"] = tuple(auth) if isinstance(auth, list) else auth
+
+        httpx_response = self._client(proxy, verify=verify, cert=cert).request(method, url, params=params, headers=_headers, timeout=timeout, follow_redirects=allow_redirects, **options)
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.url = str(httpx_response.url)
+        response.reason = httpx_response.reason_phrase
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.cookies = cookiejar_from_dict(dict(httpx_response.cookies))
+        response.elapsed = httpx_response.elapsed
+        response.http_version = httpx_response.http_version
+        response._content = httpx_response.content
+        response._content_consumed = True
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients = {}
+
+
+class Retry(Exception):
+    def __init__(self, exception: Exception = None, response: Response = None, backoff: bool = True) -> None:
+        """
+        Raised by a function run by `RetryPolicy.run` to ask for another attempt
+
+        Parameters:
+        ----------
+            exception : Exception
+                The exception raised if no attempt is left
+            response : Response
+                The response which failed, used for its `Retry-After` header (and returned if no attempt is left and `exception` is None)
+            backoff : bool
+                If the next attempt should wait (i.e False after refreshing an expired token)
+        """
+        super().__init__(exception)
+        self.exception = exception
+        self.response = response
+        self.backoff = backoff
+
+
+class RetryPolicy():
+    def __init__(self,
+                 total: int = 2,
+                 backoff_factor: float = 0.5,
+                 backoff_max: float = 10,
+                 jitter: float = 0.5,
+                 status_forcelist: set = frozenset({500, 502, 503, 504}),
+                 respect_retry_after: bool = True,
+                 deadline: float = None,
+                 exceptions: tuple = (requests.ConnectionError, requests.Timeout)) -> None:
+        """
+        A declarative retry policy, with exponential backoff and jitter
+
+        Parameters:
+        ----------
+            total : int
+                The maximum number of retries (0 to disable them)
+            backoff_factor : float
+                The wait before the n-th retry is `backoff_factor * 2 ** (n - 1)` seconds
+            backoff_max : float
+                The maximum wait between two attempts. A `Retry-After` header asking for a longer wait stops the retries.
+            jitter : float
+                The randomized part of the backoff (between 0 and 1), so that the concurrent clients do not retry at the same time
+            status_forcelist : set
+                The HTTP status codes which are retried.
+                The rate limited requests (429) are not retried by default, so that their circuit breaker opens right away.
+            respect_retry_after : bool
+                If the `Retry-After` header of the responses should be used as the wait
+            deadline : float
+                The maximum number of seconds spent on a call, retries included (no retry is made if it would end after it).
+                The deadline of the current thread is also respected (refer to `translatepy.utils.deadline`).
+            exceptions : tuple
+                The exceptions raised while sending a request which are retried
+        """
+        self.total = max(int(total), 0)
+        self.backoff_factor = float(backoff_factor)
+        self.backoff_max = float(backoff_max)
+        self.jitter = min(max(float(jitter), 0), 1)
+        self.status_forcelist = frozenset(status_forcelist)
+        self.respect_retry_after = bool(respect_retry_after)
+        self.deadline = deadline
+        self.exceptions = tuple(exceptions)
+
+    def is_retryable(self, status_code: int) -> bool:
+        """
+        If a response with the given status code should be retried
+        """
+        return status_code in self.status_forcelist
+
+    @staticmethod
+    def retry_after(response: Response) -> float:
+        """
+        Returns the number of seconds asked by the `Retry-After` header of the given response, or None
+
+        i.e "Retry-After: 120" or "Retry-After: Fri, 31 Dec 2021 23:59:59 GMT"
+        """
+        value = getattr(response, "headers", None) and response.headers.get("Retry-After")
+        if not value:
+            return None
+        value = str(value).strip()
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the wait before the given retry (starting at 0), with its jitter
+        """
+        backoff = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return backoff * (1 - self.jitter) + uniform(0, backoff * self.jitter)
+
+    def _next_delay(self, retry: Retry, attempt: int, start: float, deadline: float) -> float:
+        """Internal function returning the wait before the next attempt, or None if no retry should be made"""
+        if attempt >= self.total:
+            return None
+        delay = self.backoff(attempt) if retry.backoff else 0
+        if self.respect_retry_after and retry.response is not None:
+            retry_after = self.retry_after(retry.response)
+            if retry_after is not None:
+                if retry_after > self.backoff_max:
+                    return None
+                delay = max(delay, retry_after)
+        deadline = self.deadline if deadline is None else deadline
+        if deadline is not None and monotonic() + delay - start >= deadline:
+            return None
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+    @staticmethod
+    def _give_up(retry: Retry):
+        """Internal function returning the response or raising the exception of the last attempt"""
+        if retry.exception is None:
+            return retry.response
+        raise retry.exception
+
+    def run(self, func, deadline: float = None):
+        """
+        Calls `func` without any argument, and calls it again while it raises `Retry` and the policy allows it
+
+        Parameters:
+        ----------
+            func : callable
+                The attempt
+            deadline : float
+                Overrides the deadline of the policy for this call
+
+        Returns:
+        --------
+            Any:
+                The result of `func`, or the response of the last `Retry` if no attempt is left
+        """
+        start = monotonic()
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Retry as retry:
+                delay = self._next_delay(retry, attempt, start, deadline)
+                if delay is None:
+                    return self._give_up(retry)
+            if delay > 0:
+                sleep(delay)
+            attempt += 1
+
+    async def arun(self, func, deadline: float = None):
+        """
+        Asynchronous version of `run`, where `func` returns a coroutine
+        """
+        start = monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await func()
+            except Retry as retry:
+                delay = self._next_delay(retry, attempt, start, deadline)
+                if delay is None:
+                    return self._give_up(retry)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+
 class Request():
-    def __init__(self, proxy_urls: Union[str, List] = None, cache_duration: Union[int, float] = 2):
+    def __init__(self, proxy_urls: Union[str, List] = None, cache_duration: Union[int, float] = 2, rate_limits: dict = None, retry_policy: RetryPolicy = None, proxy_pool: ProxyPool = None, pool_connections: int = 10, pool_maxsize: int = 10, transport: BaseTransport = None):
         """
         translatepy's version of `requests.Session`
 
-        It includes caching, headers management and proxy management
+        It includes caching, headers management, proxy management, rate limiting and retries
 
         Parameters:
         ----------
@@ -93,6 +722,21 @@ class Request():
                 The URL(s) for the proxies to be used (they will be used as HTTP and HTTPS proxies)
             cache_duration : int | float
                 The duration of the cache for GET requests
+            rate_limits : dict
+                The allowed number of requests per second for each host, applied to each proxy separately
+                i.e {"www2.deepl.com": 1 / 3}
+            retry_policy : RetryPolicy
+                The policy used to retry the failed requests (`RetryPolicy()` by default, `RetryPolicy(total=0)` to disable the retries)
+            proxy_pool : ProxyPool
+                The pool of proxies to use, to configure their health checks (`ProxyPool(proxy_urls)` by default)
+            pool_connections : int
+                The number of hosts (for each proxy) which keep their connections alive
+            pool_maxsize : int
+                The number of connections kept alive for each host, which should match the number of concurrent requests
+                (`Translate` grows it to its number of workers in fast and hedged modes, refer to `resize_pool`)
+            transport : BaseTransport
+                The transport sending the requests (`RequestsTransport()`, using HTTP/1.1, by default).
+                `HTTP2Transport()` multiplexes the concurrent requests made to a host over a single connection.
 
         Returns:
         --------
@@ -121,20 +765,178 @@ class Request():
 
         self.headers = HEADERS
 
-        self._proxies_index = 0
-        self.proxies = ([proxy_urls] if isinstance(proxy_urls, str) else list(proxy_urls) if proxy_urls is not None else [])
-        if len(self.proxies) == 0:
-            self.proxies = [None]
+        self.proxy_pool = ProxyPool(proxy_urls) if proxy_pool is None else proxy_pool
+        self.proxy_pool.attach(self.session)
+        self.proxies = [proxy.url for proxy in self.proxy_pool.proxies]
 
-    def _set_session_proxies(self, url: str = None):
-        """Internal function to set the proxies"""
-        if url is not None:
-            self.session.proxies.update({
-                "http": url,
-                "https": url
-            })
+        self.pool_connections = int(pool_connections)
+        self.pool_maxsize = int(pool_maxsize)
+        self._pool_lock = Lock()
+        self._mount_adapters()
 
-    def post(self, url: str, **kwargs) -> Response:
+        self.transport = RequestsTransport() if transport is None else transport
+
+        self.rate_limits = {}
+        for host, rate in (rate_limits or {}).items():
+            self.set_rate_limit(host, rate)
+
+        self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+
+    def set_rate_limit(self, host: str, rate: Union[int, float], capacity: Union[int, float] = 1, per_proxy: bool = True, override: bool = True) -> RateLimiter:
+        """
+        Limits the number of requests made to the given host
+
+        Parameters:
+        ----------
+            host : str
+                The host (i.e "www2.deepl.com") of the service
+            rate : int | float
+                The allowed number of requests per second. The limit is removed if None.
+            capacity : int | float
+                The allowed burst of requests
+            per_proxy : bool
+                If the limit applies to each proxy separately
+            override : bool
+                If an existing limit should be replaced (translators use False to set their default limit
+                without overriding the one set by the user)
+
+        Returns:
+        --------
+            RateLimiter:
+                The rate limiter used for the host
+        """
+        host = str(host).lower()
+        if not override and host in self.rate_limits:
+            return self.rate_limits[host]
+        if rate is None:
+            return self.rate_limits.pop(host, None)
+        limiter = self.rate_limits[host] = RateLimiter(rate, capacity=capacity, per_proxy=per_proxy)
+        return limiter
+
+    def _mount_adapters(self) -> None:
+        """Internal function to mount the connection pools with the current sizes on every session"""
+        for proxy in self.proxy_pool.proxies:
+            adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+            proxy.session.mount("https://", adapter)
+            proxy.session.mount("http://", adapter)
+
+    def resize_pool(self, maxsize: int) -> None:
+        """
+        Grows the number of connections kept alive for each host to `maxsize` (it is never shrunk)
+
+        The adapters are grown in place, so that the connections currently kept alive
+        (i.e by the other users of a shared `Request`) are not dropped.
+        """
+        with self._pool_lock:
+            if int(maxsize) <= self.pool_maxsize:
+                return
+            self.pool_maxsize = int(maxsize)
+            for proxy in self.proxy_pool.proxies:
+                for adapter in {id(adapter): adapter for adapter in proxy.session.adapters.values()}.values():  # mounted for both schemes
+                    if isinstance(adapter, HTTPAdapter):
+                        self._grow_adapter(adapter, self.pool_maxsize)
+
+    @staticmethod
+    def _grow_adapter(adapter: HTTPAdapter, maxsize: int) -> None:
+        """
+        Internal function growing the connection pools of the given adapter, and the ones it will create, to `maxsize`
+
+        The pool managers find their pools with a key including their size, so the existing pools are moved to their new key.
+        """
+        adapter._pool_maxsize = maxsize
+        for manager in [adapter.poolmanager] + list(adapter.proxy_manager.values()):
+            manager.connection_pool_kw["maxsize"] = maxsize
+            with manager.pools.lock:
+                for key, pool in list(manager.pools._container.items()):
+                    with pool.pool.mutex:
+                        room = max(maxsize - pool.pool.maxsize, 0)
+                        pool.pool.maxsize = maxsize
+                        # the empty slots are put under the connections kept alive, which are reused first
+                        pool.pool.queue[:0] = [None] * room
+                        pool.pool.not_empty.notify(room)
+                    del manager.pools._container[key]  # without closing the pool
+                    manager.pools._container[key._replace(key_maxsize=maxsize)] = pool
+
+    def rate_limiter(self, url: str) -> RateLimiter:
+        """
+        Returns the rate limiter used for the given URL, or None if its host is not limited
+        """
+        if not self.rate_limits:
+            return None
+        return self.rate_limits.get(urlparse(url).netloc.lower())
+
+    def _send(self, method: str, url: str, retry: RetryPolicy = None, **kwargs) -> Response:
+        """
+        Internal function to make a request, retried according to the retry policy
+
+        The timeout of each attempt is limited to the time left before the deadline of the current thread.
+        """
+        policy = self.retry_policy if retry is None else retry
+        timeout = kwargs.pop("timeout", None)
+
+        def attempt():
+            proxy = self.proxy_pool.acquire()
+            latency, success = None, False
+            try:
+                limiter = self.rate_limiter(url)
+                # the token is not taken if the request could only be made after the deadline
+                if limiter is not None and not limiter.acquire(proxy.url, timeout=remaining_time()):
+                    raise DeadlineExceeded("The rate limit of {url} does not allow a request before the deadline".format(url=url))
+                check_deadline()
+                remaining = remaining_time()
+                attempt_timeout = timeout if remaining is None else (remaining if timeout is None else min(timeout, remaining))
+                start = monotonic()
+                try:
+                    request = self.transport.send(proxy, method, url, timeout=attempt_timeout, **kwargs)
+                except policy.exceptions + self.transport.exceptions as exception:
+                    latency = monotonic() - start
+                    if remaining is not None and remaining_time() <= 0:
+                        raise DeadlineExceeded("The deadline passed while waiting for {url}".format(url=url)) from exception
+                    raise Retry(exception)
+                latency = monotonic() - start
+                success = request.status_code not in self.proxy_pool.failure_status_codes
+            finally:
+                self.proxy_pool.release(proxy, latency, success)
+            result = Response(request)
+            if not kwargs.get("stream", False):  # the streamed content is read (and the connection released) by the caller
+                request.close()
+            if policy.is_retryable(result.status_code):
+                if kwargs.get("stream", False):  # the content is kept, in case this is the last attempt, and the connection released
+                    result.content
+                    result.close()
+                raise Retry(response=result)
+            return result
+
+        return policy.run(attempt)
+
+    def single_attempt(self, method: str, url: str, **kwargs) -> Response:
+        """
+        Makes a request without retrying it, for the translators retrying with their own `retry_policy.run` loop
+
+        The retries then only happen at one layer: the responses with a retryable status code are returned
+        for the translator to decide, and a failed connection raises `Retry` so that the loop tries again.
+
+        Parameters:
+        ----------
+            method : str
+                The HTTP method (i.e "POST")
+            url : str
+                The URL to send the request to
+            **kwargs : parameters
+                This is the options that will be passed to requests.Session.request
+
+        Returns:
+        --------
+            Response:
+                The response for the request
+        """
+        policy = RetryPolicy(total=0, exceptions=self.retry_policy.exceptions)
+        try:
+            return self._send(method, url, retry=policy, **kwargs)
+        except policy.exceptions + self.transport.exceptions as exception:
+            raise Retry(exception)
+
+    def post(self, url: str, retry: RetryPolicy = None, **kwargs) -> Response:
         """
         Makes a POST request with the given URL
 
@@ -142,6 +944,8 @@ class Request():
         ----------
             url : str
                 The URL to send a POST request to
+            retry : RetryPolicy
+                Overrides the retry policy for this request
             **kwargs : parameters
                 This is the options that will be passed to requests.Session.post
 
@@ -150,17 +954,9 @@ class Request():
             Response:
                 The response for the request
         """
-        self._set_session_proxies(self.proxies[self._proxies_index])
-        request = self.session.post(url, **kwargs)
-        result = Response(request)
-        request.close()
-        if self._proxies_index != len(self.proxies) - 1:
-            self._proxies_index += 1
-        else:
-            self._proxies_index = 0
-        return result
+        return self._send("POST", url, retry=retry, **kwargs)
 
-    def get(self, url: str, **kwargs) -> Response:
+    def get(self, url: str, retry: RetryPolicy = None, **kwargs) -> Response:
         """
         Makes a GET request with the given URL
 
@@ -168,6 +964,8 @@ class Request():
         ----------
             url : str
                 The URL to send a GET request to
+            retry : RetryPolicy
+                Overrides the retry policy for this request
             **kwargs : parameters
                 This is the options that will be passed to requests.Session.get
 
@@ -179,14 +977,7 @@ class Request():
         _cache_key = str(url) + str(kwargs)
         if _cache_key in self.GETCACHE and time() - self.GETCACHE[_cache_key]["timestamp"] < self.cache_duration:
             return self.GETCACHE[_cache_key]["response"]
-        self._set_session_proxies(self.proxies[self._proxies_index])
-        request = self.session.get(url, **kwargs)
-        result = Response(request)
-        request.close()
-        if self._proxies_index != len(self.proxies) - 1:
-            self._proxies_index += 1
-        else:
-            self._proxies_index = 0
+        result = self._send("GET", url, retry=retry, **kwargs)
         self.GETCACHE[_cache_key] = {
             "timestamp": time(),
             "response": copy(result)
@@ -211,5 +1002,310 @@ class Request():
                 self.session.headers.update(header_key_value)
 
     def __del__(self):
-        """Closing the session"""
+        """Closing the sessions"""
         self.session.close()
+        self.proxy_pool.close()
+        self.transport.close()
+
+
+_default_request = None
+_default_request_lock = Lock()
+
+
+def default_request() -> Request:
+    """
+    Returns the `Request` shared by the translators and `Translate` instances created without one,
+    so that they reuse the same connections (it is created on first use)
+    """
+    global _default_request
+    with _default_request_lock:
+        if _default_request is None:
+            _default_request = Request()
+        return _default_request
+
+
+def _to_pairs(mapping) -> list:
+    """Internal function to convert a `requests` style mapping (with list values) to a list of (key, str) pairs"""
+    pairs = []
+    for key, value in mapping.items():
+        for element in (value if isinstance(value, (list, tuple)) else [value]):
+            if element is not None:
+                pairs.append((str(key), element if isinstance(element, (str, bytes)) else str(element)))
+    return pairs
+
+
+class AsyncRequest():
+    def __init__(self, proxy_urls: Union[str, List] = None, cache_duration: Union[int, float] = 2, request: Request = None):
+        """
+        translatepy's asynchronous version of `Request`
+
+        It includes the same caching, headers, cookies and proxy management (sharing the cookie jar of `Request`) and uses `aiohttp`
+        to make the requests. If `aiohttp` is not installed, the requests are made by `Request`
+        in the event loop default executor.
+
+        Parameters:
+        ----------
+            proxy_urls : str | list
+                The URL(s) for the proxies to be used (they will be used as HTTP and HTTPS proxies)
+            cache_duration : int | float
+                The duration of the cache for GET requests
+            request : Request
+                An existing `Request` to share the headers, proxies and cache with.
+                A new one is created with `proxy_urls` and `cache_duration` if not provided.
+        """
+        if request is None:
+            request = Request(proxy_urls=proxy_urls, cache_duration=cache_duration)
+        self.request = request
+
+        self._session = None
+        self._session_loop = None
+
+    @property
+    def headers(self) -> CaseInsensitiveDict:
+        """The headers set for the session"""
+        return self.request.headers
+
+    @headers.setter
+    def headers(self, header_key_value: dict):
+        """Setter for the headers"""
+        self.request.headers = header_key_value
+
+    @property
+    def proxies(self) -> list:
+        """The proxies used to make the requests"""
+        return self.request.proxies
+
+    @property
+    def GETCACHE(self) -> LRUDictCache:
+        """The cache for GET requests"""
+        return self.request.GETCACHE
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The policy used to retry the failed requests"""
+        return self.request.retry_policy
+
+    @property
+    def rate_limits(self) -> dict:
+        """The rate limiters for each host (refer to `Request.set_rate_limit`)"""
+        return self.request.rate_limits
+
+    def set_rate_limit(self, host: str, rate: Union[int, float], capacity: Union[int, float] = 1, per_proxy: bool = True, override: bool = True) -> RateLimiter:
+        """Limits the number of requests made to the given host (refer to `Request.set_rate_limit`)"""
+        return self.request.set_rate_limit(host, rate, capacity=capacity, per_proxy=per_proxy, override=override)
+
+    @property
+    def cache_duration(self) -> float:
+        """The duration of the cache for GET requests"""
+        return self.request.cache_duration
+
+    async def _get_session(self):
+        """Internal function to get the `aiohttp.ClientSession`, bound to the current event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            await self._close_stale_session()
+            # the cookies are kept in the `Request` cookie jar, shared with the synchronous requests
+            self._session = aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar())
+            self._session_loop = loop
+        return self._session
+
+    async def _close_stale_session(self) -> None:
+        """Internal function closing the session created for another event loop, which its connections belong to"""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        if session is None or session.closed:
+            return
+        if loop.is_closed():  # there is nothing left to wait for on the closed loop
+            await session.close()
+        elif loop.is_running():  # in another thread
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, loop.run_until_complete, session.close())
+
+    def _cookie_header(self, method: str, url: str, cookies=None) -> str:
+        """
+        Internal function returning the Cookie header of a request, built from the `Request` cookie jar
+        and the cookies given for this request only (like `requests` does)
+        """
+        jar = self.request.session.cookies
+        if cookies:
+            jar = jar.copy()
+            jar.update(cookies)
+        return get_cookie_header(jar, requests.Request(method, url))
+
+    def _store_cookies(self, url: str, aiohttp_response) -> None:
+        """Internal function adding the cookies set by a response to the `Request` cookie jar"""
+        host = urlparse(url).hostname
+        for name, morsel in aiohttp_response.cookies.items():
+            self.request.session.cookies.set(name, morsel.value, domain=morsel["domain"] or host, path=morsel["path"] or "/")
+
+    async def _send(self, method: str, url: str, retry: RetryPolicy = None, **kwargs) -> Response:
+        """
+        Internal function to make a request with `aiohttp`, retried according to the retry policy
+
+        The timeout of each attempt is limited to the time left before the deadline of the current task.
+        """
+        headers = dict(self.headers)
+        for key, value in (kwargs.pop("headers", None) or {}).items():
+            if value is None:
+                headers.pop(key, None)
+            else:
+                headers[key] = value
+
+        params = kwargs.pop("params", None)
+        if isinstance(params, dict):
+            params = _to_pairs(params)
+
+        data = kwargs.pop("data", None)
+        if isinstance(data, dict):
+            data = _to_pairs(data)
+            if not data:
+                data = None
+
+        cookies = kwargs.pop("cookies", None)
+        set_cookie_header = not any(key.lower() == "cookie" for key in headers)
+
+        timeout = kwargs.pop("timeout", None)
+
+        policy = self.retry_policy if retry is None else retry
+        exceptions = policy.exceptions + (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+        async def attempt():
+            proxy = self.request.proxy_pool.acquire()
+            latency, success = None, False
+            try:
+                limiter = self.request.rate_limiter(url)
+                if limiter is not None and not await limiter.aacquire(proxy.url, timeout=remaining_time()):
+                    raise DeadlineExceeded("The rate limit of {url} does not allow a request before the deadline".format(url=url))
+
+                request_headers = headers
+                if set_cookie_header:
+                    cookie_header = self._cookie_header(method, url, cookies)
+                    if cookie_header:
+                        request_headers = dict(headers, Cookie=cookie_header)
+
+                check_deadline()
+                remaining = remaining_time()
+                attempt_timeout = timeout if remaining is None else (remaining if timeout is None else min(timeout, remaining))
+                if attempt_timeout is not None:
+                    kwargs["timeout"] = aiohttp.ClientTimeout(total=attempt_timeout)
+                start = time()
+                try:
+                    session = await self._get_session()
+                    async with session.request(method, url, headers=request_headers, params=params, data=data, proxy=proxy.url, **kwargs) as aiohttp_response:
+                        content = await aiohttp_response.read()
+                        self._store_cookies(url, aiohttp_response)
+                        response = requests.Response()
+                        response.status_code = aiohttp_response.status
+                        response.headers = CaseInsensitiveDict(aiohttp_response.headers)
+                        response.url = str(aiohttp_response.url)
+                        response.reason = aiohttp_response.reason
+                        response.encoding = get_encoding_from_headers(response.headers)
+                        response.cookies = cookiejar_from_dict({key: morsel.value for key, morsel in aiohttp_response.cookies.items()})
+                        response.elapsed = timedelta(seconds=time() - start)
+                        response._content = content
+                except exceptions as exception:
+                    latency = time() - start
+                    if remaining is not None and remaining_time() <= 0:
+                        raise DeadlineExceeded("The deadline passed while waiting for {url}".format(url=url)) from exception
+                    raise Retry(exception)
+                latency = time() - start
+                success = response.status_code not in self.request.proxy_pool.failure_status_codes
+            finally:
+                self.request.proxy_pool.release(proxy, latency, success)
+            result = Response(response)
+            if policy.is_retryable(result.status_code):
+                raise Retry(response=result)
+            return result
+
+        return await policy.arun(attempt)
+
+    async def single_attempt(self, method: str, url: str, **kwargs) -> Response:
+        """
+        Asynchronous version of `Request.single_attempt`, for the translators retrying with their own `retry_policy.arun` loop
+
+        Parameters:
+        ----------
+            method : str
+                The HTTP method (i.e "POST")
+            url : str
+                The URL to send the request to
+            **kwargs : parameters
+                This is the options that will be passed to the request (`requests.Session.request` style)
+
+        Returns:
+        --------
+            Response:
+                The response for the request
+        """
+        if aiohttp is None:
+            return await asyncio.get_running_loop().run_in_executor(None, bind_deadline(partial(self.request.single_attempt, method, url, **kwargs)))
+        policy = RetryPolicy(total=0, exceptions=self.retry_policy.exceptions)
+        try:
+            return await self._send(method, url, retry=policy, **kwargs)
+        except policy.exceptions + (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exception:
+            raise Retry(exception)
+
+    async def post(self, url: str, retry: RetryPolicy = None, **kwargs) -> Response:
+        """
+        Makes a POST request with the given URL
+
+        Parameters:
+        ----------
+            url : str
+                The URL to send a POST request to
+            retry : RetryPolicy
+                Overrides the retry policy for this request
+            **kwargs : parameters
+                This is the options that will be passed to the request (`requests.Session.post` style)
+
+        Returns:
+        --------
+            Response:
+                The response for the request
+        """
+        if aiohttp is None:
+            return await asyncio.get_running_loop().run_in_executor(None, bind_deadline(partial(self.request.post, url, retry=retry, **kwargs)))
+        return await self._send("POST", url, retry=retry, **kwargs)
+
+    async def get(self, url: str, retry: RetryPolicy = None, **kwargs) -> Response:
+        """
+        Makes a GET request with the given URL
+
+        Parameters:
+        ----------
+            url : str
+                The URL to send a GET request to
+            retry : RetryPolicy
+                Overrides the retry policy for this request
+            **kwargs : parameters
+                This is the options that will be passed to the request (`requests.Session.get` style)
+
+        Returns:
+        --------
+            Response:
+                The response for the request
+        """
+        if aiohttp is None:
+            return await asyncio.get_running_loop().run_in_executor(None, bind_deadline(partial(self.request.get, url, retry=retry, **kwargs)))
+        _cache_key = str(url) + str(kwargs)
+        if _cache_key in self.GETCACHE and time() - self.GETCACHE[_cache_key]["timestamp"] < self.cache_duration:
+            return self.GETCACHE[_cache_key]["response"]
+        result = await self._send("GET", url, retry=retry, **kwargs)
+        self.GETCACHE[_cache_key] = {
+            "timestamp": time(),
+            "response": copy(result)
+        }
+        return result
+
+    async def close(self) -> None:
+        """Closing the session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -3,11 +3,17 @@ Evaluating strings similarity
 """
 
 from collections import Counter
+from heapq import nlargest
+from importlib.util import find_spec
 from math import sqrt
 from operator import itemgetter
+from threading import Lock
 
 from translatepy.utils.annotations import List, Tuple
 
+# NumPy is only imported when a `MatrixIndex` is first used, as importing it takes some time
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
 
 class StringVector():
     def __init__(self, string: str, data: dict = None) -> None:
@@ -29,7 +35,11 @@ class StringVector():
 def fuzzy_search(search_source: List, query: str) -> Tuple[str, float]:
     """
     Finds the most similar string
+
+    `search_source` is either a list of `StringVector`, which are all scored, or a `SearchIndex`
     """
+    if isinstance(search_source, SearchIndex):
+        return search_source.search(query, limit=1)[0]
     results_dict = {}
     input_query = StringVector(query)
     for vector in search_source:
@@ -39,3 +49,234 @@ def fuzzy_search(search_source: List, query: str) -> Tuple[str, float]:
         results_dict[vector] = similarity
     best_result = max(results_dict.items(), key=itemgetter(1))[0]  # Returns the max value
     return best_result.string, results_dict[best_result]
+
+
+class SearchIndex():
+    """
+    An inverted character index over a list of `StringVector`, giving the same results as `fuzzy_search`
+    (and the same order for the ties, which is the order of the vectors) while only scoring a few candidates
+
+    The vectors sharing the most bigrams with the query are scored first, then the query characters are looked up
+    from the rarest to the most common one. A vector which does not have any of the characters looked up has a similarity
+    of at most the norm of the characters left divided by the norm of the query: once this is lower than the results found,
+    the most common characters are only looked up for the candidates which could still make it to the results.
+
+    >>> index = SearchIndex(LOADED_VECTORS)
+    >>> index.search("franch", limit=2)
+    [('frangach', 0.9036961141150639), ('franca', 0.8944271909999159)]
+    """
+
+    # The margin kept when comparing the bounds, so that the floating point errors never prune a result
+    EPSILON = 1e-9
+    # The number of candidates scored after each lookup, on top of `limit`
+    SEEDS = 2
+    # The number of candidates left under which they are scored rather than looked up with the next characters
+    CANDIDATES = 64
+
+    def __init__(self, vectors: List[StringVector]) -> None:
+        self.vectors = vectors  # might be a `LazySequence`, only loaded when the index is built
+        self._postings = None
+        self._bigrams = None
+        self._lock = Lock()
+
+    def _build(self) -> dict:
+        """
+        Internal function building the index on first use: {character: [(vector index, character count / vector norm), ...]}
+
+        A bigram index ({bigram: [vector index, ...]}) is built alongside, to find good candidates to start with
+        """
+        if self._postings is not None:
+            return self._postings
+        with self._lock:
+            if self._postings is None:
+                self.vectors = list(self.vectors)
+                postings, bigrams = {}, {}
+                for index, vector in enumerate(self.vectors):
+                    if vector.length == 0:
+                        continue
+                    for character in vector.set:
+                        postings.setdefault(character, []).append((index, vector.counter[character] / vector.length))
+                    for bigram in {vector.string[position:position + 2] for position in range(len(vector.string) - 1)}:
+                        bigrams.setdefault(bigram, []).append(index)
+                self._bigrams = bigrams
+                self._postings = postings
+            return self._postings
+
+    @staticmethod
+    def _score(vector: StringVector, query: StringVector) -> float:
+        """Internal function computing the similarity exactly like `fuzzy_search` does"""
+        summation = sum(vector.counter[character] * query.counter[character] for character in vector.set.intersection(query.set))
+        length = vector.length * query.length
+        return (0 if length == 0 else summation / length)
+
+    def search(self, query: str, limit: int = 1) -> List[Tuple[str, float]]:
+        """
+        Returns the `limit` most similar strings with their similarity, from the most similar one
+
+        i.e [("frangach", 0.9036961141150639), ("franca", 0.8944271909999159)]
+        """
+        postings = self._build()
+        limit = min(max(int(limit), 0), len(self.vectors))
+        if limit == 0:
+            return []
+        query_vector = StringVector(query)
+
+        scores = {}  # {vector index: similarity}
+        if query_vector.length != 0:
+            # The vectors sharing the most bigrams with the query (the ones of a typo) give a first lower bound for the results
+            shared = Counter()
+            for bigram in {query_vector.string[position:position + 2] for position in range(len(query_vector.string) - 1)}:
+                shared.update(self._bigrams.get(bigram, ()))
+            for index, _ in shared.most_common(limit + self.SEEDS):
+                scores[index] = self._score(self.vectors[index], query_vector)
+
+            characters = sorted((character for character in query_vector.set if character in postings), key=lambda character: len(postings[character]))
+            # the squared norm of the query restricted to the characters left after each lookup
+            remaining = [0] * (len(characters) + 1)
+            for position in range(len(characters) - 1, -1, -1):
+                remaining[position] = remaining[position + 1] + query_vector.counter[characters[position]] ** 2
+
+            partial = {}  # {vector index: dot product with the characters looked up, divided by the vector norm}
+            squares = {}  # {vector index: squared norm of the characters looked up, divided by the squared vector norm}
+            position = -1
+            for position, character in enumerate(characters):
+                count = query_vector.counter[character]
+                get_partial, get_square = partial.get, squares.get
+                for index, weight in postings[character]:
+                    partial[index] = get_partial(index, 0) + weight * count
+                    squares[index] = get_square(index, 0) + weight * weight
+
+                for index in nlargest(limit + self.SEEDS, partial, key=partial.__getitem__):
+                    if index not in scores:
+                        scores[index] = self._score(self.vectors[index], query_vector)
+                bound = sqrt(remaining[position + 1]) / query_vector.length
+                if len(scores) >= limit and bound + self.EPSILON < nlargest(limit, scores.values())[-1]:
+                    break
+
+            # With the characters which were not looked up, a candidate can at most gain the product of
+            # the norm they have in the query and the norm left in the candidate (Cauchy-Schwarz).
+            # Looking up the next characters for the candidates only is cheaper than scoring them
+            # as long as there are many of them.
+            threshold = nlargest(limit, scores.values())[-1] if len(scores) >= limit else 0
+            candidates = [index for index in partial if index not in scores]
+            position += 1
+            minimum = (threshold - self.EPSILON) * query_vector.length
+            while True:
+                remaining_norm = sqrt(remaining[position])
+                candidates = [
+                    index for index in candidates
+                    if partial[index] + remaining_norm * sqrt(abs(1 - squares[index])) >= minimum  # abs: the squares can go over 1 by a rounding error
+                ]
+                if position >= len(characters) or len(candidates) <= self.CANDIDATES:
+                    break
+                count = query_vector.counter[characters[position]]
+                for index, weight in postings[characters[position]]:
+                    if index in partial:
+                        partial[index] += weight * count
+                        squares[index] += weight * weight
+                position += 1
+            for index in candidates:
+                scores[index] = self._score(self.vectors[index], query_vector)
+
+        results = nlargest(limit, ((similarity, index) for index, similarity in scores.items()), key=lambda element: (element[0], -element[1]))
+        if len(results) < limit:  # the other vectors all have a similarity of 0, and come in their order
+            for index in range(len(self.vectors)):
+                if len(results) >= limit:
+                    break
+                if index not in scores:
+                    results.append((0, index))
+        return [(self.vectors[index].string, similarity) for similarity, index in results]
+
+
+class MatrixIndex(SearchIndex):
+    """
+    The vectors packed in a CSR (compressed sparse row) matrix over their characters, needing NumPy
+
+    A query is scored against every vector at once with a sparse matrix-vector product.
+    The character counts are integers, so the dot products are exact and the similarities
+    are the same floats as the ones of `fuzzy_search`.
+
+    >>> index = MatrixIndex(LOADED_VECTORS)
+    >>> index.search("franch", limit=2)
+    [('frangach', 0.9036961141150639), ('franca', 0.8944271909999159)]
+    """
+
+    def __init__(self, vectors: List[StringVector]) -> None:
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is needed to use MatrixIndex (pip install numpy)")
+        super().__init__(vectors)
+
+    def _build(self) -> dict:
+        """
+        Internal function building the matrix on first use
+
+        Returns {"vocabulary": {character: column}, "indices": columns, "data": counts, "rows": the row of each value, "norms": vector norms}
+        (the rows are expanded from the CSR `indptr` once, to sum the products of each row with `numpy.bincount`)
+        """
+        if self._postings is not None:
+            return self._postings
+        import numpy
+        with self._lock:
+            if self._postings is None:
+                self.vectors = list(self.vectors)
+                vocabulary = {}
+                indptr, indices, data = [0], [], []
+                for vector in self.vectors:
+                    for character in vector.set:
+                        indices.append(vocabulary.setdefault(character, len(vocabulary)))
+                        data.append(vector.counter[character])
+                    indptr.append(len(indices))
+                indptr = numpy.array(indptr, dtype=numpy.int64)
+                self._postings = {
+                    "vocabulary": vocabulary,
+                    "indices": numpy.array(indices, dtype=numpy.int64),
+                    "data": numpy.array(data, dtype=numpy.int64),
+                    "rows": numpy.repeat(numpy.arange(len(self.vectors)), numpy.diff(indptr)),
+                    "norms": numpy.array([vector.length for vector in self.vectors], dtype=numpy.float64)
+                }
+            return self._postings
+
+    def scores(self, query: str) -> "numpy.ndarray":
+        """
+        Returns the similarity of the query with every vector, in their order
+        """
+        import numpy
+        matrix = self._build()
+        query_vector = StringVector(query)
+        dense_query = numpy.zeros(len(matrix["vocabulary"]), dtype=numpy.int64)
+        for character, count in query_vector.counter.items():
+            column = matrix["vocabulary"].get(character, None)
+            if column is not None:
+                dense_query[column] = count
+        # the sums of integers are exact with the float64 weights of bincount
+        summations = numpy.bincount(matrix["rows"], weights=matrix["data"] * dense_query[matrix["indices"]], minlength=len(self.vectors))
+        lengths = matrix["norms"] * query_vector.length
+        results = numpy.zeros(len(self.vectors), dtype=numpy.float64)
+        numpy.divide(summations, lengths, out=results, where=lengths != 0)
+        return results
+
+    def search(self, query: str, limit: int = 1) -> List[Tuple[str, float]]:
+        """
+        Returns the `limit` most similar strings with their similarity, from the most similar one
+
+        i.e [("frangach", 0.9036961141150639), ("franca", 0.8944271909999159)]
+        """
+        import numpy
+        scores = self.scores(query)
+        limit = min(max(int(limit), 0), len(self.vectors))
+        if limit == 0:
+            return []
+        # every vector as good as the k-th best one is kept, so that the ties are broken by their order
+        kth = numpy.partition(scores, len(scores) - limit)[len(scores) - limit]
+        candidates = numpy.flatnonzero(scores >= kth)
+        results = candidates[numpy.lexsort((candidates, -scores[candidates]))][:limit]
+        return [(self.vectors[index].string, float(scores[index])) for index in results]
+
+
+def create_index(vectors: List[StringVector]) -> SearchIndex:
+    """
+    Returns a `MatrixIndex` over the given vectors if NumPy is installed, a `SearchIndex` otherwise
+    """
+    if not NUMPY_AVAILABLE:
+        return SearchIndex(vectors)
+    return MatrixIndex(vectors)
@@ -0,0 +1,109 @@
+"""
+Coalescing the concurrent identical calls into a single one
+"""
+
+import asyncio
+from functools import partial
+from threading import Event, Lock
+
+from translatepy.exceptions import DeadlineExceeded
+from translatepy.utils.deadline import remaining_time
+
+
+class _Call():
+    def __init__(self) -> None:
+        self.event = Event()
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight():
+    """
+    Makes the concurrent calls sharing the same key wait for the first one and share its result (or exception)
+
+    >>> flights = SingleFlight()
+    >>> flights.do(("translations", "Hello", "fr"), partial(service._translate, "Hello", "fr", "auto"))
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0  # the number of calls which got the result of another one
+        self._calls = {}
+        self._tasks = {}
+        self._lock = Lock()
+
+    def do(self, key, func):
+        """
+        Calls `func` without any argument, unless a call with the same key is already running
+        in another thread, in which case its result is waited for (until the deadline of the current thread) and returned
+
+        A call which failed because its own deadline passed is not shared: the callers waiting for it try again.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                else:
+                    self.shared += 1
+
+            if leader:
+                break
+
+            remaining = remaining_time()
+            if not call.event.wait(None if remaining is None else max(remaining, 0)):
+                raise DeadlineExceeded("The deadline passed while waiting for an identical call")
+            if isinstance(call.exception, DeadlineExceeded):
+                with self._lock:
+                    self.shared -= 1
+                continue
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except Exception as ex:
+            call.exception = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def ado(self, key, func):
+        """
+        Asynchronous version of `do`, where `func` returns a coroutine
+
+        The shared call is only cancelled once every caller waiting for it got cancelled.
+        """
+        key = (asyncio.get_running_loop(), key)  # the tasks are bound to their event loop
+        while True:
+            with self._lock:
+                entry = self._tasks.get(key)
+                leader = entry is None or entry[0].done()  # a finished task might not be forgotten yet
+                if leader:
+                    entry = self._tasks[key] = [asyncio.ensure_future(func()), 0]
+                    entry[0].add_done_callback(partial(self._forget, key, entry))
+                else:
+                    self.shared += 1
+                entry[1] += 1
+            task = entry[0]
+            try:
+                return await asyncio.shield(task)
+            except DeadlineExceeded:
+                if leader:
+                    raise
+                # the deadline of the caller which started the task passed, not necessarily the one of this caller
+                with self._lock:
+                    self.shared -= 1
+            finally:
+                entry[1] -= 1
+                if entry[1] == 0 and not task.done():
+                    task.cancel()
+
+    def _forget(self, key, entry: list, task: asyncio.Future) -> None:
+        with self._lock:
+            if self._tasks.get(key) is entry:
+                del self._tasks[key]
@@ -0,0 +1,108 @@
+"""
+Keeping track of the services performances
+"""
+
+from collections import deque
+from math import ceil
+from threading import Lock
+from time import time
+
+
+class ServiceStatistics():
+    """
+    Rolling statistics about the calls made to a service
+    """
+
+    def __init__(self, window: int = 100, min_samples: int = 5, alpha: float = 0.2, outcomes_duration: float = 300) -> None:
+        """
+        Parameters:
+        ----------
+            window : int, default = 100
+                The number of latest calls to keep the latency and outcome of
+            min_samples : int, default = 5
+                The minimum number of latencies needed before computing a percentile
+            alpha : float, default = 0.2
+                The smoothing factor of the exponentially weighted moving average of the latency
+            outcomes_duration : float, default = 300
+                The duration (in seconds) for which an outcome (success or failure) is considered as recent
+        """
+        self.min_samples = int(min_samples)
+        self.alpha = float(alpha)
+        self.outcomes_duration = float(outcomes_duration)
+
+        self.calls = 0
+        self.failures = 0
+        self.latency = None  # EWMA of the latency of all of the calls
+        self._latencies = deque(maxlen=int(window))  # latencies of the successful calls
+        self._outcomes = deque(maxlen=int(window))  # (timestamp, success)
+        self._lock = Lock()
+
+    def record(self, latency: float, success: bool = True) -> None:
+        """
+        Records a call which took `latency` seconds
+        """
+        latency = float(latency)
+        with self._lock:
+            self.calls += 1
+            if success:
+                self._latencies.append(latency)
+            else:
+                self.failures += 1
+            self.latency = latency if self.latency is None else self.alpha * latency + (1 - self.alpha) * self.latency
+            self._outcomes.append((time(), bool(success)))
+
+    def percentile(self, percentile: float):
+        """
+        Returns the given percentile (nearest-rank) of the latest successful calls latencies,
+        or None if not enough calls have been recorded
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_samples:
+            return None
+        rank = int(ceil(float(percentile) / 100 * len(latencies)))
+        return latencies[min(len(latencies), max(rank, 1)) - 1]
+
+    def _recent_outcomes(self) -> list:
+        """
+        Returns the outcomes recorded in the last `outcomes_duration` seconds
+        """
+        limit = time() - self.outcomes_duration
+        with self._lock:
+            return [success for timestamp, success in self._outcomes if timestamp >= limit]
+
+    @property
+    def recent_failures(self) -> int:
+        """
+        The number of calls which failed in the last `outcomes_duration` seconds
+        """
+        return sum(1 for success in self._recent_outcomes() if not success)
+
+    @property
+    def success_rate(self) -> float:
+        """
+        The ratio of successful calls in the last `outcomes_duration` seconds (1 if no call has been recently made)
+        """
+        outcomes = self._recent_outcomes()
+        if not outcomes:
+            return 1.
+        return sum(1 for success in outcomes if success) / len(outcomes)
+
+    def cost(self, default_latency: float = 1) -> float:
+        """
+        The expected time to get a valid result from the service, used to rank the services
+
+        `default_latency` is used for the services which did not get called yet.
+        """
+        latency = self.latency if self.latency is not None else float(default_latency)
+        return latency / max(self.success_rate, 0.01)
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "latency": self.latency,
+            "p95": self.percentile(95),
+            "success_rate": self.success_rate,
+            "recent_failures": self.recent_failures
+        }
@@ -11,3 +11,24 @@ def convert_to_float(element) -> float:
     if element != '':
         return float(element)
     return float(0)
+
+
+def pack_batches(texts: list, max_batch_size: int, max_batch_length: int) -> list:
+    """
+    Groups the given texts in batches of at most `max_batch_size` texts and `max_batch_length` characters
+
+    A text longer than `max_batch_length` is put alone in its own batch.
+    """
+    batches = []
+    current_batch = []
+    current_length = 0
+    for text in texts:
+        if current_batch and (len(current_batch) >= max_batch_size or current_length + len(text) > max_batch_length):
+            batches.append(current_batch)
+            current_batch = []
+            current_length = 0
+        current_batch.append(text)
+        current_length += len(text)
+    if current_batch:
+        batches.append(current_batch)
+    return batches